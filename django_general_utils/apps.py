@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class DjangoGeneralUtilsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'django_general_utils'
+
+    def ready(self):
+        from .checks import check_soft_delete_indexes
+
+        checks.register(check_soft_delete_indexes, checks.Tags.models)
@@ -0,0 +1,40 @@
+from django.apps import apps
+from django.core import checks
+from safedelete.models import is_safedelete_cls
+
+from .models.indexes import has_soft_delete_partial_index
+
+
+def check_soft_delete_indexes(app_configs=None, **kwargs) -> list:
+    """
+    Informa las FK sin un índice parcial `WHERE deleted IS NULL` de los modelos con soft delete que
+    activaron `_soft_delete_partial_indexes` (p. ej. una FK con `db_index=False`).
+    """
+    models = (
+        [_model for _app_config in app_configs for _model in _app_config.get_models()]
+        if app_configs is not None else apps.get_models()
+    )
+    messages = []
+
+    for _model in models:
+        if not is_safedelete_cls(_model) or not _model._meta.managed or _model._meta.proxy:
+            continue
+
+        if not getattr(_model, '_soft_delete_partial_indexes', False):
+            continue
+
+        columns = [
+            _field.column
+            for _field in _model._meta.local_fields
+            if _field.many_to_one and not _field.unique and not has_soft_delete_partial_index(_model, _field)
+        ]
+
+        if columns:
+            messages.append(checks.Info(
+                f'FK sin índice parcial WHERE deleted IS NULL: {", ".join(columns)}.',
+                hint='Quita db_index=False de la FK o agrégala a Meta.indexes y ejecuta makemigrations.',
+                obj=_model,
+                id='django_general_utils.I001',
+            ))
+
+    return messages
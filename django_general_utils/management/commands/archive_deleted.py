@@ -0,0 +1,70 @@
+import datetime
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from safedelete.models import is_safedelete_cls
+
+from ...models.archive import archive_soft_deleted, create_archive_view, sort_by_dependencies
+
+
+class Command(BaseCommand):
+    help = (
+        'Mueve a `<tabla>_archive` (o elimina) las filas soft-deleted hace más de `_archive_after`, en lotes '
+        'y procesando primero los modelos que referencian a otros.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models',
+            nargs='*',
+            help='Modelos a procesar (app_label.ModelName). Por defecto, todos los que definen _archive_after.'
+        )
+        parser.add_argument('--days', type=int, help='Días desde el soft delete (reemplaza _archive_after).')
+        parser.add_argument('--purge', action='store_true', help='Elimina las filas en vez de archivarlas.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--max-batches', type=int, help='Máximo de lotes por modelo.')
+        parser.add_argument('--create-view', action='store_true', help='(Re)crea la vista `<tabla>_with_archive`.')
+        parser.add_argument('--database', help='Alias de la base de datos (por defecto, la del router).')
+        parser.add_argument('--dry-run', action='store_true', help='Solo informa lo que se archivaría.')
+
+    def get_models(self, labels: list, days: int = None) -> list:
+        if labels:
+            try:
+                models = [apps.get_model(_label) for _label in labels]
+            except (LookupError, ValueError) as e:
+                raise CommandError(e) from e
+        else:
+            models = [
+                _model
+                for _model in apps.get_models()
+                if days is not None or getattr(_model, '_archive_after', None) is not None
+            ]
+
+        return sort_by_dependencies([_model for _model in models if is_safedelete_cls(_model)])
+
+    def handle(self, *args, **options):
+        days = options['days']
+        cutoff = None
+
+        if days is not None:
+            cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=days)
+
+        for _model in self.get_models(options['models'], days):
+            result = archive_soft_deleted(
+                _model,
+                cutoff=cutoff,
+                purge=True if options['purge'] else None,
+                batch_size=options['batch_size'],
+                max_batches=options['max_batches'],
+                dry_run=options['dry_run'],
+                using=options['database'],
+            )
+
+            if options['create_view'] and not options['dry_run']:
+                create_archive_view(_model, using=options['database'])
+
+            self.stdout.write(
+                f'{_model._meta.label}: {result["archived"]} registros archivados, '
+                f'{result["purged"]} registros eliminados'
+                + (' (dry-run)' if options['dry_run'] else '')
+            )
@@ -0,0 +1,156 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import router
+from django.db.models import Q
+
+from ...utils.image.blur_cache import (
+    blur_code_from_bytes,
+    get_cached_blur_code,
+    read_bytes,
+    set_cached_blur_code,
+)
+from ...utils.image.blur_img_to_base64 import get_default_blur_code
+
+
+class Command(BaseCommand):
+    help = (
+        'Recalcula `<campo>_blur_code` de los modelos con `_images_field_to_blur` sin pasar por save(): lee las '
+        'filas por chunks, calcula los blur en un pool de procesos y escribe solo esas columnas con bulk_update.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models',
+            nargs='*',
+            help='Modelos a procesar (app_label.ModelName). Por defecto, todos los que definen _images_field_to_blur.'
+        )
+        parser.add_argument('--fields', nargs='+', help='Campos de imagen a procesar (por defecto, todos).')
+        parser.add_argument('--chunk-size', type=int, default=500)
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Procesos del pool (0 o 1 calcula en el proceso actual).'
+        )
+        parser.add_argument(
+            '--start-after',
+            help='Retoma desde el pk siguiente al indicado (el último informado en el progreso). Requiere un modelo.'
+        )
+        parser.add_argument(
+            '--only-default',
+            action='store_true',
+            help='Solo las filas que aún tienen el código por defecto en alguno de los campos.'
+        )
+        parser.add_argument('--database', help='Alias de la base de datos (por defecto, la del router).')
+
+    def get_models(self, labels: list) -> list:
+        if labels:
+            try:
+                models = [apps.get_model(_label) for _label in labels]
+            except (LookupError, ValueError) as e:
+                raise CommandError(e) from e
+        else:
+            models = apps.get_models()
+
+        return [_model for _model in models if getattr(_model, '_images_field_to_blur', None)]
+
+    def handle(self, *args, **options):
+        models = self.get_models(options['models'])
+
+        if options['start_after'] is not None and len(models) != 1:
+            raise CommandError('--start-after requiere exactamente un modelo.')
+
+        pool = ProcessPoolExecutor(max_workers=options['workers']) if options['workers'] > 1 else None
+
+        try:
+            for _model in models:
+                fields = options['fields'] or list(_model._images_field_to_blur)
+                unknown = set(fields) - set(_model._images_field_to_blur)
+
+                if unknown:
+                    raise CommandError(
+                        f'{_model._meta.label}: {", ".join(sorted(unknown))} no están en _images_field_to_blur'
+                    )
+
+                self.backfill(_model, fields, pool, options)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    def backfill(self, model, fields: list, pool, options) -> None:
+        using = options['database'] or router.db_for_write(model)
+        size = tuple(model._blur_code_size)
+        format = model._blur_code_format
+        default = get_default_blur_code(format, size)
+        code_fields = [f'{_field}_{model._suffix_blur_code}' for _field in fields]
+        queryset = model._base_manager.using(using).order_by('pk')
+
+        if options['start_after'] is not None:
+            queryset = queryset.filter(pk__gt=options['start_after'])
+
+        if options['only_default']:
+            only_default = Q()
+
+            for _code_field in code_fields:
+                only_default |= Q(**{_code_field: default})
+
+            queryset = queryset.filter(only_default)
+
+        total = queryset.count()
+        rows = queryset.only('pk', *fields, *code_fields).iterator(chunk_size=options['chunk_size'])
+        done = 0
+
+        while chunk := list(islice(rows, options['chunk_size'])):
+            contents = {}
+            codes = {}
+
+            for _obj in chunk:
+                for _field in fields:
+                    file = getattr(_obj, _field)
+
+                    if not file:
+                        codes[(_obj.pk, _field)] = default
+
+                        continue
+
+                    try:
+                        content = read_bytes(file)
+                    except Exception as e:
+                        self.stderr.write(f'{model._meta.label} {_obj.pk} {_field}: {e}')
+                        codes[(_obj.pk, _field)] = default
+
+                        continue
+
+                    cached = get_cached_blur_code(content, size, format)
+
+                    if cached is not None:
+                        codes[(_obj.pk, _field)] = cached
+                    else:
+                        contents[(_obj.pk, _field)] = content
+
+            keys = list(contents)
+            args = ([contents[_key] for _key in keys], [size] * len(keys), [format] * len(keys))
+            results = pool.map(blur_code_from_bytes, *args) if pool is not None else map(blur_code_from_bytes, *args)
+
+            for _key, _code in zip(keys, results):
+                codes[_key] = _code
+
+                if _code != default:
+                    set_cached_blur_code(contents[_key], _code, size, format)
+
+            for _obj in chunk:
+                for _field in fields:
+                    setattr(_obj, f'{_field}_{model._suffix_blur_code}', codes[(_obj.pk, _field)])
+
+            model._base_manager.using(using).bulk_update(chunk, code_fields)
+            done += len(chunk)
+
+            self.stdout.write(f'{model._meta.label}: {done}/{total} (último pk {chunk[-1].pk})')
+
+        self.stdout.write(f'{model._meta.label}: {done} registros actualizados')
+
+        return None
@@ -0,0 +1,67 @@
+import datetime
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models.simple_history import prune_history
+
+
+class Command(BaseCommand):
+    help = (
+        'Elimina o compacta el historial anterior a la retención de cada modelo (`_history_retention`). '
+        'En tablas particionadas crea las particiones futuras y elimina las particiones vencidas.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models',
+            nargs='*',
+            help='Modelos a procesar (app_label.ModelName). Por defecto, todos los que definen _history_retention.'
+        )
+        parser.add_argument('--days', type=int, help='Retención en días (reemplaza _history_retention).')
+        parser.add_argument('--mode', choices=('drop', 'compact'), help='Reemplaza _history_retention_mode.')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--max-batches', type=int, help='Máximo de lotes (particiones o DELETE) por modelo.')
+        parser.add_argument('--months-ahead', type=int, default=3, help='Particiones futuras a mantener creadas.')
+        parser.add_argument('--database', help='Alias de la base de datos (por defecto, la del router).')
+        parser.add_argument('--dry-run', action='store_true', help='Solo informa lo que se eliminaría.')
+
+    def get_models(self, labels: list, days: int = None) -> list:
+        if labels:
+            try:
+                models = [apps.get_model(_label) for _label in labels]
+            except (LookupError, ValueError) as e:
+                raise CommandError(e) from e
+        else:
+            models = [
+                _model
+                for _model in apps.get_models()
+                if days is not None or getattr(_model, '_history_retention', None) is not None
+            ]
+
+        return [_model for _model in models if hasattr(_model._meta, 'simple_history_manager_attribute')]
+
+    def handle(self, *args, **options):
+        days = options['days']
+        cutoff = None
+
+        if days is not None:
+            cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=days)
+
+        for _model in self.get_models(options['models'], days):
+            result = prune_history(
+                _model,
+                cutoff=cutoff,
+                mode=options['mode'],
+                batch_size=options['batch_size'],
+                max_batches=options['max_batches'],
+                months_ahead=options['months_ahead'],
+                dry_run=options['dry_run'],
+                using=options['database'],
+            )
+
+            self.stdout.write(
+                f'{_model._meta.label}: {len(result["created"])} particiones creadas, '
+                f'{len(result["dropped"])} particiones eliminadas, {result["deleted"]} registros eliminados'
+                + (' (dry-run)' if options['dry_run'] else '')
+            )
@@ -0,0 +1,275 @@
+from django.apps.registry import Apps
+from django.db import connections, models, router, transaction
+from django.db.models import Exists, OuterRef
+from django.db.models.fields import AutoFieldMixin
+from django.utils import timezone
+from safedelete.config import FIELD_NAME
+from safedelete.models import is_safedelete_cls
+
+ARCHIVE_TABLE_SUFFIX = '_archive'
+ARCHIVE_VIEW_SUFFIX = '_with_archive'
+
+# Registro aislado: los modelos de archivo no existen para `makemigrations` ni para las relaciones
+archive_apps = Apps()
+_archive_models = {}
+
+
+def get_archive_table(model) -> str:
+    return f'{model._meta.db_table}{ARCHIVE_TABLE_SUFFIX}'
+
+
+def get_archive_view(model) -> str:
+    return f'{model._meta.db_table}{ARCHIVE_VIEW_SUFFIX}'
+
+
+def _copy_field(field) -> tuple:
+    """
+    Campo equivalente para la tabla de archivo: misma columna y tipo, sin unique/índices/defaults
+    y nullable (salvo la PK). Las FK pasan a ser un campo simple `<campo>_id` sin constraint.
+    """
+    source = field.target_field if field.is_relation else field
+    name = field.attname if field.is_relation else field.name
+
+    if isinstance(source, AutoFieldMixin):
+        if isinstance(source, models.BigAutoField):
+            copy = models.BigIntegerField()
+        elif isinstance(source, models.SmallAutoField):
+            copy = models.SmallIntegerField()
+        else:
+            copy = models.IntegerField()
+    else:
+        _, _, args, kwargs = source.deconstruct()
+
+        for _key in ('primary_key', 'unique', 'db_index', 'default', 'db_default', 'db_comment', 'validators'):
+            kwargs.pop(_key, None)
+
+        copy = source.__class__(*args, **kwargs)
+
+    copy.db_column = field.column
+    copy.primary_key = field.primary_key and not field.is_relation
+    copy.null = not copy.primary_key
+    copy.blank = True
+    copy.db_index = False
+
+    return name, copy
+
+
+def _create_model(model, name: str, db_table: str):
+    attrs = {
+        '__module__': model.__module__,
+        'Meta': type('Meta', (), {
+            'apps': archive_apps,
+            'app_label': model._meta.app_label,
+            'db_table': db_table,
+            'managed': False,
+        }),
+    }
+
+    for _field in model._meta.local_concrete_fields:
+        _name, _copy = _copy_field(_field)
+        attrs[_name] = _copy
+
+    return type(name, (models.Model,), attrs)
+
+
+def get_archive_model(model):
+    """
+    Modelo no administrado sobre la tabla de archivo de `model` (`<tabla>_archive`).
+    """
+    key = (model._meta.label, 'archive')
+
+    if key not in _archive_models:
+        _archive_models[key] = _create_model(model, f'{model.__name__}Archive', get_archive_table(model))
+
+    return _archive_models[key]
+
+
+def get_archive_view_model(model):
+    """
+    Modelo de solo lectura sobre la vista `<tabla>_with_archive` (`UNION ALL` de la tabla y su
+    archivo): el equivalente de `all_with_deleted()` incluyendo las filas archivadas.
+    """
+    key = (model._meta.label, 'view')
+
+    if key not in _archive_models:
+        _archive_models[key] = _create_model(model, f'{model.__name__}WithArchive', get_archive_view(model))
+
+    return _archive_models[key]
+
+
+def ensure_archive_table(model, using: str = None):
+    """
+    Crea la tabla de archivo si no existe y le agrega las columnas nuevas del modelo.
+    """
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    archive_model = get_archive_model(model)
+    table = archive_model._meta.db_table
+
+    with connection.cursor() as cursor:
+        tables = connection.introspection.table_names(cursor)
+        columns = (
+            {_column.name for _column in connection.introspection.get_table_description(cursor, table)}
+            if table in tables else None
+        )
+
+    with connection.schema_editor() as schema_editor:
+        if columns is None:
+            schema_editor.create_model(archive_model)
+        else:
+            for _field in archive_model._meta.local_concrete_fields:
+                if _field.column not in columns:
+                    schema_editor.add_field(archive_model, _field)
+
+    return archive_model
+
+
+def create_archive_view(model, using: str = None) -> str:
+    """
+    (Re)crea la vista `<tabla>_with_archive` con las filas de la tabla y las archivadas.
+    @return: Nombre de la vista
+    """
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    archive_model = ensure_archive_table(model, using=using)
+    quote = connection.ops.quote_name
+    columns = ', '.join(quote(_field.column) for _field in archive_model._meta.local_concrete_fields)
+    view = get_archive_view(model)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP VIEW IF EXISTS {quote(view)}')
+        cursor.execute(
+            f'CREATE VIEW {quote(view)} AS '
+            f'SELECT {columns} FROM {quote(model._meta.db_table)} '
+            f'UNION ALL SELECT {columns} FROM {quote(archive_model._meta.db_table)}'
+        )
+
+    return view
+
+
+def get_referencing_relations(model) -> list:
+    """
+    Relaciones inversas (incluidas las tablas intermedias de M2M) cuyas filas bloquean
+    eliminar físicamente una fila de `model`. Las FK sin constraint (`db_constraint=False`,
+    p. ej. las del historial) no bloquean.
+    """
+    return [
+        _field
+        for _field in model._meta.get_fields(include_hidden=True)
+        if _field.auto_created
+        and not _field.concrete
+        and (_field.one_to_many or _field.one_to_one)
+        and _field.field.db_constraint
+    ]
+
+
+def sort_by_dependencies(models_list: list) -> list:
+    """
+    Ordena los modelos para que los que referencian a otros se procesen antes que sus referenciados.
+    """
+    pending = list(models_list)
+    ordered = []
+
+    while pending:
+        for _model in pending:
+            referencing = {_relation.related_model for _relation in get_referencing_relations(_model)}
+
+            if not any(_other in referencing for _other in pending if _other is not _model):
+                break
+        else:
+            # Ciclo: se procesa igual (las filas aún referenciadas se omiten)
+            _model = pending[0]
+
+        pending.remove(_model)
+        ordered.append(_model)
+
+    return ordered
+
+
+def archive_soft_deleted(
+        model,
+        cutoff=None,
+        purge: bool = None,
+        batch_size: int = 1000,
+        max_batches: int = None,
+        dry_run: bool = False,
+        using: str = None,
+) -> dict:
+    """
+    Mueve a `<tabla>_archive` (o elimina con `purge`) las filas soft-deleted antes de `cutoff`, en
+    lotes de `batch_size` (cada lote en su propia transacción). Se omiten las filas que aún son
+    referenciadas por otra fila (p. ej. hijos no archivados), así que los modelos se deben procesar
+    de hijos a padres (`sort_by_dependencies`). No envía señales y no toca el historial.
+    @param cutoff: Fecha límite de `deleted` (por defecto `now() - model._archive_after`)
+    @param purge: True elimina sin archivar (por defecto `model._archive_mode == 'purge'`)
+    @return: {'archived': int, 'purged': int}
+    """
+    result = {'archived': 0, 'purged': 0}
+
+    if not is_safedelete_cls(model):
+        return result
+
+    if cutoff is None:
+        archive_after = getattr(model, '_archive_after', None)
+
+        if archive_after is None:
+            return result
+
+        cutoff = timezone.now() - archive_after
+
+    if purge is None:
+        purge = getattr(model, '_archive_mode', 'archive') == 'purge'
+
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    queryset = model._base_manager.using(using).filter(**{f'{FIELD_NAME}__lt': cutoff})
+
+    for _relation in get_referencing_relations(model):
+        queryset = queryset.exclude(Exists(
+            _relation.related_model._base_manager.using(using).filter(**{
+                _relation.field.attname: OuterRef(_relation.field.target_field.attname)
+            })
+        ))
+
+    key = 'purged' if purge else 'archived'
+
+    if dry_run:
+        result[key] = queryset.count()
+
+        return result
+
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    pk_column = quote(model._meta.pk.column)
+    columns = None
+
+    if not purge:
+        archive_model = ensure_archive_table(model, using=using)
+        columns = ', '.join(quote(_field.column) for _field in archive_model._meta.local_concrete_fields)
+        archive_table = quote(archive_model._meta.db_table)
+
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic(using=using):
+            pks = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+
+            if not pks:
+                break
+
+            placeholders = ', '.join(['%s'] * len(pks))
+
+            with connection.cursor() as cursor:
+                if not purge:
+                    cursor.execute(
+                        f'INSERT INTO {archive_table} ({columns}) '
+                        f'SELECT {columns} FROM {table} WHERE {pk_column} IN ({placeholders})',
+                        pks,
+                    )
+
+                cursor.execute(f'DELETE FROM {table} WHERE {pk_column} IN ({placeholders})', pks)
+
+        result[key] += len(pks)
+        batches += 1
+
+    return result
@@ -1,7 +1,7 @@
-from functools import partialmethod
+from collections import Counter
+from functools import partial, partialmethod
 from typing import get_type_hints
-from django.db.models.signals import m2m_changed
-from django.db import models
+from django.db import models, router, transaction
 from django.db.models import Case, When, Value, BooleanField, TextField
 from django.db.models.base import ModelBase
 from django.db.models.functions import Now
@@ -10,65 +10,24 @@ from django.utils.translation import gettext_lazy as _
 from model_utils import FieldTracker
 from ordered_model.models import OrderedModel
 from queryable_properties.properties import queryable_property
-from safedelete import SOFT_DELETE_CASCADE
+from safedelete import SOFT_DELETE, SOFT_DELETE_CASCADE
 from safedelete.config import FIELD_NAME
 from safedelete.models import SafeDeleteModel
 
+from .cascade import cascade_soft_delete
+from .indexes import apply_soft_delete_partial_indexes
 from .managers.base import BaseModelManager
 from .querysets.base import BaseModelQuerySet
+from .signals import SignalRegister, register_model_signals  # noqa: F401
 from .simple_history import HistoricalRecords
 from .uuid import UUIDModel
+from .validation import full_clean_changed
 from ..models import fields
 from ..models.constraints import UniqueConstraint
+from ..utils.executors import get_executor
 from ..utils.formats import format_currency, format_decimal
-from ..utils.image.blur_img_to_base64 import blur_img_to_base64, DEFAULT_BLUR_CODE
-
-
-def register_model_signals(app_name: str):
-    from django.apps import apps
-    from .base_without_safe_delete import BaseWithoutSafeDeleteModel
-
-    app_config = apps.get_app_config(app_name)
-
-    for _model in app_config.get_models():
-        if issubclass(_model, (BaseModel, BaseWithoutSafeDeleteModel)):
-            for _signal in _model._signals:
-                _signal.set_model(_model)
-                _signal.register()
-        else:
-            assert issubclass(_model, models.Model), _('Model "%s" is not a subclass of BaseModel or BaseWithoutSafeDeleteModel') % _model.__name__
-
-    return None
-
-
-class SignalRegister:
-    callback = None
-    signal = None
-    model = None
-
-    def __init__(self, callback, signal, through_field=None, **kwargs):
-        self.callback = callback
-        self.signal = signal
-        self.through_field = through_field
-        self.kwargs = kwargs
-
-        if signal is m2m_changed:
-            assert through_field is not None, _('through_field is required for m2m_changed signal')
-
-    def set_model(self, model):
-        if self.signal is m2m_changed:
-            assert hasattr(model, self.through_field), _('Model "%s" does not have the field "%s"') % (model.__name__, self.through_field)
-
-            self.model = getattr(model, self.through_field).through
-
-            return
-
-        self.model = model
-
-    def register(self):
-        assert self.model is not None, _('Model is not set')
-
-        self.signal.connect(self.callback, sender=self.model, **self.kwargs)
+from ..utils.image.blur_cache import get_blur_code
+from ..utils.image.blur_img_to_base64 import get_default_blur_code
 
 
 class ModelBaseMeta(ModelBase):
@@ -102,6 +61,9 @@ class ModelBaseMeta(ModelBase):
         cls._add_formated_number(model_class, attrs)
         cls._add_blur_fields(model_class)
 
+        if getattr(model_class, '_soft_delete_partial_indexes', False):
+            apply_soft_delete_partial_indexes(model_class)
+
         model_class.add_to_class('_signals', signals)
 
         return model_class
@@ -149,7 +111,10 @@ class ModelBaseMeta(ModelBase):
                 f'{_field}_{suffix}',
                 TextField(
                     editable=False,
-                    default=DEFAULT_BLUR_CODE
+                    default=get_default_blur_code(
+                        model_class._blur_code_format,
+                        tuple(model_class._blur_code_size)
+                    )
                 )
             )
 
@@ -265,6 +230,23 @@ class BaseModel(SafeDeleteModel, OrderedModel, UUIDModel, metaclass=ModelBaseMet
     _images_field_to_blur = []
     _queryable_property_params = {}
     _suffix_blur_code = 'blur_code'
+    # 'BMP' | 'PNG' | 'WEBP' | 'JPEG' (base64) o 'BLURHASH', y tamaño del thumbnail
+    _blur_code_format = 'BMP'
+    _blur_code_size = (25, 25)
+    # None: el blur se calcula en save(); 'thread' | 'async': tras el commit en el executor compartido
+    _blur_run_in = None
+    # True: save() valida solo los campos/constraints afectados por el cambio (ver models.validation)
+    _full_clean_changed_only = False
+    # Retención del historial para `prune_history` (timedelta; None = sin límite)
+    _history_retention = None
+    # 'drop': borra lo anterior a la retención; 'compact': conserva el último registro por objeto
+    _history_retention_mode = 'drop'
+    # Archivo de filas soft-deleted para `archive_deleted` (timedelta; None = nunca)
+    _archive_after = None
+    # 'archive': mueve las filas a `<tabla>_archive`; 'purge': las elimina
+    _archive_mode = 'archive'
+    # True: `Meta.indexes` y los índices de FK pasan a ser parciales `WHERE deleted IS NULL`
+    _soft_delete_partial_indexes = False
     _safedelete_policy = SOFT_DELETE_CASCADE
     objects = BaseModelManager(BaseModelQuerySet)
 
@@ -312,11 +294,61 @@ class BaseModel(SafeDeleteModel, OrderedModel, UUIDModel, metaclass=ModelBaseMet
         setattr(
             self,
             f'{field}_{self._suffix_blur_code}',
-            blur_img_to_base64(getattr(self, field))
+            self.get_blur_code(getattr(self, field))
         )
 
         return None
 
+    @classmethod
+    def get_blur_code(cls, file) -> str:
+        """
+        BLUR DE `file` EN EL FORMATO Y TAMAÑO DEL MODELO (`_blur_code_format`, `_blur_code_size`)
+        """
+        return get_blur_code(file, size_img_blur=tuple(cls._blur_code_size), format=cls._blur_code_format)
+
+    def get_blur_fields_to_update(self, update_fields=None) -> list:
+        """
+        CAMPOS DE IMAGEN CUYO BLUR SE DEBE RECALCULAR: LOS NUEVOS O MODIFICADOS SEGÚN EL TRACKER
+        @param update_fields: Si se pasa, solo se consideran los campos incluidos
+        """
+        response = []
+
+        for _field in self._images_field_to_blur:
+            if update_fields is not None and _field not in update_fields:
+                continue
+
+            value = getattr(self, _field)
+
+            # Un archivo recién asignado y aún no guardado puede tener el mismo nombre que el anterior
+            if (
+                    self._state.adding
+                    or _field not in self.tracker.fields
+                    or self.tracker.has_changed(_field)
+                    or not getattr(value, '_committed', True)
+            ):
+                response.append(_field)
+
+        return response
+
+    @classmethod
+    def update_blur_codes(cls, pk, fields: list, using: str = None) -> None:
+        """
+        CALCULA EL BLUR DE `fields` PARA EL REGISTRO `pk` Y LO GUARDA CON UN UPDATE DIRIGIDO
+        (SIN SEÑALES NI HISTORIAL). ES LO QUE EJECUTA EL EXECUTOR CUANDO `_blur_run_in` ESTÁ DEFINIDO.
+        """
+        queryset = cls._base_manager.using(using or router.db_for_write(cls)).filter(pk=pk)
+        instance = queryset.first()
+
+        if instance is None:
+            return None
+
+        queryset.update(**{
+            f'{_field}_{cls._suffix_blur_code}': cls.get_blur_code(getattr(instance, _field))
+            for _field in fields
+        })
+
+        return None
+
     def save(self, **kwargs):
         keep_deleted = kwargs.pop('keep_deleted', False)
         full_clean = kwargs.pop('full_clean', True)
@@ -328,10 +360,73 @@ class BaseModel(SafeDeleteModel, OrderedModel, UUIDModel, metaclass=ModelBaseMet
 
             setattr(self, FIELD_NAME, None)
 
-        for _field in self._images_field_to_blur:
-            self.set_blur_image(_field)
+        blur_fields = self.get_blur_fields_to_update(kwargs.get('update_fields'))
 
-        if full_clean:
+        if self._blur_run_in is None:
+            for _field in blur_fields:
+                self.set_blur_image(_field)
+
+            if blur_fields and kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = [
+                    *kwargs['update_fields'],
+                    *(f'{_field}_{self._suffix_blur_code}' for _field in blur_fields),
+                ]
+
+        if full_clean == 'changed' or (full_clean is True and self._full_clean_changed_only):
+            full_clean_changed(self)
+        elif full_clean:
             self.full_clean()
 
         super().save(keep_deleted, **kwargs)
+
+        if blur_fields and self._blur_run_in is not None:
+            using = kwargs.get('using') or router.db_for_write(self.__class__, instance=self)
+
+            transaction.on_commit(
+                partial(
+                    get_executor(self._blur_run_in).submit,
+                    self.__class__.update_blur_codes,
+                    self.pk,
+                    blur_fields,
+                    using,
+                ),
+                using=using,
+            )
+
+    def soft_delete_cascade_policy_action(self, **kwargs):
+        """
+        Igual que en safedelete, pero la cascada se marca por lotes (`cascade.cascade_soft_delete`):
+        un UPDATE y un insert de historial por modelo relacionado, sin señales. La instancia se
+        elimina con `save()` como siempre.
+        """
+        using = kwargs.get('using') or router.db_for_write(self.__class__, instance=self)
+
+        with transaction.atomic(using=using):
+            _, counter = cascade_soft_delete(self.__class__, [self.pk], using=using, include_roots=False)
+            _, response = self._delete(force_policy=SOFT_DELETE, **kwargs)
+
+        counter = Counter(counter)
+        counter.update(response)
+
+        return sum(counter.values()), dict(counter)
+
+    def undelete(self, force_policy=None, **kwargs):
+        if (force_policy or self._safedelete_policy) != SOFT_DELETE_CASCADE:
+            return super().undelete(force_policy=force_policy, **kwargs)
+
+        using = kwargs.get('using') or router.db_for_write(self.__class__, instance=self)
+
+        with transaction.atomic(using=using):
+            _, response = super().undelete(force_policy=SOFT_DELETE, **kwargs)
+            _, counter = cascade_soft_delete(
+                self.__class__,
+                [self.pk],
+                using=using,
+                include_roots=False,
+                undelete=True,
+            )
+
+        counter = Counter(counter)
+        counter.update(response)
+
+        return sum(counter.values()), dict(counter)
@@ -9,6 +9,7 @@ from ordered_model.models import OrderedModel
 
 from .managers.base_without_safe_delete import BaseWithoutSafeDeleteModelManager
 from .uuid_v2 import UUIDModelV2
+from .validation import full_clean_changed
 from ..utils.formats import format_currency, format_decimal
 
 
@@ -150,6 +151,8 @@ class ModelBaseWithOutSafeDeleteMeta(ModelBase):
 
 class BaseWithoutSafeDeleteModel(OrderedModel, UUIDModelV2, metaclass=ModelBaseWithOutSafeDeleteMeta):
     __FORMAT_LOCALE__ = 'es_CL'
+    # True: save() valida solo los campos/constraints afectados por el cambio (ver models.validation)
+    _full_clean_changed_only = False
     objects = BaseWithoutSafeDeleteModelManager()
 
     class Meta:
@@ -159,7 +162,9 @@ class BaseWithoutSafeDeleteModel(OrderedModel, UUIDModelV2, metaclass=ModelBaseW
     def save(self, **kwargs):
         full_clean = kwargs.pop('full_clean', True)
 
-        if full_clean:
+        if full_clean == 'changed' or (full_clean is True and self._full_clean_changed_only):
+            full_clean_changed(self)
+        elif full_clean:
             self.full_clean()
 
         super().save(**kwargs)
@@ -0,0 +1,210 @@
+from collections import defaultdict
+
+from django.db import connections, router, transaction
+from django.db.models import CASCADE, DO_NOTHING, PROTECT, RESTRICT
+from django.db.models.deletion import Collector, ProtectedError
+from django.utils import timezone
+from safedelete.config import DELETED_BY_CASCADE_FIELD_NAME, FIELD_NAME
+from safedelete.models import is_safedelete_cls
+
+from .simple_history import bulk_history_create, get_request_user
+
+
+def _batches(pks: list, using: str):
+    pks = list(pks)
+    batch_size = max(connections[using].ops.bulk_batch_size(['pk'], pks), 1)
+
+    for _start in range(0, len(pks), batch_size):
+        yield pks[_start:_start + batch_size]
+
+
+def _get_related_queryset(model, relation, pks: set, using: str):
+    """
+    Filas de `relation.related_model` que apuntan a `pks` de `model`, sin joins (los
+    `fields.ForeignKey` ocultan las filas eliminadas en los joins).
+    """
+    target = relation.field.target_field
+
+    if target.primary_key:
+        values = list(pks)
+    else:
+        values = list(
+            model._base_manager.using(using).filter(pk__in=pks).values_list(target.attname, flat=True)
+        )
+
+    return relation.related_model._base_manager.using(using).filter(**{f'{relation.field.attname}__in': values})
+
+
+def collect_soft_delete(model, pks, using: str = None) -> tuple:
+    """
+    Grafo de la cascada de `SOFT_DELETE_CASCADE` calculado por conjuntos de pks: una consulta
+    por relación y nivel en vez de instanciar cada objeto relacionado. Respeta `PROTECT` (solo
+    contra filas no eliminadas) y agenda `SET_NULL`/`SET_DEFAULT`/`SET()` en un `Collector`.
+    @return: ({modelo: set(pks)} eliminados en cascada (sin `pks`), collector con los field_updates)
+    """
+    using = using or router.db_for_write(model)
+    collector = Collector(using=using)
+    affected = defaultdict(set)
+    seen = {(model, _pk) for _pk in pks}
+    pending = [(model, set(pks))]
+
+    while pending:
+        parent_model, parent_pks = pending.pop()
+
+        for _relation in parent_model._meta.related_objects:
+            related_model = _relation.related_model
+            on_delete = _relation.on_delete
+
+            if _relation.many_to_many or on_delete in (DO_NOTHING, RESTRICT):
+                continue
+
+            if on_delete is CASCADE and not is_safedelete_cls(related_model):
+                continue
+
+            queryset = _get_related_queryset(parent_model, _relation, parent_pks, using)
+
+            if is_safedelete_cls(related_model):
+                queryset = queryset.filter(**{f'{FIELD_NAME}__isnull': True})
+
+            if on_delete is PROTECT:
+                protected = list(queryset[:100])
+
+                if protected:
+                    raise ProtectedError(
+                        f'Cannot delete some instances of model {model.__name__!r} because they are '
+                        f'referenced through protected foreign keys',
+                        set(protected),
+                    )
+
+                continue
+
+            if on_delete is not CASCADE:
+                on_delete(collector, _relation.field, queryset, using)
+
+                continue
+
+            children = {
+                _pk
+                for _pk in queryset.values_list('pk', flat=True)
+                if (related_model, _pk) not in seen
+            }
+
+            if not children:
+                continue
+
+            seen.update((related_model, _pk) for _pk in children)
+            affected[related_model] |= children
+            pending.append((related_model, children))
+
+    return affected, collector
+
+
+def collect_soft_undelete(model, pks, using: str = None) -> dict:
+    """
+    Contraparte de `collect_soft_delete`: filas eliminadas en cascada (`deleted_by_cascade`)
+    colgando de `pks`, por conjuntos de pks.
+    @return: {modelo: set(pks)} (sin `pks`)
+    """
+    using = using or router.db_for_write(model)
+    affected = defaultdict(set)
+    seen = {(model, _pk) for _pk in pks}
+    pending = [(model, set(pks))]
+
+    while pending:
+        parent_model, parent_pks = pending.pop()
+
+        for _relation in parent_model._meta.related_objects:
+            related_model = _relation.related_model
+
+            if _relation.many_to_many or _relation.on_delete is not CASCADE or not is_safedelete_cls(related_model):
+                continue
+
+            queryset = _get_related_queryset(parent_model, _relation, parent_pks, using).filter(**{
+                f'{FIELD_NAME}__isnull': False,
+                DELETED_BY_CASCADE_FIELD_NAME: True,
+            })
+            children = {
+                _pk
+                for _pk in queryset.values_list('pk', flat=True)
+                if (related_model, _pk) not in seen
+            }
+
+            if not children:
+                continue
+
+            seen.update((related_model, _pk) for _pk in children)
+            affected[related_model] |= children
+            pending.append((related_model, children))
+
+    return affected
+
+
+def cascade_soft_delete(
+        model,
+        pks,
+        using: str = None,
+        user=None,
+        with_history: bool = True,
+        include_roots: bool = True,
+        include_cascade: bool = True,
+        undelete: bool = False,
+) -> tuple:
+    """
+    Soft delete (o undelete) por lotes de `pks` y su cascada: un `UPDATE` por modelo afectado y
+    un `bulk_create` de historial por modelo. No envía señales.
+    @param include_roots: False para actualizar solo la cascada (las raíces las guarda el llamador)
+    @param include_cascade: False para actualizar solo `pks` (modelos sin `SOFT_DELETE_CASCADE`)
+    @param user: Usuario del historial y `updated_by` (por defecto el del request)
+    @return: (total, {modelo: cantidad}) igual que `delete()`
+    """
+    using = using or router.db_for_write(model)
+    user = user or get_request_user()
+    now = timezone.now()
+    pks = set(pks)
+    counter = {}
+
+    with transaction.atomic(using=using):
+        cascade = {}
+
+        if not include_cascade:
+            pass
+        elif undelete:
+            cascade = collect_soft_undelete(model, pks, using=using)
+        else:
+            cascade, collector = collect_soft_delete(model, pks, using=using)
+
+            # SET_NULL / SET_DEFAULT / SET() antes de marcar la cascada, igual que safedelete
+            for (_field, _value), _querysets in collector.field_updates.items():
+                for _queryset in _querysets:
+                    _queryset.update(**{_field.name: _value})
+
+        affected = [(_model, True, _pks) for _model, _pks in cascade.items()]
+
+        if include_roots and pks:
+            affected.insert(0, (model, False, pks))
+
+        for _model, _by_cascade, _pks in affected:
+            values = {
+                FIELD_NAME: None if undelete else now,
+                DELETED_BY_CASCADE_FIELD_NAME: False if undelete else _by_cascade,
+            }
+            field_names = {_field.name for _field in _model._meta.concrete_fields}
+
+            if 'updated_at' in field_names:
+                values['updated_at'] = now
+
+            if user is not None and 'updated_by' in field_names:
+                values['updated_by'] = user
+
+            has_history = getattr(_model._meta, 'simple_history_manager_attribute', None) is not None
+
+            for _batch in _batches(_pks, using):
+                _model._base_manager.using(using).filter(pk__in=_batch).update(**values)
+
+                if with_history and has_history:
+                    objs = list(_model._base_manager.using(using).filter(pk__in=_batch))
+                    bulk_history_create(_model, objs, '~', user=user, history_date=now, using=using)
+
+            counter[_model._meta.label] = counter.get(_model._meta.label, 0) + len(_pks)
+
+    return sum(counter.values()), counter
@@ -7,6 +7,7 @@ from .check_max_rows_contraint import CheckRowsModelConstraint
 from .check_max_rows_without_safe_delete_contraint import CheckRowsModelWithoutSafeDeleteConstraint
 from .check_max_rows_without_safe_delete_contraint import CheckRowsModelWithoutSafeDeleteConstraint as CheckRowsModelConstraintV2
 from .check_model_relation_constraint import CheckModelRelationConstraint
+from .profiler import ConstraintProfiler, add_constraint_hook, prometheus_hook, remove_constraint_hook
 from .unique_constraint import UniqueConstraint
 from .unique_without_safe_delete_constraint import UniqueWithoutSafeDeleteConstraint
 from .unique_without_safe_delete_constraint import UniqueWithoutSafeDeleteConstraint as UniqueConstraintV2
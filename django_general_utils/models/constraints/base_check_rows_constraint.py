@@ -0,0 +1,213 @@
+import hashlib
+
+from django.core.exceptions import FieldError, ValidationError
+from django.db import connections, transaction
+from django.db.utils import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+
+from .base_constraint import BaseConstraint, get_expression_referenced_fields
+from .q_evaluator import check_q
+
+
+class BaseCheckRowsConstraint(BaseConstraint):
+    """
+    Base de las constraints de máximo de filas. El conteo es acotado (`LIMIT max_rows`) y,
+    con `lock`, serializa las validaciones concurrentes dentro de la transacción:
+
+    - 'advisory': `pg_advisory_xact_lock` por (tabla, constraint); evita que dos inserts
+      concurrentes pasen la validación a la vez.
+    - 'select_for_update': bloquea las filas que cuentan para el límite.
+    """
+    LOCK_CHOICES = ('advisory', 'select_for_update')
+
+    def __init__(self, max_rows: int, name, check=None, lock: str = None, violation_error_message=None):
+        self.max_rows = max_rows
+        self.check = check
+        self.lock = lock
+
+        if check is not None and not getattr(check, "conditional", False):
+            raise TypeError(
+                _("CheckConstraint.check must be a Q instance or boolean expression.")
+            )
+
+        if max_rows < 1:
+            raise TypeError(
+                _('El número máximo de filas debe ser mayor a 0.')
+            )
+
+        assert lock is None or lock in self.LOCK_CHOICES, _('lock must be one of {choices}').format(
+            choices=self.LOCK_CHOICES
+        )
+
+        super().__init__(name=name, violation_error_message=violation_error_message)
+
+    def _get_check_sql(self, model, schema_editor):
+        return None
+
+    def constraint_sql(self, model, schema_editor):
+        return None
+
+    def create_sql(self, model, schema_editor):
+        return None
+
+    def remove_sql(self, model, schema_editor):
+        return None
+
+    def get_referenced_fields(self, model) -> set | None:
+        return get_expression_referenced_fields(self.check)
+
+    def get_queryset(self, model, using=DEFAULT_DB_ALIAS):
+        """
+        Filas que cuentan para el límite.
+        """
+        queryset = model._default_manager.using(using)
+
+        # Check if the model has a custom manager that filters out some rows
+        if self.check is not None:
+            queryset = queryset.filter(self.check)
+
+        return queryset
+
+    def _lock_key(self, model) -> int:
+        digest = hashlib.blake2b(
+            f'{model._meta.db_table}:{self.name}'.encode('utf-8'),
+            digest_size=8,
+        ).digest()
+
+        return int.from_bytes(digest, byteorder='big', signed=True)
+
+    def _acquire_lock(self, model, using) -> None:
+        if self.lock != 'advisory':
+            return None
+
+        connection = connections[using]
+
+        if connection.vendor != 'postgresql':
+            return None
+
+        if not connection.in_atomic_block:
+            raise transaction.TransactionManagementError(
+                'lock="advisory" requires a transaction (transaction.atomic).'
+            )
+
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_xact_lock(%s)', [self._lock_key(model)])
+
+        return None
+
+    def count_rows(self, queryset) -> int:
+        """
+        Cuenta hasta `max_rows` filas (`SELECT COUNT(*) FROM (SELECT ... LIMIT max_rows)`).
+        """
+        if self.lock == 'select_for_update':
+            return len(queryset.select_for_update().values_list('pk', flat=True)[:self.max_rows])
+
+        return queryset.values('pk')[:self.max_rows].count()
+
+    def get_against(self, model, instance, exclude=None) -> dict:
+        # Django < 5.0
+        if callable(getattr(instance, '_get_field_value_map', None)):
+            return instance._get_field_value_map(meta=model._meta, exclude=exclude)
+        elif callable(getattr(instance, '_get_field_expression_map', None)):
+            return instance._get_field_expression_map(meta=model._meta, exclude=exclude)
+
+        raise ValueError('instance must have a method "_get_field_value_map" or "_get_field_expression_map"')
+
+    def matches(self, model, instance, exclude=None, using=DEFAULT_DB_ALIAS) -> bool:
+        """
+        True si la instancia cumple `check` (es decir, cuenta para el límite).
+        """
+        against = self.get_against(model, instance, exclude=exclude)
+
+        try:
+            return bool(check_q(self.check, against, using=using))
+        except FieldError:
+            return True
+
+    def validate(self, model, instance, exclude=None, using=DEFAULT_DB_ALIAS):
+        if not self.matches(model, instance, exclude=exclude, using=using):
+            return  # Skip validation if the check is not applicable
+
+        self._acquire_lock(model, using)
+
+        queryset = self.get_queryset(model, using=using)
+        model_class_pk = instance._get_pk_val(model._meta)
+
+        # Check if the model is being updated
+        if not instance._state.adding and model_class_pk is not None:
+            queryset = queryset.exclude(pk=model_class_pk)
+
+        if self.count_rows(queryset) >= self.max_rows:
+            raise ValidationError(self.get_violation_error_message())
+
+    def validate_bulk(self, model, instances: list, exclude=None, using=DEFAULT_DB_ALIAS) -> dict:
+        """
+        Valida un lote de instancias pendientes contra el límite con una sola consulta
+        acotada (más una evaluación de `check` por combinación distinta de valores
+        referenciados), considerando también las instancias del mismo lote.
+        @return: {índice: ValidationError} de las instancias que exceden el límite
+        """
+        referenced = get_expression_referenced_fields(self.check)
+        evaluated = {}
+        matching = []
+
+        for _index, _instance in enumerate(instances):
+            if referenced is None:
+                key = _index
+            else:
+                key = tuple(
+                    (_name, repr(_value))
+                    for _name, _value in sorted(self.get_against(model, _instance, exclude=exclude).items())
+                    if _name in referenced
+                )
+
+            if key not in evaluated:
+                evaluated[key] = self.matches(model, _instance, exclude=exclude, using=using)
+
+            if evaluated[key]:
+                matching.append(_index)
+
+        if not matching:
+            return {}
+
+        self._acquire_lock(model, using)
+
+        queryset = self.get_queryset(model, using=using)
+        updated_pks = [
+            _instance.pk
+            for _instance in instances
+            if not _instance._state.adding and _instance.pk is not None
+        ]
+
+        if updated_pks:
+            queryset = queryset.exclude(pk__in=updated_pks)
+
+        available = self.max_rows - self.count_rows(queryset)
+
+        return {
+            _index: ValidationError(self.get_violation_error_message())
+            for _index in matching[max(available, 0):]
+        }
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return (
+                    self.max_rows == other.max_rows
+                    and self.name == other.name
+                    and self.check == other.check
+                    and self.lock == other.lock
+                    and self.violation_error_message == other.violation_error_message
+            )
+        return super().__eq__(other)
+
+    def deconstruct(self):
+        path, args, kwargs = super().deconstruct()
+        kwargs.update({
+            'max_rows': self.max_rows,
+            'check': self.check,
+        })
+
+        if self.lock is not None:
+            kwargs['lock'] = self.lock
+
+        return path, args, kwargs
@@ -1,9 +1,100 @@
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import Subquery
+
+from .profiler import profile_validate
+
+
+def get_expression_referenced_fields(expression) -> set | None:
+    """
+    Nombres base (antes del primer `__`) de los campos que usa un Q/expresión, ya sea
+    como lookup o vía F(). Retorna None si contiene una subconsulta, porque sus
+    dependencias no se pueden conocer sin resolverla.
+    """
+    if expression is None:
+        return set()
+
+    referenced = set()
+    pending = [expression]
+
+    while pending:
+        _node = pending.pop()
+
+        if isinstance(_node, Subquery):
+            return None
+
+        if isinstance(_node, Q):
+            for _child in _node.children:
+                if isinstance(_child, tuple):
+                    referenced.add(_child[0].split(LOOKUP_SEP, 1)[0])
+                    pending.append(_child[1])
+                else:
+                    pending.append(_child)
+
+            continue
+
+        if isinstance(_node, F):
+            referenced.add(_node.name.split(LOOKUP_SEP, 1)[0])
+
+            continue
+
+        if isinstance(_node, (list, tuple, set)):
+            pending.extend(_node)
+
+            continue
+
+        if hasattr(_node, 'get_source_expressions'):
+            pending.extend(_node.get_source_expressions())
+
+    return referenced
+
+
+def get_constraint_referenced_fields(constraint) -> set | None:
+    """
+    Campos de los que depende una constraint según su declaración (`fields`,
+    `expressions`, `condition`, `check`). None = no se puede determinar.
+    """
+    referenced = set(getattr(constraint, 'fields', None) or [])
+    expressions = list(getattr(constraint, 'expressions', None) or [])
+
+    if isinstance(constraint, models.CheckConstraint):
+        expressions.append(constraint.condition if hasattr(constraint, 'condition') else constraint.check)
+    else:
+        expressions.append(getattr(constraint, 'condition', None))
+
+    for _expression in expressions:
+        _referenced = get_expression_referenced_fields(_expression)
+
+        if _referenced is None:
+            return None
+
+        referenced |= _referenced
+
+    if not referenced:
+        return None
+
+    return referenced
 
 
 class BaseConstraint(models.BaseConstraint):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Tiempo y consultas por constraint (ver `profiler.ConstraintProfiler`)
+        for _name in ('validate', 'validate_bulk'):
+            if hasattr(cls, _name):
+                setattr(cls, _name, profile_validate(getattr(cls, _name)))
+
     def get_violation_error_message(self):
         if isinstance(self.violation_error_message, dict):
             return self.violation_error_message
 
         return super().get_violation_error_message()
+
+    def get_referenced_fields(self, model) -> set | None:
+        """
+        Campos cuyo cambio obliga a re-validar la constraint en una actualización
+        (ver `models.validation.full_clean_changed`). None = validar siempre.
+        """
+        return get_constraint_referenced_fields(self)
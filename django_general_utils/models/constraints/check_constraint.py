@@ -1,8 +1,22 @@
+from django.core.exceptions import FieldError, ValidationError
 from django.db import models
+from django.db.utils import DEFAULT_DB_ALIAS
 from safedelete.config import FIELD_NAME
 
 from .base_constraint import BaseConstraint
+from .q_evaluator import check_q
 
 
 class CheckConstraint(BaseConstraint, models.CheckConstraint):
-    pass
+    def validate(self, model, instance, exclude=None, using=DEFAULT_DB_ALIAS):
+        # Igual que `models.CheckConstraint.validate`, evaluando el check en Python si es posible
+        condition = self.condition if hasattr(self, 'condition') else self.check
+        against = instance._get_field_expression_map(meta=model._meta, exclude=exclude)
+
+        try:
+            if not check_q(condition, against, using=using):
+                raise ValidationError(
+                    self.get_violation_error_message(), code=self.violation_error_code
+                )
+        except FieldError:
+            pass
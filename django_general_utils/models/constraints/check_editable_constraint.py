@@ -28,6 +28,9 @@ class CheckEditableConstraint(BaseConstraint):
     def remove_sql(self, model, schema_editor):
         return None
 
+    def get_referenced_fields(self, model) -> set:
+        return set(self.fields)
+
     def validate(self, model, instance, exclude=None, using=DEFAULT_DB_ALIAS):
         """
         Validate the constraint
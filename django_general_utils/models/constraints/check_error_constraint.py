@@ -1,9 +1,9 @@
 from django.core.exceptions import FieldError, ValidationError
 from django.db import models
-from django.db.models.query_utils import Q
 from django.db.utils import DEFAULT_DB_ALIAS
 from django.db.models.sql.query import Query
 from .base_constraint import BaseConstraint
+from .q_evaluator import check_q
 
 
 class CheckErrorConstraint(BaseConstraint, models.CheckConstraint):
@@ -24,7 +24,7 @@ class CheckErrorConstraint(BaseConstraint, models.CheckConstraint):
             raise ValueError('instance must have a method "_get_field_value_map" or "_get_field_expression_map"')
 
         try:
-            if Q(self.check).check(against, using=using):
+            if check_q(self.check, against, using=using):
                 raise ValidationError(
                     self.get_violation_error_message(), code=self.violation_error_code
                 )
@@ -26,9 +26,42 @@ class CheckFlowStatusConstraint(BaseConstraint):
         self.skip_validate = skip_validate
         self.violation_error_message = violation_error_message
         self.violation_error_initial_statuses_message = violation_error_initial_statuses_message
+        self._choices = {}
+        self._compile_flow()
 
         super().__init__(name=name, violation_error_message=violation_error_message)
 
+    def _compile_flow(self) -> None:
+        """
+        Matriz de transiciones compilada: {origen: frozenset(destinos)} y su inversa.
+        """
+        self._allowed = {_from: frozenset(_to) for _from, _to in self.flow.items()}
+        self._sources = {}
+
+        for _from, _to in self._allowed.items():
+            for _status in _to:
+                self._sources.setdefault(_status, set()).add(_from)
+
+        return None
+
+    def is_allowed(self, last_value, current_value) -> bool:
+        """
+        True si el flujo permite pasar de `last_value` a `current_value` (o si no hay cambio).
+        """
+        return last_value == current_value or current_value in self._allowed.get(last_value, ())
+
+    def get_sources(self, current_value) -> set:
+        """
+        Estados desde los que se puede llegar a `current_value`.
+        """
+        return set(self._sources.get(current_value, ()))
+
+    def get_choices(self, model) -> dict:
+        if model not in self._choices:
+            self._choices[model] = dict(model._meta.get_field(self.field).choices or [])
+
+        return self._choices[model]
+
     def _get_check_sql(self, model, schema_editor):
         return None
 
@@ -41,6 +74,9 @@ class CheckFlowStatusConstraint(BaseConstraint):
     def remove_sql(self, model, schema_editor):
         return None
 
+    def get_referenced_fields(self, model) -> set:
+        return {self.field}
+
     def validate(self, model, instance, exclude=None, using=DEFAULT_DB_ALIAS):
         """
         Validate the constraint
@@ -58,7 +94,7 @@ class CheckFlowStatusConstraint(BaseConstraint):
 
         current_value = getattr(instance, self.field)
         last_value = instance.tracker.previous(self.field)
-        choices = dict(model._meta.get_field(self.field).choices)
+        choices = self.get_choices(model)
 
         if self.skip_validate is not None and self.skip_validate(instance, last_value, current_value):
             return None
@@ -99,7 +135,7 @@ class CheckFlowStatusConstraint(BaseConstraint):
             return None
 
         # If the current value is not in the flow of the last value, raise a validation error
-        if current_value not in self.flow.get(last_value, []):
+        if not self.is_allowed(last_value, current_value):
             violation_error_initial_statuses_message = self.violation_error_initial_statuses_message or {
                 'status': 'No puedes avanzar este estado a "{current_value}" debido a que su valor actual "{last_value}" no lo permite.',
             }
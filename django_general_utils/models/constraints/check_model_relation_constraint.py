@@ -10,12 +10,14 @@ class CheckModelRelationConstraint(BaseConstraint):
             self,
             name,
             check = None,
+            fields: list = None,
             validate_on_create=True,
             validate_on_update=True,
             validate_on_delete=False,
             violation_error_message=None
     ):
         self.check = check
+        self.fields = fields
         self.validate_on_create = validate_on_create
         self.validate_on_update = validate_on_update
         self.validate_on_delete = validate_on_delete
@@ -34,6 +36,13 @@ class CheckModelRelationConstraint(BaseConstraint):
     def remove_sql(self, model, schema_editor):
         return None
 
+    def get_referenced_fields(self, model) -> set | None:
+        # `check` es un callable arbitrario: solo se puede omitir si declara `fields`
+        if not self.fields:
+            return None
+
+        return set(self.fields)
+
     def validate(self, model, instance, exclude=None, using=DEFAULT_DB_ALIAS):
         """
         Validate the constraint
@@ -64,6 +73,7 @@ class CheckModelRelationConstraint(BaseConstraint):
         if isinstance(other, CheckModelRelationConstraint):
             return (
                     self.check == other.check
+                    and self.fields == other.fields
                     and self.validate_on_create == other.validate_on_create
                     and self.validate_on_update == other.validate_on_update
                     and self.validate_on_delete == other.validate_on_delete
@@ -76,6 +86,7 @@ class CheckModelRelationConstraint(BaseConstraint):
 
         kwargs.update({
             'check': self.check,
+            'fields': self.fields,
             'validate_on_create': self.validate_on_create,
             'validate_on_update': self.validate_on_update,
             'validate_on_delete': self.validate_on_delete,
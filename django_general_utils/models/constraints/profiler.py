@@ -0,0 +1,208 @@
+import functools
+import logging
+import time
+from contextvars import ContextVar
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+# Profilers activos en el contexto actual (hilo / tarea) y hooks globales
+_profilers = ContextVar('constraint_profilers', default=())
+_measuring = ContextVar('constraint_measuring', default=frozenset())
+_hooks = []
+
+
+class ConstraintStats:
+    """
+    Acumulado de las validaciones de una constraint sobre un modelo. `violations` cuenta
+    las llamadas que terminaron en `ValidationError` (u otra excepción).
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.violations = 0
+        self.queries = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def add(self, elapsed: float, queries: int, violated: bool) -> None:
+        self.calls += 1
+        self.violations += int(violated)
+        self.queries += queries
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+        return None
+
+    def as_dict(self) -> dict:
+        return {
+            'calls': self.calls,
+            'violations': self.violations,
+            'queries': self.queries,
+            'total_time': self.total_time,
+            'max_time': self.max_time,
+        }
+
+
+class ConstraintProfiler:
+    """
+    Context manager que registra tiempo y cantidad de consultas de cada `validate` /
+    `validate_bulk` de las constraints (`BaseConstraint`) ejecutadas dentro del bloque.
+
+        with ConstraintProfiler() as profiler:
+            instance.save()
+
+        profiler.stats[('app.Model', 'constraint_name')].queries
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self._token = None
+
+    def __enter__(self):
+        self._token = _profilers.set(_profilers.get() + (self,))
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _profilers.reset(self._token)
+        self._token = None
+
+        return None
+
+    def record(self, model, constraint, elapsed: float, queries: int, violated: bool) -> None:
+        key = (model._meta.label, constraint.name)
+        self.stats.setdefault(key, ConstraintStats()).add(elapsed, queries, violated)
+
+        return None
+
+    def get(self, name: str, model=None) -> ConstraintStats:
+        """
+        Acumulado de la constraint `name` (sumando todos los modelos si no se pasa `model`).
+        """
+        total = ConstraintStats()
+
+        for (_label, _name), _stats in self.stats.items():
+            if _name != name or (model is not None and _label != model._meta.label):
+                continue
+
+            total.calls += _stats.calls
+            total.violations += _stats.violations
+            total.queries += _stats.queries
+            total.total_time += _stats.total_time
+            total.max_time = max(total.max_time, _stats.max_time)
+
+        return total
+
+    @property
+    def total_queries(self) -> int:
+        return sum(_stats.queries for _stats in self.stats.values())
+
+    def report(self) -> list:
+        """
+        @return: Lista de dicts ordenada de mayor a menor tiempo total
+        """
+        rows = [
+            {'model': _label, 'constraint': _name, **_stats.as_dict()}
+            for (_label, _name), _stats in self.stats.items()
+        ]
+
+        return sorted(rows, key=lambda _row: _row['total_time'], reverse=True)
+
+
+def add_constraint_hook(hook) -> None:
+    """
+    Registra un hook global `hook(model, constraint, elapsed, queries, violated)` que se
+    llama tras cada validación de una constraint (p. ej. `prometheus_hook(...)`).
+    """
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+    return None
+
+
+def remove_constraint_hook(hook) -> None:
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+    return None
+
+
+def prometheus_hook(duration_metric=None, queries_metric=None, violations_metric=None):
+    """
+    Hook para métricas estilo Prometheus con labels `model` y `constraint`: `duration_metric`
+    (Histogram/Summary, `observe`) y `queries_metric`/`violations_metric` (Counter, `inc`).
+    """
+
+    def _hook(model, constraint, elapsed, queries, violated):
+        labels = {'model': model._meta.label, 'constraint': constraint.name}
+
+        if duration_metric is not None:
+            duration_metric.labels(**labels).observe(elapsed)
+
+        if queries_metric is not None and queries:
+            queries_metric.labels(**labels).inc(queries)
+
+        if violations_metric is not None and violated:
+            violations_metric.labels(**labels).inc()
+
+        return None
+
+    return _hook
+
+
+def _notify(model, constraint, elapsed: float, queries: int, violated: bool) -> None:
+    for _profiler in _profilers.get():
+        _profiler.record(model, constraint, elapsed, queries, violated)
+
+    for _hook in list(_hooks):
+        try:
+            _hook(model, constraint, elapsed, queries, violated)
+        except Exception:
+            logger.exception('Constraint hook %r failed', _hook)
+
+    return None
+
+
+def profile_validate(method):
+    """
+    Instrumenta `validate`/`validate_bulk` de una constraint. Sin profilers ni hooks activos
+    solo agrega una lectura de `ContextVar`. Las llamadas anidadas (`super().validate()`) se
+    miden una sola vez.
+    """
+    if getattr(method, '_profiled', False):
+        return method
+
+    @functools.wraps(method)
+    def _wrapper(self, model, *args, **kwargs):
+        if not (_hooks or _profilers.get()) or id(self) in _measuring.get():
+            return method(self, model, *args, **kwargs)
+
+        using = kwargs.get('using', args[2] if len(args) > 2 else None) or DEFAULT_DB_ALIAS
+        queries = [0]
+
+        def _count(execute, sql, params, many, context):
+            queries[0] += 1
+
+            return execute(sql, params, many, context)
+
+        token = _measuring.set(_measuring.get() | {id(self)})
+        violated = True
+        start = time.perf_counter()
+
+        try:
+            with connections[using].execute_wrapper(_count):
+                response = method(self, model, *args, **kwargs)
+
+            violated = bool(response) if method.__name__ == 'validate_bulk' else False
+
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            _measuring.reset(token)
+            _notify(model, self, elapsed, queries[0], violated)
+
+    _wrapper._profiled = True
+
+    return _wrapper
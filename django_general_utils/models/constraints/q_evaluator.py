@@ -0,0 +1,186 @@
+import datetime
+import decimal
+import uuid
+
+from django.core.exceptions import FieldError, ValidationError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import F, Q, Value
+from django.db.models.constants import LOOKUP_SEP
+
+# Backends donde `=` sobre texto es sensible a mayúsculas como en Python
+PYTHON_VENDORS = ('postgresql', 'sqlite')
+LOOKUPS = ('exact', 'in', 'gt', 'gte', 'lt', 'lte', 'isnull')
+ORDERED_TYPES = (
+    (int, float, decimal.Decimal),
+    (datetime.datetime,),
+    (datetime.date,),
+    (datetime.time,),
+    (datetime.timedelta,),
+)
+
+
+class Unsupported(Exception):
+    """
+    El Q (o uno de sus hijos) no se puede evaluar en Python; se delega a la base de datos.
+    """
+
+
+def _get_value(against: dict, name: str):
+    """
+    Valor preparado (`get_prep_value`) de un campo del mapa `against`, igual al que se
+    enviaría a la base de datos.
+    """
+    expression = against.get(name)
+
+    if type(expression) is not Value or hasattr(expression.value, 'resolve_expression'):
+        raise Unsupported(name)
+
+    try:
+        field = expression._output_field_or_none
+    except FieldError:
+        field = None
+
+    return field, _prepare_rhs(field, expression.value)
+
+
+def _prepare_rhs(field, value):
+    if hasattr(value, 'resolve_expression'):
+        raise Unsupported(value)
+
+    if field is None or value is None:
+        return value
+
+    try:
+        return field.get_prep_value(value)
+    except (TypeError, ValueError, ValidationError) as e:
+        raise Unsupported(value) from e
+
+
+def _comparable(left, right, ordered: bool) -> bool:
+    if isinstance(left, bool) or isinstance(right, bool):
+        return type(left) is type(right)
+
+    for _types in ORDERED_TYPES:
+        if isinstance(left, _types) and isinstance(right, _types):
+            # datetime hereda de date: no mezclar
+            return isinstance(left, datetime.datetime) == isinstance(right, datetime.datetime)
+
+    # Texto/UUID solo por igualdad: el orden depende del collation de la base de datos
+    if ordered:
+        return False
+
+    return type(left) is type(right) and isinstance(left, (str, uuid.UUID, bytes))
+
+
+def _evaluate_lookup(lookup: str, value, against: dict):
+    """
+    @return: True, False o None (desconocido, como NULL en SQL)
+    """
+    name, _, lookup_name = lookup.partition(LOOKUP_SEP)
+    lookup_name = lookup_name or 'exact'
+
+    if LOOKUP_SEP in lookup_name or lookup_name not in LOOKUPS or name not in against:
+        raise Unsupported(lookup)
+
+    field, lhs = _get_value(against, name)
+
+    if isinstance(value, F):
+        if LOOKUP_SEP in value.name or lookup_name in ('in', 'isnull'):
+            raise Unsupported(lookup)
+
+        _, value = _get_value(against, value.name)
+    elif lookup_name == 'isnull':
+        if not isinstance(value, bool):
+            raise Unsupported(lookup)
+
+        return (lhs is None) == value
+    elif lookup_name == 'in':
+        if hasattr(value, 'resolve_expression') or isinstance(value, (str, bytes)):
+            raise Unsupported(lookup)
+
+        # Igual que Django: los None se descartan del IN
+        value = [_prepare_rhs(field, _value) for _value in value if _value is not None]
+
+        if not value:
+            raise Unsupported(lookup)
+    elif lookup_name == 'exact' and value is None:
+        return lhs is None
+    else:
+        value = _prepare_rhs(field, value)
+
+    if lookup_name == 'in':
+        if lhs is None:
+            return None
+
+        for _value in value:
+            if not _comparable(lhs, _value, ordered=False):
+                raise Unsupported(lookup)
+
+        return lhs in value
+
+    if lhs is None or value is None:
+        return None
+
+    if not _comparable(lhs, value, ordered=lookup_name != 'exact'):
+        raise Unsupported(lookup)
+
+    try:
+        if lookup_name == 'exact':
+            return lhs == value
+        elif lookup_name == 'gt':
+            return lhs > value
+        elif lookup_name == 'gte':
+            return lhs >= value
+        elif lookup_name == 'lt':
+            return lhs < value
+
+        return lhs <= value
+    except TypeError as e:
+        raise Unsupported(lookup) from e
+
+
+def evaluate_q(q: Q, against: dict):
+    """
+    Evalúa un Q en Python con lógica de tres valores (Kleene) sobre el mapa `against` de
+    `Model._get_field_expression_map()`. Soporta exact, in, gt/gte/lt/lte e isnull sobre campos
+    locales (y F() a otro campo local) combinados con AND/OR/NOT.
+    @return: True, False o None (desconocido)
+    @raise Unsupported: Si contiene algo fuera de ese subconjunto
+    """
+    results = []
+
+    for _child in q.children:
+        if isinstance(_child, Q):
+            results.append(evaluate_q(_child, against))
+        elif isinstance(_child, tuple):
+            results.append(_evaluate_lookup(_child[0], _child[1], against))
+        else:
+            raise Unsupported(_child)
+
+    if q.connector == Q.AND:
+        result = False if False in results else (None if None in results else True)
+    elif q.connector == Q.OR:
+        result = True if True in results else (None if None in results else False)
+    else:
+        raise Unsupported(q.connector)
+
+    if q.negated and result is not None:
+        return not result
+
+    return result
+
+
+def check_q(q, against: dict, using: str = DEFAULT_DB_ALIAS) -> bool:
+    """
+    Igual que `Q(q).check(against, using)` (NULL cuenta como True), pero sin consulta cuando
+    `evaluate_q` puede resolverlo. En otros backends o ante algo no soportado usa la base de datos.
+    """
+    q = Q(q)
+
+    if connections[using].vendor in PYTHON_VENDORS:
+        try:
+            return evaluate_q(q, against) is not False
+        except Unsupported:
+            pass
+
+    return q.check(against, using=using)
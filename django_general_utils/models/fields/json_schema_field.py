@@ -1,13 +1,50 @@
 import inspect
 import json
 import os
+import threading
 
+from django.conf import settings
 from django.core import exceptions
 from django.db.models import JSONField
-from jsonschema import (
-    validate,
-    exceptions as jsonschema_exceptions
-)
+from jsonschema import validators
+from jsonschema.exceptions import best_match
+
+# Validators compilados por ruta absoluta del schema: {ruta: (mtime, validator)}
+_validators = {}
+_lock = threading.Lock()
+
+
+def get_schema_validator(path: str):
+    """
+    Validator compilado (clase según `$schema`, schema verificado una sola vez) para el schema de
+    `path`. Los validators de jsonschema son inmutables, así que se comparten entre hilos. Con
+    DEBUG se recarga si cambió el mtime del archivo.
+    """
+    cached = _validators.get(path)
+
+    if cached is not None and not settings.DEBUG:
+        return cached[1]
+
+    mtime = os.path.getmtime(path)
+
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with _lock:
+        cached = _validators.get(path)
+
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, 'r') as file:
+            schema = json.loads(file.read())
+
+        validator_class = validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema)
+        _validators[path] = (mtime, validator)
+
+    return validator
 
 
 class JSONSchemaField(JSONField):
@@ -42,39 +79,91 @@ class JSONSchemaField(JSONField):
         self.schema = kwargs.pop('schema', None)
         super().__init__(*args, **kwargs)
 
+    @property
+    def schema_path(self) -> str:
+        # schema file related to model.py path
+        if getattr(self, '_schema_path', None) is None:
+            dirname = os.path.dirname(inspect.getfile(self.model))
+            self._schema_path = os.path.join(dirname, self.schema)
+
+        return self._schema_path
+
     @property
     def _schema_data(self):
-        model_file = inspect.getfile(self.model)
-        dirname = os.path.dirname(model_file)
+        return self.get_validator().schema
 
-        # schema file related to model.py path
+    def get_validator(self):
+        return get_schema_validator(self.schema_path)
 
-        p = os.path.join(dirname, self.schema)
+    def _get_schema_error(self, value):
+        error = best_match(self.get_validator().iter_errors(value))
 
-        with open(p, 'r') as file:
-            return json.loads(file.read())
+        if error is None:
+            return None
+
+        return exceptions.ValidationError(error.message, code='invalid')
 
     def _validate_schema(self, value):
         # Disable validation when migrations are faked
         if self.model.__module__ == '__fake__':
             return True
 
-        try:
-            status = validate(value, self._schema_data)
-        except jsonschema_exceptions.ValidationError as e:
-            raise exceptions.ValidationError(e.message, code='invalid')
+        error = self._get_schema_error(value)
+
+        if error is not None:
+            raise error
+
+        return None
+
+    def validate_batch(self, instances: list) -> dict:
+        """
+        `clean_fields()` del campo para un lote de instancias (ver `validation.full_clean_batch`):
+        todos los valores se validan con el mismo validator compilado.
+        @return: {índice: ValidationError} de las instancias con un valor inválido
+        """
+        errors = {}
+
+        for _index, _instance in enumerate(instances):
+            value = getattr(_instance, self.attname)
 
-        return status
+            if self.blank and value in self.empty_values:
+                continue
+
+            try:
+                setattr(_instance, self.attname, self.clean(value, _instance))
+            except exceptions.ValidationError as e:
+                errors[_index] = e
+
+        return errors
 
     def validate(self, value, model_instance):
         super().validate(value, model_instance)
 
         self._validate_schema(value)
 
+        # pre_save no vuelve a validar si el valor no cambió desde acá (full_clean + save)
+        if model_instance is not None:
+            model_instance.__dict__[self._validated_attname] = self._get_snapshot(value)
+
+    @property
+    def _validated_attname(self) -> str:
+        return f'_{self.attname}_schema_validated'
+
+    def _get_snapshot(self, value) -> str | None:
+        """
+        JSON del valor con las claves ordenadas: a diferencia de `==`, distingue `1` de `True` y `1.0`.
+        @return: None si el valor no se puede serializar (se vuelve a validar en pre_save)
+        """
+        try:
+            return json.dumps(value, sort_keys=True, cls=self.encoder)
+        except (TypeError, ValueError):
+            return None
+
     def pre_save(self, model_instance, add):
         value = super().pre_save(model_instance, add)
+        validated = model_instance.__dict__.pop(self._validated_attname, None)
 
-        if value and not self.null:
+        if value and not self.null and (validated is None or validated != self._get_snapshot(value)):
             self._validate_schema(value)
 
         return value
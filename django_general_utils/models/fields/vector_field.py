@@ -1,26 +1,189 @@
-import numpy as np
-
-from pgvector.django import VectorField as PGVectorField
-
-
-class VectorField(PGVectorField):
-    def from_db_value(self, value, expression, connection):
-        if value is None:
-            return value
-
-        if isinstance(value, np.ndarray):
-            return value.tolist()
-
-        return [float(v) for v in value[1:-1].split(',')]
-
-    def to_python(self, value):
-        if value is None:
-            return value
-
-        if isinstance(value, list):
-            return value
-
-        if isinstance(value, np.ndarray):
-            return value.tolist()
-
-        return [float(v) for v in value[1:-1].split(',')]
+import struct
+
+import numpy as np
+from django.core import exceptions
+from pgvector import Bit, HalfVector, SparseVector, Vector
+from pgvector.django import VectorField as PGVectorField
+
+# Tipos de columna de pgvector soportados por `VectorField(storage=...)`
+VECTOR_STORAGES = ('vector', 'halfvec', 'sparsevec', 'bit')
+
+
+def vector_to_numpy(value, storage: str = 'vector') -> np.ndarray:
+    """
+    Convierte el valor de una columna de pgvector a `numpy.ndarray` sin pasar por floats de Python:
+    binario de pgvector (`uint16` dimensiones, `uint16` sin uso y float32/float16 big-endian), objetos de
+    `pgvector` (adapters de `pgvector.psycopg`), ndarray, lista o texto (`[0.1,...]`, `{1:0.5}/3`, `0101`).
+    @param storage: 'vector' | 'halfvec' | 'sparsevec' (float32, densos) | 'bit' (bool)
+    @return: ndarray
+    """
+    if isinstance(value, (Vector, HalfVector, SparseVector, Bit)):
+        value = value.to_numpy()
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        if storage == 'sparsevec':
+            value = SparseVector.from_binary(value).to_numpy()
+        elif storage == 'bit':
+            value = Bit.from_binary(value).to_numpy()
+        else:
+            dimensions, _ = struct.unpack_from('>HH', value)
+            value = np.frombuffer(value, dtype='>f2' if storage == 'halfvec' else '>f4', count=dimensions, offset=4)
+    elif isinstance(value, str):
+        if storage == 'sparsevec':
+            value = SparseVector.from_text(value).to_numpy()
+        elif storage == 'bit':
+            value = Bit.from_text(value).to_numpy()
+        else:
+            value = np.fromstring(value[1:-1], dtype=np.float32, sep=',')
+
+    if storage == 'bit':
+        return np.asarray(value, dtype=bool)
+
+    return np.asarray(value).astype(np.float32, copy=False)
+
+
+def binary_quantize(value) -> str:
+    """
+    Bit string con un `1` por cada componente > 0, igual que `binary_quantize()` de pgvector.
+    """
+    return Bit(vector_to_numpy(value) > 0).to_text()
+
+
+def is_empty_vector(value) -> bool:
+    """
+    `value in field.empty_values` compara elemento a elemento con un ndarray (y falla); aquí solo por largo.
+    """
+    if value is None:
+        return True
+
+    if isinstance(value, (str, list, tuple, dict, np.ndarray)):
+        return len(value) == 0
+
+    return False
+
+
+class EmptyVectorValues(list):
+    """
+    `empty_values` de `VectorField`: `Model.clean_fields()` hace `valor in field.empty_values`.
+    """
+
+    def __contains__(self, value) -> bool:
+        return is_empty_vector(value)
+
+
+class VectorField(PGVectorField):
+    """
+    VectorField(dimensions=1536, as_numpy=True, storage='halfvec')
+
+    Con `as_numpy=True` los valores se cargan como `numpy.ndarray` float32 (ver `vector_to_numpy`);
+    por defecto se mantienen las listas de float.
+
+    `storage` define el tipo de columna: 'vector' (float32), 'halfvec' (float16, la mitad de espacio),
+    'sparsevec' o 'bit' (cuantización binaria, 1 bit por dimensión). En Python los valores siguen siendo
+    vectores densos: float para 'vector'/'halfvec'/'sparsevec' y bool para 'bit', que al guardar cuantiza
+    listas/ndarray de floats (ver `binary_quantize`).
+    """
+
+    def __init__(self, *args, as_numpy: bool = False, storage: str = 'vector', **kwargs):
+        assert storage in VECTOR_STORAGES, f'storage must be one of {", ".join(VECTOR_STORAGES)}'
+
+        self.as_numpy = as_numpy
+        self.storage = storage
+        super().__init__(*args, **kwargs)
+        self.empty_values = EmptyVectorValues(self.empty_values)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+
+        if self.as_numpy:
+            kwargs['as_numpy'] = True
+
+        if self.storage != 'vector':
+            kwargs['storage'] = self.storage
+
+        return name, path, args, kwargs
+
+    def validate(self, value, model_instance):
+        if not self.editable:
+            return None
+
+        if value is None and not self.null:
+            raise exceptions.ValidationError(self.error_messages['null'], code='null')
+
+        if not self.blank and is_empty_vector(value):
+            raise exceptions.ValidationError(self.error_messages['blank'], code='blank')
+
+        return None
+
+    def run_validators(self, value):
+        if is_empty_vector(value):
+            return None
+
+        return super().run_validators(value)
+
+    def db_type(self, connection):
+        if self.dimensions is None:
+            return self.storage
+
+        return f'{self.storage}({self.dimensions:d})'
+
+    def get_prep_value(self, value):
+        if value is None or self.storage == 'vector':
+            return super().get_prep_value(value)
+
+        if self.storage == 'halfvec':
+            return HalfVector._to_db(value)
+
+        if self.storage == 'sparsevec':
+            if isinstance(value, dict):
+                value = SparseVector(value, self.dimensions)
+
+            return SparseVector._to_db(value)
+
+        if isinstance(value, Bit):
+            return value.to_text()
+
+        if isinstance(value, str):
+            return Bit(value).to_text()
+
+        value = np.asarray(value)
+
+        if value.dtype == np.bool_:
+            return Bit(value).to_text()
+
+        return binary_quantize(value)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+
+        if self.as_numpy:
+            return vector_to_numpy(value, self.storage)
+
+        if self.storage != 'vector':
+            return vector_to_numpy(value, self.storage).tolist()
+
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+
+        if isinstance(value, Vector):
+            return value.to_list()
+
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return vector_to_numpy(value).tolist()
+
+        return [float(v) for v in value[1:-1].split(',')]
+
+    def to_python(self, value):
+        if value is None:
+            return value
+
+        if self.as_numpy:
+            return vector_to_numpy(value, self.storage)
+
+        if isinstance(value, list):
+            return value
+
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+
+        return self.from_db_value(value, None, None)
@@ -2,6 +2,7 @@ from .array_append import ArrayAppend
 from .array_to_string import ArrayToString
 from .clean_html import CleanHtml
 from .formatted_datetime import FormattedDatetime
+from .formatted_number import FormattedCurrency, FormattedNumber
 from .random_number import RandomNumber
 from .round import Round
 from .subquery_aggregate import SubqueryAggregate
@@ -0,0 +1,171 @@
+import re
+
+from babel import numbers
+from django.db.models import Case, CharField, F, Func, Value, When
+from django.db.models.functions import Abs, Concat
+from django.db.models.lookups import IsNull, LessThan
+
+from ...utils.formats import get_number_formatter
+
+# Dígitos enteros del patrón de to_char (si el valor tiene más, Postgres retorna '#')
+TO_CHAR_INTEGER_DIGITS = 18
+
+
+def get_to_char_format(int_min: int, frac_prec: tuple, grouping: tuple = (3, 3), group_separator=True) -> str:
+    """
+    Patrón de `to_char` equivalente a la parte numérica de un patrón de Babel, con `,` y `.` como
+    separadores (luego se reemplazan por los del locale con `translate`).
+    @param int_min: dígitos enteros mínimos
+    @param frac_prec: (mínimo, máximo) de decimales
+    @param grouping: (primario, secundario) de Babel, p. ej. (3, 2) en `hi_IN`
+    """
+    integer = []
+
+    for _position in range(TO_CHAR_INTEGER_DIGITS):
+        is_group = _position == grouping[0] or (
+            _position > grouping[0] and (_position - grouping[0]) % grouping[1] == 0
+        )
+
+        if group_separator and is_group:
+            integer.append(',')
+
+        integer.append('0' if _position < int_min else '9')
+
+    fraction = '0' * frac_prec[0] + '9' * (frac_prec[1] - frac_prec[0])
+
+    return 'FM' + ''.join(reversed(integer)) + (f'.{fraction}' if fraction else '')
+
+
+class FormattedNumber(Func):
+    """
+    Número formateado en la consulta con `to_char`, usando el patrón, los separadores y los prefijos/sufijos
+    (signo) del locale según Babel, igual que `utils.formats.format_decimal`. Sirve con `values()` para no
+    instanciar modelos solo para formatear. **Postgres-only**.
+
+    `to_char` redondea la mitad hacia arriba (Babel usa redondeo bancario) y no soporta patrones científicos
+    ni de dígitos significativos.
+    """
+    output_field = CharField()
+    template = '%(expressions)s'
+
+    def __init__(
+            self,
+            field,
+            locale: str = 'es_CL',
+            format: str = None,
+            group_separator: bool = True,
+            output_field=None,
+            **extra
+    ):
+        formatter = get_number_formatter(locale, format=format, group_separator=group_separator)
+        output_field = output_field or self.output_field
+        super().__init__(
+            self.get_expression(field, formatter, formatter.pattern.frac_prec),
+            output_field=output_field,
+            **extra
+        )
+
+    def get_affix(self, formatter, value: str) -> str:
+        # Comillas de texto literal del patrón, igual que NumberPattern.apply
+        return re.sub(r"'([^']*)'", lambda m: m.group(1) or "'", value)
+
+    def get_expression(self, field, formatter, frac_prec: tuple):
+        pattern = formatter.pattern
+
+        if pattern.exp_prec or '@' in pattern.pattern:
+            raise ValueError(f'Pattern "{pattern.pattern}" is not supported by to_char')
+
+        field = F(field) if isinstance(field, str) else field
+        value = Abs(field)
+
+        if pattern.scale:
+            value = value * Value(10 ** pattern.scale)
+
+        symbols = formatter.locale.number_symbols[formatter.numbering_system]
+        number = Func(
+            value,
+            Value(get_to_char_format(pattern.int_prec[0], frac_prec, pattern.grouping, formatter.group_separator)),
+            function='to_char',
+            output_field=CharField(),
+        )
+
+        if frac_prec[0] == 0 and frac_prec[1] > 0:
+            # Con FM, to_char(10, 'FM90.99') retorna '10.'
+            number = Func(number, Value('.'), function='rtrim', output_field=CharField())
+
+        number = Func(
+            number,
+            Value(',.'),
+            Value(symbols['group'] + symbols['decimal']),
+            function='translate',
+            output_field=CharField(),
+        )
+        formatted = []
+
+        for _is_negative in (False, True):
+            prefix = self.get_affix(formatter, pattern.prefix[_is_negative])
+            suffix = self.get_affix(formatter, pattern.suffix[_is_negative])
+
+            if not prefix and not suffix:
+                formatted.append(number)
+
+                continue
+
+            formatted.append(Concat(Value(prefix), number, Value(suffix), output_field=CharField()))
+
+        return Case(
+            When(IsNull(field, True), then=Value(None)),
+            When(LessThan(field, 0), then=formatted[True]),
+            default=formatted[False],
+            output_field=CharField(),
+        )
+
+
+class FormattedCurrency(FormattedNumber):
+    """
+    `FormattedNumber` con el patrón de moneda del locale, el símbolo (`¤`), código (`¤¤`) o nombre (`¤¤¤`)
+    de `currency` y sus decimales (`currency_digits`), igual que `utils.formats.format_currency`.
+    **Postgres-only**.
+    """
+
+    def __init__(
+            self,
+            field,
+            locale: str = 'es_CL',
+            currency: str = 'CLP',
+            format: str = None,
+            format_type: str = 'standard',
+            currency_digits: bool = True,
+            group_separator: bool = True,
+            output_field=None,
+            **extra
+    ):
+        if format_type == 'name':
+            raise ValueError('format_type "name" is not supported by to_char')
+
+        formatter = get_number_formatter(
+            locale,
+            currency,
+            format=format,
+            format_type=format_type,
+            currency_digits=currency_digits,
+            group_separator=group_separator,
+        )
+        frac_prec = formatter.pattern.frac_prec
+
+        if currency_digits:
+            frac_prec = (numbers.get_currency_precision(currency),) * 2
+
+        output_field = output_field or self.output_field
+        super(FormattedNumber, self).__init__(
+            self.get_expression(field, formatter, frac_prec),
+            output_field=output_field,
+            **extra
+        )
+
+    def get_affix(self, formatter, value: str) -> str:
+        value = value.replace('¤¤¤', numbers.get_currency_name(formatter.currency, locale=formatter.locale))
+        value = value.replace('¤¤', formatter.currency.upper())
+        value = value.replace('¤', numbers.get_currency_symbol(formatter.currency, formatter.locale))
+
+        return super().get_affix(formatter, value)
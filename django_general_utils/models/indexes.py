@@ -0,0 +1,70 @@
+from django.db.models import Index, Q
+from safedelete.config import FIELD_NAME
+
+PARTIAL_INDEX_SUFFIX = 'pdx'
+
+
+def get_soft_delete_condition() -> Q:
+    return Q(**{f'{FIELD_NAME}__isnull': True})
+
+
+def is_soft_delete_partial(index) -> bool:
+    """
+    True si el índice es parcial sobre las filas no eliminadas (`WHERE deleted IS NULL`).
+    """
+    condition = index.condition
+
+    if condition is None or condition.negated or condition.connector != Q.AND:
+        return False
+
+    return (f'{FIELD_NAME}__isnull', True) in condition.children
+
+
+def make_soft_delete_partial(index, model=None):
+    """
+    Copia de `index` restringida a `deleted IS NULL` (combinada con su `condition`, si tiene).
+    """
+    index = index.clone()
+    condition = get_soft_delete_condition()
+
+    if index.condition is not None and not is_soft_delete_partial(index):
+        condition = index.condition & condition
+
+    if not index.name and model is not None:
+        index.suffix = PARTIAL_INDEX_SUFFIX
+        index.set_name_with_model(model)
+
+    index.condition = condition
+
+    return index
+
+
+def has_soft_delete_partial_index(model, field) -> bool:
+    return any(
+        _index.fields and _index.fields[0].lstrip('-') == field.name and is_soft_delete_partial(_index)
+        for _index in model._meta.indexes
+    )
+
+
+def apply_soft_delete_partial_indexes(model) -> None:
+    """
+    Reescribe `Meta.indexes` como índices parciales `WHERE deleted IS NULL` y reemplaza el índice
+    simple de cada FK (`db_index=True`) por uno parcial. Los cambios salen en `makemigrations`.
+    """
+    meta = model._meta
+    indexes = [
+        _index if is_soft_delete_partial(_index) else make_soft_delete_partial(_index, model)
+        for _index in meta.indexes
+    ]
+    meta.indexes = indexes
+
+    for _field in meta.local_fields:
+        if not _field.many_to_one or not _field.db_index or _field.unique:
+            continue
+
+        _field.db_index = False
+
+        if not has_soft_delete_partial_index(model, _field):
+            indexes.append(make_soft_delete_partial(Index(fields=[_field.name]), model))
+
+    return None
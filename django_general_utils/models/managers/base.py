@@ -6,7 +6,9 @@ from queryable_properties import managers
 from safedelete.config import FIELD_NAME
 from safedelete.managers import SafeDeleteManager
 
+from ..archive import get_archive_view_model
 from ..querysets.base import BaseModelQuerySet
+from ..validation import full_clean_batch
 from ...utils.drf.validation_errors import ListValidationError
 
 
@@ -30,6 +32,14 @@ class BaseModelManager(
         self.filter_queryable_property(**kwargs.get('property_params', {}))
         return self.get_queryset().select_properties(*names)
 
+    def all_with_archived(self):
+        """
+        Como `all_with_deleted()` pero incluyendo las filas archivadas, a través de la vista
+        `<tabla>_with_archive` (ver `archive.create_archive_view`). Retorna instancias de solo
+        lectura del modelo de la vista, con las FK como `<campo>_id`.
+        """
+        return get_archive_view_model(self.model)._default_manager.using(self._db)
+
     def get_queryset(self):
         from ..base import BaseModel
 
@@ -61,6 +71,8 @@ class BaseModelManager(
             full_clean: bool = True,
             # NO DELETE CREATED AND UPDATED. FILTER ONLY TAKE UNIQUE FIELDS NOT IN UPDATE FIELDS
             delete_others: bool = False,
+            with_history: bool = True,
+            history_user=None,
     ):
         assert len(update_fields) > 0, _('update_fields is required')
         assert len(unique_fields) > 0, _('unique_fields is required')
@@ -110,18 +122,6 @@ class BaseModelManager(
                 for _value in to_create
             ]
 
-            if full_clean:
-                for _obj in models_to_create:
-                    try:
-                        _obj.full_clean()
-                    except ValidationError as e:
-                        errors[
-                            str([
-                                str(getattr(_obj, _unique))
-                                for _unique in unique_fields
-                            ])
-                        ] = e
-
         if len(to_update) > 0:
             for _obj in to_update.values():
                 for _field in update_fields:
@@ -137,17 +137,18 @@ class BaseModelManager(
 
                 models_to_update.append(_obj)
 
-            if full_clean:
-                for _obj in models_to_update:
-                    try:
-                        _obj.full_clean()
-                    except ValidationError as e:
-                        errors[
-                            str([
-                                str(getattr(_obj, _unique))
-                                for _unique in unique_fields
-                            ])
-                        ] = e
+        # Un solo lote: las constraints con validate_bulk ven creaciones y actualizaciones juntas
+        if full_clean:
+            objs_to_clean = models_to_create + models_to_update
+
+            for _obj, _error in zip(objs_to_clean, full_clean_batch(objs_to_clean)):
+                if len(_error.message_dict) > 0:
+                    errors[
+                        str([
+                            str(getattr(_obj, _unique))
+                            for _unique in unique_fields
+                        ])
+                    ] = _error
 
         if full_clean and any([len(_error.message_dict) > 0 for _error in errors.values()]):
             raise ListValidationError(errors.values())
@@ -157,6 +158,8 @@ class BaseModelManager(
                 instance_created = self.bulk_create(
                     models_to_create,
                     full_clean=False,
+                    with_history=with_history,
+                    history_user=history_user,
                 )
             except ListValidationError as e:
                 for _model, _error in zip(models_to_create, e.args[0]):
@@ -174,6 +177,8 @@ class BaseModelManager(
                     fields=update_fields,
                     batch_size=100,
                     full_clean=False,
+                    with_history=with_history,
+                    history_user=history_user,
                 )
             except ListValidationError as e:
                 for _model, _error in zip(models_to_create, e.args[0]):
@@ -5,6 +5,7 @@ from ordered_model.models import OrderedModelManager
 from queryable_properties import managers
 
 from ..querysets.base_without_safe_delete import BaseModelWithoutSafeDeleteQuerySet
+from ..validation import full_clean_batch
 from ...utils.drf.validation_errors import ListValidationError
 
 
@@ -70,18 +71,6 @@ class BaseWithoutSafeDeleteModelManager(
                 for _value in to_create
             ]
 
-            if full_clean:
-                for _obj in models_to_create:
-                    try:
-                        _obj.full_clean()
-                    except ValidationError as e:
-                        errors[
-                            str([
-                                str(getattr(_obj, _unique))
-                                for _unique in unique_fields
-                            ])
-                        ] = e
-
         if len(to_update) > 0:
             for _obj in to_update.values():
                 for _field in update_fields:
@@ -97,17 +86,18 @@ class BaseWithoutSafeDeleteModelManager(
 
                 models_to_update.append(_obj)
 
-            if full_clean:
-                for _obj in models_to_update:
-                    try:
-                        _obj.full_clean()
-                    except ValidationError as e:
-                        errors[
-                            str([
-                                str(getattr(_obj, _unique))
-                                for _unique in unique_fields
-                            ])
-                        ] = e
+        # Un solo lote: las constraints con validate_bulk ven creaciones y actualizaciones juntas
+        if full_clean:
+            objs_to_clean = models_to_create + models_to_update
+
+            for _obj, _error in zip(objs_to_clean, full_clean_batch(objs_to_clean)):
+                if len(_error.message_dict) > 0:
+                    errors[
+                        str([
+                            str(getattr(_obj, _unique))
+                            for _unique in unique_fields
+                        ])
+                    ] = _error
 
         if full_clean and any([len(_error.message_dict) > 0 for _error in errors.values()]):
             raise ListValidationError(errors.values())
@@ -0,0 +1,3 @@
+from .partition_history import CreateHistoryPartitions, PartitionHistoryTable
+from .vector_index import CreateVectorIndex
+from .vector_storage import ConvertVectorStorage, CopyVectorStorage
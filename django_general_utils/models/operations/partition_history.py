@@ -0,0 +1,349 @@
+import datetime
+
+from django.db import transaction
+from django.db.migrations.operations.base import Operation
+
+# Sufijo de las particiones mensuales: <tabla>_pYYYYMM
+PARTITION_SUFFIX = '_p'
+DEFAULT_PARTITION_SUFFIX = '_default'
+
+
+def month_start(value: datetime.date) -> datetime.date:
+    return datetime.date(value.year, value.month, 1)
+
+
+def add_months(value: datetime.date, months: int) -> datetime.date:
+    month = value.month - 1 + months
+
+    return datetime.date(value.year + month // 12, month % 12 + 1, 1)
+
+
+def get_partition_name(table: str, month: datetime.date) -> str:
+    return f'{table}{PARTITION_SUFFIX}{month:%Y%m}'
+
+
+def parse_partition_month(table: str, name: str) -> datetime.date | None:
+    """
+    Mes de una partición creada por este módulo a partir de su nombre, o None.
+    """
+    prefix = f'{table}{PARTITION_SUFFIX}'
+
+    if not name.startswith(prefix) or len(name) != len(prefix) + 6 or not name[len(prefix):].isdigit():
+        return None
+
+    return datetime.date(int(name[len(prefix):len(prefix) + 4]), int(name[len(prefix) + 4:]), 1)
+
+
+def is_partitioned(connection, table: str) -> bool:
+    if connection.vendor != 'postgresql':
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)', [table])
+        row = cursor.fetchone()
+
+    return row is not None and row[0] == 'p'
+
+
+def get_partitions(connection, table: str) -> dict:
+    """
+    {mes: nombre} de las particiones mensuales de `table`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname FROM pg_inherits '
+            'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+            'WHERE pg_inherits.inhparent = to_regclass(%s)',
+            [table]
+        )
+        names = [_row[0] for _row in cursor.fetchall()]
+
+    partitions = {}
+
+    for _name in names:
+        month = parse_partition_month(table, _name)
+
+        if month is not None:
+            partitions[month] = _name
+
+    return partitions
+
+
+def get_default_partition(connection, table: str) -> str | None:
+    """
+    Nombre de la partición default de `table`, o None si no tiene.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname FROM pg_partitioned_table '
+            'JOIN pg_class child ON child.oid = pg_partitioned_table.partdefid '
+            'WHERE pg_partitioned_table.partrelid = to_regclass(%s)',
+            [table]
+        )
+        row = cursor.fetchone()
+
+    return row[0] if row is not None else None
+
+
+def get_month_bound(month: datetime.date) -> str:
+    return f'{month.isoformat()} 00:00:00+00'
+
+
+def create_month_partitions(
+        connection,
+        table: str,
+        start: datetime.date,
+        end: datetime.date,
+        date_column: str = 'history_date',
+) -> list:
+    """
+    Crea (si no existen) las particiones mensuales de `table` desde el mes de `start`
+    hasta el mes de `end`, ambos incluidos.
+
+    Postgres no permite crear una partición si la partición default ya tiene filas de ese
+    rango: en ese caso se desacopla la default, se crean las particiones, se mueven las filas
+    y se vuelve a acoplar, todo en la misma transacción.
+    @param date_column: Columna por la que está particionada la tabla
+    @return: Nombres de las particiones creadas
+    """
+    quote_name = connection.ops.quote_name
+    existing = set(get_partitions(connection, table))
+    months = []
+    month = month_start(start)
+
+    while month <= end:
+        if month not in existing:
+            months.append(month)
+
+        month = add_months(month, 1)
+
+    if not months:
+        return []
+
+    lower, upper = get_month_bound(months[0]), get_month_bound(add_months(months[-1], 1))
+    column = quote_name(date_column)
+
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        default = get_default_partition(connection, table)
+        detached = False
+
+        if default is not None:
+            # Las filas de meses ya particionados nunca quedan en la default
+            cursor.execute(
+                f'SELECT EXISTS (SELECT 1 FROM {quote_name(default)} WHERE {column} >= %s AND {column} < %s)',
+                [lower, upper]
+            )
+            detached = cursor.fetchone()[0]
+
+        if detached:
+            cursor.execute(f'ALTER TABLE {quote_name(table)} DETACH PARTITION {quote_name(default)}')
+
+        for _month in months:
+            cursor.execute(
+                f'CREATE TABLE {quote_name(get_partition_name(table, _month))} PARTITION OF {quote_name(table)} '
+                f'FOR VALUES FROM (%s) TO (%s)',
+                [get_month_bound(_month), get_month_bound(add_months(_month, 1))]
+            )
+
+        if detached:
+            cursor.execute(
+                f'WITH moved AS ('
+                f'DELETE FROM {quote_name(default)} WHERE {column} >= %s AND {column} < %s RETURNING *'
+                f') INSERT INTO {quote_name(table)} SELECT * FROM moved',
+                [lower, upper]
+            )
+            cursor.execute(f'ALTER TABLE {quote_name(table)} ATTACH PARTITION {quote_name(default)} DEFAULT')
+
+    return [get_partition_name(table, _month) for _month in months]
+
+
+def drop_partition(connection, table: str, name: str) -> None:
+    quote_name = connection.ops.quote_name
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE {quote_name(table)} DETACH PARTITION {quote_name(name)}')
+        cursor.execute(f'DROP TABLE {quote_name(name)}')
+
+    return None
+
+
+class PartitionHistoryTable(Operation):
+    """
+    Convierte la tabla de un modelo histórico (`HistoricalX`) en una tabla particionada por
+    rango mensual de `history_date`. Copia los datos a la nueva tabla, crea una partición por
+    mes con datos hasta `months_ahead` meses a futuro, más una partición default.
+
+    La PK pasa a ser (`history_id`, `history_date`), como exige Postgres para tablas
+    particionadas. Solo aplica en PostgreSQL; en otros motores es un no-op.
+    """
+    reversible = True
+    reduces_to_sql = False
+
+    def __init__(self, model_name: str, months_ahead: int = 3):
+        self.model_name = model_name
+        self.months_ahead = months_ahead
+
+    def deconstruct(self):
+        kwargs = {'model_name': self.model_name}
+
+        if self.months_ahead != 3:
+            kwargs['months_ahead'] = self.months_ahead
+
+        return self.__class__.__qualname__, [], kwargs
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def _rebuild(self, schema_editor, model, partitioned: bool) -> None:
+        connection = schema_editor.connection
+        quote_name = schema_editor.quote_name
+        table = model._meta.db_table
+        legacy = f'{table}_legacy'
+        pk_column = model._meta.pk.column
+        date_column = model._meta.get_field('history_date').column
+
+        schema_editor.execute(f'ALTER TABLE {quote_name(table)} RENAME TO {quote_name(legacy)}')
+        schema_editor.execute(
+            f'CREATE TABLE {quote_name(table)} ('
+            f'LIKE {quote_name(legacy)} INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING STORAGE'
+            f')' + (f' PARTITION BY RANGE ({quote_name(date_column)})' if partitioned else '')
+        )
+
+        with connection.cursor() as cursor:
+            # Columna serial (no identity): la secuencia pertenece a la tabla vieja
+            cursor.execute('SELECT pg_get_serial_sequence(%s, %s)', [quote_name(table), pk_column])
+            own_sequence = cursor.fetchone()[0]
+            cursor.execute('SELECT pg_get_serial_sequence(%s, %s)', [quote_name(legacy), pk_column])
+            legacy_sequence = cursor.fetchone()[0]
+
+            if own_sequence is None and legacy_sequence is not None:
+                cursor.execute(f'ALTER SEQUENCE {legacy_sequence} OWNED BY {quote_name(table)}.{quote_name(pk_column)}')
+
+            if partitioned:
+                cursor.execute(f'SELECT MIN({quote_name(date_column)}) FROM {quote_name(legacy)}')
+                first = cursor.fetchone()[0]
+                today = datetime.date.today()
+                create_month_partitions(
+                    connection,
+                    table,
+                    first.date() if first is not None else today,
+                    add_months(today, self.months_ahead),
+                    date_column
+                )
+                cursor.execute(
+                    f'CREATE TABLE {quote_name(table + DEFAULT_PARTITION_SUFFIX)} '
+                    f'PARTITION OF {quote_name(table)} DEFAULT'
+                )
+
+            cursor.execute(f'INSERT INTO {quote_name(table)} SELECT * FROM {quote_name(legacy)}')
+            cursor.execute(f'DROP TABLE {quote_name(legacy)} CASCADE')
+
+            primary_key = [pk_column, date_column] if partitioned else [pk_column]
+            cursor.execute(
+                f'ALTER TABLE {quote_name(table)} '
+                f'ADD PRIMARY KEY ({", ".join(quote_name(_column) for _column in primary_key)})'
+            )
+
+            if own_sequence is not None:
+                cursor.execute(
+                    f'SELECT setval(%s, COALESCE(MAX({quote_name(pk_column)}), 0) + 1, false) '
+                    f'FROM {quote_name(table)}',
+                    [own_sequence]
+                )
+
+        for _sql in schema_editor._model_indexes_sql(model):
+            schema_editor.execute(_sql)
+
+        for _field in model._meta.local_fields:
+            if _field.remote_field and _field.db_constraint:
+                schema_editor.execute(schema_editor._create_fk_sql(model, _field, '_fk_%(to_table)s_%(to_column)s'))
+
+        return None
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            return None
+
+        model = to_state.apps.get_model(app_label, self.model_name)
+
+        if is_partitioned(schema_editor.connection, model._meta.db_table):
+            return None
+
+        self._rebuild(schema_editor, model, partitioned=True)
+
+        return None
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            return None
+
+        model = from_state.apps.get_model(app_label, self.model_name)
+
+        if not is_partitioned(schema_editor.connection, model._meta.db_table):
+            return None
+
+        self._rebuild(schema_editor, model, partitioned=False)
+
+        return None
+
+    def describe(self):
+        return f'Partition history table of {self.model_name} by month'
+
+    @property
+    def migration_name_fragment(self):
+        return f'partition_{self.model_name.lower()}'
+
+
+class CreateHistoryPartitions(Operation):
+    """
+    Crea por adelantado las particiones mensuales de una tabla histórica ya particionada
+    (el comando `prune_history` también las crea en cada corrida).
+    """
+    reversible = True
+    reduces_to_sql = False
+
+    def __init__(self, model_name: str, months_ahead: int = 3):
+        self.model_name = model_name
+        self.months_ahead = months_ahead
+
+    def deconstruct(self):
+        kwargs = {'model_name': self.model_name}
+
+        if self.months_ahead != 3:
+            kwargs['months_ahead'] = self.months_ahead
+
+        return self.__class__.__qualname__, [], kwargs
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            return None
+
+        model = to_state.apps.get_model(app_label, self.model_name)
+        table = model._meta.db_table
+
+        if not is_partitioned(schema_editor.connection, table):
+            return None
+
+        today = datetime.date.today()
+        create_month_partitions(
+            schema_editor.connection,
+            table,
+            today,
+            add_months(today, self.months_ahead),
+            model._meta.get_field('history_date').column
+        )
+
+        return None
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        pass
+
+    def describe(self):
+        return f'Create history partitions of {self.model_name}'
+
+    @property
+    def migration_name_fragment(self):
+        return f'create_partitions_{self.model_name.lower()}'
@@ -0,0 +1,182 @@
+from django.db.backends.utils import truncate_name
+from django.db.migrations.operations.base import Operation
+from pgvector.django import HnswIndex, IvfflatIndex
+
+# Opclass de pgvector por tipo de columna y métrica (ver `VectorQuerySetMixin.nearest`)
+VECTOR_OPCLASSES = {
+    'vector': {
+        'l2': 'vector_l2_ops',
+        'inner_product': 'vector_ip_ops',
+        'cosine': 'vector_cosine_ops',
+        'l1': 'vector_l1_ops',
+    },
+    'halfvec': {
+        'l2': 'halfvec_l2_ops',
+        'inner_product': 'halfvec_ip_ops',
+        'cosine': 'halfvec_cosine_ops',
+        'l1': 'halfvec_l1_ops',
+    },
+    'sparsevec': {
+        'l2': 'sparsevec_l2_ops',
+        'inner_product': 'sparsevec_ip_ops',
+        'cosine': 'sparsevec_cosine_ops',
+        'l1': 'sparsevec_l1_ops',
+    },
+    'bit': {'hamming': 'bit_hamming_ops', 'jaccard': 'bit_jaccard_ops'},
+}
+INDEX_METHODS = {
+    'hnsw': HnswIndex,
+    'ivfflat': IvfflatIndex,
+}
+# IVFFlat no soporta sparsevec, L1 ni Jaccard
+IVFFLAT_OPCLASSES = {
+    'vector_l2_ops', 'vector_ip_ops', 'vector_cosine_ops',
+    'halfvec_l2_ops', 'halfvec_ip_ops', 'halfvec_cosine_ops',
+    'bit_hamming_ops',
+}
+
+
+def get_vector_type(field, connection) -> str:
+    return field.db_type(connection).split('(')[0]
+
+
+class CreateVectorIndex(Operation):
+    """
+    Crea un índice HNSW o IVFFlat sobre un `VectorField` con el opclass de `metric`. Permite
+    ajustar `m`/`ef_construction` (HNSW) o `lists` (IVFFlat) y la memoria/paralelismo del build
+    (`maintenance_work_mem`, `max_parallel_maintenance_workers`, solo para esta transacción).
+    `concurrently=True` requiere una migración con `atomic = False`.
+
+    El índice no se agrega al estado de los modelos (como `PartitionHistoryTable`): no se declara
+    en `Meta.indexes`. Solo aplica en PostgreSQL; en otros motores es un no-op.
+    """
+    reversible = True
+    reduces_to_sql = False
+
+    def __init__(
+            self,
+            model_name: str,
+            field: str,
+            method: str = 'hnsw',
+            metric: str = 'cosine',
+            name: str = None,
+            m: int = None,
+            ef_construction: int = None,
+            lists: int = None,
+            condition=None,
+            concurrently: bool = False,
+            maintenance_work_mem: str = None,
+            max_parallel_maintenance_workers: int = None,
+    ):
+        assert method in INDEX_METHODS, f'method must be one of {", ".join(INDEX_METHODS)}'
+
+        self.model_name = model_name
+        self.field = field
+        self.method = method
+        self.metric = metric
+        self.name = name
+        self.m = m
+        self.ef_construction = ef_construction
+        self.lists = lists
+        self.condition = condition
+        self.concurrently = concurrently
+        self.maintenance_work_mem = maintenance_work_mem
+        self.max_parallel_maintenance_workers = max_parallel_maintenance_workers
+
+    def deconstruct(self):
+        kwargs = {'model_name': self.model_name, 'field': self.field}
+        defaults = {
+            'method': 'hnsw',
+            'metric': 'cosine',
+            'name': None,
+            'm': None,
+            'ef_construction': None,
+            'lists': None,
+            'condition': None,
+            'concurrently': False,
+            'maintenance_work_mem': None,
+            'max_parallel_maintenance_workers': None,
+        }
+
+        for _name, _default in defaults.items():
+            if getattr(self, _name) != _default:
+                kwargs[_name] = getattr(self, _name)
+
+        return self.__class__.__qualname__, [], kwargs
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def get_index_name(self, model, connection) -> str:
+        if self.name is not None:
+            return self.name
+
+        column = model._meta.get_field(self.field).column
+
+        return truncate_name(
+            f'{model._meta.db_table}_{column}_{self.method}_{self.metric}',
+            connection.ops.max_name_length()
+        )
+
+    def get_index(self, model, connection):
+        field = model._meta.get_field(self.field)
+        opclasses = VECTOR_OPCLASSES.get(get_vector_type(field, connection), {})
+
+        if self.metric not in opclasses:
+            raise ValueError(f'Metric "{self.metric}" is not supported by column type "{field.db_type(connection)}"')
+
+        if self.method == 'ivfflat' and opclasses[self.metric] not in IVFFLAT_OPCLASSES:
+            raise ValueError(f'Operator class "{opclasses[self.metric]}" is not supported by ivfflat')
+
+        kwargs = {
+            'fields': [self.field],
+            'name': self.get_index_name(model, connection),
+            'opclasses': [opclasses[self.metric]],
+            'condition': self.condition,
+        }
+
+        if self.method == 'hnsw':
+            kwargs.update(m=self.m, ef_construction=self.ef_construction)
+        else:
+            kwargs.update(lists=self.lists)
+
+        return INDEX_METHODS[self.method](**kwargs)
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            return None
+
+        model = to_state.apps.get_model(app_label, self.model_name)
+        config = {
+            'maintenance_work_mem': self.maintenance_work_mem,
+            'max_parallel_maintenance_workers': self.max_parallel_maintenance_workers,
+        }
+
+        for _name, _value in config.items():
+            if _value is not None:
+                # Fuera de una transacción (concurrently) queda para la sesión de la migración
+                schema_editor.execute('SELECT set_config(%s, %s, %s)', [_name, str(_value), not self.concurrently])
+
+        schema_editor.add_index(model, self.get_index(model, schema_editor.connection), concurrently=self.concurrently)
+
+        return None
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            return None
+
+        model = from_state.apps.get_model(app_label, self.model_name)
+        schema_editor.remove_index(
+            model,
+            self.get_index(model, schema_editor.connection),
+            concurrently=self.concurrently
+        )
+
+        return None
+
+    def describe(self):
+        return f'Create {self.method} index ({self.metric}) on {self.model_name}.{self.field}'
+
+    @property
+    def migration_name_fragment(self):
+        return f'{self.model_name.lower()}_{self.field}_{self.method}'
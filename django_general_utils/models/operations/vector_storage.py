@@ -0,0 +1,137 @@
+from django.db.migrations.exceptions import IrreversibleError
+from django.db.migrations.operations import AlterField
+from django.db.migrations.operations.base import Operation
+
+from .vector_index import get_vector_type
+
+
+def get_vector_cast_sql(column: str, from_type: str, to_db_type: str) -> str:
+    """
+    Expresión que convierte `column` (tipo `from_type`) a `to_db_type` (p. ej. `halfvec(1536)`). A `bit`
+    se pasa con `binary_quantize()`; desde `bit` no se puede reconstruir el vector.
+    """
+    to_type = to_db_type.split('(')[0]
+
+    if from_type == 'bit' and to_type != 'bit':
+        raise IrreversibleError(f'Cannot convert a bit column to {to_db_type}')
+
+    if to_type == 'bit' and from_type != 'bit':
+        # binary_quantize() acepta vector y halfvec
+        if from_type == 'sparsevec':
+            column = f'{column}::vector'
+
+        return f'binary_quantize({column})::{to_db_type}'
+
+    return f'{column}::{to_db_type}'
+
+
+class ConvertVectorStorage(AlterField):
+    """
+    `AlterField` de un `VectorField` que cambia su `storage` ('vector' -> 'halfvec' | 'sparsevec' | 'bit')
+    reescribiendo la columna con `ALTER COLUMN ... TYPE ... USING <cast>` (ver `get_vector_cast_sql`).
+    Reemplaza al `AlterField` que genera makemigrations, necesario para pasar a `bit`, que no tiene cast
+    directo. Los índices de la columna deben eliminarse antes y recrearse con el opclass del nuevo tipo
+    (ver `CreateVectorIndex`). La conversión a `bit` es irreversible.
+    """
+
+    def alter_vector_storage(self, app_label, schema_editor, from_state, to_state):
+        from_model = from_state.apps.get_model(app_label, self.model_name)
+        to_model = to_state.apps.get_model(app_label, self.model_name)
+        connection = schema_editor.connection
+
+        if not self.allow_migrate_model(connection.alias, to_model):
+            return None
+
+        from_field = from_model._meta.get_field(self.name)
+        to_field = to_model._meta.get_field(self.name)
+        from_type = get_vector_type(from_field, connection)
+
+        if connection.vendor != 'postgresql' or from_type == get_vector_type(to_field, connection):
+            schema_editor.alter_field(from_model, from_field, to_field)
+
+            return None
+
+        column = schema_editor.quote_name(from_field.column)
+        to_db_type = to_field.db_type(connection)
+        schema_editor.execute(
+            f'ALTER TABLE {schema_editor.quote_name(from_model._meta.db_table)} ALTER COLUMN {column} '
+            f'TYPE {to_db_type} USING {get_vector_cast_sql(column, from_type, to_db_type)}'
+        )
+
+        # El resto de los cambios del campo (null, default, ...) con el tipo ya convertido
+        name, path, args, kwargs = from_field.deconstruct()
+        kwargs.update(storage=to_field.storage, dimensions=to_field.dimensions)
+        converted_field = from_field.__class__(*args, **kwargs)
+        converted_field.set_attributes_from_name(name)
+        converted_field.model = from_model
+        schema_editor.alter_field(from_model, converted_field, to_field)
+
+        return None
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        return self.alter_vector_storage(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        return self.alter_vector_storage(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return f'Convert vector storage of {self.model_name}.{self.name} to {self.field.storage}'
+
+    @property
+    def migration_name_fragment(self):
+        return f'convert_{self.model_name_lower}_{self.name_lower}_{self.field.storage}'
+
+
+class CopyVectorStorage(Operation):
+    """
+    Llena la columna `target` (p. ej. un `VectorField(storage='bit')` recién agregado) a partir de `source`,
+    convirtiendo con `get_vector_cast_sql`. Permite mantener la columna de precisión completa para el
+    rescore de `nearest(..., rescore_field=...)` junto a la cuantizada que se indexa. Solo las filas con
+    `target` nulo; en otros motores es un no-op.
+    """
+    reversible = True
+    reduces_to_sql = False
+
+    def __init__(self, model_name: str, source: str, target: str):
+        self.model_name = model_name
+        self.source = source
+        self.target = target
+
+    def deconstruct(self):
+        return self.__class__.__qualname__, [], {
+            'model_name': self.model_name,
+            'source': self.source,
+            'target': self.target,
+        }
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        connection = schema_editor.connection
+        model = to_state.apps.get_model(app_label, self.model_name)
+
+        if connection.vendor != 'postgresql' or not self.allow_migrate_model(connection.alias, model):
+            return None
+
+        source = model._meta.get_field(self.source)
+        target = model._meta.get_field(self.target)
+        source_column = schema_editor.quote_name(source.column)
+        target_column = schema_editor.quote_name(target.column)
+        schema_editor.execute(
+            f'UPDATE {schema_editor.quote_name(model._meta.db_table)} SET {target_column} = '
+            f'{get_vector_cast_sql(source_column, get_vector_type(source, connection), target.db_type(connection))} '
+            f'WHERE {target_column} IS NULL AND {source_column} IS NOT NULL'
+        )
+
+        return None
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        return None
+
+    def describe(self):
+        return f'Copy {self.model_name}.{self.source} into {self.model_name}.{self.target}'
+
+    @property
+    def migration_name_fragment(self):
+        return f'copy_{self.model_name.lower()}_{self.source}_{self.target}'
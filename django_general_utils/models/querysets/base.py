@@ -1,16 +1,27 @@
 from django.core.exceptions import FieldDoesNotExist
-from django.core.exceptions import ValidationError
 from django.db import router, transaction
 from django.db.models import Q
 from django.db.models.constants import LOOKUP_SEP
 from ordered_model.models import OrderedModelQuerySet
-from safedelete.config import FIELD_NAME
+from safedelete.config import FIELD_NAME, SOFT_DELETE_CASCADE
 from safedelete.queryset import SafeDeleteQueryset
 
 from ...utils.drf.validation_errors import ListValidationError
-
-
-class BaseModelQuerySet(SafeDeleteQueryset, OrderedModelQuerySet):
+from ..cascade import cascade_soft_delete
+from ..simple_history import bulk_history_create, get_request_user, has_updated_by
+from ..validation import full_clean_batch
+from .formats import FormatQuerySetMixin
+from .transition import TransitionQuerySetMixin
+from .vector import VectorQuerySetMixin
+
+
+class BaseModelQuerySet(
+    TransitionQuerySetMixin,
+    VectorQuerySetMixin,
+    FormatQuerySetMixin,
+    SafeDeleteQueryset,
+    OrderedModelQuerySet,
+):
     @staticmethod
     def _is_valid_lookup(model, field_name: str):
         """
@@ -113,47 +124,127 @@ class BaseModelQuerySet(SafeDeleteQueryset, OrderedModelQuerySet):
 
         return self
 
+    def _assign_history_user(self, objs, user=None):
+        """
+        Asigna `updated_by` con el usuario del historial (`user` o el del request): simple_history
+        lo toma de `_history_user`, que en `BaseModel` es `updated_by`.
+        @return: Usuario asignado, o None
+        """
+        user = user or get_request_user()
+
+        if user is not None and has_updated_by(self.model):
+            for _obj in objs:
+                _obj.updated_by = user
+
+        return user
+
     def bulk_create(self, objs, *args, **kwargs):
         full_clean = kwargs.pop('full_clean', True)
+        with_history = kwargs.pop('with_history', None)
+        history_user = kwargs.pop('history_user', None)
 
-        if full_clean:
-            errors = []
+        # Las filas omitidas por conflicto no se distinguen de las insertadas: sin historial, salvo
+        # que se pida explícitamente (error)
+        if kwargs.get('ignore_conflicts', len(args) > 1 and args[1]):
+            if with_history:
+                raise ValueError('bulk_create(ignore_conflicts=True) no puede escribir el historial.')
 
-            for _obj in objs:
-                try:
-                    _obj.full_clean()
-                    errors.append(ValidationError({}))
-                except ValidationError as e:
-                    errors.append(e)
+            with_history = False
+
+        with_history = with_history is not False
+
+        history_user = self._assign_history_user(objs, history_user) if with_history else None
+
+        if full_clean:
+            errors = full_clean_batch(objs)
 
             if any([len(_error.message_dict) > 0 for _error in errors]):
                 raise ListValidationError(errors)
 
-        using = kwargs.get('using') or router.db_for_write(self.model)
+        using = self._db or router.db_for_write(self.model)
 
         with transaction.atomic(using=using):
             if hasattr(self.model, '_assign_auto_ids'):
                 self.model._assign_auto_ids(objs, using=using)
             response = super().bulk_create(objs, *args, **kwargs)
 
+            if with_history:
+                bulk_history_create(self.model, response, '+', user=history_user, using=using)
+
         return response
 
     def bulk_update(self, objs, *args, **kwargs):
         full_clean = kwargs.pop('full_clean', True)
+        with_history = kwargs.pop('with_history', True)
+        history_user = kwargs.pop('history_user', None)
+        history_user = self._assign_history_user(objs, history_user) if with_history else None
 
-        if full_clean:
-            errors = []
+        if history_user is not None and has_updated_by(self.model):
+            if args:
+                args = ([*args[0], 'updated_by'], *args[1:]) if 'updated_by' not in args[0] else args
+            elif 'updated_by' not in kwargs['fields']:
+                kwargs['fields'] = [*kwargs['fields'], 'updated_by']
 
-            for _obj in objs:
-                try:
-                    _obj.full_clean()
-                    errors.append(ValidationError({}))
-                except ValidationError as e:
-                    errors.append(e)
+        if full_clean:
+            errors = full_clean_batch(objs)
 
             if any([len(_error.message_dict) > 0 for _error in errors]):
                 raise ListValidationError(errors)
 
-        response = super().bulk_update(objs, *args, **kwargs)
+        using = self._db or router.db_for_write(self.model)
+
+        with transaction.atomic(using=using):
+            response = super().bulk_update(objs, *args, **kwargs)
+
+            if with_history:
+                bulk_history_create(self.model, objs, '~', user=history_user, using=using)
+
+        return response
+
+    def _bulk_soft_delete(self, objs: list, undelete: bool, user=None, with_history: bool = True) -> tuple:
+        if not objs:
+            return 0, {}
+
+        response = cascade_soft_delete(
+            self.model,
+            [_obj.pk for _obj in objs],
+            using=router.db_for_write(self.model),
+            user=user,
+            with_history=with_history,
+            include_cascade=self.model._safedelete_policy == SOFT_DELETE_CASCADE,
+            undelete=undelete,
+        )
+
+        self._result_cache = None
 
         return response
+
+    def bulk_delete(self, user=None, with_history: bool = True) -> tuple:
+        """
+        Soft delete en lote: un UPDATE por modelo afectado (incluida la cascada de
+        `SOFT_DELETE_CASCADE`) y un `bulk_create` de historial por modelo. No envía las
+        señales `pre_softdelete`/`post_softdelete` ni `pre_save`/`post_save`.
+        @param user: Usuario del historial y `updated_by` (por defecto el del request)
+        @param with_history: False para no escribir registros históricos
+        @return: (total, {modelo: cantidad}) igual que `delete()`
+        """
+        assert self.query.can_filter(), 'Cannot use \'limit\' or \'offset\' with bulk_delete.'
+
+        objs = [_obj for _obj in self if not getattr(_obj, FIELD_NAME)]
+
+        return self._bulk_soft_delete(objs, undelete=False, user=user, with_history=with_history)
+
+    bulk_delete.alters_data = True
+
+    def bulk_undelete(self, user=None, with_history: bool = True) -> tuple:
+        """
+        Contraparte de `bulk_delete()`: restaura las filas eliminadas del queryset y lo que
+        se eliminó en cascada con ellas. No envía `post_undelete` ni `pre_save`/`post_save`.
+        """
+        assert self.query.can_filter(), 'Cannot use \'limit\' or \'offset\' with bulk_undelete.'
+
+        objs = [_obj for _obj in self if getattr(_obj, FIELD_NAME)]
+
+        return self._bulk_soft_delete(objs, undelete=True, user=user, with_history=with_history)
+
+    bulk_undelete.alters_data = True
@@ -1,11 +1,19 @@
-from django.core.exceptions import ValidationError
 from django.db import router, transaction
 from ordered_model.models import OrderedModelQuerySet
 
 from ...utils.drf.validation_errors import ListValidationError
-
-
-class BaseModelWithoutSafeDeleteQuerySet(OrderedModelQuerySet):
+from ..validation import full_clean_batch
+from .formats import FormatQuerySetMixin
+from .transition import TransitionQuerySetMixin
+from .vector import VectorQuerySetMixin
+
+
+class BaseModelWithoutSafeDeleteQuerySet(
+    TransitionQuerySetMixin,
+    VectorQuerySetMixin,
+    FormatQuerySetMixin,
+    OrderedModelQuerySet,
+):
     def active(self):
         """ Return only active records"""
         return self.filter(is_active=True)
@@ -14,14 +22,7 @@ class BaseModelWithoutSafeDeleteQuerySet(OrderedModelQuerySet):
         full_clean = kwargs.pop('full_clean', True)
 
         if full_clean:
-            errors = []
-
-            for _obj in objs:
-                try:
-                    _obj.full_clean()
-                    errors.append(ValidationError({}))
-                except ValidationError as e:
-                    errors.append(e)
+            errors = full_clean_batch(objs)
 
             if any([len(_error.message_dict) > 0 for _error in errors]):
                 raise ListValidationError(errors)
@@ -39,14 +40,7 @@ class BaseModelWithoutSafeDeleteQuerySet(OrderedModelQuerySet):
         full_clean = kwargs.pop('full_clean', True)
 
         if full_clean:
-            errors = []
-
-            for _obj in objs:
-                try:
-                    _obj.full_clean()
-                    errors.append(ValidationError({}))
-                except ValidationError as e:
-                    errors.append(e)
+            errors = full_clean_batch(objs)
 
             if any([len(_error.message_dict) > 0 for _error in errors]):
                 raise ListValidationError(errors)
@@ -0,0 +1,33 @@
+from ...utils.formats import format_currency_batch, format_decimal_batch
+
+
+class FormatQuerySetMixin:
+    """
+    Versión por columna de `get_<campo>_format_decimal/currency()`: una sola consulta
+    (`values_list`) y un formateador compartido para todas las filas.
+    """
+
+    def format_decimal(self, field: str, locale: str = None, empty: str = '', **kwargs) -> list:
+        """
+        @param locale: por defecto, `__FORMAT_LOCALE__` del modelo
+        @return: lista de strings en el orden del queryset
+        """
+        return format_decimal_batch(
+            self.values_list(field, flat=True),
+            locale=locale or getattr(self.model, '__FORMAT_LOCALE__', 'es_CL'),
+            empty=empty,
+            **kwargs,
+        )
+
+    def format_currency(self, field: str, currency='CLP', locale: str = None, empty: str = '', **kwargs) -> list:
+        """
+        @param locale: por defecto, `__FORMAT_LOCALE__` del modelo
+        @return: lista de strings en el orden del queryset
+        """
+        return format_currency_batch(
+            self.values_list(field, flat=True),
+            currency=currency,
+            locale=locale or getattr(self.model, '__FORMAT_LOCALE__', 'es_CL'),
+            empty=empty,
+            **kwargs,
+        )
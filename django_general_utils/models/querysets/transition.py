@@ -0,0 +1,154 @@
+from django.core.exceptions import ValidationError
+from django.db import connections, router, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from ..constraints.check_flow_status import CheckFlowStatusConstraint
+from ..simple_history import bulk_history_create, get_request_user
+
+
+class TransitionQuerySetMixin:
+    def get_flow_constraint(self, field: str = 'status') -> CheckFlowStatusConstraint:
+        for _constraint in self.model._meta.constraints:
+            if isinstance(_constraint, CheckFlowStatusConstraint) and _constraint.field == field:
+                return _constraint
+
+        raise ValueError(f'{self.model.__name__} no tiene un CheckFlowStatusConstraint para el campo "{field}".')
+
+    def get_transition_offending(self, to, field: str = 'status') -> dict:
+        """
+        Valida en una consulta agrupada por estado que todos los registros puedan pasar a `to`.
+        `skip_validate` se evalúa en lote solo sobre los registros de los estados no permitidos.
+        @return: {estado actual: [pks]} de los registros que no pueden pasar a `to`
+        """
+        constraint = self.get_flow_constraint(field)
+
+        if not constraint.validate_on_update:
+            return {}
+
+        states = (
+            self.exclude(**{field: to})
+            .order_by()
+            .values(field)
+            .annotate(total=Count('pk'))
+        )
+        # Igual que `validate`: sin valor previo no se valida el flujo
+        denied = [
+            _row[field]
+            for _row in states
+            if _row[field] is not None and not constraint.is_allowed(_row[field], to)
+        ]
+
+        if not denied:
+            return {}
+
+        offending = {}
+        queryset = self.filter(**{f'{field}__in': denied}).order_by('pk')
+
+        if constraint.skip_validate is None:
+            for _pk, _state in queryset.values_list('pk', field):
+                offending.setdefault(_state, []).append(_pk)
+
+            return offending
+
+        for _obj in queryset:
+            _state = getattr(_obj, field)
+
+            if not constraint.skip_validate(_obj, _state, to):
+                offending.setdefault(_state, []).append(_obj.pk)
+
+        return offending
+
+    def transition(
+            self,
+            to,
+            field: str = 'status',
+            user=None,
+            with_history: bool = True,
+            raise_exception: bool = True,
+    ) -> tuple:
+        """
+        Cambia `field` a `to` en todos los registros del queryset con un único UPDATE, validando
+        el `flow` de su `CheckFlowStatusConstraint` por estado en vez de un `save()` por registro.
+        No envía señales `pre_save`/`post_save`.
+        @param user: Usuario del historial y `updated_by` (por defecto el del request)
+        @param with_history: False para no escribir registros históricos
+        @param raise_exception: False para actualizar solo los registros permitidos
+        @return: (actualizados, {estado actual: [pks]} no permitidos)
+        """
+        assert self.query.can_filter(), 'Cannot use \'limit\' or \'offset\' with transition.'
+
+        using = router.db_for_write(self.model)
+        user = user or get_request_user()
+
+        with transaction.atomic(using=using):
+            constraint = self.get_flow_constraint(field)
+            candidates = self.exclude(**{field: to}).order_by('pk')
+            features = connections[using].features
+
+            if features.has_select_for_update:
+                # Bloquea las filas: su estado no puede cambiar entre la validación y el UPDATE
+                candidates = candidates.select_for_update(of=('self',) if features.has_select_for_update_of else ())
+
+            pks = list(candidates.values_list('pk', flat=True))
+            offending = self.filter(pk__in=pks).get_transition_offending(to, field)
+
+            if offending and raise_exception:
+                message = (
+                    'No puedes avanzar este estado a "{current_value}" debido a que su valor actual '
+                    '"{last_value}" no lo permite ({count} registros).'
+                )
+
+                raise ValidationError({
+                    field: [
+                        ValidationError(
+                            message.format(current_value=to, last_value=_state, count=len(_pks)),
+                            code='invalid_transition',
+                            params={'last_value': _state, 'current_value': to, 'pks': _pks},
+                        )
+                        for _state, _pks in offending.items()
+                    ]
+                })
+
+            queryset = self.filter(pk__in=pks).exclude(**{field: to})
+
+            if offending:
+                queryset = queryset.exclude(pk__in=[_pk for _pks in offending.values() for _pk in _pks])
+
+            if constraint.validate_on_update and constraint.skip_validate is None:
+                # Sin skip_validate, los únicos estados permitidos son los de origen del flujo (o sin valor)
+                queryset = queryset.filter(
+                    Q(**{f'{field}__in': constraint.get_sources(to)}) | Q(**{f'{field}__isnull': True})
+                )
+
+            now = timezone.now()
+            values = {field: to}
+            field_names = {_field.name for _field in self.model._meta.concrete_fields}
+
+            if 'updated_at' in field_names:
+                values['updated_at'] = now
+
+            if user is not None and 'updated_by' in field_names:
+                values['updated_by'] = user
+
+            has_history = getattr(self.model._meta, 'simple_history_manager_attribute', None) is not None
+
+            if not (with_history and has_history):
+                count = queryset.order_by().update(**values)
+            else:
+                objs = list(queryset.order_by())
+                count = self.model._base_manager.using(using).filter(
+                    pk__in=[_obj.pk for _obj in objs]
+                ).update(**values)
+
+                for _obj in objs:
+                    for _name, _value in values.items():
+                        setattr(_obj, _name, _value)
+
+                bulk_history_create(self.model, objs, '~', user=user, history_date=now, using=using)
+
+        self._result_cache = None
+
+        return count, offending
+
+    transition.alters_data = True
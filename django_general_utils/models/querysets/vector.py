@@ -0,0 +1,189 @@
+from contextlib import contextmanager
+
+from django.db import connections, transaction
+from django.db.models import Q, Value
+from pgvector.django import CosineDistance, HammingDistance, JaccardDistance, L1Distance, L2Distance, MaxInnerProduct
+
+VECTOR_METRICS = {
+    'l2': L2Distance,
+    'cosine': CosineDistance,
+    'inner_product': MaxInnerProduct,
+    'l1': L1Distance,
+    'hamming': HammingDistance,
+    'jaccard': JaccardDistance,
+}
+
+
+class VectorQuerySetMixin:
+    """
+    Búsqueda por similitud sobre `VectorField` (pgvector) y parámetros de Postgres por consulta.
+    """
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._db_config = dict(getattr(self, '_db_config', {}))
+
+        return clone
+
+    def get_db_config(self) -> dict:
+        return dict(getattr(self, '_db_config', {}))
+
+    def set_config(self, config: dict):
+        """
+        Parámetros de Postgres (p. ej. `{'hnsw.ef_search': 100}`) que se aplican con
+        `set_config(..., true)` en un savepoint que se revierte después de evaluar el queryset
+        (iterarlo, `iterator()`, `count()`, `exists()` o `aggregate()`), así que no afectan a otras
+        consultas de la conexión ni de una transacción externa. Con `select_for_update()` el savepoint
+        no se revierte (perdería los locks) y los parámetros duran hasta el fin de la transacción.
+        En otros motores se ignoran.
+        """
+        clone = self._chain()
+        clone._db_config.update(config)
+
+        return clone
+
+    @contextmanager
+    def _applied_db_config(self):
+        config = getattr(self, '_db_config', None)
+        connection = connections[self.db]
+
+        if not config or connection.vendor != 'postgresql':
+            yield
+
+            return None
+
+        with transaction.atomic(using=self.db):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT ' + ', '.join(['set_config(%s, %s, true)'] * len(config)),
+                    [_value for _name, _setting in config.items() for _value in (_name, str(_setting))]
+                )
+
+            yield
+
+            # Revertir el savepoint (o la transacción) descarta los parámetros; las filas ya se leyeron
+            if not self.query.select_for_update:
+                transaction.set_rollback(True, using=self.db)
+
+        return None
+
+    def _fetch_all(self):
+        if self._result_cache is not None:
+            return super()._fetch_all()
+
+        with self._applied_db_config():
+            super()._fetch_all()
+
+        return None
+
+    def iterator(self, chunk_size=None):
+        with self._applied_db_config():
+            yield from super().iterator(chunk_size=chunk_size)
+
+        return None
+
+    def count(self):
+        if self._result_cache is not None:
+            return super().count()
+
+        with self._applied_db_config():
+            return super().count()
+
+    def exists(self):
+        if self._result_cache is not None:
+            return super().exists()
+
+        with self._applied_db_config():
+            return super().exists()
+
+    def aggregate(self, *args, **kwargs):
+        with self._applied_db_config():
+            return super().aggregate(*args, **kwargs)
+
+    def get_vector_value(self, field: str, vector):
+        """
+        `vector` en el formato de la columna de `field` (p. ej. cuantizado a bits si es `storage='bit'`).
+        """
+        model_field = self.model._meta.get_field(field)
+
+        if hasattr(vector, 'resolve_expression') or getattr(model_field, 'storage', 'vector') == 'vector':
+            return vector
+
+        return Value(model_field.get_prep_value(vector))
+
+    def nearest(
+            self,
+            field: str,
+            vector,
+            k: int = 10,
+            metric: str = 'cosine',
+            filters=None,
+            ef_search: int = None,
+            probes: int = None,
+            iterative_scan: str = None,
+            alias: str = 'distance',
+            rescore_field: str = None,
+            rescore_candidates: int = None,
+            candidate_metric: str = None,
+    ):
+        """
+        Los `k` registros más cercanos a `vector`, anotados con `alias` y ordenados por
+        `ORDER BY <campo> <op> <vector> LIMIT k`, la forma que usan los índices HNSW/IVFFlat
+        (el operador de `metric` debe coincidir con el opclass del índice, ver `CreateVectorIndex`).
+
+        Los filtros (incluido `deleted IS NULL` del manager) se aplican después del escaneo del
+        índice, así que pueden dejar menos de `k` resultados: con pgvector >= 0.8,
+        `iterative_scan='strict_order' | 'relaxed_order'` sigue escaneando hasta completar `k`.
+
+        Con `rescore_field`, `field` es la columna cuantizada (`storage='bit'` o `'halfvec'`): su índice
+        entrega `rescore_candidates` candidatos (por defecto `4 * k`) y el orden final se calcula con la
+        distancia exacta sobre `rescore_field`, la columna de precisión completa.
+        @param metric: 'cosine' | 'l2' | 'inner_product' | 'l1' | 'hamming' | 'jaccard'
+        @param filters: Q o dict de filtros adicionales
+        @param ef_search: `hnsw.ef_search` para esta consulta
+        @param probes: `ivfflat.probes` para esta consulta
+        @param candidate_metric: métrica del escaneo de candidatos (por defecto 'hamming' en columnas
+        `bit` y `metric` en el resto)
+        """
+        assert metric in VECTOR_METRICS, f'metric must be one of {", ".join(VECTOR_METRICS)}'
+
+        queryset = self
+
+        if filters is not None:
+            queryset = queryset.filter(filters) if isinstance(filters, Q) else queryset.filter(**filters)
+
+        config = {}
+
+        if ef_search is not None:
+            config['hnsw.ef_search'] = ef_search
+
+        if probes is not None:
+            config['ivfflat.probes'] = probes
+
+        if iterative_scan is not None:
+            config['hnsw.iterative_scan'] = iterative_scan
+
+            # IVFFlat solo soporta relaxed_order
+            if iterative_scan != 'strict_order':
+                config['ivfflat.iterative_scan'] = iterative_scan
+
+        queryset = queryset.set_config(config)
+
+        if rescore_field is None:
+            return queryset.annotate(**{
+                alias: VECTOR_METRICS[metric](field, self.get_vector_value(field, vector))
+            }).order_by(alias)[:k]
+
+        if candidate_metric is None:
+            is_bit = getattr(self.model._meta.get_field(field), 'storage', 'vector') == 'bit'
+            candidate_metric = 'hamming' if is_bit else metric
+
+        assert candidate_metric in VECTOR_METRICS, f'candidate_metric must be one of {", ".join(VECTOR_METRICS)}'
+
+        candidates = queryset.annotate(
+            _candidate_distance=VECTOR_METRICS[candidate_metric](field, self.get_vector_value(field, vector))
+        ).order_by('_candidate_distance').values('pk')[:rescore_candidates or 4 * k]
+
+        return queryset.filter(pk__in=candidates).annotate(**{
+            alias: VECTOR_METRICS[metric](rescore_field, self.get_vector_value(rescore_field, vector))
+        }).order_by(alias)[:k]
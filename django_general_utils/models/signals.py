@@ -1,51 +1,103 @@
-from django.db import models
-from django.db.models.signals import m2m_changed
-from django.utils.translation import gettext_lazy as _
-
-
-def register_model_signals(app_name: str):
-    from django.apps import apps
-    from .base_without_safe_delete import BaseWithoutSafeDeleteModel
-    from .base import BaseModel
-
-    app_config = apps.get_app_config(app_name)
-
-    for _model in app_config.get_models():
-        if issubclass(_model, (BaseModel, BaseWithoutSafeDeleteModel)):
-            for _signal in _model._signals:
-                _signal.set_model(_model)
-                _signal.register()
-        else:
-            assert issubclass(_model, models.Model), _('Model "%s" is not a subclass of BaseModel or BaseWithoutSafeDeleteModel') % _model.__name__
-
-    return None
-
-
-class SignalRegister:
-    callback = None
-    signal = None
-    model = None
-
-    def __init__(self, callback, signal, through_field=None, **kwargs):
-        self.callback = callback
-        self.signal = signal
-        self.through_field = through_field
-        self.kwargs = kwargs
-
-        if signal is m2m_changed:
-            assert through_field is not None, _('through_field is required for m2m_changed signal')
-
-    def set_model(self, model):
-        if self.signal is m2m_changed:
-            assert hasattr(model, self.through_field), _('Model "%s" does not have the field "%s"') % (model.__name__, self.through_field)
-
-            self.model = getattr(model, self.through_field).through
-
-            return
-
-        self.model = model
-
-    def register(self):
-        assert self.model is not None, _('Model is not set')
-
-        self.signal.connect(self.callback, sender=self.model, **self.kwargs)
+import asyncio
+from functools import partial
+
+from django.db import models, router, transaction
+from django.db.models.signals import m2m_changed
+from django.utils.translation import gettext_lazy as _
+
+from ..utils.executors import get_executor
+
+RUN_IN_CHOICES = ('thread', 'async')
+
+
+def register_model_signals(app_name: str):
+    from django.apps import apps
+    from .base_without_safe_delete import BaseWithoutSafeDeleteModel
+    from .base import BaseModel
+
+    app_config = apps.get_app_config(app_name)
+
+    for _model in app_config.get_models():
+        if issubclass(_model, (BaseModel, BaseWithoutSafeDeleteModel)):
+            for _signal in _model._signals:
+                _signal.set_model(_model)
+                _signal.register()
+        else:
+            assert issubclass(_model, models.Model), _('Model "%s" is not a subclass of BaseModel or BaseWithoutSafeDeleteModel') % _model.__name__
+
+    return None
+
+
+class SignalRegister:
+    """
+    Conecta `callback` a `signal` para el modelo que lo declara en `Meta.signals`.
+
+    Con `run_in='thread'|'async'` el callback no corre en el hilo del request: se
+    encola tras el commit de la transacción (`transaction.on_commit`) en el executor
+    compartido de `utils.executors` (o en `executor`, si se pasa uno). Los callbacks
+    `async def` sin `run_in` usan `run_in='async'`.
+    """
+    callback = None
+    signal = None
+    model = None
+
+    def __init__(self, callback, signal, through_field=None, run_in=None, executor=None, **kwargs):
+        self.callback = callback
+        self.signal = signal
+        self.through_field = through_field
+        self.kwargs = kwargs
+        self.executor = executor
+        self._receiver = None
+
+        if run_in is None and asyncio.iscoroutinefunction(callback):
+            run_in = 'async'
+
+        self.run_in = run_in
+
+        if signal is m2m_changed:
+            assert through_field is not None, _('through_field is required for m2m_changed signal')
+
+        if run_in is not None:
+            assert run_in in RUN_IN_CHOICES, _('run_in must be one of: %s') % ', '.join(RUN_IN_CHOICES)
+
+    def set_model(self, model):
+        if self.signal is m2m_changed:
+            assert hasattr(model, self.through_field), _('Model "%s" does not have the field "%s"') % (model.__name__, self.through_field)
+
+            self.model = getattr(model, self.through_field).through
+
+            return
+
+        self.model = model
+
+    def get_executor(self):
+        if self.executor is not None:
+            return self.executor
+
+        return get_executor(self.run_in)
+
+    def register(self):
+        assert self.model is not None, _('Model is not set')
+
+        self._receiver = self.callback if self.run_in is None else self._defer
+
+        self.signal.connect(self._receiver, sender=self.model, **self.kwargs)
+
+    def unregister(self):
+        if self._receiver is None:
+            return None
+
+        self.signal.disconnect(self._receiver, sender=self.model, dispatch_uid=self.kwargs.get('dispatch_uid'))
+        self._receiver = None
+
+        return None
+
+    def _defer(self, sender, **kwargs):
+        using = kwargs.get('using') or router.db_for_write(sender)
+
+        transaction.on_commit(
+            partial(self.get_executor().submit, self.callback, sender=sender, **kwargs),
+            using=using,
+        )
+
+        return None
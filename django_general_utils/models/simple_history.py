@@ -1,13 +1,418 @@
+import datetime
+from functools import partial
+
+from django.conf import settings
 from django.contrib import admin
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import ManyToManyField, DateTimeField, CharField
+from django.db import connections, router, transaction
+from django.db.models import (
+    Case,
+    CharField,
+    DateTimeField,
+    Exists,
+    F,
+    ManyToManyField,
+    Max,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Lag, Lead
+from django.db.models.signals import pre_save
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
+from simple_history import manager, models, utils
+
+from .operations.partition_history import (
+    add_months,
+    create_month_partitions,
+    drop_partition,
+    get_partitions,
+    is_partitioned,
+)
+
+
+def get_request_user():
+    """
+    Usuario autenticado del request registrado por `HistoryRequestMiddleware`, o None.
+    """
+    user = getattr(getattr(models.HistoricalRecords.context, 'request', None), 'user', None)
+
+    if user is None or not user.is_authenticated:
+        return None
+
+    return user
+
+
+def bulk_history_create(
+        model,
+        objs,
+        history_type: str = '~',
+        user=None,
+        batch_size: int = None,
+        change_reason: str = None,
+        history_date=None,
+        using: str = None,
+) -> list:
+    """
+    Crea los registros históricos de `objs` con un único `bulk_create` sobre el modelo histórico, en
+    la base `using`. Las filas se arman como en `HistoryManager.bulk_history_create` de simple_history
+    (`_history_user`, `_history_date` y motivo de cambio de cada instancia), pero ese método siempre
+    inserta en la base que indique el router. El usuario por defecto es `user` o el del request actual.
+    @param model: Modelo con historial (p. ej. `BaseModel`)
+    @param objs: Instancias ya persistidas; falla si alguna no tiene pk
+    @param history_type: '+' creado, '~' modificado
+    @param using: Base de datos (por defecto, la del router para el modelo histórico)
+    @return: Registros históricos creados ([] si el modelo no tiene historial)
+    """
+    assert history_type in ('+', '~'), _('history_type must be "+" or "~"')
+
+    manager_name = getattr(model._meta, 'simple_history_manager_attribute', None)
+
+    if manager_name is None or not getattr(settings, 'SIMPLE_HISTORY_ENABLED', True):
+        return []
+
+    objs = list(objs)
+
+    if any(_obj.pk is None for _obj in objs):
+        raise ValueError(f'Todas las instancias de {model.__name__} deben tener pk para crear su historial.')
+
+    history_model = utils.get_history_manager_for_model(model).model
+    user = user or get_request_user()
+    history_date = history_date or timezone.now()
+    rows = []
+
+    for _obj in objs:
+        row = history_model(
+            history_date=getattr(_obj, '_history_date', None) or history_date,
+            history_user=getattr(_obj, '_history_user', None) or user,
+            history_change_reason=utils.get_change_reason_from_object(_obj) or change_reason or '',
+            history_type=history_type,
+            **{_field.attname: getattr(_obj, _field.attname) for _field in history_model.tracked_fields},
+        )
+
+        if hasattr(history_model, 'history_relation'):
+            row.history_relation_id = _obj.pk
+
+        rows.append(row)
+
+    using = using or router.db_for_write(history_model)
+
+    return history_model._default_manager.using(using).bulk_create(rows, batch_size=batch_size)
+
+def prune_history(
+        model,
+        cutoff: datetime.datetime = None,
+        mode: str = None,
+        batch_size: int = 5000,
+        max_batches: int = None,
+        months_ahead: int = 3,
+        dry_run: bool = False,
+        using: str = None,
+) -> dict:
+    """
+    Aplica la retención del historial de `model` (`_history_retention`, `_history_retention_mode`).
+    En tablas particionadas (ver `operations.PartitionHistoryTable`) crea las particiones
+    futuras y, en modo 'drop', elimina las particiones completas anteriores a `cutoff`. El resto
+    se borra en lotes de `batch_size` (cada lote en su propia transacción).
+    @param cutoff: Fecha límite (por defecto `now() - model._history_retention`)
+    @param mode: 'drop' borra todo lo anterior a `cutoff`; 'compact' conserva el último registro
+        de cada objeto anterior a `cutoff` (el estado a esa fecha)
+    @param max_batches: Máximo de lotes (particiones o DELETE) por corrida
+    @return: {'created': [...], 'dropped': [...], 'deleted': int}
+    """
+    result = {'created': [], 'dropped': [], 'deleted': 0}
+    manager_name = getattr(model._meta, 'simple_history_manager_attribute', None)
+
+    if manager_name is None:
+        return result
+
+    if cutoff is None:
+        retention = getattr(model, '_history_retention', None)
+
+        if retention is None:
+            return result
+
+        cutoff = timezone.now() - retention
+
+    mode = mode or getattr(model, '_history_retention_mode', 'drop')
+
+    assert mode in ('drop', 'compact'), _('mode must be "drop" or "compact"')
+
+    history_model = getattr(model, manager_name).model
+    using = using or router.db_for_write(history_model)
+    connection = connections[using]
+    table = history_model._meta.db_table
+    batches = 0
+
+    if is_partitioned(connection, table):
+        if not dry_run:
+            today = datetime.date.today()
+            result['created'] = create_month_partitions(
+                connection,
+                table,
+                today,
+                add_months(today, months_ahead),
+                history_model._meta.get_field('history_date').column
+            )
+
+        for _month, _name in sorted(get_partitions(connection, table).items()):
+            upper = datetime.datetime.combine(add_months(_month, 1), datetime.time.min, tzinfo=datetime.timezone.utc)
+
+            if mode != 'drop' or upper > cutoff or (max_batches is not None and batches >= max_batches):
+                break
+
+            if not dry_run:
+                drop_partition(connection, table, _name)
+
+            result['dropped'].append(_name)
+            batches += 1
+
+    pk_attr = history_model._meta.get_field(model._meta.pk.name).attname
+    history = history_model._default_manager.using(using)
+    queryset = history.filter(history_date__lt=cutoff)
+
+    if mode == 'compact':
+        queryset = queryset.filter(Exists(history.filter(
+            history_date__lt=cutoff,
+            history_date__gt=OuterRef('history_date'),
+            **{pk_attr: OuterRef(pk_attr)}
+        )))
+
+    if dry_run:
+        result['deleted'] = queryset.count()
+
+        return result
+
+    while max_batches is None or batches < max_batches:
+        history_ids = list(queryset.values_list('history_id', flat=True)[:batch_size])
+
+        if not history_ids:
+            break
+
+        # `history_date__lt` permite que Postgres descarte particiones
+        with transaction.atomic(using=using):
+            history.filter(history_date__lt=cutoff, history_id__in=history_ids).delete()
+
+        result['deleted'] += len(history_ids)
+        batches += 1
+
+    return result
+
+
+def has_updated_by(instance) -> bool:
+    return any(_field.name == 'updated_by' for _field in instance._meta.concrete_fields)
+
+
+def queue_updated_by(instance, user, using=None) -> None:
+    """
+    Encola `updated_by = user` para `instance` y lo aplica al commit con un único
+    UPDATE por (modelo, usuario) por transacción. Fuera de una transacción se aplica
+    de inmediato.
+    """
+    using = using or instance._state.db or 'default'
+    connection = transaction.get_connection(using)
+
+    if not connection.in_atomic_block:
+        instance._meta.concrete_model._base_manager.using(using).filter(pk=instance.pk).update(updated_by=user)
+
+        return None
+
+    pending, flush = getattr(connection, '_pending_updated_by', (None, None))
+
+    # Si la transacción anterior hizo rollback, su on_commit se descartó junto con lo pendiente
+    if pending is None or not any(_callback[1] is flush for _callback in connection.run_on_commit):
+        pending = {}
+        flush = partial(flush_updated_by, pending, using)
+        connection._pending_updated_by = (pending, flush)
+        transaction.on_commit(flush, using=using)
+
+    pending.setdefault((instance._meta.concrete_model, user.pk), set()).add(instance.pk)
+
+    return None
+
+
+def flush_updated_by(pending: dict, using='default') -> None:
+    for (_model, _user_pk), _pks in pending.items():
+        _model._base_manager.using(using).filter(pk__in=_pks).update(updated_by=_user_pk)
+
+    pending.clear()
+
+    return None
+
+
+# Prefijos de las anotaciones de `HistoricalQuerySet.with_neighbors()` / `with_excluded_fields()`
+PREV_VALUE_PREFIX = '_prev_value_'
+# Ventana que marca las filas del queryset original dentro del historial completo de sus objetos
+NEIGHBOR_SELECTED_ALIAS = '_neighbor_selected'
+EXCLUDED_VALUE_PREFIX = '_excluded_value_'
+
+
+def get_diff_fields(history_model, fields: list = None) -> list:
+    """
+    Campos comparables en un diff (los mismos que `diff_against()`: trackeados y editables).
+    """
+    return [
+        _field
+        for _field in history_model.tracked_fields
+        if _field.editable and (fields is None or _field.name in fields)
+    ]
+
+
+class HistoricalQuerySet(manager.HistoricalQuerySet):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._neighbor_fields = None
+        self._neighbor_source = None
+
+    def _clone(self):
+        c = super()._clone()
+        c._neighbor_fields = self._neighbor_fields
+        c._neighbor_source = self._neighbor_source
+
+        return c
+
+    def _get_neighbor_window(self, expression) -> Window:
+        return Window(
+            expression,
+            partition_by=[F(self._pk_attr)],
+            order_by=[F('history_date').asc(), F('history_id').asc()],
+        )
+
+    def with_neighbors(self, fields: list = None):
+        """
+        Anota en una sola consulta `prev_history_id`/`next_history_id` (LAG/LEAD por objeto,
+        ordenado por `history_date`) y el valor anterior de cada campo, para que
+        `prev_record`, `next_record` y `diff_prev()` no consulten por registro.
+        Las ventanas se calculan sobre todo el historial de los objetos del queryset y luego se
+        seleccionan sus filas, así que los filtros (antes o después de esta llamada) no recortan
+        los vecinos.
+        @param fields: Campos a comparar (por defecto todos los de `diff_against()`)
+        """
+        source = self._neighbor_source if self._neighbor_source is not None else self
+        diff_fields = get_diff_fields(self.model, fields)
+        annotations = {
+            'prev_history_id': self._get_neighbor_window(Lag('history_id')),
+            'next_history_id': self._get_neighbor_window(Lead('history_id')),
+        }
+
+        for _field in diff_fields:
+            annotations[f'{PREV_VALUE_PREFIX}{_field.attname}'] = self._get_neighbor_window(Lag(_field.attname))
+
+        queryset = self.__class__(model=self.model, using=self._db)
+        queryset.query.order_by = self.query.order_by
+        queryset.query.default_ordering = self.query.default_ordering
+        queryset.query.select_related = self.query.select_related
+        queryset = queryset.filter(
+            **{f'{self._pk_attr}__in': source.values(self._pk_attr)}
+        ).annotate(**annotations).alias(
+            # Filtrar por una ventana se aplica sobre su resultado (QUALIFY): no recorta LAG/LEAD
+            **{NEIGHBOR_SELECTED_ALIAS: Window(
+                Max(Case(When(history_id__in=source.values('history_id'), then=Value(1)), default=Value(0))),
+                partition_by=[F('history_id')],
+            )}
+        ).filter(**{NEIGHBOR_SELECTED_ALIAS: 1})
+        queryset._neighbor_fields = [_field.name for _field in diff_fields]
+        queryset._neighbor_source = source
+
+        return queryset
 
-from simple_history import models, utils
+    def _references_neighbors(self, args, kwargs) -> bool:
+        names = list(kwargs)
+
+        for _q in args:
+            if isinstance(_q, Q):
+                names += [_child[0] for _child in _q.flatten() if isinstance(_child, tuple)]
+
+        return any(
+            _name.split(LOOKUP_SEP)[0] in ('prev_history_id', 'next_history_id')
+            or _name.startswith(PREV_VALUE_PREFIX)
+            for _name in names
+        )
+
+    def _filter_or_exclude(self, negate, args, kwargs):
+        if self._neighbor_source is None or self._references_neighbors(args, kwargs):
+            return super()._filter_or_exclude(negate, args, kwargs)
+
+        # Filtros sobre el historial: cambian las filas seleccionadas, no las ventanas
+        source = self._neighbor_source._filter_or_exclude(negate, args, kwargs)
+        rebuilt = source.with_neighbors(self._neighbor_fields)
+        clone = self._chain()
+        clone.query.where.children[:2] = rebuilt.query.where.children[:2]
+        clone.query.annotations[NEIGHBOR_SELECTED_ALIAS] = rebuilt.query.annotations[NEIGHBOR_SELECTED_ALIAS]
+        clone._neighbor_source = source
+
+        return clone
+
+    def with_excluded_fields(self):
+        """
+        Anota los campos excluidos del historial (`excluded_fields`) con su valor actual, para
+        que `instance` no haga un `.get()` por registro.
+        """
+        model = self.model.instance_type
+        annotations = {}
+
+        for _name in self.model._history_excluded_fields:
+            field = model._meta.get_field(_name)
+
+            if isinstance(field, ManyToManyField):
+                continue
+
+            annotations[f'{EXCLUDED_VALUE_PREFIX}{field.attname}'] = Subquery(
+                model._base_manager.filter(pk=OuterRef(self._pk_attr)).values(field.attname)[:1]
+            )
+
+        return self.annotate(**annotations)
+
+    def diffs(self) -> list:
+        """
+        `ModelDelta` de cada registro respecto al anterior del mismo objeto, calculados con
+        una sola consulta. Se omiten los registros sin anterior.
+        """
+        queryset = self if self._neighbor_fields is not None else self.with_neighbors()
+
+        return [
+            _delta
+            for _delta in (_record.diff_prev() for _record in queryset)
+            if _delta is not None
+        ]
+
+    def _fetch_all(self):
+        linked = self._result_cache is not None
+
+        super()._fetch_all()
+
+        if linked or self._neighbor_fields is None or self._as_instances:
+            return None
+
+        records = {
+            _record.history_id: _record
+            for _record in self._result_cache
+            if isinstance(_record, self.model)
+        }
+
+        # Vecinos que vienen en el mismo resultado: prev_record/next_record sin consultas
+        for _record in records.values():
+            if _record.prev_history_id in records:
+                _record._prev_record = records[_record.prev_history_id]
+
+            if _record.next_history_id in records:
+                _record._next_record = records[_record.next_history_id]
+
+        return None
 
 
 class HistoricalRecords(models.HistoricalRecords):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('historical_queryset', HistoricalQuerySet)
+
+        super().__init__(*args, **kwargs)
+
     def fields_included(self, model):
         """
         Retorna una lista de campos para incluir en el registro histórico. Por defecto,
@@ -28,8 +433,20 @@ class HistoricalRecords(models.HistoricalRecords):
 
         return fields
 
-    def get_history_user(self, instance):
-        """Get the modifying user from instance or middleware."""
+    def finalize(self, sender, **kwargs):
+        super().finalize(sender, **kwargs)
+
+        if self.cls is not sender and not (self.inherit and issubclass(sender, self.cls)):
+            return None
+
+        pre_save.connect(self.pre_save, sender=sender, weak=False)
+
+        return None
+
+    def _resolve_history_user(self, instance):
+        """
+        Usuario del request actual (middleware de simple_history), sin efectos secundarios.
+        """
         request = None
 
         try:
@@ -38,13 +455,40 @@ class HistoricalRecords(models.HistoricalRecords):
         except AttributeError:
             pass
 
-        user = self.get_user(instance=instance, request=request)
+        return self.get_user(instance=instance, request=request)
 
-        if user is not None:
-            instance._history_user = user
-            instance.__class__.objects.filter(id=instance.id).update(
-                updated_by=user
-            )
+    def pre_save(self, instance, raw=False, using=None, update_fields=None, **kwargs):
+        """
+        Asigna `updated_by` antes de escribir, para que viaje en el mismo INSERT/UPDATE.
+        """
+        if raw or not has_updated_by(instance):
+            return None
+
+        user = self._resolve_history_user(instance)
+
+        if user is None:
+            return None
+
+        instance.updated_by = user
+
+        # Con update_fields sin `updated_by` el valor no se persiste: se corrige al commit
+        if update_fields is not None and 'updated_by' not in update_fields:
+            queue_updated_by(instance, user, using=using)
+
+        return None
+
+    def get_history_user(self, instance):
+        """Get the modifying user from instance or middleware."""
+        user = self._resolve_history_user(instance)
+
+        if user is None:
+            return None
+
+        # Solo si pre_save no alcanzó a asignarlo (p. ej. registros históricos manuales)
+        if has_updated_by(instance) and instance.updated_by_id != user.pk and instance.pk is not None:
+            queue_updated_by(instance, user)
+
+        instance._history_user = user
 
         return user
 
@@ -72,6 +516,18 @@ class HistoricalRecords(models.HistoricalRecords):
                     for field in self._history_excluded_fields
                     if not isinstance(model._meta.get_field(field), ManyToManyField)
                 ]
+                annotated = {
+                    _attname: getattr(self, f'{EXCLUDED_VALUE_PREFIX}{_attname}')
+                    for _attname in excluded_attnames
+                    if hasattr(self, f'{EXCLUDED_VALUE_PREFIX}{_attname}')
+                }
+
+                # Anotados por `with_excluded_fields()`
+                if len(annotated) == len(excluded_attnames):
+                    attrs.update(annotated)
+                    excluded_attnames = []
+
+            if self._history_excluded_fields and excluded_attnames:
                 try:
                     values = (
                         model.objects.filter(pk=getattr(self, model._meta.pk.attname))
@@ -92,7 +548,17 @@ class HistoricalRecords(models.HistoricalRecords):
             """
             Get the next history record for the instance. `None` if last.
             """
+            if hasattr(self, '_next_record'):
+                return self._next_record
+
+            if hasattr(self, 'next_history_id') and self.next_history_id is None:
+                return None
+
             history = utils.get_history_manager_from_history(self)
+
+            if hasattr(self, 'next_history_id'):
+                return history.filter(history_id=self.next_history_id).first()
+
             return (
                 history.filter(history_date__gt=self.history_date)
                 .order_by("history_date")
@@ -103,13 +569,61 @@ class HistoricalRecords(models.HistoricalRecords):
             """
             Get the previous history record for the instance. `None` if first.
             """
+            if hasattr(self, '_prev_record'):
+                return self._prev_record
+
+            if hasattr(self, 'prev_history_id') and self.prev_history_id is None:
+                return None
+
             history = utils.get_history_manager_from_history(self)
+
+            if hasattr(self, 'prev_history_id'):
+                return history.filter(history_id=self.prev_history_id).first()
+
             return (
                 history.filter(history_date__lt=self.history_date)
                 .order_by("history_date")
                 .last()
             )
 
+        def diff_prev(self, fields: list = None):
+            """
+            `ModelDelta` contra el registro anterior. `None` si es el primero. Con
+            `with_neighbors()` usa los valores anotados y no consulta la DB; `old_record`
+            es None si el anterior no venía en el mismo resultado.
+            """
+            if not hasattr(self, 'prev_history_id'):
+                prev_record = self.prev_record
+
+                if prev_record is None:
+                    return None
+
+                return self.diff_against(prev_record, included_fields=fields)
+
+            if self.prev_history_id is None:
+                return None
+
+            changes = []
+
+            for _field in get_diff_fields(type(self), fields):
+                if not hasattr(self, f'{PREV_VALUE_PREFIX}{_field.attname}'):
+                    continue
+
+                old = getattr(self, f'{PREV_VALUE_PREFIX}{_field.attname}')
+                new = getattr(self, _field.attname)
+
+                if old != new:
+                    changes.append(models.ModelChange(_field.name, old, new))
+
+            changes.sort(key=lambda change: change.field)
+
+            return models.ModelDelta(
+                changes,
+                [_change.field for _change in changes],
+                getattr(self, '_prev_record', None),
+                self,
+            )
+
         def get_default_history_user(instance):
             """
             Returns the user specified by `get_user` method for manually creating
@@ -132,6 +646,7 @@ class HistoricalRecords(models.HistoricalRecords):
             "instance_type": model,
             "next_record": property(get_next_record),
             "prev_record": property(get_prev_record),
+            "diff_prev": diff_prev,
             "revert_url": revert_url,
             "__str__": lambda self: "{} as of {}".format(
                 self.history_object, self.history_date
@@ -0,0 +1,209 @@
+from django.core.exceptions import NON_FIELD_ERRORS, FieldDoesNotExist, ValidationError
+from django.db import router
+
+from .constraints.base_constraint import get_constraint_referenced_fields
+
+
+def get_changed_fields(instance) -> set:
+    """
+    Nombres (no attnames) de los campos que `instance.tracker` marca como modificados.
+    """
+    attnames = {_field.attname: _field.name for _field in instance._meta.concrete_fields}
+
+    return {attnames.get(_field, _field) for _field in instance.tracker.changed()}
+
+
+def get_referenced_fields(constraint, model) -> set | None:
+    if hasattr(constraint, 'get_referenced_fields'):
+        referenced = constraint.get_referenced_fields(model)
+    else:
+        referenced = get_constraint_referenced_fields(constraint)
+
+    if referenced is None:
+        return None
+
+    # Normaliza attnames (`fk_id`) y `pk` al nombre del campo
+    names = set()
+
+    for _name in referenced:
+        if _name == 'pk':
+            names.add(model._meta.pk.name)
+
+            continue
+
+        try:
+            names.add(model._meta.get_field(_name).name)
+        except FieldDoesNotExist:
+            names.add(_name)
+
+    return names
+
+
+def validate_unique_changed(instance, changed: set, exclude: set) -> None:
+    unique_checks, date_checks = instance._get_unique_checks(exclude=exclude)
+
+    unique_checks = [
+        (_model_class, _check)
+        for _model_class, _check in unique_checks
+        if changed.intersection(_check)
+    ]
+    date_checks = [
+        (_model_class, _lookup_type, _field, _unique_for)
+        for _model_class, _lookup_type, _field, _unique_for in date_checks
+        if changed.intersection({_field, _unique_for})
+    ]
+
+    errors = instance._perform_unique_checks(unique_checks)
+
+    for _key, _value in instance._perform_date_checks(date_checks).items():
+        errors.setdefault(_key, []).extend(_value)
+
+    if errors:
+        raise ValidationError(errors)
+
+    return None
+
+
+def validate_constraints_changed(instance, changed: set | None, exclude: set, skip_bulk: bool = False) -> None:
+    """
+    Igual que `Model.validate_constraints`, pero omite las constraints cuyos campos
+    referenciados no cambiaron (`changed=None` = validar todas) y, con `skip_bulk`, las que
+    se validan por lote (`validate_bulk`, ver `full_clean_batch`).
+    """
+    using = router.db_for_write(instance.__class__, instance=instance)
+    errors = {}
+
+    for _model_class, _constraints in instance.get_constraints():
+        for _constraint in _constraints:
+            if skip_bulk and hasattr(_constraint, 'validate_bulk'):
+                continue
+
+            if changed is not None:
+                referenced = get_referenced_fields(_constraint, _model_class)
+
+                if referenced is not None and not referenced & changed:
+                    continue
+
+            try:
+                _constraint.validate(_model_class, instance, exclude=exclude, using=using)
+            except ValidationError as e:
+                fields = getattr(_constraint, 'fields', None) or []
+
+                if getattr(e, 'code', None) == 'unique' and len(fields) == 1:
+                    errors.setdefault(fields[0], []).append(e)
+                else:
+                    errors = e.update_error_dict(errors)
+
+    if errors:
+        raise ValidationError(errors)
+
+    return None
+
+
+def full_clean_changed(instance, exclude=None) -> None:
+    """
+    Variante incremental de `full_clean()` para actualizaciones: valida solo los
+    campos que cambiaron según `tracker.changed()`, los unique que los incluyen y
+    las constraints cuyos campos referenciados cambiaron. Al crear (o sin tracker)
+    hace el `full_clean()` completo.
+    """
+    if instance._state.adding or not hasattr(instance, 'tracker'):
+        return instance.full_clean(exclude=exclude)
+
+    changed = get_changed_fields(instance)
+    exclude = set(exclude or [])
+    unchanged = {_field.name for _field in instance._meta.concrete_fields if _field.name not in changed}
+    errors = {}
+
+    try:
+        instance.clean_fields(exclude=exclude | unchanged)
+    except ValidationError as e:
+        errors = e.update_error_dict(errors)
+
+    try:
+        instance.clean()
+    except ValidationError as e:
+        errors = e.update_error_dict(errors)
+
+    # Igual que full_clean(): unique y constraints solo para campos que pasaron la validación
+    exclude |= {_name for _name in errors if _name != NON_FIELD_ERRORS}
+
+    try:
+        validate_unique_changed(instance, changed, exclude)
+    except ValidationError as e:
+        errors = e.update_error_dict(errors)
+
+    try:
+        validate_constraints_changed(instance, changed, exclude)
+    except ValidationError as e:
+        errors = e.update_error_dict(errors)
+
+    if errors:
+        raise ValidationError(errors)
+
+    return None
+
+
+def full_clean_batch(objs: list, exclude=None) -> list:
+    """
+    `full_clean()` de un lote para `bulk_create`/`bulk_update`. Las constraints con
+    `validate_bulk(model, instances)` (p. ej. `CheckRowsModelConstraint`) se validan una vez
+    para todo el lote, considerando también las instancias pendientes entre sí.
+    @return: Un ValidationError por objeto (vacío si es válido), como espera `ListValidationError`
+    """
+    exclude = set(exclude or [])
+    errors = [{} for _obj in objs]
+    batch_fields = [
+        _field
+        for _field in (objs[0]._meta.concrete_fields if objs else [])
+        if hasattr(_field, 'validate_batch') and _field.name not in exclude
+    ]
+
+    # Campos que se validan por lote (`validate_batch`, p. ej. `JSONSchemaField`): fuera de `clean_fields()`
+    for _field in batch_fields:
+        for _index, _error in _field.validate_batch(objs).items():
+            errors[_index] = ValidationError({_field.name: _error}).update_error_dict(errors[_index])
+
+    field_exclude = exclude | {_field.name for _field in batch_fields}
+
+    for _obj, obj_errors in zip(objs, errors):
+        # Igual que full_clean(validate_constraints=False), sin los campos validados por lote
+        try:
+            _obj.clean_fields(exclude=field_exclude)
+        except ValidationError as e:
+            obj_errors = e.update_error_dict(obj_errors)
+
+        try:
+            _obj.clean()
+        except ValidationError as e:
+            obj_errors = e.update_error_dict(obj_errors)
+
+        try:
+            _obj.validate_unique(exclude=exclude | {_name for _name in obj_errors if _name != NON_FIELD_ERRORS})
+        except ValidationError as e:
+            obj_errors = e.update_error_dict(obj_errors)
+
+        try:
+            validate_constraints_changed(
+                _obj,
+                None,
+                exclude | {_name for _name in obj_errors if _name != NON_FIELD_ERRORS},
+                skip_bulk=True
+            )
+        except ValidationError as e:
+            obj_errors = e.update_error_dict(obj_errors)
+
+    if objs:
+        using = router.db_for_write(objs[0].__class__)
+
+        for _model_class, _constraints in objs[0].get_constraints():
+            for _constraint in _constraints:
+                if not hasattr(_constraint, 'validate_bulk'):
+                    continue
+
+                bulk_errors = _constraint.validate_bulk(_model_class, objs, exclude=exclude, using=using)
+
+                for _index, _error in bulk_errors.items():
+                    errors[_index] = _error.update_error_dict(errors[_index])
+
+    return [ValidationError(_errors) for _errors in errors]
@@ -0,0 +1,54 @@
+from contextlib import contextmanager
+
+from ..models.constraints.profiler import ConstraintProfiler
+
+
+class ConstraintAssertionsMixin:
+    """
+    Asserts para `TestCase` sobre el costo de las constraints validadas dentro de un bloque.
+
+        with self.assertConstraintQueries(1, 'order_max_rows'):
+            order.save()
+    """
+
+    @contextmanager
+    def assertConstraintQueries(self, num: int, name: str = None, model=None):
+        """
+        Falla si las constraints (o solo `name`) ejecutan una cantidad de consultas distinta de `num`.
+        """
+        with ConstraintProfiler() as profiler:
+            yield profiler
+
+        queries = profiler.total_queries if name is None else profiler.get(name, model=model).queries
+
+        self.assertEqual(
+            queries,
+            num,
+            f'{queries} consultas ejecutadas por constraints, se esperaban {num}:\n{profiler.report()}'
+        )
+
+        return None
+
+    @contextmanager
+    def assertConstraintValidated(self, name: str, model=None, calls: int = None):
+        """
+        Falla si la constraint `name` no se valida dentro del bloque (o no `calls` veces).
+        """
+        with ConstraintProfiler() as profiler:
+            yield profiler
+
+        total = profiler.get(name, model=model).calls
+
+        if calls is None:
+            self.assertGreater(total, 0, f'La constraint "{name}" no se validó')
+        else:
+            self.assertEqual(total, calls, f'La constraint "{name}" se validó {total} veces, se esperaban {calls}')
+
+        return None
+
+    @contextmanager
+    def assertConstraintNotValidated(self, name: str, model=None):
+        with self.assertConstraintValidated(name, model=model, calls=0) as profiler:
+            yield profiler
+
+        return None
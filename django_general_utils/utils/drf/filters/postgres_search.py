@@ -22,6 +22,12 @@ class PostgresSearchFilter(filters.BaseFilterBackend):
     search_icontains_attribute = 'search_icontains_fields'
     search_bonus_rank_startswith = 'search_fields_bonus_rank_startswith'
     search_rank_weights_attribute = 'search_rank_weights'
+    # Búsqueda híbrida (V2): la vista define `search_embedding_field` y `get_search_embedding(search_terms)`,
+    # `search_hybrid_mode` (rrf, weighted) y `search_hybrid_options` (hybrid_candidates, rrf_k, lexical_weight, etc)
+    search_embedding_field_attribute = 'search_embedding_field'
+    search_embedding_method = 'get_search_embedding'
+    search_hybrid_mode_attribute = 'search_hybrid_mode'
+    search_hybrid_options_attribute = 'search_hybrid_options'
 
     def filter_queryset(self, request, queryset, view):
         search_terms = self.get_search_terms(request, view)
@@ -63,10 +69,25 @@ class PostgresSearchFilter(filters.BaseFilterBackend):
                 search_word_trigram_fields,
                 search_vector_field,
                 search_rank_weights,
+                **self.get_hybrid_kwargs(view, search_terms),
             )
 
         raise ValueError(f'Search version {self.search_version} not supported')
 
+    def get_hybrid_kwargs(self, view, search_terms: str) -> dict:
+        embedding_field = getattr(view, self.search_embedding_field_attribute, None)
+        get_embedding = getattr(view, self.search_embedding_method, None)
+
+        if not embedding_field or get_embedding is None:
+            return {}
+
+        return {
+            'query_embedding': get_embedding(search_terms),
+            'embedding_field': embedding_field,
+            'hybrid_mode': getattr(view, self.search_hybrid_mode_attribute, 'rrf'),
+            **getattr(view, self.search_hybrid_options_attribute, {}),
+        }
+
     def get_search_param(self, view) -> str:
         return getattr(view, self.search_param_attribute, api_settings.SEARCH_PARAM)
 
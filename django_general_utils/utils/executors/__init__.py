@@ -0,0 +1,5 @@
+from .async_executor import AsyncExecutor
+from .base import BaseExecutor, ExecutorMetrics
+from .in_process_executor import InProcessExecutor
+from .registry import get_executor, set_executor
+from .thread_executor import ThreadExecutor
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+
+from .base import BaseExecutor, logger
+
+
+class AsyncExecutor(BaseExecutor):
+    """
+    Corre los callbacks en un event loop propio (en un hilo daemon). Como máximo
+    `max_workers` callbacks se ejecutan a la vez; los síncronos se delegan a un hilo
+    con `sync_to_async` para no bloquear el loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._loop = None
+        self._concurrency = None
+        self._lock = threading.Lock()
+
+    def _get_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._concurrency = None
+                threading.Thread(target=self._loop.run_forever, name='django-general-utils-async', daemon=True).start()
+
+            return self._loop
+
+    def _dispatch(self, callback, args, kwargs) -> None:
+        asyncio.run_coroutine_threadsafe(self._run_async(callback, args, kwargs), self._get_loop())
+
+        return None
+
+    async def _run_async(self, callback, args, kwargs) -> None:
+        # Se crea en el hilo del loop: en Python 3.9 el Semaphore queda asociado al loop del hilo que lo crea
+        if self._concurrency is None:
+            self._concurrency = asyncio.Semaphore(self.max_workers)
+
+        async with self._concurrency:
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    await self._measure(callback, args, kwargs)
+                else:
+                    await sync_to_async(self._run_in_worker, thread_sensitive=False)(callback, args, kwargs)
+            finally:
+                self._release()
+
+        return None
+
+    def _run_in_worker(self, callback, args, kwargs) -> None:
+        # Como en ThreadExecutor: el hilo de sync_to_async se reutiliza y sus conexiones pueden vencer
+        close_old_connections()
+
+        try:
+            self._run(callback, args, kwargs)
+        finally:
+            close_old_connections()
+
+        return None
+
+    async def _measure(self, callback, args, kwargs) -> None:
+        start = self._loop.time()
+
+        try:
+            await callback(*args, **kwargs)
+        except Exception:
+            logger.exception('Error running %r in %s', callback, self.__class__.__name__)
+            self.metrics.increment(failed=1, total_time=self._loop.time() - start)
+
+            return None
+
+        self.metrics.increment(completed=1, total_time=self._loop.time() - start)
+
+        return None
+
+    def shutdown(self, wait: bool = True) -> None:
+        super().shutdown(wait=wait)
+
+        with self._lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+
+        return None
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import threading
+import time
+
+from asgiref.sync import async_to_sync
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorMetrics:
+    """
+    Contadores thread-safe de un executor. `rejected` cuenta las tareas que se
+    ejecutaron en el hilo que las envió porque la cola estaba llena.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.total_time = 0.0
+
+    def increment(self, **values) -> None:
+        with self._lock:
+            for _name, _value in values.items():
+                setattr(self, _name, getattr(self, _name) + _value)
+
+        return None
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'rejected': self.rejected,
+                'in_flight': self.in_flight,
+                'total_time': self.total_time,
+            }
+
+
+class BaseExecutor:
+    """
+    Ejecuta callbacks fuera del flujo del request con capacidad acotada.
+
+    Hay `max_workers + max_queue_size` cupos; cuando se agotan, `submit` espera
+    hasta `queue_timeout` segundos (None = indefinidamente) y, si sigue sin cupo,
+    ejecuta el callback en el hilo que lo envió. Los errores del callback se
+    registran en el log y en `metrics`, nunca se propagan al emisor.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue_size: int = 100, queue_timeout: float = None):
+        assert max_workers > 0, 'max_workers must be greater than 0'
+        assert max_queue_size >= 0, 'max_queue_size must be greater than or equal to 0'
+
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.metrics = ExecutorMetrics()
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue_size)
+        self._idle = threading.Condition()
+
+    def submit(self, callback, *args, **kwargs) -> None:
+        self.metrics.increment(submitted=1, in_flight=1)
+
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            self.metrics.increment(rejected=1)
+            self._run(callback, args, kwargs)
+            self._done()
+
+            return None
+
+        self._dispatch(callback, args, kwargs)
+
+        return None
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Bloquea hasta que no queden tareas en curso. Retorna False si se agotó el timeout.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self.metrics.in_flight == 0, timeout=timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        if wait:
+            self.wait()
+
+        return None
+
+    def _dispatch(self, callback, args, kwargs) -> None:
+        raise NotImplementedError
+
+    def _run(self, callback, args, kwargs) -> None:
+        start = time.perf_counter()
+
+        try:
+            if asyncio.iscoroutinefunction(callback):
+                async_to_sync(callback)(*args, **kwargs)
+            else:
+                callback(*args, **kwargs)
+        except Exception:
+            logger.exception('Error running %r in %s', callback, self.__class__.__name__)
+            self.metrics.increment(failed=1, total_time=time.perf_counter() - start)
+
+            return None
+
+        self.metrics.increment(completed=1, total_time=time.perf_counter() - start)
+
+        return None
+
+    def _release(self) -> None:
+        self._slots.release()
+        self._done()
+
+        return None
+
+    def _done(self) -> None:
+        self.metrics.increment(in_flight=-1)
+
+        with self._idle:
+            self._idle.notify_all()
+
+        return None
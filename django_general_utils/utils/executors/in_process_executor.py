@@ -0,0 +1,16 @@
+from .base import BaseExecutor
+
+
+class InProcessExecutor(BaseExecutor):
+    """
+    Ejecuta el callback en el mismo hilo al momento de `submit`. Pensado para tests:
+    mantiene el aislamiento de errores y las métricas sin concurrencia.
+    """
+
+    def _dispatch(self, callback, args, kwargs) -> None:
+        try:
+            self._run(callback, args, kwargs)
+        finally:
+            self._release()
+
+        return None
@@ -0,0 +1,56 @@
+import threading
+
+from django.conf import settings
+
+from .async_executor import AsyncExecutor
+from .in_process_executor import InProcessExecutor
+from .thread_executor import ThreadExecutor
+
+EXECUTOR_CLASSES = {
+    'thread': ThreadExecutor,
+    'async': AsyncExecutor,
+}
+
+_executors = {}
+_lock = threading.Lock()
+
+
+def get_executor(run_in: str):
+    """
+    Executor compartido para `run_in` ('thread' | 'async'), creado al primer uso con
+    `SIGNAL_EXECUTOR_MAX_WORKERS`, `SIGNAL_EXECUTOR_MAX_QUEUE_SIZE` y
+    `SIGNAL_EXECUTOR_QUEUE_TIMEOUT`. Con `SIGNAL_EXECUTOR_IN_PROCESS = True` (tests)
+    se usa un `InProcessExecutor`.
+    """
+    assert run_in in EXECUTOR_CLASSES, f'run_in must be one of {", ".join(EXECUTOR_CLASSES)}'
+
+    with _lock:
+        if run_in not in _executors:
+            executor_class = EXECUTOR_CLASSES[run_in]
+
+            if getattr(settings, 'SIGNAL_EXECUTOR_IN_PROCESS', False):
+                executor_class = InProcessExecutor
+
+            _executors[run_in] = executor_class(
+                max_workers=getattr(settings, 'SIGNAL_EXECUTOR_MAX_WORKERS', 4),
+                max_queue_size=getattr(settings, 'SIGNAL_EXECUTOR_MAX_QUEUE_SIZE', 100),
+                queue_timeout=getattr(settings, 'SIGNAL_EXECUTOR_QUEUE_TIMEOUT', None),
+            )
+
+        return _executors[run_in]
+
+
+def set_executor(run_in: str, executor) -> None:
+    """
+    Reemplaza el executor compartido de `run_in` (p. ej. por un `InProcessExecutor` en tests).
+    `None` lo descarta para que se vuelva a crear según settings.
+    """
+    assert run_in in EXECUTOR_CLASSES, f'run_in must be one of {", ".join(EXECUTOR_CLASSES)}'
+
+    with _lock:
+        if executor is None:
+            _executors.pop(run_in, None)
+        else:
+            _executors[run_in] = executor
+
+    return None
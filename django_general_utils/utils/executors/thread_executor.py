@@ -0,0 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections
+
+from .base import BaseExecutor
+
+
+class ThreadExecutor(BaseExecutor):
+    def __init__(self, *args, thread_name_prefix: str = 'django-general-utils', **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=thread_name_prefix)
+
+    def _dispatch(self, callback, args, kwargs) -> None:
+        self._pool.submit(self._run_in_worker, callback, args, kwargs)
+
+        return None
+
+    def _run_in_worker(self, callback, args, kwargs) -> None:
+        # Las conexiones de Django son por hilo: se cierran las vencidas antes y después de cada tarea
+        close_old_connections()
+
+        try:
+            self._run(callback, args, kwargs)
+        finally:
+            close_old_connections()
+            self._release()
+
+        return None
+
+    def shutdown(self, wait: bool = True) -> None:
+        super().shutdown(wait=wait)
+        self._pool.shutdown(wait=wait)
+
+        return None
@@ -0,0 +1,83 @@
+from collections.abc import Sequence
+from functools import lru_cache
+
+from .generators import format_ruts, random_points_in_polygon, random_rut_numbers, rut_check_digits
+
+# Los fixtures ya no son archivos: se generan en el primer uso, siempre iguales (semilla fija)
+FIXTURES_SIZE = 10_000
+FIXTURES_SEED = 0
+
+
+def get_fixtures_random():
+    import numpy as np
+
+    return np.random.default_rng(FIXTURES_SEED)
+
+
+@lru_cache
+def get_rut_array():
+    """
+    RUTs de los fixtures: arreglo estructurado `number` (uint32) + `dv` (1 byte, `K` en mayúscula).
+    """
+    import numpy as np
+
+    numbers = random_rut_numbers(get_fixtures_random(), FIXTURES_SIZE)
+    ruts = np.empty(FIXTURES_SIZE, dtype=[('number', np.uint32), ('dv', 'S1')])
+    ruts['number'] = numbers
+    ruts['dv'] = rut_check_digits(numbers)
+
+    return ruts
+
+
+@lru_cache
+def get_ruts() -> tuple:
+    """
+    RUTs de los fixtures formateados como los retorna `CLRutField().clean()` (`12.611.222-K`).
+    """
+    return tuple(format_ruts(get_rut_array()['number']).tolist())
+
+
+@lru_cache
+def get_santiago_points():
+    """
+    Puntos `[lat, lon]` de los fixtures (ndarray (n, 2) de float64), dentro de `SANTIAGO_POLYGON`.
+    """
+    return random_points_in_polygon(get_fixtures_random(), FIXTURES_SIZE)
+
+
+class LazyFixture(Sequence):
+    """
+    Secuencia que genera el fixture recién en el primer acceso (Faker lee todos los atributos del
+    provider al agregarlo). Los demás atributos (`shape`, `tolist()`, ...) son los del fixture.
+    """
+
+    def __init__(self, loader):
+        self.loader = loader
+
+    def __getitem__(self, index):
+        return self.loader()[index]
+
+    def __len__(self):
+        return len(self.loader())
+
+    def __getattr__(self, name: str):
+        if name == 'loader':
+            raise AttributeError(name)
+
+        return getattr(self.loader(), name)
+
+    def __array__(self, dtype=None, copy=None):
+        import numpy as np
+
+        return np.asarray(self.loader(), dtype=dtype)
+
+
+def __getattr__(name: str):
+    # Compatibilidad con `from .fixtures import RUTS, SANTIAGO_POINTS`, sin generarlos al importar
+    if name == 'RUTS':
+        return list(get_ruts())
+
+    if name == 'SANTIAGO_POINTS':
+        return get_santiago_points().tolist()
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,2 +0,0 @@
-from .rut import RUTS
-from .santiago_points import SANTIAGO_POINTS
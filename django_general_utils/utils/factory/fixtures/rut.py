@@ -1,10002 +0,0 @@
-RUTS = [
-  "12611222-k",
-  "10314141-9",
-  "5855930-k",
-  "15985975-4",
-  "7428700-k",
-  "19861007-0",
-  "21094385-4",
-  "5464424-8",
-  "5627534-7",
-  "10964480-3",
-  "5800584-3",
-  "23978688-k",
-  "5432484-7",
-  "23665233-5",
-  "21962841-2",
-  "13520633-4",
-  "13589236-k",
-  "14518329-4",
-  "24413402-5",
-  "17684250-4",
-  "7411678-7",
-  "7512716-2",
-  "10405401-3",
-  "21014482-k",
-  "6872407-4",
-  "23377450-2",
-  "8488192-9",
-  "11191417-6",
-  "19184002-k",
-  "8374831-1",
-  "11068565-3",
-  "8451181-1",
-  "12211059-1",
-  "9112890-k",
-  "10202778-7",
-  "22010125-8",
-  "6138216-k",
-  "19482740-7",
-  "13549604-9",
-  "24830590-8",
-  "16160400-3",
-  "20761585-4",
-  "13966027-7",
-  "14781641-3",
-  "6587582-9",
-  "21324271-7",
-  "17339748-8",
-  "22886984-8",
-  "13802106-8",
-  "6185938-1",
-  "12444513-2",
-  "9496776-7",
-  "11824523-7",
-  "14594224-1",
-  "18563045-5",
-  "18545893-8",
-  "24836745-8",
-  "20101026-8",
-  "20783865-9",
-  "15704597-0",
-  "23021747-5",
-  "12311275-k",
-  "22705890-0",
-  "23464728-8",
-  "18241490-5",
-  "10412052-0",
-  "23085663-k",
-  "24768721-1",
-  "11083804-2",
-  "11264384-2",
-  "20321176-7",
-  "24642948-0",
-  "13539244-8",
-  "5091187-k",
-  "11803241-1",
-  "9171093-5",
-  "19028873-0",
-  "8406972-8",
-  "23211726-5",
-  "22482598-6",
-  "12881900-2",
-  "23823322-4",
-  "8021321-2",
-  "11493293-0",
-  "17019882-4",
-  "11613461-6",
-  "9121792-9",
-  "6647190-k",
-  "20084607-9",
-  "24605127-5",
-  "20491111-8",
-  "17620131-2",
-  "9676894-k",
-  "12032508-6",
-  "12605674-5",
-  "23176994-3",
-  "14217305-0",
-  "6568152-8",
-  "22702686-3",
-  "16685792-9",
-  "12968142-k",
-  "18942125-7",
-  "15921060-k",
-  "19825655-2",
-  "9880292-4",
-  "12721855-2",
-  "15682473-9",
-  "10584797-1",
-  "6186401-6",
-  "20213016-k",
-  "19016253-2",
-  "18247833-4",
-  "18132772-3",
-  "20267002-4",
-  "5508419-k",
-  "17199503-5",
-  "5124606-3",
-  "20598456-9",
-  "21267317-k",
-  "17435290-9",
-  "15025374-8",
-  "17028107-1",
-  "10539418-7",
-  "20215018-7",
-  "11735973-5",
-  "21643589-3",
-  "22478908-4",
-  "19869274-3",
-  "18358325-5",
-  "17827181-4",
-  "21399152-3",
-  "19310409-6",
-  "5540899-8",
-  "11436987-k",
-  "16864650-k",
-  "19221595-1",
-  "13095060-4",
-  "13797967-5",
-  "22095398-k",
-  "14593961-5",
-  "20945507-2",
-  "6736375-2",
-  "23997176-8",
-  "8141460-2",
-  "24424994-9",
-  "9766552-4",
-  "18477086-5",
-  "17056782-k",
-  "8647311-9",
-  "20075625-8",
-  "24617703-1",
-  "24178466-5",
-  "10286852-8",
-  "11563132-2",
-  "13894745-9",
-  "20289340-6",
-  "20351633-9",
-  "20440568-9",
-  "12929586-4",
-  "20790201-2",
-  "15602448-1",
-  "21153427-3",
-  "23190197-3",
-  "20840266-8",
-  "18775972-2",
-  "14059398-2",
-  "5407774-2",
-  "13084688-2",
-  "19043228-9",
-  "13110267-4",
-  "16083480-3",
-  "19956990-2",
-  "16599118-4",
-  "22591629-2",
-  "22244729-1",
-  "12296716-6",
-  "15599814-8",
-  "10174066-8",
-  "5972144-5",
-  "8278419-5",
-  "20133675-9",
-  "21849939-2",
-  "6580694-0",
-  "5922384-4",
-  "5680666-0",
-  "7049394-2",
-  "10577021-9",
-  "18631961-3",
-  "12566508-k",
-  "15766047-0",
-  "22500315-7",
-  "18486421-5",
-  "14942761-9",
-  "23640240-1",
-  "14459162-3",
-  "14585979-4",
-  "10326136-8",
-  "21404192-8",
-  "23678731-1",
-  "21758740-9",
-  "13044518-7",
-  "11391918-3",
-  "15724775-1",
-  "22670980-0",
-  "19058799-1",
-  "21126105-6",
-  "19251577-7",
-  "14127264-0",
-  "5936768-4",
-  "18307929-8",
-  "24656251-2",
-  "6972378-0",
-  "19366594-2",
-  "14938321-2",
-  "5088367-1",
-  "10877464-9",
-  "10133386-8",
-  "10514167-k",
-  "21057398-4",
-  "11959428-6",
-  "9837636-4",
-  "15280256-0",
-  "14921374-0",
-  "6936819-0",
-  "15472939-9",
-  "12033121-3",
-  "16561931-5",
-  "21332705-4",
-  "11666231-0",
-  "19406453-5",
-  "9895179-2",
-  "23299743-5",
-  "15479778-5",
-  "17908258-6",
-  "9117115-5",
-  "10491852-2",
-  "18943855-9",
-  "24225957-2",
-  "5912321-1",
-  "9750125-4",
-  "7130907-k",
-  "12844937-k",
-  "11260789-7",
-  "5580321-8",
-  "11818173-5",
-  "12027301-9",
-  "5462785-8",
-  "18311055-1",
-  "14358124-1",
-  "24359286-0",
-  "15816145-1",
-  "17222709-0",
-  "21827709-8",
-  "22236580-5",
-  "11887129-4",
-  "17591761-6",
-  "9078152-9",
-  "24716631-9",
-  "8886905-2",
-  "11872474-7",
-  "7191895-5",
-  "18049621-1",
-  "15980082-2",
-  "16203021-3",
-  "6017640-k",
-  "6178721-6",
-  "18478200-6",
-  "6876358-4",
-  "22777129-1",
-  "21285515-4",
-  "21237483-0",
-  "14392458-0",
-  "12841491-6",
-  "23642657-2",
-  "9981114-5",
-  "11989700-9",
-  "6638502-7",
-  "22484752-1",
-  "5334699-5",
-  "11101979-7",
-  "20099915-0",
-  "9985949-0",
-  "13339678-0",
-  "16182184-5",
-  "6227972-9",
-  "23952974-7",
-  "12236611-1",
-  "19482959-0",
-  "11303319-3",
-  "17025131-8",
-  "12574088-k",
-  "11044480-k",
-  "12376197-9",
-  "10734585-k",
-  "8963185-8",
-  "22159330-8",
-  "24312470-0",
-  "20385926-0",
-  "16757638-9",
-  "16620900-5",
-  "22476823-0",
-  "23723957-1",
-  "12366172-9",
-  "17009318-6",
-  "15829476-1",
-  "20779314-0",
-  "9341100-5",
-  "15259961-7",
-  "13086765-0",
-  "15425823-k",
-  "17587481-k",
-  "18209914-7",
-  "16164953-8",
-  "21043844-0",
-  "22198197-9",
-  "17547545-1",
-  "11141501-3",
-  "9843511-5",
-  "12988887-3",
-  "7950042-9",
-  "12219658-5",
-  "15745652-0",
-  "9246297-8",
-  "19303086-6",
-  "15018094-5",
-  "17396325-4",
-  "6960480-3",
-  "6233646-3",
-  "20780801-6",
-  "15077272-9",
-  "23689522-k",
-  "19194891-2",
-  "6006609-4",
-  "9800035-6",
-  "5045336-7",
-  "20158765-4",
-  "19416240-5",
-  "6821292-8",
-  "5713910-2",
-  "16324343-1",
-  "13337848-0",
-  "17968131-5",
-  "14649123-5",
-  "20765815-4",
-  "15876506-3",
-  "7952202-3",
-  "14230797-9",
-  "24626540-2",
-  "17923489-0",
-  "15073185-2",
-  "14105235-7",
-  "17315897-1",
-  "11328358-0",
-  "16425396-1",
-  "17037567-k",
-  "13706318-2",
-  "23648529-3",
-  "24711121-2",
-  "9732149-3",
-  "8285498-3",
-  "8253749-k",
-  "14481438-k",
-  "14652534-2",
-  "16572758-4",
-  "11453554-0",
-  "6371815-7",
-  "17007880-2",
-  "12817869-4",
-  "23948720-3",
-  "9268273-0",
-  "11589679-2",
-  "22166418-3",
-  "21740147-k",
-  "22148379-0",
-  "16687936-1",
-  "17930381-7",
-  "23184390-6",
-  "23452300-7",
-  "23389745-0",
-  "5754984-k",
-  "21961055-6",
-  "13774249-7",
-  "21455990-0",
-  "15343042-k",
-  "7027839-1",
-  "24751750-2",
-  "21711374-1",
-  "21661928-5",
-  "9130981-5",
-  "22987287-7",
-  "20992337-8",
-  "10413314-2",
-  "16511200-8",
-  "17009297-k",
-  "9751206-k",
-  "23417433-9",
-  "18692325-1",
-  "21132006-0",
-  "7060093-5",
-  "22003384-8",
-  "18181349-0",
-  "8835095-2",
-  "15215237-k",
-  "9067990-2",
-  "18174296-8",
-  "17331245-8",
-  "21844489-k",
-  "15189895-5",
-  "14617458-2",
-  "13363151-8",
-  "5528171-8",
-  "15973301-7",
-  "10857312-0",
-  "22778209-9",
-  "8686637-4",
-  "13139023-8",
-  "19418938-9",
-  "9021895-6",
-  "9783789-9",
-  "24369576-7",
-  "22616404-9",
-  "21464989-6",
-  "13143805-2",
-  "24794896-1",
-  "15960901-4",
-  "10568901-2",
-  "9808981-0",
-  "15570717-8",
-  "15798011-4",
-  "21898510-6",
-  "13333014-3",
-  "12805404-9",
-  "23473983-2",
-  "19937356-0",
-  "15526163-3",
-  "5447989-1",
-  "10664800-k",
-  "16557763-9",
-  "23964379-5",
-  "23993024-7",
-  "22397349-3",
-  "12151073-1",
-  "24662532-8",
-  "6633753-7",
-  "9665157-0",
-  "10805331-3",
-  "15654604-6",
-  "18154906-8",
-  "17544934-5",
-  "23695495-1",
-  "23381316-8",
-  "9682437-8",
-  "7936139-9",
-  "13652617-0",
-  "13971088-6",
-  "23448343-9",
-  "8176638-k",
-  "23465069-6",
-  "14526932-6",
-  "19887114-1",
-  "10185560-0",
-  "18346966-5",
-  "16606642-5",
-  "21957049-k",
-  "6979917-5",
-  "18485106-7",
-  "22422756-6",
-  "18932046-9",
-  "20373489-1",
-  "10934101-0",
-  "23120502-0",
-  "6540982-8",
-  "23483424-k",
-  "8649375-6",
-  "15165616-1",
-  "11901994-k",
-  "5828647-8",
-  "23918542-8",
-  "18614863-0",
-  "11106899-2",
-  "16526960-8",
-  "12219654-2",
-  "22705753-k",
-  "23360246-9",
-  "17623250-1",
-  "10014463-8",
-  "23218064-1",
-  "5288636-8",
-  "15267640-9",
-  "24016222-9",
-  "14690380-0",
-  "17574714-1",
-  "10186080-9",
-  "7218754-7",
-  "21265644-5",
-  "23164010-k",
-  "22786028-6",
-  "17912256-1",
-  "20095912-4",
-  "18651580-3",
-  "23097263-k",
-  "8856951-2",
-  "20524321-6",
-  "20688410-k",
-  "12478178-7",
-  "15139036-6",
-  "23226646-5",
-  "15047433-7",
-  "18692765-6",
-  "14668363-0",
-  "6094551-9",
-  "13059631-2",
-  "9534977-3",
-  "24295167-0",
-  "23898759-8",
-  "17507984-k",
-  "13148864-5",
-  "22584386-4",
-  "13312592-2",
-  "11343407-4",
-  "5278526-k",
-  "11583355-3",
-  "5243200-6",
-  "19561524-1",
-  "22354437-1",
-  "9910203-9",
-  "16170820-8",
-  "15102747-4",
-  "8615311-4",
-  "18994401-2",
-  "15679188-1",
-  "10480419-5",
-  "14314699-5",
-  "11052569-9",
-  "8339188-k",
-  "22307114-7",
-  "9328586-7",
-  "6336861-k",
-  "8158167-3",
-  "21989772-3",
-  "24430592-k",
-  "19804451-2",
-  "19576209-0",
-  "13241864-0",
-  "18941763-2",
-  "24271136-k",
-  "6407908-5",
-  "9756128-1",
-  "18057388-7",
-  "12098300-8",
-  "8721106-1",
-  "19746346-5",
-  "6430854-8",
-  "21650284-1",
-  "18234061-8",
-  "20706133-6",
-  "18471140-0",
-  "6699406-6",
-  "17045596-7",
-  "10528893-k",
-  "15205387-8",
-  "6233725-7",
-  "16258688-2",
-  "24093176-1",
-  "10883245-2",
-  "22733728-1",
-  "15925150-0",
-  "11632257-9",
-  "15449313-1",
-  "23003026-k",
-  "8308855-9",
-  "13775727-3",
-  "23354937-1",
-  "11347782-2",
-  "12237549-8",
-  "10502055-4",
-  "19007477-3",
-  "17634834-8",
-  "11807826-8",
-  "21581300-2",
-  "16025710-5",
-  "11057208-5",
-  "11717137-k",
-  "21095435-k",
-  "20573798-7",
-  "18351564-0",
-  "14210432-6",
-  "21142142-8",
-  "5975942-6",
-  "10268811-2",
-  "10908420-4",
-  "17777116-3",
-  "10863513-4",
-  "12918471-k",
-  "8237479-5",
-  "19497270-9",
-  "17474249-9",
-  "23881271-2",
-  "24051599-7",
-  "24416213-4",
-  "10734134-k",
-  "9629332-1",
-  "14672375-6",
-  "7341221-8",
-  "9768024-8",
-  "21930606-7",
-  "8394339-4",
-  "10051474-5",
-  "24658021-9",
-  "9213823-2",
-  "16416322-9",
-  "22802773-1",
-  "19010035-9",
-  "5097624-6",
-  "22482649-4",
-  "24964660-1",
-  "22773191-5",
-  "10560952-3",
-  "8094748-8",
-  "23286015-4",
-  "8691981-8",
-  "16239675-7",
-  "23034173-7",
-  "6909586-0",
-  "18523787-7",
-  "19788911-k",
-  "12522458-k",
-  "17298220-4",
-  "20470690-5",
-  "9593774-8",
-  "8784213-4",
-  "10743495-k",
-  "18797593-k",
-  "14451827-6",
-  "23201394-k",
-  "11184830-0",
-  "6260557-k",
-  "13470839-5",
-  "16343436-9",
-  "21107457-4",
-  "9540118-k",
-  "22283535-6",
-  "24551728-9",
-  "21602661-6",
-  "14684509-6",
-  "21713265-7",
-  "18679702-7",
-  "16449737-2",
-  "12629128-0",
-  "24883497-8",
-  "15236409-1",
-  "13340049-4",
-  "11944544-2",
-  "22075710-2",
-  "9615094-6",
-  "8816728-7",
-  "12864669-8",
-  "13687628-7",
-  "21450588-6",
-  "13415348-2",
-  "19153352-6",
-  "8882935-2",
-  "24602545-2",
-  "12742967-7",
-  "20951870-8",
-  "22446431-2",
-  "11624647-3",
-  "5979561-9",
-  "8423997-6",
-  "8649125-7",
-  "13714644-4",
-  "12864154-8",
-  "10089243-k",
-  "9000566-9",
-  "9904531-0",
-  "10841928-8",
-  "14428361-9",
-  "15619978-8",
-  "8961451-1",
-  "12606482-9",
-  "19561193-9",
-  "10002994-4",
-  "15369049-9",
-  "12522453-9",
-  "12120737-0",
-  "19283852-5",
-  "19661685-3",
-  "17086803-k",
-  "10797568-3",
-  "8347666-4",
-  "20452723-7",
-  "7975590-7",
-  "13198664-5",
-  "11670800-0",
-  "9032910-3",
-  "20477194-4",
-  "7517893-k",
-  "5464661-5",
-  "21504519-6",
-  "5057346-k",
-  "23521464-4",
-  "7121334-k",
-  "10008394-9",
-  "19013545-4",
-  "23100875-6",
-  "17760534-4",
-  "20850471-1",
-  "14098056-0",
-  "20562102-4",
-  "14009072-7",
-  "5968363-2",
-  "17418115-2",
-  "5695700-6",
-  "6579503-5",
-  "24862947-9",
-  "15808497-k",
-  "18080332-7",
-  "19673661-1",
-  "12754763-7",
-  "21597712-9",
-  "15566225-5",
-  "18947689-2",
-  "22951092-4",
-  "18148510-8",
-  "22446844-k",
-  "12299066-4",
-  "18409121-6",
-  "18779658-k",
-  "22625968-6",
-  "18590264-1",
-  "11798575-k",
-  "21225000-7",
-  "24402100-k",
-  "16276454-3",
-  "16587529-k",
-  "12383483-6",
-  "15563000-0",
-  "6689674-9",
-  "10966665-3",
-  "12330477-2",
-  "24820676-4",
-  "18669419-8",
-  "13585947-8",
-  "11970557-6",
-  "9470425-1",
-  "7853316-1",
-  "9596286-6",
-  "22229399-5",
-  "10842365-k",
-  "13941252-4",
-  "16111175-9",
-  "16727477-3",
-  "13285223-5",
-  "14697510-0",
-  "8724602-7",
-  "13021849-0",
-  "5166088-9",
-  "12360501-2",
-  "20965728-7",
-  "14612827-0",
-  "23407753-8",
-  "24615823-1",
-  "19864048-4",
-  "13572653-2",
-  "8709383-2",
-  "7187110-k",
-  "14798625-4",
-  "24276112-k",
-  "16442125-2",
-  "9593638-5",
-  "11701801-6",
-  "6068176-7",
-  "19330427-3",
-  "7887632-8",
-  "7407974-1",
-  "11707774-8",
-  "22676515-8",
-  "21802836-5",
-  "9266970-k",
-  "17945846-2",
-  "17465692-4",
-  "6664589-4",
-  "12088890-0",
-  "9272638-k",
-  "15197863-0",
-  "22425183-1",
-  "21336025-6",
-  "15586683-7",
-  "18988015-4",
-  "6726151-8",
-  "10253417-4",
-  "20561406-0",
-  "12923953-0",
-  "11736667-7",
-  "19710742-1",
-  "15069934-7",
-  "10320784-3",
-  "22202418-8",
-  "6774932-4",
-  "5384094-9",
-  "13417708-k",
-  "24736389-0",
-  "11305036-5",
-  "11806612-k",
-  "22043914-3",
-  "19491215-3",
-  "23394722-9",
-  "6601031-7",
-  "24347310-1",
-  "22158983-1",
-  "23466048-9",
-  "14608856-2",
-  "13863704-2",
-  "6923645-6",
-  "11787432-k",
-  "17781985-9",
-  "22972791-5",
-  "14597011-3",
-  "5530476-9",
-  "13198536-3",
-  "14204941-4",
-  "13426444-6",
-  "17801687-3",
-  "11009649-6",
-  "19464262-8",
-  "8628335-2",
-  "14484842-k",
-  "13295479-8",
-  "13621188-9",
-  "12857521-9",
-  "14668401-7",
-  "6464813-6",
-  "14615193-0",
-  "6259748-8",
-  "10453458-9",
-  "13441415-4",
-  "8067417-1",
-  "20873305-2",
-  "9798815-3",
-  "19179042-1",
-  "20790830-4",
-  "15571456-5",
-  "19399822-4",
-  "7077990-0",
-  "20295883-4",
-  "21732316-9",
-  "8728760-2",
-  "18150826-4",
-  "14244931-5",
-  "17690176-4",
-  "5326929-k",
-  "20734151-7",
-  "18705557-1",
-  "11429749-6",
-  "23703337-k",
-  "19455683-7",
-  "9635330-8",
-  "14569945-2",
-  "24048442-0",
-  "24782466-9",
-  "19136378-7",
-  "13989893-1",
-  "6379399-k",
-  "7798210-8",
-  "6546400-4",
-  "16666676-7",
-  "24519135-9",
-  "11570557-1",
-  "6579289-3",
-  "15631217-7",
-  "20863124-1",
-  "23180045-k",
-  "23175499-7",
-  "19121289-4",
-  "6960262-2",
-  "7769827-2",
-  "9599705-8",
-  "19031510-k",
-  "21734954-0",
-  "15407109-1",
-  "9245873-3",
-  "17540133-4",
-  "9559280-5",
-  "19531291-5",
-  "13034892-0",
-  "24733135-2",
-  "20129295-6",
-  "9935246-9",
-  "10289687-4",
-  "23789493-6",
-  "6330136-1",
-  "24941666-5",
-  "20698533-k",
-  "17631864-3",
-  "16032567-4",
-  "16704451-4",
-  "12344902-9",
-  "12256915-2",
-  "5958617-3",
-  "12037547-4",
-  "24144878-9",
-  "23383339-8",
-  "19970717-5",
-  "18552308-k",
-  "21932282-8",
-  "6756199-6",
-  "12553319-1",
-  "20795383-0",
-  "14159720-5",
-  "20128649-2",
-  "17198344-4",
-  "17214977-4",
-  "6070440-6",
-  "9919674-2",
-  "21647765-0",
-  "16255375-5",
-  "15287287-9",
-  "6675575-4",
-  "15576265-9",
-  "7198135-5",
-  "5076481-8",
-  "21822919-0",
-  "14769365-6",
-  "16536954-8",
-  "22891016-3",
-  "24941768-8",
-  "18118033-1",
-  "24175452-9",
-  "7411190-4",
-  "6250949-k",
-  "7590387-1",
-  "9748733-2",
-  "23788369-1",
-  "13639320-0",
-  "15186813-4",
-  "7518434-4",
-  "19040101-4",
-  "13399770-9",
-  "12799215-0",
-  "10066672-3",
-  "23610467-2",
-  "20102519-2",
-  "7515009-1",
-  "20997885-7",
-  "22565842-0",
-  "10641714-8",
-  "19932306-7",
-  "23637913-2",
-  "23111509-9",
-  "8011421-4",
-  "13049628-8",
-  "13218518-2",
-  "8947983-5",
-  "7135943-3",
-  "14072684-2",
-  "7526165-9",
-  "19619109-7",
-  "18526817-9",
-  "19502300-k",
-  "21920986-k",
-  "14900275-8",
-  "21700944-8",
-  "7023103-4",
-  "14078185-1",
-  "10056653-2",
-  "6801493-k",
-  "9604333-3",
-  "20463285-5",
-  "22613430-1",
-  "9987371-k",
-  "23062838-6",
-  "22020972-5",
-  "11860319-2",
-  "14146795-6",
-  "5541897-7",
-  "5416695-8",
-  "5768983-8",
-  "5458357-5",
-  "16180803-2",
-  "15209777-8",
-  "21536901-3",
-  "9407037-6",
-  "17245933-1",
-  "22283822-3",
-  "11150718-k",
-  "7700953-1",
-  "8663669-7",
-  "5448060-1",
-  "16923177-k",
-  "9646179-8",
-  "11904886-9",
-  "12175968-3",
-  "10668569-k",
-  "20473358-9",
-  "16874264-9",
-  "10779088-8",
-  "8955550-7",
-  "6782049-5",
-  "8201518-3",
-  "16320366-9",
-  "9392680-3",
-  "19434772-3",
-  "18550563-4",
-  "7053218-2",
-  "11644530-1",
-  "23264338-2",
-  "9778808-1",
-  "15631734-9",
-  "10145595-5",
-  "20885880-7",
-  "19808007-1",
-  "5390328-2",
-  "23275378-1",
-  "18867852-1",
-  "10935817-7",
-  "15871354-3",
-  "10044714-2",
-  "8705997-9",
-  "18791043-9",
-  "21373966-2",
-  "21650640-5",
-  "13226615-8",
-  "22045432-0",
-  "23445931-7",
-  "21926753-3",
-  "17620756-6",
-  "22200381-4",
-  "6022700-4",
-  "20408061-5",
-  "20234282-5",
-  "23127849-4",
-  "9997223-8",
-  "11101636-4",
-  "16123533-4",
-  "8068990-k",
-  "15213423-1",
-  "14472501-8",
-  "12812375-k",
-  "11307495-7",
-  "12172450-2",
-  "16203886-9",
-  "14772865-4",
-  "18041302-2",
-  "10874888-5",
-  "21654048-4",
-  "11897847-1",
-  "24157089-4",
-  "15449703-k",
-  "9656118-0",
-  "17682312-7",
-  "6898125-5",
-  "20246519-6",
-  "13644015-2",
-  "21177841-5",
-  "12179100-5",
-  "18406547-9",
-  "8287997-8",
-  "22520121-8",
-  "13866076-1",
-  "9667463-5",
-  "19135230-0",
-  "23080848-1",
-  "7449682-2",
-  "12756998-3",
-  "20361957-k",
-  "6754688-1",
-  "21200316-6",
-  "7570322-8",
-  "9935844-0",
-  "11606041-8",
-  "24299339-k",
-  "23104549-k",
-  "23677237-3",
-  "18266136-8",
-  "6803394-2",
-  "16608873-9",
-  "24401571-9",
-  "10009640-4",
-  "20049308-7",
-  "5796439-1",
-  "13298770-k",
-  "23411552-9",
-  "19501448-5",
-  "11827691-4",
-  "20016237-4",
-  "10020756-7",
-  "17812088-3",
-  "22761097-2",
-  "20488046-8",
-  "23199946-9",
-  "8117285-4",
-  "15776275-3",
-  "22109600-2",
-  "9058572-k",
-  "9206540-5",
-  "5204289-5",
-  "15257422-3",
-  "21622783-2",
-  "24604098-2",
-  "12059477-k",
-  "17703605-6",
-  "14965593-k",
-  "21095376-0",
-  "21744433-0",
-  "8497537-0",
-  "21465509-8",
-  "20096481-0",
-  "21684553-6",
-  "16149971-4",
-  "9887227-2",
-  "22508570-6",
-  "7299988-6",
-  "16557334-k",
-  "13393125-2",
-  "22721942-4",
-  "5005149-8",
-  "5648293-8",
-  "21165020-6",
-  "17089759-5",
-  "8676342-7",
-  "11194625-6",
-  "10498951-9",
-  "14632813-k",
-  "16910304-6",
-  "19453159-1",
-  "16267928-7",
-  "20920155-0",
-  "10814674-5",
-  "17882829-0",
-  "16341759-6",
-  "6816244-0",
-  "23180169-3",
-  "12626165-9",
-  "18302350-0",
-  "23095863-7",
-  "5424424-k",
-  "16928917-4",
-  "6368870-3",
-  "7947232-8",
-  "21514942-0",
-  "11759691-5",
-  "21091979-1",
-  "8433170-8",
-  "22607369-8",
-  "6293423-9",
-  "6367674-8",
-  "14551264-6",
-  "7317294-2",
-  "10419474-5",
-  "7079337-7",
-  "20121488-2",
-  "19842282-7",
-  "14904246-6",
-  "5567252-0",
-  "21501164-k",
-  "16683758-8",
-  "15444960-4",
-  "23552816-9",
-  "6606947-8",
-  "7625508-3",
-  "5730024-8",
-  "8752444-2",
-  "22085392-6",
-  "23632495-8",
-  "5064703-k",
-  "7209666-5",
-  "22782187-6",
-  "23933017-7",
-  "16971721-4",
-  "5871943-9",
-  "5328640-2",
-  "19989213-4",
-  "19557397-2",
-  "14306420-4",
-  "8344741-9",
-  "17436480-k",
-  "23914157-9",
-  "18581783-0",
-  "5125743-k",
-  "13422503-3",
-  "17808294-9",
-  "14400055-2",
-  "5851383-0",
-  "20979821-2",
-  "15847908-7",
-  "21325220-8",
-  "7796980-2",
-  "9351530-7",
-  "7433136-k",
-  "17326168-3",
-  "6423601-6",
-  "7503454-7",
-  "16316322-5",
-  "8207869-k",
-  "5919267-1",
-  "24333129-3",
-  "21926749-5",
-  "13912741-2",
-  "7827581-2",
-  "7468687-7",
-  "18503152-7",
-  "7525987-5",
-  "21546703-1",
-  "22609475-k",
-  "10006762-5",
-  "22437462-3",
-  "15599258-1",
-  "20162705-2",
-  "24306967-k",
-  "8230436-3",
-  "12402292-4",
-  "8592485-0",
-  "21068446-8",
-  "22553406-3",
-  "9252031-5",
-  "24453621-2",
-  "13623063-8",
-  "6651090-5",
-  "23711742-5",
-  "5194976-5",
-  "10691163-0",
-  "21731996-k",
-  "10003912-5",
-  "16081801-8",
-  "7355029-7",
-  "12811699-0",
-  "6755508-2",
-  "12248907-8",
-  "15184388-3",
-  "12766337-8",
-  "19269780-8",
-  "13294935-2",
-  "20815668-3",
-  "19151671-0",
-  "24631988-k",
-  "12377591-0",
-  "21120735-3",
-  "10904181-5",
-  "17018912-4",
-  "17963723-5",
-  "15355229-0",
-  "18777450-0",
-  "13443907-6",
-  "13465316-7",
-  "9950283-5",
-  "15732984-7",
-  "9011341-0",
-  "6867444-1",
-  "6783669-3",
-  "11901048-9",
-  "15573074-9",
-  "17482286-7",
-  "12428139-3",
-  "11321374-4",
-  "21320603-6",
-  "19400390-0",
-  "11818205-7",
-  "21823817-3",
-  "15383141-6",
-  "7902197-0",
-  "9995834-0",
-  "11287060-1",
-  "20576469-0",
-  "15947087-3",
-  "10486272-1",
-  "13442067-7",
-  "24330156-4",
-  "12988625-0",
-  "21671570-5",
-  "12192560-5",
-  "20688222-0",
-  "20826863-5",
-  "15473067-2",
-  "23516385-3",
-  "20010814-0",
-  "7785356-1",
-  "13814498-4",
-  "19771178-7",
-  "6079716-1",
-  "6876802-0",
-  "16903645-4",
-  "10283641-3",
-  "18008662-5",
-  "5569458-3",
-  "9773277-9",
-  "22192912-8",
-  "21069642-3",
-  "14001041-3",
-  "8394574-5",
-  "19491968-9",
-  "10406940-1",
-  "18952475-7",
-  "15519470-7",
-  "17179479-k",
-  "9756871-5",
-  "20803231-3",
-  "8012309-4",
-  "21759639-4",
-  "20488844-2",
-  "19297434-8",
-  "13473275-k",
-  "21049087-6",
-  "6080543-1",
-  "5638108-2",
-  "8892634-k",
-  "21347511-8",
-  "14419703-8",
-  "9364103-5",
-  "7230295-8",
-  "7480586-8",
-  "21515243-k",
-  "23705621-3",
-  "9877398-3",
-  "7412068-7",
-  "22264266-3",
-  "8320601-2",
-  "23465684-8",
-  "23737319-7",
-  "7015724-1",
-  "10885131-7",
-  "22388116-5",
-  "17652071-k",
-  "9355219-9",
-  "16280446-4",
-  "13405463-8",
-  "17386878-2",
-  "5558524-5",
-  "21289643-8",
-  "14349646-5",
-  "10305266-1",
-  "16454016-2",
-  "22657731-9",
-  "23307895-6",
-  "9069688-2",
-  "8715546-3",
-  "10051936-4",
-  "19523987-8",
-  "16567391-3",
-  "10646320-4",
-  "9004705-1",
-  "22941169-1",
-  "23676370-6",
-  "17168750-0",
-  "12253769-2",
-  "23959907-9",
-  "12564363-9",
-  "15617838-1",
-  "7427826-4",
-  "7180380-5",
-  "23778024-8",
-  "23683662-2",
-  "19767028-2",
-  "17230558-k",
-  "13349400-6",
-  "10727331-k",
-  "15137583-9",
-  "8219535-1",
-  "9689676-k",
-  "15413767-k",
-  "8686351-0",
-  "5954804-2",
-  "7234872-9",
-  "12054239-7",
-  "14508172-6",
-  "23807473-8",
-  "18390272-5",
-  "23540670-5",
-  "10109429-4",
-  "21243690-9",
-  "8506428-2",
-  "9896350-2",
-  "9603739-2",
-  "23772111-k",
-  "19677201-4",
-  "22318298-4",
-  "14720793-k",
-  "19809711-k",
-  "24291804-5",
-  "17928204-6",
-  "9047745-5",
-  "21751161-5",
-  "7474132-0",
-  "8506558-0",
-  "21929169-8",
-  "10076854-2",
-  "12507691-2",
-  "14905969-5",
-  "21789071-3",
-  "23133221-9",
-  "15502569-7",
-  "5195252-9",
-  "8956079-9",
-  "7558913-1",
-  "24877770-2",
-  "8784625-3",
-  "18868200-6",
-  "16458982-k",
-  "8433918-0",
-  "20045091-4",
-  "5757935-8",
-  "24779315-1",
-  "6135518-9",
-  "11074204-5",
-  "13043013-9",
-  "22279334-3",
-  "21531886-9",
-  "11109989-8",
-  "8514902-4",
-  "9502929-9",
-  "20685351-4",
-  "20314823-2",
-  "17934274-k",
-  "20726153-k",
-  "11719204-0",
-  "21765722-9",
-  "15831938-1",
-  "16708779-5",
-  "9158373-9",
-  "12160916-9",
-  "17219996-8",
-  "17000063-3",
-  "20859029-4",
-  "6418255-2",
-  "15818737-k",
-  "13144991-7",
-  "16240610-8",
-  "15421539-5",
-  "17021977-5",
-  "20989427-0",
-  "6850212-8",
-  "24709647-7",
-  "17045663-7",
-  "17015333-2",
-  "21277756-0",
-  "7784925-4",
-  "24869080-1",
-  "21742289-2",
-  "15547897-7",
-  "13587967-3",
-  "5404935-8",
-  "13368275-9",
-  "23273734-4",
-  "18899494-6",
-  "16692826-5",
-  "11712826-1",
-  "9608934-1",
-  "6923593-k",
-  "13428395-5",
-  "11942368-6",
-  "18266789-7",
-  "22648547-3",
-  "21550263-5",
-  "22812793-0",
-  "7992268-4",
-  "23646353-2",
-  "20410898-6",
-  "24487409-6",
-  "18278805-8",
-  "11983543-7",
-  "7609770-4",
-  "14498746-2",
-  "10808815-k",
-  "7067521-8",
-  "23893050-2",
-  "9564986-6",
-  "6487057-2",
-  "18455244-2",
-  "20980948-6",
-  "24131545-2",
-  "6535819-0",
-  "23043633-9",
-  "10164801-k",
-  "23946770-9",
-  "11374154-6",
-  "14701495-3",
-  "15894887-7",
-  "14560686-1",
-  "12560088-3",
-  "10571862-4",
-  "14640258-5",
-  "12116226-1",
-  "7568915-2",
-  "7495829-k",
-  "22924816-2",
-  "13767768-7",
-  "23269561-7",
-  "7964756-k",
-  "14261591-6",
-  "9659487-9",
-  "16330323-k",
-  "22765473-2",
-  "10081077-8",
-  "15826471-4",
-  "11102411-1",
-  "11845037-k",
-  "5647357-2",
-  "21071297-6",
-  "5684011-7",
-  "9312279-8",
-  "23215768-2",
-  "15067125-6",
-  "7351371-5",
-  "14268050-5",
-  "10703111-1",
-  "13207568-9",
-  "20668075-k",
-  "7926060-6",
-  "12157039-4",
-  "6362856-5",
-  "17675762-0",
-  "11113679-3",
-  "23563883-5",
-  "16117690-7",
-  "22384168-6",
-  "21780669-0",
-  "18411268-k",
-  "8018704-1",
-  "9483241-1",
-  "24382090-1",
-  "23211024-4",
-  "8184996-k",
-  "10804108-0",
-  "13294194-7",
-  "14618762-5",
-  "15702868-5",
-  "12377499-k",
-  "17320922-3",
-  "12841884-9",
-  "13256434-5",
-  "19877459-6",
-  "19135171-1",
-  "19758267-7",
-  "17508232-8",
-  "10676533-2",
-  "15297566-k",
-  "11067802-9",
-  "19427031-3",
-  "6016161-5",
-  "14872250-1",
-  "6780082-6",
-  "19460165-4",
-  "5082144-7",
-  "18476281-1",
-  "12756297-0",
-  "22078588-2",
-  "7852377-8",
-  "23082540-8",
-  "8315303-2",
-  "12531380-9",
-  "15920529-0",
-  "21070171-0",
-  "13472712-8",
-  "13887097-9",
-  "17296017-0",
-  "19722422-3",
-  "16781790-4",
-  "21461906-7",
-  "15626621-3",
-  "12624825-3",
-  "9782805-9",
-  "20034188-0",
-  "5404704-5",
-  "18714274-1",
-  "11523793-4",
-  "18558284-1",
-  "19604333-0",
-  "6314142-9",
-  "17607594-5",
-  "20231944-0",
-  "8865991-0",
-  "5849028-8",
-  "14142059-3",
-  "21584994-5",
-  "15792070-7",
-  "19009564-9",
-  "11893218-8",
-  "21946223-9",
-  "5362088-4",
-  "11323220-k",
-  "8564757-1",
-  "19821696-8",
-  "11323316-8",
-  "16996151-4",
-  "19245371-2",
-  "9084797-k",
-  "14469802-9",
-  "11458988-8",
-  "17264389-2",
-  "20571984-9",
-  "24621983-4",
-  "8392353-9",
-  "24038003-k",
-  "17651280-6",
-  "10518758-0",
-  "17325345-1",
-  "5184087-9",
-  "12693429-7",
-  "19022390-6",
-  "17439607-8",
-  "6730161-7",
-  "9403390-k",
-  "22727768-8",
-  "20134905-2",
-  "9694474-8",
-  "22336393-8",
-  "15775696-6",
-  "10001176-k",
-  "24497781-2",
-  "7225658-1",
-  "8478629-2",
-  "6905544-3",
-  "10178927-6",
-  "20185498-9",
-  "6300200-3",
-  "19627248-8",
-  "14992480-9",
-  "18818265-8",
-  "15457686-k",
-  "18071898-2",
-  "20280382-2",
-  "23662418-8",
-  "18496321-3",
-  "20433699-7",
-  "19954834-4",
-  "5176715-2",
-  "16429067-0",
-  "7923655-1",
-  "18700974-k",
-  "18700660-0",
-  "14798926-1",
-  "14614882-4",
-  "23326051-7",
-  "15131757-k",
-  "20285734-5",
-  "9611798-1",
-  "16916560-2",
-  "6721405-6",
-  "22170604-8",
-  "24407542-8",
-  "21605878-k",
-  "12637258-2",
-  "17729442-k",
-  "8434968-2",
-  "16576960-0",
-  "6536533-2",
-  "21005584-3",
-  "7878833-k",
-  "12171273-3",
-  "23585376-0",
-  "7655126-k",
-  "7595405-0",
-  "15153593-3",
-  "18749971-2",
-  "19985149-7",
-  "19174778-k",
-  "8347185-9",
-  "7278894-k",
-  "19361051-k",
-  "5461597-3",
-  "14132409-8",
-  "5147306-k",
-  "10428751-4",
-  "19317233-4",
-  "7244387-k",
-  "7925176-3",
-  "6911645-0",
-  "11271554-1",
-  "23456008-5",
-  "22184909-4",
-  "24845569-1",
-  "19473473-5",
-  "11807983-3",
-  "18097738-4",
-  "17444340-8",
-  "7926598-5",
-  "8453144-8",
-  "14295818-k",
-  "13324604-5",
-  "5257151-0",
-  "19822387-5",
-  "22774964-4",
-  "13369377-7",
-  "18424425-k",
-  "18106166-9",
-  "19563190-5",
-  "18921630-0",
-  "22520921-9",
-  "9135586-8",
-  "11571995-5",
-  "20947153-1",
-  "17442217-6",
-  "8845724-2",
-  "19143844-2",
-  "6616391-1",
-  "22238008-1",
-  "15701068-9",
-  "17145128-0",
-  "19884960-k",
-  "20017686-3",
-  "12404230-5",
-  "12114577-4",
-  "15185310-2",
-  "16126097-5",
-  "11607025-1",
-  "5933327-5",
-  "20507804-5",
-  "7851696-8",
-  "6963749-3",
-  "5574895-0",
-  "21830677-2",
-  "21177116-k",
-  "13439153-7",
-  "5586688-0",
-  "21900205-k",
-  "21109309-9",
-  "12997478-8",
-  "21652318-0",
-  "24349620-9",
-  "6824811-6",
-  "15581392-k",
-  "21849275-4",
-  "20787639-9",
-  "8290587-1",
-  "13583952-3",
-  "6015299-3",
-  "22690491-3",
-  "10869884-5",
-  "9873034-6",
-  "23990043-7",
-  "18874344-7",
-  "16405117-k",
-  "14291395-k",
-  "15498656-1",
-  "23828619-0",
-  "18192415-2",
-  "24799186-7",
-  "16511878-2",
-  "20999731-2",
-  "17275996-3",
-  "19776108-3",
-  "14250913-k",
-  "20283718-2",
-  "19135699-3",
-  "6359082-7",
-  "21726273-9",
-  "17674473-1",
-  "10460284-3",
-  "6560423-k",
-  "12344666-6",
-  "16091954-k",
-  "21459415-3",
-  "22366043-6",
-  "10328224-1",
-  "9258856-4",
-  "7690364-6",
-  "12572175-3",
-  "13395243-8",
-  "16883372-5",
-  "10267345-k",
-  "21811681-7",
-  "9397000-4",
-  "12240988-0",
-  "18399105-1",
-  "7941565-0",
-  "8145031-5",
-  "14557692-k",
-  "22129933-7",
-  "10367827-7",
-  "11322534-3",
-  "11240488-0",
-  "18841647-0",
-  "23116307-7",
-  "19287345-2",
-  "21410488-1",
-  "10920685-7",
-  "13215952-1",
-  "23413460-4",
-  "17115286-0",
-  "15917332-1",
-  "21240151-k",
-  "8360404-2",
-  "21798679-6",
-  "24589336-1",
-  "15252754-3",
-  "5491704-k",
-  "18240538-8",
-  "5161246-9",
-  "13778085-2",
-  "15339250-1",
-  "24703639-3",
-  "21674241-9",
-  "17205285-1",
-  "21861013-7",
-  "13493214-7",
-  "17744661-0",
-  "13790466-7",
-  "5395813-3",
-  "12544446-6",
-  "24484188-0",
-  "9590518-8",
-  "12980126-3",
-  "21109432-k",
-  "18123603-5",
-  "7832957-2",
-  "5745543-8",
-  "20064103-5",
-  "5267093-4",
-  "18589274-3",
-  "12687675-0",
-  "17754959-2",
-  "17760788-6",
-  "15614928-4",
-  "21479020-3",
-  "5249911-9",
-  "6522858-0",
-  "6711383-7",
-  "20082783-k",
-  "7538164-6",
-  "5341596-2",
-  "19014205-1",
-  "5442828-6",
-  "19287274-k",
-  "11108375-4",
-  "11181056-7",
-  "13266912-0",
-  "13717232-1",
-  "19146487-7",
-  "18986217-2",
-  "16756278-7",
-  "24395544-0",
-  "6790827-9",
-  "24837732-1",
-  "13590070-2",
-  "21171077-2",
-  "23044317-3",
-  "7232159-6",
-  "23027239-5",
-  "24805386-0",
-  "21325330-1",
-  "18848158-2",
-  "5664967-0",
-  "9270564-1",
-  "7153738-2",
-  "15855981-1",
-  "7877367-7",
-  "21800053-3",
-  "9548699-1",
-  "22430397-1",
-  "5007848-5",
-  "10495247-k",
-  "15962312-2",
-  "19712104-1",
-  "5084041-7",
-  "10072720-k",
-  "23534123-9",
-  "18124523-9",
-  "20345272-1",
-  "20423712-3",
-  "21914787-2",
-  "14260598-8",
-  "24999045-0",
-  "5054685-3",
-  "15916155-2",
-  "10296699-6",
-  "6736409-0",
-  "9521271-9",
-  "22796180-5",
-  "14605152-9",
-  "11473615-5",
-  "12035583-k",
-  "21863596-2",
-  "18481207-k",
-  "21369814-1",
-  "14681916-8",
-  "6830987-5",
-  "19068343-5",
-  "17427936-5",
-  "20246205-7",
-  "19332669-2",
-  "10332048-8",
-  "19211415-2",
-  "17398239-9",
-  "22942826-8",
-  "11447542-4",
-  "15832809-7",
-  "6794836-k",
-  "20483054-1",
-  "16915382-5",
-  "14320519-3",
-  "23030341-k",
-  "19554177-9",
-  "22676391-0",
-  "5554021-7",
-  "17833303-8",
-  "12866115-8",
-  "10315393-k",
-  "11583398-7",
-  "5547354-4",
-  "17835483-3",
-  "12064938-8",
-  "22154608-3",
-  "16451574-5",
-  "10517213-3",
-  "10678247-4",
-  "20805506-2",
-  "23388368-9",
-  "19273521-1",
-  "11881220-4",
-  "18902513-0",
-  "23094257-9",
-  "6889861-7",
-  "20653739-6",
-  "15798634-1",
-  "10745835-2",
-  "23577891-2",
-  "6000632-6",
-  "9470756-0",
-  "13699549-9",
-  "6170066-8",
-  "20983133-3",
-  "19470032-6",
-  "5486749-2",
-  "21344389-5",
-  "22317801-4",
-  "16241127-6",
-  "6848562-2",
-  "16849675-3",
-  "14029331-8",
-  "24354477-7",
-  "14019093-4",
-  "24310573-0",
-  "21235986-6",
-  "15676865-0",
-  "7708529-7",
-  "18940881-1",
-  "8347136-0",
-  "10869031-3",
-  "10119059-5",
-  "14152998-6",
-  "10976797-2",
-  "9105682-8",
-  "11523538-9",
-  "6868483-8",
-  "10448084-5",
-  "23604092-5",
-  "6188008-9",
-  "20064848-k",
-  "15032323-1",
-  "17892761-2",
-  "24218998-1",
-  "18041220-4",
-  "10189166-6",
-  "10785341-3",
-  "16411351-5",
-  "18137146-3",
-  "10434684-7",
-  "15142845-2",
-  "11078924-6",
-  "18739382-5",
-  "5636248-7",
-  "21455234-5",
-  "11201931-6",
-  "7133414-7",
-  "14425042-7",
-  "7949222-1",
-  "21828510-4",
-  "14065679-8",
-  "22234713-0",
-  "20344354-4",
-  "22795186-9",
-  "5061217-1",
-  "7125938-2",
-  "20998636-1",
-  "19517505-5",
-  "17593944-k",
-  "21288771-4",
-  "13933949-5",
-  "24905594-8",
-  "21222945-8",
-  "15491838-8",
-  "16731679-4",
-  "16705340-8",
-  "9109328-6",
-  "20458351-k",
-  "19489582-8",
-  "17224602-8",
-  "14291189-2",
-  "13917161-6",
-  "13114871-2",
-  "12752899-3",
-  "8286319-2",
-  "24332818-7",
-  "6906979-7",
-  "19006747-5",
-  "8098472-3",
-  "13343036-9",
-  "8025130-0",
-  "6645928-4",
-  "22503955-0",
-  "21003159-6",
-  "8613653-8",
-  "6785262-1",
-  "21422694-4",
-  "12498011-9",
-  "24365324-k",
-  "11097278-4",
-  "5057568-3",
-  "13037861-7",
-  "7215398-7",
-  "12828753-1",
-  "12175267-0",
-  "12264081-7",
-  "13190383-9",
-  "7680347-1",
-  "24570193-4",
-  "21150584-2",
-  "5458820-8",
-  "21841135-5",
-  "16119700-9",
-  "22801635-7",
-  "20924393-8",
-  "15588533-5",
-  "11325252-9",
-  "20196948-4",
-  "20355819-8",
-  "8966730-5",
-  "13774313-2",
-  "22151739-3",
-  "24180363-5",
-  "20066595-3",
-  "5816646-4",
-  "19067932-2",
-  "16986986-3",
-  "20353093-5",
-  "24724914-1",
-  "9063430-5",
-  "12055700-9",
-  "17579044-6",
-  "7223120-1",
-  "11552472-0",
-  "19136655-7",
-  "21430226-8",
-  "8541797-5",
-  "22243245-6",
-  "9216875-1",
-  "5001273-5",
-  "20352521-4",
-  "14747459-8",
-  "17147589-9",
-  "14875731-3",
-  "9694109-9",
-  "9341367-9",
-  "18415553-2",
-  "24130417-5",
-  "8419343-7",
-  "9533071-1",
-  "12699681-0",
-  "14506119-9",
-  "16099252-2",
-  "22393167-7",
-  "17488157-k",
-  "9410411-4",
-  "13196260-6",
-  "17332386-7",
-  "5653696-5",
-  "10920329-7",
-  "6746910-0",
-  "7601246-6",
-  "20945618-4",
-  "19829727-5",
-  "14631324-8",
-  "18193101-9",
-  "16155826-5",
-  "18385788-6",
-  "9337745-1",
-  "8833636-4",
-  "12446009-3",
-  "8000086-3",
-  "14509518-2",
-  "9013449-3",
-  "19054921-6",
-  "9530739-6",
-  "6216785-8",
-  "20713348-5",
-  "8784931-7",
-  "10917601-k",
-  "9787665-7",
-  "9810084-9",
-  "7927132-2",
-  "18357105-2",
-  "18592666-4",
-  "24879997-8",
-  "11098390-5",
-  "11397981-k",
-  "13981975-6",
-  "10116657-0",
-  "6208699-8",
-  "14594250-0",
-  "17200842-9",
-  "13300802-0",
-  "11929396-0",
-  "20922591-3",
-  "12356815-k",
-  "18751355-3",
-  "14956266-4",
-  "21542485-5",
-  "7965440-k",
-  "9040439-3",
-  "24532294-1",
-  "8372740-3",
-  "20126593-2",
-  "19371870-1",
-  "12521830-k",
-  "21220155-3",
-  "5867743-4",
-  "8357534-4",
-  "15938000-9",
-  "16312523-4",
-  "10575872-3",
-  "11077043-k",
-  "24268143-6",
-  "18616705-8",
-  "17638299-6",
-  "18749055-3",
-  "15634505-9",
-  "18698367-k",
-  "12298416-8",
-  "21089178-1",
-  "22571765-6",
-  "19891819-9",
-  "23168926-5",
-  "14559086-8",
-  "18716808-2",
-  "11292459-0",
-  "14281865-5",
-  "13051685-8",
-  "18484701-9",
-  "17153872-6",
-  "15696234-1",
-  "13729027-8",
-  "22328573-2",
-  "12924199-3",
-  "9296948-7",
-  "12560287-8",
-  "14802006-k",
-  "11950408-2",
-  "20385244-4",
-  "17197590-5",
-  "15314972-0",
-  "13539895-0",
-  "17515062-5",
-  "23915282-1",
-  "7014154-k",
-  "13636812-5",
-  "5943428-4",
-  "17213895-0",
-  "21857558-7",
-  "5486072-2",
-  "7174935-5",
-  "18888122-k",
-  "5661031-6",
-  "9285869-3",
-  "22356541-7",
-  "17327453-k",
-  "9319863-8",
-  "21334198-7",
-  "9727096-1",
-  "5168643-8",
-  "21815927-3",
-  "13980292-6",
-  "8360824-2",
-  "20726451-2",
-  "17927964-9",
-  "18793630-6",
-  "13907870-5",
-  "10251969-8",
-  "18056873-5",
-  "8860323-0",
-  "14717092-0",
-  "6234091-6",
-  "7560495-5",
-  "20132212-k",
-  "15212794-4",
-  "24970672-8",
-  "16895797-1",
-  "5696689-7",
-  "9459044-2",
-  "24030110-5",
-  "19312941-2",
-  "5459517-4",
-  "24838997-4",
-  "11114468-0",
-  "23617638-k",
-  "17043412-9",
-  "16087825-8",
-  "5044358-2",
-  "11643171-8",
-  "7721401-1",
-  "11368204-3",
-  "19864926-0",
-  "18113590-5",
-  "17669055-0",
-  "5961154-2",
-  "21932958-k",
-  "23793011-8",
-  "13892909-4",
-  "8568143-5",
-  "24468438-6",
-  "18797530-1",
-  "10831885-6",
-  "10391569-4",
-  "16109031-k",
-  "11844489-2",
-  "10030002-8",
-  "9013939-8",
-  "21971554-4",
-  "14136104-k",
-  "5628118-5",
-  "11637829-9",
-  "11899133-8",
-  "17822811-0",
-  "6738241-2",
-  "18104217-6",
-  "10360889-9",
-  "20894964-0",
-  "16128902-7",
-  "14037388-5",
-  "7160251-6",
-  "12633920-8",
-  "19605598-3",
-  "5992457-5",
-  "14147705-6",
-  "9336267-5",
-  "7331201-9",
-  "7746074-8",
-  "21350105-4",
-  "17328800-k",
-  "10007510-5",
-  "5379631-1",
-  "9164961-6",
-  "15682370-8",
-  "5389304-k",
-  "13334191-9",
-  "7337483-9",
-  "20359272-8",
-  "8945875-7",
-  "22012177-1",
-  "19941011-3",
-  "19021608-k",
-  "12746850-8",
-  "7170279-0",
-  "13212197-4",
-  "7892373-3",
-  "9436775-1",
-  "14560352-8",
-  "12836962-7",
-  "14646955-8",
-  "13034137-3",
-  "22458271-4",
-  "8197397-0",
-  "6832716-4",
-  "23268935-8",
-  "24415698-3",
-  "14798223-2",
-  "14102342-k",
-  "11413535-6",
-  "24171598-1",
-  "21602479-6",
-  "20136530-9",
-  "24253876-5",
-  "23888714-3",
-  "20001661-0",
-  "8257048-9",
-  "24659512-7",
-  "9396744-5",
-  "5401425-2",
-  "15192429-8",
-  "22106660-k",
-  "12639175-7",
-  "7089340-1",
-  "21120726-4",
-  "14959373-k",
-  "5678274-5",
-  "14994943-7",
-  "14442127-2",
-  "10934122-3",
-  "20822864-1",
-  "24886218-1",
-  "15074090-8",
-  "19364960-2",
-  "16938802-4",
-  "19854959-2",
-  "22860574-3",
-  "6741448-9",
-  "23326740-6",
-  "21742051-2",
-  "10128645-2",
-  "22609085-1",
-  "22833751-k",
-  "11737736-9",
-  "23024183-k",
-  "12189312-6",
-  "18408404-k",
-  "20541518-1",
-  "21338930-0",
-  "23983466-3",
-  "19880709-5",
-  "15681095-9",
-  "12364450-6",
-  "5229697-8",
-  "8361145-6",
-  "24282953-0",
-  "5653269-2",
-  "12237109-3",
-  "6529968-2",
-  "18943908-3",
-  "5467412-0",
-  "6024525-8",
-  "13160556-0",
-  "21914586-1",
-  "15524438-0",
-  "18972359-8",
-  "24650704-k",
-  "24455454-7",
-  "9985118-k",
-  "8435597-6",
-  "24220941-9",
-  "6931447-3",
-  "13655578-2",
-  "16017361-0",
-  "24827175-2",
-  "12717047-9",
-  "14623844-0",
-  "8455964-4",
-  "23825809-k",
-  "19117473-9",
-  "10368202-9",
-  "20449436-3",
-  "6209902-k",
-  "15659657-4",
-  "17412956-8",
-  "20260512-5",
-  "22823357-9",
-  "21499300-7",
-  "11883439-9",
-  "19544704-7",
-  "24516518-8",
-  "21254412-4",
-  "15076799-7",
-  "20813829-4",
-  "19940753-8",
-  "11855524-4",
-  "8939023-0",
-  "21955096-0",
-  "17054776-4",
-  "22124053-7",
-  "23737173-9",
-  "7151647-4",
-  "24531956-8",
-  "16371924-k",
-  "18590679-5",
-  "11889258-5",
-  "21117809-4",
-  "16410034-0",
-  "14384904-k",
-  "21054252-3",
-  "5820951-1",
-  "7394650-6",
-  "19366454-7",
-  "12373285-5",
-  "11427008-3",
-  "19703082-8",
-  "15010565-k",
-  "15217840-9",
-  "14206682-3",
-  "5850666-4",
-  "20205426-9",
-  "17290579-k",
-  "9012710-1",
-  "20676471-6",
-  "18693195-5",
-  "9532128-3",
-  "5797409-5",
-  "7061787-0",
-  "5470093-8",
-  "9724713-7",
-  "15637101-7",
-  "14994077-4",
-  "14379631-0",
-  "21847984-7",
-  "8685795-2",
-  "24023988-4",
-  "13452095-7",
-  "22551039-3",
-  "21491917-6",
-  "10499531-4",
-  "10885036-1",
-  "6386111-1",
-  "21642531-6",
-  "12514729-1",
-  "18050463-k",
-  "21979471-1",
-  "19033567-4",
-  "9382673-6",
-  "11381726-7",
-  "22771214-7",
-  "18296147-7",
-  "10379994-5",
-  "13925036-2",
-  "20914831-5",
-  "15490137-k",
-  "24325916-9",
-  "14427359-1",
-  "12697780-8",
-  "10053872-5",
-  "16899013-8",
-  "11086453-1",
-  "22568293-3",
-  "17248230-9",
-  "17051484-k",
-  "18768406-4",
-  "11156750-6",
-  "20434950-9",
-  "10908801-3",
-  "18883994-0",
-  "22484110-8",
-  "19412026-5",
-  "10758758-6",
-  "12778765-4",
-  "6227816-1",
-  "21649641-8",
-  "14007773-9",
-  "17535446-8",
-  "18963409-9",
-  "6108959-4",
-  "20721909-6",
-  "16852165-0",
-  "19994046-5",
-  "21185977-6",
-  "24564098-6",
-  "8209241-2",
-  "18437942-2",
-  "13559181-5",
-  "7698424-7",
-  "22924527-9",
-  "10364860-2",
-  "18375969-8",
-  "6110639-1",
-  "5186535-9",
-  "24639409-1",
-  "7274322-9",
-  "7367096-9",
-  "11432465-5",
-  "8305565-0",
-  "24381768-4",
-  "21414511-1",
-  "16990477-4",
-  "19023695-1",
-  "11249398-0",
-  "23887651-6",
-  "21503309-0",
-  "9926007-6",
-  "15247413-k",
-  "10304375-1",
-  "20435185-6",
-  "14475889-7",
-  "23752273-7",
-  "24025651-7",
-  "21641047-5",
-  "13153198-2",
-  "21284011-4",
-  "7170948-5",
-  "22736318-5",
-  "6549828-6",
-  "18599158-k",
-  "14708557-5",
-  "24133745-6",
-  "16999495-1",
-  "6464335-5",
-  "6271862-5",
-  "13033155-6",
-  "7772413-3",
-  "24796140-2",
-  "20699449-5",
-  "8938634-9",
-  "17059732-k",
-  "20728985-k",
-  "14434266-6",
-  "20877556-1",
-  "12770807-k",
-  "12683961-8",
-  "23942013-3",
-  "18245373-0",
-  "20260531-1",
-  "9750172-6",
-  "9646608-0",
-  "20488235-5",
-  "10821890-8",
-  "10337662-9",
-  "5829918-9",
-  "12632022-1",
-  "23130914-4",
-  "6652824-3",
-  "7268681-0",
-  "18470346-7",
-  "18635769-8",
-  "13705817-0",
-  "18423289-8",
-  "11299182-4",
-  "15633794-3",
-  "19416834-9",
-  "23770759-1",
-  "18563895-2",
-  "15201761-8",
-  "6180861-2",
-  "10917811-k",
-  "12396515-9",
-  "17537882-0",
-  "20993348-9",
-  "20884990-5",
-  "22176718-7",
-  "15651559-0",
-  "8061813-1",
-  "24029342-0",
-  "12237369-k",
-  "5659200-8",
-  "22402881-4",
-  "22539876-3",
-  "18683463-1",
-  "11306603-2",
-  "6167188-9",
-  "19962632-9",
-  "19545457-4",
-  "14540817-2",
-  "13870248-0",
-  "8445015-4",
-  "18682458-k",
-  "20529481-3",
-  "10410760-5",
-  "5027365-2",
-  "19918444-k",
-  "12218682-2",
-  "9932148-2",
-  "5004760-1",
-  "14679030-5",
-  "14764490-6",
-  "14908060-0",
-  "22488944-5",
-  "18416108-7",
-  "20279851-9",
-  "13583305-3",
-  "17180157-5",
-  "24157658-2",
-  "23943438-k",
-  "21481566-4",
-  "11110209-0",
-  "23553079-1",
-  "13342139-4",
-  "22684308-6",
-  "24878551-9",
-  "22853243-6",
-  "24529931-1",
-  "13574644-4",
-  "15621042-0",
-  "24705746-3",
-  "10400823-2",
-  "24491239-7",
-  "20587076-8",
-  "5046704-k",
-  "15922187-3",
-  "20233753-8",
-  "5768428-3",
-  "19114274-8",
-  "19090192-0",
-  "10431464-3",
-  "10423135-7",
-  "15318676-6",
-  "13904983-7",
-  "20178965-6",
-  "12122242-6",
-  "14047088-0",
-  "14585501-2",
-  "15783082-1",
-  "12620071-4",
-  "12378434-0",
-  "22783348-3",
-  "6113850-1",
-  "6227433-6",
-  "20560538-k",
-  "7903352-9",
-  "21126228-1",
-  "13537701-5",
-  "12923891-7",
-  "7332771-7",
-  "6230997-0",
-  "15369917-8",
-  "15163450-8",
-  "18646180-0",
-  "7797249-8",
-  "16678016-0",
-  "9285604-6",
-  "19461859-k",
-  "11611623-5",
-  "23432908-1",
-  "24846912-9",
-  "16523305-0",
-  "8987120-4",
-  "8365926-2",
-  "23108156-9",
-  "22709554-7",
-  "14368063-0",
-  "19164536-7",
-  "13929518-8",
-  "17338687-7",
-  "14750127-7",
-  "6724827-9",
-  "12147730-0",
-  "20448872-k",
-  "22668866-8",
-  "11306499-4",
-  "11939330-2",
-  "8736322-8",
-  "12724564-9",
-  "12988987-k",
-  "6372621-4",
-  "8592678-0",
-  "10747553-2",
-  "20325650-7",
-  "5026783-0",
-  "21861987-8",
-  "14877702-0",
-  "11064782-4",
-  "19880024-4",
-  "10995147-1",
-  "11833226-1",
-  "15340625-1",
-  "23440447-4",
-  "24041897-5",
-  "15420078-9",
-  "19217786-3",
-  "17365238-0",
-  "18434860-8",
-  "20989072-0",
-  "14379795-3",
-  "8913556-7",
-  "20278417-8",
-  "23690408-3",
-  "18457235-4",
-  "22065500-8",
-  "5501164-8",
-  "18660513-6",
-  "12861969-0",
-  "6189029-7",
-  "11211884-5",
-  "17173769-9",
-  "22951165-3",
-  "7182451-9",
-  "22693348-4",
-  "9792246-2",
-  "11565153-6",
-  "16547537-2",
-  "20980699-1",
-  "21255828-1",
-  "14218448-6",
-  "17134920-6",
-  "22039612-6",
-  "21199995-0",
-  "5540929-3",
-  "5173635-4",
-  "6646316-8",
-  "9961894-9",
-  "23589963-9",
-  "8992510-k",
-  "12924876-9",
-  "19949658-1",
-  "13274769-5",
-  "14906259-9",
-  "7675992-8",
-  "9559721-1",
-  "21317400-2",
-  "17424804-4",
-  "8346075-k",
-  "15839050-7",
-  "18563337-3",
-  "16558337-k",
-  "15686414-5",
-  "17537219-9",
-  "22338495-1",
-  "16072171-5",
-  "15317022-3",
-  "7141066-8",
-  "13838122-6",
-  "14022835-4",
-  "8736453-4",
-  "8950494-5",
-  "22226993-8",
-  "22755468-1",
-  "13681680-2",
-  "20123723-8",
-  "20232237-9",
-  "13540815-8",
-  "24667583-k",
-  "13679092-7",
-  "5111968-1",
-  "7947155-0",
-  "14098023-4",
-  "24332022-4",
-  "8529979-4",
-  "7085647-6",
-  "8618424-9",
-  "18734762-9",
-  "17550631-4",
-  "13625933-4",
-  "5847096-1",
-  "5035108-4",
-  "5067327-8",
-  "7093802-2",
-  "15362932-3",
-  "12079811-1",
-  "22270429-4",
-  "12446117-0",
-  "5987281-8",
-  "6192072-2",
-  "5557661-0",
-  "7667053-6",
-  "22261670-0",
-  "23648832-2",
-  "8456755-8",
-  "18220492-7",
-  "21288803-6",
-  "17365980-6",
-  "23290381-3",
-  "11904686-6",
-  "8706569-3",
-  "8322149-6",
-  "11442710-1",
-  "6162327-2",
-  "24928230-8",
-  "10243332-7",
-  "11070564-6",
-  "24297970-2",
-  "6400964-8",
-  "20913568-k",
-  "5443201-1",
-  "7752392-8",
-  "18493303-9",
-  "11485288-0",
-  "19372845-6",
-  "21054457-7",
-  "10949498-4",
-  "16840980-k",
-  "5195026-7",
-  "17929197-5",
-  "8752891-k",
-  "20471383-9",
-  "16460322-9",
-  "21920623-2",
-  "22065870-8",
-  "11155740-3",
-  "19349184-7",
-  "5577266-5",
-  "23973296-8",
-  "14105982-3",
-  "19658156-1",
-  "23793560-8",
-  "12866078-k",
-  "6993626-1",
-  "13977349-7",
-  "8249128-7",
-  "8842488-3",
-  "20370254-k",
-  "13803390-2",
-  "19289124-8",
-  "19895538-8",
-  "23846991-0",
-  "14990623-1",
-  "8070983-8",
-  "8989636-3",
-  "22553103-k",
-  "14400334-9",
-  "24060143-5",
-  "5325943-k",
-  "20809475-0",
-  "14494480-1",
-  "18990161-5",
-  "12142269-7",
-  "7093422-1",
-  "9139949-0",
-  "17326645-6",
-  "7910406-k",
-  "17829211-0",
-  "7249877-1",
-  "7380795-6",
-  "16312350-9",
-  "5333775-9",
-  "10181443-2",
-  "20733265-8",
-  "17823697-0",
-  "8571702-2",
-  "8648211-8",
-  "17682628-2",
-  "19039953-2",
-  "15815081-6",
-  "22442097-8",
-  "15065647-8",
-  "24201791-9",
-  "16170042-8",
-  "14037509-8",
-  "13428821-3",
-  "17538013-2",
-  "19017137-k",
-  "22901480-3",
-  "7431222-5",
-  "16881119-5",
-  "6945595-6",
-  "20174838-0",
-  "7573998-2",
-  "18410092-4",
-  "24022995-1",
-  "15118367-0",
-  "23315155-6",
-  "23104931-2",
-  "5211837-9",
-  "10250327-9",
-  "18429265-3",
-  "18644801-4",
-  "8898294-0",
-  "9892763-8",
-  "21535899-2",
-  "11583144-5",
-  "9892110-9",
-  "9452182-3",
-  "6080151-7",
-  "10701379-2",
-  "10112817-2",
-  "13999385-3",
-  "11072680-5",
-  "18154720-0",
-  "10253839-0",
-  "16557649-7",
-  "21021996-k",
-  "16666553-1",
-  "5803672-2",
-  "7690701-3",
-  "20982973-8",
-  "17954834-8",
-  "22832593-7",
-  "21003422-6",
-  "17182934-8",
-  "12249498-5",
-  "9627106-9",
-  "18175380-3",
-  "8561110-0",
-  "15701208-8",
-  "23642731-5",
-  "10114050-4",
-  "15574115-5",
-  "9963882-6",
-  "13473720-4",
-  "24761488-5",
-  "20178142-6",
-  "23051369-4",
-  "15792813-9",
-  "22224838-8",
-  "8845848-6",
-  "8727810-7",
-  "24882140-k",
-  "12436866-9",
-  "15317437-7",
-  "11935018-2",
-  "11803850-9",
-  "13024210-3",
-  "20015550-5",
-  "20794776-8",
-  "23393151-9",
-  "16330294-2",
-  "22032692-6",
-  "24978318-8",
-  "14760421-1",
-  "7874102-3",
-  "11797855-9",
-  "6695541-9",
-  "16799752-k",
-  "16789124-1",
-  "9000164-7",
-  "21968964-0",
-  "17977639-1",
-  "20698003-6",
-  "6664096-5",
-  "5619194-1",
-  "17179951-1",
-  "18897913-0",
-  "15653140-5",
-  "10351619-6",
-  "22812553-9",
-  "6674761-1",
-  "15660495-k",
-  "10922346-8",
-  "5907626-4",
-  "21978690-5",
-  "8909142-k",
-  "6899211-7",
-  "22756731-7",
-  "23582103-6",
-  "7546575-0",
-  "22401116-4",
-  "14790546-7",
-  "13475003-0",
-  "10909892-2",
-  "21333189-2",
-  "24921161-3",
-  "19049210-9",
-  "11450577-3",
-  "10868799-1",
-  "20024416-8",
-  "11712103-8",
-  "9634463-5",
-  "5273520-3",
-  "9159668-7",
-  "18695730-k",
-  "22741035-3",
-  "9827214-3",
-  "15222119-3",
-  "20335211-5",
-  "9402875-2",
-  "10015432-3",
-  "20353121-4",
-  "19648059-5",
-  "24396173-4",
-  "19599333-5",
-  "13301087-4",
-  "17763253-8",
-  "24013975-8",
-  "24846384-8",
-  "20231127-k",
-  "22542371-7",
-  "11520384-3",
-  "11338258-9",
-  "11956726-2",
-  "16361042-6",
-  "18607117-4",
-  "24170444-0",
-  "8131124-2",
-  "16411827-4",
-  "9932667-0",
-  "5441968-6",
-  "16750216-4",
-  "16398821-6",
-  "8320172-k",
-  "12908733-1",
-  "23125331-9",
-  "23890904-k",
-  "19369544-2",
-  "15285243-6",
-  "10835303-1",
-  "19426991-9",
-  "16581806-7",
-  "10768434-4",
-  "6977965-4",
-  "19543650-9",
-  "10773954-8",
-  "12465171-9",
-  "14383088-8",
-  "21670031-7",
-  "15808180-6",
-  "9368034-0",
-  "17458170-3",
-  "21285535-9",
-  "22723984-0",
-  "16081154-4",
-  "19488415-k",
-  "10674022-4",
-  "21949838-1",
-  "13251948-k",
-  "5882890-4",
-  "11330455-3",
-  "20732135-4",
-  "14275284-0",
-  "17967260-k",
-  "22905994-7",
-  "19256303-8",
-  "13714028-4",
-  "12266597-6",
-  "17599884-5",
-  "5460064-k",
-  "23576976-k",
-  "21601120-1",
-  "24484691-2",
-  "12226645-1",
-  "24986828-0",
-  "9694814-k",
-  "23555217-5",
-  "23858176-1",
-  "12434071-3",
-  "21662594-3",
-  "15722489-1",
-  "10937211-0",
-  "9175266-2",
-  "15505271-6",
-  "6997723-5",
-  "9086723-7",
-  "13350890-2",
-  "21170617-1",
-  "20498088-8",
-  "17194945-9",
-  "11980469-8",
-  "18954881-8",
-  "21654397-1",
-  "5712014-2",
-  "18741180-7",
-  "17984939-9",
-  "21583836-6",
-  "9062064-9",
-  "10516767-9",
-  "12438007-3",
-  "20372493-4",
-  "16747110-2",
-  "24458777-1",
-  "7959295-1",
-  "24686485-3",
-  "12079605-4",
-  "23905810-8",
-  "5014350-3",
-  "21881552-9",
-  "6744408-6",
-  "9174344-2",
-  "15826413-7",
-  "7844712-5",
-  "15631411-0",
-  "12650175-7",
-  "17485739-3",
-  "20344463-k",
-  "14172109-7",
-  "18832674-9",
-  "6168506-5",
-  "6735903-8",
-  "20119478-4",
-  "16223935-k",
-  "16534781-1",
-  "8418215-k",
-  "11965787-3",
-  "16004314-8",
-  "11285626-9",
-  "19152573-6",
-  "14230963-7",
-  "11390284-1",
-  "12878709-7",
-  "17230438-9",
-  "18736463-9",
-  "20505612-2",
-  "14631024-9",
-  "22329870-2",
-  "6174120-8",
-  "20337444-5",
-  "24576028-0",
-  "6067191-5",
-  "7631180-3",
-  "21874311-0",
-  "13673271-4",
-  "19957140-0",
-  "11800611-9",
-  "22408870-1",
-  "7879059-8",
-  "14270095-6",
-  "11907094-5",
-  "18008925-k",
-  "15231191-5",
-  "11661585-1",
-  "24909625-3",
-  "11737306-1",
-  "9393708-2",
-  "24376842-k",
-  "15928069-1",
-  "19203896-0",
-  "16102659-k",
-  "9756181-8",
-  "15657602-6",
-  "21157645-6",
-  "22500788-8",
-  "8624752-6",
-  "9314878-9",
-  "23443069-6",
-  "16151663-5",
-  "12350402-k",
-  "20848942-9",
-  "16143375-6",
-  "10654907-9",
-  "18509842-7",
-  "17693303-8",
-  "15862547-4",
-  "10820161-4",
-  "7926087-8",
-  "24459628-2",
-  "15342403-9",
-  "7790173-6",
-  "6399743-9",
-  "14061363-0",
-  "7376133-6",
-  "8076821-4",
-  "10805997-4",
-  "12885101-1",
-  "18166779-6",
-  "24795261-6",
-  "6766625-9",
-  "19945250-9",
-  "6576659-0",
-  "5407683-5",
-  "7394211-k",
-  "17458388-9",
-  "17793188-8",
-  "24391722-0",
-  "13907788-1",
-  "20167101-9",
-  "8048033-4",
-  "23965256-5",
-  "13962742-3",
-  "5792769-0",
-  "8750594-4",
-  "10203205-5",
-  "20687794-4",
-  "12139546-0",
-  "16177399-9",
-  "18723685-1",
-  "5621028-8",
-  "24081755-1",
-  "22111794-8",
-  "24684414-3",
-  "13310641-3",
-  "19003303-1",
-  "23690570-5",
-  "20401920-7",
-  "22070966-3",
-  "7718268-3",
-  "9887025-3",
-  "22801754-k",
-  "12762551-4",
-  "14153421-1",
-  "12239583-9",
-  "11551062-2",
-  "8118594-8",
-  "24950119-0",
-  "24862862-6",
-  "7773054-0",
-  "8727531-0",
-  "19255032-7",
-  "21337376-5",
-  "24937200-5",
-  "20827641-7",
-  "20110452-1",
-  "13939091-1",
-  "18621080-8",
-  "24063762-6",
-  "23435101-k",
-  "23866439-k",
-  "20608067-1",
-  "19956325-4",
-  "10787774-6",
-  "17268501-3",
-  "21785932-8",
-  "5802227-6",
-  "23957215-4",
-  "14389843-1",
-  "9579055-0",
-  "21674916-2",
-  "21464804-0",
-  "17282392-0",
-  "19679448-4",
-  "5246523-0",
-  "18137400-4",
-  "15531846-5",
-  "17129273-5",
-  "6283436-6",
-  "12769403-6",
-  "22363717-5",
-  "23560851-0",
-  "15911960-2",
-  "23067001-3",
-  "19642124-6",
-  "7464722-7",
-  "7566778-7",
-  "16394777-3",
-  "5200724-0",
-  "14035606-9",
-  "12375622-3",
-  "13398374-0",
-  "8136013-8",
-  "14686964-5",
-  "24870488-8",
-  "17016899-2",
-  "5814804-0",
-  "20109216-7",
-  "14180126-0",
-  "9250163-9",
-  "17933120-9",
-  "11752281-4",
-  "16399406-2",
-  "13532938-k",
-  "17819413-5",
-  "5091285-k",
-  "18125820-9",
-  "6573445-1",
-  "17180071-4",
-  "23030022-4",
-  "24110159-2",
-  "16014513-7",
-  "6658798-3",
-  "14852474-2",
-  "11088817-1",
-  "13778856-k",
-  "5054162-2",
-  "16080449-1",
-  "8539511-4",
-  "16535032-4",
-  "22558466-4",
-  "12332240-1",
-  "14217360-3",
-  "15692171-8",
-  "24713376-3",
-  "9272028-4",
-  "11700961-0",
-  "22387716-8",
-  "19967607-5",
-  "17324703-6",
-  "12679098-8",
-  "24977770-6",
-  "11176092-6",
-  "17354989-k",
-  "12827064-7",
-  "20373932-k",
-  "10867636-1",
-  "23037802-9",
-  "6580145-0",
-  "19547625-k",
-  "13702850-6",
-  "12843608-1",
-  "19516818-0",
-  "24511466-4",
-  "20446144-9",
-  "23235535-2",
-  "15942015-9",
-  "6939510-4",
-  "15733052-7",
-  "12638986-8",
-  "20894971-3",
-  "5395128-7",
-  "14402432-k",
-  "18873593-2",
-  "20557301-1",
-  "22663921-7",
-  "7227483-0",
-  "18081261-k",
-  "10656605-4",
-  "14284787-6",
-  "11539899-7",
-  "13461314-9",
-  "10185150-8",
-  "17158274-1",
-  "10989212-2",
-  "24762640-9",
-  "21112293-5",
-  "11512087-5",
-  "13183062-9",
-  "14790884-9",
-  "24705546-0",
-  "22332626-9",
-  "6947518-3",
-  "14737200-0",
-  "5399195-5",
-  "7129253-3",
-  "13719286-1",
-  "21816501-k",
-  "10528815-8",
-  "8414006-6",
-  "22614755-1",
-  "6146502-2",
-  "5158834-7",
-  "10631946-4",
-  "17692318-0",
-  "16298021-1",
-  "17926301-7",
-  "22067857-1",
-  "20151400-2",
-  "12437390-5",
-  "5469812-7",
-  "14538627-6",
-  "24722024-0",
-  "16760516-8",
-  "17079573-3",
-  "22808668-1",
-  "20576014-8",
-  "15066942-1",
-  "23691024-5",
-  "22554416-6",
-  "9056609-1",
-  "18617529-8",
-  "20810717-8",
-  "23751980-9",
-  "14930173-9",
-  "11117579-9",
-  "10177253-5",
-  "20567312-1",
-  "16177158-9",
-  "5230573-k",
-  "13334522-1",
-  "16238596-8",
-  "8998849-7",
-  "6376833-2",
-  "8839653-7",
-  "8100307-6",
-  "7776139-k",
-  "13669759-5",
-  "5226467-7",
-  "15463190-9",
-  "5922276-7",
-  "18335896-0",
-  "22695251-9",
-  "9230247-4",
-  "16910981-8",
-  "8193883-0",
-  "16955924-4",
-  "19466336-6",
-  "22345636-7",
-  "5949117-2",
-  "12651452-2",
-  "5587519-7",
-  "17659914-6",
-  "7773062-1",
-  "15429289-6",
-  "10236804-5",
-  "20968559-0",
-  "20695849-9",
-  "6489921-k",
-  "15578736-8",
-  "13955118-4",
-  "24382081-2",
-  "16118605-8",
-  "6435314-4",
-  "21002336-4",
-  "7774920-9",
-  "5847232-8",
-  "13215039-7",
-  "21207077-7",
-  "17549510-k",
-  "24287294-0",
-  "8672908-3",
-  "16019765-k",
-  "12497070-9",
-  "6977117-3",
-  "10453646-8",
-  "21150066-2",
-  "22873331-8",
-  "23223419-9",
-  "16995286-8",
-  "5907177-7",
-  "14497955-9",
-  "17587213-2",
-  "9614451-2",
-  "9407562-9",
-  "10705336-0",
-  "14021370-5",
-  "10764600-0",
-  "21402957-k",
-  "18661311-2",
-  "10477615-9",
-  "12247829-7",
-  "10341972-7",
-  "20810260-5",
-  "18044572-2",
-  "5726987-1",
-  "23953198-9",
-  "20131665-0",
-  "7526062-8",
-  "14586965-k",
-  "24743644-8",
-  "11264135-1",
-  "5557408-1",
-  "21007825-8",
-  "23162232-2",
-  "23495328-1",
-  "12407602-1",
-  "16351822-8",
-  "24396164-5",
-  "19116265-k",
-  "5184704-0",
-  "11767714-1",
-  "18011534-k",
-  "9543406-1",
-  "5936624-6",
-  "23336939-k",
-  "20264731-6",
-  "23974065-0",
-  "18067979-0",
-  "19724371-6",
-  "16532260-6",
-  "10243853-1",
-  "6152720-6",
-  "24999394-8",
-  "15953821-4",
-  "21928810-7",
-  "10192898-5",
-  "13808613-5",
-  "19942242-1",
-  "17006818-1",
-  "17929612-8",
-  "18277005-1",
-  "23784454-8",
-  "14131780-6",
-  "8030950-3",
-  "11562479-2",
-  "6580862-5",
-  "11635387-3",
-  "13219526-9",
-  "8897460-3",
-  "21653341-0",
-  "12205588-4",
-  "18002503-0",
-  "15611922-9",
-  "10581106-3",
-  "20677018-k",
-  "12714779-5",
-  "6639687-8",
-  "18436575-8",
-  "8926064-7",
-  "9850186-k",
-  "23794684-7",
-  "22629302-7",
-  "6297941-0",
-  "21282235-3",
-  "24008279-9",
-  "15740494-6",
-  "12683730-5",
-  "18929807-2",
-  "7263860-3",
-  "18692877-6",
-  "21780964-9",
-  "17842986-8",
-  "9385234-6",
-  "7769334-3",
-  "22479379-0",
-  "10782606-8",
-  "21136809-8",
-  "23413623-2",
-  "5927930-0",
-  "9360559-4",
-  "13816842-5",
-  "6665200-9",
-  "21142289-0",
-  "20351425-5",
-  "21108069-8",
-  "11201497-7",
-  "13610432-2",
-  "23825881-2",
-  "16766815-1",
-  "6831285-k",
-  "6040589-1",
-  "5007429-3",
-  "16278514-1",
-  "21123110-6",
-  "18424587-6",
-  "20435225-9",
-  "6405259-4",
-  "11047369-9",
-  "19000771-5",
-  "5229521-1",
-  "5714421-1",
-  "11738597-3",
-  "14404586-6",
-  "13966602-k",
-  "13766435-6",
-  "7791796-9",
-  "6113699-1",
-  "6590117-k",
-  "21039974-7",
-  "14232713-9",
-  "17954870-4",
-  "21964448-5",
-  "17984235-1",
-  "11479383-3",
-  "8902077-8",
-  "9356714-5",
-  "15292789-4",
-  "22718767-0",
-  "18714907-k",
-  "8483215-4",
-  "22821256-3",
-  "11138114-3",
-  "10957584-4",
-  "13596636-3",
-  "6986578-k",
-  "24674975-2",
-  "6277265-4",
-  "6582065-k",
-  "12128688-2",
-  "16464746-3",
-  "9511285-4",
-  "13931512-k",
-  "21362525-k",
-  "16158090-2",
-  "8101822-7",
-  "20679241-8",
-  "21594065-9",
-  "14845985-1",
-  "9971470-0",
-  "20052577-9",
-  "9964153-3",
-  "5880411-8",
-  "7209947-8",
-  "19271151-7",
-  "17227144-8",
-  "18431799-0",
-  "14864259-1",
-  "10457705-9",
-  "23911321-4",
-  "7504877-7",
-  "5168104-5",
-  "20582099-k",
-  "7072909-1",
-  "20269316-4",
-  "15361989-1",
-  "9877514-5",
-  "8005797-0",
-  "13775769-9",
-  "20510029-6",
-  "15432258-2",
-  "11539843-1",
-  "23497742-3",
-  "9287659-4",
-  "23200059-7",
-  "5463788-8",
-  "18253792-6",
-  "11080842-9",
-  "22566469-2",
-  "18986540-6",
-  "22814059-7",
-  "5798920-3",
-  "17828119-4",
-  "15412236-2",
-  "18161174-k",
-  "17190336-k",
-  "10837795-k",
-  "17468529-0",
-  "20162411-8",
-  "14595890-3",
-  "14725530-6",
-  "19986631-1",
-  "12680613-2",
-  "18238734-7",
-  "19080487-9",
-  "16564907-9",
-  "18661374-0",
-  "14297999-3",
-  "16674250-1",
-  "18945785-5",
-  "10833129-1",
-  "21302066-8",
-  "20959872-8",
-  "22114002-8",
-  "6482754-5",
-  "23632999-2",
-  "19898582-1",
-  "19116838-0",
-  "8956173-6",
-  "18545573-4",
-  "18834854-8",
-  "21969275-7",
-  "9590548-k",
-  "11759793-8",
-  "7818146-k",
-  "13629558-6",
-  "9710139-6",
-  "6008657-5",
-  "24401588-3",
-  "8189758-1",
-  "13527394-5",
-  "24210023-9",
-  "9789650-k",
-  "17990442-k",
-  "22629892-4",
-  "14779802-4",
-  "16513977-1",
-  "21349488-0",
-  "21195651-8",
-  "12483984-k",
-  "21101242-0",
-  "13418622-4",
-  "18120379-k",
-  "17646772-k",
-  "11824959-3",
-  "14009477-3",
-  "5675607-8",
-  "23466937-0",
-  "23051617-0",
-  "14902848-k",
-  "20522715-6",
-  "9784178-0",
-  "8195331-7",
-  "10726503-1",
-  "18294377-0",
-  "9175748-6",
-  "20742641-5",
-  "22124081-2",
-  "10171703-8",
-  "14117994-2",
-  "15280670-1",
-  "7501371-k",
-  "19982736-7",
-  "16152101-9",
-  "8275028-2",
-  "17655585-8",
-  "20278092-k",
-  "10305343-9",
-  "14137580-6",
-  "7400201-3",
-  "13448813-1",
-  "23015062-1",
-  "12930899-0",
-  "9199716-9",
-  "8825105-9",
-  "14671487-0",
-  "17614209-k",
-  "5340421-9",
-  "7202889-9",
-  "5638497-9",
-  "10311304-0",
-  "22045053-8",
-  "6280414-9",
-  "18087154-3",
-  "16667695-9",
-  "16344532-8",
-  "21374704-5",
-  "21751465-7",
-  "12105409-4",
-  "23234185-8",
-  "14503066-8",
-  "15957296-k",
-  "21316235-7",
-  "18191781-4",
-  "18490253-2",
-  "17783529-3",
-  "22636370-k",
-  "18483910-5",
-  "16798529-7",
-  "19744135-6",
-  "14087294-6",
-  "13683695-1",
-  "9925053-4",
-  "23051421-6",
-  "16701973-0",
-  "21388835-8",
-  "19941099-7",
-  "20116884-8",
-  "22456473-2",
-  "23443463-2",
-  "17894193-3",
-  "19770689-9",
-  "6673341-6",
-  "24560154-9",
-  "16998743-2",
-  "6765517-6",
-  "12518551-7",
-  "16014714-8",
-  "8233265-0",
-  "19432550-9",
-  "22445117-2",
-  "23911249-8",
-  "23992238-4",
-  "18371166-0",
-  "10398925-6",
-  "5571413-4",
-  "13509889-2",
-  "22031121-k",
-  "10518374-7",
-  "15392695-6",
-  "24198621-7",
-  "12108233-0",
-  "19758134-4",
-  "20426689-1",
-  "17644584-k",
-  "22420666-6",
-  "17192871-0",
-  "12522433-4",
-  "12747919-4",
-  "22254770-9",
-  "22534264-4",
-  "12608334-3",
-  "17912708-3",
-  "5013148-3",
-  "18614068-0",
-  "16938396-0",
-  "20995073-1",
-  "16260452-k",
-  "8121852-8",
-  "22984255-2",
-  "22586410-1",
-  "12886046-0",
-  "17533393-2",
-  "23348546-2",
-  "10454409-6",
-  "8834609-2",
-  "14292471-4",
-  "22381837-4",
-  "9776812-9",
-  "6902454-8",
-  "9211974-2",
-  "6818834-2",
-  "7006167-8",
-  "10128370-4",
-  "18349557-7",
-  "11879672-1",
-  "6659674-5",
-  "18189165-3",
-  "8211755-5",
-  "7171551-5",
-  "7628708-2",
-  "18643583-4",
-  "18849187-1",
-  "19926111-8",
-  "11656717-2",
-  "10412902-1",
-  "14676031-7",
-  "13081520-0",
-  "20770478-4",
-  "22570866-5",
-  "19509343-1",
-  "22651166-0",
-  "5476430-8",
-  "22596123-9",
-  "19539767-8",
-  "18004837-5",
-  "6346514-3",
-  "10566757-4",
-  "18191535-8",
-  "11363873-7",
-  "11585564-6",
-  "7709072-k",
-  "9620870-7",
-  "13973068-2",
-  "23187522-0",
-  "6770157-7",
-  "20859058-8",
-  "12724640-8",
-  "10083904-0",
-  "21805818-3",
-  "21089397-0",
-  "8826507-6",
-  "12438325-0",
-  "22400665-9",
-  "16250506-8",
-  "13349502-9",
-  "16932724-6",
-  "23524618-k",
-  "23196138-0",
-  "17479111-2",
-  "17456722-0",
-  "5332909-8",
-  "20349444-0",
-  "7951288-5",
-  "22765670-0",
-  "24878212-9",
-  "6713317-k",
-  "11515312-9",
-  "15267031-1",
-  "18128313-0",
-  "7091158-2",
-  "5552373-8",
-  "9369522-4",
-  "23327484-4",
-  "16091224-3",
-  "11347170-0",
-  "12433211-7",
-  "23721149-9",
-  "7378060-8",
-  "5287986-8",
-  "13846596-9",
-  "19529757-6",
-  "7070651-2",
-  "10891340-1",
-  "23509201-8",
-  "22689980-4",
-  "11688431-3",
-  "23848520-7",
-  "13340182-2",
-  "11789712-5",
-  "22992456-7",
-  "17354122-8",
-  "17170427-8",
-  "13081683-5",
-  "19463406-4",
-  "12992636-8",
-  "23954046-5",
-  "6539704-8",
-  "11155819-1",
-  "21590289-7",
-  "11902394-7",
-  "10642089-0",
-  "9978741-4",
-  "14873133-0",
-  "14699135-1",
-  "10643001-2",
-  "13401774-0",
-  "22210953-1",
-  "21334573-7",
-  "18714494-9",
-  "18752408-3",
-  "7982550-6",
-  "7975048-4",
-  "6435487-6",
-  "16201994-5",
-  "7412967-6",
-  "16169732-k",
-  "13879192-0",
-  "13373810-k",
-  "12561232-6",
-  "19406921-9",
-  "5399472-5",
-  "8895842-k",
-  "11091460-1",
-  "16763291-2",
-  "14175903-5",
-  "16233328-3",
-  "6905389-0",
-  "12057852-9",
-  "9205300-8",
-  "23733896-0",
-  "7092845-0",
-  "5595870-k",
-  "17682349-6",
-  "21280733-8",
-  "8748640-0",
-  "9643638-6",
-  "6009958-8",
-  "13599115-5",
-  "23887652-4",
-  "12073371-0",
-  "7628342-7",
-  "20117769-3",
-  "20332096-5",
-  "7893544-8",
-  "24608119-0",
-  "16526788-5",
-  "14394508-1",
-  "21313522-8",
-  "19796784-6",
-  "8846553-9",
-  "15196822-8",
-  "13511855-9",
-  "17551447-3",
-  "19977137-k",
-  "9553886-k",
-  "20995570-9",
-  "9485364-8",
-  "12282049-1",
-  "17752451-4",
-  "11188037-9",
-  "8027577-3",
-  "7970963-8",
-  "10421003-1",
-  "11955162-5",
-  "20758388-k",
-  "21836878-6",
-  "6463001-6",
-  "22949181-4",
-  "12921888-6",
-  "11357088-1",
-  "20697663-2",
-  "17888868-4",
-  "15343294-5",
-  "12806433-8",
-  "15388883-3",
-  "14735798-2",
-  "23815515-0",
-  "19425371-0",
-  "9908448-0",
-  "20898209-5",
-  "12808837-7",
-  "22527817-2",
-  "15633431-6",
-  "7998374-8",
-  "16159573-k",
-  "19336658-9",
-  "8853142-6",
-  "20238467-6",
-  "15954858-9",
-  "8666237-k",
-  "16306365-4",
-  "13221202-3",
-  "12743382-8",
-  "23722095-1",
-  "8581230-0",
-  "9944582-3",
-  "14551896-2",
-  "13876107-k",
-  "16325012-8",
-  "8944550-7",
-  "8100430-7",
-  "21743636-2",
-  "16552261-3",
-  "24396207-2",
-  "9775043-2",
-  "8733833-9",
-  "10403775-5",
-  "14262088-k",
-  "24257194-0",
-  "14867527-9",
-  "13529992-8",
-  "16870617-0",
-  "18228622-2",
-  "23523528-5",
-  "14896894-2",
-  "5741333-6",
-  "10593248-0",
-  "21654951-1",
-  "17949167-2",
-  "6073190-k",
-  "23806215-2",
-  "16297675-3",
-  "10679219-4",
-  "23976493-2",
-  "22572745-7",
-  "9186421-5",
-  "15760072-9",
-  "16403239-6",
-  "14593354-4",
-  "23303797-4",
-  "24858848-9",
-  "20025310-8",
-  "23144576-5",
-  "21458671-1",
-  "23199451-3",
-  "16369573-1",
-  "18825929-4",
-  "20556309-1",
-  "19175593-6",
-  "6259056-4",
-  "6890184-7",
-  "15872108-2",
-  "19262858-k",
-  "14586554-9",
-  "12201897-0",
-  "12773803-3",
-  "11729871-k",
-  "21493747-6",
-  "5948602-0",
-  "19225670-4",
-  "5237819-2",
-  "14469094-k",
-  "11390193-4",
-  "21405804-9",
-  "10597212-1",
-  "9800734-2",
-  "17606864-7",
-  "18909541-4",
-  "11386302-1",
-  "15850416-2",
-  "16527174-2",
-  "20864353-3",
-  "12250500-6",
-  "16225093-0",
-  "17552129-1",
-  "6366885-0",
-  "7406763-8",
-  "5262632-3",
-  "14178480-3",
-  "10450469-8",
-  "22013056-8",
-  "13613818-9",
-  "7163512-0",
-  "7515958-7",
-  "15960540-k",
-  "14963879-2",
-  "7360937-2",
-  "5812784-1",
-  "18564929-6",
-  "24568087-2",
-  "5084148-0",
-  "18973230-9",
-  "22797373-0",
-  "23177013-5",
-  "23183591-1",
-  "8500183-3",
-  "12365326-2",
-  "15865569-1",
-  "14775740-9",
-  "22128840-8",
-  "7993432-1",
-  "23602581-0",
-  "11864201-5",
-  "24556988-2",
-  "15719309-0",
-  "24713558-8",
-  "5777925-k",
-  "21759456-1",
-  "6414525-8",
-  "21999035-9",
-  "12997042-1",
-  "12088694-0",
-  "7554691-2",
-  "6633586-0",
-  "14898935-4",
-  "16606755-3",
-  "12668933-0",
-  "6931779-0",
-  "15495465-1",
-  "22517904-2",
-  "12694111-0",
-  "13661933-0",
-  "6666610-7",
-  "15341899-3",
-  "19723380-k",
-  "19176566-4",
-  "21496400-7",
-  "20387110-4",
-  "11750198-1",
-  "24811488-6",
-  "11082940-k",
-  "17122169-2",
-  "9488971-5",
-  "17582858-3",
-  "6407646-9",
-  "17461124-6",
-  "12306083-0",
-  "9364158-2",
-  "14997935-2",
-  "22956473-0",
-  "12905157-4",
-  "22242535-2",
-  "13746669-4",
-  "13509483-8",
-  "10124386-9",
-  "5613575-8",
-  "9856521-3",
-  "15699321-2",
-  "23364540-0",
-  "11684406-0",
-  "18360992-0",
-  "10430161-4",
-  "5128639-1",
-  "20531253-6",
-  "14470808-3",
-  "7018973-9",
-  "12454167-0",
-  "14557384-k",
-  "16272799-0",
-  "10370249-6",
-  "17944442-9",
-  "6243660-3",
-  "7687913-3",
-  "18755809-3",
-  "7780225-8",
-  "13400276-k",
-  "13456869-0",
-  "6579917-0",
-  "5735673-1",
-  "22978795-0",
-  "18172498-6",
-  "6580909-5",
-  "13860204-4",
-  "21893603-2",
-  "24492112-4",
-  "9923086-k",
-  "22980173-2",
-  "20357220-4",
-  "18204848-8",
-  "6865233-2",
-  "23403910-5",
-  "20138567-9",
-  "12951599-6",
-  "6632098-7",
-  "6513909-k",
-  "9788180-4",
-  "24544127-4",
-  "18097919-0",
-  "7745558-2",
-  "19841514-6",
-  "22489262-4",
-  "15130689-6",
-  "17545917-0",
-  "7106460-3",
-  "24338806-6",
-  "7444844-5",
-  "17859920-8",
-  "13842751-k",
-  "21503153-5",
-  "17532902-1",
-  "17403132-0",
-  "24798481-k",
-  "16405547-7",
-  "8586109-3",
-  "10155940-8",
-  "22627877-k",
-  "6889552-9",
-  "21987291-7",
-  "5940570-5",
-  "17607993-2",
-  "15875926-8",
-  "16913738-2",
-  "11718996-1",
-  "19697536-5",
-  "11072580-9",
-  "24966409-k",
-  "24767867-0",
-  "14806589-6",
-  "9235126-2",
-  "8781916-7",
-  "23704276-k",
-  "8557746-8",
-  "19208790-2",
-  "8652338-8",
-  "22355927-1",
-  "17774235-k",
-  "20589399-7",
-  "10171357-1",
-  "20161269-1",
-  "22401918-1",
-  "12087534-5",
-  "17661231-2",
-  "11055385-4",
-  "12332753-5",
-  "24285841-7",
-  "23654080-4",
-  "22123916-4",
-  "24678044-7",
-  "6334539-3",
-  "23644958-0",
-  "16484948-1",
-  "11160982-9",
-  "20803473-1",
-  "15939949-4",
-  "8934845-5",
-  "13277883-3",
-  "15079744-6",
-  "22743929-7",
-  "16832309-3",
-  "5426177-2",
-  "14117157-7",
-  "12137809-4",
-  "20388222-k",
-  "11578724-1",
-  "13374100-3",
-  "9303784-7",
-  "22435592-0",
-  "11323425-3",
-  "8937647-5",
-  "7959271-4",
-  "13090895-0",
-  "13726089-1",
-  "20139896-7",
-  "23986388-4",
-  "20556314-8",
-  "6207459-0",
-  "20421200-7",
-  "24133924-6",
-  "20157130-8",
-  "17214390-3",
-  "8684255-6",
-  "11496708-4",
-  "23418571-3",
-  "18814497-7",
-  "16560645-0",
-  "12392770-2",
-  "24195223-1",
-  "21480495-6",
-  "22182255-2",
-  "23299141-0",
-  "5062485-4",
-  "6632941-0",
-  "22427084-4",
-  "11566123-k",
-  "17013412-5",
-  "10100955-6",
-  "7016851-0",
-  "7988921-0",
-  "14018229-k",
-  "6387683-6",
-  "9877642-7",
-  "20466585-0",
-  "22282794-9",
-  "14152320-1",
-  "19930575-1",
-  "9856465-9",
-  "16831074-9",
-  "6713061-8",
-  "12188086-5",
-  "15629644-9",
-  "21862054-k",
-  "14135485-k",
-  "24359506-1",
-  "11462655-4",
-  "7202491-5",
-  "8368770-3",
-  "24896960-1",
-  "9633458-3",
-  "22676132-2",
-  "22052739-5",
-  "21334455-2",
-  "15265259-3",
-  "19813838-k",
-  "14069579-3",
-  "22894466-1",
-  "17925718-1",
-  "18440466-4",
-  "20264701-4",
-  "24487509-2",
-  "16364814-8",
-  "16546731-0",
-  "17116913-5",
-  "21525418-6",
-  "20687517-8",
-  "14300328-0",
-  "12750928-k",
-  "18509268-2",
-  "15248702-9",
-  "17603172-7",
-  "15156325-2",
-  "9368444-3",
-  "18928356-3",
-  "19270752-8",
-  "15312067-6",
-  "5276053-4",
-  "11946251-7",
-  "5435317-0",
-  "19705674-6",
-  "13317089-8",
-  "19117764-9",
-  "16816078-k",
-  "13083723-9",
-  "21493485-k",
-  "24490073-9",
-  "23032560-k",
-  "20030200-1",
-  "19168178-9",
-  "10415042-k",
-  "5546069-8",
-  "23469288-7",
-  "9739928-k",
-  "8946469-2",
-  "19582881-4",
-  "12099165-5",
-  "15736846-k",
-  "10128693-2",
-  "15234292-6",
-  "16473747-0",
-  "10938850-5",
-  "8712633-1",
-  "21619288-5",
-  "10037090-5",
-  "20109430-5",
-  "14216072-2",
-  "13032670-6",
-  "8612667-2",
-  "19088602-6",
-  "6429809-7",
-  "19131489-1",
-  "10278725-0",
-  "6728773-8",
-  "24007508-3",
-  "24531513-9",
-  "23424725-5",
-  "24858165-4",
-  "16389381-9",
-  "23314749-4",
-  "12067290-8",
-  "8875726-2",
-  "9977456-8",
-  "8309398-6",
-  "11552735-5",
-  "15254657-2",
-  "19466232-7",
-  "15318624-3",
-  "22327308-4",
-  "23838293-9",
-  "16959788-k",
-  "19771945-1",
-  "21134290-0",
-  "7490083-6",
-  "20252791-4",
-  "12456770-k",
-  "5850210-3",
-  "19929395-8",
-  "13594386-k",
-  "18468052-1",
-  "22151156-5",
-  "13798850-k",
-  "10533330-7",
-  "15279683-8",
-  "9173007-3",
-  "23470682-9",
-  "13393707-2",
-  "7157792-9",
-  "12523246-9",
-  "11621900-k",
-  "16985954-k",
-  "5029618-0",
-  "10816116-7",
-  "8291522-2",
-  "24197790-0",
-  "14277558-1",
-  "23262883-9",
-  "8331622-5",
-  "22726534-5",
-  "6388993-8",
-  "5193584-5",
-  "24899676-5",
-  "6178329-6",
-  "22213710-1",
-  "6998341-3",
-  "11491508-4",
-  "9844650-8",
-  "12469028-5",
-  "15551831-6",
-  "8238835-4",
-  "5097696-3",
-  "18919529-k",
-  "24078229-4",
-  "18654020-4",
-  "13206654-k",
-  "6693635-k",
-  "22868797-9",
-  "9166390-2",
-  "21831696-4",
-  "16240946-8",
-  "24932312-8",
-  "5441562-1",
-  "19760404-2",
-  "15274737-3",
-  "10703653-9",
-  "9133008-3",
-  "5160753-8",
-  "14927004-3",
-  "16180200-k",
-  "22519958-2",
-  "7643069-1",
-  "8290942-7",
-  "11803449-k",
-  "9469894-4",
-  "17596318-9",
-  "8459410-5",
-  "7310032-1",
-  "13134902-5",
-  "11873970-1",
-  "22625398-k",
-  "13808226-1",
-  "10652399-1",
-  "24644327-0",
-  "15741914-5",
-  "14082382-1",
-  "9389297-6",
-  "9165789-9",
-  "21413157-9",
-  "10230068-8",
-  "21067463-2",
-  "14455962-2",
-  "11409082-4",
-  "15717894-6",
-  "24820929-1",
-  "7125271-k",
-  "15841576-3",
-  "21670666-8",
-  "20101437-9",
-  "24137082-8",
-  "20083995-1",
-  "11025168-8",
-  "6032702-5",
-  "14424778-7",
-  "10637236-5",
-  "5037706-7",
-  "8448132-7",
-  "18894502-3",
-  "24646924-5",
-  "19290302-5",
-  "18566642-5",
-  "12696594-k",
-  "10802847-5",
-  "16350331-k",
-  "23964041-9",
-  "15985770-0",
-  "7705253-4",
-  "7746962-1",
-  "6808577-2",
-  "16920203-6",
-  "20090245-9",
-  "8231026-6",
-  "23780534-8",
-  "16762956-3",
-  "13324266-k",
-  "6419198-5",
-  "11856502-9",
-  "23180355-6",
-  "17206757-3",
-  "21416537-6",
-  "14664689-1",
-  "9200148-2",
-  "8770512-9",
-  "22389502-6",
-  "17137409-k",
-  "24454321-9",
-  "15125451-9",
-  "19988548-0",
-  "20121846-2",
-  "14529185-2",
-  "20749739-8",
-  "20152076-2",
-  "5574253-7",
-  "11424500-3",
-  "21880683-k",
-  "16329782-5",
-  "10750606-3",
-  "12359456-8",
-  "20153761-4",
-  "22610880-7",
-  "14073246-k",
-  "8657126-9",
-  "20424818-4",
-  "11899573-2",
-  "21921859-1",
-  "6945204-3",
-  "15237513-1",
-  "23167480-2",
-  "7334248-1",
-  "15659198-k",
-  "5828151-4",
-  "17989297-9",
-  "17299204-8",
-  "22339773-5",
-  "18458147-7",
-  "18074088-0",
-  "22823605-5",
-  "17890227-k",
-  "20928806-0",
-  "23843085-2",
-  "19916254-3",
-  "10813434-8",
-  "15098549-8",
-  "7912984-4",
-  "22538932-2",
-  "12986659-4",
-  "8895766-0",
-  "18003893-0",
-  "22138267-6",
-  "23599535-2",
-  "9572735-2",
-  "9134824-1",
-  "17077805-7",
-  "15907019-0",
-  "14951886-k",
-  "10726606-2",
-  "13520666-0",
-  "11482452-6",
-  "8740268-1",
-  "16251643-4",
-  "8031007-2",
-  "15683146-8",
-  "21198133-4",
-  "20326186-1",
-  "24957337-k",
-  "21424012-2",
-  "23191714-4",
-  "19825643-9",
-  "20862376-1",
-  "21610631-8",
-  "20478830-8",
-  "18543596-2",
-  "16200490-5",
-  "5157051-0",
-  "11453852-3",
-  "13483027-1",
-  "13588365-4",
-  "12912193-9",
-  "17618247-4",
-  "8775910-5",
-  "19886520-6",
-  "7818832-4",
-  "21087447-k",
-  "20732880-4",
-  "17033562-7",
-  "10833864-4",
-  "14148130-4",
-  "15012221-k",
-  "12595419-7",
-  "22779334-1",
-  "9071671-9",
-  "21968663-3",
-  "13673881-k",
-  "17503560-5",
-  "16112672-1",
-  "7234285-2",
-  "7899608-0",
-  "16730723-k",
-  "24083298-4",
-  "6214737-7",
-  "21712568-5",
-  "8551483-0",
-  "23879593-1",
-  "13751313-7",
-  "8453182-0",
-  "9252199-0",
-  "10220488-3",
-  "19473662-2",
-  "13753601-3",
-  "17542351-6",
-  "13897001-9",
-  "10913564-k",
-  "11168595-9",
-  "20996117-2",
-  "10060264-4",
-  "5908634-0",
-  "12763892-6",
-  "17791733-8",
-  "17915171-5",
-  "9479447-1",
-  "14776494-4",
-  "20497981-2",
-  "11069081-9",
-  "21357220-2",
-  "12733934-1",
-  "17885280-9",
-  "7541852-3",
-  "17188416-0",
-  "22796353-0",
-  "15947773-8",
-  "17478702-6",
-  "24734828-k",
-  "14530385-0",
-  "16377852-1",
-  "11648182-0",
-  "6450631-5",
-  "8457094-k",
-  "20808413-5",
-  "24229536-6",
-  "15915765-2",
-  "15135364-9",
-  "16274413-5",
-  "24416080-8",
-  "7185318-7",
-  "6212869-0",
-  "8212314-8",
-  "22316472-2",
-  "18880249-4",
-  "23819691-4",
-  "16641995-6",
-  "13378289-3",
-  "5711079-1",
-  "7851604-6",
-  "18226861-5",
-  "9217705-k",
-  "13833256-k",
-  "6648086-0",
-  "6036995-k",
-  "7201436-7",
-  "13646566-k",
-  "12059150-9",
-  "11782113-7",
-  "22103545-3",
-  "9267012-0",
-  "21040955-6",
-  "17207280-1",
-  "14669443-8",
-  "22810926-6",
-  "23128213-0",
-  "11085406-4",
-  "24371641-1",
-  "18084452-k",
-  "16737527-8",
-  "21250109-3",
-  "8547813-3",
-  "14983665-9",
-  "19030041-2",
-  "23184383-3",
-  "15521066-4",
-  "17641305-0",
-  "8928690-5",
-  "5509209-5",
-  "9387491-9",
-  "15268211-5",
-  "9932209-8",
-  "11900480-2",
-  "20337285-k",
-  "18050929-1",
-  "9420513-1",
-  "7998545-7",
-  "17332760-9",
-  "19344683-3",
-  "19550868-2",
-  "7851468-k",
-  "11689386-k",
-  "17219117-7",
-  "13970885-7",
-  "12367403-0",
-  "10915731-7",
-  "23074026-7",
-  "8323113-0",
-  "5006613-4",
-  "17677881-4",
-  "19892884-4",
-  "17004541-6",
-  "6089263-6",
-  "22678978-2",
-  "24210942-2",
-  "22399773-2",
-  "24143562-8",
-  "16193582-4",
-  "6966878-k",
-  "16667895-1",
-  "7126888-8",
-  "21870533-2",
-  "20227370-k",
-  "7290514-8",
-  "20204516-2",
-  "22998775-5",
-  "22611305-3",
-  "11253610-8",
-  "22090305-2",
-  "19007972-4",
-  "19031348-4",
-  "6953633-6",
-  "23945101-2",
-  "11395246-6",
-  "22616399-9",
-  "21568123-8",
-  "19846431-7",
-  "13539901-9",
-  "20182338-2",
-  "19080849-1",
-  "22149648-5",
-  "8893557-8",
-  "5522175-8",
-  "8790672-8",
-  "9236476-3",
-  "14672691-7",
-  "18431492-4",
-  "7512200-4",
-  "11547887-7",
-  "22331001-k",
-  "19421721-8",
-  "16139376-2",
-  "12815929-0",
-  "17784208-7",
-  "17455734-9",
-  "17440344-9",
-  "16565129-4",
-  "20029358-4",
-  "9039355-3",
-  "20070050-3",
-  "19557689-0",
-  "10094205-4",
-  "24606690-6",
-  "6973242-9",
-  "18427158-3",
-  "11218111-3",
-  "11240641-7",
-  "6073620-0",
-  "17148823-0",
-  "13344171-9",
-  "22830119-1",
-  "22771913-3",
-  "24669335-8",
-  "7555688-8",
-  "18889512-3",
-  "22178567-3",
-  "9499665-1",
-  "24652203-0",
-  "8283545-8",
-  "10758945-7",
-  "18248546-2",
-  "7640967-6",
-  "23004500-3",
-  "13051795-1",
-  "18305388-4",
-  "15654362-4",
-  "19361104-4",
-  "7603944-5",
-  "23164805-4",
-  "12423197-3",
-  "15179413-0",
-  "22100623-2",
-  "13588937-7",
-  "22091414-3",
-  "14203591-k",
-  "24461244-k",
-  "12130642-5",
-  "11709678-5",
-  "15785643-k",
-  "18348130-4",
-  "6253355-2",
-  "10021105-k",
-  "14453414-k",
-  "5192624-2",
-  "6145102-1",
-  "6178441-1",
-  "19492933-1",
-  "9417690-5",
-  "9182333-0",
-  "19413626-9",
-  "7920224-k",
-  "18691421-k",
-  "8078186-5",
-  "21968547-5",
-  "24131224-0",
-  "24009962-4",
-  "14119617-0",
-  "18007202-0",
-  "20980616-9",
-  "10493751-9",
-  "22115024-4",
-  "12106430-8",
-  "21288062-0",
-  "20638502-2",
-  "18889155-1",
-  "13542535-4",
-  "11716560-4",
-  "23702349-8",
-  "24081515-k",
-  "10026351-3",
-  "14203681-9",
-  "14608198-3",
-  "9694887-5",
-  "18865402-9",
-  "16357355-5",
-  "21092365-9",
-  "6668561-6",
-  "20085054-8",
-  "7220327-5",
-  "7413136-0",
-  "9423485-9",
-  "9963062-0",
-  "9718128-4",
-  "16353585-8",
-  "17487567-7",
-  "24815342-3",
-  "22959064-2",
-  "12244733-2",
-  "23805807-4",
-  "18619297-4",
-  "21755215-k",
-  "5177187-7",
-  "17474812-8",
-  "22696675-7",
-  "12023218-5",
-  "15705319-1",
-  "21949742-3",
-  "10351076-7",
-  "19957996-7",
-  "12798683-5",
-  "7613435-9",
-  "24285490-k",
-  "8269658-k",
-  "16307271-8",
-  "15024605-9",
-  "11994432-5",
-  "5924596-1",
-  "10499206-4",
-  "8771549-3",
-  "9999622-6",
-  "24543085-k",
-  "18703273-3",
-  "15539748-9",
-  "16919572-2",
-  "16768462-9",
-  "8628002-7",
-  "14406623-5",
-  "17260828-0",
-  "11387913-0",
-  "6647079-2",
-  "19335110-7",
-  "5665223-k",
-  "16307495-8",
-  "23862890-3",
-  "11045728-6",
-  "12948444-6",
-  "19571897-0",
-  "9480083-8",
-  "12942705-1",
-  "5284553-k",
-  "7542527-9",
-  "20956333-9",
-  "5324423-8",
-  "24179526-8",
-  "24197464-2",
-  "8506720-6",
-  "24827235-k",
-  "19665447-k",
-  "17217047-1",
-  "24181146-8",
-  "6986495-3",
-  "15137497-2",
-  "5447928-k",
-  "20503765-9",
-  "10966567-3",
-  "8116183-6",
-  "13890357-5",
-  "15870361-0",
-  "9978809-7",
-  "9583327-6",
-  "17648489-6",
-  "5063070-6",
-  "22520731-3",
-  "20342918-5",
-  "8098757-9",
-  "22193599-3",
-  "5147068-0",
-  "13624596-1",
-  "15754165-k",
-  "22762671-2",
-  "11816578-0",
-  "14853973-1",
-  "24708228-k",
-  "7782356-5",
-  "10030943-2",
-  "21075689-2",
-  "19230705-8",
-  "9461053-2",
-  "18343375-k",
-  "8382160-4",
-  "11408951-6",
-  "19350326-8",
-  "16744023-1",
-  "9629097-7",
-  "24148937-k",
-  "21050613-6",
-  "15033256-7",
-  "8787140-1",
-  "17732604-6",
-  "23092586-0",
-  "18644812-k",
-  "7473217-8",
-  "15478750-k",
-  "10025432-8",
-  "13064486-4",
-  "14909426-1",
-  "21396539-5",
-  "6615314-2",
-  "9803793-4",
-  "7557411-8",
-  "9681933-1",
-  "10641325-8",
-  "15327382-0",
-  "20792329-k",
-  "12838753-6",
-  "16905966-7",
-  "11459319-2",
-  "17503766-7",
-  "5834494-k",
-  "22836977-2",
-  "9507300-k",
-  "13260628-5",
-  "8645393-2",
-  "7469138-2",
-  "19679338-0",
-  "13381385-3",
-  "11087009-4",
-  "10003792-0",
-  "15167347-3",
-  "16866815-5",
-  "13487541-0",
-  "12753681-3",
-  "24797101-7",
-  "17557848-k",
-  "5437501-8",
-  "20861085-6",
-  "12060801-0",
-  "5215119-8",
-  "22809533-8",
-  "6099813-2",
-  "8440501-9",
-  "22443087-6",
-  "18836220-6",
-  "13123641-7",
-  "19727393-3",
-  "22351606-8",
-  "23209714-0",
-  "21272030-5",
-  "12554489-4",
-  "9447585-6",
-  "9590808-k",
-  "21594264-3",
-  "15167845-9",
-  "7909607-5",
-  "6960356-4",
-  "20663478-2",
-  "17246376-2",
-  "6926237-6",
-  "15492759-k",
-  "10370390-5",
-  "17445045-5",
-  "6636543-3",
-  "5059248-0",
-  "10974785-8",
-  "19638023-k",
-  "7663469-6",
-  "9234740-0",
-  "11598588-4",
-  "19387664-1",
-  "18515559-5",
-  "23586488-6",
-  "13991511-9",
-  "24134971-3",
-  "14352558-9",
-  "11961720-0",
-  "5054629-2",
-  "9695669-k",
-  "22471306-1",
-  "16685840-2",
-  "24125349-k",
-  "10796192-5",
-  "5554597-9",
-  "13864463-4",
-  "9728418-0",
-  "23515047-6",
-  "12725786-8",
-  "14702215-8",
-  "11962000-7",
-  "8592889-9",
-  "6122118-2",
-  "24300828-k",
-  "12179674-0",
-  "17526949-5",
-  "9074159-4",
-  "10149955-3",
-  "21726247-k",
-  "9605776-8",
-  "7647550-4",
-  "16346785-2",
-  "24372285-3",
-  "24892546-9",
-  "19375984-k",
-  "22109832-3",
-  "15798914-6",
-  "16118328-8",
-  "9383026-1",
-  "12311237-7",
-  "23503255-4",
-  "18046251-1",
-  "7697462-4",
-  "13124597-1",
-  "20247346-6",
-  "6115226-1",
-  "14548241-0",
-  "8776186-k",
-  "9814714-4",
-  "24955282-8",
-  "10459765-3",
-  "9485852-6",
-  "7496987-9",
-  "14432560-5",
-  "8598121-8",
-  "24167632-3",
-  "22476072-8",
-  "9183197-k",
-  "18518828-0",
-  "19327443-9",
-  "18049056-6",
-  "13177501-6",
-  "10327121-5",
-  "22942137-9",
-  "13525137-2",
-  "15937336-3",
-  "17263023-5",
-  "9572747-6",
-  "13265802-1",
-  "16937046-k",
-  "5586579-5",
-  "11628990-3",
-  "16433923-8",
-  "17912785-7",
-  "20662632-1",
-  "11945267-8",
-  "19817424-6",
-  "13040553-3",
-  "16860491-2",
-  "6056492-2",
-  "10843353-1",
-  "12917826-4",
-  "17339358-k",
-  "22951398-2",
-  "7249156-4",
-  "14159364-1",
-  "5253075-k",
-  "17429175-6",
-  "12852783-4",
-  "7200937-1",
-  "6661340-2",
-  "21518761-6",
-  "6882496-6",
-  "5432224-0",
-  "13609110-7",
-  "10364638-3",
-  "18426617-2",
-  "12496864-k",
-  "22517915-8",
-  "16618576-9",
-  "16292653-5",
-  "24649372-3",
-  "8169165-7",
-  "24893942-7",
-  "11107480-1",
-  "12354276-2",
-  "6411302-k",
-  "21483864-8",
-  "5534031-5",
-  "18745831-5",
-  "5954899-9",
-  "19318805-2",
-  "10809848-1",
-  "7639193-9",
-  "20653159-2",
-  "12623807-k",
-  "13560020-2",
-  "24430241-6",
-  "11563558-1",
-  "13919086-6",
-  "20366533-4",
-  "20993789-1",
-  "24513161-5",
-  "6482480-5",
-  "7488074-6",
-  "7202988-7",
-  "10466297-8",
-  "13848429-7",
-  "22037999-k",
-  "21124321-k",
-  "8466392-1",
-  "17694841-8",
-  "5210477-7",
-  "13241491-2",
-  "9347559-3",
-  "16470596-k",
-  "8356353-2",
-  "7808203-8",
-  "7034629-k",
-  "8762186-3",
-  "6956311-2",
-  "18426875-2",
-  "12216902-2",
-  "8729851-5",
-  "15846369-5",
-  "7932853-7",
-  "15171686-5",
-  "8071531-5",
-  "20882495-3",
-  "7630658-3",
-  "24813247-7",
-  "19496346-7",
-  "23264908-9",
-  "23255705-2",
-  "15123990-0",
-  "23529790-6",
-  "12003539-8",
-  "11857955-0",
-  "11851717-2",
-  "19084381-5",
-  "10817496-k",
-  "18316894-0",
-  "17849467-8",
-  "8997822-k",
-  "19085555-4",
-  "23883451-1",
-  "22616948-2",
-  "16844839-2",
-  "21243758-1",
-  "7374061-4",
-  "16568497-4",
-  "15053647-2",
-  "15877699-5",
-  "15230831-0",
-  "12714711-6",
-  "21107278-4",
-  "11268330-5",
-  "12004530-k",
-  "6612594-7",
-  "18039553-9",
-  "17767308-0",
-  "18442983-7",
-  "17680005-4",
-  "24703920-1",
-  "10045781-4",
-  "17072270-1",
-  "7330348-6",
-  "22375658-1",
-  "20500405-k",
-  "5597647-3",
-  "20525317-3",
-  "15348688-3",
-  "22289015-2",
-  "5646196-5",
-  "21597507-k",
-  "13859860-8",
-  "7605830-k",
-  "24299952-5",
-  "17527839-7",
-  "21213206-3",
-  "20600180-1",
-  "9275101-5",
-  "17338456-4",
-  "23057783-8",
-  "19141976-6",
-  "9319414-4",
-  "22833627-0",
-  "18808418-4",
-  "7426661-4",
-  "19403444-k",
-  "7871498-0",
-  "8461193-k",
-  "11075471-k",
-  "16253245-6",
-  "14219262-4",
-  "12554532-7",
-  "21001722-4",
-  "19118612-5",
-  "17345211-k",
-  "16867496-1",
-  "13355125-5",
-  "8945047-0",
-  "15212304-3",
-  "16252189-6",
-  "22746589-1",
-  "9122437-2",
-  "24608949-3",
-  "14320165-1",
-  "20279966-3",
-  "15000701-1",
-  "16262681-7",
-  "12526742-4",
-  "15786768-7",
-  "22694757-4",
-  "23958777-1",
-  "9873152-0",
-  "17298311-1",
-  "14998777-0",
-  "7446575-7",
-  "9551979-2",
-  "18316394-9",
-  "21053000-2",
-  "13151593-6",
-  "13808617-8",
-  "11021989-k",
-  "8803041-9",
-  "21299881-8",
-  "13850860-9",
-  "18046298-8",
-  "24760225-9",
-  "23794760-6",
-  "12248197-2",
-  "23007704-5",
-  "7765512-3",
-  "20198419-k",
-  "6981077-2",
-  "7651143-8",
-  "9542365-5",
-  "10422319-2",
-  "9278999-3",
-  "15774770-3",
-  "12848346-2",
-  "21778567-7",
-  "17866748-3",
-  "23238141-8",
-  "9890545-6",
-  "12140478-8",
-  "19020028-0",
-  "11321647-6",
-  "13082937-6",
-  "11798209-2",
-  "7258597-6",
-  "9763099-2",
-  "7099348-1",
-  "8725059-8",
-  "8267355-5",
-  "14190441-8",
-  "5131820-k",
-  "23467261-4",
-  "13727814-6",
-  "19790855-6",
-  "14946057-8",
-  "10053724-9",
-  "15300346-7",
-  "16889623-9",
-  "12563969-0",
-  "22388547-0",
-  "17321830-3",
-  "19976513-2",
-  "19063448-5",
-  "21264226-6",
-  "10931831-0",
-  "6913229-4",
-  "13257423-5",
-  "13551438-1",
-  "16390597-3",
-  "9126615-6",
-  "7788309-6",
-  "11583772-9",
-  "21657185-1",
-  "19446345-6",
-  "24154722-1",
-  "22811066-3",
-  "17835941-k",
-  "13155327-7",
-  "12018453-9",
-  "8159213-6",
-  "19225058-7",
-  "24319438-5",
-  "17426037-0",
-  "15574503-7",
-  "8272965-8",
-  "8051881-1",
-  "23922551-9",
-  "24091919-2",
-  "11947702-6",
-  "15286811-1",
-  "7201092-2",
-  "15141931-3",
-  "16836593-4",
-  "20674212-7",
-  "22789592-6",
-  "11065870-2",
-  "9063219-1",
-  "18577301-9",
-  "21399847-1",
-  "6531550-5",
-  "21531756-0",
-  "22224245-2",
-  "5563347-9",
-  "23653539-8",
-  "10040270-k",
-  "20565625-1",
-  "24023470-k",
-  "15258028-2",
-  "13581789-9",
-  "23536143-4",
-  "24423045-8",
-  "12544905-0",
-  "12028736-2",
-  "23748257-3",
-  "8527655-7",
-  "14693100-6",
-  "9595417-0",
-  "22150578-6",
-  "19896220-1",
-  "6399857-5",
-  "9618500-6",
-  "10604635-2",
-  "11766029-k",
-  "23300235-6",
-  "19834697-7",
-  "15787749-6",
-  "17207381-6",
-  "21626312-k",
-  "20423526-0",
-  "13148748-7",
-  "18556731-1",
-  "15202537-8",
-  "12998317-5",
-  "19570609-3",
-  "20501127-7",
-  "14644172-6",
-  "21361960-8",
-  "11274085-6",
-  "21475061-9",
-  "19179032-4",
-  "17108049-5",
-  "9021602-3",
-  "14691794-1",
-  "24414155-2",
-  "10750772-8",
-  "16691153-2",
-  "21586394-8",
-  "6188401-7",
-  "15606926-4",
-  "16789010-5",
-  "14812432-9",
-  "17935897-2",
-  "16403015-6",
-  "16988157-k",
-  "9749001-5",
-  "13898038-3",
-  "6625710-k",
-  "7054096-7",
-  "8657203-6",
-  "14642759-6",
-  "17288689-2",
-  "14115533-4",
-  "17984539-3",
-  "7448518-9",
-  "11107917-k",
-  "11225562-1",
-  "7192877-2",
-  "12937818-2",
-  "11241253-0",
-  "15304844-4",
-  "7910955-k",
-  "16358119-1",
-  "13199405-2",
-  "22498069-8",
-  "7402891-8",
-  "5544505-2",
-  "12905127-2",
-  "16555133-8",
-  "17456099-4",
-  "24956970-4",
-  "10119610-0",
-  "22813874-6",
-  "24975122-7",
-  "8198141-8",
-  "12427226-2",
-  "22386991-2",
-  "19811280-1",
-  "17931444-4",
-  "9577754-6",
-  "22102009-k",
-  "6655428-7",
-  "16759632-0",
-  "21496547-k",
-  "20259456-5",
-  "6514096-9",
-  "23022979-1",
-  "19457479-7",
-  "17042515-4",
-  "16721746-k",
-  "17233483-0",
-  "7521012-4",
-  "13228311-7",
-  "17179412-9",
-  "23803132-k",
-  "5243455-6",
-  "5540185-3",
-  "21649861-5",
-  "23731750-5",
-  "14573765-6",
-  "14602859-4",
-  "6941924-0",
-  "18358604-1",
-  "12185666-2",
-  "15503319-3",
-  "23916588-5",
-  "11494835-7",
-  "17586422-9",
-  "9535574-9",
-  "16379380-6",
-  "6358013-9",
-  "15372047-9",
-  "23207585-6",
-  "9033795-5",
-  "13891100-4",
-  "21157247-7",
-  "24930165-5",
-  "5777495-9",
-  "24704468-k",
-  "10452470-2",
-  "13397407-5",
-  "14968594-4",
-  "5646892-7",
-  "24832531-3",
-  "22091589-1",
-  "10269226-8",
-  "23568097-1",
-  "19115491-6",
-  "15049467-2",
-  "21687963-5",
-  "5497645-3",
-  "18076807-6",
-  "17369412-1",
-  "12441526-8",
-  "11729301-7",
-  "17935347-4",
-  "21366091-8",
-  "11880172-5",
-  "11455879-6",
-  "15449224-0",
-  "13682713-8",
-  "10410978-0",
-  "18271023-7",
-  "11387982-3",
-  "21248928-k",
-  "18921612-2",
-  "21974479-k",
-  "20756275-0",
-  "24019034-6",
-  "21707337-5",
-  "24911236-4",
-  "20843043-2",
-  "16058029-1",
-  "6202427-5",
-  "18973635-5",
-  "23310550-3",
-  "13443189-k",
-  "16822894-5",
-  "7251630-3",
-  "14510181-6",
-  "19199280-6",
-  "5897738-1",
-  "11244490-4",
-  "5678378-4",
-  "16282339-6",
-  "15436232-0",
-  "24363975-1",
-  "16620149-7",
-  "22741719-6",
-  "21882531-1",
-  "11524800-6",
-  "24298462-5",
-  "20401190-7",
-  "11504293-9",
-  "14711392-7",
-  "17592498-1",
-  "20969565-0",
-  "17704806-2",
-  "10217338-4",
-  "5277340-7",
-  "18461704-8",
-  "9742290-7",
-  "24741076-7",
-  "14037854-2",
-  "12222368-k",
-  "9548953-2",
-  "18730247-1",
-  "12415978-4",
-  "22941587-5",
-  "5626935-5",
-  "7301109-4",
-  "23082540-8",
-  "23421457-8",
-  "5700071-6",
-  "10901245-9",
-  "5605143-0",
-  "11799705-7",
-  "18784461-4",
-  "23324371-k",
-  "18920972-k",
-  "20792867-4",
-  "10014527-8",
-  "11523119-7",
-  "14924205-8",
-  "7147334-1",
-  "22409503-1",
-  "17057038-3",
-  "8670691-1",
-  "20617436-6",
-  "21495479-6",
-  "19120692-4",
-  "22328741-7",
-  "11294671-3",
-  "10531790-5",
-  "14226325-4",
-  "19092568-4",
-  "24657562-2",
-  "10650818-6",
-  "17070573-4",
-  "13068415-7",
-  "24091511-1",
-  "7423936-6",
-  "18273993-6",
-  "18288579-7",
-  "12172275-5",
-  "6979515-3",
-  "16791679-1",
-  "20063587-6",
-  "24072157-0",
-  "16085443-k",
-  "19173417-3",
-  "19929408-3",
-  "10126580-3",
-  "21074033-3",
-  "9451696-k",
-  "20220960-2",
-  "10138435-7",
-  "14124904-5",
-  "17791947-0",
-  "12634126-1",
-  "11759356-8",
-  "5886908-2",
-  "14113031-5",
-  "23227524-3",
-  "23196362-6",
-  "23623824-5",
-  "9688125-8",
-  "15466145-k",
-  "23414005-1",
-  "23726686-2",
-  "19446549-1",
-  "24560322-3",
-  "6249924-9",
-  "18212915-1",
-  "17977791-6",
-  "6672304-6",
-  "6768254-8",
-  "21213119-9",
-  "6873278-6",
-  "20043848-5",
-  "5153651-7",
-  "8845534-7",
-  "23115115-k",
-  "21172948-1",
-  "21399546-4",
-  "15065497-1",
-  "22662187-3",
-  "7317146-6",
-  "15579432-1",
-  "18534911-k",
-  "6770855-5",
-  "20438009-0",
-  "22718907-k",
-  "6932135-6",
-  "21553121-k",
-  "24077666-9",
-  "18783444-9",
-  "13109045-5",
-  "19023846-6",
-  "17260402-1",
-  "22635414-k",
-  "21087963-3",
-  "5285044-4",
-  "7275204-k",
-  "17592482-5",
-  "14208078-8",
-  "18441995-5",
-  "9852910-1",
-  "15828762-5",
-  "16325658-4",
-  "16938919-5",
-  "10372403-1",
-  "16670700-5",
-  "19440857-9",
-  "19194101-2",
-  "18321540-k",
-  "13240157-8",
-  "6671862-k",
-  "13339513-k",
-  "14033506-1",
-  "22920849-7",
-  "22256339-9",
-  "9701057-9",
-  "12424311-4",
-  "14425271-3",
-  "15176484-3",
-  "12375654-1",
-  "9989671-k",
-  "8246766-1",
-  "6169741-1",
-  "24774406-1",
-  "24659975-0",
-  "9475294-9",
-  "15696190-6",
-  "13185870-1",
-  "10038878-2",
-  "6062830-0",
-  "14195493-8",
-  "7226373-1",
-  "22175364-k",
-  "15902768-6",
-  "22837054-1",
-  "20160345-5",
-  "10074049-4",
-  "22221476-9",
-  "9276702-7",
-  "20013307-2",
-  "24618049-0",
-  "8204625-9",
-  "6522319-8",
-  "8573883-6",
-  "12360856-9",
-  "15138140-5",
-  "21849678-4",
-  "18057139-6",
-  "8862425-4",
-  "10482869-8",
-  "21115119-6",
-  "7134899-7",
-  "15916508-6",
-  "12791695-0",
-  "9639225-7",
-  "17555487-4",
-  "11767411-8",
-  "20343605-k",
-  "20197318-k",
-  "21186447-8",
-  "17138499-0",
-  "17082817-8",
-  "23387630-5",
-  "8223463-2",
-  "11350230-4",
-  "8383814-0",
-  "17266533-0",
-  "24910255-5",
-  "16493034-3",
-  "11767581-5",
-  "15355402-1",
-  "5801069-3",
-  "18674560-4",
-  "14444821-9",
-  "9279093-2",
-  "10670023-0",
-  "7101985-3",
-  "16934118-4",
-  "20177394-6",
-  "10743573-5",
-  "12134835-7",
-  "18678226-7",
-  "15118331-k",
-  "7042132-1",
-  "13304925-8",
-  "13379247-3",
-  "24372990-4",
-  "6201328-1",
-  "9839775-2",
-  "24046273-7",
-  "20564883-6",
-  "12740138-1",
-  "20930525-9",
-  "16894463-2",
-  "24401375-9",
-  "17207770-6",
-  "17579288-0",
-  "5163715-1",
-  "5301761-4",
-  "14359509-9",
-  "14003260-3",
-  "24494457-4",
-  "18589659-5",
-  "13539968-k",
-  "6989998-6",
-  "8237141-9",
-  "17360579-k",
-  "11996837-2",
-  "5502246-1",
-  "7711199-9",
-  "18092359-4",
-  "9616544-7",
-  "10244205-9",
-  "16647253-9",
-  "7263727-5",
-  "17376726-9",
-  "22189609-2",
-  "14105878-9",
-  "11346281-7",
-  "7010487-3",
-  "10667260-1",
-  "17953262-k",
-  "18260577-8",
-  "19909598-6",
-  "12334488-k",
-  "10887047-8",
-  "8912776-9",
-  "8445719-1",
-  "5684083-4",
-  "15743460-8",
-  "5003544-1",
-  "11162576-k",
-  "13569696-k",
-  "21204574-8",
-  "17357865-2",
-  "22478880-0",
-  "10731287-0",
-  "11432113-3",
-  "21421580-2",
-  "16868651-k",
-  "15765810-7",
-  "15535103-9",
-  "19697298-6",
-  "12674647-4",
-  "23987408-8",
-  "16745207-8",
-  "17405510-6",
-  "16245245-2",
-  "19687440-2",
-  "11269430-7",
-  "17057603-9",
-  "20218828-1",
-  "20167057-8",
-  "7116576-0",
-  "7765169-1",
-  "12983712-8",
-  "8125766-3",
-  "11377728-1",
-  "20077597-k",
-  "12427639-k",
-  "12339444-5",
-  "8487792-1",
-  "24866208-5",
-  "14029178-1",
-  "6071645-5",
-  "20838382-5",
-  "6386811-6",
-  "8892934-9",
-  "14381436-k",
-  "17629535-k",
-  "20845156-1",
-  "19963741-k",
-  "14441410-1",
-  "21481729-2",
-  "24917219-7",
-  "18611873-1",
-  "14567295-3",
-  "15091241-5",
-  "22949484-8",
-  "22252981-6",
-  "16150970-1",
-  "24264986-9",
-  "18246569-0",
-  "8824142-8",
-  "16770961-3",
-  "7771019-1",
-  "12934408-3",
-  "16577787-5",
-  "9860723-4",
-  "16385484-8",
-  "19878059-6",
-  "11078983-1",
-  "14626905-2",
-  "22024727-9",
-  "8676940-9",
-  "7862260-1",
-  "21482465-5",
-  "8787884-8",
-  "10861420-k",
-  "19836678-1",
-  "18185810-9",
-  "15789632-6",
-  "8116775-3",
-  "23259726-7",
-  "17004133-k",
-  "20007974-4",
-  "21969937-9",
-  "16833977-1",
-  "23186952-2",
-  "8549398-1",
-  "14088351-4",
-  "20324801-6",
-  "18474577-1",
-  "9065412-8",
-  "9868230-9",
-  "20165648-6",
-  "7397029-6",
-  "24902425-2",
-  "24426470-0",
-  "8119383-5",
-  "21243253-9",
-  "16574150-1",
-  "21000663-k",
-  "13489526-8",
-  "18728132-6",
-  "11451785-2",
-  "12538270-3",
-  "13786536-k",
-  "8458117-8",
-  "10992956-5",
-  "10326467-7",
-  "19719981-4",
-  "17415701-4",
-  "8282611-4",
-  "9386922-2",
-  "13212738-7",
-  "23410300-8",
-  "23696285-7",
-  "15541080-9",
-  "6537439-0",
-  "5581066-4",
-  "13016671-7",
-  "24282018-5",
-  "6213543-3",
-  "14552346-k",
-  "16512553-3",
-  "19355565-9",
-  "7705171-6",
-  "19446972-1",
-  "12577634-5",
-  "21344240-6",
-  "15908204-0",
-  "13517383-5",
-  "9169018-7",
-  "20192000-0",
-  "20663610-6",
-  "7345574-k",
-  "22165141-3",
-  "12846741-6",
-  "22793504-9",
-  "9327251-k",
-  "17213777-6",
-  "17882564-k",
-  "11437059-2",
-  "15870310-6",
-  "16771074-3",
-  "6272683-0",
-  "14347944-7",
-  "7009984-5",
-  "21125845-4",
-  "10474652-7",
-  "8303029-1",
-  "11420942-2",
-  "22490684-6",
-  "11001562-3",
-  "12320246-5",
-  "16414100-4",
-  "5331280-2",
-  "8913774-8",
-  "16303217-1",
-  "13271501-7",
-  "24554069-8",
-  "23018504-2",
-  "16286494-7",
-  "10103193-4",
-  "10755376-2",
-  "24247305-1",
-  "14261972-5",
-  "24574848-5",
-  "24542316-0",
-  "22233162-5",
-  "15128874-k",
-  "13266416-1",
-  "17699946-2",
-  "21647029-k",
-  "10963750-5",
-  "19533220-7",
-  "6866958-8",
-  "11854250-9",
-  "24253907-9",
-  "18650613-8",
-  "19033489-9",
-  "7233365-9",
-  "12924869-6",
-  "13887065-0",
-  "15803813-7",
-  "20898338-5",
-  "23145224-9",
-  "20503750-0",
-  "20466220-7",
-  "23144009-7",
-  "8759935-3",
-  "12288579-8",
-  "18274142-6",
-  "18328160-7",
-  "24920933-3",
-  "18726768-4",
-  "5331121-0",
-  "15583106-5",
-  "8732561-k",
-  "17717409-2",
-  "6092902-5",
-  "9228994-k",
-  "13590289-6",
-  "14243489-k",
-  "7863160-0",
-  "18811223-4",
-  "11750867-6",
-  "10585703-9",
-  "6800685-6",
-  "12269561-1",
-  "6055709-8",
-  "23228502-8",
-  "16178843-0",
-  "19245257-0",
-  "5511308-4",
-  "13917477-1",
-  "20776953-3",
-  "6354095-1",
-  "6984226-7",
-  "7825749-0",
-  "8230596-3",
-  "16852759-4",
-  "22720750-7",
-  "8973919-5",
-  "7983451-3",
-  "15136787-9",
-  "15621338-1",
-  "18175520-2",
-  "5433114-2",
-  "24113599-3",
-  "17340010-1",
-  "22378673-1",
-  "5711656-0",
-  "18595978-3",
-  "24984067-k",
-  "5876900-2",
-  "11459290-0",
-  "13103312-5",
-  "10451354-9",
-  "13168667-6",
-  "10025862-5",
-  "5421505-3",
-  "24439728-k",
-  "10725399-8",
-  "18267434-6",
-  "7713615-0",
-  "7695450-k",
-  "21806507-4",
-  "22869346-4",
-  "9878545-0",
-  "11521891-3",
-  "10153945-8",
-  "15983261-9",
-  "14258935-4",
-  "24649787-7",
-  "14870374-4",
-  "7016074-9",
-  "9211477-5",
-  "21989036-2",
-  "24492107-8",
-  "22715711-9",
-  "24716556-8",
-  "11654976-k",
-  "16592410-k",
-  "7302763-2",
-  "5567593-7",
-  "8934188-4",
-  "11549130-k",
-  "24039248-8",
-  "11213353-4",
-  "19828563-3",
-  "21232715-8",
-  "20815150-9",
-  "10000055-5",
-  "7816970-2",
-  "16859176-4",
-  "14230277-2",
-  "9978344-3",
-  "16353819-9",
-  "22441100-6",
-  "22831473-0",
-  "7027927-4",
-  "9101259-6",
-  "14834042-0",
-  "9075042-9",
-  "15848452-8",
-  "10870068-8",
-  "14865760-2",
-  "7465506-8",
-  "5967880-9",
-  "19382168-5",
-  "8472435-1",
-  "17665411-2",
-  "23167251-6",
-  "24253821-8",
-  "14600762-7",
-  "18104632-5",
-  "8511960-5",
-  "11614835-8",
-  "5272325-6",
-  "13143480-4",
-  "11109343-1",
-  "21235225-k",
-  "8521122-6",
-  "17657703-7",
-  "12410864-0",
-  "19236915-0",
-  "17491942-9",
-  "6883138-5",
-  "14080739-7",
-  "6126734-4",
-  "20244316-8",
-  "13264782-8",
-  "15227445-9",
-  "18268157-1",
-  "18794889-4",
-  "14657765-2",
-  "14563724-4",
-  "9774547-1",
-  "8922259-1",
-  "6585317-5",
-  "23297896-1",
-  "23386049-2",
-  "14756528-3",
-  "8735308-7",
-  "22554902-8",
-  "20161798-7",
-  "5129636-2",
-  "14035677-8",
-  "21355869-2",
-  "9959711-9",
-  "7804675-9",
-  "11628869-9",
-  "23656997-7",
-  "16893361-4",
-  "13889530-0",
-  "9630680-6",
-  "7788051-8",
-  "14305428-4",
-  "22394034-k",
-  "8183340-0",
-  "10749821-4",
-  "15203988-3",
-  "14598126-3",
-  "7428415-9",
-  "19136340-k",
-  "5336010-6",
-  "19407158-2",
-  "14136972-5",
-  "5220873-4",
-  "14384520-6",
-  "16273987-5",
-  "8841750-k",
-  "13286862-k",
-  "6433480-8",
-  "22279536-2",
-  "19579562-2",
-  "5302356-8",
-  "19229894-6",
-  "7813476-3",
-  "16816609-5",
-  "12562873-7",
-  "11768829-1",
-  "22599103-0",
-  "21751736-2",
-  "13428138-3",
-  "21532081-2",
-  "12082948-3",
-  "12884383-3",
-  "8141721-0",
-  "23489091-3",
-  "8671957-6",
-  "14475316-k",
-  "20036391-4",
-  "6685397-7",
-  "18888646-9",
-  "14318554-0",
-  "7275040-3",
-  "22758538-2",
-  "15249072-0",
-  "11301392-3",
-  "6429152-1",
-  "24822912-8",
-  "21421400-8",
-  "21387360-1",
-  "20797691-1",
-  "16870393-7",
-  "8059796-7",
-  "9163185-7",
-  "23763346-6",
-  "21169241-3",
-  "24877416-9",
-  "22233169-2",
-  "7107254-1",
-  "24574001-8",
-  "24538992-2",
-  "19077231-4",
-  "7346903-1",
-  "9254569-5",
-  "20030877-8",
-  "7290251-3",
-  "21307078-9",
-  "5221405-k",
-  "7548914-5",
-  "8875058-6",
-  "12099708-4",
-  "22067134-8",
-  "23927680-6",
-  "17772695-8",
-  "20918948-8",
-  "17962944-5",
-  "21784627-7",
-  "23926994-k",
-  "11869978-5",
-  "9139406-5",
-  "9128559-2",
-  "16383726-9",
-  "23528631-9",
-  "9695433-6",
-  "24912703-5",
-  "10166436-8",
-  "20515400-0",
-  "8733634-4",
-  "6086366-0",
-  "14884494-1",
-  "7402586-2",
-  "16723878-5",
-  "14172075-9",
-  "12008371-6",
-  "8800497-3",
-  "7821356-6",
-  "6483612-9",
-  "12440089-9",
-  "8643476-8",
-  "5149605-1",
-  "9497333-3",
-  "19385871-6",
-  "21851157-0",
-  "13153880-4",
-  "8376748-0",
-  "9674395-5",
-  "8918624-2",
-  "24971621-9",
-  "9389038-8",
-  "15139316-0",
-  "6469144-9",
-  "19431572-4",
-  "10235903-8",
-  "11227552-5",
-  "5329373-5",
-  "10345545-6",
-  "18819673-k",
-  "16224035-8",
-  "23880763-8",
-  "11035197-6",
-  "5693030-2",
-  "5447128-9",
-  "10530654-7",
-  "19665515-8",
-  "10819675-0",
-  "9735817-6",
-  "14270902-3",
-  "20298838-5",
-  "7882930-3",
-  "12243220-3",
-  "10799389-4",
-  "18424174-9",
-  "18279272-1",
-  "21735382-3",
-  "18144703-6",
-  "22016067-k",
-  "8196393-2",
-  "19893523-9",
-  "20594137-1",
-  "21442060-0",
-  "6778550-9",
-  "19563340-1",
-  "22910786-0",
-  "6347380-4",
-  "12538005-0",
-  "24449083-2",
-  "12707024-5",
-  "22963065-2",
-  "16421387-0",
-  "14973104-0",
-  "14748854-8",
-  "22474913-9",
-  "8997356-2",
-  "11424436-8",
-  "15252866-3",
-  "19689911-1",
-  "14651735-8",
-  "24748343-8",
-  "24593989-2",
-  "13337179-6",
-  "6670908-6",
-  "13063362-5",
-  "15249677-k",
-  "20719960-5",
-  "18114167-0",
-  "5785931-8",
-  "8665632-9",
-  "16456551-3",
-  "6936666-k",
-  "14295287-4",
-  "11293033-7",
-  "19171738-4",
-  "14754442-1",
-  "5954022-k",
-  "10219880-8",
-  "13025313-k",
-  "17971262-8",
-  "18519784-0",
-  "15845534-k",
-  "15453147-5",
-  "7895868-5",
-  "14841542-0",
-  "17569821-3",
-  "22761818-3",
-  "17128567-4",
-  "6387471-k",
-  "15737755-8",
-  "6309103-0",
-  "13553500-1",
-  "16203213-5",
-  "7666320-3",
-  "10513136-4",
-  "14922438-6",
-  "11544896-k",
-  "6295071-4",
-  "7056194-8",
-  "7436531-0",
-  "19077532-1",
-  "8913027-1",
-  "21066356-8",
-  "21962755-6",
-  "12274655-0",
-  "16790176-k",
-  "20111499-3",
-  "22430674-1",
-  "24827523-5",
-  "6840542-4",
-  "15315291-8",
-  "8255271-5",
-  "19355500-4",
-  "18098617-0",
-  "5072413-1",
-  "23333305-0",
-  "23677681-6",
-  "23782740-6",
-  "13522881-8",
-  "22585150-6",
-  "19672983-6",
-  "16995809-2",
-  "21372168-2",
-  "20093647-7",
-  "9171214-8",
-  "19744814-8",
-  "17616010-1",
-  "23252532-0",
-  "16787169-0",
-  "13318420-1",
-  "17452496-3",
-  "9717611-6",
-  "8216533-9",
-  "16833860-0",
-  "23832660-5",
-  "17742464-1",
-  "20700811-7",
-  "23009659-7",
-  "23196172-0",
-  "16481754-7",
-  "21867975-7",
-  "18799388-1",
-  "11951013-9",
-  "16089421-0",
-  "17674328-k",
-  "20136511-2",
-  "12753065-3",
-  "24007321-8",
-  "7020689-7",
-  "19517554-3",
-  "22903274-7",
-  "23989507-7",
-  "21933219-k",
-  "18974895-7",
-  "14301427-4",
-  "6043655-k",
-  "6541480-5",
-  "9864435-0",
-  "18074933-0",
-  "20985497-k",
-  "22835144-k",
-  "8260379-4",
-  "11993958-5",
-  "21124842-4",
-  "24481338-0",
-  "24564089-7",
-  "24076354-0",
-  "24039023-k",
-  "22880490-8",
-  "12189236-7",
-  "24914861-k",
-  "13552269-4",
-  "13192515-8",
-  "9148853-1",
-  "11743806-6",
-  "5245069-1",
-  "6180628-8",
-  "9856546-9",
-  "7812553-5",
-  "9112366-5",
-  "18652412-8",
-  "10141232-6",
-  "7677891-4",
-  "15432818-1",
-  "9304248-4",
-  "16635776-4",
-  "7474279-3",
-  "13173372-0",
-  "11214350-5",
-  "7904546-2",
-  "11203685-7",
-  "13243279-1",
-  "15952601-1",
-  "5937915-1",
-  "21636610-7",
-  "23789755-2",
-  "12317022-9",
-  "21031354-0",
-  "17022204-0",
-  "13971279-k",
-  "7411640-k",
-  "8257468-9",
-  "12629171-k",
-  "8884479-3",
-  "5212141-8",
-  "17810515-9",
-  "19551597-2",
-  "12424620-2",
-  "6774211-7",
-  "12209244-5",
-  "13581739-2",
-  "19052390-k",
-  "6677417-1",
-  "7105059-9",
-  "5107536-6",
-  "9213250-1",
-  "8004077-6",
-  "13843432-k",
-  "12409906-4",
-  "19573502-6",
-  "8118064-4",
-  "7692601-8",
-  "24504204-3",
-  "22378063-6",
-  "16879925-k",
-  "7137352-5",
-  "13017161-3",
-  "10204075-9",
-  "8333454-1",
-  "7980800-8",
-  "21281297-8",
-  "22226980-6",
-  "18121919-k",
-  "5648798-0",
-  "19891474-6",
-  "8116981-0",
-  "5393714-4",
-  "24043233-1",
-  "16101438-9",
-  "21268675-1",
-  "14496613-9",
-  "8067719-7",
-  "11697276-k",
-  "5101265-8",
-  "14362495-1",
-  "17154746-6",
-  "15396939-6",
-  "18271093-8",
-  "23229737-9",
-  "23293273-2",
-  "19684009-5",
-  "11221907-2",
-  "17829757-0",
-  "6107025-7",
-  "23266733-8",
-  "5355284-6",
-  "6880665-8",
-  "21389176-6",
-  "24028895-8",
-  "12851386-8",
-  "8887755-1",
-  "13909767-k",
-  "10544140-1",
-  "12831364-8",
-  "5981152-5",
-  "24168436-9",
-  "9771521-1",
-  "13489553-5",
-  "10070181-2",
-  "12938083-7",
-  "7088833-5",
-  "9310494-3",
-  "19535195-3",
-  "17205067-0",
-  "9472695-6",
-  "18150816-7",
-  "16583240-k",
-  "16657864-7",
-  "20792922-0",
-  "18511217-9",
-  "14320879-6",
-  "11216380-8",
-  "8165648-7",
-  "8259390-k",
-  "14687029-5",
-  "14299481-k",
-  "6379335-3",
-  "16801140-7",
-  "14847977-1",
-  "10690745-5",
-  "22445495-3",
-  "21992346-5",
-  "10456763-0",
-  "12061066-k",
-  "21755936-7",
-  "19152225-7",
-  "17348635-9",
-  "10456503-4",
-  "12089957-0",
-  "5482617-6",
-  "20142037-7",
-  "19480191-2",
-  "8779982-4",
-  "7581753-3",
-  "13883210-4",
-  "24939446-7",
-  "18293708-8",
-  "9165576-4",
-  "20346611-0",
-  "17057346-3",
-  "14187978-2",
-  "5456118-0",
-  "11785572-4",
-  "20069164-4",
-  "9838108-2",
-  "19874852-8",
-  "22458023-1",
-  "11298953-6",
-  "6893696-9",
-  "5885993-1",
-  "17960657-7",
-  "13963742-9",
-  "21737077-9",
-  "22633538-2",
-  "16611046-7",
-  "7190710-4",
-  "9616887-k",
-  "21059692-5",
-  "10210838-8",
-  "21783555-0",
-  "23250819-1",
-  "20001242-9",
-  "12862142-3",
-  "23246856-4",
-  "23402368-3",
-  "21784534-3",
-  "24327657-8",
-  "24316904-6",
-  "10114673-1",
-  "24705301-8",
-  "10892701-1",
-  "7742611-6",
-  "14409220-1",
-  "20745553-9",
-  "20961536-3",
-  "7299679-8",
-  "7827215-5",
-  "5724333-3",
-  "12035128-1",
-  "14191077-9",
-  "19997820-9",
-  "12320241-4",
-  "8533551-0",
-  "23710901-5",
-  "19167515-0",
-  "10466950-6",
-  "22570937-8",
-  "7638427-4",
-  "23824838-8",
-  "12594468-k",
-  "14224710-0",
-  "16521004-2",
-  "14343826-0",
-  "24271443-1",
-  "18934138-5",
-  "7389551-0",
-  "13437311-3",
-  "24241172-2",
-  "9908702-1",
-  "14678849-1",
-  "23396112-4",
-  "10307636-6",
-  "22000161-k",
-  "16296897-1",
-  "23134724-0",
-  "10409248-9",
-  "7190854-2",
-  "9012397-1",
-  "16738114-6",
-  "8471564-6",
-  "9563357-9",
-  "5955630-4",
-  "20837977-1",
-  "8654890-9",
-  "16463722-0",
-  "19864562-1",
-  "7956699-3",
-  "24520561-9",
-  "14378647-1",
-  "23108831-8",
-  "21157425-9",
-  "12858437-4",
-  "14739012-2",
-  "16482271-0",
-  "10312897-8",
-  "13940486-6",
-  "8660596-1",
-  "6603320-1",
-  "22643344-9",
-  "11845321-2",
-  "17233091-6",
-  "9898293-0",
-  "12361224-8",
-  "14589379-8",
-  "24153363-8",
-  "13847973-0",
-  "8488492-8",
-  "22437571-9",
-  "21517020-9",
-  "23914185-4",
-  "23201429-6",
-  "6998305-7",
-  "24137464-5",
-  "23285718-8",
-  "13938924-7",
-  "11306459-5",
-  "23600630-1",
-  "12258815-7",
-  "22667146-3",
-  "12585773-6",
-  "11900406-3",
-  "15354742-4",
-  "10042979-9",
-  "16225274-7",
-  "13901855-9",
-  "24251077-1",
-  "14143159-5",
-  "19260471-0",
-  "11423637-3",
-  "20890069-2",
-  "7762911-4",
-  "14914044-1",
-  "12398226-6",
-  "5048251-0",
-  "23186728-7",
-  "7098703-1",
-  "15211989-5",
-  "17616895-1",
-  "21681886-5",
-  "19018471-4",
-  "13819950-9",
-  "14130825-4",
-  "21245872-4",
-  "23134228-1",
-  "19976725-9",
-  "9109677-3",
-  "15858524-3",
-  "20498058-6",
-  "19343133-k",
-  "15959733-4",
-  "24242886-2",
-  "15179398-3",
-  "24332415-7",
-  "24913458-9",
-  "19084725-k",
-  "13700168-3",
-  "19983088-0",
-  "15336712-4",
-  "22267558-8",
-  "6456545-1",
-  "6799523-6",
-  "17871162-8",
-  "18058868-k",
-  "13054172-0",
-  "19422718-3",
-  "17759744-9",
-  "17034386-7",
-  "5513652-1",
-  "22795769-7",
-  "22489093-1",
-  "10893150-7",
-  "7564744-1",
-  "18659727-3",
-  "18994265-6",
-  "9029508-k",
-  "23257264-7",
-  "8926377-8",
-  "8927552-0",
-  "21856134-9",
-  "12662758-0",
-  "20667430-k",
-  "22508660-5",
-  "24153659-9",
-  "12229553-2",
-  "7482745-4",
-  "6857274-6",
-  "11584927-1",
-  "24338223-8",
-  "21313115-k",
-  "22058918-8",
-  "8812607-6",
-  "9558069-6",
-  "9791291-2",
-  "12496615-9",
-  "7238141-6",
-  "9833943-4",
-  "22929761-9",
-  "23352879-k",
-  "8283682-9",
-  "16099866-0",
-  "18691347-7",
-  "14521154-9",
-  "15210400-6",
-  "5512671-2",
-  "17712865-1",
-  "9307858-6",
-  "9803080-8",
-  "19632961-7",
-  "8221010-5",
-  "7500052-9",
-  "5438690-7",
-  "21371348-5",
-  "24956398-6",
-  "12067946-5",
-  "24240265-0",
-  "22412768-5",
-  "19723896-8",
-  "6873706-0",
-  "12704939-4",
-  "20125028-5",
-  "16614860-k",
-  "8861369-4",
-  "10229187-5",
-  "14284043-k",
-  "17737526-8",
-  "13769800-5",
-  "16011618-8",
-  "24993610-3",
-  "22165150-2",
-  "17753276-2",
-  "20585780-k",
-  "11399713-3",
-  "6624829-1",
-  "24470321-6",
-  "21927867-5",
-  "24536311-7",
-  "22399306-0",
-  "14866892-2",
-  "5241496-2",
-  "13707504-0",
-  "13915344-8",
-  "16673211-5",
-  "22979171-0",
-  "9215360-6",
-  "10778293-1",
-  "9090021-8",
-  "12651627-4",
-  "11964228-0",
-  "7326973-3",
-  "12039166-6",
-  "17738683-9",
-  "10788337-1",
-  "13554033-1",
-  "23625748-7",
-  "10374510-1",
-  "21032742-8",
-  "24189638-2",
-  "6408234-5",
-  "18326586-5",
-  "12816887-7",
-  "16638120-7",
-  "17465497-2",
-  "14037930-1",
-  "7270055-4",
-  "16945634-8",
-  "13102772-9",
-  "21113213-2",
-  "7551097-7",
-  "10113613-2",
-  "18781569-k",
-  "21928721-6",
-  "5086452-9",
-  "12959248-6",
-  "15778041-7",
-  "20880032-9",
-  "23969154-4",
-  "6238575-8",
-  "16382319-5",
-  "10369969-k",
-  "22694985-2",
-  "13291852-k",
-  "12482059-6",
-  "11637557-5",
-  "21804893-5",
-  "8258123-5",
-  "9411890-5",
-  "21612362-k",
-  "20968283-4",
-  "16235231-8",
-  "21093656-4",
-  "14927908-3",
-  "12992951-0",
-  "15730089-k",
-  "8217122-3",
-  "21973239-2",
-  "13453118-5",
-  "21580580-8",
-  "8076128-7",
-  "9393849-6",
-  "22262690-0",
-  "6596877-0",
-  "7332611-7",
-  "15115582-0",
-  "11983287-k",
-  "18376318-0",
-  "18276094-3",
-  "17475447-0",
-  "24837646-5",
-  "20553121-1",
-  "5865241-5",
-  "12359270-0",
-  "22687527-1",
-  "6841096-7",
-  "20139206-3",
-  "5884018-1",
-  "14742698-4",
-  "10093985-1",
-  "10434784-3",
-  "21832277-8",
-  "18187328-0",
-  "17262120-1",
-  "9686833-2",
-  "21908449-8",
-  "19276391-6",
-  "11543756-9",
-  "15153819-3",
-  "18813249-9",
-  "24055840-8",
-  "6822809-3",
-  "18909279-2",
-  "6858796-4",
-  "22067915-2",
-  "16473201-0",
-  "22606880-5",
-  "10206905-6",
-  "7015335-1",
-  "17185223-4",
-  "24938582-4",
-  "13482499-9",
-  "8138346-4",
-  "22809257-6",
-  "7107043-3",
-  "13657406-k",
-  "17298940-3",
-  "13985854-9",
-  "7578105-9",
-  "16492938-8",
-  "19892178-5",
-  "19041742-5",
-  "18108462-6",
-  "19299022-k",
-  "12773605-7",
-  "10872485-4",
-  "11133972-4",
-  "7411104-1",
-  "5535313-1",
-  "5020831-1",
-  "23890777-2",
-  "10925333-2",
-  "6752040-8",
-  "12298191-6",
-  "22743127-k",
-  "19399111-4",
-  "15424339-9",
-  "15538282-1",
-  "24396772-4",
-  "8326689-9",
-  "22361577-5",
-  "17958039-k",
-  "18221311-k",
-  "11801117-1",
-  "16920017-3",
-  "20134976-1",
-  "22407061-6",
-  "18733637-6",
-  "19753210-6",
-  "16927310-3",
-  "23261203-7",
-  "19219872-0",
-  "24015226-6",
-  "17139823-1",
-  "24717838-4",
-  "6637701-6",
-  "15077630-9",
-  "19539617-5",
-  "23069672-1",
-  "5438674-5",
-  "7569246-3",
-  "20999653-7",
-  "15504199-4",
-  "18918612-6",
-  "20489540-6",
-  "14775670-4",
-  "7555086-3",
-  "23573851-1",
-  "20928927-k",
-  "16496386-1",
-  "19159722-2",
-  "9296963-0",
-  "16929310-4",
-  "18825321-0",
-  "8408732-7",
-  "14535682-2",
-  "8254443-7",
-  "5682877-k",
-  "8042529-5",
-  "23827750-7",
-  "14166417-4",
-  "7044834-3",
-  "20582160-0",
-  "23962424-3",
-  "13831378-6",
-  "6574465-1",
-  "18916461-0",
-  "18618472-6",
-  "22084038-7",
-  "12679208-5",
-  "12697050-1",
-  "22713797-5",
-  "7457909-4",
-  "14795095-0",
-  "18047397-1",
-  "21579266-8",
-  "24928383-5",
-  "10477029-0",
-  "7656373-k",
-  "20011403-5",
-  "12542218-7",
-  "24399229-k",
-  "11636519-7",
-  "15973046-8",
-  "9725661-6",
-  "6974713-2",
-  "19806730-k",
-  "20353321-7",
-  "9184855-4",
-  "7640309-0",
-  "12214640-5",
-  "24921316-0",
-  "16922720-9",
-  "9167984-1",
-  "11232910-2",
-  "21463591-7",
-  "11702194-7",
-  "6535529-9",
-  "23893203-3",
-  "17276417-7",
-  "12476573-0",
-  "6604600-1",
-  "22902636-4",
-  "9747238-6",
-  "5798702-2",
-  "9137485-4",
-  "10999251-8",
-  "18451693-4",
-  "13341886-5",
-  "20304711-8",
-  "23113192-2",
-  "21993899-3",
-  "12034849-3",
-  "23318687-2",
-  "7108480-9",
-  "21202169-5",
-  "20290771-7",
-  "9994095-6",
-  "17403108-8",
-  "19735372-4",
-  "19293012-k",
-  "5913491-4",
-  "14002788-k",
-  "10484538-k",
-  "6359094-0",
-  "14780674-4",
-  "24249074-6",
-  "24087642-6",
-  "11597865-9",
-  "13420429-k",
-  "23956928-5",
-  "19720629-2",
-  "14731958-4",
-  "24885231-3",
-  "8226644-5",
-  "8724666-3",
-  "12195815-5",
-  "20836186-4",
-  "22956074-3",
-  "5512796-4",
-  "22141774-7",
-  "16821175-9",
-  "23108336-7",
-  "5185479-9",
-  "13252951-5",
-  "16711111-4",
-  "10662460-7",
-  "8824942-9",
-  "9221757-4",
-  "20098497-8",
-  "18902083-k",
-  "12493904-6",
-  "17168127-8",
-  "14754061-2",
-  "9722285-1",
-  "8168856-7",
-  "12062326-5",
-  "16604860-5",
-  "20678828-3",
-  "7492750-5",
-  "5289797-1",
-  "22417235-4",
-  "5898978-9",
-  "12369121-0",
-  "18255699-8",
-  "10224406-0",
-  "17616349-6",
-  "23756828-1",
-  "21806997-5",
-  "23527522-8",
-  "10286096-9",
-  "9304010-4",
-  "21403247-3",
-  "18239229-4",
-  "5810624-0",
-  "10307853-9",
-  "20910729-5",
-  "16725927-8",
-  "17738202-7",
-  "22707054-4",
-  "5395959-8",
-  "21395765-1",
-  "13396172-0",
-  "14220159-3",
-  "11743339-0",
-  "5775342-0",
-  "12957728-2",
-  "10798614-6",
-  "13818946-5",
-  "15251250-3",
-  "16122004-3",
-  "8388627-7",
-  "11537974-7",
-  "14855039-5",
-  "5243030-5",
-  "6013652-1",
-  "13527585-9",
-  "16832178-3",
-  "15273851-k",
-  "5020399-9",
-  "8037578-6",
-  "10592445-3",
-  "23718132-8",
-  "18160236-8",
-  "5301135-7",
-  "13298504-9",
-  "11643212-9",
-  "24400353-2",
-  "15387113-2",
-  "20684597-k",
-  "23628129-9",
-  "14521817-9",
-  "18496569-0",
-  "19309007-9",
-  "12498215-4",
-  "16515824-5",
-  "9702706-4",
-  "7498588-2",
-  "7613189-9",
-  "5345645-6",
-  "21476142-4",
-  "6630096-k",
-  "24071973-8",
-  "9437282-8",
-  "19447352-4",
-  "5709542-3",
-  "12182390-k",
-  "14554024-0",
-  "8967650-9",
-  "12823508-6",
-  "14847920-8",
-  "21640861-6",
-  "18375831-4",
-  "11675308-1",
-  "12370833-4",
-  "13459803-4",
-  "18384692-2",
-  "8248832-4",
-  "20019122-6",
-  "11266782-2",
-  "15920723-4",
-  "10924968-8",
-  "22429414-k",
-  "22869054-6",
-  "5408137-5",
-  "5951123-8",
-  "9198189-0",
-  "5654247-7",
-  "8409734-9",
-  "11137134-2",
-  "5810166-4",
-  "22797291-2",
-  "10429940-7",
-  "7396628-0",
-  "12363274-5",
-  "13703084-5",
-  "14401184-8",
-  "19588806-k",
-  "10645355-1",
-  "24354343-6",
-  "8311087-2",
-  "19509593-0",
-  "10738649-1",
-  "13371059-0",
-  "16849565-k",
-  "14334809-1",
-  "24832788-k",
-  "9182240-7",
-  "11107160-8",
-  "5563620-6",
-  "22140538-2",
-  "6101923-5",
-  "7087130-0",
-  "6459405-2",
-  "19043047-2",
-  "5688333-9",
-  "6312269-6",
-  "18262531-0",
-  "15703111-2",
-  "23319625-8",
-  "13513668-9",
-  "19801314-5",
-  "24175499-5",
-  "7045224-3",
-  "10868076-8",
-  "11724484-9",
-  "13230888-8",
-  "7677441-2",
-  "14062486-1",
-  "9895464-3",
-  "22402586-6",
-  "11919743-0",
-  "5700268-9",
-  "17604506-k",
-  "19244566-3",
-  "10179087-8",
-  "21596115-k",
-  "19580660-8",
-  "24676610-k",
-  "9982098-5",
-  "14459721-4",
-  "6466771-8",
-  "23315655-8",
-  "8173382-1",
-  "22495172-8",
-  "15082546-6",
-  "23585142-3",
-  "22317695-k",
-  "5613158-2",
-  "9962706-9",
-  "8642588-2",
-  "23447709-9",
-  "19010175-4",
-  "7519547-8",
-  "14596677-9",
-  "10245401-4",
-  "14400405-1",
-  "10023488-2",
-  "22798969-6",
-  "6656532-7",
-  "15059291-7",
-  "19976681-3",
-  "6489780-2",
-  "23726018-k",
-  "13855831-2",
-  "10290451-6",
-  "19389821-1",
-  "21359859-7",
-  "11318284-9",
-  "14307949-k",
-  "6577034-2",
-  "17775461-7",
-  "9098982-0",
-  "19089856-3",
-  "9066793-9",
-  "19707735-2",
-  "14687598-k",
-  "6884594-7",
-  "24082621-6",
-  "17923766-0",
-  "10908740-8",
-  "21283134-4",
-  "12788405-6",
-  "17956417-3",
-  "5458524-1",
-  "24843534-8",
-  "16929193-4",
-  "10468080-1",
-  "13970639-0",
-  "23628761-0",
-  "17539106-1",
-  "21932801-k",
-  "16997223-0",
-  "23843228-6",
-  "23732356-4",
-  "21505298-2",
-  "5900074-8",
-  "7707064-8",
-  "18818976-8",
-  "8617799-4",
-  "10819807-9",
-  "7123419-3",
-  "15197441-4",
-  "10430350-1",
-  "5552234-0",
-  "5113693-4",
-  "16094183-9",
-  "17080817-7",
-  "14460283-8",
-  "13413466-6",
-  "8659032-8",
-  "10111542-9",
-  "18810308-1",
-  "19825271-9",
-  "11135924-5",
-  "14765045-0",
-  "15808226-8",
-  "10612253-9",
-  "10862624-0",
-  "16953095-5",
-  "14146490-6",
-  "11170904-1",
-  "19678921-9",
-  "7917676-1",
-  "15527680-0",
-  "21900991-7",
-  "22947697-1",
-  "14437974-8",
-  "5719294-1",
-  "6184713-8",
-  "19896843-9",
-  "15319994-9",
-  "15010545-5",
-  "8628922-9",
-  "20496393-2",
-  "7440288-7",
-  "21941984-8",
-  "10701383-0",
-  "5744061-9",
-  "16388156-k",
-  "22795271-7",
-  "17808229-9",
-  "23064543-4",
-  "15014228-8",
-  "8628109-0",
-  "11032874-5",
-  "8029116-7",
-  "11071279-0",
-  "21284477-2",
-  "9209501-0",
-  "18095914-9",
-  "9196543-7",
-  "7080821-8",
-  "10151335-1",
-  "5379122-0",
-  "6439267-0",
-  "9190579-5",
-  "10802566-2",
-  "19077985-8",
-  "21605065-7",
-  "6510535-7",
-  "13752498-8",
-  "12601218-7",
-  "14886187-0",
-  "13804639-7",
-  "14028169-7",
-  "9579838-1",
-  "23027279-4",
-  "9220295-k",
-  "24413371-1",
-  "16504687-0",
-  "12986844-9",
-  "10645372-1",
-  "21283538-2",
-  "11081614-6",
-  "24491609-0",
-  "21268581-k",
-  "9743126-4",
-  "14170536-9",
-  "24212839-7",
-  "9739584-5",
-  "10247985-8",
-  "17810764-k",
-  "21611934-7",
-  "21223452-4",
-  "19646696-7",
-  "21483585-1",
-  "15384340-6",
-  "6013049-3",
-  "15661962-0",
-  "9273717-9",
-  "24039117-1",
-  "20130558-6",
-  "24433913-1",
-  "10430545-8",
-  "21198767-7",
-  "20086606-1",
-  "7766238-3",
-  "14002158-k",
-  "24291672-7",
-  "15581250-8",
-  "13083635-6",
-  "15173846-k",
-  "22357200-6",
-  "19112246-1",
-  "6288181-k",
-  "15727940-8",
-  "11419537-5",
-  "17832731-3",
-  "12351030-5",
-  "18011073-9",
-  "17438468-1",
-  "21027319-0",
-  "24266359-4",
-  "15296869-8",
-  "20611617-k",
-  "24560506-4",
-  "15553095-2",
-  "24687032-2",
-  "13246565-7",
-  "12539799-9",
-  "22632012-1",
-  "24006544-4",
-  "19258060-9",
-  "6706818-1",
-  "18030827-k",
-  "9562005-1",
-  "13771262-8",
-  "17968321-0",
-  "20489252-0",
-  "6211260-3",
-  "16133075-2",
-  "18738835-k",
-  "6356047-2",
-  "16415284-7",
-  "18643704-7",
-  "18175157-6",
-  "15021228-6",
-  "13615843-0",
-  "18612657-2",
-  "14702231-k",
-  "13157260-3",
-  "13933519-8",
-  "22228598-4",
-  "20848270-k",
-  "8717244-9",
-  "21226645-0",
-  "8163859-4",
-  "9664972-k",
-  "5795186-9",
-  "8404479-2",
-  "23876099-2",
-  "14132930-8",
-  "21259509-8",
-  "15922759-6",
-  "18404045-k",
-  "20219404-4",
-  "6536807-2",
-  "9139509-6",
-  "6459334-k",
-  "16198754-9",
-  "21471415-9",
-  "22258617-8",
-  "22169211-k",
-  "7563763-2",
-  "8638506-6",
-  "16973618-9",
-  "5006143-4",
-  "12321617-2",
-  "12906142-1",
-  "16967491-4",
-  "10116979-0",
-  "19070757-1",
-  "13906955-2",
-  "23270970-7",
-  "8286554-3",
-  "7958157-7",
-  "11677547-6",
-  "15813856-5",
-  "7766244-8",
-  "10029814-7",
-  "11883853-k",
-  "7559600-6",
-  "17383995-2",
-  "14325799-1",
-  "9430534-9",
-  "10815518-3",
-  "23657593-4",
-  "8441449-2",
-  "9212205-0",
-  "17228876-6",
-  "18955126-6",
-  "10961665-6",
-  "13118545-6",
-  "8583014-7",
-  "22886943-0",
-  "17433904-k",
-  "12393542-k",
-  "18034488-8",
-  "15521067-2",
-  "5398836-9",
-  "13489053-3",
-  "18581750-4",
-  "24719070-8",
-  "16011681-1",
-  "17545824-7",
-  "5300289-7",
-  "15652697-5",
-  "20940798-1",
-  "9842523-3",
-  "20218945-8",
-  "24245775-7",
-  "7682590-4",
-  "8844189-3",
-  "18072197-5",
-  "16829896-k",
-  "12382201-3",
-  "7828159-6",
-  "15735519-8",
-  "22030750-6",
-  "15555439-8",
-  "9398507-9",
-  "8510174-9",
-  "13995219-7",
-  "22083782-3",
-  "17668293-0",
-  "18278262-9",
-  "14701778-2",
-  "13267655-0",
-  "22198688-1",
-  "20132028-3",
-  "23616958-8",
-  "24851498-1",
-  "18483977-6",
-  "7807866-9",
-  "11418750-k",
-  "15146355-k",
-  "23468316-0",
-  "17036407-4",
-  "10500131-2",
-  "21019638-2",
-  "9369711-1",
-  "9715359-0",
-  "19651837-1",
-  "18655007-2",
-  "24259259-k",
-  "5115398-7",
-  "12617308-3",
-  "24659516-k",
-  "19140504-8",
-  "9201809-1",
-  "8565318-0",
-  "14915663-1",
-  "24048564-8",
-  "21629327-4",
-  "17974228-4",
-  "23605789-5",
-  "11467209-2",
-  "22583285-4",
-  "21854127-5",
-  "12264463-4",
-  "13501036-7",
-  "17548100-1",
-  "11869387-6",
-  "6659915-9",
-  "24994230-8",
-  "7668418-9",
-  "17504975-4",
-  "6658534-4",
-  "16843388-3",
-  "23264352-8",
-  "12512882-3",
-  "9523071-7",
-  "14433213-k",
-  "22729844-8",
-  "11652025-7",
-  "20890306-3",
-  "6075493-4",
-  "15296345-9",
-  "13385656-0",
-  "18939091-2",
-  "7694073-8",
-  "14996855-5",
-  "12126525-7",
-  "18828725-5",
-  "12879161-2",
-  "21726062-0",
-  "9234990-k",
-  "15978509-2",
-  "22824338-8",
-  "16177928-8",
-  "22140934-5",
-  "21032976-5",
-  "20842590-0",
-  "21033978-7",
-  "13686029-1",
-  "18266735-8",
-  "22114797-9",
-  "9030836-k",
-  "14496900-6",
-  "19557235-6",
-  "14907877-0",
-  "24177638-7",
-  "9897999-9",
-  "11332377-9",
-  "21129510-4",
-  "6183664-0",
-  "16436024-5",
-  "14000051-5",
-  "12652582-6",
-  "20746267-5",
-  "6931614-k",
-  "10839795-0",
-  "8769768-1",
-  "8357180-2",
-  "24975521-4",
-  "6670157-3",
-  "13835391-5",
-  "23709940-0",
-  "15693534-4",
-  "15782804-5",
-  "23111624-9",
-  "15411184-0",
-  "6195308-6",
-  "15660193-4",
-  "16389663-k",
-  "18952338-6",
-  "13115442-9",
-  "22436116-5",
-  "11750653-3",
-  "14770608-1",
-  "20399940-2",
-  "20489165-6",
-  "19336080-7",
-  "6045164-8",
-  "7911901-6",
-  "9257238-2",
-  "21384706-6",
-  "6899126-9",
-  "15177773-2",
-  "11433020-5",
-  "7006714-5",
-  "11694339-5",
-  "17309525-2",
-  "14204349-1",
-  "10684840-8",
-  "21630451-9",
-  "12880125-1",
-  "16620887-4",
-  "5469034-7",
-  "11304685-6",
-  "22731876-7",
-  "23213840-8",
-  "16058337-1",
-  "12201021-k",
-  "17499698-9",
-  "11016313-4",
-  "17528196-7",
-  "24746974-5",
-  "11011017-0",
-  "6029736-3",
-  "12955168-2",
-  "22313892-6",
-  "8787719-1",
-  "19547072-3",
-  "24352988-3",
-  "18792942-3",
-  "20162503-3",
-  "15621107-9",
-  "9103376-3",
-  "14250445-6",
-  "15408151-8",
-  "20471774-5",
-  "11214154-5",
-  "16868313-8",
-  "20256691-k",
-  "11569827-3",
-  "6760489-k",
-  "18000602-8",
-  "24174033-1",
-  "20998799-6",
-  "5011328-0",
-  "15994335-6",
-  "17742913-9",
-  "11715051-8",
-  "20737610-8",
-  "20621072-9",
-  "5272372-8",
-  "7685015-1",
-  "8478980-1",
-  "16087652-2",
-  "9207930-9",
-  "22344991-3",
-  "5943856-5",
-  "14769761-9",
-  "19716813-7",
-  "24168008-8",
-  "23788149-4",
-  "11757274-9",
-  "16813829-6",
-  "12707242-6",
-  "5544999-6",
-  "21005892-3",
-  "8039186-2",
-  "19460466-1",
-  "6920267-5",
-  "11330550-9",
-  "13934653-k",
-  "7644713-6",
-  "18858399-7",
-  "12276299-8",
-  "10598129-5",
-  "16941949-3",
-  "17452024-0",
-  "15775527-7",
-  "18589792-3",
-  "20404272-1",
-  "7703644-k",
-  "7861125-1",
-  "21437954-6",
-  "23365798-0",
-  "6312158-4",
-  "18643139-1",
-  "24128323-2",
-  "21318947-6",
-  "12872210-6",
-  "23454758-5",
-  "16670256-9",
-  "7056695-8",
-  "7744593-5",
-  "17118053-8",
-  "22949944-0",
-  "13958995-5",
-  "14699225-0",
-  "10785487-8",
-  "10766743-1",
-  "19761741-1",
-  "23947556-6",
-  "20188538-8",
-  "13988043-9",
-  "5250134-2",
-  "24069191-4",
-  "20820456-4",
-  "14216910-k",
-  "15206695-3",
-  "7644157-k",
-  "17028525-5",
-  "9645625-5",
-  "23034235-0",
-  "24835279-5",
-  "10057269-9",
-  "13050668-2",
-  "19795610-0",
-  "8703954-4",
-  "11977550-7",
-  "15084290-5",
-  "22819765-3",
-  "17141640-k",
-  "9352139-0",
-  "19352551-2",
-  "14634054-7",
-  "12481548-7",
-  "22303445-4",
-  "17764623-7",
-  "5897783-7",
-  "5630321-9",
-  "22825918-7",
-  "14295628-4",
-  "15541530-4",
-  "24236400-7",
-  "5589465-5",
-  "8364939-9",
-  "8760114-5",
-  "9342323-2",
-  "10961154-9",
-  "12074843-2",
-  "7572518-3",
-  "10361345-0",
-  "5416773-3",
-  "20996205-5",
-  "12639994-4",
-  "7163433-7",
-  "24134139-9",
-  "8526475-3",
-  "20304964-1",
-  "8627571-6",
-  "19134017-5",
-  "24019335-3",
-  "23755183-4",
-  "18592188-3",
-  "14966975-2",
-  "24804874-3",
-  "5831505-2",
-  "18106476-5",
-  "15221150-3",
-  "16561794-0",
-  "11961325-6",
-  "14173700-7",
-  "15785047-4",
-  "17541243-3",
-  "9138127-3",
-  "21903060-6",
-  "13995446-7",
-  "19962452-0",
-  "22196300-8",
-  "9589120-9",
-  "18454650-7",
-  "20555661-3",
-  "22906367-7",
-  "19365868-7",
-  "6538759-k",
-  "19597574-4",
-  "10274102-1",
-  "7364633-2",
-  "17698953-k",
-  "13512754-k",
-  "6065478-6",
-  "20365595-9",
-  "17240110-4",
-  "16529743-1",
-  "5725331-2",
-  "9759237-3",
-  "19831148-0",
-  "17223056-3",
-  "11131168-4",
-  "9824684-3",
-  "15632837-5",
-  "10052264-0",
-  "13832640-3",
-  "12054575-2",
-  "13768090-4",
-  "7649761-3",
-  "9442326-0",
-  "22324926-4",
-  "12255866-5",
-  "16236892-3",
-  "24923122-3",
-  "8817685-5",
-  "23071998-5",
-  "14750580-9",
-  "16527603-5",
-  "21118827-8",
-  "9186791-5",
-  "23459335-8",
-  "6390655-7",
-  "19069687-1",
-  "21766170-6",
-  "12946148-9",
-  "20741380-1",
-  "15495837-1",
-  "6174484-3",
-  "7191020-2",
-  "14521874-8",
-  "22106506-9",
-  "18015506-6",
-  "24685346-0",
-  "24011704-5",
-  "14796375-0",
-  "9860653-k",
-  "11929004-k",
-  "18075835-6",
-  "6086082-3",
-  "21463407-4",
-  "22255676-7",
-  "14061130-1",
-  "18305790-1",
-  "16791909-k",
-  "21395614-0",
-  "16310567-5",
-  "24383292-6",
-  "10483776-k",
-  "19947634-3",
-  "8148768-5",
-  "23845252-k",
-  "6744537-6",
-  "6534068-2",
-  "18467173-5",
-  "21652106-4",
-  "7441429-k",
-  "21310430-6",
-  "17591654-7",
-  "23613404-0",
-  "16606037-0",
-  "9102066-1",
-  "7865232-2",
-  "16480979-k",
-  "7058481-6",
-  "23506864-8",
-  "19507752-5",
-  "14402032-4",
-  "7460274-6",
-  "17716677-4",
-  "15219477-3",
-  "18545829-6",
-  "24479024-0",
-  "12772182-3",
-  "23314759-1",
-  "11329045-5",
-  "18126419-5",
-  "5934257-6",
-  "17575605-1",
-  "11018450-6",
-  "14792265-5",
-  "16188654-8",
-  "17886790-3",
-  "23533065-2",
-  "5063160-5",
-  "15651778-k",
-  "17920137-2",
-  "16614267-9",
-  "12549294-0",
-  "20700884-2",
-  "15367546-5",
-  "7688681-4",
-  "13702154-4",
-  "16372735-8",
-  "10114982-k",
-  "15117617-8",
-  "17970668-7",
-  "13240193-4",
-  "20645840-2",
-  "15809780-k",
-  "7522400-1",
-  "23216980-k",
-  "20249522-2",
-  "19284479-7",
-  "20374107-3",
-  "15301194-k",
-  "23927013-1",
-  "22702922-6",
-  "8632849-6",
-  "19040030-1",
-  "5898420-5",
-  "16304577-k",
-  "5075156-2",
-  "21056300-8",
-  "7070999-6",
-  "23085852-7",
-  "21661830-0",
-  "16914012-k",
-  "16992063-k",
-  "9132374-5",
-  "7901770-1",
-  "22577755-1",
-  "19701003-7",
-  "19138157-2",
-  "12742337-7",
-  "13706924-5",
-  "13227836-9",
-  "19859750-3",
-  "18107535-k",
-  "11023742-1",
-  "21649457-1",
-  "19864166-9",
-  "11571513-5",
-  "10757524-3",
-  "18496935-1",
-  "5778994-8",
-  "12834088-2",
-  "6843975-2",
-  "6252159-7",
-  "19480306-0",
-  "23612588-2",
-  "13920997-4",
-  "9795577-8",
-  "12095010-k",
-  "16933424-2",
-  "20680568-4",
-  "19935336-5",
-  "16469044-k",
-  "16820878-2",
-  "5477743-4",
-  "11044304-8",
-  "11030016-6",
-  "17711011-6",
-  "9765939-7",
-  "10856130-0",
-  "13963850-6",
-  "17955462-3",
-  "22817021-6",
-  "15089807-2",
-  "18783431-7",
-  "23909571-2",
-  "10051656-k",
-  "20902823-9",
-  "16658531-7",
-  "20067736-6",
-  "14447525-9",
-  "24450873-1",
-  "20261331-4",
-  "18963271-1",
-  "7590674-9",
-  "15936456-9",
-  "24638379-0",
-  "17602300-7",
-  "8760294-k",
-  "16693871-6",
-  "13315515-5",
-  "24788122-0",
-  "20306209-5",
-  "8434360-9",
-  "18011268-5",
-  "12878115-3",
-  "9813497-2",
-  "9243325-0",
-  "18589064-3",
-  "9092538-5",
-  "15870214-2",
-  "14842753-4",
-  "24522908-9",
-  "5266131-5",
-  "21395414-8",
-  "19376107-0",
-  "13984547-1",
-  "15902894-1",
-  "21408506-2",
-  "9893163-5",
-  "23002355-7",
-  "21682706-6",
-  "15142812-6",
-  "24000992-7",
-  "8160082-1",
-  "9709210-9",
-  "18757954-6",
-  "20107422-3",
-  "10976039-0",
-  "12862243-8",
-  "6438859-2",
-  "20479435-9",
-  "12028493-2",
-  "8955571-k",
-  "24736852-3",
-  "11435441-4",
-  "17668741-k",
-  "10241284-2",
-  "17609995-k",
-  "21079345-3",
-  "5622715-6",
-  "20899498-0",
-  "17695924-k",
-  "10624423-5",
-  "22015203-0",
-  "15993958-8",
-  "10542655-0",
-  "19151407-6",
-  "7964894-9",
-  "6772355-4",
-  "23570919-8",
-  "7571864-0",
-  "15155397-4",
-  "21454335-4",
-  "12271433-0",
-  "17700193-7",
-  "15133737-6",
-  "11042260-1",
-  "18105320-8",
-  "9957008-3",
-  "12119829-0",
-  "6287802-9",
-  "7154029-4",
-  "21118459-0",
-  "14415657-9",
-  "7041954-8",
-  "6214481-5",
-  "10697139-0",
-  "17322466-4",
-  "18570741-5",
-  "18001257-5",
-  "19730484-7",
-  "11810237-1",
-  "13366483-1",
-  "21792419-7",
-  "7077960-9",
-  "22456970-k",
-  "19960657-3",
-  "22529846-7",
-  "18639316-3",
-  "5271893-7",
-  "20286857-6",
-  "15543466-k",
-  "12330110-2",
-  "17616783-1",
-  "16895977-k",
-  "18099443-2",
-  "23811891-3",
-  "17463331-2",
-  "15814719-k",
-  "9722031-k",
-  "10801857-7",
-  "12003756-0",
-  "23548582-6",
-  "12043276-1",
-  "9734720-4",
-  "9834915-4",
-  "20022902-9",
-  "13575882-5",
-  "10914051-1",
-  "11583348-0",
-  "23571114-1",
-  "5931217-0",
-  "20155063-7",
-  "19123293-3",
-  "24359213-5",
-  "20366129-0",
-  "8531893-4",
-  "8849592-6",
-  "12155853-k",
-  "20902552-3",
-  "12670331-7",
-  "21371568-2",
-  "8133427-7",
-  "24655802-7",
-  "14664466-k",
-  "18265965-7",
-  "17490731-5",
-  "8111782-9",
-  "9366063-3",
-  "16858760-0",
-  "22404484-4",
-  "21859423-9",
-  "19483194-3",
-  "9440978-0",
-  "5526418-k",
-  "23641002-1",
-  "16165429-9",
-  "16402662-0",
-  "12216256-7",
-  "5635490-5",
-  "6570852-3",
-  "24383945-9",
-  "18252261-9",
-  "22131745-9",
-  "23281828-k",
-  "20359909-9",
-  "24819665-3",
-  "8666187-k",
-  "23558488-3",
-  "6998264-6",
-  "18367263-0",
-  "5146815-5",
-  "6072179-3",
-  "15950581-2",
-  "22839557-9",
-  "22324025-9",
-  "18127102-7",
-  "19410517-7",
-  "6197207-2",
-  "22981711-6",
-  "10475711-1",
-  "7666324-6",
-  "17078145-7",
-  "16252815-7",
-  "20779733-2",
-  "19054661-6",
-  "22728631-8",
-  "14350047-0",
-  "17899478-6",
-  "7775211-0",
-  "12100916-1",
-  "5200371-7",
-  "21195861-8",
-  "12159721-7",
-  "7519485-4",
-  "17986185-2",
-  "24965647-k",
-  "13136077-0",
-  "13540666-k",
-  "8116994-2",
-  "20639056-5",
-  "23002620-3",
-  "18365053-k",
-  "12094438-k",
-  "7396788-0",
-  "7611779-9",
-  "5604213-k",
-  "6468714-k",
-  "20034966-0",
-  "10424768-7",
-  "16254475-6",
-  "10380706-9",
-  "20767069-3",
-  "18664019-5",
-  "10587852-4",
-  "5005986-3",
-  "22907046-0",
-  "15316177-1",
-  "17224016-k",
-  "18275875-2",
-  "16945149-4",
-  "12262341-6",
-  "19661363-3",
-  "19306703-4",
-  "15141558-k",
-  "12058304-2",
-  "23337367-2",
-  "5644910-8",
-  "19248277-1",
-  "20236603-1",
-  "19026160-3",
-  "13808582-1",
-  "20266480-6",
-  "24698003-9",
-  "6015230-6",
-  "11453497-8",
-  "19839730-k",
-  "10781259-8",
-  "9783132-7",
-  "21232788-3",
-  "21121805-3",
-  "10755268-5",
-  "23420967-1",
-  "6954953-5",
-  "13675798-9",
-  "21007153-9",
-  "14872360-5",
-  "10212609-2",
-  "12351523-4",
-  "24935655-7",
-  "11961050-8",
-  "6587133-5",
-  "23951170-8",
-  "7263834-4",
-  "21887682-k",
-  "16330167-9",
-  "19467246-2",
-  "15050153-9",
-  "9534750-9",
-  "22547263-7",
-  "21357567-8",
-  "10273729-6",
-  "20858389-1",
-  "13869955-2",
-  "9709994-4",
-  "13528643-5",
-  "11582658-1",
-  "8187885-4",
-  "14602177-8",
-  "13833607-7",
-  "14504589-4",
-  "10186275-5",
-  "21343910-3",
-  "23290793-2",
-  "14800215-0",
-  "8290681-9",
-  "8941062-2",
-  "17527370-0",
-  "23514615-0",
-  "14810338-0",
-  "20147048-k",
-  "15802024-6",
-  "10715053-6",
-  "22119022-k",
-  "11634206-5",
-  "9081320-k",
-  "21537797-0",
-  "9071323-k",
-  "15904258-8",
-  "11332962-9",
-  "20606749-7",
-  "6249279-1",
-  "14522881-6",
-  "14858756-6",
-  "20083534-4",
-  "18283406-8",
-  "7967034-0",
-  "13614518-5",
-  "16657154-5",
-  "5301742-8",
-  "11692738-1",
-  "18069117-0",
-  "23808785-6",
-  "12399354-3",
-  "19259012-4",
-  "7409179-2",
-  "12019970-6",
-  "7732416-k",
-  "23716339-7",
-  "15546156-k",
-  "19493231-6",
-  "13249143-7",
-  "17905220-2",
-  "22695239-k",
-  "24743623-5",
-  "10894588-5",
-  "18553205-4",
-  "9212360-k",
-  "13827653-8",
-  "8854989-9",
-  "9756433-7",
-  "21490786-0",
-  "18359452-4",
-  "22277993-6",
-  "10712729-1",
-  "12196097-4",
-  "7164412-k",
-  "23911690-6",
-  "9321100-6",
-  "23723216-k",
-  "20545173-0",
-  "12930990-3",
-  "23139625-k",
-  "21566161-k",
-  "13276585-5",
-  "9253184-8",
-  "19242921-8",
-  "9536897-2",
-  "9964558-k",
-  "17308616-4",
-  "15106120-6",
-  "15225367-2",
-  "19397222-5",
-  "11697045-7",
-  "22261746-4",
-  "15079677-6",
-  "21879214-6",
-  "16360974-6",
-  "8928858-4",
-  "18683796-7",
-  "21110419-8",
-  "8685473-2",
-  "24228051-2",
-  "17685844-3",
-  "13252256-1",
-  "11681775-6",
-  "19509696-1",
-  "22117930-7",
-  "21594383-6",
-  "20174546-2",
-  "8496817-k",
-  "6187494-1",
-  "5006252-k",
-  "16748492-1",
-  "8144011-5",
-  "21338073-7",
-  "15574583-5",
-  "17269577-9",
-  "13865925-9",
-  "14231903-9",
-  "8673125-8",
-  "5229967-5",
-  "20079512-1",
-  "24688097-2",
-  "6228335-1",
-  "7294727-4",
-  "20982443-4",
-  "13270644-1",
-  "13303763-2",
-  "16057185-3",
-  "21186052-9",
-  "8316277-5",
-  "24783936-4",
-  "8958606-2",
-  "24130464-7",
-  "24385412-1",
-  "20312776-6",
-  "15775382-7",
-  "13863676-3",
-  "16623918-4",
-  "12757052-3",
-  "22739480-3",
-  "8277325-8",
-  "22686081-9",
-  "22476931-8",
-  "8050156-0",
-  "16268319-5",
-  "6037807-k",
-  "7966258-5",
-  "6347809-1",
-  "7051340-4",
-  "6217637-7",
-  "24816673-8",
-  "11167628-3",
-  "6467053-0",
-  "22671282-8",
-  "20684968-1",
-  "9010113-7",
-  "16422585-2",
-  "23709415-8",
-  "17237398-4",
-  "10847347-9",
-  "22433126-6",
-  "9685208-8",
-  "22393733-0",
-  "19621111-k",
-  "16833615-2",
-  "18121423-6",
-  "12842780-5",
-  "20363655-5",
-  "13706202-k",
-  "15331369-5",
-  "20957594-9",
-  "10010009-6",
-  "18821395-2",
-  "22835832-0",
-  "14339521-9",
-  "18391400-6",
-  "18290793-6",
-  "10539256-7",
-  "16069108-5",
-  "12170469-2",
-  "13611769-6",
-  "5094719-k",
-  "13315780-8",
-  "15916705-4",
-  "5779085-7",
-  "11132488-3",
-  "12152758-8",
-  "19599964-3",
-  "18961619-8",
-  "13184050-0",
-  "13750509-6",
-  "22548063-k",
-  "18611897-9",
-  "17925935-4",
-  "6876307-k",
-  "16610918-3",
-  "8746626-4",
-  "18021519-0",
-  "8277365-7",
-  "10817265-7",
-  "10355759-3",
-  "11108869-1",
-  "16907624-3",
-  "10048703-9",
-  "11878222-4",
-  "19964480-7",
-  "19966546-4",
-  "11478587-3",
-  "21488538-7",
-  "17711895-8",
-  "22405457-2",
-  "7358736-0",
-  "19137853-9",
-  "16731036-2",
-  "15271305-3",
-  "12852281-6",
-  "5389209-4",
-  "9493023-5",
-  "23461957-8",
-  "16268871-5",
-  "13991325-6",
-  "18868504-8",
-  "19963139-k",
-  "19017386-0",
-  "24089551-k",
-  "12542656-5",
-  "10607054-7",
-  "13590821-5",
-  "9532354-5",
-  "11860406-7",
-  "20631205-k",
-  "16768100-k",
-  "12697414-0",
-  "19660881-8",
-  "6953813-4",
-  "15088554-k",
-  "18682302-8",
-  "17032363-7",
-  "10883545-1",
-  "24010623-k",
-  "22273661-7",
-  "21610005-0",
-  "8255823-3",
-  "24927628-6",
-  "8353951-8",
-  "8981030-2",
-  "12504414-k",
-  "12718206-k",
-  "15617353-3",
-  "21660994-8",
-  "17806942-k",
-  "18610218-5",
-  "19626241-5",
-  "5270796-k",
-  "21520628-9",
-  "20692666-k",
-  "7840500-7",
-  "17513514-6",
-  "8548669-1",
-  "21783391-4",
-  "7926569-1",
-  "20762585-k",
-  "20241623-3",
-  "7708254-9",
-  "11881637-4",
-  "19267611-8",
-  "8796961-4",
-  "14772201-k",
-  "17999527-1",
-  "10977916-4",
-  "11807839-k",
-  "14266330-9",
-  "20165703-2",
-  "15789724-1",
-  "11811033-1",
-  "8365254-3",
-  "8259717-4",
-  "7888334-0",
-  "16301481-5",
-  "23135043-8",
-  "24351200-k",
-  "21749930-5",
-  "12790375-1",
-  "7725085-9",
-  "7029756-6",
-  "17695586-4",
-  "11212201-k",
-  "24108441-8",
-  "9738013-9",
-  "22166932-0",
-  "14951357-4",
-  "8820685-1",
-  "10410726-5",
-  "12474916-6",
-  "11634565-k",
-  "11007758-0",
-  "7108908-8",
-  "23356089-8",
-  "24452119-3",
-  "24277911-8",
-  "20370559-k",
-  "11286741-4",
-  "24097017-1",
-  "19031165-1",
-  "21849739-k",
-  "13229020-2",
-  "9960672-k",
-  "5793737-8",
-  "18185100-7",
-  "16323617-6",
-  "12439164-4",
-  "18105155-8",
-  "22331481-3",
-  "17357173-9",
-  "16372876-1",
-  "17826165-7",
-  "5390619-2",
-  "16301373-8",
-  "24719158-5",
-  "6276685-9",
-  "13881511-0",
-  "22076191-6",
-  "14180548-7",
-  "21930252-5",
-  "16490770-8",
-  "10163398-5",
-  "22358756-9",
-  "19007583-4",
-  "21829984-9",
-  "9815491-4",
-  "7812624-8",
-  "7467442-9",
-  "22598652-5",
-  "23566983-8",
-  "12913970-6",
-  "6315631-0",
-  "6635188-2",
-  "12049263-2",
-  "18058758-6",
-  "9646222-0",
-  "23655127-k",
-  "20555458-0",
-  "21949544-7",
-  "18301131-6",
-  "19295623-4",
-  "22542694-5",
-  "7967867-8",
-  "13341159-3",
-  "22027158-7",
-  "8059792-4",
-  "15733985-0",
-  "21206130-1",
-  "13504334-6",
-  "15522917-9",
-  "20175691-k",
-  "19987845-k",
-  "12159813-2",
-  "11796407-8",
-  "13107704-1",
-  "24141645-3",
-  "11470386-9",
-  "21656145-7",
-  "8742239-9",
-  "13772897-4",
-  "6130040-6",
-  "15689402-8",
-  "5240411-8",
-  "15580521-8",
-  "19307445-6",
-  "17243826-1",
-  "22099473-2",
-  "15249903-5",
-  "11748130-1",
-  "10251874-8",
-  "5303133-1",
-  "13706899-0",
-  "14218526-1",
-  "16593911-5",
-  "6326425-3",
-  "15200089-8",
-  "6105933-4",
-  "24305328-5",
-  "15761233-6",
-  "7121511-3",
-  "24115122-0",
-  "5711372-3",
-  "16453496-0",
-  "16707118-k",
-  "19023709-5",
-  "22789683-3",
-  "13238559-9",
-  "22259680-7",
-  "6506979-2",
-  "18207103-k",
-  "17022684-4",
-  "20047653-0",
-  "13013030-5",
-  "11455166-k",
-  "8263698-6",
-  "16329286-6",
-  "15942321-2",
-  "12756525-2",
-  "23657699-k",
-  "9591471-3",
-  "9711509-5",
-  "8923805-6",
-  "12880434-k",
-  "7542146-k",
-  "8193048-1",
-  "22674575-0",
-  "11600403-8",
-  "18715546-0",
-  "22562826-2",
-  "14119735-5",
-  "6689020-1",
-  "24801523-3",
-  "8557870-7",
-  "7603605-5",
-  "6536272-4",
-  "19138569-1",
-  "20894979-9",
-  "8665036-3",
-  "11675462-2",
-  "22470750-9",
-  "23700446-9",
-  "15416512-6",
-  "7678960-6",
-  "23314315-4",
-  "11558672-6",
-  "13271279-4",
-  "10390156-1",
-  "22878539-3",
-  "10606162-9",
-  "12790939-3",
-  "16280996-2",
-  "18956981-5",
-  "7482529-k",
-  "21894017-k",
-  "5018589-3",
-  "10042936-5",
-  "19498269-0",
-  "23303819-9",
-  "22224215-0",
-  "19616330-1",
-  "10667374-8",
-  "13604943-7",
-  "20917384-0",
-  "14767410-4",
-  "13114061-4",
-  "17356621-2",
-  "16535798-1",
-  "22976186-2",
-  "8768259-5",
-  "10520798-0",
-  "19546227-5",
-  "20630773-0",
-  "8094657-0",
-  "19338311-4",
-  "12884428-7",
-  "11974012-6",
-  "18371541-0",
-  "15327390-1",
-  "19759101-3",
-  "13079368-1",
-  "13523478-8",
-  "21812532-8",
-  "10975425-0",
-  "21098805-k",
-  "14644678-7",
-  "6291660-5",
-  "13852394-2",
-  "5652805-9",
-  "11410573-2",
-  "24366252-4",
-  "19497514-7",
-  "8026546-8",
-  "14386317-4",
-  "17443468-9",
-  "22207599-8",
-  "19674213-1",
-  "14743650-5",
-  "20414925-9",
-  "9042326-6",
-  "23914399-7",
-  "23989933-1",
-  "14331280-1",
-  "13402424-0",
-  "5767727-9",
-  "6989752-5",
-  "10309859-9",
-  "18039539-3",
-  "22011412-0",
-  "10522013-8",
-  "10477392-3",
-  "21901824-k",
-  "10543317-4",
-  "6861638-7",
-  "15838439-6",
-  "8200182-4",
-  "16264785-7",
-  "10227342-7",
-  "15228833-6",
-  "18482469-8",
-  "12587674-9",
-  "9120703-6",
-  "16440808-6",
-  "17296708-6",
-  "13926304-9",
-  "24736263-0",
-  "5278431-k",
-  "7635085-k",
-  "6741705-4",
-  "11641909-2",
-  "22546558-4",
-  "7742230-7",
-  "17019256-7",
-  "19164598-7",
-  "24825885-3",
-  "20185398-2",
-  "8202830-7",
-  "18122705-2",
-  "17945052-6",
-  "20813124-9",
-  "17550480-k",
-  "19396350-1",
-  "14218856-2",
-  "19399415-6",
-  "18644162-1",
-  "16637124-4",
-  "23226237-0",
-  "16551907-8",
-  "19642860-7",
-  "6404234-3",
-  "9931790-6",
-  "11257166-3",
-  "13186960-6",
-  "14994090-1",
-  "7507403-4",
-  "5796715-3",
-  "7872346-7",
-  "21267493-1",
-  "17491036-7",
-  "18017764-7",
-  "23420500-5",
-  "8435098-2",
-  "8030829-9",
-  "7527831-4",
-  "6686199-6",
-  "11675721-4",
-  "14521490-4",
-  "22455416-8",
-  "21014236-3",
-  "18652486-1",
-  "16566760-3",
-  "11088942-9",
-  "6277384-7",
-  "8729948-1",
-  "17766258-5",
-  "14216208-3",
-  "14339031-4",
-  "21055886-1",
-  "18956654-9",
-  "6512695-8",
-  "20767191-6",
-  "5266955-3",
-  "5455031-6",
-  "17591547-8",
-  "7567004-4",
-  "7032079-7",
-  "11549617-4",
-  "7392896-6",
-  "24202548-2",
-  "18539882-k",
-  "13454474-0",
-  "11203784-5",
-  "6028452-0",
-  "8960336-6",
-  "17658006-2",
-  "9165517-9",
-  "21219734-3",
-  "17561231-9",
-  "18150300-9",
-  "13874875-8",
-  "13862054-9",
-  "5729342-k",
-  "13959179-8",
-  "6592578-8",
-  "14628549-k",
-  "11741810-3",
-  "22296369-9",
-  "5006448-4",
-  "8674130-k",
-  "22526319-1",
-  "7187802-3",
-  "24048319-k",
-  "20019868-9",
-  "12023593-1",
-  "11379027-k",
-  "10229860-8",
-  "22199280-6",
-  "17583876-7",
-  "19152877-8",
-  "8081251-5",
-  "12670786-k",
-  "18346832-4",
-  "14080369-3",
-  "17782224-8",
-  "10403379-2",
-  "18298193-1",
-  "9019203-5",
-  "16117218-9",
-  "5927552-6",
-  "22249523-7",
-  "21942425-6",
-  "23771987-5",
-  "24765791-6",
-  "12512132-2",
-  "9221689-6",
-  "17182762-0",
-  "6578469-6",
-  "23131879-8",
-  "7818424-8",
-  "17411152-9",
-  "6506101-5",
-  "16878588-7",
-  "21393205-5",
-  "13305893-1",
-  "10612526-0",
-  "19507548-4",
-  "15507682-8",
-  "10472592-9",
-  "7657802-8",
-  "10218165-4",
-  "8791436-4",
-  "6924752-0",
-  "23076142-6",
-  "6492213-0",
-  "16143981-9",
-  "11611895-5",
-  "13688280-5",
-  "18635932-1",
-  "5287899-3",
-  "17229894-k",
-  "23761085-7",
-  "15145573-5",
-  "12857559-6",
-  "16281723-k",
-  "13698613-9",
-  "22249873-2",
-  "10102246-3",
-  "14016883-1",
-  "21978617-4",
-  "11940877-6",
-  "22433473-7",
-  "14628653-4",
-  "24977387-5",
-  "19992166-5",
-  "20257546-3",
-  "19467272-1",
-  "16491022-9",
-  "16633903-0",
-  "15706905-5",
-  "11845582-7",
-  "17234421-6",
-  "19414810-0",
-  "19292799-4",
-  "21022713-k",
-  "7003921-4",
-  "17141822-4",
-  "11188294-0",
-  "7345006-3",
-  "21340441-5",
-  "17647987-6",
-  "9608412-9",
-  "23740934-5",
-  "8726625-7",
-  "21500018-4",
-  "23760464-4",
-  "14064842-6",
-  "10648303-5",
-  "7874193-7",
-  "13617942-k",
-  "10300210-9",
-  "21498067-3",
-  "13332095-4",
-  "6365279-2",
-  "6447197-k",
-  "24428284-9",
-  "18771113-4",
-  "20027109-2",
-  "22331571-2",
-  "23469987-3",
-  "17698459-7",
-  "20184242-5",
-  "21297523-0",
-  "13426639-2",
-  "9844767-9",
-  "22585835-7",
-  "12917606-7",
-  "24508755-1",
-  "9522897-6",
-  "24877847-4",
-  "15144938-7",
-  "23690437-7",
-  "17057352-8",
-  "24969174-7",
-  "7457353-3",
-  "23590081-5",
-  "21188858-k",
-  "24394731-6",
-  "17801231-2",
-  "5880745-1",
-  "23728150-0",
-  "16435085-1",
-  "17409687-2",
-  "12143138-6",
-  "24236467-8",
-  "16444238-1",
-  "22771624-k",
-  "15528860-4",
-  "13399849-7",
-  "14650334-9",
-  "5997904-3",
-  "18617427-5",
-  "5049943-k",
-  "12692503-4",
-  "9558502-7",
-  "17952635-2",
-  "13151081-0",
-  "7225382-5",
-  "18625633-6",
-  "8541364-3",
-  "12732281-3",
-  "22811548-7",
-  "24791537-0",
-  "20581648-8",
-  "20976407-5",
-  "9209846-k",
-  "7630157-3",
-  "16587647-4",
-  "22282325-0",
-  "21375660-5",
-  "20572404-4",
-  "21429831-7",
-  "15843536-5",
-  "20438801-6",
-  "23252911-3",
-  "24237964-0",
-  "5847502-5",
-  "6568174-9",
-  "21710035-6",
-  "10346602-4",
-  "10384497-5",
-  "18749696-9",
-  "20257285-5",
-  "9868782-3",
-  "5315354-2",
-  "21536913-7",
-  "18343877-8",
-  "23031580-9",
-  "23828618-2",
-  "23662114-6",
-  "16376678-7",
-  "16873101-9",
-  "7729222-5",
-  "15218380-1",
-  "7460100-6",
-  "18226564-0",
-  "6125194-4",
-  "23625675-8",
-  "18282953-6",
-  "24634370-5",
-  "12205205-2",
-  "10926766-k",
-  "10284637-0",
-  "22539875-5",
-  "7081997-k",
-  "22704914-6",
-  "24153400-6",
-  "22863576-6",
-  "18180773-3",
-  "24506678-3",
-  "6360510-7",
-  "16581799-0",
-  "10935244-6",
-  "16705752-7",
-  "18086210-2",
-  "7649546-7",
-  "6627256-7",
-  "8129120-9",
-  "6042018-1",
-  "9965797-9",
-  "9141436-8",
-  "23860450-8",
-  "13395743-k",
-  "13154268-2",
-  "5450397-0",
-  "10857168-3",
-  "10234084-1",
-  "14228295-k",
-  "23299374-k",
-  "23917891-k",
-  "21134462-8",
-  "6036404-4",
-  "21306226-3",
-  "7786798-8",
-  "14040300-8",
-  "20699078-3",
-  "24140869-8",
-  "6698172-k",
-  "12601405-8",
-  "10014647-9",
-  "9204657-5",
-  "5509313-k",
-  "12509895-9",
-  "18388152-3",
-  "16443122-3",
-  "12206677-0",
-  "7807057-9",
-  "10333214-1",
-  "8649433-7",
-  "14685483-4",
-  "17323567-4",
-  "18555449-k",
-  "20502980-k",
-  "17861077-5",
-  "10934303-k",
-  "6079853-2",
-  "10180867-k",
-  "17284312-3",
-  "16298164-1",
-  "7858365-7",
-  "9931852-k",
-  "14243263-3",
-  "6510774-0",
-  "21670200-k",
-  "12229966-k",
-  "13166628-4",
-  "22925851-6",
-  "15292380-5",
-  "20328247-8",
-  "21539911-7",
-  "9940250-4",
-  "14119793-2",
-  "22420787-5",
-  "20765093-5",
-  "13908714-3",
-  "20328692-9",
-  "11540174-2",
-  "11207027-3",
-  "11917568-2",
-  "8841157-9",
-  "7421201-8",
-  "23792221-2",
-  "18080822-1",
-  "5153499-9",
-  "21116174-4",
-  "13338148-1",
-  "22921086-6",
-  "20752338-0",
-  "10061215-1",
-  "16664439-9",
-  "19782408-5",
-  "24197561-4",
-  "7918364-4",
-  "14538988-7",
-  "6554907-7",
-  "15538282-1",
-  "18380404-9",
-  "20074673-2",
-  "24519149-9",
-  "19610091-1",
-  "6640294-0",
-  "5714823-3",
-  "12164767-2",
-  "19074836-7",
-  "8076436-7",
-  "18106173-1",
-  "24768306-2",
-  "10784352-3",
-  "21994310-5",
-  "23951271-2",
-  "17097437-9",
-  "14562054-6",
-  "8349108-6",
-  "14789019-2",
-  "13423875-5",
-  "8147324-2",
-  "8917414-7",
-  "5278571-5",
-  "5403789-9",
-  "6923069-5",
-  "11758291-4",
-  "13438878-1",
-  "15261223-0",
-  "17831910-8",
-  "14943996-k",
-  "23819342-7",
-  "21982756-3",
-  "7594981-2",
-  "12076201-k",
-  "13181720-7",
-  "23363013-6",
-  "10562331-3",
-  "9989842-9",
-  "24015714-4",
-  "17136100-1",
-  "21011554-4",
-  "7906047-k",
-  "13307022-2",
-  "14174955-2",
-  "9051655-8",
-  "8940791-5",
-  "5688121-2",
-  "18466755-k",
-  "9254459-1",
-  "10204417-7",
-  "9160221-0",
-  "8596485-2",
-  "11609269-7",
-  "10586429-9",
-  "13454784-7",
-  "17190036-0",
-  "20764127-8",
-  "8225054-9",
-  "10671901-2",
-  "23316459-3",
-  "8328308-4",
-  "21543689-6",
-  "5470717-7",
-  "9460666-7",
-  "8537660-8",
-  "20730562-6",
-  "9516897-3",
-  "24473226-7",
-  "8871429-6",
-  "6680336-8",
-  "19551946-3",
-  "18816080-8",
-  "21780088-9",
-  "21750344-2",
-  "12980734-2",
-  "13103993-k",
-  "20021335-1",
-  "18395805-4",
-  "19694802-3",
-  "22875314-9",
-  "23233237-9",
-  "23630864-2",
-  "12586623-9",
-  "9373969-8",
-  "18163223-2",
-  "14513511-7",
-  "23718849-7",
-  "19048224-3",
-  "13355614-1",
-  "17362361-5",
-  "21521912-7",
-  "9036251-8",
-  "21797193-4",
-  "24269254-3",
-  "7707021-4",
-  "14485563-9",
-  "20610012-5",
-  "11313765-7",
-  "13367927-8",
-  "18645941-5",
-  "23033898-1",
-  "10037186-3",
-  "6652705-0",
-  "20573052-4",
-  "9656856-8",
-  "6936328-8",
-  "20657108-k",
-  "19958664-5",
-  "11729155-3",
-  "24807916-9",
-  "10036857-9",
-  "17957680-5",
-  "16352564-k",
-  "10761706-k",
-  "18979329-4",
-  "13033220-k",
-  "9497542-5",
-  "24777354-1",
-  "8935215-0",
-  "13467063-0",
-  "8119346-0",
-  "8570610-1",
-  "19829976-6",
-  "6276911-4",
-  "18382664-6",
-  "10413859-4",
-  "14169785-4",
-  "7481301-1",
-  "14472304-k",
-  "9657851-2",
-  "16620743-6",
-  "24773813-4",
-  "10575219-9",
-  "23238102-7",
-  "9996454-5",
-  "10106687-8",
-  "9373973-6",
-  "9788523-0",
-  "20201635-9",
-  "18386610-9",
-  "15752032-6",
-  "23003132-0",
-  "24526090-3",
-  "22187054-9",
-  "6506968-7",
-  "17211369-9",
-  "23561612-2",
-  "5474659-8",
-  "6354337-3",
-  "24185104-4",
-  "13979858-9",
-  "18208368-2",
-  "22083955-9",
-  "5490183-6",
-  "10090131-5",
-  "11124241-0",
-  "23539645-9",
-  "16707206-2",
-  "7798229-9",
-  "22801708-6",
-  "16903480-k",
-  "23016087-2",
-  "23596605-0",
-  "9077769-6",
-  "15061966-1",
-  "10538373-8",
-  "23744147-8",
-  "18952215-0",
-  "24754001-6",
-  "9066247-3",
-  "22222874-3",
-  "9349947-6",
-  "12826775-1",
-  "15623111-8",
-  "21309860-8",
-  "13015297-k",
-  "16396175-k",
-  "9719915-9",
-  "14038441-0",
-  "7133609-3",
-  "8464783-7",
-  "20876946-4",
-  "5975759-8",
-  "15533972-1",
-  "7005865-0",
-  "14830055-0",
-  "23534592-7",
-  "23534223-5",
-  "12411469-1",
-  "18640645-1",
-  "18769978-9",
-  "6349607-3",
-  "5145184-8",
-  "6383488-2",
-  "8821156-1",
-  "21067204-4",
-  "9159035-2",
-  "21129668-2",
-  "22013600-0",
-  "17082995-6",
-  "12857948-6",
-  "13806802-1",
-  "14451905-1",
-  "18624765-5",
-  "13918611-7",
-  "18854254-9",
-  "19241437-7",
-  "22719686-6",
-  "5733093-7",
-  "21387921-9",
-  "12861027-8",
-  "17858849-4",
-  "16035698-7",
-  "13388398-3",
-  "5585293-6",
-  "5661396-k",
-  "15737399-4",
-  "24826860-3",
-  "20948881-7",
-  "6006346-k",
-  "14083385-1",
-  "16635477-3",
-  "24394336-1",
-  "19441614-8",
-  "6999489-k",
-  "10790391-7",
-  "20147242-3",
-  "23082439-8",
-  "9386018-7",
-  "9249441-1",
-  "9488364-4",
-  "19985761-4",
-  "6835355-6",
-  "22185460-8",
-  "20595884-3",
-  "24892754-2",
-  "14340423-4",
-  "12712698-4",
-  "10129038-7",
-  "15345794-8",
-  "20495591-3",
-  "21303362-k",
-  "24279606-3",
-  "19975564-1",
-  "7322472-1",
-  "14621808-3",
-  "23101708-9",
-  "16563406-3",
-  "16295638-8",
-  "15509318-8",
-  "19282209-2",
-  "19754766-9",
-  "9295729-2",
-  "21431738-9",
-  "11764192-9",
-  "24262217-0",
-  "21812164-0",
-  "24100442-2",
-  "15006889-4",
-  "12262624-5",
-  "10179776-7",
-  "7709513-6",
-  "23954176-3",
-  "21171658-4",
-  "20214069-6",
-  "11947070-6",
-  "17540346-9",
-  "13767208-1",
-  "14266774-6",
-  "24794984-4",
-  "6146888-9",
-  "23780644-1",
-  "12354003-4",
-  "14801225-3",
-  "22478638-7",
-  "19930847-5",
-  "23661829-3",
-  "15971172-2",
-  "7833632-3",
-  "6999840-2",
-  "13565180-k",
-  "10090092-0",
-  "21876907-1",
-  "15410230-2",
-  "6081613-1",
-  "15991168-3",
-  "24562713-0",
-  "18931379-9",
-  "20592314-4",
-  "17599606-0",
-  "16485331-4",
-  "23746359-5",
-  "5764493-1",
-  "6727400-8",
-  "7125785-1",
-  "5029862-0",
-  "15672761-k",
-  "22546171-6",
-  "22844278-k",
-  "19063727-1",
-  "13685120-9",
-  "23288346-4",
-  "17576225-6",
-  "10536397-4",
-  "8408916-8",
-  "18904054-7",
-  "16298230-3",
-  "19400944-5",
-  "19761483-8",
-  "6271396-8",
-  "8913940-6",
-  "23487303-2",
-  "6870157-0",
-  "18128131-6",
-  "8405360-0",
-  "13151884-6",
-  "21694550-6",
-  "5567917-7",
-  "15647388-k",
-  "15212448-1",
-  "17816540-2",
-  "7598474-k",
-  "12975120-7",
-  "24423141-1",
-  "12904143-9",
-  "19323931-5",
-  "19452673-3",
-  "14982596-7",
-  "18262693-7",
-  "16933132-4",
-  "22945592-3",
-  "5900470-0",
-  "17816771-5",
-  "23115025-0",
-  "20872647-1",
-  "20687949-1",
-  "16621164-6",
-  "6515611-3",
-  "20116797-3",
-  "14538430-3",
-  "10945084-7",
-  "20464711-9",
-  "16418619-9",
-  "19641084-8",
-  "19189977-6",
-  "7641008-9",
-  "18209904-k",
-  "15219588-5",
-  "19025043-1",
-  "23861327-2",
-  "11737440-8",
-  "8045672-7",
-  "9624985-3",
-  "6848710-2",
-  "20027983-2",
-  "14921362-7",
-  "19184511-0",
-  "9673261-9",
-  "9591023-8",
-  "12968861-0",
-  "8242272-2",
-  "24367506-5",
-  "21645725-0",
-  "10654651-7",
-  "9793014-7",
-  "8113416-2",
-  "6603348-1",
-  "24028992-k",
-  "15944308-6",
-  "8221980-3",
-  "19109128-0",
-  "12169148-5",
-  "9837591-0",
-  "17057621-7",
-  "23174945-4",
-  "21444189-6",
-  "20848586-5",
-  "12284303-3",
-  "17241004-9",
-  "20118394-4",
-  "7733880-2",
-  "13694497-5",
-  "5391472-1",
-  "7763448-7",
-  "16471338-5",
-  "8098055-8",
-  "7414736-4",
-  "10164503-7",
-  "20687913-0",
-  "6817833-9",
-  "9086563-3",
-  "10149954-5",
-  "19908874-2",
-  "11461319-3",
-  "13702768-2",
-  "9765308-9",
-  "7685224-3",
-  "17532441-0",
-  "24725741-1",
-  "16467399-5",
-  "10397771-1",
-  "22072907-9",
-  "22849363-5",
-  "14678829-7",
-  "20150040-0",
-  "7174739-5",
-  "7445812-2",
-  "14848069-9",
-  "13545522-9",
-  "15975728-5",
-  "6473589-6",
-  "5063643-7",
-  "10225449-k",
-  "7747062-k",
-  "11058863-1",
-  "12271724-0",
-  "17582330-1",
-  "7700767-9",
-  "8693279-2",
-  "20429496-8",
-  "18440252-1",
-  "9525305-9",
-  "18502207-2",
-  "13114691-4",
-  "11192604-2",
-  "23442566-8",
-  "21009163-7",
-  "24097566-1",
-  "16438064-5",
-  "18432450-4",
-  "24272606-5",
-  "15303726-4",
-  "21897434-1",
-  "5289312-7",
-  "9592902-8",
-  "20651731-k",
-  "10207495-5",
-  "16677156-0",
-  "13609518-8",
-  "15177985-9",
-  "9516794-2",
-  "13733112-8",
-  "10478852-1",
-  "16234907-4",
-  "8536491-k",
-  "23952935-6",
-  "21502054-1",
-  "19851977-4",
-  "5580445-1",
-  "5561258-7",
-  "11057285-9",
-  "12451425-8",
-  "5904846-5",
-  "24701399-7",
-  "13551802-6",
-  "11518292-7",
-  "17319004-2",
-  "21531797-8",
-  "23846213-4",
-  "9302507-5",
-  "19316221-5",
-  "17822860-9",
-  "9217365-8",
-  "20264836-3",
-  "9351262-6",
-  "10488049-5",
-  "19108529-9",
-  "6186421-0",
-  "21609162-0",
-  "7670731-6",
-  "6489048-4",
-  "11174573-0",
-  "8203521-4",
-  "19161390-2",
-  "15270016-4",
-  "24899508-4",
-  "5180703-0",
-  "22454880-k",
-  "22530599-4",
-  "6326051-7",
-  "17892476-1",
-  "12988555-6",
-  "18813981-7",
-  "22405543-9",
-  "20045537-1",
-  "11666556-5",
-  "14550462-7",
-  "9689541-0",
-  "12615383-k",
-  "17992063-8",
-  "14731528-7",
-  "11456994-1",
-  "8023481-3",
-  "22547473-7",
-  "7074709-k",
-  "5924234-2",
-  "11665044-4",
-  "17149388-9",
-  "14812798-0",
-  "15139404-3",
-  "23072143-2",
-  "17338512-9",
-  "19982714-6",
-  "14474712-7",
-  "5825529-7",
-  "17375166-4",
-  "6599280-9",
-  "9689979-3",
-  "13461719-5",
-  "22435621-8",
-  "6117508-3",
-  "6388325-5",
-  "20147359-4",
-  "8712573-4",
-  "8594629-3",
-  "9159153-7",
-  "8237398-5",
-  "19040126-k",
-  "14964878-k",
-  "15707021-5",
-  "8485994-k",
-  "13487100-8",
-  "19879951-3",
-  "5814898-9",
-  "10892472-1",
-  "5844322-0",
-  "24461076-5",
-  "7963669-k",
-  "13120891-k",
-  "19954264-8",
-  "18448287-8",
-  "11099988-7",
-  "8174169-7",
-  "6756714-5",
-  "15416741-2",
-  "8730862-6",
-  "10344566-3",
-  "24088983-8",
-  "10991397-9",
-  "6038427-4",
-  "16293451-1",
-  "10661256-0",
-  "24582739-3",
-  "12917702-0",
-  "20225514-0",
-  "14004538-1",
-  "12429581-5",
-  "15345766-2",
-  "6141758-3",
-  "12694444-6",
-  "7633456-0",
-  "13309083-5",
-  "7846943-9",
-  "21270618-3",
-  "15500079-1",
-  "5170635-8",
-  "9096023-7",
-  "23849751-5",
-  "24614487-7",
-  "7524760-5",
-  "13687848-4",
-  "23663444-2",
-  "16885805-1",
-  "20983812-5",
-  "21695591-9",
-  "11434618-7",
-  "10569786-4",
-  "15057050-6",
-  "17151764-8",
-  "14381321-5",
-  "9835767-k",
-  "8156129-k",
-  "23235784-3",
-  "13967125-2",
-  "13467648-5",
-  "14380325-2",
-  "20375039-0",
-  "11543200-1",
-  "23132278-7",
-  "15515209-5",
-  "20691275-8",
-  "13267093-5",
-  "14425249-7",
-  "24821889-4",
-  "7244238-5",
-  "14055668-8",
-  "14063208-2",
-  "10396481-4",
-  "16004402-0",
-  "14515299-2",
-  "8926765-k",
-  "7583426-8",
-  "18099598-6",
-  "17245369-4",
-  "19587828-5",
-  "16109344-0",
-  "11729084-0",
-  "8879478-8",
-  "21516423-3",
-  "5890705-7",
-  "7069236-8",
-  "15773455-5",
-  "6389693-4",
-  "22207962-4",
-  "10846666-9",
-  "21022688-5",
-  "19502321-2",
-  "15387063-2",
-  "21591043-1",
-  "17991524-3",
-  "5406696-1",
-  "23282994-k",
-  "11852934-0",
-  "17036796-0",
-  "11031762-k",
-  "19544724-1",
-  "24196544-9",
-  "22134725-0",
-  "9209421-9",
-  "14444140-0",
-  "11234326-1",
-  "23193259-3",
-  "13588967-9",
-  "14430788-7",
-  "18872987-8",
-  "9789021-8",
-  "14253426-6",
-  "20034551-7",
-  "15378862-6",
-  "22138115-7",
-  "24560799-7",
-  "8157778-1",
-  "9634259-4",
-  "13872701-7",
-  "18838205-3",
-  "14153525-0",
-  "16089173-4",
-  "24054763-5",
-  "10834616-7",
-  "8809153-1",
-  "8928731-6",
-  "9188715-0",
-  "21598587-3",
-  "17610691-3",
-  "11170400-7",
-  "11363279-8",
-  "24773645-k",
-  "10685441-6",
-  "8398460-0",
-  "8120981-2",
-  "7750171-1",
-  "15942301-8",
-  "7238170-k",
-  "17994302-6",
-  "23301364-1",
-  "5580960-7",
-  "21839049-8",
-  "13712041-0",
-  "23838938-0",
-  "5662722-7",
-  "22618642-5",
-  "14903850-7",
-  "22404814-9",
-  "7324671-7",
-  "6310464-7",
-  "15784542-k",
-  "7953786-1",
-  "8794498-0",
-  "18264779-9",
-  "9479035-2",
-  "21502529-2",
-  "13915948-9",
-  "22523690-9",
-  "15837422-6",
-  "12942591-1",
-  "22518456-9",
-  "6043886-2",
-  "9464824-6",
-  "16841838-8",
-  "22200807-7",
-  "18704386-7",
-  "22229382-0",
-  "8177114-6",
-  "6563408-2",
-  "7583323-7",
-  "20997245-k",
-  "18012775-5",
-  "12191148-5",
-  "18797267-1",
-  "16394793-5",
-  "23025608-k",
-  "23252005-1",
-  "20766990-3",
-  "22080066-0",
-  "13524190-3",
-  "15055669-4",
-  "11277816-0",
-  "6055340-8",
-  "10069211-2",
-  "6003409-5",
-  "12110470-9",
-  "9321011-5",
-  "14323945-4",
-  "22800442-1",
-  "11114487-7",
-  "15099986-3",
-  "13091845-k",
-  "19836017-1",
-  "17412329-2",
-  "10307756-7",
-  "12863707-9",
-  "22766506-8",
-  "6065804-8",
-  "8907749-4",
-  "6712280-1",
-  "18997199-0",
-  "21721099-2",
-  "12912505-5",
-  "23003968-2",
-  "6035599-1",
-  "17720447-1",
-  "20043167-7",
-  "18368782-4",
-  "20881771-k",
-  "22714201-4",
-  "24605138-0",
-  "19627747-1",
-  "8367094-0",
-  "22631021-5",
-  "9520806-1",
-  "16647247-4",
-  "8744389-2",
-  "23191996-1",
-  "12537617-7",
-  "19753113-4",
-  "22242088-1",
-  "19896342-9",
-  "16907465-8",
-  "13544627-0",
-  "19103928-9",
-  "12724711-0",
-  "10416376-9",
-  "19984020-7",
-  "6068056-6",
-  "9927219-8",
-  "8383036-0",
-  "7122831-2",
-  "17443022-5",
-  "21037434-5",
-  "21225320-0",
-  "19736819-5",
-  "23494629-3",
-  "10833061-9",
-  "19624610-k",
-  "20770674-4",
-  "24242598-7",
-  "21971178-6",
-  "11131762-3",
-  "17849048-6",
-  "19969436-7",
-  "14050494-7",
-  "21827026-3",
-  "8111774-8",
-  "12610575-4",
-  "5881532-2",
-  "9159029-8",
-  "24196996-7",
-  "15785697-9",
-  "23152086-4",
-  "11494751-2",
-  "21841160-6",
-  "19235890-6",
-  "7111024-9",
-  "20574990-k",
-  "12687904-0",
-  "21428867-2",
-  "24463754-k",
-  "8961339-6",
-  "15804611-3",
-  "20109976-5",
-  "23107905-k",
-  "7789533-7",
-  "23008399-1",
-  "7394778-2",
-  "18227449-6",
-  "23644422-8",
-  "14421132-4",
-  "13045230-2",
-  "9708870-5",
-  "19535377-8",
-  "19329489-8",
-  "9031108-5",
-  "13835305-2",
-  "11575332-0",
-  "10206026-1",
-  "18990182-8",
-  "6235125-k",
-  "11810531-1",
-  "17912700-8",
-  "17451693-6",
-  "7282312-5",
-  "14432476-5",
-  "16740122-8",
-  "5736532-3",
-  "21521953-4",
-  "7436077-7",
-  "11755141-5",
-  "17609548-2",
-  "11366705-2",
-  "14431826-9",
-  "21638162-9",
-  "14029994-4",
-  "23505557-0",
-  "8569500-2",
-  "12873861-4",
-  "17017509-3",
-  "22884796-8",
-  "19537360-4",
-  "24906124-7",
-  "5115781-8",
-  "14546317-3",
-  "13136335-4",
-  "13881336-3",
-  "19176404-8",
-  "24485994-1",
-  "16419339-k",
-  "16422603-4",
-  "11572159-3",
-  "13051249-6",
-  "22497001-3",
-  "9776486-7",
-  "16243104-8",
-  "7803115-8",
-  "11421025-0",
-  "12680085-1",
-  "24351661-7",
-  "9341170-6",
-  "8226032-3",
-  "18060617-3",
-  "17285209-2",
-  "21920361-6",
-  "6398087-0",
-  "5405621-4",
-  "7255194-k",
-  "9877861-6",
-  "21064682-5",
-  "12896508-4",
-  "9837824-3",
-  "19465427-8",
-  "17368679-k",
-  "9706297-8",
-  "15922041-9",
-  "17081464-9",
-  "20845372-6",
-  "17110085-2",
-  "12323299-2",
-  "10931207-k",
-  "9835999-0",
-  "22861954-k",
-  "6757369-2",
-  "8159151-2",
-  "20898645-7",
-  "20337923-4",
-  "20753242-8",
-  "10842548-2",
-  "23483399-5",
-  "8510317-2",
-  "8068392-8",
-  "14834863-4",
-  "14509936-6",
-  "9519713-2",
-  "13220787-9",
-  "13538499-2",
-  "6641576-7",
-  "18521249-1",
-  "9552683-7",
-  "10963506-5",
-  "21633841-3",
-  "19556494-9",
-  "18137729-1",
-  "12077099-3",
-  "14803816-3",
-  "11768678-7",
-  "17282521-4",
-  "16383274-7",
-  "23034429-9",
-  "8833895-2",
-  "21933074-k",
-  "9772319-2",
-  "19150983-8",
-  "24243609-1",
-  "22841553-7",
-  "12402786-1",
-  "14604411-5",
-  "15960907-3",
-  "22869876-8",
-  "15147574-4",
-  "10173006-9",
-  "10199281-0",
-  "17438308-1",
-  "10559870-k",
-  "23415113-4",
-  "13477971-3",
-  "18166368-5",
-  "6070008-7",
-  "18308652-9",
-  "22987557-4",
-  "6997207-1",
-  "10119984-3",
-  "7011598-0",
-  "17797239-8",
-  "11561913-6",
-  "9013774-3",
-  "24129433-1",
-  "21212609-8",
-  "14526911-3",
-  "14695625-4",
-  "13011001-0",
-  "20200348-6",
-  "21618494-7",
-  "18258180-1",
-  "13215960-2",
-  "12279758-9",
-  "12598148-8",
-  "5926915-1",
-  "20273413-8",
-  "24117349-6",
-  "5810154-0",
-  "6295054-4",
-  "22152998-7",
-  "6738944-1",
-  "23191216-9",
-  "15120555-0",
-  "9781123-7",
-  "23639735-1",
-  "14257847-6",
-  "18653603-7",
-  "7043938-7",
-  "24986459-5",
-  "21889356-2",
-  "23827767-1",
-  "13457897-1",
-  "20484458-5",
-  "14768812-1",
-  "10915916-6",
-  "15812718-0",
-  "7144982-3",
-  "22387422-3",
-  "5541756-3",
-  "16931434-9",
-  "24657529-0",
-  "10155378-7",
-  "11912422-0",
-  "7745874-3",
-  "24173595-8",
-  "14496552-3",
-  "20979620-1",
-  "10396061-4",
-  "9346928-3",
-  "23678388-k",
-  "8580768-4",
-  "15467964-2",
-  "15652111-6",
-  "18612324-7",
-  "5240248-4",
-  "10809998-4",
-  "23447575-4",
-  "11695347-1",
-  "11641660-3",
-  "17407688-k",
-  "14758343-5",
-  "21707774-5",
-  "17153371-6",
-  "12114351-8",
-  "14825770-1",
-  "24903252-2",
-  "5016497-7",
-  "17074023-8",
-  "11725924-2",
-  "14736928-k",
-  "15477030-5",
-  "19104658-7",
-  "18050839-2",
-  "14447087-7",
-  "22679654-1",
-  "8189469-8",
-  "7420046-k",
-  "8323164-5",
-  "12079800-6",
-  "17363355-6",
-  "19441913-9",
-  "15348994-7",
-  "15108408-7",
-  "18163497-9",
-  "9651666-5",
-  "11229515-1",
-  "7626713-8",
-  "11100343-2",
-  "11378980-8",
-  "7335398-k",
-  "20853900-0",
-  "23626199-9",
-  "23418655-8",
-  "5477917-8",
-  "23822186-2",
-  "20383642-2",
-  "14520143-8",
-  "21246194-6",
-  "14783298-2",
-  "9426645-9",
-  "18211181-3",
-  "11304795-k",
-  "5232027-5",
-  "13785847-9",
-  "11786213-5",
-  "24076778-3",
-  "12820689-2",
-  "10393798-1",
-  "17652949-0",
-  "24960208-6",
-  "18332395-4",
-  "5957406-k",
-  "14986500-4",
-  "20241217-3",
-  "14224565-5",
-  "14947156-1",
-  "17333521-0",
-  "7142920-2",
-  "17401538-4",
-  "15999951-3",
-  "18092105-2",
-  "8695955-0",
-  "14279764-k",
-  "18761453-8",
-  "10994109-3",
-  "12234983-7",
-  "21152155-4",
-  "22938143-1",
-  "12438129-0",
-  "12353396-8",
-  "11777402-3",
-  "21806936-3",
-  "14018896-4",
-  "22423481-3",
-  "16377266-3",
-  "10093241-5",
-  "16885372-6",
-  "18537558-7",
-  "21838726-8",
-  "16356299-5",
-  "12456892-7",
-  "13247303-k",
-  "23658409-7",
-  "19455810-4",
-  "8555003-9",
-  "14495542-0",
-  "10609834-4",
-  "14508424-5",
-  "13443042-7",
-  "8645094-1",
-  "9152590-9",
-  "14862784-3",
-  "23431992-2",
-  "15812123-9",
-  "20887942-1",
-  "10685935-3",
-  "18202870-3",
-  "17418040-7",
-  "12956949-2",
-  "10524382-0",
-  "9887350-3",
-  "7930902-8",
-  "5914791-9",
-  "16562583-8",
-  "8376388-4",
-  "17131400-3",
-  "23955587-k",
-  "11992243-7",
-  "13476469-4",
-  "19551407-0",
-  "17250164-8",
-  "23416616-6",
-  "20684420-5",
-  "24118397-1",
-  "19112176-7",
-  "20241901-1",
-  "14789233-0",
-  "17053726-2",
-  "17493447-9",
-  "6231120-7",
-  "8983721-9",
-  "22097049-3",
-  "23123291-5",
-  "11350058-1",
-  "18723245-7",
-  "19329711-0",
-  "5729697-6",
-  "9699444-3",
-  "24880313-4",
-  "6460352-3",
-  "18449531-7",
-  "8282720-k",
-  "12663879-5",
-  "9692017-2",
-  "19644561-7",
-  "20018330-4",
-  "16060738-6",
-  "20952944-0",
-  "15392060-5",
-  "23048462-7",
-  "11505061-3",
-  "23432804-2",
-  "20911796-7",
-  "22701675-2",
-  "14525152-4",
-  "23483485-1",
-  "24569768-6",
-  "24831433-8",
-  "13724895-6",
-  "6774582-5",
-  "12233341-8",
-  "18706007-9",
-  "9733054-9",
-  "24647046-4",
-  "6534710-5",
-  "23015785-5",
-  "8869104-0",
-  "17280875-1",
-  "18381891-0",
-  "8349729-7",
-  "20874849-1",
-  "15383907-7",
-  "11484738-0",
-  "19700249-2",
-  "18764366-k",
-  "21143059-1",
-  "15289552-6",
-  "13618744-9",
-  "5673630-1",
-  "18366022-5"
-]
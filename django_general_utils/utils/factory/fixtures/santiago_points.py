@@ -1,10002 +0,0 @@
-SANTIAGO_POINTS = [
-  [-33.44871245,-70.62458381],
-  [-33.32175919,-70.71359039],
-  [-33.41098284,-70.80855865],
-  [-33.32300548,-70.63328563],
-  [-33.28714895,-70.73769303],
-  [-33.48425951,-70.81159232],
-  [-33.5802395,-70.57972834],
-  [-33.52193351,-70.76755722],
-  [-33.41297778,-70.66657076],
-  [-33.46206119,-70.52007347],
-  [-33.57301719,-70.75841965],
-  [-33.49199979,-70.78979812],
-  [-33.36908377,-70.68033637],
-  [-33.46515012,-70.74312382],
-  [-33.56537137,-70.82623388],
-  [-33.43572807,-70.67233423],
-  [-33.53501603,-70.84438441],
-  [-33.3956044,-70.54149186],
-  [-33.4873534,-70.55390979],
-  [-33.52152495,-70.63069791],
-  [-33.38225943,-70.6172989],
-  [-33.3872353,-70.57088196],
-  [-33.44785391,-70.72949801],
-  [-33.54552558,-70.79903125],
-  [-33.34031707,-70.70076862],
-  [-33.28151636,-70.70254578],
-  [-33.54437079,-70.83752662],
-  [-33.41774928,-70.68522973],
-  [-33.46370124,-70.88739081],
-  [-33.50731805,-70.69764578],
-  [-33.35637543,-70.67275708],
-  [-33.36208824,-70.8309688],
-  [-33.31548331,-70.67773378],
-  [-33.30742323,-70.56285134],
-  [-33.48755673,-70.74223812],
-  [-33.40003763,-70.74870965],
-  [-33.55302774,-70.75716931],
-  [-33.5889109,-70.66836066],
-  [-33.46652976,-70.88189805],
-  [-33.36971654,-70.72028763],
-  [-33.54963989,-70.75577309],
-  [-33.48068799,-70.78654258],
-  [-33.59342487,-70.63032764],
-  [-33.32202944,-70.56346003],
-  [-33.39417684,-70.80058257],
-  [-33.40153959,-70.83197938],
-  [-33.34104409,-70.61482971],
-  [-33.31774065,-70.67322307],
-  [-33.40221844,-70.46612841],
-  [-33.49753086,-70.51238982],
-  [-33.41398337,-70.49944439],
-  [-33.52681647,-70.66447536],
-  [-33.51045174,-70.66414333],
-  [-33.29872939,-70.59715839],
-  [-33.28477612,-70.61453012],
-  [-33.39114727,-70.52327523],
-  [-33.48221122,-70.59291571],
-  [-33.40031702,-70.65851867],
-  [-33.41697923,-70.64930434],
-  [-33.43641904,-70.84480216],
-  [-33.4016288,-70.5004733],
-  [-33.54651173,-70.53403245],
-  [-33.60311758,-70.77757182],
-  [-33.3305018,-70.58100133],
-  [-33.44414841,-70.74267169],
-  [-33.50305344,-70.85521055],
-  [-33.42543193,-70.47613274],
-  [-33.4653795,-70.50903769],
-  [-33.34994617,-70.65816681],
-  [-33.50015788,-70.4708154],
-  [-33.30358796,-70.68781749],
-  [-33.60235019,-70.73140734],
-  [-33.41019918,-70.56417027],
-  [-33.44757402,-70.52187364],
-  [-33.44043719,-70.75871281],
-  [-33.58535939,-70.73559862],
-  [-33.48848404,-70.60384611],
-  [-33.32135116,-70.57056979],
-  [-33.34227652,-70.53125631],
-  [-33.48843836,-70.81990887],
-  [-33.56223894,-70.71511688],
-  [-33.45573312,-70.70497871],
-  [-33.3167103,-70.77324506],
-  [-33.5087271,-70.7179589],
-  [-33.48548866,-70.79345815],
-  [-33.4169717,-70.77061246],
-  [-33.44241982,-70.75011813],
-  [-33.44266683,-70.83501682],
-  [-33.42362787,-70.87632042],
-  [-33.41083092,-70.64229669],
-  [-33.51504701,-70.81819411],
-  [-33.38585728,-70.62602792],
-  [-33.29972895,-70.70677758],
-  [-33.34517783,-70.67564343],
-  [-33.43665267,-70.80087241],
-  [-33.51501144,-70.68210096],
-  [-33.49404168,-70.81875029],
-  [-33.31351632,-70.67240721],
-  [-33.49519235,-70.73438666],
-  [-33.38998225,-70.73374779],
-  [-33.44170617,-70.62273778],
-  [-33.4310832,-70.7408493],
-  [-33.49968597,-70.79529838],
-  [-33.41154471,-70.57098527],
-  [-33.52609408,-70.553665],
-  [-33.5493259,-70.73328194],
-  [-33.43628941,-70.52868154],
-  [-33.4631163,-70.812411],
-  [-33.43436629,-70.78598998],
-  [-33.3945687,-70.55436349],
-  [-33.42939226,-70.65271208],
-  [-33.59643146,-70.62829295],
-  [-33.31986729,-70.70662878],
-  [-33.52926184,-70.62956067],
-  [-33.41249841,-70.72993187],
-  [-33.3151384,-70.62576313],
-  [-33.37886285,-70.79921554],
-  [-33.37934638,-70.49337178],
-  [-33.41608815,-70.68488669],
-  [-33.34683694,-70.7315129],
-  [-33.44296077,-70.64345961],
-  [-33.4474113,-70.65321035],
-  [-33.56491757,-70.61856292],
-  [-33.32506446,-70.69691017],
-  [-33.58903521,-70.77580665],
-  [-33.49796909,-70.76753801],
-  [-33.48561913,-70.6669493],
-  [-33.45648134,-70.74386969],
-  [-33.60261671,-70.74145209],
-  [-33.42263484,-70.68127797],
-  [-33.45117406,-70.7192994],
-  [-33.28437033,-70.64349009],
-  [-33.48898375,-70.51586572],
-  [-33.49262697,-70.830988],
-  [-33.54168276,-70.66683649],
-  [-33.43179386,-70.86272764],
-  [-33.41031669,-70.77385901],
-  [-33.54759351,-70.79038217],
-  [-33.39295225,-70.77424809],
-  [-33.4218957,-70.78520809],
-  [-33.52943387,-70.77952365],
-  [-33.4994678,-70.59944463],
-  [-33.35144796,-70.60960679],
-  [-33.4022206,-70.50824323],
-  [-33.61239138,-70.68269694],
-  [-33.27726441,-70.63492154],
-  [-33.56831633,-70.58880979],
-  [-33.5667823,-70.66207907],
-  [-33.47756129,-70.8025549],
-  [-33.35964917,-70.52754074],
-  [-33.51302121,-70.79877216],
-  [-33.55328541,-70.73321708],
-  [-33.34881569,-70.83249485],
-  [-33.30396862,-70.76351937],
-  [-33.36189779,-70.6063758],
-  [-33.53353572,-70.8125936],
-  [-33.31607186,-70.72685046],
-  [-33.46291947,-70.6962604],
-  [-33.57818224,-70.54370822],
-  [-33.29998487,-70.55358133],
-  [-33.34442602,-70.74758858],
-  [-33.33925839,-70.71029686],
-  [-33.32255103,-70.77571199],
-  [-33.58057298,-70.79882212],
-  [-33.54864278,-70.78252674],
-  [-33.34894837,-70.73199132],
-  [-33.38642302,-70.54407841],
-  [-33.27528123,-70.66218254],
-  [-33.49180399,-70.7507708],
-  [-33.33295931,-70.52626363],
-  [-33.59193866,-70.76187885],
-  [-33.45121281,-70.61367146],
-  [-33.51105423,-70.56152533],
-  [-33.5195891,-70.5479848],
-  [-33.59961149,-70.70661907],
-  [-33.45886955,-70.60638977],
-  [-33.45055706,-70.65817409],
-  [-33.38204917,-70.49911747],
-  [-33.40233421,-70.69305899],
-  [-33.33888825,-70.60354862],
-  [-33.39246107,-70.62631403],
-  [-33.53201916,-70.79777352],
-  [-33.51695596,-70.77084542],
-  [-33.52230601,-70.65508724],
-  [-33.49831011,-70.61480521],
-  [-33.39017608,-70.69837464],
-  [-33.62043438,-70.68011482],
-  [-33.38331682,-70.55213427],
-  [-33.57534545,-70.6731839],
-  [-33.50068132,-70.66914477],
-  [-33.57666046,-70.62376287],
-  [-33.60486481,-70.64756766],
-  [-33.48871711,-70.86105671],
-  [-33.28703002,-70.63595253],
-  [-33.50012351,-70.49051301],
-  [-33.35483477,-70.58093481],
-  [-33.51010972,-70.85689811],
-  [-33.35815549,-70.54308429],
-  [-33.3861256,-70.85088245],
-  [-33.41703929,-70.73196312],
-  [-33.38411258,-70.76032027],
-  [-33.3162605,-70.54053919],
-  [-33.34243799,-70.71376281],
-  [-33.36943942,-70.50096094],
-  [-33.29617285,-70.71801312],
-  [-33.60953804,-70.58486145],
-  [-33.54384007,-70.63437937],
-  [-33.39158617,-70.5079571],
-  [-33.54491954,-70.80137881],
-  [-33.35911215,-70.67083506],
-  [-33.33253736,-70.59454061],
-  [-33.34813399,-70.83596744],
-  [-33.41516143,-70.79386441],
-  [-33.53062537,-70.59802503],
-  [-33.35898765,-70.51519651],
-  [-33.48035325,-70.80899268],
-  [-33.31904403,-70.78212817],
-  [-33.36431372,-70.74005202],
-  [-33.48608115,-70.84648162],
-  [-33.43126511,-70.46029181],
-  [-33.53178033,-70.50472831],
-  [-33.42999635,-70.64592185],
-  [-33.51225201,-70.64569745],
-  [-33.32273624,-70.80935028],
-  [-33.50489995,-70.56627748],
-  [-33.32729346,-70.54516001],
-  [-33.42133979,-70.62723143],
-  [-33.48079955,-70.50781651],
-  [-33.36673902,-70.56198004],
-  [-33.56672478,-70.7297884],
-  [-33.61594257,-70.69912423],
-  [-33.46125256,-70.87908183],
-  [-33.57337452,-70.59823826],
-  [-33.31170659,-70.56064591],
-  [-33.40705749,-70.61010861],
-  [-33.45623264,-70.83199968],
-  [-33.54883649,-70.5346321],
-  [-33.49218965,-70.76041467],
-  [-33.4556166,-70.63990364],
-  [-33.30343758,-70.60543595],
-  [-33.47233742,-70.53200716],
-  [-33.49560808,-70.71388067],
-  [-33.29168744,-70.56698572],
-  [-33.35422077,-70.49296743],
-  [-33.58912974,-70.78672871],
-  [-33.40237651,-70.63866002],
-  [-33.38343173,-70.49799759],
-  [-33.51442408,-70.47830332],
-  [-33.3963894,-70.72158714],
-  [-33.36873346,-70.7463124],
-  [-33.50728356,-70.56301767],
-  [-33.54436294,-70.82281606],
-  [-33.40726303,-70.51435221],
-  [-33.478056,-70.83258906],
-  [-33.41522572,-70.64268666],
-  [-33.47864912,-70.72331976],
-  [-33.47888414,-70.70086813],
-  [-33.51695977,-70.83918837],
-  [-33.53127995,-70.59107341],
-  [-33.5691486,-70.82837453],
-  [-33.36111759,-70.66463468],
-  [-33.42431214,-70.74804816],
-  [-33.36706802,-70.63827674],
-  [-33.46164111,-70.64113673],
-  [-33.55027906,-70.82802876],
-  [-33.54350732,-70.7778506],
-  [-33.51840617,-70.63601775],
-  [-33.59136025,-70.6293092],
-  [-33.44704499,-70.68266561],
-  [-33.49616411,-70.59666911],
-  [-33.50351236,-70.76717088],
-  [-33.34089654,-70.63380233],
-  [-33.48304775,-70.59913418],
-  [-33.40329901,-70.5232787],
-  [-33.44318592,-70.57272311],
-  [-33.27835699,-70.62953766],
-  [-33.49370791,-70.51026568],
-  [-33.29515946,-70.61189502],
-  [-33.46825549,-70.5900026],
-  [-33.46257619,-70.79010023],
-  [-33.35213293,-70.70858231],
-  [-33.40485337,-70.83157495],
-  [-33.33102065,-70.64234089],
-  [-33.37540367,-70.75597927],
-  [-33.33607749,-70.68994998],
-  [-33.60854134,-70.67497204],
-  [-33.59306001,-70.79869888],
-  [-33.29096837,-70.56916035],
-  [-33.56152515,-70.78339417],
-  [-33.33262668,-70.72360545],
-  [-33.50091576,-70.64085245],
-  [-33.61014154,-70.64750922],
-  [-33.32853128,-70.53443488],
-  [-33.47982894,-70.72073518],
-  [-33.47799869,-70.75207691],
-  [-33.5932098,-70.72410016],
-  [-33.6022831,-70.56641432],
-  [-33.39551038,-70.51346624],
-  [-33.4351919,-70.8652415],
-  [-33.4113703,-70.72506048],
-  [-33.31264192,-70.81252239],
-  [-33.4898076,-70.61983651],
-  [-33.29901892,-70.68492535],
-  [-33.39011068,-70.76897984],
-  [-33.58028517,-70.57541313],
-  [-33.55768607,-70.81068377],
-  [-33.42898345,-70.83616003],
-  [-33.35924513,-70.77202402],
-  [-33.34454636,-70.58830951],
-  [-33.45609301,-70.72454243],
-  [-33.32233264,-70.63810725],
-  [-33.30856956,-70.67720367],
-  [-33.36451999,-70.80078811],
-  [-33.46132784,-70.87910804],
-  [-33.31826684,-70.53859892],
-  [-33.32705133,-70.58224496],
-  [-33.50835543,-70.67188439],
-  [-33.50848623,-70.49927383],
-  [-33.47402524,-70.65435985],
-  [-33.50795294,-70.83135019],
-  [-33.3252815,-70.7640698],
-  [-33.33694482,-70.54773753],
-  [-33.44737358,-70.546231],
-  [-33.58104229,-70.54532262],
-  [-33.3988995,-70.68082909],
-  [-33.36259166,-70.77726589],
-  [-33.5657109,-70.63363355],
-  [-33.59049572,-70.66931396],
-  [-33.4568798,-70.59462411],
-  [-33.28774328,-70.7423754],
-  [-33.46568879,-70.86458649],
-  [-33.5144786,-70.84229881],
-  [-33.36548372,-70.53611611],
-  [-33.39622593,-70.55656925],
-  [-33.34440199,-70.78682253],
-  [-33.58922207,-70.76416808],
-  [-33.36514977,-70.62238123],
-  [-33.38490096,-70.76865619],
-  [-33.45658988,-70.77851782],
-  [-33.52715853,-70.6087503],
-  [-33.43234442,-70.71473405],
-  [-33.38265699,-70.52582296],
-  [-33.41101876,-70.85193682],
-  [-33.44211564,-70.47263205],
-  [-33.53420758,-70.56479828],
-  [-33.55478504,-70.78086964],
-  [-33.32871014,-70.69838576],
-  [-33.59884889,-70.70411878],
-  [-33.39145363,-70.47465705],
-  [-33.44657086,-70.50625441],
-  [-33.3891915,-70.56720928],
-  [-33.31997783,-70.70107032],
-  [-33.37288197,-70.83206155],
-  [-33.45793831,-70.55089572],
-  [-33.5006987,-70.78352931],
-  [-33.36833134,-70.50219589],
-  [-33.53391918,-70.64740316],
-  [-33.33768297,-70.55823995],
-  [-33.53205427,-70.5567913],
-  [-33.42355446,-70.55474771],
-  [-33.41146763,-70.75062912],
-  [-33.59597108,-70.61996446],
-  [-33.40762616,-70.81717846],
-  [-33.49641013,-70.59873843],
-  [-33.28515905,-70.75487999],
-  [-33.57910152,-70.63753864],
-  [-33.55699758,-70.79067865],
-  [-33.55804882,-70.50803469],
-  [-33.29326173,-70.66753619],
-  [-33.46355617,-70.70970813],
-  [-33.2858692,-70.67805981],
-  [-33.43555125,-70.69371637],
-  [-33.37210076,-70.76443803],
-  [-33.49794893,-70.47875969],
-  [-33.55605255,-70.60520922],
-  [-33.29859311,-70.59289029],
-  [-33.42031407,-70.80348386],
-  [-33.48672939,-70.6029165],
-  [-33.31178498,-70.69864155],
-  [-33.47269889,-70.72521626],
-  [-33.48502965,-70.61226445],
-  [-33.38291424,-70.48092083],
-  [-33.43202456,-70.48172768],
-  [-33.38517542,-70.54491055],
-  [-33.55697965,-70.66431059],
-  [-33.43393592,-70.6317569],
-  [-33.28710061,-70.69650419],
-  [-33.42040137,-70.49583977],
-  [-33.50918704,-70.53882712],
-  [-33.53459637,-70.56990798],
-  [-33.46247181,-70.58272345],
-  [-33.5036271,-70.86752998],
-  [-33.58414903,-70.71205528],
-  [-33.41799561,-70.66932424],
-  [-33.54078446,-70.69032488],
-  [-33.62125909,-70.71888641],
-  [-33.39807912,-70.50380093],
-  [-33.5261727,-70.77144901],
-  [-33.47480419,-70.67677795],
-  [-33.42091571,-70.5635394],
-  [-33.30987571,-70.77339768],
-  [-33.42652674,-70.88096389],
-  [-33.62504261,-70.65029967],
-  [-33.5677338,-70.52450225],
-  [-33.54434535,-70.62130498],
-  [-33.33873681,-70.59498876],
-  [-33.47831819,-70.66506654],
-  [-33.49080634,-70.54707703],
-  [-33.61979139,-70.71361538],
-  [-33.44223285,-70.47522571],
-  [-33.31470485,-70.66833455],
-  [-33.31923663,-70.58803994],
-  [-33.31349853,-70.71401374],
-  [-33.4241667,-70.79991765],
-  [-33.50509555,-70.71161012],
-  [-33.37615122,-70.72596735],
-  [-33.5925364,-70.768458],
-  [-33.58717652,-70.79196217],
-  [-33.42429047,-70.79887084],
-  [-33.46936934,-70.57129704],
-  [-33.35723961,-70.53963953],
-  [-33.60430365,-70.72417928],
-  [-33.5635618,-70.67631474],
-  [-33.54116451,-70.6638695],
-  [-33.59455028,-70.6524577],
-  [-33.45324509,-70.72346729],
-  [-33.523641,-70.7582986],
-  [-33.50152294,-70.61386013],
-  [-33.56949048,-70.79160163],
-  [-33.42983256,-70.60600137],
-  [-33.43710348,-70.85262182],
-  [-33.30317232,-70.54931906],
-  [-33.61864131,-70.6821468],
-  [-33.48434299,-70.56200515],
-  [-33.37207578,-70.51884878],
-  [-33.51938478,-70.48490772],
-  [-33.39467274,-70.50891047],
-  [-33.50518495,-70.48085383],
-  [-33.47937572,-70.51539123],
-  [-33.42264793,-70.50917845],
-  [-33.50363825,-70.53538392],
-  [-33.61478579,-70.60662939],
-  [-33.55962128,-70.78563956],
-  [-33.62008237,-70.66241965],
-  [-33.60572801,-70.63255677],
-  [-33.3759175,-70.75812296],
-  [-33.52125782,-70.82903664],
-  [-33.3149915,-70.78633599],
-  [-33.55499223,-70.52225051],
-  [-33.4212004,-70.76070411],
-  [-33.39676962,-70.75145953],
-  [-33.37425414,-70.7130596],
-  [-33.45692844,-70.87313881],
-  [-33.45066716,-70.86199132],
-  [-33.50884795,-70.58129045],
-  [-33.38597376,-70.70248639],
-  [-33.3573464,-70.50582443],
-  [-33.47640513,-70.59586201],
-  [-33.36138571,-70.68659554],
-  [-33.58102638,-70.6438214],
-  [-33.54271303,-70.62930269],
-  [-33.52732526,-70.59735643],
-  [-33.58257872,-70.58167352],
-  [-33.54591961,-70.7145055],
-  [-33.47735153,-70.70296311],
-  [-33.431888,-70.84960784],
-  [-33.46379699,-70.7829485],
-  [-33.34464016,-70.67499627],
-  [-33.41281152,-70.83279047],
-  [-33.57333298,-70.82741441],
-  [-33.40508511,-70.53340757],
-  [-33.33325928,-70.64379241],
-  [-33.40377757,-70.73789407],
-  [-33.46653296,-70.70028606],
-  [-33.34650588,-70.54177951],
-  [-33.60567557,-70.625172],
-  [-33.27030142,-70.66056056],
-  [-33.40506685,-70.85706809],
-  [-33.42092855,-70.48826469],
-  [-33.54180642,-70.75140403],
-  [-33.54138224,-70.82800605],
-  [-33.59821361,-70.68061478],
-  [-33.55528482,-70.62184853],
-  [-33.41963565,-70.72821682],
-  [-33.4164091,-70.79972774],
-  [-33.59949598,-70.59442934],
-  [-33.58274575,-70.58392701],
-  [-33.46738982,-70.87408794],
-  [-33.34784741,-70.64664517],
-  [-33.48656619,-70.73184351],
-  [-33.34190795,-70.59262733],
-  [-33.3755616,-70.58955187],
-  [-33.39767829,-70.65146579],
-  [-33.29468696,-70.73035271],
-  [-33.36939934,-70.72368601],
-  [-33.44663041,-70.62645292],
-  [-33.39274672,-70.57974082],
-  [-33.31026716,-70.75259398],
-  [-33.52346695,-70.60267817],
-  [-33.49720645,-70.47866079],
-  [-33.51327921,-70.52624801],
-  [-33.34016809,-70.74558261],
-  [-33.49820928,-70.54572859],
-  [-33.52917959,-70.48794142],
-  [-33.44115538,-70.7696506],
-  [-33.40361961,-70.63380132],
-  [-33.45477856,-70.57766024],
-  [-33.42490144,-70.78468595],
-  [-33.48519616,-70.72721277],
-  [-33.37709661,-70.64083141],
-  [-33.54144671,-70.78326419],
-  [-33.45870326,-70.82271936],
-  [-33.54951901,-70.79417033],
-  [-33.3254776,-70.81212528],
-  [-33.35562299,-70.61939375],
-  [-33.32750688,-70.7411851],
-  [-33.51321377,-70.78777715],
-  [-33.56977253,-70.77656601],
-  [-33.58216677,-70.58256537],
-  [-33.36624093,-70.56546943],
-  [-33.5191447,-70.76699977],
-  [-33.54073946,-70.56696566],
-  [-33.61231136,-70.65683775],
-  [-33.27737719,-70.65801618],
-  [-33.48068786,-70.84964775],
-  [-33.57413958,-70.70215503],
-  [-33.4553276,-70.85560559],
-  [-33.56942451,-70.54797875],
-  [-33.44994452,-70.71455943],
-  [-33.41219008,-70.874503],
-  [-33.50894189,-70.47668831],
-  [-33.49979608,-70.49800636],
-  [-33.32433348,-70.65843422],
-  [-33.37387314,-70.7234239],
-  [-33.52039197,-70.72278194],
-  [-33.56878023,-70.69148119],
-  [-33.38350422,-70.60722468],
-  [-33.48606394,-70.48913513],
-  [-33.4756365,-70.78106566],
-  [-33.56231747,-70.82798567],
-  [-33.40329788,-70.8567564],
-  [-33.48674187,-70.6824786],
-  [-33.50977913,-70.61478348],
-  [-33.27278213,-70.71081849],
-  [-33.51429975,-70.60824363],
-  [-33.39797168,-70.48930108],
-  [-33.50352867,-70.74410828],
-  [-33.3709756,-70.70014029],
-  [-33.59296957,-70.56134192],
-  [-33.37676443,-70.84148901],
-  [-33.53479367,-70.71161571],
-  [-33.52464055,-70.64723565],
-  [-33.49402031,-70.79778764],
-  [-33.55553249,-70.80366713],
-  [-33.39224819,-70.66243465],
-  [-33.49715896,-70.87950495],
-  [-33.46437894,-70.48910757],
-  [-33.37075839,-70.6733098],
-  [-33.33494115,-70.69501585],
-  [-33.60645795,-70.66545879],
-  [-33.38148618,-70.6794987],
-  [-33.52788404,-70.64484086],
-  [-33.34169779,-70.6869167],
-  [-33.36892636,-70.85571484],
-  [-33.53804125,-70.70823061],
-  [-33.43992318,-70.6943374],
-  [-33.55080865,-70.84751565],
-  [-33.60193756,-70.76496549],
-  [-33.56337666,-70.54197318],
-  [-33.33007378,-70.76733703],
-  [-33.29411909,-70.75870951],
-  [-33.57938626,-70.76316077],
-  [-33.29306877,-70.58560888],
-  [-33.51731911,-70.80913463],
-  [-33.45307567,-70.46495365],
-  [-33.54848701,-70.52658697],
-  [-33.59866342,-70.62075466],
-  [-33.60289753,-70.67813997],
-  [-33.54813362,-70.66751909],
-  [-33.45404786,-70.61820705],
-  [-33.62379828,-70.70917804],
-  [-33.40267668,-70.76520566],
-  [-33.5058417,-70.63332941],
-  [-33.28364415,-70.74917409],
-  [-33.33507563,-70.60675454],
-  [-33.50163304,-70.68900113],
-  [-33.49696915,-70.63363686],
-  [-33.30864354,-70.60328052],
-  [-33.36138978,-70.61065848],
-  [-33.40764378,-70.83946164],
-  [-33.44424374,-70.71759822],
-  [-33.34785101,-70.66024259],
-  [-33.56747075,-70.83321958],
-  [-33.29288983,-70.61328662],
-  [-33.54355431,-70.72561673],
-  [-33.36862938,-70.82020639],
-  [-33.46930346,-70.56561093],
-  [-33.33769628,-70.76284125],
-  [-33.51704719,-70.7285291],
-  [-33.40236324,-70.80816523],
-  [-33.52449175,-70.54540181],
-  [-33.388605,-70.70152183],
-  [-33.57578105,-70.74591182],
-  [-33.44325348,-70.53151112],
-  [-33.57450414,-70.54328828],
-  [-33.36962932,-70.82183729],
-  [-33.40287169,-70.52843681],
-  [-33.59361493,-70.65484676],
-  [-33.42427099,-70.71004784],
-  [-33.45912599,-70.88462265],
-  [-33.37557741,-70.63578444],
-  [-33.33911329,-70.77424063],
-  [-33.40377949,-70.73109608],
-  [-33.41763229,-70.60094816],
-  [-33.43019862,-70.67814244],
-  [-33.27067509,-70.66654938],
-  [-33.43853955,-70.63923774],
-  [-33.51337392,-70.83309294],
-  [-33.44029357,-70.76789947],
-  [-33.45597703,-70.58388508],
-  [-33.38678065,-70.54021524],
-  [-33.37192061,-70.52913551],
-  [-33.55205871,-70.50790757],
-  [-33.55941048,-70.61900719],
-  [-33.45201197,-70.63845113],
-  [-33.27869171,-70.7025529],
-  [-33.35410647,-70.49214804],
-  [-33.3403742,-70.51881139],
-  [-33.34282632,-70.51804425],
-  [-33.5034751,-70.68835653],
-  [-33.6015817,-70.59936168],
-  [-33.44513027,-70.5014274],
-  [-33.3486604,-70.56218605],
-  [-33.32052532,-70.75107181],
-  [-33.39146926,-70.52505623],
-  [-33.46964218,-70.74097941],
-  [-33.44084463,-70.66517069],
-  [-33.41646981,-70.6902248],
-  [-33.47445534,-70.78001801],
-  [-33.36270089,-70.69656973],
-  [-33.30183865,-70.67521368],
-  [-33.36729467,-70.5070394],
-  [-33.38389582,-70.69119082],
-  [-33.50109644,-70.47624314],
-  [-33.60223494,-70.6422843],
-  [-33.43411836,-70.48214485],
-  [-33.49198497,-70.5527086],
-  [-33.35192271,-70.58246041],
-  [-33.44689089,-70.624788],
-  [-33.45187346,-70.57159317],
-  [-33.38687082,-70.590008],
-  [-33.55934748,-70.51597776],
-  [-33.41726795,-70.87864091],
-  [-33.44963641,-70.7167693],
-  [-33.49165314,-70.52531106],
-  [-33.34959458,-70.55991813],
-  [-33.35494985,-70.79742988],
-  [-33.50144516,-70.66848832],
-  [-33.42033257,-70.66040057],
-  [-33.37817166,-70.53729771],
-  [-33.42785708,-70.80144826],
-  [-33.4653007,-70.73585925],
-  [-33.38894181,-70.6724927],
-  [-33.55959743,-70.73737856],
-  [-33.53524531,-70.77242509],
-  [-33.57680062,-70.64759603],
-  [-33.34221384,-70.74937186],
-  [-33.29926165,-70.680977],
-  [-33.52735474,-70.64935832],
-  [-33.32959979,-70.53074052],
-  [-33.43531385,-70.85830284],
-  [-33.40320959,-70.71375618],
-  [-33.37358265,-70.62223958],
-  [-33.43536389,-70.76683322],
-  [-33.40098653,-70.57122011],
-  [-33.54178074,-70.50663288],
-  [-33.37986505,-70.60771801],
-  [-33.37141584,-70.56315892],
-  [-33.37409795,-70.84499151],
-  [-33.48441274,-70.77161615],
-  [-33.4554096,-70.5000833],
-  [-33.42973681,-70.55029811],
-  [-33.57958363,-70.66369827],
-  [-33.38461253,-70.86338369],
-  [-33.51242751,-70.7272015],
-  [-33.46385291,-70.71775104],
-  [-33.54843636,-70.80975143],
-  [-33.31546442,-70.61596185],
-  [-33.44875797,-70.58813297],
-  [-33.37556899,-70.69176835],
-  [-33.54609219,-70.82025204],
-  [-33.4727024,-70.71375529],
-  [-33.35332728,-70.85084017],
-  [-33.43997457,-70.4698655],
-  [-33.44955077,-70.70538814],
-  [-33.47375815,-70.57937071],
-  [-33.29893979,-70.65791299],
-  [-33.33078016,-70.83654912],
-  [-33.41701632,-70.88356868],
-  [-33.52541724,-70.53226428],
-  [-33.50671822,-70.49779242],
-  [-33.49707959,-70.63411981],
-  [-33.56925534,-70.68663749],
-  [-33.40477084,-70.81620802],
-  [-33.54566739,-70.66502294],
-  [-33.46351916,-70.80960103],
-  [-33.35721329,-70.70877813],
-  [-33.43270266,-70.49966713],
-  [-33.42419724,-70.68115875],
-  [-33.39305505,-70.79277082],
-  [-33.5064062,-70.87679568],
-  [-33.54571895,-70.64256585],
-  [-33.56682788,-70.64090993],
-  [-33.4798847,-70.55470528],
-  [-33.40545774,-70.67650118],
-  [-33.54923259,-70.69949974],
-  [-33.30254013,-70.78225879],
-  [-33.55552895,-70.6335929],
-  [-33.49671475,-70.78586474],
-  [-33.52057277,-70.70636665],
-  [-33.52704269,-70.75575317],
-  [-33.42261111,-70.55884452],
-  [-33.43581681,-70.59058711],
-  [-33.55907948,-70.50813246],
-  [-33.3575131,-70.66813621],
-  [-33.49928845,-70.69240359],
-  [-33.37508965,-70.65835953],
-  [-33.4478084,-70.88677651],
-  [-33.56438981,-70.59506711],
-  [-33.52163819,-70.70462516],
-  [-33.3278884,-70.57828818],
-  [-33.53416474,-70.55507869],
-  [-33.44823433,-70.87952246],
-  [-33.55334476,-70.81051092],
-  [-33.54468033,-70.75286603],
-  [-33.32192707,-70.55582193],
-  [-33.52084214,-70.80106667],
-  [-33.51033752,-70.66304166],
-  [-33.56685329,-70.55508493],
-  [-33.5434537,-70.50220475],
-  [-33.32726332,-70.55431752],
-  [-33.5556801,-70.76607508],
-  [-33.29994125,-70.63629083],
-  [-33.4970288,-70.74612525],
-  [-33.47269738,-70.56721802],
-  [-33.38219125,-70.48668984],
-  [-33.58915089,-70.64089722],
-  [-33.44975419,-70.47674742],
-  [-33.46259514,-70.64946853],
-  [-33.38723504,-70.56262774],
-  [-33.60791373,-70.71045576],
-  [-33.5532596,-70.73140534],
-  [-33.30394238,-70.72678642],
-  [-33.34148977,-70.6152129],
-  [-33.39614913,-70.82450545],
-  [-33.42718102,-70.49312867],
-  [-33.31558087,-70.54663513],
-  [-33.35305475,-70.71323072],
-  [-33.34872184,-70.63982686],
-  [-33.44194803,-70.57125795],
-  [-33.45963489,-70.83837444],
-  [-33.34119171,-70.6893694],
-  [-33.46502744,-70.68208573],
-  [-33.60158364,-70.60776053],
-  [-33.34254599,-70.72914766],
-  [-33.5830463,-70.76251751],
-  [-33.41265408,-70.76909577],
-  [-33.35271189,-70.84691412],
-  [-33.53682647,-70.74349771],
-  [-33.30024594,-70.73598176],
-  [-33.59646587,-70.62838504],
-  [-33.4624641,-70.49531366],
-  [-33.47316443,-70.62085274],
-  [-33.44341369,-70.761642],
-  [-33.3985887,-70.66097358],
-  [-33.42039934,-70.81469683],
-  [-33.55836516,-70.57073086],
-  [-33.56019745,-70.70872255],
-  [-33.3610573,-70.76196862],
-  [-33.56233883,-70.64412606],
-  [-33.36235239,-70.72857523],
-  [-33.4235907,-70.68930847],
-  [-33.55553263,-70.57295558],
-  [-33.45365415,-70.73641605],
-  [-33.54166566,-70.57005424],
-  [-33.44149197,-70.88212863],
-  [-33.38990716,-70.52242856],
-  [-33.40440882,-70.69673996],
-  [-33.40843964,-70.83910163],
-  [-33.32128405,-70.81673191],
-  [-33.47637734,-70.75251124],
-  [-33.48725959,-70.87295545],
-  [-33.4787939,-70.82394345],
-  [-33.38255479,-70.68032921],
-  [-33.40824953,-70.63224146],
-  [-33.51481908,-70.47842608],
-  [-33.31434144,-70.5484387],
-  [-33.59317974,-70.66960529],
-  [-33.5078526,-70.65877303],
-  [-33.31085905,-70.67328281],
-  [-33.40166357,-70.84907751],
-  [-33.34547323,-70.68895997],
-  [-33.5092274,-70.52483725],
-  [-33.51688358,-70.59338608],
-  [-33.43931738,-70.76728679],
-  [-33.43865015,-70.83153392],
-  [-33.36755326,-70.53460043],
-  [-33.40260731,-70.53901444],
-  [-33.42489204,-70.62794091],
-  [-33.4733734,-70.53718298],
-  [-33.4188555,-70.66816738],
-  [-33.48740277,-70.64002552],
-  [-33.37732447,-70.8707071],
-  [-33.3525105,-70.57633851],
-  [-33.41362305,-70.47957582],
-  [-33.54116971,-70.57274162],
-  [-33.61323393,-70.70964681],
-  [-33.53501474,-70.56257293],
-  [-33.60328487,-70.70298175],
-  [-33.49044585,-70.67817327],
-  [-33.41302301,-70.6225223],
-  [-33.45538721,-70.5086083],
-  [-33.4953065,-70.68474827],
-  [-33.31358068,-70.80221],
-  [-33.37263787,-70.59808767],
-  [-33.35949285,-70.55541885],
-  [-33.51390077,-70.75887286],
-  [-33.4054782,-70.6330849],
-  [-33.57596677,-70.63487114],
-  [-33.42827621,-70.50352545],
-  [-33.48708408,-70.498516],
-  [-33.4059265,-70.56400292],
-  [-33.47497121,-70.77259665],
-  [-33.31873524,-70.73668995],
-  [-33.45901757,-70.50007648],
-  [-33.4284906,-70.65122626],
-  [-33.51925694,-70.56220589],
-  [-33.43326706,-70.85628751],
-  [-33.34188301,-70.6376789],
-  [-33.3229943,-70.62250118],
-  [-33.50996904,-70.83528294],
-  [-33.54719604,-70.71853422],
-  [-33.43527237,-70.57101467],
-  [-33.39213727,-70.57874462],
-  [-33.54559388,-70.68731417],
-  [-33.54429824,-70.60725781],
-  [-33.31285191,-70.60405024],
-  [-33.55600859,-70.61878489],
-  [-33.46100997,-70.75566692],
-  [-33.35569899,-70.81551764],
-  [-33.55542118,-70.5618817],
-  [-33.48556158,-70.49438003],
-  [-33.35969649,-70.74171082],
-  [-33.46934817,-70.72359871],
-  [-33.38208547,-70.70203042],
-  [-33.50585001,-70.60181563],
-  [-33.47247544,-70.594881],
-  [-33.45576943,-70.48995394],
-  [-33.30671879,-70.66310528],
-  [-33.44374347,-70.71499753],
-  [-33.56862448,-70.8129452],
-  [-33.59380106,-70.75040065],
-  [-33.40618302,-70.51054171],
-  [-33.50120031,-70.68645897],
-  [-33.36052147,-70.82933272],
-  [-33.61121917,-70.74331512],
-  [-33.30102825,-70.68387205],
-  [-33.53087013,-70.78641033],
-  [-33.52588398,-70.63180405],
-  [-33.28854145,-70.59747375],
-  [-33.41974977,-70.71555813],
-  [-33.28264193,-70.72978266],
-  [-33.39321081,-70.68406565],
-  [-33.57078997,-70.7641817],
-  [-33.52726866,-70.7787886],
-  [-33.40501378,-70.67016424],
-  [-33.35013039,-70.714463],
-  [-33.45012053,-70.74861576],
-  [-33.53800299,-70.49864255],
-  [-33.42056323,-70.71712831],
-  [-33.38298731,-70.70228968],
-  [-33.39709692,-70.60350727],
-  [-33.58899837,-70.65114638],
-  [-33.47172058,-70.54884704],
-  [-33.46315056,-70.7073741],
-  [-33.53237421,-70.67871655],
-  [-33.55467147,-70.78903996],
-  [-33.40542695,-70.51450662],
-  [-33.31428842,-70.64575474],
-  [-33.53986478,-70.75961874],
-  [-33.51111038,-70.7213203],
-  [-33.38662478,-70.8222268],
-  [-33.60954343,-70.58102192],
-  [-33.31846314,-70.56464921],
-  [-33.53961709,-70.82630636],
-  [-33.55615483,-70.57701064],
-  [-33.45177947,-70.78678563],
-  [-33.48640723,-70.69872571],
-  [-33.32514064,-70.54884797],
-  [-33.56076268,-70.62093573],
-  [-33.40451946,-70.59232016],
-  [-33.53406847,-70.85896841],
-  [-33.37365909,-70.51376619],
-  [-33.36377148,-70.78204805],
-  [-33.61683168,-70.72514332],
-  [-33.32416041,-70.68075387],
-  [-33.61879709,-70.62550609],
-  [-33.50655575,-70.8532145],
-  [-33.41091136,-70.7422047],
-  [-33.34677158,-70.76651357],
-  [-33.38318845,-70.61752455],
-  [-33.57151569,-70.53730122],
-  [-33.36042751,-70.58099265],
-  [-33.39814708,-70.53784754],
-  [-33.46185954,-70.87125655],
-  [-33.52260845,-70.52002272],
-  [-33.48812428,-70.62947605],
-  [-33.48554058,-70.81522935],
-  [-33.37890254,-70.48285315],
-  [-33.38085281,-70.82866298],
-  [-33.40162582,-70.60199313],
-  [-33.34694645,-70.55129434],
-  [-33.5276942,-70.57066617],
-  [-33.41597558,-70.58164914],
-  [-33.4050907,-70.85471078],
-  [-33.3521211,-70.83204886],
-  [-33.60940252,-70.75383473],
-  [-33.52007542,-70.51488337],
-  [-33.48301937,-70.65802383],
-  [-33.38550063,-70.71146891],
-  [-33.37366118,-70.80712883],
-  [-33.58896411,-70.72080222],
-  [-33.49914872,-70.77547466],
-  [-33.30346543,-70.6935002],
-  [-33.37147599,-70.76687089],
-  [-33.45237692,-70.69635091],
-  [-33.33493144,-70.70875249],
-  [-33.57044215,-70.80467244],
-  [-33.52476317,-70.58384264],
-  [-33.30820924,-70.76370189],
-  [-33.46720193,-70.79092894],
-  [-33.59237165,-70.6748951],
-  [-33.40398633,-70.7777486],
-  [-33.39223572,-70.59381079],
-  [-33.45523804,-70.57225672],
-  [-33.60512448,-70.75975736],
-  [-33.35067001,-70.56423164],
-  [-33.36858028,-70.56951643],
-  [-33.41879256,-70.73078711],
-  [-33.30862838,-70.75309807],
-  [-33.54967974,-70.55356703],
-  [-33.54707403,-70.55245662],
-  [-33.40040613,-70.56812706],
-  [-33.49770522,-70.61329395],
-  [-33.55348672,-70.63546358],
-  [-33.3934213,-70.74029267],
-  [-33.37489371,-70.65443262],
-  [-33.47491646,-70.68778012],
-  [-33.4698165,-70.62275677],
-  [-33.36033026,-70.59738857],
-  [-33.57839818,-70.75953682],
-  [-33.6144812,-70.66727413],
-  [-33.41474537,-70.87640069],
-  [-33.56611808,-70.67825004],
-  [-33.37299873,-70.56763661],
-  [-33.40922026,-70.8064035],
-  [-33.54981064,-70.60242542],
-  [-33.47846791,-70.47351193],
-  [-33.36689151,-70.79365837],
-  [-33.48032713,-70.74948873],
-  [-33.44379029,-70.84766683],
-  [-33.42815477,-70.59835144],
-  [-33.41442676,-70.63758709],
-  [-33.3205909,-70.70001357],
-  [-33.62157512,-70.62012065],
-  [-33.5285909,-70.68094123],
-  [-33.48712598,-70.63290287],
-  [-33.34832856,-70.84931573],
-  [-33.33689548,-70.82584489],
-  [-33.54728112,-70.75303329],
-  [-33.49844813,-70.6061927],
-  [-33.4271385,-70.6922426],
-  [-33.34596147,-70.71275116],
-  [-33.33205691,-70.52852847],
-  [-33.52958462,-70.82060298],
-  [-33.57137286,-70.74791148],
-  [-33.38323554,-70.6992907],
-  [-33.45903972,-70.64743574],
-  [-33.61023638,-70.68444008],
-  [-33.43514788,-70.56619092],
-  [-33.48755479,-70.60123332],
-  [-33.44188857,-70.65391225],
-  [-33.38943168,-70.82057822],
-  [-33.3216572,-70.77026738],
-  [-33.50650277,-70.81281777],
-  [-33.37132327,-70.59432658],
-  [-33.38014345,-70.71847597],
-  [-33.345174,-70.61332201],
-  [-33.30640092,-70.68502172],
-  [-33.38625513,-70.69632784],
-  [-33.28621581,-70.65409824],
-  [-33.27200344,-70.69063599],
-  [-33.46519658,-70.57436221],
-  [-33.33190717,-70.82319531],
-  [-33.3782965,-70.59297494],
-  [-33.39863895,-70.71584939],
-  [-33.48911747,-70.81525456],
-  [-33.41043191,-70.77646906],
-  [-33.54225631,-70.68521257],
-  [-33.59771606,-70.77439475],
-  [-33.35248605,-70.8561784],
-  [-33.51218985,-70.79707647],
-  [-33.46210772,-70.72302844],
-  [-33.48127073,-70.87867006],
-  [-33.33837401,-70.76159251],
-  [-33.58328823,-70.71586911],
-  [-33.47471921,-70.67442196],
-  [-33.58780729,-70.80626132],
-  [-33.50977751,-70.82083703],
-  [-33.57728789,-70.7083023],
-  [-33.41297796,-70.58898239],
-  [-33.52963291,-70.63489698],
-  [-33.50364359,-70.70170351],
-  [-33.4759305,-70.51185702],
-  [-33.40184096,-70.61408017],
-  [-33.41130886,-70.8314712],
-  [-33.5001826,-70.77512867],
-  [-33.33003369,-70.81231757],
-  [-33.41279256,-70.49951553],
-  [-33.46926899,-70.55596398],
-  [-33.52852723,-70.75501348],
-  [-33.53441747,-70.76667781],
-  [-33.32640673,-70.57528467],
-  [-33.48876356,-70.80535851],
-  [-33.33375774,-70.75902997],
-  [-33.49508227,-70.62383636],
-  [-33.31125084,-70.78422115],
-  [-33.55592941,-70.51199349],
-  [-33.35334452,-70.74100511],
-  [-33.28498952,-70.6889858],
-  [-33.45391178,-70.55834801],
-  [-33.53514399,-70.60068453],
-  [-33.54465304,-70.62766114],
-  [-33.46543437,-70.57419873],
-  [-33.47042198,-70.54429335],
-  [-33.33916002,-70.55711284],
-  [-33.3444728,-70.79582096],
-  [-33.54191738,-70.82448992],
-  [-33.49816439,-70.83530325],
-  [-33.40812364,-70.54829683],
-  [-33.31767155,-70.73398922],
-  [-33.59143865,-70.78727698],
-  [-33.42319875,-70.4617217],
-  [-33.38515677,-70.87078911],
-  [-33.27727799,-70.71687913],
-  [-33.33417887,-70.78082794],
-  [-33.45272914,-70.56804439],
-  [-33.47362927,-70.66185675],
-  [-33.40943809,-70.55649955],
-  [-33.49451931,-70.73813657],
-  [-33.32279077,-70.56573023],
-  [-33.52602046,-70.6476241],
-  [-33.3185818,-70.63115164],
-  [-33.42943399,-70.5347534],
-  [-33.58144325,-70.56871481],
-  [-33.303352,-70.77187767],
-  [-33.56580047,-70.72206032],
-  [-33.44199885,-70.84525783],
-  [-33.59984912,-70.61793501],
-  [-33.54650391,-70.59374319],
-  [-33.37306315,-70.70621867],
-  [-33.54420272,-70.64041692],
-  [-33.31468886,-70.70669354],
-  [-33.60501926,-70.6305129],
-  [-33.47068065,-70.51947318],
-  [-33.44872046,-70.66713329],
-  [-33.55402976,-70.72829981],
-  [-33.55091002,-70.65116484],
-  [-33.41835167,-70.50039842],
-  [-33.59522142,-70.68892299],
-  [-33.43784953,-70.54633763],
-  [-33.34407005,-70.61457827],
-  [-33.53025952,-70.76944703],
-  [-33.6065943,-70.60649098],
-  [-33.53823876,-70.52603134],
-  [-33.60076226,-70.69384293],
-  [-33.59732345,-70.70950515],
-  [-33.33808532,-70.58255842],
-  [-33.49960846,-70.54910477],
-  [-33.52628771,-70.7471315],
-  [-33.41569401,-70.50194665],
-  [-33.50169518,-70.67078595],
-  [-33.52386807,-70.71747639],
-  [-33.45048444,-70.62790547],
-  [-33.46628687,-70.72553463],
-  [-33.42737616,-70.76271559],
-  [-33.41274184,-70.51500444],
-  [-33.29066456,-70.65174994],
-  [-33.45098376,-70.72398372],
-  [-33.33866223,-70.79641559],
-  [-33.48974305,-70.80082509],
-  [-33.5686573,-70.66423063],
-  [-33.40239872,-70.48511226],
-  [-33.54396371,-70.64997287],
-  [-33.42005004,-70.5253446],
-  [-33.50570766,-70.78253985],
-  [-33.57161033,-70.77197044],
-  [-33.39612304,-70.63106809],
-  [-33.39185867,-70.82600969],
-  [-33.29858424,-70.74452888],
-  [-33.32182605,-70.76029017],
-  [-33.49308001,-70.74836926],
-  [-33.37492981,-70.84866868],
-  [-33.4637883,-70.84991156],
-  [-33.55243532,-70.55262387],
-  [-33.47928161,-70.87974004],
-  [-33.44551588,-70.54911966],
-  [-33.35195587,-70.67696173],
-  [-33.47693392,-70.51971838],
-  [-33.51106245,-70.80459065],
-  [-33.47830038,-70.77481359],
-  [-33.41683893,-70.74786619],
-  [-33.39222787,-70.80240892],
-  [-33.3631082,-70.79986264],
-  [-33.61187996,-70.6854587],
-  [-33.44947361,-70.54490027],
-  [-33.48366017,-70.81286234],
-  [-33.51700179,-70.54712062],
-  [-33.52109267,-70.63255491],
-  [-33.47813458,-70.55511059],
-  [-33.33848076,-70.7957496],
-  [-33.32510577,-70.62548088],
-  [-33.32126568,-70.72016854],
-  [-33.29523771,-70.67162381],
-  [-33.43120364,-70.86944608],
-  [-33.37427648,-70.75399372],
-  [-33.32412017,-70.52288666],
-  [-33.35993807,-70.52534307],
-  [-33.48644794,-70.49634246],
-  [-33.50205261,-70.75586725],
-  [-33.43090936,-70.52170186],
-  [-33.49063005,-70.51584328],
-  [-33.58655716,-70.72615716],
-  [-33.50899926,-70.51203869],
-  [-33.36413273,-70.64356679],
-  [-33.43050502,-70.5308361],
-  [-33.37335555,-70.78740113],
-  [-33.54384463,-70.83569941],
-  [-33.54571917,-70.78093132],
-  [-33.39489065,-70.5016539],
-  [-33.38963976,-70.50513455],
-  [-33.57790189,-70.70542622],
-  [-33.29369545,-70.70791016],
-  [-33.57065669,-70.60849295],
-  [-33.57747437,-70.81360932],
-  [-33.59285653,-70.70904312],
-  [-33.36577966,-70.67901663],
-  [-33.44311955,-70.68793113],
-  [-33.49368474,-70.52339063],
-  [-33.60861091,-70.64040041],
-  [-33.43892699,-70.65528311],
-  [-33.37193115,-70.64467987],
-  [-33.4247004,-70.49527137],
-  [-33.29908697,-70.5954485],
-  [-33.45277985,-70.48538489],
-  [-33.55219211,-70.58948685],
-  [-33.42362518,-70.53036272],
-  [-33.33870589,-70.74697808],
-  [-33.50129915,-70.50434465],
-  [-33.31469931,-70.75176812],
-  [-33.35126256,-70.57420178],
-  [-33.44787675,-70.74578567],
-  [-33.36611014,-70.69645934],
-  [-33.42614993,-70.6552795],
-  [-33.48167586,-70.52469965],
-  [-33.53647287,-70.84704248],
-  [-33.56107452,-70.54755573],
-  [-33.48362256,-70.71793232],
-  [-33.47243819,-70.77848376],
-  [-33.41292048,-70.46444133],
-  [-33.40872589,-70.62482119],
-  [-33.31305772,-70.68473598],
-  [-33.40027955,-70.68120819],
-  [-33.49440114,-70.5959728],
-  [-33.4745401,-70.54578874],
-  [-33.54020993,-70.84136207],
-  [-33.47770407,-70.76788882],
-  [-33.47399843,-70.88123202],
-  [-33.51180843,-70.7823922],
-  [-33.35842514,-70.51131135],
-  [-33.43530515,-70.53849159],
-  [-33.46498909,-70.53205322],
-  [-33.32046937,-70.53055738],
-  [-33.32804022,-70.58304113],
-  [-33.38695454,-70.84520128],
-  [-33.42841652,-70.65716746],
-  [-33.36726821,-70.73729297],
-  [-33.49890166,-70.69217009],
-  [-33.52641718,-70.86549539],
-  [-33.5029029,-70.62119747],
-  [-33.43406401,-70.67269647],
-  [-33.57382246,-70.53146909],
-  [-33.5799684,-70.62312807],
-  [-33.42416965,-70.54693567],
-  [-33.36365574,-70.82633275],
-  [-33.30714645,-70.7543272],
-  [-33.52750138,-70.49620127],
-  [-33.47676541,-70.68364809],
-  [-33.51307069,-70.5442122],
-  [-33.41992066,-70.64661993],
-  [-33.4140057,-70.77256455],
-  [-33.56853922,-70.70379633],
-  [-33.44879276,-70.77940893],
-  [-33.52833323,-70.60409877],
-  [-33.33946285,-70.58001584],
-  [-33.2968507,-70.58983433],
-  [-33.47482696,-70.78802864],
-  [-33.52984102,-70.71950689],
-  [-33.52261298,-70.50650573],
-  [-33.49509581,-70.59430688],
-  [-33.48713965,-70.70062017],
-  [-33.36956932,-70.74434323],
-  [-33.56915124,-70.52217581],
-  [-33.33583137,-70.7762535],
-  [-33.34631564,-70.69012864],
-  [-33.57786587,-70.70718214],
-  [-33.41276844,-70.83627519],
-  [-33.52476998,-70.5198304],
-  [-33.51446555,-70.62997824],
-  [-33.44951479,-70.63734768],
-  [-33.32501615,-70.64540625],
-  [-33.49157505,-70.51572664],
-  [-33.3684155,-70.73782459],
-  [-33.29471181,-70.62882778],
-  [-33.51156834,-70.61814236],
-  [-33.36870966,-70.7917632],
-  [-33.35701331,-70.78730896],
-  [-33.44723968,-70.4690555],
-  [-33.44143429,-70.5624233],
-  [-33.33785415,-70.7531226],
-  [-33.41236706,-70.46969182],
-  [-33.47279381,-70.46736686],
-  [-33.41790805,-70.70397349],
-  [-33.53624622,-70.50124744],
-  [-33.30561399,-70.74166583],
-  [-33.35988583,-70.48920667],
-  [-33.33691366,-70.77628743],
-  [-33.54372737,-70.59712027],
-  [-33.52229318,-70.55390991],
-  [-33.435642,-70.84154533],
-  [-33.51129806,-70.85341626],
-  [-33.5039467,-70.47072104],
-  [-33.39371263,-70.82214683],
-  [-33.53927946,-70.54501333],
-  [-33.53374705,-70.78632043],
-  [-33.35658538,-70.74862687],
-  [-33.41906889,-70.57790174],
-  [-33.48459077,-70.78120231],
-  [-33.57169229,-70.53137214],
-  [-33.32304487,-70.74629339],
-  [-33.41880435,-70.49258931],
-  [-33.42412432,-70.83189045],
-  [-33.37795058,-70.51894717],
-  [-33.49563318,-70.64964563],
-  [-33.45026334,-70.85813383],
-  [-33.4387799,-70.69767167],
-  [-33.59110655,-70.65037861],
-  [-33.34101101,-70.7608948],
-  [-33.40471796,-70.58915696],
-  [-33.43706979,-70.78017046],
-  [-33.38303171,-70.63712989],
-  [-33.42451448,-70.49516318],
-  [-33.43806436,-70.65074978],
-  [-33.44264133,-70.59646377],
-  [-33.5223749,-70.70591913],
-  [-33.4832446,-70.77982228],
-  [-33.42498651,-70.88201311],
-  [-33.43648781,-70.57109785],
-  [-33.51119719,-70.83172098],
-  [-33.55693284,-70.68479053],
-  [-33.29385191,-70.57731646],
-  [-33.38062232,-70.8521327],
-  [-33.56424908,-70.51130279],
-  [-33.30945546,-70.59463978],
-  [-33.49767736,-70.80106203],
-  [-33.42496766,-70.66347533],
-  [-33.60993183,-70.67311201],
-  [-33.55307511,-70.81290538],
-  [-33.41557957,-70.73016432],
-  [-33.31536179,-70.60339505],
-  [-33.48161408,-70.73325266],
-  [-33.51836618,-70.63072883],
-  [-33.43394283,-70.73431593],
-  [-33.49550548,-70.64014228],
-  [-33.40975592,-70.78373012],
-  [-33.54463044,-70.69177526],
-  [-33.32845088,-70.70291267],
-  [-33.37666174,-70.49050376],
-  [-33.35105921,-70.57696131],
-  [-33.4649993,-70.54497212],
-  [-33.43990529,-70.48305892],
-  [-33.400885,-70.56366843],
-  [-33.51319065,-70.65744088],
-  [-33.42549937,-70.48745539],
-  [-33.37340309,-70.86458915],
-  [-33.40684014,-70.73187331],
-  [-33.39769263,-70.56913303],
-  [-33.54557337,-70.59329672],
-  [-33.39663864,-70.60369608],
-  [-33.35733907,-70.68495438],
-  [-33.45948218,-70.58316459],
-  [-33.43854253,-70.4933301],
-  [-33.29431494,-70.74545766],
-  [-33.40971065,-70.52827796],
-  [-33.40324074,-70.83856446],
-  [-33.49514074,-70.55595142],
-  [-33.61848253,-70.72011108],
-  [-33.33213106,-70.54200455],
-  [-33.54175594,-70.6090779],
-  [-33.3990131,-70.66256105],
-  [-33.51606844,-70.85490773],
-  [-33.48544348,-70.63781169],
-  [-33.42617291,-70.75587425],
-  [-33.42613173,-70.85938859],
-  [-33.60019656,-70.71396405],
-  [-33.43976047,-70.81262741],
-  [-33.57016933,-70.64408815],
-  [-33.43730312,-70.58046231],
-  [-33.30201483,-70.7622071],
-  [-33.3376689,-70.7553104],
-  [-33.43868726,-70.72514371],
-  [-33.5427979,-70.7283716],
-  [-33.39907234,-70.67899352],
-  [-33.51524289,-70.59402119],
-  [-33.48606038,-70.47109764],
-  [-33.48338345,-70.82578618],
-  [-33.30210461,-70.73694321],
-  [-33.40621006,-70.87721678],
-  [-33.51714275,-70.64721147],
-  [-33.39648058,-70.47354508],
-  [-33.27868167,-70.65767724],
-  [-33.48816796,-70.65206037],
-  [-33.471357,-70.49377245],
-  [-33.53043683,-70.68583894],
-  [-33.27099567,-70.65340758],
-  [-33.34663453,-70.67412094],
-  [-33.52373013,-70.60051938],
-  [-33.368195,-70.73195675],
-  [-33.52343738,-70.51654073],
-  [-33.439275,-70.71499231],
-  [-33.35961816,-70.7186882],
-  [-33.33687922,-70.55448837],
-  [-33.45296322,-70.60822507],
-  [-33.62594108,-70.69800992],
-  [-33.5236762,-70.689278],
-  [-33.39217992,-70.57820945],
-  [-33.38275915,-70.77311144],
-  [-33.39928568,-70.61877568],
-  [-33.58943749,-70.74751632],
-  [-33.45611103,-70.77587901],
-  [-33.28070962,-70.7064494],
-  [-33.39582557,-70.59804566],
-  [-33.39319276,-70.81235401],
-  [-33.54112769,-70.79255258],
-  [-33.29989303,-70.57260748],
-  [-33.52233367,-70.60228911],
-  [-33.38959448,-70.57355003],
-  [-33.33406893,-70.83583592],
-  [-33.34566864,-70.66888929],
-  [-33.59246582,-70.75044122],
-  [-33.61256207,-70.72515692],
-  [-33.39923549,-70.76292459],
-  [-33.45135123,-70.52363289],
-  [-33.28583189,-70.7373294],
-  [-33.49029322,-70.56993724],
-  [-33.42573653,-70.51361248],
-  [-33.53918762,-70.77025414],
-  [-33.26965387,-70.6529356],
-  [-33.51183446,-70.57210495],
-  [-33.58782827,-70.58570544],
-  [-33.39796232,-70.74920235],
-  [-33.50687216,-70.57427644],
-  [-33.60438831,-70.76568028],
-  [-33.4340845,-70.58814158],
-  [-33.49357265,-70.5884023],
-  [-33.53187764,-70.57172473],
-  [-33.40661949,-70.59476511],
-  [-33.37345039,-70.68055188],
-  [-33.4627412,-70.52053408],
-  [-33.42187735,-70.82459166],
-  [-33.36063487,-70.68713411],
-  [-33.46200478,-70.58756568],
-  [-33.47919088,-70.6781069],
-  [-33.40007276,-70.71991083],
-  [-33.51824865,-70.53672838],
-  [-33.61845675,-70.73168371],
-  [-33.36831413,-70.82444695],
-  [-33.45088979,-70.88145785],
-  [-33.51831198,-70.54901058],
-  [-33.29409958,-70.71898499],
-  [-33.43657855,-70.79763907],
-  [-33.39103282,-70.7633945],
-  [-33.57632205,-70.80668944],
-  [-33.47433042,-70.84255208],
-  [-33.52814871,-70.53143848],
-  [-33.57918748,-70.67563455],
-  [-33.62281987,-70.650703],
-  [-33.2907297,-70.66663803],
-  [-33.336673,-70.60238066],
-  [-33.41781071,-70.69381841],
-  [-33.46940541,-70.6946878],
-  [-33.27943108,-70.60291008],
-  [-33.60937714,-70.59304445],
-  [-33.47833015,-70.86107054],
-  [-33.42457858,-70.86854758],
-  [-33.28658464,-70.71570779],
-  [-33.33223634,-70.51458214],
-  [-33.41946324,-70.65358651],
-  [-33.51352713,-70.54064176],
-  [-33.53364882,-70.7096363],
-  [-33.40611837,-70.58285555],
-  [-33.58328394,-70.68816455],
-  [-33.30342258,-70.70001019],
-  [-33.32750999,-70.52052008],
-  [-33.60755898,-70.71475075],
-  [-33.36530911,-70.72119983],
-  [-33.47729044,-70.50891637],
-  [-33.42781457,-70.78921378],
-  [-33.51702785,-70.53342082],
-  [-33.39144967,-70.48348418],
-  [-33.42290814,-70.84286246],
-  [-33.58642712,-70.70328513],
-  [-33.53691713,-70.57544537],
-  [-33.42099646,-70.59923968],
-  [-33.32796869,-70.6898544],
-  [-33.44862209,-70.67645133],
-  [-33.5288356,-70.71571492],
-  [-33.58908615,-70.78033748],
-  [-33.54061885,-70.75028064],
-  [-33.53315104,-70.68153332],
-  [-33.50892075,-70.64692628],
-  [-33.47973008,-70.49645236],
-  [-33.45407511,-70.65792079],
-  [-33.45164315,-70.8545716],
-  [-33.51980204,-70.73686519],
-  [-33.56098412,-70.5778836],
-  [-33.40954378,-70.4699305],
-  [-33.51645909,-70.53365916],
-  [-33.37230145,-70.58209656],
-  [-33.52635068,-70.53855588],
-  [-33.48547069,-70.68095184],
-  [-33.41193055,-70.77944102],
-  [-33.40129076,-70.71595432],
-  [-33.5276512,-70.76174752],
-  [-33.59984568,-70.60200627],
-  [-33.54415807,-70.80315174],
-  [-33.40069078,-70.742982],
-  [-33.37106049,-70.81417515],
-  [-33.47435802,-70.67795913],
-  [-33.55754537,-70.51167301],
-  [-33.61053937,-70.72447509],
-  [-33.51532704,-70.61138345],
-  [-33.31234442,-70.78312255],
-  [-33.30120141,-70.7242736],
-  [-33.45261659,-70.46006667],
-  [-33.32779566,-70.54389074],
-  [-33.53104445,-70.77093396],
-  [-33.54429258,-70.53428358],
-  [-33.5115367,-70.52855404],
-  [-33.38594925,-70.79622068],
-  [-33.59096686,-70.71465678],
-  [-33.34848854,-70.49738129],
-  [-33.30190608,-70.74723742],
-  [-33.48388112,-70.52250431],
-  [-33.44533984,-70.58949948],
-  [-33.40145028,-70.63919096],
-  [-33.31156668,-70.61065047],
-  [-33.31810312,-70.54797331],
-  [-33.55049798,-70.57793308],
-  [-33.53426448,-70.72676597],
-  [-33.42693532,-70.69597762],
-  [-33.35082171,-70.70901378],
-  [-33.48769193,-70.80040516],
-  [-33.47222698,-70.53542317],
-  [-33.43852663,-70.64367693],
-  [-33.46794896,-70.46624548],
-  [-33.34563264,-70.79634517],
-  [-33.5030302,-70.60338838],
-  [-33.54948492,-70.79099183],
-  [-33.49016799,-70.75721771],
-  [-33.49804069,-70.69176995],
-  [-33.40662428,-70.48535463],
-  [-33.31867256,-70.80815065],
-  [-33.30206316,-70.54809325],
-  [-33.49296848,-70.62606223],
-  [-33.52057459,-70.54787377],
-  [-33.39482285,-70.84954856],
-  [-33.55000573,-70.84526814],
-  [-33.54097312,-70.61897142],
-  [-33.60119666,-70.74056823],
-  [-33.27716854,-70.65025787],
-  [-33.36880526,-70.61857107],
-  [-33.56848359,-70.76158065],
-  [-33.5565628,-70.76864021],
-  [-33.39371187,-70.80312423],
-  [-33.37865254,-70.80132473],
-  [-33.46985717,-70.55262036],
-  [-33.38055806,-70.59217287],
-  [-33.37607652,-70.82056946],
-  [-33.54137702,-70.84030924],
-  [-33.27022387,-70.64083612],
-  [-33.34245063,-70.55862383],
-  [-33.33005743,-70.56172584],
-  [-33.3609921,-70.64882321],
-  [-33.45872483,-70.70023306],
-  [-33.40311857,-70.68821658],
-  [-33.5953376,-70.69238],
-  [-33.37872684,-70.6024137],
-  [-33.57055287,-70.58440941],
-  [-33.5800442,-70.71779166],
-  [-33.42512898,-70.86951129],
-  [-33.42817457,-70.5213419],
-  [-33.57083246,-70.74993399],
-  [-33.48239476,-70.66357614],
-  [-33.3884465,-70.79800876],
-  [-33.34293503,-70.83322615],
-  [-33.53145399,-70.53596783],
-  [-33.35452857,-70.66133109],
-  [-33.3170687,-70.7438035],
-  [-33.48126442,-70.83228532],
-  [-33.36234366,-70.68455752],
-  [-33.51268595,-70.60894388],
-  [-33.4422093,-70.82335642],
-  [-33.36411602,-70.76739525],
-  [-33.54799442,-70.64715748],
-  [-33.32475682,-70.75463906],
-  [-33.47164648,-70.88282808],
-  [-33.34871288,-70.73401012],
-  [-33.52903285,-70.51837372],
-  [-33.46875617,-70.73362176],
-  [-33.46026384,-70.63194844],
-  [-33.50420557,-70.55255601],
-  [-33.46105857,-70.85329067],
-  [-33.57656424,-70.74748418],
-  [-33.31480321,-70.66047189],
-  [-33.58472541,-70.80568074],
-  [-33.58757212,-70.63004175],
-  [-33.37995498,-70.84628599],
-  [-33.40369788,-70.83219858],
-  [-33.42685723,-70.75637276],
-  [-33.41064266,-70.68090872],
-  [-33.43003145,-70.59641116],
-  [-33.47591208,-70.5718988],
-  [-33.55337167,-70.71346925],
-  [-33.45806057,-70.84554833],
-  [-33.48404437,-70.64964332],
-  [-33.55002849,-70.82217363],
-  [-33.59806863,-70.63264311],
-  [-33.3611688,-70.66775393],
-  [-33.4486436,-70.7541145],
-  [-33.44689472,-70.59932529],
-  [-33.59634551,-70.72394823],
-  [-33.46848028,-70.66170492],
-  [-33.40306553,-70.47462296],
-  [-33.52673772,-70.60251177],
-  [-33.57407186,-70.7493027],
-  [-33.48135406,-70.67572018],
-  [-33.53737718,-70.83412726],
-  [-33.53377034,-70.55413648],
-  [-33.36496561,-70.72103246],
-  [-33.35425655,-70.65930083],
-  [-33.6070036,-70.75447126],
-  [-33.41021018,-70.54862125],
-  [-33.40060454,-70.63000963],
-  [-33.4410325,-70.72757105],
-  [-33.35851005,-70.80475918],
-  [-33.5789839,-70.67399364],
-  [-33.46082711,-70.82798836],
-  [-33.34660873,-70.69360003],
-  [-33.41364829,-70.88286286],
-  [-33.35825094,-70.63432066],
-  [-33.4577192,-70.55505413],
-  [-33.50413195,-70.60089665],
-  [-33.30726669,-70.80755665],
-  [-33.38181343,-70.81285878],
-  [-33.44187304,-70.61582499],
-  [-33.42037995,-70.76647612],
-  [-33.40992883,-70.67244516],
-  [-33.33740023,-70.53340857],
-  [-33.41010141,-70.47887232],
-  [-33.51357409,-70.6042845],
-  [-33.42398503,-70.86966437],
-  [-33.3805975,-70.69228872],
-  [-33.37296628,-70.83116135],
-  [-33.43601766,-70.8497359],
-  [-33.53217134,-70.83201397],
-  [-33.51300316,-70.55532999],
-  [-33.37487285,-70.64272226],
-  [-33.52952253,-70.6264889],
-  [-33.36973821,-70.57446712],
-  [-33.54357587,-70.77963995],
-  [-33.35048008,-70.5060145],
-  [-33.35958309,-70.82093884],
-  [-33.38719808,-70.70444664],
-  [-33.42598107,-70.47798075],
-  [-33.3194762,-70.77925798],
-  [-33.46857903,-70.84326847],
-  [-33.52887233,-70.60756636],
-  [-33.50539733,-70.71352527],
-  [-33.49391411,-70.52827277],
-  [-33.59422098,-70.72502347],
-  [-33.46859863,-70.87145445],
-  [-33.30045964,-70.56012664],
-  [-33.34412634,-70.54340147],
-  [-33.52326835,-70.58188314],
-  [-33.3753088,-70.49775456],
-  [-33.46724196,-70.84055174],
-  [-33.47283924,-70.75287909],
-  [-33.56350756,-70.61471935],
-  [-33.45909888,-70.71841446],
-  [-33.58198385,-70.58415392],
-  [-33.59586358,-70.61541936],
-  [-33.35946723,-70.71413446],
-  [-33.44550933,-70.48672634],
-  [-33.32367039,-70.58293214],
-  [-33.44145671,-70.75571154],
-  [-33.31639037,-70.76626208],
-  [-33.47786069,-70.54007679],
-  [-33.51331452,-70.59047979],
-  [-33.54533551,-70.79281257],
-  [-33.35688879,-70.64221335],
-  [-33.46855239,-70.8715975],
-  [-33.45352125,-70.47014342],
-  [-33.53343318,-70.58525823],
-  [-33.54230017,-70.64703206],
-  [-33.5042387,-70.80648088],
-  [-33.49587073,-70.61360233],
-  [-33.55537398,-70.54288575],
-  [-33.35456054,-70.58011973],
-  [-33.30788512,-70.74537814],
-  [-33.4803151,-70.60310575],
-  [-33.43948484,-70.57932956],
-  [-33.61411709,-70.60687275],
-  [-33.52195278,-70.57182654],
-  [-33.61387667,-70.5963103],
-  [-33.58833962,-70.66844075],
-  [-33.60286361,-70.65128231],
-  [-33.45622616,-70.54929881],
-  [-33.35533264,-70.52134972],
-  [-33.47400797,-70.60539238],
-  [-33.6006307,-70.6765605],
-  [-33.50243707,-70.72166734],
-  [-33.32762631,-70.6594889],
-  [-33.51123561,-70.63688124],
-  [-33.39515369,-70.59390133],
-  [-33.49546184,-70.66274934],
-  [-33.53498166,-70.76557664],
-  [-33.39995564,-70.80802353],
-  [-33.58681293,-70.63241645],
-  [-33.32911856,-70.524674],
-  [-33.3778743,-70.76188987],
-  [-33.49828066,-70.8073297],
-  [-33.4062421,-70.74087124],
-  [-33.41001208,-70.53322968],
-  [-33.44091936,-70.66424985],
-  [-33.30137054,-70.74263197],
-  [-33.41074167,-70.77493205],
-  [-33.50406895,-70.49904954],
-  [-33.42497267,-70.55426164],
-  [-33.37327125,-70.59514876],
-  [-33.52209478,-70.71592984],
-  [-33.32660282,-70.54179396],
-  [-33.42220868,-70.76588674],
-  [-33.58995353,-70.54234617],
-  [-33.34650944,-70.53039715],
-  [-33.3501845,-70.66492251],
-  [-33.59163516,-70.55914929],
-  [-33.41604901,-70.61339491],
-  [-33.27912747,-70.68844449],
-  [-33.44441298,-70.85213448],
-  [-33.58494358,-70.7357918],
-  [-33.43248952,-70.70083556],
-  [-33.45459492,-70.80498933],
-  [-33.43082405,-70.71318814],
-  [-33.51405411,-70.63820423],
-  [-33.45248311,-70.6677186],
-  [-33.41230265,-70.75824578],
-  [-33.37701466,-70.59145641],
-  [-33.4204594,-70.63952436],
-  [-33.5356499,-70.80786053],
-  [-33.54349601,-70.66279283],
-  [-33.33796145,-70.73801126],
-  [-33.55480615,-70.68923151],
-  [-33.36183894,-70.59521453],
-  [-33.57156576,-70.8120932],
-  [-33.52064734,-70.73883499],
-  [-33.40210356,-70.5991967],
-  [-33.54069366,-70.75217189],
-  [-33.34351373,-70.61923929],
-  [-33.38605521,-70.70659437],
-  [-33.40480941,-70.47101183],
-  [-33.53729133,-70.84457477],
-  [-33.61859083,-70.61043797],
-  [-33.30382416,-70.57860087],
-  [-33.45985054,-70.48406422],
-  [-33.53757786,-70.66697266],
-  [-33.31910602,-70.75009044],
-  [-33.46252174,-70.47416955],
-  [-33.49748074,-70.69442587],
-  [-33.4909875,-70.77897196],
-  [-33.47394182,-70.48892363],
-  [-33.35221866,-70.83440025],
-  [-33.39021433,-70.80328435],
-  [-33.61077949,-70.61906688],
-  [-33.46852926,-70.75639616],
-  [-33.47883878,-70.48868722],
-  [-33.41956375,-70.53623188],
-  [-33.54710103,-70.84958272],
-  [-33.33278867,-70.66438223],
-  [-33.47835141,-70.80098601],
-  [-33.4082362,-70.64473668],
-  [-33.33000729,-70.81436913],
-  [-33.5765395,-70.55090003],
-  [-33.5473067,-70.83526677],
-  [-33.41861777,-70.52448056],
-  [-33.47634329,-70.81282034],
-  [-33.54217105,-70.53338238],
-  [-33.42901096,-70.8623036],
-  [-33.48343026,-70.76325479],
-  [-33.42188388,-70.6804856],
-  [-33.36316003,-70.70530562],
-  [-33.43495844,-70.79913145],
-  [-33.34536547,-70.5331268],
-  [-33.41849687,-70.8403075],
-  [-33.48613083,-70.7502104],
-  [-33.32666031,-70.64945454],
-  [-33.36060499,-70.68452719],
-  [-33.51772419,-70.81844877],
-  [-33.49688295,-70.82593213],
-  [-33.38677275,-70.73044003],
-  [-33.44685633,-70.81394643],
-  [-33.40630261,-70.86544681],
-  [-33.35941859,-70.60532854],
-  [-33.58840792,-70.62389259],
-  [-33.50860383,-70.75570111],
-  [-33.30674465,-70.69202785],
-  [-33.60115395,-70.6671432],
-  [-33.3331198,-70.71312728],
-  [-33.41126439,-70.63734994],
-  [-33.45103969,-70.49568468],
-  [-33.42325196,-70.73084589],
-  [-33.33593593,-70.80870831],
-  [-33.28813938,-70.57594154],
-  [-33.33496851,-70.58425441],
-  [-33.40238045,-70.84958773],
-  [-33.42586694,-70.84930619],
-  [-33.31288226,-70.76729137],
-  [-33.4207651,-70.86761986],
-  [-33.60836658,-70.67098081],
-  [-33.47339216,-70.60169008],
-  [-33.54468191,-70.60327547],
-  [-33.38077231,-70.60673549],
-  [-33.45947473,-70.69637241],
-  [-33.41189282,-70.75901798],
-  [-33.46971458,-70.61552401],
-  [-33.48815529,-70.86735561],
-  [-33.54418475,-70.68688135],
-  [-33.41461058,-70.75855185],
-  [-33.42299047,-70.72340902],
-  [-33.38163282,-70.48365618],
-  [-33.27460362,-70.66983892],
-  [-33.4722764,-70.68940983],
-  [-33.39084622,-70.74499668],
-  [-33.34913602,-70.71418975],
-  [-33.42904005,-70.81488787],
-  [-33.55237348,-70.74742361],
-  [-33.49301947,-70.71310447],
-  [-33.42516142,-70.8832913],
-  [-33.47059161,-70.70086638],
-  [-33.29750147,-70.62792842],
-  [-33.36327431,-70.70320594],
-  [-33.53195741,-70.73586511],
-  [-33.35234208,-70.52074854],
-  [-33.3509912,-70.7974139],
-  [-33.50909433,-70.70297117],
-  [-33.54603452,-70.51366584],
-  [-33.43782216,-70.55204409],
-  [-33.50286052,-70.60243958],
-  [-33.49154233,-70.68874115],
-  [-33.46320564,-70.82368756],
-  [-33.41782705,-70.53442802],
-  [-33.40677125,-70.58868816],
-  [-33.34859058,-70.58538462],
-  [-33.4108458,-70.77915459],
-  [-33.45546978,-70.84160933],
-  [-33.34176481,-70.84455269],
-  [-33.43251197,-70.47401253],
-  [-33.54708994,-70.83541284],
-  [-33.52626424,-70.71108505],
-  [-33.55702511,-70.78085396],
-  [-33.40857304,-70.77299231],
-  [-33.42049833,-70.71233646],
-  [-33.33664178,-70.72242551],
-  [-33.57668577,-70.65364504],
-  [-33.45281263,-70.74085433],
-  [-33.38104842,-70.6318332],
-  [-33.33745033,-70.79625605],
-  [-33.52376475,-70.83834126],
-  [-33.44292242,-70.49448114],
-  [-33.44867639,-70.8264219],
-  [-33.57649848,-70.67118902],
-  [-33.28334546,-70.63655454],
-  [-33.34015208,-70.73309727],
-  [-33.34938538,-70.78791089],
-  [-33.5495402,-70.72430312],
-  [-33.46977203,-70.62319349],
-  [-33.45024962,-70.6678865],
-  [-33.59120462,-70.67251508],
-  [-33.52061983,-70.62948865],
-  [-33.48672612,-70.66155382],
-  [-33.38507232,-70.76537595],
-  [-33.59347366,-70.65007176],
-  [-33.52793941,-70.58790556],
-  [-33.33819133,-70.63098991],
-  [-33.39857835,-70.69389309],
-  [-33.40214849,-70.75768032],
-  [-33.34480882,-70.66461202],
-  [-33.31399103,-70.66187144],
-  [-33.40817352,-70.48997388],
-  [-33.45482704,-70.64239894],
-  [-33.60512136,-70.66321671],
-  [-33.52621298,-70.77747828],
-  [-33.31437638,-70.53253812],
-  [-33.41492602,-70.49195456],
-  [-33.48506213,-70.82075531],
-  [-33.38082921,-70.68085829],
-  [-33.42266348,-70.75910839],
-  [-33.4945296,-70.70114024],
-  [-33.47865364,-70.72899766],
-  [-33.3982596,-70.67141581],
-  [-33.52021638,-70.77735891],
-  [-33.46729282,-70.74499499],
-  [-33.55096313,-70.60530194],
-  [-33.47986382,-70.57089416],
-  [-33.53832211,-70.7504067],
-  [-33.53725003,-70.8045456],
-  [-33.33074717,-70.83736101],
-  [-33.38539624,-70.54589653],
-  [-33.58736714,-70.80753236],
-  [-33.45176295,-70.71204054],
-  [-33.42195644,-70.76342845],
-  [-33.50312584,-70.86249636],
-  [-33.46929151,-70.49392487],
-  [-33.48567608,-70.85481291],
-  [-33.46383756,-70.74107846],
-  [-33.58047326,-70.76446661],
-  [-33.5300186,-70.71137742],
-  [-33.35827011,-70.71709445],
-  [-33.38660468,-70.8004592],
-  [-33.3961042,-70.65025363],
-  [-33.31827214,-70.5933773],
-  [-33.44184713,-70.80749793],
-  [-33.33781571,-70.66195402],
-  [-33.46356346,-70.7281803],
-  [-33.3416355,-70.69745561],
-  [-33.47348599,-70.5022195],
-  [-33.4895505,-70.76978103],
-  [-33.33088034,-70.54728686],
-  [-33.59958444,-70.65475428],
-  [-33.44890573,-70.65962861],
-  [-33.53237084,-70.64614005],
-  [-33.36149832,-70.74529074],
-  [-33.46320826,-70.71509145],
-  [-33.39361385,-70.78514473],
-  [-33.58721417,-70.57772934],
-  [-33.56137857,-70.79666388],
-  [-33.46035261,-70.6508539],
-  [-33.48570095,-70.58486432],
-  [-33.55138712,-70.59442919],
-  [-33.33174204,-70.57770707],
-  [-33.5865257,-70.68014126],
-  [-33.51178346,-70.55204032],
-  [-33.37461631,-70.61124702],
-  [-33.46435463,-70.82343536],
-  [-33.56382233,-70.78909048],
-  [-33.58001181,-70.64435686],
-  [-33.3088293,-70.54093887],
-  [-33.59149157,-70.77756952],
-  [-33.37667367,-70.55488778],
-  [-33.31024504,-70.8080435],
-  [-33.52575054,-70.62820767],
-  [-33.49692297,-70.57234775],
-  [-33.38432906,-70.80494588],
-  [-33.35393381,-70.49444118],
-  [-33.57657785,-70.78308596],
-  [-33.61496484,-70.63468651],
-  [-33.46801659,-70.63975161],
-  [-33.38862792,-70.84612957],
-  [-33.39783505,-70.63027844],
-  [-33.29837514,-70.63898504],
-  [-33.34407874,-70.55299573],
-  [-33.43343327,-70.66444038],
-  [-33.56772979,-70.70164363],
-  [-33.44115709,-70.60537223],
-  [-33.54657035,-70.71758885],
-  [-33.42437227,-70.82434606],
-  [-33.47228164,-70.62523753],
-  [-33.40098623,-70.72252316],
-  [-33.29721502,-70.6226678],
-  [-33.4387038,-70.50749003],
-  [-33.51219857,-70.52587577],
-  [-33.48900735,-70.49535226],
-  [-33.44634329,-70.81915145],
-  [-33.58962548,-70.56735156],
-  [-33.47896987,-70.6502483],
-  [-33.47027714,-70.54730668],
-  [-33.3072435,-70.55041965],
-  [-33.39180253,-70.76791599],
-  [-33.45196378,-70.63337551],
-  [-33.52399319,-70.85926024],
-  [-33.380347,-70.67062207],
-  [-33.41639388,-70.7180638],
-  [-33.45392446,-70.64373686],
-  [-33.46852755,-70.55901152],
-  [-33.52950541,-70.49907816],
-  [-33.350386,-70.68817758],
-  [-33.41569794,-70.66370903],
-  [-33.2933172,-70.64774764],
-  [-33.54094083,-70.49733939],
-  [-33.48552389,-70.78918326],
-  [-33.43390378,-70.87892451],
-  [-33.3748443,-70.58845237],
-  [-33.29572418,-70.76918912],
-  [-33.28198722,-70.59491184],
-  [-33.37121879,-70.58371795],
-  [-33.38612388,-70.58177961],
-  [-33.5353124,-70.5688931],
-  [-33.4313428,-70.52895334],
-  [-33.3301859,-70.74426101],
-  [-33.32350382,-70.56115854],
-  [-33.29213505,-70.68242193],
-  [-33.34364116,-70.73527031],
-  [-33.5197169,-70.51929354],
-  [-33.31697736,-70.7500204],
-  [-33.45180028,-70.79042169],
-  [-33.55686745,-70.57343737],
-  [-33.53555569,-70.6897799],
-  [-33.44674576,-70.46852072],
-  [-33.28266411,-70.68327801],
-  [-33.31844441,-70.66233456],
-  [-33.32824924,-70.74525668],
-  [-33.55478595,-70.53294883],
-  [-33.59516046,-70.67640125],
-  [-33.61228704,-70.69707336],
-  [-33.35342128,-70.71287854],
-  [-33.53201778,-70.57907143],
-  [-33.42965595,-70.71069769],
-  [-33.41156683,-70.4871054],
-  [-33.44238473,-70.72584544],
-  [-33.36808489,-70.59753678],
-  [-33.55771925,-70.67068271],
-  [-33.54126479,-70.65228304],
-  [-33.41513249,-70.66544683],
-  [-33.43918065,-70.87402171],
-  [-33.45377016,-70.68994356],
-  [-33.40512506,-70.86704622],
-  [-33.41881882,-70.78203721],
-  [-33.32854453,-70.68891797],
-  [-33.39525882,-70.68018411],
-  [-33.38843959,-70.7736257],
-  [-33.51563068,-70.75936147],
-  [-33.36050799,-70.51755916],
-  [-33.47011777,-70.74207734],
-  [-33.32632419,-70.60028352],
-  [-33.60651595,-70.62748562],
-  [-33.5287397,-70.82593041],
-  [-33.46531743,-70.53098088],
-  [-33.3945949,-70.62577451],
-  [-33.61455553,-70.71675322],
-  [-33.5121908,-70.57261049],
-  [-33.43160588,-70.55817129],
-  [-33.30127431,-70.58116264],
-  [-33.53666629,-70.70984202],
-  [-33.5431629,-70.52568364],
-  [-33.36225562,-70.52140112],
-  [-33.34603339,-70.52799818],
-  [-33.35073413,-70.59584796],
-  [-33.28560269,-70.66388602],
-  [-33.33206794,-70.81585499],
-  [-33.5107775,-70.496952],
-  [-33.55291647,-70.78169736],
-  [-33.29209215,-70.56689361],
-  [-33.52232806,-70.66247625],
-  [-33.40796723,-70.76059854],
-  [-33.30791801,-70.64016063],
-  [-33.50022062,-70.75976976],
-  [-33.40354775,-70.65657793],
-  [-33.48734272,-70.54496445],
-  [-33.47705101,-70.8745726],
-  [-33.31237536,-70.58605808],
-  [-33.41080767,-70.67515696],
-  [-33.57107166,-70.61477636],
-  [-33.39462904,-70.58029647],
-  [-33.51790475,-70.56381665],
-  [-33.4555691,-70.81490493],
-  [-33.33820911,-70.53927411],
-  [-33.35491002,-70.5929028],
-  [-33.42600925,-70.65830085],
-  [-33.40867399,-70.83571493],
-  [-33.35908288,-70.58282773],
-  [-33.58801768,-70.73668834],
-  [-33.55267658,-70.54045805],
-  [-33.60125648,-70.59215077],
-  [-33.28194093,-70.61970276],
-  [-33.29407597,-70.67024781],
-  [-33.50304945,-70.73304169],
-  [-33.49278713,-70.50091802],
-  [-33.61268783,-70.7227037],
-  [-33.43426846,-70.70345616],
-  [-33.36033348,-70.78299232],
-  [-33.51239697,-70.73673175],
-  [-33.58469868,-70.69884808],
-  [-33.41455282,-70.80642689],
-  [-33.49829426,-70.8721663],
-  [-33.31042257,-70.74417577],
-  [-33.44492786,-70.76385172],
-  [-33.42482191,-70.61537861],
-  [-33.29812354,-70.67826078],
-  [-33.40110796,-70.85182317],
-  [-33.48167454,-70.8053356],
-  [-33.35948131,-70.48598992],
-  [-33.50880637,-70.87609449],
-  [-33.37890192,-70.5571092],
-  [-33.60033849,-70.76143602],
-  [-33.41083737,-70.80114523],
-  [-33.57288168,-70.54507039],
-  [-33.47910673,-70.88471351],
-  [-33.48097887,-70.72282991],
-  [-33.37112097,-70.66807402],
-  [-33.35058995,-70.54974674],
-  [-33.39973299,-70.72590779],
-  [-33.39606195,-70.81746108],
-  [-33.50331224,-70.67089741],
-  [-33.57947318,-70.57792437],
-  [-33.52047583,-70.8210151],
-  [-33.55202319,-70.58933614],
-  [-33.38383822,-70.65966543],
-  [-33.35366205,-70.73174168],
-  [-33.43636117,-70.6022667],
-  [-33.56210049,-70.68630895],
-  [-33.55435274,-70.61360665],
-  [-33.29416945,-70.77488798],
-  [-33.59559808,-70.77874056],
-  [-33.5624917,-70.78347729],
-  [-33.4213565,-70.54987318],
-  [-33.36853871,-70.82499394],
-  [-33.34577784,-70.82157103],
-  [-33.52802547,-70.78898029],
-  [-33.51875505,-70.84443437],
-  [-33.49170458,-70.69365466],
-  [-33.40625242,-70.51366308],
-  [-33.37970303,-70.51920735],
-  [-33.56578242,-70.6459475],
-  [-33.59341363,-70.60172629],
-  [-33.44238963,-70.87832983],
-  [-33.46064924,-70.48696542],
-  [-33.35944279,-70.85895193],
-  [-33.43483967,-70.74799314],
-  [-33.53897114,-70.74753153],
-  [-33.58439786,-70.77025935],
-  [-33.44717609,-70.49247729],
-  [-33.50243212,-70.6637849],
-  [-33.39000551,-70.52448867],
-  [-33.41389646,-70.61071171],
-  [-33.54576737,-70.53162179],
-  [-33.4885657,-70.83383879],
-  [-33.42340527,-70.76089678],
-  [-33.35241956,-70.71147185],
-  [-33.38998526,-70.51977228],
-  [-33.5355053,-70.75665748],
-  [-33.41026977,-70.65606282],
-  [-33.33070726,-70.7832043],
-  [-33.39282836,-70.70283257],
-  [-33.48321867,-70.84756262],
-  [-33.56180477,-70.69548358],
-  [-33.57742029,-70.67494468],
-  [-33.45714595,-70.61982545],
-  [-33.51042101,-70.87205866],
-  [-33.42377425,-70.63500058],
-  [-33.36061701,-70.5370486],
-  [-33.29298763,-70.68265999],
-  [-33.3777664,-70.52751495],
-  [-33.34603503,-70.63338012],
-  [-33.42188144,-70.72202836],
-  [-33.55059343,-70.68510453],
-  [-33.31437356,-70.55760545],
-  [-33.35626357,-70.63776073],
-  [-33.58988446,-70.78057985],
-  [-33.44831979,-70.83846875],
-  [-33.39735158,-70.49049975],
-  [-33.54444964,-70.75487788],
-  [-33.54248202,-70.80352265],
-  [-33.53819868,-70.51734597],
-  [-33.45606697,-70.79795742],
-  [-33.34937285,-70.63887125],
-  [-33.4571187,-70.58626683],
-  [-33.49403848,-70.56685062],
-  [-33.4137735,-70.67366991],
-  [-33.59639561,-70.574761],
-  [-33.36698397,-70.85942705],
-  [-33.42776371,-70.79654803],
-  [-33.50234303,-70.56508899],
-  [-33.29441396,-70.62175084],
-  [-33.58712865,-70.7148224],
-  [-33.36921156,-70.68490988],
-  [-33.35682133,-70.67567765],
-  [-33.54993051,-70.58524145],
-  [-33.58712504,-70.70587214],
-  [-33.48925465,-70.79288045],
-  [-33.50384358,-70.83664087],
-  [-33.49367004,-70.58167742],
-  [-33.54199055,-70.5373139],
-  [-33.52858267,-70.57169889],
-  [-33.32293181,-70.7260148],
-  [-33.5065898,-70.51888888],
-  [-33.27328816,-70.68779884],
-  [-33.54035305,-70.71554357],
-  [-33.41684885,-70.48102948],
-  [-33.45870461,-70.64588264],
-  [-33.32648592,-70.64549443],
-  [-33.57355429,-70.58843255],
-  [-33.31288302,-70.69881133],
-  [-33.38947301,-70.5994622],
-  [-33.49021554,-70.88075705],
-  [-33.60272353,-70.59263645],
-  [-33.60952968,-70.68847535],
-  [-33.38836265,-70.62014847],
-  [-33.27331602,-70.64424657],
-  [-33.40674851,-70.68453266],
-  [-33.5619685,-70.76454622],
-  [-33.57415728,-70.61541977],
-  [-33.34437768,-70.5324548],
-  [-33.4488892,-70.80446766],
-  [-33.37482968,-70.54831423],
-  [-33.40912626,-70.5827437],
-  [-33.5041902,-70.56006437],
-  [-33.3838552,-70.60925417],
-  [-33.38526075,-70.73348884],
-  [-33.44176189,-70.5889906],
-  [-33.45521809,-70.81731661],
-  [-33.44395561,-70.61891467],
-  [-33.34906818,-70.68293868],
-  [-33.51033466,-70.73032405],
-  [-33.52351065,-70.51099946],
-  [-33.57948952,-70.69669461],
-  [-33.40565996,-70.71196474],
-  [-33.5446087,-70.65546143],
-  [-33.36545869,-70.76057969],
-  [-33.35710194,-70.51534679],
-  [-33.36476041,-70.75758424],
-  [-33.48287647,-70.58188281],
-  [-33.51766503,-70.58737179],
-  [-33.56800155,-70.5606636],
-  [-33.36152003,-70.55480724],
-  [-33.36735863,-70.77756761],
-  [-33.56208294,-70.82966333],
-  [-33.54175326,-70.52164632],
-  [-33.52768445,-70.53279378],
-  [-33.3370637,-70.78269227],
-  [-33.31684626,-70.69040434],
-  [-33.44820699,-70.75099778],
-  [-33.50538075,-70.61432472],
-  [-33.59523244,-70.7375105],
-  [-33.55035428,-70.59030372],
-  [-33.35129716,-70.60521261],
-  [-33.51717937,-70.8505011],
-  [-33.55921359,-70.66661889],
-  [-33.56970841,-70.76481837],
-  [-33.58977546,-70.70392424],
-  [-33.3337479,-70.69217495],
-  [-33.39442466,-70.61894705],
-  [-33.55298784,-70.62813126],
-  [-33.54280469,-70.63024046],
-  [-33.55233502,-70.80900535],
-  [-33.27848863,-70.65517019],
-  [-33.44964605,-70.59324033],
-  [-33.46069913,-70.57657617],
-  [-33.57194772,-70.57761512],
-  [-33.44010168,-70.53473395],
-  [-33.52723435,-70.54885035],
-  [-33.31957013,-70.57771131],
-  [-33.4722568,-70.60357127],
-  [-33.45930351,-70.87290091],
-  [-33.38061519,-70.76903049],
-  [-33.33576709,-70.80195393],
-  [-33.34464288,-70.78069131],
-  [-33.52028825,-70.81395377],
-  [-33.48145005,-70.5859297],
-  [-33.42750679,-70.52515758],
-  [-33.50408695,-70.73678875],
-  [-33.47763016,-70.63663525],
-  [-33.60819181,-70.68680434],
-  [-33.51321343,-70.59662085],
-  [-33.35845367,-70.55147034],
-  [-33.47738328,-70.69573614],
-  [-33.43329344,-70.64311997],
-  [-33.36747829,-70.77584318],
-  [-33.38137467,-70.67959336],
-  [-33.41788998,-70.57501192],
-  [-33.55697497,-70.66860413],
-  [-33.57613308,-70.77410055],
-  [-33.38111215,-70.81891946],
-  [-33.28843804,-70.75142141],
-  [-33.37119256,-70.84428413],
-  [-33.47303134,-70.66538231],
-  [-33.5541201,-70.56310789],
-  [-33.44338869,-70.49264827],
-  [-33.5485289,-70.82475253],
-  [-33.40268389,-70.53539948],
-  [-33.43133352,-70.80060007],
-  [-33.32759846,-70.54648224],
-  [-33.54640084,-70.60234384],
-  [-33.36935415,-70.65735903],
-  [-33.40959553,-70.6620432],
-  [-33.44287041,-70.87732974],
-  [-33.32220334,-70.65558215],
-  [-33.45465707,-70.74562989],
-  [-33.47943186,-70.86618225],
-  [-33.51686998,-70.67796704],
-  [-33.42221011,-70.70630348],
-  [-33.33980945,-70.70053856],
-  [-33.58541359,-70.81079352],
-  [-33.33937789,-70.72027334],
-  [-33.53510739,-70.48677328],
-  [-33.43997151,-70.81007978],
-  [-33.33425537,-70.5468547],
-  [-33.38483189,-70.61565011],
-  [-33.53144603,-70.49504173],
-  [-33.39841237,-70.70483251],
-  [-33.46744935,-70.79497773],
-  [-33.55375312,-70.71839836],
-  [-33.57754368,-70.79327516],
-  [-33.44259179,-70.8165975],
-  [-33.43532021,-70.52071638],
-  [-33.60776614,-70.73321185],
-  [-33.40258552,-70.62053757],
-  [-33.3179968,-70.68476715],
-  [-33.59535465,-70.62834372],
-  [-33.44882009,-70.88439421],
-  [-33.38619471,-70.86442302],
-  [-33.56499289,-70.70052196],
-  [-33.42156209,-70.46679638],
-  [-33.3620007,-70.79589447],
-  [-33.44062446,-70.88286832],
-  [-33.33838256,-70.62379896],
-  [-33.31112294,-70.76133856],
-  [-33.52960652,-70.57825857],
-  [-33.35352986,-70.6841701],
-  [-33.44865225,-70.7557409],
-  [-33.45523737,-70.54716369],
-  [-33.43961161,-70.81548343],
-  [-33.42176819,-70.51397319],
-  [-33.34763741,-70.82752616],
-  [-33.3097272,-70.6687286],
-  [-33.50596831,-70.47078876],
-  [-33.62061731,-70.67931252],
-  [-33.44591375,-70.56672139],
-  [-33.54998287,-70.60954848],
-  [-33.4349009,-70.6012904],
-  [-33.34239951,-70.57612571],
-  [-33.5368144,-70.83333277],
-  [-33.47191153,-70.60603684],
-  [-33.36793467,-70.75520938],
-  [-33.52205091,-70.84534816],
-  [-33.45010156,-70.84932372],
-  [-33.49338435,-70.56001516],
-  [-33.34042144,-70.80116795],
-  [-33.57791957,-70.73431441],
-  [-33.50992638,-70.76716584],
-  [-33.3813371,-70.66223573],
-  [-33.3979963,-70.57605276],
-  [-33.60334327,-70.74684911],
-  [-33.52212746,-70.64801553],
-  [-33.39443878,-70.80297444],
-  [-33.40595711,-70.56753306],
-  [-33.46303578,-70.7738089],
-  [-33.444402,-70.8762338],
-  [-33.45112432,-70.52960718],
-  [-33.47721823,-70.48039807],
-  [-33.37055704,-70.82672046],
-  [-33.29872251,-70.7043254],
-  [-33.35089213,-70.63700194],
-  [-33.51366488,-70.70439148],
-  [-33.41547871,-70.56014495],
-  [-33.56070334,-70.70975994],
-  [-33.59186375,-70.69035726],
-  [-33.42084661,-70.84222113],
-  [-33.40513459,-70.83660353],
-  [-33.37478285,-70.50185957],
-  [-33.45931889,-70.82566639],
-  [-33.36691573,-70.82574634],
-  [-33.40756157,-70.53037011],
-  [-33.35374528,-70.49964729],
-  [-33.46749866,-70.52251005],
-  [-33.30561171,-70.73956199],
-  [-33.42615113,-70.60571579],
-  [-33.38963329,-70.57203561],
-  [-33.59371626,-70.69464621],
-  [-33.33437147,-70.75162113],
-  [-33.58346777,-70.64555286],
-  [-33.44721601,-70.58293087],
-  [-33.40894899,-70.87629317],
-  [-33.27242745,-70.67803013],
-  [-33.47778963,-70.549315],
-  [-33.37371392,-70.6752271],
-  [-33.51746111,-70.5654681],
-  [-33.33298517,-70.67404834],
-  [-33.43714731,-70.87032565],
-  [-33.41525769,-70.7621408],
-  [-33.5790662,-70.81333876],
-  [-33.37425797,-70.81564947],
-  [-33.53040031,-70.74476006],
-  [-33.39879045,-70.70863597],
-  [-33.52364154,-70.6815227],
-  [-33.30924861,-70.65049465],
-  [-33.44596104,-70.59329897],
-  [-33.49631873,-70.71027655],
-  [-33.32437886,-70.52743401],
-  [-33.51372869,-70.85719286],
-  [-33.3981831,-70.63185641],
-  [-33.34310414,-70.8263195],
-  [-33.3932288,-70.78190747],
-  [-33.36320138,-70.72477602],
-  [-33.44320468,-70.75691485],
-  [-33.36526556,-70.55138796],
-  [-33.50225663,-70.61064077],
-  [-33.33002181,-70.52494427],
-  [-33.31478024,-70.58709105],
-  [-33.28077231,-70.75042721],
-  [-33.32234729,-70.77944561],
-  [-33.31170923,-70.57225366],
-  [-33.43780024,-70.88256783],
-  [-33.36904965,-70.48908928],
-  [-33.36070237,-70.63956562],
-  [-33.44131351,-70.46738911],
-  [-33.47865383,-70.50483883],
-  [-33.51253736,-70.48329577],
-  [-33.37269346,-70.70600502],
-  [-33.37743609,-70.60640029],
-  [-33.55369933,-70.73338181],
-  [-33.45661898,-70.85208284],
-  [-33.53639194,-70.80853378],
-  [-33.52132714,-70.66272442],
-  [-33.51350415,-70.50332021],
-  [-33.59266195,-70.65475933],
-  [-33.31671263,-70.66115687],
-  [-33.52969028,-70.81603312],
-  [-33.43235802,-70.52384269],
-  [-33.49284305,-70.74414186],
-  [-33.57573523,-70.52597841],
-  [-33.27499048,-70.70296109],
-  [-33.45336655,-70.84652174],
-  [-33.39333287,-70.4710722],
-  [-33.43466642,-70.71936094],
-  [-33.31342402,-70.54107384],
-  [-33.43947123,-70.86030605],
-  [-33.43250675,-70.7754217],
-  [-33.47006181,-70.53346183],
-  [-33.46408525,-70.84017105],
-  [-33.41549185,-70.56914171],
-  [-33.51387916,-70.55027599],
-  [-33.30599051,-70.69594575],
-  [-33.27142302,-70.69416601],
-  [-33.55703206,-70.62231526],
-  [-33.54314468,-70.79164787],
-  [-33.34118309,-70.5689479],
-  [-33.53157317,-70.60635706],
-  [-33.40919541,-70.5403387],
-  [-33.50986822,-70.64863558],
-  [-33.5403173,-70.51959799],
-  [-33.49236514,-70.87818076],
-  [-33.42120581,-70.87659292],
-  [-33.57378967,-70.70580727],
-  [-33.42154099,-70.56783646],
-  [-33.38770431,-70.86990035],
-  [-33.3128576,-70.57862578],
-  [-33.29100533,-70.77499883],
-  [-33.57380937,-70.55435598],
-  [-33.57108331,-70.67644765],
-  [-33.57595749,-70.82079583],
-  [-33.48825737,-70.47178016],
-  [-33.33686812,-70.7075168],
-  [-33.43214812,-70.59205093],
-  [-33.51926839,-70.77635907],
-  [-33.41710987,-70.59454338],
-  [-33.4499913,-70.55785355],
-  [-33.47316906,-70.60299905],
-  [-33.47718684,-70.78589146],
-  [-33.4277187,-70.72178348],
-  [-33.32923017,-70.5230395],
-  [-33.30359457,-70.59154967],
-  [-33.40111963,-70.5769818],
-  [-33.29321723,-70.56671188],
-  [-33.32441413,-70.52079475],
-  [-33.30385826,-70.79380061],
-  [-33.54548361,-70.81875016],
-  [-33.46031292,-70.60422451],
-  [-33.48483693,-70.55556251],
-  [-33.35468282,-70.82620436],
-  [-33.27373813,-70.63284466],
-  [-33.3190929,-70.79517456],
-  [-33.30035744,-70.74578217],
-  [-33.52916368,-70.84143058],
-  [-33.32499921,-70.79131323],
-  [-33.32578294,-70.59498739],
-  [-33.48470751,-70.77790929],
-  [-33.27514447,-70.63067126],
-  [-33.42473239,-70.5100033],
-  [-33.48956228,-70.84805946],
-  [-33.38556676,-70.54474436],
-  [-33.37045504,-70.5703403],
-  [-33.4142582,-70.49103074],
-  [-33.41548735,-70.53879012],
-  [-33.28678584,-70.67867477],
-  [-33.33081354,-70.743851],
-  [-33.57230655,-70.72016746],
-  [-33.58607726,-70.54066442],
-  [-33.48457622,-70.51631803],
-  [-33.46341122,-70.88208482],
-  [-33.39580863,-70.69503347],
-  [-33.36120719,-70.54898238],
-  [-33.52654827,-70.50487473],
-  [-33.36951475,-70.84026084],
-  [-33.60747748,-70.69740373],
-  [-33.40990649,-70.47698191],
-  [-33.43943389,-70.64499896],
-  [-33.32956342,-70.59719551],
-  [-33.59500421,-70.73953995],
-  [-33.496665,-70.69598403],
-  [-33.42466221,-70.80966923],
-  [-33.53361435,-70.8008869],
-  [-33.51848767,-70.678638],
-  [-33.41182381,-70.67744592],
-  [-33.35203275,-70.70439195],
-  [-33.34242235,-70.52756829],
-  [-33.42825872,-70.80225973],
-  [-33.37823209,-70.51243161],
-  [-33.60432315,-70.73170645],
-  [-33.34934031,-70.67535187],
-  [-33.28534099,-70.60305146],
-  [-33.51420699,-70.70661498],
-  [-33.51253834,-70.62779273],
-  [-33.34563054,-70.51978787],
-  [-33.54240599,-70.76764165],
-  [-33.3467825,-70.72684484],
-  [-33.39920054,-70.57424802],
-  [-33.58501064,-70.76028917],
-  [-33.39296518,-70.55489595],
-  [-33.45133461,-70.8734966],
-  [-33.50461114,-70.63565417],
-  [-33.41177988,-70.76300336],
-  [-33.30410332,-70.55196852],
-  [-33.34701663,-70.51548185],
-  [-33.43996124,-70.65005917],
-  [-33.5388203,-70.62789227],
-  [-33.36620822,-70.77958406],
-  [-33.36322309,-70.53100728],
-  [-33.40463329,-70.59882765],
-  [-33.60154504,-70.72883196],
-  [-33.31505209,-70.66478442],
-  [-33.53583363,-70.65037578],
-  [-33.49970029,-70.71609097],
-  [-33.5620034,-70.5963927],
-  [-33.34141605,-70.81230539],
-  [-33.33492184,-70.83373912],
-  [-33.56998852,-70.73475737],
-  [-33.51199106,-70.81679213],
-  [-33.56129499,-70.67004673],
-  [-33.47146177,-70.58777052],
-  [-33.54903386,-70.64294534],
-  [-33.34946567,-70.73106155],
-  [-33.36024361,-70.50666953],
-  [-33.33992354,-70.50545213],
-  [-33.35873091,-70.67863577],
-  [-33.39554573,-70.61228715],
-  [-33.41219944,-70.66677674],
-  [-33.48010267,-70.6853436],
-  [-33.52977614,-70.76902885],
-  [-33.51005715,-70.73260146],
-  [-33.49899349,-70.58510026],
-  [-33.4298446,-70.80506586],
-  [-33.48768738,-70.76497764],
-  [-33.51064412,-70.81406477],
-  [-33.33169959,-70.76316552],
-  [-33.34354506,-70.65549556],
-  [-33.35177418,-70.65160637],
-  [-33.36076769,-70.55942854],
-  [-33.48084957,-70.6646608],
-  [-33.52011537,-70.53137972],
-  [-33.53061729,-70.68257255],
-  [-33.37023006,-70.57979683],
-  [-33.28862966,-70.60426624],
-  [-33.30176966,-70.7255629],
-  [-33.57686806,-70.63633145],
-  [-33.43386897,-70.52846142],
-  [-33.59709272,-70.5613314],
-  [-33.52852734,-70.77479253],
-  [-33.34634577,-70.80242527],
-  [-33.31085592,-70.72767937],
-  [-33.5639516,-70.55017274],
-  [-33.4061419,-70.8822673],
-  [-33.55831587,-70.73651557],
-  [-33.51055236,-70.70675194],
-  [-33.36360258,-70.49196453],
-  [-33.45866737,-70.81339793],
-  [-33.42722123,-70.83675669],
-  [-33.46338594,-70.47419816],
-  [-33.37837128,-70.54149482],
-  [-33.59063464,-70.57709557],
-  [-33.39517819,-70.87725466],
-  [-33.52092763,-70.61705977],
-  [-33.43613298,-70.85063014],
-  [-33.60314367,-70.60340888],
-  [-33.30599971,-70.74480513],
-  [-33.44456968,-70.58709673],
-  [-33.46827845,-70.82707952],
-  [-33.49994707,-70.68606571],
-  [-33.50971448,-70.50479378],
-  [-33.54097027,-70.67520955],
-  [-33.46114707,-70.78588729],
-  [-33.42253119,-70.84569876],
-  [-33.5181896,-70.6595039],
-  [-33.33269671,-70.51556785],
-  [-33.45587028,-70.50401299],
-  [-33.54596262,-70.57146635],
-  [-33.48690828,-70.87439458],
-  [-33.52699421,-70.69925932],
-  [-33.37429773,-70.604811],
-  [-33.50285006,-70.59023012],
-  [-33.43120083,-70.69770852],
-  [-33.33541724,-70.77391167],
-  [-33.45964681,-70.46903907],
-  [-33.61256596,-70.71745058],
-  [-33.56900789,-70.69929792],
-  [-33.34232607,-70.50166496],
-  [-33.54494528,-70.63636625],
-  [-33.29592058,-70.76672539],
-  [-33.47202302,-70.74019872],
-  [-33.44170167,-70.65712929],
-  [-33.54284488,-70.83514306],
-  [-33.53055413,-70.59283452],
-  [-33.36868812,-70.76376699],
-  [-33.51312875,-70.67289744],
-  [-33.49983366,-70.82610424],
-  [-33.54422102,-70.58996475],
-  [-33.4476093,-70.69663434],
-  [-33.44991764,-70.63666453],
-  [-33.60673647,-70.64003258],
-  [-33.40907857,-70.66841499],
-  [-33.38245715,-70.47598822],
-  [-33.34951919,-70.63968044],
-  [-33.43318348,-70.70101986],
-  [-33.48292511,-70.75137136],
-  [-33.39589295,-70.81395954],
-  [-33.50373279,-70.58836237],
-  [-33.34037134,-70.81992631],
-  [-33.54913777,-70.74193716],
-  [-33.54928844,-70.49862193],
-  [-33.28333787,-70.73928792],
-  [-33.56764638,-70.59484811],
-  [-33.61449246,-70.62821923],
-  [-33.47050398,-70.46993277],
-  [-33.60754692,-70.71805501],
-  [-33.3176243,-70.70204236],
-  [-33.34765491,-70.52293862],
-  [-33.32851256,-70.56119853],
-  [-33.4073795,-70.52586252],
-  [-33.38029447,-70.50861129],
-  [-33.49222605,-70.55504148],
-  [-33.28874783,-70.7171558],
-  [-33.43061905,-70.6152987],
-  [-33.59061271,-70.72679283],
-  [-33.36039534,-70.76403939],
-  [-33.50828952,-70.87605717],
-  [-33.55651682,-70.57896531],
-  [-33.37451682,-70.72778166],
-  [-33.33073403,-70.72253491],
-  [-33.49965048,-70.67008216],
-  [-33.49590532,-70.76157357],
-  [-33.52190608,-70.58175549],
-  [-33.41589505,-70.49701375],
-  [-33.55011437,-70.68558562],
-  [-33.29830194,-70.67674238],
-  [-33.3040131,-70.67744137],
-  [-33.52913727,-70.76333212],
-  [-33.31334432,-70.72458978],
-  [-33.43456429,-70.46693034],
-  [-33.37205571,-70.69066156],
-  [-33.53454706,-70.60032729],
-  [-33.37720508,-70.48260101],
-  [-33.35033599,-70.73638336],
-  [-33.42724009,-70.65479896],
-  [-33.5753229,-70.78027955],
-  [-33.38379968,-70.85683545],
-  [-33.48801039,-70.87066124],
-  [-33.38429319,-70.73236486],
-  [-33.41975896,-70.77344031],
-  [-33.59309993,-70.68768215],
-  [-33.40534804,-70.65701097],
-  [-33.6140792,-70.61825324],
-  [-33.35527519,-70.51400938],
-  [-33.56226085,-70.7265129],
-  [-33.56315268,-70.66661555],
-  [-33.42308285,-70.8432689],
-  [-33.4512605,-70.8621698],
-  [-33.49558928,-70.56518498],
-  [-33.4442979,-70.50127618],
-  [-33.50646702,-70.68105007],
-  [-33.35107112,-70.75852323],
-  [-33.55598941,-70.6598301],
-  [-33.4846321,-70.61611737],
-  [-33.31669041,-70.76662124],
-  [-33.4902093,-70.50169841],
-  [-33.46720266,-70.54547067],
-  [-33.46401014,-70.65976912],
-  [-33.48614121,-70.5915657],
-  [-33.50581724,-70.76050185],
-  [-33.5075008,-70.47128113],
-  [-33.4185967,-70.78867964],
-  [-33.59610254,-70.74096568],
-  [-33.41458837,-70.83465649],
-  [-33.49922454,-70.65967277],
-  [-33.46171371,-70.83113151],
-  [-33.44405176,-70.75291507],
-  [-33.32380603,-70.57104831],
-  [-33.51626574,-70.84126152],
-  [-33.50917728,-70.62176652],
-  [-33.46298038,-70.5720632],
-  [-33.50438426,-70.80438619],
-  [-33.40066509,-70.51766333],
-  [-33.31933293,-70.65452319],
-  [-33.55369833,-70.55360048],
-  [-33.50261045,-70.85818868],
-  [-33.4081779,-70.72508989],
-  [-33.6023423,-70.65799453],
-  [-33.4447309,-70.63927162],
-  [-33.3078493,-70.5757815],
-  [-33.47314945,-70.68155135],
-  [-33.45948029,-70.46894036],
-  [-33.36966099,-70.53775294],
-  [-33.46389649,-70.67627252],
-  [-33.3675191,-70.62704287],
-  [-33.42931878,-70.67284246],
-  [-33.50887928,-70.76389407],
-  [-33.55523916,-70.55645574],
-  [-33.3726157,-70.49421002],
-  [-33.46765,-70.8868157],
-  [-33.54634346,-70.67244473],
-  [-33.4346193,-70.5289709],
-  [-33.52118988,-70.69036729],
-  [-33.55528626,-70.51775346],
-  [-33.48475904,-70.50710133],
-  [-33.40247953,-70.50193196],
-  [-33.53020783,-70.79217589],
-  [-33.31324784,-70.70222872],
-  [-33.4338067,-70.81921702],
-  [-33.50690843,-70.75590574],
-  [-33.36976462,-70.77413149],
-  [-33.48896201,-70.81669869],
-  [-33.30468359,-70.78309686],
-  [-33.61135137,-70.60648676],
-  [-33.35070673,-70.50567271],
-  [-33.60225186,-70.78296551],
-  [-33.56263743,-70.52703844],
-  [-33.43970949,-70.66296751],
-  [-33.4269835,-70.64927564],
-  [-33.33179222,-70.71648849],
-  [-33.3093174,-70.80758978],
-  [-33.45683111,-70.50878822],
-  [-33.4080019,-70.57697949],
-  [-33.50268926,-70.69620636],
-  [-33.60846026,-70.59915942],
-  [-33.46239333,-70.75403647],
-  [-33.29775284,-70.66986077],
-  [-33.41819742,-70.56950275],
-  [-33.44126584,-70.73024369],
-  [-33.47907157,-70.58866108],
-  [-33.60977374,-70.5842536],
-  [-33.55903155,-70.79472848],
-  [-33.53185428,-70.57594376],
-  [-33.46949873,-70.71974302],
-  [-33.28868369,-70.73820715],
-  [-33.34196242,-70.52728485],
-  [-33.42680622,-70.51572284],
-  [-33.43225168,-70.85323347],
-  [-33.29600903,-70.59474941],
-  [-33.44824835,-70.64348737],
-  [-33.481758,-70.53403539],
-  [-33.46327554,-70.65668164],
-  [-33.43979833,-70.74765245],
-  [-33.6080155,-70.74923698],
-  [-33.61276655,-70.74423063],
-  [-33.5991194,-70.62712557],
-  [-33.52299508,-70.51422075],
-  [-33.32466107,-70.7161416],
-  [-33.40435921,-70.48206704],
-  [-33.46608603,-70.53407766],
-  [-33.51970403,-70.67678575],
-  [-33.50940043,-70.76121576],
-  [-33.37409618,-70.53307987],
-  [-33.41464526,-70.85110434],
-  [-33.38320608,-70.8264881],
-  [-33.37860621,-70.60279851],
-  [-33.40269066,-70.51495884],
-  [-33.32119753,-70.71131927],
-  [-33.31632673,-70.55267318],
-  [-33.44890764,-70.85028257],
-  [-33.32771064,-70.67232685],
-  [-33.53958966,-70.70614605],
-  [-33.46706837,-70.71926861],
-  [-33.33763668,-70.7769396],
-  [-33.59799278,-70.65683498],
-  [-33.53001621,-70.55357236],
-  [-33.47324824,-70.69406374],
-  [-33.43158459,-70.6096373],
-  [-33.54801455,-70.50067668],
-  [-33.61250632,-70.59112938],
-  [-33.39538417,-70.50021078],
-  [-33.6192709,-70.61290696],
-  [-33.4099995,-70.58696443],
-  [-33.46753737,-70.51178611],
-  [-33.42106359,-70.6765748],
-  [-33.35852105,-70.7667256],
-  [-33.36292792,-70.8348836],
-  [-33.44467375,-70.79880889],
-  [-33.29764672,-70.69110863],
-  [-33.36931911,-70.59910447],
-  [-33.47189378,-70.55038879],
-  [-33.47099775,-70.60616275],
-  [-33.42821058,-70.54873472],
-  [-33.5134908,-70.52105027],
-  [-33.37388154,-70.52232884],
-  [-33.39893732,-70.66410997],
-  [-33.52997564,-70.5081657],
-  [-33.46075667,-70.49891735],
-  [-33.4861234,-70.53655897],
-  [-33.40762436,-70.70247221],
-  [-33.46715868,-70.79056122],
-  [-33.54871534,-70.67183646],
-  [-33.51165851,-70.70146287],
-  [-33.36023528,-70.6980608],
-  [-33.48796216,-70.685346],
-  [-33.46311205,-70.68369606],
-  [-33.43291768,-70.65449321],
-  [-33.59127894,-70.5798526],
-  [-33.56734753,-70.55002198],
-  [-33.59786419,-70.66130176],
-  [-33.40365472,-70.57657971],
-  [-33.3469028,-70.67046226],
-  [-33.38085276,-70.61104776],
-  [-33.36287529,-70.67552572],
-  [-33.41826029,-70.78639745],
-  [-33.51091033,-70.53560028],
-  [-33.59634987,-70.71460008],
-  [-33.49909839,-70.86166533],
-  [-33.58253942,-70.77074432],
-  [-33.38880091,-70.77420904],
-  [-33.5018087,-70.85522036],
-  [-33.38116088,-70.75423815],
-  [-33.37486854,-70.79399178],
-  [-33.3989625,-70.64415889],
-  [-33.27684466,-70.7397569],
-  [-33.44915769,-70.61754852],
-  [-33.55514279,-70.5179868],
-  [-33.54937552,-70.81192307],
-  [-33.443023,-70.58405501],
-  [-33.2870257,-70.63665109],
-  [-33.40977391,-70.85960067],
-  [-33.45477406,-70.80712932],
-  [-33.37124472,-70.55035985],
-  [-33.45509782,-70.50750468],
-  [-33.54053044,-70.70696575],
-  [-33.53868044,-70.51332269],
-  [-33.35484947,-70.53208223],
-  [-33.61686719,-70.64174286],
-  [-33.60557992,-70.74427264],
-  [-33.34125301,-70.67796173],
-  [-33.51520095,-70.48480135],
-  [-33.37483325,-70.68742998],
-  [-33.46074097,-70.58984443],
-  [-33.54257906,-70.79826719],
-  [-33.28477628,-70.67571441],
-  [-33.31168746,-70.62539173],
-  [-33.55163302,-70.78328526],
-  [-33.43687521,-70.78908947],
-  [-33.57673921,-70.60567946],
-  [-33.5730166,-70.63301793],
-  [-33.38210286,-70.73824456],
-  [-33.3427756,-70.82661748],
-  [-33.36726849,-70.69790915],
-  [-33.2720025,-70.69213783],
-  [-33.52362814,-70.67163955],
-  [-33.520177,-70.79890003],
-  [-33.31367485,-70.66277522],
-  [-33.60654158,-70.61746886],
-  [-33.30352222,-70.67100652],
-  [-33.33491028,-70.52684226],
-  [-33.45870162,-70.85243026],
-  [-33.45593959,-70.48699039],
-  [-33.41658854,-70.5869837],
-  [-33.36611241,-70.69463555],
-  [-33.40686148,-70.72762894],
-  [-33.35745999,-70.78083594],
-  [-33.54345437,-70.7214049],
-  [-33.41905209,-70.79522215],
-  [-33.47491689,-70.80658355],
-  [-33.52467498,-70.56143135],
-  [-33.43501555,-70.6088797],
-  [-33.49035011,-70.74975082],
-  [-33.5163428,-70.86455038],
-  [-33.52278272,-70.65690787],
-  [-33.51267705,-70.8533412],
-  [-33.32284095,-70.61563058],
-  [-33.56264872,-70.55489367],
-  [-33.32737565,-70.60922653],
-  [-33.33135409,-70.82023591],
-  [-33.36099707,-70.66287446],
-  [-33.51530536,-70.58299788],
-  [-33.37945577,-70.58321615],
-  [-33.61421767,-70.65683923],
-  [-33.61027798,-70.61609675],
-  [-33.31076424,-70.59990716],
-  [-33.3559658,-70.62683838],
-  [-33.43363537,-70.64415689],
-  [-33.32722867,-70.60337781],
-  [-33.30379598,-70.69777564],
-  [-33.46808026,-70.58663619],
-  [-33.43340806,-70.84361416],
-  [-33.32073373,-70.5621887],
-  [-33.44644085,-70.47911508],
-  [-33.44052508,-70.48868635],
-  [-33.48804688,-70.59916015],
-  [-33.56138684,-70.52942204],
-  [-33.39797328,-70.74877148],
-  [-33.45645682,-70.66257158],
-  [-33.31236935,-70.64072086],
-  [-33.34876814,-70.56122279],
-  [-33.42956414,-70.7801835],
-  [-33.46648305,-70.86433913],
-  [-33.52705128,-70.53266201],
-  [-33.50702759,-70.54252567],
-  [-33.39826633,-70.86016314],
-  [-33.34388162,-70.7930838],
-  [-33.47371405,-70.88145043],
-  [-33.41988005,-70.68139905],
-  [-33.49216528,-70.54769673],
-  [-33.55025857,-70.75012266],
-  [-33.40802773,-70.47732084],
-  [-33.37956376,-70.62377187],
-  [-33.41925737,-70.51012912],
-  [-33.49811857,-70.54846776],
-  [-33.49042409,-70.57502391],
-  [-33.40294492,-70.85578531],
-  [-33.49682519,-70.67070772],
-  [-33.46457354,-70.81983946],
-  [-33.51891568,-70.77652953],
-  [-33.57084445,-70.64070922],
-  [-33.39478187,-70.85878304],
-  [-33.47495155,-70.70612122],
-  [-33.41835911,-70.55076569],
-  [-33.3087189,-70.63178082],
-  [-33.53283943,-70.69697501],
-  [-33.55519694,-70.81843763],
-  [-33.32688657,-70.52642748],
-  [-33.39763072,-70.74073555],
-  [-33.43459878,-70.58033266],
-  [-33.6032407,-70.68057407],
-  [-33.43051758,-70.63367633],
-  [-33.47489629,-70.46094887],
-  [-33.37390667,-70.4887237],
-  [-33.50644766,-70.49564172],
-  [-33.46624462,-70.52804428],
-  [-33.33184669,-70.68891666],
-  [-33.51795324,-70.47959824],
-  [-33.41592624,-70.82080949],
-  [-33.42085992,-70.87439332],
-  [-33.36915566,-70.76572759],
-  [-33.43361432,-70.65978944],
-  [-33.53462356,-70.49578714],
-  [-33.33768811,-70.59883024],
-  [-33.4566572,-70.4961045],
-  [-33.42866447,-70.49125333],
-  [-33.48079552,-70.85340694],
-  [-33.35853326,-70.5072231],
-  [-33.45233769,-70.65474088],
-  [-33.50553154,-70.47568669],
-  [-33.51292942,-70.7173416],
-  [-33.49027625,-70.65773408],
-  [-33.55602911,-70.64385287],
-  [-33.52964477,-70.64776986],
-  [-33.28704963,-70.72455095],
-  [-33.5430371,-70.51689235],
-  [-33.44126168,-70.69791102],
-  [-33.2856818,-70.68564484],
-  [-33.35870175,-70.68511895],
-  [-33.31862595,-70.63985771],
-  [-33.48563949,-70.84442397],
-  [-33.42606559,-70.81109847],
-  [-33.37817464,-70.69552689],
-  [-33.53929564,-70.62210582],
-  [-33.30753294,-70.71310002],
-  [-33.57337887,-70.73871229],
-  [-33.6186459,-70.63509211],
-  [-33.32970598,-70.69189728],
-  [-33.28839335,-70.72069105],
-  [-33.29775175,-70.68779398],
-  [-33.41970705,-70.68071556],
-  [-33.40928247,-70.50118018],
-  [-33.58571867,-70.56781758],
-  [-33.54405314,-70.80911874],
-  [-33.45399094,-70.58422065],
-  [-33.49140927,-70.73959025],
-  [-33.43145941,-70.58341202],
-  [-33.36987566,-70.83129287],
-  [-33.52209695,-70.4790049],
-  [-33.39123719,-70.51093403],
-  [-33.40265267,-70.85508654],
-  [-33.44805064,-70.65899691],
-  [-33.36876951,-70.67778416],
-  [-33.46688253,-70.53582808],
-  [-33.56754267,-70.73057844],
-  [-33.34948479,-70.57575167],
-  [-33.35433736,-70.61542222],
-  [-33.58050251,-70.58593047],
-  [-33.4558306,-70.7649571],
-  [-33.40143351,-70.71145466],
-  [-33.52659188,-70.63584212],
-  [-33.57949778,-70.64344703],
-  [-33.46309055,-70.83982231],
-  [-33.44770432,-70.48140025],
-  [-33.40559144,-70.73078802],
-  [-33.41039828,-70.79496204],
-  [-33.43362667,-70.65968426],
-  [-33.50486717,-70.58139316],
-  [-33.41954741,-70.51190224],
-  [-33.36149299,-70.78776488],
-  [-33.40823749,-70.50166911],
-  [-33.4279612,-70.714498],
-  [-33.48578666,-70.71475806],
-  [-33.6185637,-70.63391054],
-  [-33.54116958,-70.49376199],
-  [-33.50184028,-70.49093195],
-  [-33.33540165,-70.55894782],
-  [-33.36181734,-70.83216068],
-  [-33.38195491,-70.49561398],
-  [-33.47161285,-70.70199258],
-  [-33.38520108,-70.82360192],
-  [-33.4140552,-70.56264318],
-  [-33.43049229,-70.47932434],
-  [-33.33947117,-70.7499719],
-  [-33.38249846,-70.82848843],
-  [-33.42737644,-70.67861598],
-  [-33.42866017,-70.75478974],
-  [-33.40372604,-70.79233922],
-  [-33.48979885,-70.82796202],
-  [-33.34330652,-70.69311878],
-  [-33.37142058,-70.53515932],
-  [-33.40310187,-70.86600838],
-  [-33.52404829,-70.76117442],
-  [-33.49936924,-70.48231224],
-  [-33.49675605,-70.4728476],
-  [-33.38649682,-70.66335785],
-  [-33.27401852,-70.61737553],
-  [-33.38215294,-70.4734076],
-  [-33.30408635,-70.57197454],
-  [-33.60608738,-70.72727751],
-  [-33.34874972,-70.69656348],
-  [-33.60291121,-70.59781342],
-  [-33.50189061,-70.83555229],
-  [-33.3180338,-70.60373852],
-  [-33.31070265,-70.73307262],
-  [-33.32645661,-70.57231637],
-  [-33.41262342,-70.55605911],
-  [-33.49611959,-70.71580185],
-  [-33.39745939,-70.70267249],
-  [-33.34422765,-70.78429169],
-  [-33.33014388,-70.53043439],
-  [-33.36085597,-70.60290108],
-  [-33.46198787,-70.8586541],
-  [-33.62093438,-70.70799469],
-  [-33.55898685,-70.817878],
-  [-33.38841293,-70.74819489],
-  [-33.61725438,-70.64048582],
-  [-33.41658354,-70.673833],
-  [-33.44707663,-70.74439066],
-  [-33.46042684,-70.63725421],
-  [-33.47794935,-70.72290345],
-  [-33.36574154,-70.71575143],
-  [-33.61954668,-70.64319525],
-  [-33.27799643,-70.61489946],
-  [-33.53200566,-70.82563358],
-  [-33.4472378,-70.53654461],
-  [-33.29666718,-70.64834754],
-  [-33.53561128,-70.579422],
-  [-33.45286012,-70.78823568],
-  [-33.39764245,-70.58880415],
-  [-33.43282708,-70.83401124],
-  [-33.28719788,-70.76995152],
-  [-33.4566935,-70.76579085],
-  [-33.46395176,-70.84012807],
-  [-33.35029906,-70.58130232],
-  [-33.36483021,-70.63845895],
-  [-33.40838571,-70.76412864],
-  [-33.30603486,-70.77705587],
-  [-33.52603293,-70.54056418],
-  [-33.48866415,-70.83922681],
-  [-33.29421593,-70.73743449],
-  [-33.31315663,-70.6097326],
-  [-33.3457439,-70.76402065],
-  [-33.47258903,-70.63588101],
-  [-33.32016864,-70.53763281],
-  [-33.31301746,-70.58740792],
-  [-33.47190061,-70.63932622],
-  [-33.45882102,-70.63116195],
-  [-33.52450995,-70.66895244],
-  [-33.2878438,-70.61763092],
-  [-33.48252406,-70.55728344],
-  [-33.45030853,-70.64738671],
-  [-33.4226331,-70.46162404],
-  [-33.46492905,-70.59825376],
-  [-33.53539164,-70.49712004],
-  [-33.54867538,-70.49737189],
-  [-33.33862763,-70.56828861],
-  [-33.55395407,-70.66428085],
-  [-33.42036442,-70.55703156],
-  [-33.61076979,-70.66906966],
-  [-33.47630908,-70.88375465],
-  [-33.37739394,-70.80529581],
-  [-33.55989103,-70.57529507],
-  [-33.55066592,-70.68927714],
-  [-33.55600395,-70.6891506],
-  [-33.55663028,-70.69847236],
-  [-33.2883764,-70.59416169],
-  [-33.42870691,-70.57916244],
-  [-33.55602894,-70.7199516],
-  [-33.37839962,-70.76150209],
-  [-33.3718299,-70.48974109],
-  [-33.49098386,-70.88024535],
-  [-33.393482,-70.83851433],
-  [-33.58259754,-70.56269879],
-  [-33.3706794,-70.68608015],
-  [-33.43462642,-70.83933935],
-  [-33.53735339,-70.55077253],
-  [-33.43014728,-70.47920791],
-  [-33.32797944,-70.58301743],
-  [-33.49036861,-70.60505977],
-  [-33.60882492,-70.63626916],
-  [-33.54827697,-70.51440316],
-  [-33.49853914,-70.79487629],
-  [-33.35712493,-70.80927073],
-  [-33.38483077,-70.78028939],
-  [-33.6228625,-70.66269615],
-  [-33.54955403,-70.68020627],
-  [-33.34269104,-70.77016417],
-  [-33.42339774,-70.70104524],
-  [-33.37695591,-70.66355202],
-  [-33.4601203,-70.60984719],
-  [-33.35294854,-70.54180232],
-  [-33.48973811,-70.83225747],
-  [-33.35356584,-70.64006098],
-  [-33.30305423,-70.74822216],
-  [-33.36794157,-70.8580151],
-  [-33.50120293,-70.72727401],
-  [-33.46245307,-70.62961285],
-  [-33.45550471,-70.81588483],
-  [-33.36786095,-70.61042926],
-  [-33.34053172,-70.63243674],
-  [-33.59979388,-70.70898593],
-  [-33.37942487,-70.65848078],
-  [-33.36447589,-70.6068457],
-  [-33.60021678,-70.57529974],
-  [-33.59552793,-70.70659062],
-  [-33.30295701,-70.74018015],
-  [-33.56486257,-70.57512684],
-  [-33.46568223,-70.62876428],
-  [-33.59101582,-70.79438789],
-  [-33.47688618,-70.62365608],
-  [-33.3533246,-70.60382432],
-  [-33.44282639,-70.53407315],
-  [-33.34403215,-70.8481429],
-  [-33.42782494,-70.61164668],
-  [-33.57619436,-70.73696374],
-  [-33.57034909,-70.58801622],
-  [-33.55681323,-70.70127079],
-  [-33.44363377,-70.68073886],
-  [-33.353133,-70.52488063],
-  [-33.46028997,-70.55120326],
-  [-33.34754259,-70.79602603],
-  [-33.52465312,-70.53350868],
-  [-33.43534933,-70.63032471],
-  [-33.31634156,-70.59450444],
-  [-33.36052008,-70.57883177],
-  [-33.32197131,-70.58039595],
-  [-33.33378044,-70.79271145],
-  [-33.32602063,-70.82477035],
-  [-33.42248365,-70.86907044],
-  [-33.39938696,-70.62998187],
-  [-33.36384295,-70.78183935],
-  [-33.3537728,-70.61189695],
-  [-33.40590549,-70.48882392],
-  [-33.35358863,-70.84206565],
-  [-33.49447066,-70.50151431],
-  [-33.3984344,-70.6008482],
-  [-33.29238341,-70.60826345],
-  [-33.31868036,-70.64671304],
-  [-33.3051357,-70.56189312],
-  [-33.31164271,-70.60849108],
-  [-33.29772689,-70.75207617],
-  [-33.34146775,-70.50724505],
-  [-33.56809012,-70.81811267],
-  [-33.36091616,-70.76923863],
-  [-33.55416878,-70.66068301],
-  [-33.53039213,-70.85796374],
-  [-33.4344055,-70.65618897],
-  [-33.53323988,-70.6312182],
-  [-33.62369107,-70.68782105],
-  [-33.37654545,-70.53121207],
-  [-33.58281907,-70.65019229],
-  [-33.37905569,-70.86442239],
-  [-33.51169424,-70.811444],
-  [-33.3511337,-70.60018207],
-  [-33.41381457,-70.84752445],
-  [-33.50745127,-70.7656015],
-  [-33.61172482,-70.75790775],
-  [-33.4266081,-70.77414303],
-  [-33.43506056,-70.88822713],
-  [-33.4127951,-70.52921675],
-  [-33.34692961,-70.64934257],
-  [-33.35642912,-70.68058901],
-  [-33.5003642,-70.71450575],
-  [-33.42909042,-70.83344338],
-  [-33.36657395,-70.79142342],
-  [-33.41714742,-70.61375149],
-  [-33.56182198,-70.702977],
-  [-33.52186686,-70.71104972],
-  [-33.37083957,-70.56821944],
-  [-33.30389352,-70.68525068],
-  [-33.47809125,-70.85217491],
-  [-33.56911686,-70.64374631],
-  [-33.5890849,-70.62714872],
-  [-33.45135785,-70.85121212],
-  [-33.35760415,-70.57807401],
-  [-33.32786562,-70.59185589],
-  [-33.47979824,-70.69896076],
-  [-33.49815401,-70.704154],
-  [-33.30059647,-70.78679021],
-  [-33.37398589,-70.48382932],
-  [-33.37583645,-70.73789848],
-  [-33.52776865,-70.70663324],
-  [-33.33701952,-70.5604448],
-  [-33.3974594,-70.72101525],
-  [-33.54670489,-70.78304394],
-  [-33.27043448,-70.66284587],
-  [-33.42839236,-70.50705386],
-  [-33.29950152,-70.59269542],
-  [-33.4023887,-70.77342303],
-  [-33.44173273,-70.79044938],
-  [-33.37879382,-70.77073257],
-  [-33.51326583,-70.65103303],
-  [-33.50577829,-70.74723107],
-  [-33.36062377,-70.82869937],
-  [-33.45058727,-70.60036975],
-  [-33.31645167,-70.68440597],
-  [-33.42220063,-70.81185262],
-  [-33.35108182,-70.67147489],
-  [-33.49727825,-70.53762806],
-  [-33.48564341,-70.49759423],
-  [-33.41621701,-70.61711019],
-  [-33.4864502,-70.65379958],
-  [-33.5619952,-70.80343543],
-  [-33.40994761,-70.86474093],
-  [-33.5742341,-70.64643296],
-  [-33.44214165,-70.86652525],
-  [-33.31401138,-70.63231745],
-  [-33.49344856,-70.84355523],
-  [-33.60499888,-70.64848229],
-  [-33.42175254,-70.53104681],
-  [-33.46999736,-70.84794222],
-  [-33.2969217,-70.58377731],
-  [-33.38135563,-70.81192252],
-  [-33.51129203,-70.66420624],
-  [-33.35218166,-70.76510589],
-  [-33.41735546,-70.54790505],
-  [-33.4323776,-70.63130378],
-  [-33.39547525,-70.57911026],
-  [-33.60426443,-70.62119103],
-  [-33.60080999,-70.63575863],
-  [-33.54619021,-70.58261051],
-  [-33.59751781,-70.75944496],
-  [-33.4087744,-70.48787125],
-  [-33.2886253,-70.66973844],
-  [-33.40111712,-70.50531999],
-  [-33.5654817,-70.54606299],
-  [-33.54681671,-70.65255676],
-  [-33.55396884,-70.723479],
-  [-33.40522901,-70.78600215],
-  [-33.48769471,-70.67058197],
-  [-33.56459617,-70.64368027],
-  [-33.41269206,-70.61529418],
-  [-33.43758718,-70.84759197],
-  [-33.46062387,-70.71486899],
-  [-33.57803023,-70.66625093],
-  [-33.39417123,-70.54991297],
-  [-33.50483108,-70.82446505],
-  [-33.40939933,-70.62398902],
-  [-33.48369352,-70.69401946],
-  [-33.45384071,-70.54065482],
-  [-33.28279327,-70.68357931],
-  [-33.58399386,-70.7338858],
-  [-33.58765284,-70.80712376],
-  [-33.45330481,-70.84466158],
-  [-33.50838003,-70.78086895],
-  [-33.4919156,-70.67164387],
-  [-33.54328792,-70.62069073],
-  [-33.57403529,-70.73707919],
-  [-33.28936669,-70.75607172],
-  [-33.52910668,-70.5043594],
-  [-33.45261321,-70.73103256],
-  [-33.56327545,-70.71615057],
-  [-33.40397221,-70.7638155],
-  [-33.52668594,-70.8465673],
-  [-33.56159547,-70.79409494],
-  [-33.58431361,-70.61971898],
-  [-33.34174216,-70.80617347],
-  [-33.60414445,-70.619294],
-  [-33.44034376,-70.69401716],
-  [-33.37131063,-70.59589868],
-  [-33.31514719,-70.69300568],
-  [-33.34539283,-70.82207677],
-  [-33.44603198,-70.85296338],
-  [-33.40673482,-70.4783697],
-  [-33.50382844,-70.83143693],
-  [-33.55964532,-70.50978493],
-  [-33.3869673,-70.51991425],
-  [-33.57765506,-70.52541545],
-  [-33.4173517,-70.79570879],
-  [-33.43803551,-70.64114882],
-  [-33.40992462,-70.79094279],
-  [-33.39951328,-70.60169449],
-  [-33.35076238,-70.7738491],
-  [-33.52775601,-70.80367509],
-  [-33.37949297,-70.75284723],
-  [-33.38646339,-70.79329202],
-  [-33.5987544,-70.78734935],
-  [-33.3013576,-70.66406485],
-  [-33.42165534,-70.81984289],
-  [-33.27861885,-70.6159681],
-  [-33.47001013,-70.77007975],
-  [-33.40043682,-70.72013715],
-  [-33.45783276,-70.5292714],
-  [-33.47748842,-70.64456333],
-  [-33.35260006,-70.53799003],
-  [-33.54536128,-70.78511378],
-  [-33.45766498,-70.79865146],
-  [-33.57833522,-70.6656174],
-  [-33.49193686,-70.51201985],
-  [-33.31665781,-70.72375703],
-  [-33.52421391,-70.85771635],
-  [-33.31590717,-70.680844],
-  [-33.34675428,-70.55309142],
-  [-33.35971288,-70.79880653],
-  [-33.473221,-70.49287614],
-  [-33.45988571,-70.51998206],
-  [-33.48386846,-70.7046468],
-  [-33.6094645,-70.61621273],
-  [-33.41207589,-70.7071808],
-  [-33.51387828,-70.81254917],
-  [-33.56953281,-70.62330927],
-  [-33.38373589,-70.64784229],
-  [-33.6132019,-70.71689709],
-  [-33.59713147,-70.67437772],
-  [-33.40320132,-70.82242745],
-  [-33.35735404,-70.76717696],
-  [-33.56515124,-70.60515784],
-  [-33.57030822,-70.60694775],
-  [-33.5203971,-70.56809413],
-  [-33.55664526,-70.60640971],
-  [-33.59912471,-70.71562214],
-  [-33.37888657,-70.52613027],
-  [-33.56594654,-70.71871915],
-  [-33.49986366,-70.87790093],
-  [-33.41035213,-70.71117825],
-  [-33.36466524,-70.51312127],
-  [-33.46293837,-70.81012265],
-  [-33.37459526,-70.75388006],
-  [-33.41306665,-70.83480575],
-  [-33.30218402,-70.67981196],
-  [-33.46660484,-70.47533917],
-  [-33.37070864,-70.86066051],
-  [-33.34606563,-70.55475975],
-  [-33.49320611,-70.72429542],
-  [-33.29508091,-70.74548678],
-  [-33.45048854,-70.81346748],
-  [-33.51179067,-70.76327788],
-  [-33.50450344,-70.57858291],
-  [-33.59455661,-70.66909657],
-  [-33.50320444,-70.83529798],
-  [-33.48902407,-70.8814253],
-  [-33.34897689,-70.70551728],
-  [-33.30272876,-70.69257492],
-  [-33.51762214,-70.62602213],
-  [-33.38003486,-70.52075139],
-  [-33.53241664,-70.71087887],
-  [-33.5177354,-70.63373351],
-  [-33.5003256,-70.84317593],
-  [-33.32706013,-70.64202705],
-  [-33.35528532,-70.6587742],
-  [-33.34840249,-70.55774189],
-  [-33.48641275,-70.80834539],
-  [-33.34854384,-70.51428521],
-  [-33.31357406,-70.65879689],
-  [-33.38365371,-70.79965697],
-  [-33.42678815,-70.58967239],
-  [-33.40040558,-70.68408412],
-  [-33.42400909,-70.58604596],
-  [-33.33301409,-70.69316419],
-  [-33.42751861,-70.69037195],
-  [-33.5577572,-70.76221972],
-  [-33.44111675,-70.5817387],
-  [-33.56501587,-70.8026767],
-  [-33.44376803,-70.76740964],
-  [-33.55731446,-70.70235811],
-  [-33.32526051,-70.57247442],
-  [-33.27060295,-70.71187319],
-  [-33.505811,-70.85725641],
-  [-33.45562125,-70.46523974],
-  [-33.3785266,-70.59005189],
-  [-33.29643109,-70.77417212],
-  [-33.47269978,-70.80337178],
-  [-33.36869001,-70.66298201],
-  [-33.35623405,-70.81201807],
-  [-33.30703337,-70.79150785],
-  [-33.55628692,-70.81649656],
-  [-33.40163584,-70.83041417],
-  [-33.54657345,-70.71928674],
-  [-33.57017545,-70.6592684],
-  [-33.47646903,-70.85998938],
-  [-33.422781,-70.60755867],
-  [-33.35736679,-70.54551427],
-  [-33.34150616,-70.60354666],
-  [-33.56379433,-70.70027363],
-  [-33.60080693,-70.74122459],
-  [-33.45045393,-70.78651076],
-  [-33.38237801,-70.63530477],
-  [-33.52134578,-70.6068118],
-  [-33.45213347,-70.49586863],
-  [-33.5155085,-70.52987498],
-  [-33.39346898,-70.82984922],
-  [-33.42734241,-70.46349048],
-  [-33.39792046,-70.64140301],
-  [-33.46504509,-70.664484],
-  [-33.3376941,-70.56679504],
-  [-33.45130971,-70.74906232],
-  [-33.43672082,-70.84192911],
-  [-33.49061098,-70.58443726],
-  [-33.44796678,-70.54909751],
-  [-33.35633601,-70.52302638],
-  [-33.42383936,-70.7261374],
-  [-33.53077869,-70.54316942],
-  [-33.5536716,-70.61666731],
-  [-33.54710814,-70.57324185],
-  [-33.36064065,-70.77213676],
-  [-33.55871681,-70.55560081],
-  [-33.46416125,-70.79245587],
-  [-33.48244469,-70.80131413],
-  [-33.53661998,-70.5819801],
-  [-33.56217596,-70.58264744],
-  [-33.48926212,-70.49388421],
-  [-33.37145973,-70.76389548],
-  [-33.53154761,-70.75698679],
-  [-33.55492432,-70.75244406],
-  [-33.35871299,-70.7437016],
-  [-33.51444902,-70.49102139],
-  [-33.5368654,-70.77661366],
-  [-33.48304293,-70.88488878],
-  [-33.46764726,-70.79049756],
-  [-33.48608987,-70.72864083],
-  [-33.38451839,-70.53439121],
-  [-33.45179801,-70.59932038],
-  [-33.5561845,-70.81057625],
-  [-33.45427655,-70.71483739],
-  [-33.41863309,-70.60191371],
-  [-33.42558012,-70.65652965],
-  [-33.52370818,-70.48582581],
-  [-33.61880718,-70.73207057],
-  [-33.44225476,-70.65561263],
-  [-33.44531443,-70.62856185],
-  [-33.37754743,-70.66107344],
-  [-33.47923462,-70.76529048],
-  [-33.56698171,-70.61940016],
-  [-33.45138291,-70.87694735],
-  [-33.46321856,-70.57607803],
-  [-33.43288117,-70.72074902],
-  [-33.47413752,-70.62747545],
-  [-33.3590339,-70.51512703],
-  [-33.52991336,-70.80819297],
-  [-33.32339075,-70.69831187],
-  [-33.48688891,-70.76487966],
-  [-33.54634486,-70.61513398],
-  [-33.29239501,-70.6611938],
-  [-33.61916921,-70.67556207],
-  [-33.31140699,-70.79524173],
-  [-33.47844834,-70.62370156],
-  [-33.6224298,-70.64603071],
-  [-33.48796062,-70.83446949],
-  [-33.44073928,-70.86981703],
-  [-33.3092653,-70.81004698],
-  [-33.47815185,-70.57560376],
-  [-33.54095847,-70.56812991],
-  [-33.47962257,-70.73036419],
-  [-33.34298743,-70.50379375],
-  [-33.48991588,-70.56211642],
-  [-33.56892956,-70.70139283],
-  [-33.494702,-70.81406863],
-  [-33.50851798,-70.48643154],
-  [-33.41487505,-70.72753402],
-  [-33.53168378,-70.56434159],
-  [-33.53384581,-70.84654775],
-  [-33.36809712,-70.71244644],
-  [-33.53080016,-70.53689405],
-  [-33.41748893,-70.74791048],
-  [-33.45757421,-70.46040659],
-  [-33.38414922,-70.80686047],
-  [-33.58240521,-70.60553915],
-  [-33.61496507,-70.67813533],
-  [-33.41451485,-70.59922563],
-  [-33.50251442,-70.55668538],
-  [-33.3681157,-70.76740651],
-  [-33.50834194,-70.48196482],
-  [-33.59584789,-70.57215847],
-  [-33.54392435,-70.65164943],
-  [-33.3842063,-70.62216464],
-  [-33.42398433,-70.68294543],
-  [-33.51941407,-70.73766736],
-  [-33.47188019,-70.49062656],
-  [-33.48864096,-70.50198365],
-  [-33.42749779,-70.50525317],
-  [-33.29147982,-70.61329185],
-  [-33.52224182,-70.70004907],
-  [-33.61722899,-70.61427636],
-  [-33.33273571,-70.58067147],
-  [-33.50357165,-70.86076497],
-  [-33.35995125,-70.49677617],
-  [-33.35612658,-70.83312127],
-  [-33.54525089,-70.53609522],
-  [-33.55628099,-70.75456049],
-  [-33.32404591,-70.67250926],
-  [-33.53621691,-70.51334844],
-  [-33.51423401,-70.55644376],
-  [-33.52987152,-70.67995673],
-  [-33.5060258,-70.63440903],
-  [-33.55306304,-70.57019501],
-  [-33.47443432,-70.8111276],
-  [-33.54194381,-70.72310837],
-  [-33.30473813,-70.64364898],
-  [-33.55940941,-70.52849879],
-  [-33.52699633,-70.83636579],
-  [-33.53115359,-70.83821109],
-  [-33.39413499,-70.77316187],
-  [-33.28942765,-70.61546383],
-  [-33.49212398,-70.4894802],
-  [-33.41781009,-70.83883267],
-  [-33.41176815,-70.58781047],
-  [-33.47284853,-70.61563024],
-  [-33.47015096,-70.72879969],
-  [-33.4888727,-70.79935041],
-  [-33.31639562,-70.6211059],
-  [-33.3862753,-70.78815336],
-  [-33.34174511,-70.77576402],
-  [-33.49148776,-70.77775487],
-  [-33.34930454,-70.51797847],
-  [-33.39948182,-70.70705945],
-  [-33.34980819,-70.81533628],
-  [-33.32733772,-70.71306107],
-  [-33.34804836,-70.60904891],
-  [-33.57069794,-70.8126449],
-  [-33.47499253,-70.79700842],
-  [-33.4875469,-70.61883317],
-  [-33.3915542,-70.73528933],
-  [-33.57285203,-70.81244445],
-  [-33.33876041,-70.5271674],
-  [-33.32263332,-70.60774943],
-  [-33.36595813,-70.52698483],
-  [-33.5325778,-70.54880058],
-  [-33.38416536,-70.71333763],
-  [-33.30200353,-70.70291559],
-  [-33.46770462,-70.66094966],
-  [-33.48546662,-70.54062749],
-  [-33.48156411,-70.6678774],
-  [-33.35749108,-70.7626151],
-  [-33.44006304,-70.56355255],
-  [-33.31034203,-70.73091979],
-  [-33.50020384,-70.61528042],
-  [-33.52279583,-70.86156702],
-  [-33.33791005,-70.72108252],
-  [-33.46768027,-70.81523112],
-  [-33.41406961,-70.65701994],
-  [-33.39548534,-70.79602659],
-  [-33.56396805,-70.51232648],
-  [-33.53264375,-70.72155093],
-  [-33.54385365,-70.50723751],
-  [-33.56031286,-70.56636343],
-  [-33.34140655,-70.55386093],
-  [-33.60437221,-70.71887723],
-  [-33.52932752,-70.52417842],
-  [-33.44191137,-70.72995812],
-  [-33.38814989,-70.87334929],
-  [-33.49896659,-70.69404873],
-  [-33.44402106,-70.57802681],
-  [-33.40902763,-70.47377191],
-  [-33.39951949,-70.81439137],
-  [-33.40673551,-70.77791488],
-  [-33.43011239,-70.78175661],
-  [-33.52223732,-70.70586689],
-  [-33.44796372,-70.59915176],
-  [-33.32858249,-70.74500843],
-  [-33.45396609,-70.50339934],
-  [-33.37525467,-70.8343068],
-  [-33.36782483,-70.7946525],
-  [-33.49781513,-70.80955912],
-  [-33.3853718,-70.59449267],
-  [-33.55501933,-70.81675678],
-  [-33.51099741,-70.49801289],
-  [-33.37561349,-70.65330387],
-  [-33.36648064,-70.6546956],
-  [-33.41694029,-70.75370172],
-  [-33.46055972,-70.64960287],
-  [-33.34560476,-70.6309954],
-  [-33.37758118,-70.72792447],
-  [-33.5650329,-70.5780577],
-  [-33.36166422,-70.58374768],
-  [-33.31259619,-70.60360708],
-  [-33.36795745,-70.8573015],
-  [-33.43948331,-70.87200934],
-  [-33.61656119,-70.69082495],
-  [-33.49439745,-70.68126688],
-  [-33.33265424,-70.68924833],
-  [-33.43806238,-70.77209353],
-  [-33.41329616,-70.57237848],
-  [-33.52936358,-70.7489409],
-  [-33.60647971,-70.68864702],
-  [-33.45511449,-70.8274782],
-  [-33.57200948,-70.52938121],
-  [-33.59537222,-70.55478695],
-  [-33.45508889,-70.74457355],
-  [-33.38475663,-70.7232699],
-  [-33.34399482,-70.79788832],
-  [-33.35446088,-70.78094195],
-  [-33.32543767,-70.53117727],
-  [-33.5940281,-70.68218246],
-  [-33.40900994,-70.54129333],
-  [-33.37146233,-70.73231938],
-  [-33.4530014,-70.73446588],
-  [-33.34217108,-70.71887493],
-  [-33.3651117,-70.53124138],
-  [-33.5252002,-70.5123238],
-  [-33.36166623,-70.8576204],
-  [-33.59282284,-70.58808779],
-  [-33.59512696,-70.78962772],
-  [-33.58762194,-70.73286066],
-  [-33.35955403,-70.50118546],
-  [-33.4382605,-70.83931178],
-  [-33.57988362,-70.7551006],
-  [-33.57377049,-70.53137242],
-  [-33.53628975,-70.70834101],
-  [-33.53268591,-70.6408042],
-  [-33.51658094,-70.78052851],
-  [-33.37105634,-70.63127088],
-  [-33.52901396,-70.68036905],
-  [-33.42501528,-70.56616173],
-  [-33.29381106,-70.5952271],
-  [-33.48144727,-70.50390215],
-  [-33.50265443,-70.77365732],
-  [-33.50469951,-70.78565781],
-  [-33.5591824,-70.71724897],
-  [-33.44522626,-70.57393219],
-  [-33.27584196,-70.67542309],
-  [-33.41651323,-70.87059584],
-  [-33.54742232,-70.68557691],
-  [-33.40892966,-70.87286677],
-  [-33.43546405,-70.53856128],
-  [-33.53543706,-70.70940588],
-  [-33.39756532,-70.52906949],
-  [-33.51415436,-70.76460301],
-  [-33.44763662,-70.74787469],
-  [-33.60840839,-70.69823286],
-  [-33.52837865,-70.54367239],
-  [-33.46064674,-70.56442973],
-  [-33.42662496,-70.88369174],
-  [-33.39954114,-70.86554554],
-  [-33.36316295,-70.68654982],
-  [-33.33314629,-70.7822077],
-  [-33.46500641,-70.55483279],
-  [-33.43600308,-70.47754748],
-  [-33.39830697,-70.48972076],
-  [-33.52147751,-70.57658511],
-  [-33.58803794,-70.70817563],
-  [-33.48081523,-70.66581512],
-  [-33.4400931,-70.64613012],
-  [-33.54919084,-70.66311637],
-  [-33.27747676,-70.61939167],
-  [-33.53237247,-70.80297989],
-  [-33.47561079,-70.85684293],
-  [-33.57372603,-70.75521677],
-  [-33.46988412,-70.5827205],
-  [-33.34218189,-70.81486604],
-  [-33.29929823,-70.57068703],
-  [-33.40399282,-70.72346093],
-  [-33.35648003,-70.58584689],
-  [-33.32490693,-70.59021342],
-  [-33.52100325,-70.86880674],
-  [-33.58024785,-70.63507445],
-  [-33.47420073,-70.60851222],
-  [-33.50011504,-70.48288312],
-  [-33.48667045,-70.59990115],
-  [-33.52181908,-70.67837884],
-  [-33.36246941,-70.83809395],
-  [-33.44989915,-70.80788535],
-  [-33.53732384,-70.50084375],
-  [-33.33798723,-70.57549265],
-  [-33.57347161,-70.71081923],
-  [-33.53031343,-70.63795439],
-  [-33.32222894,-70.82648619],
-  [-33.47062176,-70.87826125],
-  [-33.50870367,-70.59355608],
-  [-33.53261431,-70.68798463],
-  [-33.48728945,-70.70797549],
-  [-33.40755073,-70.64812633],
-  [-33.3769859,-70.59832062],
-  [-33.37532996,-70.69240018],
-  [-33.53014745,-70.63285213],
-  [-33.44174934,-70.74655961],
-  [-33.3439287,-70.72727315],
-  [-33.43604817,-70.79258481],
-  [-33.53211972,-70.76159115],
-  [-33.53174626,-70.72473404],
-  [-33.30016593,-70.57579058],
-  [-33.4389346,-70.67656355],
-  [-33.43908128,-70.86617563],
-  [-33.45960679,-70.83174136],
-  [-33.46197965,-70.78762292],
-  [-33.35097044,-70.6559513],
-  [-33.57841161,-70.72630653],
-  [-33.54728847,-70.55970221],
-  [-33.53992337,-70.66776431],
-  [-33.50388509,-70.58679518],
-  [-33.41022826,-70.76839096],
-  [-33.35468402,-70.55921778],
-  [-33.42180998,-70.48992143],
-  [-33.39027689,-70.71698008],
-  [-33.56502928,-70.58484569],
-  [-33.39844133,-70.65220478],
-  [-33.48840243,-70.79515283],
-  [-33.31734509,-70.78738036],
-  [-33.4512483,-70.71212316],
-  [-33.43996021,-70.58285327],
-  [-33.37472814,-70.62519749],
-  [-33.4690986,-70.6813759],
-  [-33.41122876,-70.7775952],
-  [-33.51359231,-70.6366607],
-  [-33.50575349,-70.65460814],
-  [-33.62430747,-70.64148781],
-  [-33.39779744,-70.78811308],
-  [-33.55553172,-70.54943854],
-  [-33.36560809,-70.50981201],
-  [-33.31548162,-70.74526601],
-  [-33.47093908,-70.57060483],
-  [-33.49734213,-70.54369157],
-  [-33.36778999,-70.67203585],
-  [-33.40249756,-70.48974598],
-  [-33.32425165,-70.78373149],
-  [-33.34492077,-70.50950202],
-  [-33.36453029,-70.58034307],
-  [-33.48968224,-70.76543344],
-  [-33.31932085,-70.66926628],
-  [-33.44745496,-70.63327993],
-  [-33.3436327,-70.50047929],
-  [-33.35336864,-70.67109206],
-  [-33.44439954,-70.56289825],
-  [-33.46813617,-70.85250596],
-  [-33.53131206,-70.48364527],
-  [-33.32948025,-70.59880954],
-  [-33.32118214,-70.74715362],
-  [-33.59955647,-70.57166205],
-  [-33.33219162,-70.74582648],
-  [-33.38482286,-70.86593855],
-  [-33.36906476,-70.56192351],
-  [-33.57983361,-70.80993741],
-  [-33.36477136,-70.72413543],
-  [-33.35635951,-70.82996352],
-  [-33.48979224,-70.47790354],
-  [-33.39126016,-70.54643112],
-  [-33.43869806,-70.60509679],
-  [-33.36591094,-70.77653857],
-  [-33.47272299,-70.54222193],
-  [-33.35048385,-70.56384079],
-  [-33.44808518,-70.8554602],
-  [-33.56655955,-70.69462235],
-  [-33.43235502,-70.50844447],
-  [-33.39748231,-70.59032514],
-  [-33.34366482,-70.5860015],
-  [-33.50488278,-70.55265057],
-  [-33.56870983,-70.74623106],
-  [-33.33429951,-70.64263081],
-  [-33.38998144,-70.71142338],
-  [-33.4904392,-70.70972016],
-  [-33.59647161,-70.60567319],
-  [-33.30345493,-70.64465309],
-  [-33.29474802,-70.69618223],
-  [-33.61664207,-70.70216844],
-  [-33.47690811,-70.52390078],
-  [-33.45381329,-70.78404051],
-  [-33.51027177,-70.49687346],
-  [-33.33662377,-70.64887378],
-  [-33.38444978,-70.82120407],
-  [-33.2970114,-70.59314665],
-  [-33.39782551,-70.86189026],
-  [-33.40318422,-70.67012629],
-  [-33.32619401,-70.65688776],
-  [-33.4641707,-70.85457088],
-  [-33.43626576,-70.64191171],
-  [-33.34805878,-70.52121541],
-  [-33.32110576,-70.58030273],
-  [-33.27385344,-70.6205534],
-  [-33.51480396,-70.78995106],
-  [-33.46852619,-70.79366859],
-  [-33.41031407,-70.65457586],
-  [-33.4452916,-70.57678811],
-  [-33.47517515,-70.56447758],
-  [-33.58907156,-70.55142934],
-  [-33.27863204,-70.628884],
-  [-33.55531139,-70.63732449],
-  [-33.35890018,-70.6502473],
-  [-33.27932069,-70.74360376],
-  [-33.50259372,-70.86877814],
-  [-33.49944333,-70.85937834],
-  [-33.48772418,-70.52420839],
-  [-33.3380847,-70.6880236],
-  [-33.49344185,-70.62192915],
-  [-33.48600745,-70.82220631],
-  [-33.46730365,-70.88498585],
-  [-33.41826605,-70.78938219],
-  [-33.54870584,-70.53764742],
-  [-33.34851979,-70.55871426],
-  [-33.46879078,-70.87567302],
-  [-33.45605892,-70.47860351],
-  [-33.54129853,-70.75229199],
-  [-33.41833309,-70.85938104],
-  [-33.30900906,-70.69760084],
-  [-33.46307243,-70.87533904],
-  [-33.40706664,-70.80632955],
-  [-33.50764983,-70.65386054],
-  [-33.36056628,-70.75754281],
-  [-33.38206399,-70.55192226],
-  [-33.47281953,-70.50213459],
-  [-33.4081199,-70.71442121],
-  [-33.40193337,-70.7524927],
-  [-33.38727587,-70.64431908],
-  [-33.29198447,-70.59472713],
-  [-33.55236142,-70.63516139],
-  [-33.53231804,-70.54612874],
-  [-33.44426884,-70.71631915],
-  [-33.49676869,-70.55639651],
-  [-33.53349814,-70.84986578],
-  [-33.58148619,-70.59802668],
-  [-33.3459491,-70.74353712],
-  [-33.30121869,-70.78802026],
-  [-33.31983134,-70.70508409],
-  [-33.57063226,-70.58639991],
-  [-33.44888123,-70.86918421],
-  [-33.50961291,-70.72883672],
-  [-33.39467871,-70.70365872],
-  [-33.40680064,-70.77584426],
-  [-33.54067796,-70.49715519],
-  [-33.30779416,-70.73882441],
-  [-33.49315797,-70.58075751],
-  [-33.43853972,-70.80000705],
-  [-33.57376082,-70.56912993],
-  [-33.45353028,-70.53081798],
-  [-33.44444108,-70.67306624],
-  [-33.5176065,-70.5470946],
-  [-33.50856206,-70.62283565],
-  [-33.49362524,-70.69343185],
-  [-33.41595148,-70.82680527],
-  [-33.48419419,-70.56318831],
-  [-33.4487382,-70.82710366],
-  [-33.62492727,-70.70257292],
-  [-33.30375203,-70.57536677],
-  [-33.54779863,-70.62631744],
-  [-33.44295573,-70.5510656],
-  [-33.33135291,-70.77807057],
-  [-33.53970811,-70.64691917],
-  [-33.54681072,-70.49578339],
-  [-33.28208078,-70.73430188],
-  [-33.37331855,-70.8698769],
-  [-33.44433475,-70.56801465],
-  [-33.39600799,-70.82836091],
-  [-33.46775745,-70.86671165],
-  [-33.43768739,-70.64242405],
-  [-33.3901719,-70.55856032],
-  [-33.44753987,-70.61714339],
-  [-33.48017144,-70.66844146],
-  [-33.37206836,-70.48324294],
-  [-33.38347168,-70.57511441],
-  [-33.35870593,-70.69289076],
-  [-33.48544653,-70.70784033],
-  [-33.50599374,-70.85388288],
-  [-33.44573964,-70.78046056],
-  [-33.51468029,-70.73090718],
-  [-33.47783076,-70.86349034],
-  [-33.29232423,-70.68916323],
-  [-33.2870341,-70.69106686],
-  [-33.47028418,-70.59580159],
-  [-33.38503703,-70.57661597],
-  [-33.37909777,-70.59157272],
-  [-33.40558666,-70.81643629],
-  [-33.50645518,-70.72590521],
-  [-33.30297636,-70.61068234],
-  [-33.47913973,-70.4739591],
-  [-33.3245546,-70.61426408],
-  [-33.41255148,-70.84116308],
-  [-33.56324682,-70.55470804],
-  [-33.34220087,-70.75670814],
-  [-33.59972676,-70.77503191],
-  [-33.48490453,-70.80214089],
-  [-33.57000704,-70.57255178],
-  [-33.59261182,-70.63367928],
-  [-33.36368676,-70.70979594],
-  [-33.40298357,-70.64819321],
-  [-33.39323906,-70.87003313],
-  [-33.43899784,-70.65232111],
-  [-33.38782675,-70.7910224],
-  [-33.29580319,-70.75159765],
-  [-33.39684161,-70.70063395],
-  [-33.39998609,-70.47956791],
-  [-33.42901066,-70.52800616],
-  [-33.31712604,-70.74223679],
-  [-33.55443491,-70.77815297],
-  [-33.28600778,-70.63364506],
-  [-33.30858095,-70.79584532],
-  [-33.32951081,-70.6997337],
-  [-33.38769219,-70.63550502],
-  [-33.44526631,-70.46278068],
-  [-33.46548625,-70.68853446],
-  [-33.4206089,-70.71110905],
-  [-33.32033126,-70.64525605],
-  [-33.49083565,-70.84993852],
-  [-33.36935044,-70.78833257],
-  [-33.39114477,-70.73285493],
-  [-33.47408409,-70.75608859],
-  [-33.45921609,-70.85803338],
-  [-33.54368503,-70.56671069],
-  [-33.40987807,-70.70389172],
-  [-33.5310884,-70.6927391],
-  [-33.42668333,-70.81362137],
-  [-33.33115125,-70.62312371],
-  [-33.59322119,-70.55778821],
-  [-33.5012014,-70.80350397],
-  [-33.56994433,-70.74793955],
-  [-33.33442376,-70.67417774],
-  [-33.28501274,-70.59557481],
-  [-33.49033789,-70.64514851],
-  [-33.47350079,-70.47444797],
-  [-33.36908503,-70.65003084],
-  [-33.54765444,-70.50160716],
-  [-33.50324342,-70.63802261],
-  [-33.59874061,-70.63042799],
-  [-33.49492125,-70.50473758],
-  [-33.38604687,-70.81156333],
-  [-33.56703196,-70.76174044],
-  [-33.42943472,-70.46732311],
-  [-33.59485886,-70.75020099],
-  [-33.42654994,-70.65645717],
-  [-33.56035072,-70.70992486],
-  [-33.50919775,-70.77816333],
-  [-33.37825987,-70.74731982],
-  [-33.37096787,-70.61549496],
-  [-33.44858151,-70.59631391],
-  [-33.40197477,-70.85502637],
-  [-33.42386018,-70.57748758],
-  [-33.52627659,-70.48320699],
-  [-33.29320423,-70.57517464],
-  [-33.29313494,-70.624727],
-  [-33.32328775,-70.67836466],
-  [-33.2939492,-70.58622194],
-  [-33.30528758,-70.67681263],
-  [-33.3572619,-70.50464597],
-  [-33.42417392,-70.63643663],
-  [-33.31149231,-70.5352147],
-  [-33.29201105,-70.69128402],
-  [-33.43128759,-70.51226818],
-  [-33.50837007,-70.73064309],
-  [-33.53141069,-70.78926506],
-  [-33.34971887,-70.58916411],
-  [-33.40433403,-70.504956],
-  [-33.44626402,-70.76880152],
-  [-33.46103299,-70.49753881],
-  [-33.3539695,-70.64478393],
-  [-33.49248556,-70.64041098],
-  [-33.52782251,-70.85641786],
-  [-33.41562016,-70.63063062],
-  [-33.50088605,-70.64361542],
-  [-33.4044206,-70.49487221],
-  [-33.31686139,-70.79621994],
-  [-33.57775302,-70.75119693],
-  [-33.48995069,-70.55155524],
-  [-33.31883142,-70.73232032],
-  [-33.29160329,-70.65873491],
-  [-33.54402797,-70.8475227],
-  [-33.58273399,-70.59473566],
-  [-33.309685,-70.60529694],
-  [-33.37685911,-70.7837813],
-  [-33.36400876,-70.61432084],
-  [-33.43470129,-70.61886443],
-  [-33.33616209,-70.52846082],
-  [-33.5746923,-70.69481673],
-  [-33.30489386,-70.59216217],
-  [-33.47522287,-70.6589121],
-  [-33.46982038,-70.77109883],
-  [-33.57326816,-70.7322931],
-  [-33.31400915,-70.79595159],
-  [-33.59183363,-70.70334196],
-  [-33.40869838,-70.70855822],
-  [-33.61908519,-70.65610435],
-  [-33.47997485,-70.7108779],
-  [-33.57912977,-70.69513034],
-  [-33.27976403,-70.740938],
-  [-33.51181746,-70.76864332],
-  [-33.45369044,-70.58187586],
-  [-33.37997606,-70.55161314],
-  [-33.35216983,-70.60439547],
-  [-33.56676342,-70.51485529],
-  [-33.3293079,-70.67747455],
-  [-33.37229672,-70.48246251],
-  [-33.4846469,-70.59697191],
-  [-33.45089995,-70.48487409],
-  [-33.60249822,-70.63708016],
-  [-33.60808706,-70.6499906],
-  [-33.46178162,-70.472911],
-  [-33.38102232,-70.65928327],
-  [-33.38625492,-70.67791626],
-  [-33.35471615,-70.66101458],
-  [-33.40310101,-70.74663751],
-  [-33.42696602,-70.68746398],
-  [-33.38851896,-70.70488093],
-  [-33.38548311,-70.84304028],
-  [-33.5003819,-70.73901474],
-  [-33.54274606,-70.67906422],
-  [-33.43646257,-70.7153836],
-  [-33.31790893,-70.70105482],
-  [-33.41678087,-70.82827428],
-  [-33.52906501,-70.62146082],
-  [-33.33993167,-70.72391836],
-  [-33.39778834,-70.65999571],
-  [-33.60132148,-70.68394073],
-  [-33.41259504,-70.80363129],
-  [-33.37568756,-70.74673018],
-  [-33.43884534,-70.78934494],
-  [-33.54369464,-70.53487667],
-  [-33.54498259,-70.78651347],
-  [-33.30955393,-70.70645013],
-  [-33.51769313,-70.64931954],
-  [-33.47894692,-70.57338276],
-  [-33.44297703,-70.80006098],
-  [-33.50801226,-70.4708757],
-  [-33.29332098,-70.75475145],
-  [-33.49638999,-70.81149193],
-  [-33.48950939,-70.51175261],
-  [-33.3101676,-70.72370508],
-  [-33.34768473,-70.77068039],
-  [-33.49433232,-70.71646094],
-  [-33.43174507,-70.63179527],
-  [-33.32054743,-70.81100038],
-  [-33.47228598,-70.80454338],
-  [-33.45316973,-70.62785551],
-  [-33.5592123,-70.7254512],
-  [-33.27199839,-70.67941363],
-  [-33.62235818,-70.70939554],
-  [-33.32145118,-70.74533998],
-  [-33.4022201,-70.64698522],
-  [-33.35972413,-70.57548895],
-  [-33.52225981,-70.57513514],
-  [-33.47721397,-70.69034773],
-  [-33.46857612,-70.70008276],
-  [-33.61260451,-70.59559784],
-  [-33.36257306,-70.72433766],
-  [-33.44345101,-70.61068324],
-  [-33.51473637,-70.51486651],
-  [-33.47695165,-70.75364118],
-  [-33.60090911,-70.77795323],
-  [-33.55932132,-70.79053848],
-  [-33.44636437,-70.79526414],
-  [-33.29951398,-70.77264459],
-  [-33.46035374,-70.72079151],
-  [-33.50322793,-70.83834106],
-  [-33.54113692,-70.77669087],
-  [-33.3651613,-70.57458643],
-  [-33.61260779,-70.66399008],
-  [-33.56748153,-70.58512156],
-  [-33.31954761,-70.67411418],
-  [-33.46315496,-70.72876372],
-  [-33.39151578,-70.70119457],
-  [-33.60578335,-70.67821068],
-  [-33.3513343,-70.55626668],
-  [-33.40318767,-70.64609347],
-  [-33.58433649,-70.69446383],
-  [-33.33987687,-70.70831294],
-  [-33.30555908,-70.71353144],
-  [-33.38618924,-70.524998],
-  [-33.33872241,-70.66308011],
-  [-33.27994026,-70.68550778],
-  [-33.29941326,-70.71133561],
-  [-33.51010916,-70.87118752],
-  [-33.58512599,-70.54737231],
-  [-33.53286659,-70.65487776],
-  [-33.51253881,-70.81108619],
-  [-33.33326137,-70.60108856],
-  [-33.33860041,-70.52904797],
-  [-33.54847421,-70.51620738],
-  [-33.4692096,-70.50485673],
-  [-33.51887602,-70.63386723],
-  [-33.59720943,-70.73865847],
-  [-33.42018977,-70.85113224],
-  [-33.45416411,-70.80804101],
-  [-33.57259754,-70.73403798],
-  [-33.28450506,-70.67055573],
-  [-33.40992788,-70.53725282],
-  [-33.43396604,-70.47452369],
-  [-33.51454672,-70.8350996],
-  [-33.49977504,-70.69736931],
-  [-33.48830705,-70.54654945],
-  [-33.38683592,-70.47891837],
-  [-33.34600866,-70.83506236],
-  [-33.41871952,-70.60621084],
-  [-33.3144592,-70.66870061],
-  [-33.4479361,-70.63814037],
-  [-33.27805251,-70.71849885],
-  [-33.46219818,-70.76520963],
-  [-33.55822247,-70.81918281],
-  [-33.39504275,-70.64270502],
-  [-33.54308979,-70.73954704],
-  [-33.38397109,-70.80029922],
-  [-33.53298663,-70.60837641],
-  [-33.46058413,-70.83868232],
-  [-33.43822871,-70.63165347],
-  [-33.26933322,-70.66065721],
-  [-33.56116479,-70.77068505],
-  [-33.48312744,-70.66160656],
-  [-33.37197754,-70.78824428],
-  [-33.4281244,-70.57735721],
-  [-33.53871517,-70.74742019],
-  [-33.44916443,-70.64569942],
-  [-33.42794815,-70.79710728],
-  [-33.40110398,-70.53727795],
-  [-33.41741271,-70.60196672],
-  [-33.35913008,-70.51759341],
-  [-33.29436961,-70.6123197],
-  [-33.5290997,-70.7500948],
-  [-33.2770535,-70.69684418],
-  [-33.35831208,-70.50348848],
-  [-33.48416168,-70.79425595],
-  [-33.42353909,-70.67310638],
-  [-33.52803748,-70.53445068],
-  [-33.37735018,-70.50173478],
-  [-33.56468047,-70.8119149],
-  [-33.39073138,-70.81986887],
-  [-33.46701964,-70.79539631],
-  [-33.57404418,-70.77910331],
-  [-33.54806139,-70.7876989],
-  [-33.33428014,-70.75068998],
-  [-33.45992205,-70.88308592],
-  [-33.38383077,-70.68391999],
-  [-33.5131592,-70.52108711],
-  [-33.44941623,-70.48149264],
-  [-33.41641286,-70.49824076],
-  [-33.54488362,-70.83878021],
-  [-33.43205453,-70.83902419],
-  [-33.32729417,-70.83206417],
-  [-33.60985438,-70.70148456],
-  [-33.56954021,-70.52989974],
-  [-33.55209255,-70.81514251],
-  [-33.51367487,-70.76862382],
-  [-33.45751172,-70.84240292],
-  [-33.3507737,-70.5755209],
-  [-33.57975239,-70.65547793],
-  [-33.34433053,-70.50110393],
-  [-33.36776105,-70.55734874],
-  [-33.43704533,-70.70477141],
-  [-33.59153057,-70.77314582],
-  [-33.37422313,-70.55273332],
-  [-33.37301465,-70.67010511],
-  [-33.59765121,-70.6056874],
-  [-33.35985951,-70.86058584],
-  [-33.57255296,-70.75045334],
-  [-33.32423303,-70.76723608],
-  [-33.41763394,-70.67663359],
-  [-33.47982386,-70.80369296],
-  [-33.32887438,-70.68142526],
-  [-33.36383584,-70.53757233],
-  [-33.45476121,-70.47421802],
-  [-33.47612669,-70.86834688],
-  [-33.41598774,-70.5375391],
-  [-33.36876383,-70.62436631],
-  [-33.36553569,-70.86131585],
-  [-33.43333055,-70.76045472],
-  [-33.36001055,-70.75156272],
-  [-33.47289132,-70.80887892],
-  [-33.44026984,-70.75462642],
-  [-33.56166909,-70.76733263],
-  [-33.29625817,-70.6971442],
-  [-33.57030977,-70.65465126],
-  [-33.53685707,-70.51856184],
-  [-33.4031491,-70.55570644],
-  [-33.46845595,-70.54140254],
-  [-33.39127378,-70.74949264],
-  [-33.50363041,-70.49575061],
-  [-33.34767589,-70.74926108],
-  [-33.34265849,-70.5770943],
-  [-33.51350795,-70.47588056],
-  [-33.44681803,-70.87314413],
-  [-33.47476402,-70.52760857],
-  [-33.31069412,-70.71966882],
-  [-33.45279092,-70.47597712],
-  [-33.44226756,-70.82506662],
-  [-33.41684748,-70.51867372],
-  [-33.40281751,-70.61523936],
-  [-33.29489018,-70.57073088],
-  [-33.50818446,-70.52578054],
-  [-33.36668193,-70.59244434],
-  [-33.46174808,-70.84405266],
-  [-33.36134918,-70.66572343],
-  [-33.47377583,-70.69779799],
-  [-33.4606082,-70.60113337],
-  [-33.32697857,-70.6580136],
-  [-33.44243468,-70.50644123],
-  [-33.27275692,-70.69706711],
-  [-33.30275123,-70.60554788],
-  [-33.37466541,-70.82290775],
-  [-33.53575407,-70.5353482],
-  [-33.62493772,-70.69785712],
-  [-33.45997085,-70.58781822],
-  [-33.49389228,-70.70564499],
-  [-33.50617229,-70.62551399],
-  [-33.39895172,-70.82312022],
-  [-33.58540404,-70.5494011],
-  [-33.30268176,-70.6824589],
-  [-33.3492643,-70.62824157],
-  [-33.28677772,-70.64678346],
-  [-33.4100278,-70.8033772],
-  [-33.47575454,-70.52027041],
-  [-33.61777982,-70.6076376],
-  [-33.42494818,-70.62658333],
-  [-33.42239486,-70.54608762],
-  [-33.53258615,-70.62136773],
-  [-33.48205831,-70.56720394],
-  [-33.60940653,-70.74308093],
-  [-33.38308949,-70.79329972],
-  [-33.58425913,-70.57697706],
-  [-33.40642413,-70.82363787],
-  [-33.52053533,-70.75780286],
-  [-33.40916206,-70.71335596],
-  [-33.34424772,-70.72869138],
-  [-33.56157748,-70.54458346],
-  [-33.29073031,-70.74091905],
-  [-33.55467659,-70.79859917],
-  [-33.36950156,-70.54672529],
-  [-33.43174138,-70.46501885],
-  [-33.56253046,-70.56113252],
-  [-33.49968639,-70.51937539],
-  [-33.40849999,-70.61872878],
-  [-33.31545566,-70.75819186],
-  [-33.51430107,-70.73118563],
-  [-33.38955153,-70.76115711],
-  [-33.58077264,-70.55185319],
-  [-33.57997319,-70.55692417],
-  [-33.60699145,-70.62013657],
-  [-33.48834097,-70.61640506],
-  [-33.39878259,-70.61562203],
-  [-33.30620053,-70.74184494],
-  [-33.30554175,-70.68918104],
-  [-33.56314992,-70.61086141],
-  [-33.55543372,-70.51536705],
-  [-33.41722141,-70.82363716],
-  [-33.42064345,-70.60660927],
-  [-33.37812135,-70.66840166],
-  [-33.56555831,-70.5846902],
-  [-33.54810369,-70.82479609],
-  [-33.43484135,-70.57893482],
-  [-33.33377289,-70.60340808],
-  [-33.48271535,-70.51800801],
-  [-33.44698705,-70.50657219],
-  [-33.54268471,-70.6692329],
-  [-33.54559883,-70.57761082],
-  [-33.44458217,-70.54136175],
-  [-33.43899787,-70.50160115],
-  [-33.2819865,-70.68885791],
-  [-33.30402366,-70.6029611],
-  [-33.4472879,-70.46735348],
-  [-33.5775059,-70.53324902],
-  [-33.50401676,-70.67252103],
-  [-33.47068066,-70.65864691],
-  [-33.29159391,-70.60017337],
-  [-33.3567858,-70.73397639],
-  [-33.52569562,-70.57954147],
-  [-33.38195999,-70.66778258],
-  [-33.2879534,-70.60283833],
-  [-33.38986246,-70.73533696],
-  [-33.44444463,-70.82516742],
-  [-33.5663101,-70.68150953],
-  [-33.48054049,-70.55766279],
-  [-33.34830276,-70.81208543],
-  [-33.38640108,-70.57077653],
-  [-33.48928758,-70.60967002],
-  [-33.40363375,-70.57780948],
-  [-33.4779976,-70.81465869],
-  [-33.4194963,-70.67073292],
-  [-33.41728099,-70.55556274],
-  [-33.48118618,-70.82469741],
-  [-33.34543856,-70.744956],
-  [-33.55324865,-70.74874075],
-  [-33.52982437,-70.63813345],
-  [-33.5712769,-70.5913577],
-  [-33.31369245,-70.75041951],
-  [-33.36032208,-70.61375954],
-  [-33.35372384,-70.7981513],
-  [-33.33222987,-70.57764236],
-  [-33.48579784,-70.64842443],
-  [-33.43975503,-70.50922611],
-  [-33.57378227,-70.65673803],
-  [-33.44386099,-70.59194061],
-  [-33.44426914,-70.53535322],
-  [-33.4133187,-70.70706621],
-  [-33.54627233,-70.77431806],
-  [-33.46780242,-70.62583455],
-  [-33.37011835,-70.70364663],
-  [-33.33267153,-70.61769711],
-  [-33.4006984,-70.66216286],
-  [-33.46336997,-70.81498976],
-  [-33.34837664,-70.69818034],
-  [-33.43205244,-70.72433229],
-  [-33.53167617,-70.82016924],
-  [-33.40965246,-70.87532701],
-  [-33.29685551,-70.74735058],
-  [-33.42153711,-70.88669829],
-  [-33.4834275,-70.65631313],
-  [-33.46741571,-70.83136301],
-  [-33.33997049,-70.68163498],
-  [-33.42043221,-70.63288734],
-  [-33.37128855,-70.53176109],
-  [-33.42070806,-70.55050318],
-  [-33.27891927,-70.60070414],
-  [-33.53329075,-70.55619939],
-  [-33.54347191,-70.5546521],
-  [-33.48202272,-70.48652236],
-  [-33.37934348,-70.81749503],
-  [-33.50289797,-70.83986748],
-  [-33.44272954,-70.58207968],
-  [-33.57445113,-70.52567788],
-  [-33.49782123,-70.68521252],
-  [-33.49083263,-70.62116436],
-  [-33.59553253,-70.578731],
-  [-33.37623481,-70.80254006],
-  [-33.31306317,-70.68488561],
-  [-33.49596708,-70.62254859],
-  [-33.33371379,-70.68004653],
-  [-33.44728208,-70.84102689],
-  [-33.37916745,-70.80722661],
-  [-33.49679395,-70.77118465],
-  [-33.45715905,-70.73828515],
-  [-33.43054514,-70.55890613],
-  [-33.3338325,-70.68018208],
-  [-33.42804477,-70.70103292],
-  [-33.51619055,-70.72123776],
-  [-33.45883993,-70.83226421],
-  [-33.39032775,-70.66841331],
-  [-33.39738941,-70.50141895],
-  [-33.61553038,-70.74897274],
-  [-33.41175167,-70.77007061],
-  [-33.38605007,-70.82870056],
-  [-33.44630242,-70.77525356],
-  [-33.38247789,-70.84467544],
-  [-33.55504879,-70.68418249],
-  [-33.44353505,-70.87719196],
-  [-33.54874911,-70.71210347],
-  [-33.58788441,-70.61424731],
-  [-33.39129798,-70.68540848],
-  [-33.52851556,-70.70548003],
-  [-33.53726122,-70.54904277],
-  [-33.50328556,-70.63294857],
-  [-33.53741716,-70.79132628],
-  [-33.37114936,-70.49611432],
-  [-33.42707955,-70.80178865],
-  [-33.38818881,-70.6725832],
-  [-33.49435934,-70.63866636],
-  [-33.53348018,-70.85923754],
-  [-33.47018677,-70.71005383],
-  [-33.55449687,-70.65364195],
-  [-33.43379658,-70.52588205],
-  [-33.44920036,-70.85840097],
-  [-33.51534271,-70.62404544],
-  [-33.31161518,-70.69236647],
-  [-33.5412346,-70.75219211],
-  [-33.45331696,-70.57960033],
-  [-33.44015803,-70.68494788],
-  [-33.44979861,-70.76832851],
-  [-33.37976682,-70.75215185],
-  [-33.57971658,-70.64594877],
-  [-33.36608667,-70.52924065],
-  [-33.51630747,-70.77239686],
-  [-33.47424142,-70.77778366],
-  [-33.34593296,-70.63295874],
-  [-33.55333533,-70.65790987],
-  [-33.3035939,-70.55033905],
-  [-33.50767043,-70.68701565],
-  [-33.41591069,-70.56255796],
-  [-33.48820946,-70.62581849],
-  [-33.51527924,-70.7854857],
-  [-33.43063865,-70.56360083],
-  [-33.42497983,-70.6711218],
-  [-33.44644099,-70.80191246],
-  [-33.37115484,-70.82093962],
-  [-33.56627712,-70.5991239],
-  [-33.38028577,-70.76581914],
-  [-33.39402798,-70.66203759],
-  [-33.35725162,-70.76075707],
-  [-33.47958761,-70.78330041],
-  [-33.38832212,-70.83378813],
-  [-33.57557496,-70.73955077],
-  [-33.31352428,-70.78835394],
-  [-33.431538,-70.8159497],
-  [-33.29642143,-70.74063529],
-  [-33.43062522,-70.52271284],
-  [-33.3798817,-70.60881377],
-  [-33.50710576,-70.49267698],
-  [-33.51067508,-70.67342704],
-  [-33.38047079,-70.69656035],
-  [-33.53816731,-70.66497916],
-  [-33.3647641,-70.56161503],
-  [-33.40306257,-70.52945485],
-  [-33.30331022,-70.8002042],
-  [-33.43392372,-70.8297601],
-  [-33.57849081,-70.80534827],
-  [-33.42132079,-70.56386173],
-  [-33.41046127,-70.77336696],
-  [-33.27746184,-70.67456412],
-  [-33.37006849,-70.85644204],
-  [-33.32673701,-70.65048538],
-  [-33.36707138,-70.76030271],
-  [-33.51429472,-70.81326221],
-  [-33.49219341,-70.64253148],
-  [-33.46737584,-70.83451989],
-  [-33.59557151,-70.55540535],
-  [-33.30619127,-70.80609919],
-  [-33.5067533,-70.72389963],
-  [-33.37447731,-70.81866242],
-  [-33.29821396,-70.69156532],
-  [-33.42073282,-70.54262299],
-  [-33.30693986,-70.67994118],
-  [-33.37859621,-70.82850528],
-  [-33.30325732,-70.64198748],
-  [-33.40107905,-70.64382533],
-  [-33.58501306,-70.69737805],
-  [-33.47630138,-70.556478],
-  [-33.36966185,-70.69596045],
-  [-33.56054569,-70.72129796],
-  [-33.37219272,-70.52221495],
-  [-33.58300643,-70.62751366],
-  [-33.40330708,-70.53435203],
-  [-33.49564154,-70.52324408],
-  [-33.49722414,-70.60143041],
-  [-33.29125573,-70.6606691],
-  [-33.37325509,-70.85646369],
-  [-33.46816043,-70.83050107],
-  [-33.48639253,-70.6141564],
-  [-33.44133134,-70.72779557],
-  [-33.53231873,-70.72382034],
-  [-33.48563144,-70.57650021],
-  [-33.41480373,-70.68550299],
-  [-33.36435317,-70.82830976],
-  [-33.31496791,-70.78493856],
-  [-33.43350476,-70.85093161],
-  [-33.5102816,-70.64085984],
-  [-33.58701068,-70.54973065],
-  [-33.46596489,-70.61402026],
-  [-33.4938663,-70.56783679],
-  [-33.53574373,-70.66827378],
-  [-33.51833343,-70.51881081],
-  [-33.38089252,-70.53946441],
-  [-33.34111929,-70.60391943],
-  [-33.34926863,-70.58991972],
-  [-33.56252628,-70.60404683],
-  [-33.41810498,-70.57840389],
-  [-33.55052026,-70.78865421],
-  [-33.34376309,-70.611314],
-  [-33.32254406,-70.54999904],
-  [-33.4792684,-70.86833414],
-  [-33.34172999,-70.7775429],
-  [-33.34382682,-70.74749241],
-  [-33.55029701,-70.58014742],
-  [-33.41782157,-70.88329524],
-  [-33.49147818,-70.66685288],
-  [-33.51210628,-70.85115744],
-  [-33.48780917,-70.86641872],
-  [-33.32065845,-70.55901487],
-  [-33.59889139,-70.62133642],
-  [-33.49922624,-70.70865635],
-  [-33.42849563,-70.69792032],
-  [-33.40277454,-70.59288573],
-  [-33.43087089,-70.64115149],
-  [-33.51104589,-70.5611954],
-  [-33.57246213,-70.64202411],
-  [-33.5137389,-70.7494959],
-  [-33.36830314,-70.72140303],
-  [-33.30210057,-70.58189859],
-  [-33.45675831,-70.68675027],
-  [-33.4017437,-70.67129409],
-  [-33.39723609,-70.8395401],
-  [-33.45825063,-70.71471255],
-  [-33.50947315,-70.83850436],
-  [-33.40349837,-70.81807566],
-  [-33.45822294,-70.58338969],
-  [-33.30981268,-70.59089491],
-  [-33.58327306,-70.65614059],
-  [-33.55461327,-70.79502763],
-  [-33.53229172,-70.60161503],
-  [-33.5370468,-70.81336862],
-  [-33.56506583,-70.83411168],
-  [-33.57106988,-70.8296067],
-  [-33.43530257,-70.6703106],
-  [-33.31094519,-70.70230376],
-  [-33.57540147,-70.58172279],
-  [-33.33258191,-70.65486919],
-  [-33.44116488,-70.62108309],
-  [-33.36758411,-70.71778881],
-  [-33.41837556,-70.56041007],
-  [-33.41247091,-70.73518854],
-  [-33.56226439,-70.83597124],
-  [-33.55137027,-70.78068345],
-  [-33.37149157,-70.8544811],
-  [-33.59748869,-70.58509264],
-  [-33.56597695,-70.58570631],
-  [-33.48668812,-70.49009906],
-  [-33.32225939,-70.7644583],
-  [-33.61736419,-70.63962648],
-  [-33.33654326,-70.56581229],
-  [-33.36715959,-70.70869893],
-  [-33.48173188,-70.53366635],
-  [-33.34140523,-70.7653342],
-  [-33.42522913,-70.83575554],
-  [-33.29352018,-70.68511582],
-  [-33.51978473,-70.6952089],
-  [-33.61485174,-70.64904039],
-  [-33.57048216,-70.69800664],
-  [-33.58722942,-70.70056571],
-  [-33.36050988,-70.54522541],
-  [-33.53140487,-70.69955513],
-  [-33.38149724,-70.86229764],
-  [-33.40438184,-70.77407515],
-  [-33.47191779,-70.46033332],
-  [-33.32954596,-70.51636976],
-  [-33.43776228,-70.49405375],
-  [-33.51609803,-70.5251126],
-  [-33.45677071,-70.86514297],
-  [-33.40467165,-70.69302991],
-  [-33.43902995,-70.54990135],
-  [-33.34328944,-70.77470757],
-  [-33.32042379,-70.62248813],
-  [-33.31650115,-70.66983517],
-  [-33.4811987,-70.75621778],
-  [-33.29848775,-70.68465872],
-  [-33.4122806,-70.52403973],
-  [-33.43275062,-70.49107193],
-  [-33.40587998,-70.72033728],
-  [-33.28797406,-70.69140303],
-  [-33.37157284,-70.62860963],
-  [-33.48540607,-70.77866522],
-  [-33.51156382,-70.66300763],
-  [-33.37525197,-70.78705766],
-  [-33.40314882,-70.50183378],
-  [-33.38257005,-70.76915424],
-  [-33.46679956,-70.84960878],
-  [-33.59766048,-70.68901728],
-  [-33.39903942,-70.69063099],
-  [-33.29750134,-70.61986937],
-  [-33.38033503,-70.71811121],
-  [-33.43724867,-70.52699631],
-  [-33.38516868,-70.49018266],
-  [-33.36593525,-70.59493734],
-  [-33.34758237,-70.78402895],
-  [-33.54656772,-70.58927895],
-  [-33.55665589,-70.54257011],
-  [-33.58096466,-70.55276452],
-  [-33.49465071,-70.71447204],
-  [-33.53829564,-70.6466343],
-  [-33.44665864,-70.79595613],
-  [-33.36722018,-70.52860432],
-  [-33.46048553,-70.64065107],
-  [-33.3782665,-70.60679123],
-  [-33.57194294,-70.75172082],
-  [-33.27475253,-70.7151277],
-  [-33.48227817,-70.4942112],
-  [-33.39933952,-70.85352722],
-  [-33.582255,-70.62841694],
-  [-33.50697391,-70.74839315],
-  [-33.43201061,-70.69141454],
-  [-33.53053115,-70.83376403],
-  [-33.34697688,-70.64086493],
-  [-33.4700938,-70.78912254],
-  [-33.4485541,-70.82055911],
-  [-33.45473387,-70.8264072],
-  [-33.37926517,-70.50646162],
-  [-33.54455516,-70.54825473],
-  [-33.54742647,-70.55410708],
-  [-33.47251499,-70.78402711],
-  [-33.59014116,-70.73388033],
-  [-33.35644114,-70.72797833],
-  [-33.51398988,-70.81392082],
-  [-33.55987073,-70.7787442],
-  [-33.56197283,-70.5591964],
-  [-33.5016212,-70.61266423],
-  [-33.40288887,-70.83955809],
-  [-33.49856423,-70.76764317],
-  [-33.48469156,-70.8311059],
-  [-33.56070627,-70.72869295],
-  [-33.60168875,-70.60018527],
-  [-33.45249153,-70.83239028],
-  [-33.47668941,-70.74828744],
-  [-33.33127151,-70.55504081],
-  [-33.50854477,-70.69988838],
-  [-33.51188922,-70.7790757],
-  [-33.2804784,-70.73831448],
-  [-33.47587289,-70.54348852],
-  [-33.38129175,-70.54993357],
-  [-33.45883471,-70.68598588],
-  [-33.58508968,-70.75610284],
-  [-33.47416174,-70.76954116],
-  [-33.49507379,-70.5948553],
-  [-33.45233259,-70.82998549],
-  [-33.33150354,-70.75323371],
-  [-33.42586342,-70.66688412],
-  [-33.45751391,-70.58962855],
-  [-33.49742117,-70.68040789],
-  [-33.54348538,-70.53778295],
-  [-33.51910989,-70.70263614],
-  [-33.35691954,-70.57017255],
-  [-33.33918792,-70.55473123],
-  [-33.54766701,-70.84738581],
-  [-33.372003,-70.65889707],
-  [-33.33395217,-70.74100543],
-  [-33.44035351,-70.7255933],
-  [-33.33350726,-70.73458433],
-  [-33.4770934,-70.62265926],
-  [-33.37920428,-70.8074662],
-  [-33.55377079,-70.83149715],
-  [-33.5722381,-70.7902171],
-  [-33.38185459,-70.51168822],
-  [-33.44983841,-70.76506841],
-  [-33.28198189,-70.6604886],
-  [-33.46077421,-70.6894029],
-  [-33.45058771,-70.80762815],
-  [-33.43732351,-70.72726285],
-  [-33.45693582,-70.71127614],
-  [-33.42613916,-70.67074622],
-  [-33.52203194,-70.74669068],
-  [-33.33394632,-70.57980621],
-  [-33.48144445,-70.47110704],
-  [-33.4167767,-70.58910687],
-  [-33.49278733,-70.88126823],
-  [-33.38777151,-70.87047341],
-  [-33.52608684,-70.72520858],
-  [-33.3404533,-70.65304263],
-  [-33.35662392,-70.63958446],
-  [-33.55952842,-70.60404636],
-  [-33.31228309,-70.54926597],
-  [-33.61092468,-70.74550267],
-  [-33.34044737,-70.52523019],
-  [-33.53099257,-70.84686933],
-  [-33.38373059,-70.66261357],
-  [-33.40650828,-70.87076099],
-  [-33.49862728,-70.63599793],
-  [-33.3878098,-70.78092887],
-  [-33.40791748,-70.46986641],
-  [-33.36879136,-70.67826289],
-  [-33.51038903,-70.74867933],
-  [-33.30340642,-70.70537742],
-  [-33.58151684,-70.60913593],
-  [-33.35639455,-70.60984406],
-  [-33.53196139,-70.74504607],
-  [-33.429798,-70.56824875],
-  [-33.42905707,-70.50316948],
-  [-33.60686958,-70.71494495],
-  [-33.33303118,-70.69408655],
-  [-33.54286508,-70.63462085],
-  [-33.33611843,-70.76471976],
-  [-33.56302506,-70.6946776],
-  [-33.53206254,-70.51427385],
-  [-33.57483549,-70.66929612],
-  [-33.3393868,-70.72992261],
-  [-33.37054509,-70.60394818],
-  [-33.53099614,-70.68791011],
-  [-33.55770952,-70.7434096],
-  [-33.57101716,-70.72495476],
-  [-33.50180512,-70.74906334],
-  [-33.50259755,-70.5660925],
-  [-33.34415485,-70.78723247],
-  [-33.59520856,-70.59276253],
-  [-33.41295262,-70.60324897],
-  [-33.32832229,-70.66785153],
-  [-33.54047168,-70.69954335],
-  [-33.5081247,-70.8536821],
-  [-33.31829429,-70.56040411],
-  [-33.52767167,-70.73066268],
-  [-33.6032752,-70.62140343],
-  [-33.54010658,-70.5881515],
-  [-33.56460309,-70.58551387],
-  [-33.31652355,-70.68586488],
-  [-33.52699214,-70.55967516],
-  [-33.31932698,-70.55398417],
-  [-33.50280778,-70.52950993],
-  [-33.62046831,-70.63066921],
-  [-33.47155959,-70.71134424],
-  [-33.56578824,-70.57686139],
-  [-33.58660271,-70.6010992],
-  [-33.40920652,-70.55196059],
-  [-33.45510635,-70.65824134],
-  [-33.45753885,-70.69113042],
-  [-33.38855192,-70.50604836],
-  [-33.52072289,-70.58399981],
-  [-33.36233254,-70.56515088],
-  [-33.44118456,-70.55927878],
-  [-33.59295695,-70.78729367],
-  [-33.39339318,-70.73159707],
-  [-33.30410455,-70.70573723],
-  [-33.53851233,-70.54804954],
-  [-33.30627244,-70.72563518],
-  [-33.3489903,-70.62835593],
-  [-33.27616512,-70.6837728],
-  [-33.45242045,-70.69270316],
-  [-33.57567723,-70.56343345],
-  [-33.61779781,-70.70577831],
-  [-33.46492339,-70.75545108],
-  [-33.42972289,-70.83650993],
-  [-33.54742115,-70.65666524],
-  [-33.55835935,-70.8220145],
-  [-33.47369135,-70.84343269],
-  [-33.49870378,-70.68208568],
-  [-33.36825334,-70.6624658],
-  [-33.40391232,-70.59610454],
-  [-33.54397669,-70.74334827],
-  [-33.52322632,-70.75781331],
-  [-33.51557306,-70.75584072],
-  [-33.4999643,-70.62696118],
-  [-33.44018415,-70.48754556],
-  [-33.47671857,-70.57424302],
-  [-33.5759431,-70.54059167],
-  [-33.43229313,-70.66125136],
-  [-33.52954154,-70.59929586],
-  [-33.49207808,-70.75920886],
-  [-33.57880626,-70.63993612],
-  [-33.34306404,-70.72463511],
-  [-33.57825195,-70.67045505],
-  [-33.54163394,-70.82951086],
-  [-33.55908747,-70.81437021],
-  [-33.58276245,-70.56756361],
-  [-33.5577289,-70.74774587],
-  [-33.61206367,-70.71920671],
-  [-33.41292027,-70.58344227],
-  [-33.42392062,-70.73766815],
-  [-33.42297191,-70.72336158],
-  [-33.49094998,-70.78642535],
-  [-33.443118,-70.80681661],
-  [-33.37949056,-70.52413339],
-  [-33.42394941,-70.85551729],
-  [-33.51250405,-70.51155376],
-  [-33.42996228,-70.81539225],
-  [-33.37950523,-70.56534295],
-  [-33.43103503,-70.70997679],
-  [-33.46526495,-70.76702282],
-  [-33.56164159,-70.58500826],
-  [-33.47882077,-70.65074714],
-  [-33.41278684,-70.62462934],
-  [-33.47507588,-70.73830516],
-  [-33.56489126,-70.52590121],
-  [-33.45688546,-70.70677604],
-  [-33.4936597,-70.74471326],
-  [-33.47910614,-70.75556969],
-  [-33.59747905,-70.67906108],
-  [-33.56399823,-70.67377344],
-  [-33.31001162,-70.59921398],
-  [-33.37220547,-70.54358692],
-  [-33.30327816,-70.76898282],
-  [-33.35527038,-70.81873703],
-  [-33.27800934,-70.70817746],
-  [-33.46163275,-70.46196191],
-  [-33.29752327,-70.63636683],
-  [-33.41320227,-70.47329696],
-  [-33.50111277,-70.85017829],
-  [-33.52406441,-70.56203061],
-  [-33.39852254,-70.53787384],
-  [-33.36825105,-70.7926703],
-  [-33.38937644,-70.70646229],
-  [-33.37282186,-70.75330711],
-  [-33.33925293,-70.81749684],
-  [-33.40909296,-70.79782094],
-  [-33.57303592,-70.65518907],
-  [-33.44216095,-70.5260271],
-  [-33.34658741,-70.63093514],
-  [-33.46583975,-70.65018348],
-  [-33.44451063,-70.45822417],
-  [-33.52818528,-70.75932098],
-  [-33.53299661,-70.57227724],
-  [-33.41631365,-70.76918118],
-  [-33.57915021,-70.71865432],
-  [-33.33811211,-70.64150884],
-  [-33.32801869,-70.59610771],
-  [-33.30402249,-70.71986882],
-  [-33.45109081,-70.57041708],
-  [-33.30664141,-70.76963071],
-  [-33.57092835,-70.73014796],
-  [-33.435231,-70.80445276],
-  [-33.31409247,-70.78947662],
-  [-33.37673027,-70.75344134],
-  [-33.51392598,-70.78007818],
-  [-33.41249744,-70.7873358],
-  [-33.3830369,-70.77838206],
-  [-33.55795889,-70.7528993],
-  [-33.37800288,-70.56302982],
-  [-33.32863873,-70.83203359],
-  [-33.41504845,-70.81039265],
-  [-33.28995264,-70.72530697],
-  [-33.42167537,-70.71984128],
-  [-33.31455661,-70.56884715],
-  [-33.5292666,-70.78514993],
-  [-33.34244695,-70.52195317],
-  [-33.37375251,-70.72100365],
-  [-33.33497958,-70.62881008],
-  [-33.41431059,-70.52764186],
-  [-33.43540694,-70.52802254],
-  [-33.40933253,-70.84150956],
-  [-33.4404929,-70.7840206],
-  [-33.33497743,-70.6925001],
-  [-33.30261994,-70.79271841],
-  [-33.57480193,-70.74519003],
-  [-33.50632923,-70.71791207],
-  [-33.38054083,-70.59498401],
-  [-33.42794564,-70.8430077],
-  [-33.41055524,-70.57584877],
-  [-33.48548116,-70.69562033],
-  [-33.50377271,-70.82813931],
-  [-33.42374294,-70.86829751],
-  [-33.61932082,-70.6208424],
-  [-33.43531308,-70.58584756],
-  [-33.40842916,-70.59945383],
-  [-33.53580955,-70.56663326],
-  [-33.43095822,-70.65463067],
-  [-33.57486769,-70.6468425],
-  [-33.49009696,-70.55904733],
-  [-33.37576705,-70.78304859],
-  [-33.37635673,-70.77077874],
-  [-33.55096096,-70.82177382],
-  [-33.43009236,-70.49690676],
-  [-33.54606905,-70.81848811],
-  [-33.50189818,-70.69430342],
-  [-33.46495634,-70.68481388],
-  [-33.58860088,-70.66466061],
-  [-33.59309959,-70.70780553],
-  [-33.51442817,-70.77745589],
-  [-33.40331569,-70.53290618],
-  [-33.42153708,-70.52677901],
-  [-33.31120143,-70.65616159],
-  [-33.45837631,-70.63719473],
-  [-33.42050757,-70.66099836],
-  [-33.55384124,-70.55888915],
-  [-33.56283986,-70.82599377],
-  [-33.52140864,-70.63593803],
-  [-33.50872399,-70.47414043],
-  [-33.47831352,-70.47622481],
-  [-33.42763263,-70.59285163],
-  [-33.39761494,-70.88049278],
-  [-33.58847397,-70.61248707],
-  [-33.59414463,-70.5792053],
-  [-33.39278427,-70.66182308],
-  [-33.4899442,-70.61491057],
-  [-33.52688291,-70.6963729],
-  [-33.49564461,-70.74372431],
-  [-33.35169284,-70.82430236],
-  [-33.28439384,-70.63233653],
-  [-33.33161509,-70.6807338],
-  [-33.53609809,-70.84427048],
-  [-33.35906401,-70.57993399],
-  [-33.48136174,-70.83435016],
-  [-33.38593349,-70.60842885],
-  [-33.47685405,-70.82665414],
-  [-33.40422797,-70.51594765],
-  [-33.52247776,-70.54064739],
-  [-33.54922604,-70.77155251],
-  [-33.44995779,-70.86465405],
-  [-33.42050865,-70.62080759],
-  [-33.46573686,-70.6255228],
-  [-33.40290802,-70.72623977],
-  [-33.48324112,-70.81459057],
-  [-33.57657494,-70.81129953],
-  [-33.34210143,-70.6292626],
-  [-33.56302159,-70.67135877],
-  [-33.44297517,-70.49175255],
-  [-33.56769359,-70.70689411],
-  [-33.54074566,-70.50951643],
-  [-33.48689778,-70.55508993],
-  [-33.35049884,-70.77728534],
-  [-33.32337194,-70.5208788],
-  [-33.55390454,-70.73538284],
-  [-33.56007603,-70.66333409],
-  [-33.36906744,-70.77244443],
-  [-33.39891817,-70.55109094],
-  [-33.33734692,-70.7483199],
-  [-33.49254519,-70.53241034],
-  [-33.48137008,-70.55415765],
-  [-33.43086826,-70.71415702],
-  [-33.29443846,-70.75887873],
-  [-33.37436892,-70.47941039],
-  [-33.56860492,-70.7794499],
-  [-33.50972957,-70.85926408],
-  [-33.41836689,-70.58467526],
-  [-33.43279638,-70.4753833],
-  [-33.28619431,-70.5868533],
-  [-33.3675459,-70.82522773],
-  [-33.33679508,-70.77085378],
-  [-33.40591371,-70.4674172],
-  [-33.42426371,-70.63682462],
-  [-33.47964883,-70.46348208],
-  [-33.54215123,-70.60858236],
-  [-33.30964297,-70.59949589],
-  [-33.50436121,-70.72890672],
-  [-33.31839318,-70.80535233],
-  [-33.41650047,-70.48772963],
-  [-33.53210424,-70.6095749],
-  [-33.59816723,-70.6227273],
-  [-33.43086806,-70.86266693],
-  [-33.37797695,-70.78430133],
-  [-33.42429571,-70.87040935],
-  [-33.48079982,-70.5928029],
-  [-33.46659979,-70.52624694],
-  [-33.61187101,-70.66320691],
-  [-33.6047289,-70.65169338],
-  [-33.3086131,-70.77000424],
-  [-33.35473658,-70.57027742],
-  [-33.38772851,-70.79464889],
-  [-33.4003325,-70.62064696],
-  [-33.5415886,-70.55467166],
-  [-33.40253677,-70.80557057],
-  [-33.29181387,-70.57977137],
-  [-33.44256356,-70.62519747],
-  [-33.46266477,-70.60033165],
-  [-33.3264036,-70.77242885],
-  [-33.45018887,-70.86649518],
-  [-33.59273531,-70.69538672],
-  [-33.58136583,-70.77127389],
-  [-33.42717523,-70.76144765],
-  [-33.56348086,-70.81957536],
-  [-33.31991621,-70.72891991],
-  [-33.41212545,-70.79875554],
-  [-33.42639726,-70.63742611],
-  [-33.60699267,-70.75538421],
-  [-33.43669791,-70.56083739],
-  [-33.32729492,-70.56021787],
-  [-33.61775769,-70.67699205],
-  [-33.324713,-70.7364319],
-  [-33.40638234,-70.51453477],
-  [-33.58181314,-70.6433408],
-  [-33.38206571,-70.80034999],
-  [-33.31211484,-70.60962871],
-  [-33.39514782,-70.66495879],
-  [-33.53300705,-70.62829671],
-  [-33.5162852,-70.80510895],
-  [-33.27749159,-70.6068415],
-  [-33.49210587,-70.57949111],
-  [-33.35805217,-70.79167115],
-  [-33.39000113,-70.79099385],
-  [-33.39894861,-70.85984517],
-  [-33.50024076,-70.87972931],
-  [-33.5481742,-70.50123365],
-  [-33.44645775,-70.84733128],
-  [-33.37509407,-70.48692955],
-  [-33.27076466,-70.63536277],
-  [-33.49510208,-70.48809641],
-  [-33.40402667,-70.76240481],
-  [-33.35617249,-70.56432835],
-  [-33.61784994,-70.72323224],
-  [-33.37247825,-70.54041082],
-  [-33.57597517,-70.70639384],
-  [-33.3506063,-70.544516],
-  [-33.43179827,-70.85423848],
-  [-33.35012578,-70.58208644],
-  [-33.61695384,-70.71401492],
-  [-33.41189115,-70.78261913],
-  [-33.41934509,-70.82454706],
-  [-33.48725104,-70.69736726],
-  [-33.45927923,-70.74258116],
-  [-33.40714205,-70.86770997],
-  [-33.48149266,-70.72398785],
-  [-33.44974547,-70.84193149],
-  [-33.42322102,-70.69018899],
-  [-33.47128211,-70.72637627],
-  [-33.47951803,-70.72662919],
-  [-33.50717652,-70.67837892],
-  [-33.43598081,-70.70161237],
-  [-33.52568417,-70.7273391],
-  [-33.47789716,-70.60182215],
-  [-33.50444965,-70.48862667],
-  [-33.55304947,-70.61469893],
-  [-33.35361689,-70.67181279],
-  [-33.48253447,-70.6970024],
-  [-33.55721495,-70.66383259],
-  [-33.3854724,-70.8535452],
-  [-33.28858392,-70.62591159],
-  [-33.54813028,-70.71345706],
-  [-33.33337145,-70.82028325],
-  [-33.29758969,-70.70107294],
-  [-33.42424255,-70.79173799],
-  [-33.31164337,-70.73757681],
-  [-33.43890596,-70.6198218],
-  [-33.43409694,-70.77979724],
-  [-33.38682781,-70.77044784],
-  [-33.52363467,-70.6958027],
-  [-33.50457862,-70.69021636],
-  [-33.46074256,-70.67530888],
-  [-33.40325115,-70.8250451],
-  [-33.37042641,-70.79208445],
-  [-33.4231536,-70.87455537],
-  [-33.5569502,-70.77939338],
-  [-33.38991925,-70.71414106],
-  [-33.36005975,-70.62613169],
-  [-33.30951483,-70.55923459],
-  [-33.54034846,-70.84068876],
-  [-33.38269404,-70.71499566],
-  [-33.2882246,-70.77148708],
-  [-33.51876707,-70.77483165],
-  [-33.60480835,-70.70477657],
-  [-33.44119077,-70.55681676],
-  [-33.38598977,-70.53115426],
-  [-33.31915558,-70.63227898],
-  [-33.48163759,-70.48018033],
-  [-33.41263012,-70.8702278],
-  [-33.35655513,-70.72707133],
-  [-33.32674745,-70.81933762],
-  [-33.47733371,-70.46781989],
-  [-33.53835347,-70.55079577],
-  [-33.5971626,-70.62256824],
-  [-33.45497381,-70.80709136],
-  [-33.37572252,-70.52987802],
-  [-33.28340805,-70.7430078],
-  [-33.45531024,-70.58203969],
-  [-33.35623494,-70.83100174],
-  [-33.54667645,-70.8317758],
-  [-33.5167477,-70.55679623],
-  [-33.33507261,-70.52418867],
-  [-33.47868365,-70.82975684],
-  [-33.37296589,-70.60881718],
-  [-33.36006308,-70.73307742],
-  [-33.29913465,-70.63211584],
-  [-33.45329078,-70.76665832],
-  [-33.54199243,-70.53937131],
-  [-33.36922182,-70.72125135],
-  [-33.36624096,-70.68692415],
-  [-33.38408368,-70.68480018],
-  [-33.48754672,-70.79885151],
-  [-33.58758696,-70.68309577],
-  [-33.50690191,-70.57522385],
-  [-33.53182579,-70.85208631],
-  [-33.56944136,-70.73708277],
-  [-33.47539983,-70.85288164],
-  [-33.44641136,-70.62146997],
-  [-33.48571669,-70.75845084],
-  [-33.47141773,-70.46535859],
-  [-33.27493595,-70.66905],
-  [-33.45950469,-70.61795084],
-  [-33.41093787,-70.6061575],
-  [-33.37390541,-70.79464466],
-  [-33.34212044,-70.63163633],
-  [-33.42423192,-70.88234547],
-  [-33.4278704,-70.59643061],
-  [-33.58086154,-70.67162668],
-  [-33.42257358,-70.66783176],
-  [-33.32446357,-70.69009365],
-  [-33.39794712,-70.80335201],
-  [-33.27456759,-70.71632854],
-  [-33.44080711,-70.63668088],
-  [-33.2884874,-70.72115492],
-  [-33.37178878,-70.84097301],
-  [-33.32632354,-70.68273656],
-  [-33.41526666,-70.49800265],
-  [-33.34379572,-70.72336247],
-  [-33.34070675,-70.66519691],
-  [-33.37525462,-70.66474097],
-  [-33.60931246,-70.59924545],
-  [-33.42688527,-70.78116245],
-  [-33.53169326,-70.85875706],
-  [-33.408349,-70.57694975],
-  [-33.57292653,-70.57179567],
-  [-33.54914172,-70.67394375],
-  [-33.5607314,-70.54230417],
-  [-33.36347417,-70.79630328],
-  [-33.50227492,-70.72451883],
-  [-33.38772629,-70.61578949],
-  [-33.56552668,-70.59841757],
-  [-33.31360976,-70.78088315],
-  [-33.31712688,-70.65853522],
-  [-33.60391536,-70.5975422],
-  [-33.32645856,-70.65180086],
-  [-33.550654,-70.52701458],
-  [-33.49590318,-70.71578371],
-  [-33.33139579,-70.54957659],
-  [-33.59138276,-70.60746205],
-  [-33.47984301,-70.51524423],
-  [-33.44905185,-70.79009052],
-  [-33.51683975,-70.5808816],
-  [-33.59231687,-70.65991467],
-  [-33.42309057,-70.46188375],
-  [-33.38306405,-70.51674345],
-  [-33.50225381,-70.87613016],
-  [-33.42150446,-70.80292218],
-  [-33.51677571,-70.54147971],
-  [-33.44504756,-70.46763402],
-  [-33.37345943,-70.8400263],
-  [-33.44535683,-70.87145036],
-  [-33.48569762,-70.76403884],
-  [-33.47696994,-70.87654639],
-  [-33.51786019,-70.69539812],
-  [-33.46040331,-70.46308345],
-  [-33.2854533,-70.72234421],
-  [-33.31566472,-70.72027775],
-  [-33.54105295,-70.74086809],
-  [-33.55045739,-70.83443399],
-  [-33.52362127,-70.61770272],
-  [-33.54826395,-70.65407341],
-  [-33.30722839,-70.72299322],
-  [-33.39642479,-70.56921669],
-  [-33.49108825,-70.51807402],
-  [-33.57713927,-70.6801282],
-  [-33.32507079,-70.83110537],
-  [-33.52297213,-70.78653022],
-  [-33.39731862,-70.77008769],
-  [-33.47935986,-70.65622783],
-  [-33.58464122,-70.69419772],
-  [-33.37838488,-70.52047294],
-  [-33.36949027,-70.76494983],
-  [-33.42831702,-70.56882009],
-  [-33.37036944,-70.79573313],
-  [-33.38523331,-70.67018906],
-  [-33.56589609,-70.79790055],
-  [-33.3656348,-70.65519454],
-  [-33.46458055,-70.60519786],
-  [-33.59969994,-70.74873894],
-  [-33.44478545,-70.64695455],
-  [-33.54899697,-70.73697254],
-  [-33.58677938,-70.58338297],
-  [-33.28101397,-70.72001125],
-  [-33.42971139,-70.79538142],
-  [-33.47765792,-70.60308466],
-  [-33.37635864,-70.80564272],
-  [-33.56432375,-70.71095371],
-  [-33.55742748,-70.51524842],
-  [-33.51532534,-70.63937823],
-  [-33.42223859,-70.75645538],
-  [-33.4592298,-70.6708976],
-  [-33.49163344,-70.61067546],
-  [-33.58634718,-70.54808039],
-  [-33.36463307,-70.7985018],
-  [-33.54586071,-70.74906291],
-  [-33.3341792,-70.53375911],
-  [-33.42374104,-70.46841291],
-  [-33.34806969,-70.81225138],
-  [-33.40565311,-70.79224414],
-  [-33.39039921,-70.61561655],
-  [-33.54966437,-70.72903534],
-  [-33.37751424,-70.78678033],
-  [-33.36702062,-70.80126128],
-  [-33.46889979,-70.54068518],
-  [-33.61217558,-70.6372142],
-  [-33.31687175,-70.6129898],
-  [-33.61508154,-70.61567828],
-  [-33.48953152,-70.56260323],
-  [-33.59651306,-70.78402576],
-  [-33.52061172,-70.58936973],
-  [-33.52222164,-70.50837244],
-  [-33.39144586,-70.86236601],
-  [-33.54348608,-70.63843929],
-  [-33.56276055,-70.71794874],
-  [-33.38031255,-70.51094588],
-  [-33.58965718,-70.72726859],
-  [-33.35344819,-70.4940783],
-  [-33.3252993,-70.71915368],
-  [-33.58638662,-70.61477153],
-  [-33.35908762,-70.60218363],
-  [-33.3664019,-70.48719794],
-  [-33.30974726,-70.78796263],
-  [-33.56106833,-70.64931556],
-  [-33.37673876,-70.77152318],
-  [-33.55998509,-70.72729687],
-  [-33.27664688,-70.68700281],
-  [-33.44754882,-70.70869095],
-  [-33.38157694,-70.690243],
-  [-33.46982332,-70.84792601],
-  [-33.47876358,-70.57785679],
-  [-33.62560463,-70.65889739],
-  [-33.50950486,-70.53894314],
-  [-33.37908686,-70.71364357],
-  [-33.42788854,-70.70713183],
-  [-33.50995551,-70.69676029],
-  [-33.56291188,-70.7249902],
-  [-33.40125717,-70.56093963],
-  [-33.51128195,-70.62457788],
-  [-33.44097086,-70.80451113],
-  [-33.44131566,-70.5124473],
-  [-33.52587387,-70.70977946],
-  [-33.3710846,-70.6060548],
-  [-33.42345394,-70.53493839],
-  [-33.37122884,-70.6583376],
-  [-33.31679074,-70.72138788],
-  [-33.6109083,-70.70686237],
-  [-33.35244389,-70.53491617],
-  [-33.52370246,-70.81801399],
-  [-33.5258703,-70.5342639],
-  [-33.49470375,-70.52423078],
-  [-33.37201765,-70.70381173],
-  [-33.54592167,-70.63551199],
-  [-33.37009476,-70.53899435],
-  [-33.37201204,-70.52327344],
-  [-33.32816529,-70.73482961],
-  [-33.40809129,-70.60117386],
-  [-33.39775918,-70.49118657],
-  [-33.5407204,-70.82808996],
-  [-33.43850926,-70.70719265],
-  [-33.43393551,-70.80410327],
-  [-33.30755379,-70.72810245],
-  [-33.39050411,-70.56523088],
-  [-33.49781503,-70.55202719],
-  [-33.42209924,-70.70089351],
-  [-33.44387185,-70.52492556],
-  [-33.35019147,-70.53102557],
-  [-33.44868,-70.7152667],
-  [-33.44659745,-70.56141212],
-  [-33.5095687,-70.70696869],
-  [-33.28418926,-70.68396125],
-  [-33.39779668,-70.59627839],
-  [-33.43704575,-70.75546216],
-  [-33.50070512,-70.65031883],
-  [-33.30906811,-70.64380095],
-  [-33.31047979,-70.65398189],
-  [-33.5327525,-70.8538297],
-  [-33.33647137,-70.82877788],
-  [-33.42306356,-70.77570264],
-  [-33.44886409,-70.79297638],
-  [-33.50685957,-70.4739622],
-  [-33.42172998,-70.87851121],
-  [-33.57087746,-70.69408551],
-  [-33.56951759,-70.73092843],
-  [-33.39574336,-70.51820885],
-  [-33.29279271,-70.72794857],
-  [-33.36879777,-70.57942172],
-  [-33.27993792,-70.73931703],
-  [-33.35307932,-70.77013364],
-  [-33.36724377,-70.60694307],
-  [-33.32587488,-70.79188705],
-  [-33.45353983,-70.88406902],
-  [-33.54678268,-70.6653041],
-  [-33.42128234,-70.57078847],
-  [-33.43279594,-70.846319],
-  [-33.619715,-70.64345783],
-  [-33.53067342,-70.82322476],
-  [-33.530525,-70.57677962],
-  [-33.53383522,-70.80412244],
-  [-33.47117125,-70.79664453],
-  [-33.54097653,-70.5638062],
-  [-33.44741962,-70.46864413],
-  [-33.31992506,-70.78517583],
-  [-33.55997261,-70.64484702],
-  [-33.5443117,-70.77827776],
-  [-33.52056502,-70.66070159],
-  [-33.40766749,-70.87119203],
-  [-33.53206251,-70.80852624],
-  [-33.35913425,-70.49863305],
-  [-33.50238186,-70.71669599],
-  [-33.60616997,-70.6456275],
-  [-33.34067181,-70.51504936],
-  [-33.58173204,-70.62990977],
-  [-33.34464329,-70.51190917],
-  [-33.53856928,-70.77388281],
-  [-33.60057167,-70.71462879],
-  [-33.39042819,-70.72456446],
-  [-33.37676725,-70.48266335],
-  [-33.40880035,-70.69386801],
-  [-33.47439897,-70.74704874],
-  [-33.46581412,-70.54948959],
-  [-33.30517163,-70.69801665],
-  [-33.52332779,-70.80621836],
-  [-33.45321023,-70.73317044],
-  [-33.28374476,-70.60440509],
-  [-33.44034019,-70.47096932],
-  [-33.55644922,-70.52132416],
-  [-33.43447195,-70.78897904],
-  [-33.54764069,-70.67009201],
-  [-33.45033864,-70.50291188],
-  [-33.38843505,-70.76582054],
-  [-33.53424701,-70.84076005],
-  [-33.51621568,-70.74955237],
-  [-33.5123682,-70.81671786],
-  [-33.28832414,-70.66235998],
-  [-33.4153939,-70.88031803],
-  [-33.36155497,-70.74001271],
-  [-33.35368002,-70.70153643],
-  [-33.53983513,-70.6381725],
-  [-33.35430574,-70.79453376],
-  [-33.60109683,-70.73150373],
-  [-33.38057599,-70.60618037],
-  [-33.60603075,-70.72529138],
-  [-33.47012814,-70.51453899],
-  [-33.51866355,-70.6743156],
-  [-33.56978108,-70.60940963],
-  [-33.45681719,-70.50356927],
-  [-33.50169134,-70.84813871],
-  [-33.34854805,-70.62815847],
-  [-33.47361358,-70.85740956],
-  [-33.5622169,-70.54640378],
-  [-33.31942059,-70.72063077],
-  [-33.42740274,-70.73124243],
-  [-33.3493087,-70.66470993],
-  [-33.31210119,-70.58787577],
-  [-33.58888935,-70.54786129],
-  [-33.31133272,-70.80543047],
-  [-33.35793012,-70.67289691],
-  [-33.34798965,-70.69576583],
-  [-33.39883059,-70.6566347],
-  [-33.52615545,-70.61408924],
-  [-33.54448113,-70.67014687],
-  [-33.54665447,-70.77339804],
-  [-33.45617665,-70.52681632],
-  [-33.61021268,-70.64496999],
-  [-33.34730965,-70.64400682],
-  [-33.41617632,-70.88426002],
-  [-33.52717591,-70.81455593],
-  [-33.56803077,-70.71887872],
-  [-33.39871865,-70.7621017],
-  [-33.31314442,-70.63597076],
-  [-33.55154712,-70.56056609],
-  [-33.38821509,-70.86965848],
-  [-33.55111424,-70.84285166],
-  [-33.46555892,-70.64004932],
-  [-33.42087584,-70.62118806],
-  [-33.51830826,-70.60074862],
-  [-33.60119055,-70.5641223],
-  [-33.52061029,-70.65777219],
-  [-33.35461804,-70.8473859],
-  [-33.32519205,-70.77408292],
-  [-33.47595529,-70.80289849],
-  [-33.60650547,-70.73315662],
-  [-33.5265066,-70.78105869],
-  [-33.57492736,-70.66014416],
-  [-33.42496584,-70.68238094],
-  [-33.45045127,-70.68813883],
-  [-33.37469488,-70.59289276],
-  [-33.52788198,-70.58835257],
-  [-33.38739233,-70.55112906],
-  [-33.62575073,-70.65079946],
-  [-33.48481879,-70.88313556],
-  [-33.31827774,-70.61069472],
-  [-33.41851219,-70.55604475],
-  [-33.51092051,-70.73240984],
-  [-33.38989089,-70.61383406],
-  [-33.41702584,-70.7794982],
-  [-33.37291078,-70.68491481],
-  [-33.54142378,-70.80412869],
-  [-33.61891451,-70.69099209],
-  [-33.29324203,-70.63536067],
-  [-33.54491826,-70.71264518],
-  [-33.47660526,-70.67790118],
-  [-33.56898504,-70.64462918],
-  [-33.32601341,-70.78801628],
-  [-33.37062033,-70.56853585],
-  [-33.33553355,-70.64713944],
-  [-33.38937199,-70.58592501],
-  [-33.50758166,-70.85861399],
-  [-33.44327436,-70.59356782],
-  [-33.54428182,-70.85348347],
-  [-33.58999815,-70.58091988],
-  [-33.49303778,-70.7268549],
-  [-33.43440964,-70.83341397],
-  [-33.49502233,-70.77646809],
-  [-33.52783425,-70.53532543],
-  [-33.50850414,-70.49947113],
-  [-33.50168728,-70.51446222],
-  [-33.43707462,-70.6261802],
-  [-33.32227186,-70.65239512],
-  [-33.34304854,-70.82939263],
-  [-33.44979936,-70.69323523],
-  [-33.45784214,-70.71322319],
-  [-33.47630181,-70.79820456],
-  [-33.2714166,-70.71221718],
-  [-33.60561436,-70.67891691],
-  [-33.43348625,-70.87643941],
-  [-33.52358445,-70.60944963],
-  [-33.54232052,-70.72794535],
-  [-33.5210203,-70.62468493],
-  [-33.41349008,-70.85191939],
-  [-33.38085809,-70.50713801],
-  [-33.3514797,-70.58583314],
-  [-33.36569249,-70.85574293],
-  [-33.37203087,-70.59165479],
-  [-33.52947817,-70.59690237],
-  [-33.4201536,-70.83706921],
-  [-33.49239542,-70.64988301],
-  [-33.50823399,-70.64287439],
-  [-33.51734439,-70.72378358],
-  [-33.49830966,-70.8639667],
-  [-33.43046018,-70.46367821],
-  [-33.54640387,-70.66643491],
-  [-33.41024446,-70.80288859],
-  [-33.43799289,-70.58041385],
-  [-33.43982472,-70.84026689],
-  [-33.55295748,-70.5532488],
-  [-33.28135134,-70.59545008],
-  [-33.52467262,-70.55504207],
-  [-33.49091835,-70.70359939],
-  [-33.49581188,-70.62160493],
-  [-33.45929656,-70.53809226],
-  [-33.53325427,-70.66492707],
-  [-33.35174504,-70.58831231],
-  [-33.49481655,-70.66875238],
-  [-33.4006049,-70.71976087],
-  [-33.34148051,-70.76299985],
-  [-33.40833461,-70.73220779],
-  [-33.57968358,-70.60999158],
-  [-33.5362112,-70.67174417],
-  [-33.4813212,-70.66487679],
-  [-33.32487751,-70.80722613],
-  [-33.35305708,-70.82028686],
-  [-33.42676392,-70.86598376],
-  [-33.39423421,-70.51879661],
-  [-33.46144577,-70.54761505],
-  [-33.34086935,-70.68106308],
-  [-33.50755095,-70.53009182],
-  [-33.38276951,-70.72548271],
-  [-33.48682036,-70.77582815],
-  [-33.29665409,-70.57284842],
-  [-33.41754402,-70.55980363],
-  [-33.33861364,-70.73688546],
-  [-33.44952989,-70.72788293],
-  [-33.30263808,-70.76395359],
-  [-33.38691995,-70.66559386],
-  [-33.53556573,-70.73063635],
-  [-33.52103148,-70.69243871],
-  [-33.58425612,-70.5833047],
-  [-33.59004209,-70.57751135],
-  [-33.38930575,-70.78040555],
-  [-33.54442201,-70.7206783],
-  [-33.44961192,-70.54600881],
-  [-33.38413132,-70.62330801],
-  [-33.48812063,-70.74998596],
-  [-33.37363652,-70.8196541],
-  [-33.3774329,-70.52632753],
-  [-33.30184009,-70.73407455],
-  [-33.42547054,-70.5293603],
-  [-33.31170904,-70.80043982],
-  [-33.52475012,-70.70626629],
-  [-33.5951134,-70.75695358],
-  [-33.50652031,-70.72290979],
-  [-33.50533563,-70.64969453],
-  [-33.43044399,-70.8539556],
-  [-33.56013091,-70.71286154],
-  [-33.35899539,-70.59936685],
-  [-33.4533516,-70.88168948],
-  [-33.53760676,-70.82207433],
-  [-33.56936717,-70.77166984],
-  [-33.43718307,-70.62916369],
-  [-33.54161461,-70.76847534],
-  [-33.44353108,-70.48212134],
-  [-33.53464857,-70.58553768],
-  [-33.34730628,-70.83736287],
-  [-33.40418497,-70.52742987],
-  [-33.56070648,-70.57738707],
-  [-33.34538664,-70.63031548],
-  [-33.47749008,-70.63594249],
-  [-33.44710368,-70.7456644],
-  [-33.40604508,-70.65112208],
-  [-33.53276066,-70.84648989],
-  [-33.44784093,-70.72596554],
-  [-33.46423848,-70.71069602],
-  [-33.50117172,-70.66131727],
-  [-33.41462187,-70.83036899],
-  [-33.51834573,-70.84384769],
-  [-33.51264571,-70.74641153],
-  [-33.60089731,-70.75202526],
-  [-33.42398217,-70.80349879],
-  [-33.27908856,-70.72831242],
-  [-33.49075332,-70.7016398],
-  [-33.39068391,-70.65444868],
-  [-33.36077302,-70.73118969],
-  [-33.53220119,-70.76886031],
-  [-33.59357728,-70.73455875],
-  [-33.42935423,-70.65500392],
-  [-33.30531968,-70.77752908],
-  [-33.48408994,-70.59200256],
-  [-33.31019055,-70.79779286],
-  [-33.55222062,-70.77266657],
-  [-33.45539996,-70.78107868],
-  [-33.49161578,-70.84119144],
-  [-33.47499152,-70.84657372],
-  [-33.46257506,-70.76815038],
-  [-33.32599034,-70.52268646],
-  [-33.37149665,-70.50566454],
-  [-33.40018121,-70.81501538],
-  [-33.43766024,-70.57002566],
-  [-33.46003064,-70.80442108],
-  [-33.48923117,-70.48200644],
-  [-33.55206424,-70.7565186],
-  [-33.30412937,-70.63024701],
-  [-33.45760486,-70.48082304],
-  [-33.48802492,-70.65261934],
-  [-33.31998952,-70.57680403],
-  [-33.38775995,-70.52199723],
-  [-33.57048908,-70.64925842],
-  [-33.32881715,-70.512332],
-  [-33.30879738,-70.80298923],
-  [-33.41367684,-70.83745729],
-  [-33.47039613,-70.49217677],
-  [-33.57868457,-70.67427441],
-  [-33.46937401,-70.66493188],
-  [-33.38800492,-70.51930519],
-  [-33.33916811,-70.83113401],
-  [-33.46227412,-70.54266259],
-  [-33.39150066,-70.66462859],
-  [-33.34558336,-70.74985074],
-  [-33.40736428,-70.82614319],
-  [-33.51936877,-70.5085585],
-  [-33.43700155,-70.81076092],
-  [-33.30033657,-70.69163162],
-  [-33.41637426,-70.81729931],
-  [-33.43794852,-70.78460412],
-  [-33.50751032,-70.48508468],
-  [-33.52100832,-70.56204111],
-  [-33.42228326,-70.68688641],
-  [-33.42536658,-70.5123192],
-  [-33.60937192,-70.66964433],
-  [-33.45900884,-70.53100029],
-  [-33.49161504,-70.79626244],
-  [-33.3307047,-70.74973511],
-  [-33.40170234,-70.494742],
-  [-33.53250612,-70.50965256],
-  [-33.38464126,-70.64599764],
-  [-33.39122193,-70.73818558],
-  [-33.45616892,-70.5186208],
-  [-33.51025174,-70.60107794],
-  [-33.52340059,-70.59242419],
-  [-33.44572337,-70.85559391],
-  [-33.34127736,-70.64812414],
-  [-33.53408905,-70.71400822],
-  [-33.47351659,-70.58189921],
-  [-33.36624179,-70.51313714],
-  [-33.349125,-70.62565549],
-  [-33.5975153,-70.6642583],
-  [-33.5551549,-70.5429349],
-  [-33.33504548,-70.66946991],
-  [-33.40498685,-70.64709293],
-  [-33.28453886,-70.71840544],
-  [-33.56870548,-70.54228868],
-  [-33.35436572,-70.74653127],
-  [-33.3906661,-70.53930776],
-  [-33.55772086,-70.58827516],
-  [-33.54083898,-70.60763359],
-  [-33.55431665,-70.63050529],
-  [-33.57874206,-70.77236656],
-  [-33.58006163,-70.59087537],
-  [-33.33067225,-70.64290683],
-  [-33.39574556,-70.6520507],
-  [-33.39941675,-70.85177929],
-  [-33.58528341,-70.53581469],
-  [-33.59846212,-70.69849605],
-  [-33.3978524,-70.67691779],
-  [-33.40132222,-70.80779348],
-  [-33.56412987,-70.6709738],
-  [-33.47080779,-70.76704249],
-  [-33.59251954,-70.70562208],
-  [-33.456409,-70.77789361],
-  [-33.48925209,-70.6605527],
-  [-33.30848028,-70.57388197],
-  [-33.40730999,-70.63012606],
-  [-33.56776543,-70.60146479],
-  [-33.27623058,-70.73027457],
-  [-33.39160804,-70.53644564],
-  [-33.57630159,-70.53191537],
-  [-33.41016946,-70.71603262],
-  [-33.34176342,-70.6067285],
-  [-33.52571021,-70.55081111],
-  [-33.38922175,-70.47307797],
-  [-33.37575661,-70.72785724],
-  [-33.37027834,-70.58528011],
-  [-33.47064458,-70.72563187],
-  [-33.33112442,-70.83616085],
-  [-33.33752417,-70.68326102],
-  [-33.40412859,-70.77534509],
-  [-33.33576045,-70.51110234],
-  [-33.29263394,-70.76771182],
-  [-33.57563427,-70.81499429],
-  [-33.53451656,-70.54526983],
-  [-33.52287825,-70.71463944],
-  [-33.33693152,-70.54059187],
-  [-33.56727354,-70.81596568],
-  [-33.41256028,-70.7247664],
-  [-33.56925869,-70.7541518],
-  [-33.55148602,-70.7299135],
-  [-33.59166247,-70.73124222],
-  [-33.60476322,-70.65217707],
-  [-33.41535921,-70.74316964],
-  [-33.42853838,-70.74251587],
-  [-33.47599102,-70.63159147],
-  [-33.35652256,-70.70449222],
-  [-33.44291351,-70.49249133],
-  [-33.55986929,-70.82916744],
-  [-33.54689617,-70.51500451],
-  [-33.32490572,-70.59684021],
-  [-33.37130444,-70.73669219],
-  [-33.61785472,-70.62336433],
-  [-33.42267142,-70.59168659],
-  [-33.34692876,-70.60192512],
-  [-33.48108078,-70.70245273],
-  [-33.37269549,-70.7347209],
-  [-33.29999577,-70.61233593],
-  [-33.48602635,-70.62631621],
-  [-33.49471376,-70.51271082],
-  [-33.4084509,-70.58934656],
-  [-33.35427177,-70.53311905],
-  [-33.58862915,-70.70730926],
-  [-33.59338648,-70.62043855],
-  [-33.35904215,-70.49362372],
-  [-33.48312388,-70.5889599],
-  [-33.35617643,-70.84886412],
-  [-33.33575608,-70.63580057],
-  [-33.34256551,-70.63130699],
-  [-33.39974667,-70.59199191],
-  [-33.46454735,-70.613746],
-  [-33.40491514,-70.65274886],
-  [-33.3585741,-70.53207508],
-  [-33.48790541,-70.5194557],
-  [-33.50462619,-70.65638081],
-  [-33.57769226,-70.80073323],
-  [-33.34654682,-70.63198348],
-  [-33.41876786,-70.63018727],
-  [-33.34829528,-70.67782778],
-  [-33.27829181,-70.73856687],
-  [-33.54325148,-70.62627071],
-  [-33.53995909,-70.74518491],
-  [-33.34586826,-70.66117506],
-  [-33.52581028,-70.80662826],
-  [-33.43671339,-70.85081976],
-  [-33.43372752,-70.62211346],
-  [-33.57750552,-70.73450316],
-  [-33.51326033,-70.50975898],
-  [-33.44259421,-70.75721804],
-  [-33.38894816,-70.70844705],
-  [-33.4610904,-70.85032162],
-  [-33.61588914,-70.72746258],
-  [-33.52709952,-70.51515143],
-  [-33.52915743,-70.85303688],
-  [-33.47758067,-70.46158073],
-  [-33.30943373,-70.63328766],
-  [-33.43243762,-70.64418906],
-  [-33.37041279,-70.75826094],
-  [-33.42025096,-70.59450113],
-  [-33.50864829,-70.71211028],
-  [-33.40497454,-70.47665275],
-  [-33.57558547,-70.68475644],
-  [-33.47858648,-70.74117638],
-  [-33.35502191,-70.594848],
-  [-33.42403005,-70.88501308],
-  [-33.3929949,-70.81635363],
-  [-33.32145033,-70.60329335],
-  [-33.50944581,-70.7790536],
-  [-33.53769874,-70.79208172],
-  [-33.5304454,-70.70687918],
-  [-33.51562616,-70.71049431],
-  [-33.46655614,-70.62453623],
-  [-33.49728484,-70.68530987],
-  [-33.42443049,-70.7088256],
-  [-33.39096067,-70.59065919],
-  [-33.39809718,-70.66163274],
-  [-33.44238609,-70.61361569],
-  [-33.47441852,-70.84019136],
-  [-33.55514207,-70.63606666],
-  [-33.50764887,-70.87384941],
-  [-33.46488699,-70.77140658],
-  [-33.44692615,-70.74087029],
-  [-33.55185316,-70.658836],
-  [-33.55320057,-70.75178291],
-  [-33.5058981,-70.76386778],
-  [-33.51884585,-70.69275432],
-  [-33.40487737,-70.75440801],
-  [-33.28913148,-70.5928971],
-  [-33.49898734,-70.48169218],
-  [-33.32702215,-70.70483471],
-  [-33.43154162,-70.87486268],
-  [-33.5758146,-70.68583614],
-  [-33.29279012,-70.66719793],
-  [-33.41855799,-70.73104136],
-  [-33.48628965,-70.75625139],
-  [-33.27245796,-70.70418296],
-  [-33.60893482,-70.66634698],
-  [-33.41093716,-70.82652279],
-  [-33.44354773,-70.80292571],
-  [-33.59707016,-70.56001352],
-  [-33.32605167,-70.57883313],
-  [-33.49948412,-70.8395383],
-  [-33.42387345,-70.56918918],
-  [-33.4493478,-70.47279973],
-  [-33.41005869,-70.54368019],
-  [-33.45784674,-70.58720946],
-  [-33.56723858,-70.56680865],
-  [-33.29634771,-70.59590516],
-  [-33.28296539,-70.58729499],
-  [-33.34383851,-70.78209072],
-  [-33.44574708,-70.49969371],
-  [-33.31686433,-70.55318241],
-  [-33.52229338,-70.86539851],
-  [-33.44043476,-70.7487741],
-  [-33.37687825,-70.56481237],
-  [-33.37236696,-70.74849197],
-  [-33.51663373,-70.56767835],
-  [-33.45191849,-70.52985683],
-  [-33.37345554,-70.63020537],
-  [-33.48632308,-70.61607391],
-  [-33.47332679,-70.77447988],
-  [-33.48230868,-70.68806941],
-  [-33.43397852,-70.56108216],
-  [-33.49060404,-70.52165395],
-  [-33.38284736,-70.5742454],
-  [-33.31747556,-70.68883213],
-  [-33.49331427,-70.72641207],
-  [-33.41050224,-70.55346786],
-  [-33.37458183,-70.61496733],
-  [-33.5458066,-70.81957163],
-  [-33.43546886,-70.53512985],
-  [-33.34539841,-70.69022093],
-  [-33.37554125,-70.84198129],
-  [-33.32592686,-70.72379403],
-  [-33.39817446,-70.86888356],
-  [-33.27809787,-70.70304146],
-  [-33.29903561,-70.58741818],
-  [-33.52434829,-70.83096669],
-  [-33.47328488,-70.64044261],
-  [-33.42200452,-70.82168117],
-  [-33.34786795,-70.58373709],
-  [-33.37452879,-70.524515],
-  [-33.42950235,-70.82511853],
-  [-33.53898205,-70.8439915],
-  [-33.56074309,-70.70401035],
-  [-33.54371163,-70.57436102],
-  [-33.44190445,-70.73202132],
-  [-33.4876825,-70.67130792],
-  [-33.36271217,-70.70060022],
-  [-33.4094688,-70.5415215],
-  [-33.492717,-70.52830559],
-  [-33.45061934,-70.58415068],
-  [-33.53154806,-70.66811227],
-  [-33.47857763,-70.63732686],
-  [-33.52223004,-70.52488649],
-  [-33.54114119,-70.50068197],
-  [-33.48158438,-70.7215758],
-  [-33.4005597,-70.62229991],
-  [-33.37930513,-70.49303489],
-  [-33.35144508,-70.75044019],
-  [-33.55089203,-70.70018325],
-  [-33.55998861,-70.62029673],
-  [-33.34399728,-70.78616985],
-  [-33.29920172,-70.78247782],
-  [-33.39155296,-70.73227298],
-  [-33.48601863,-70.63911091],
-  [-33.47265117,-70.78605953],
-  [-33.41750236,-70.62338189],
-  [-33.35513001,-70.78176614],
-  [-33.57263119,-70.6899873],
-  [-33.46389915,-70.60036247],
-  [-33.49485569,-70.81721206],
-  [-33.54252228,-70.83088084],
-  [-33.38821186,-70.49658105],
-  [-33.47183257,-70.78154719],
-  [-33.38534711,-70.75048336],
-  [-33.46992367,-70.85955661],
-  [-33.49056034,-70.56678428],
-  [-33.4445689,-70.63214219],
-  [-33.46709148,-70.86996051],
-  [-33.54020344,-70.67473547],
-  [-33.36159921,-70.62410203],
-  [-33.53837231,-70.6427796],
-  [-33.55820119,-70.59337566],
-  [-33.36798426,-70.7332931],
-  [-33.39847783,-70.66692936],
-  [-33.4841666,-70.88054787],
-  [-33.39849015,-70.52830746],
-  [-33.37904546,-70.85950164],
-  [-33.34544075,-70.69067505],
-  [-33.35875121,-70.6534153],
-  [-33.28841859,-70.76369541],
-  [-33.49467262,-70.55129128],
-  [-33.46559163,-70.49767991],
-  [-33.43775138,-70.50868352],
-  [-33.5116141,-70.70659615],
-  [-33.3119353,-70.69523001],
-  [-33.43053161,-70.58589975],
-  [-33.30420784,-70.78015909],
-  [-33.59949162,-70.58994903],
-  [-33.53274089,-70.7429317],
-  [-33.52798884,-70.80353561],
-  [-33.33023701,-70.81838453],
-  [-33.38090865,-70.79791614],
-  [-33.55889136,-70.5785163],
-  [-33.36356695,-70.80746987],
-  [-33.57543788,-70.60457717],
-  [-33.4402365,-70.63050869],
-  [-33.393045,-70.86752322],
-  [-33.47645274,-70.7874482],
-  [-33.44559321,-70.88768078],
-  [-33.44739147,-70.84874973],
-  [-33.35253109,-70.63641056],
-  [-33.59564731,-70.78814493],
-  [-33.48867918,-70.63176839],
-  [-33.39442834,-70.68796526],
-  [-33.35089137,-70.57562873],
-  [-33.62205423,-70.63050231],
-  [-33.49442169,-70.62143214],
-  [-33.37036888,-70.83742387],
-  [-33.50051068,-70.84673034],
-  [-33.35087721,-70.59506071],
-  [-33.60101138,-70.61556142],
-  [-33.35960576,-70.64350386],
-  [-33.50402081,-70.68513366],
-  [-33.27070643,-70.67481413],
-  [-33.42263335,-70.64254028],
-  [-33.46763449,-70.61399373],
-  [-33.47186404,-70.49934001],
-  [-33.6175666,-70.67651102],
-  [-33.56453809,-70.80525294],
-  [-33.44716167,-70.86011104],
-  [-33.50920254,-70.62543294],
-  [-33.55617997,-70.59364246],
-  [-33.40292083,-70.73324802],
-  [-33.42597152,-70.79090056],
-  [-33.3906595,-70.72830621],
-  [-33.49488689,-70.74990719],
-  [-33.39761793,-70.63252957],
-  [-33.38374553,-70.81081436],
-  [-33.43541131,-70.81696599],
-  [-33.42054782,-70.71199688],
-  [-33.44531299,-70.48301229],
-  [-33.50673705,-70.56769134],
-  [-33.44150767,-70.58679386],
-  [-33.60694162,-70.74233511],
-  [-33.449752,-70.46651652],
-  [-33.34474572,-70.72741195],
-  [-33.5327302,-70.56344169],
-  [-33.35774034,-70.5601262],
-  [-33.47623062,-70.7484578],
-  [-33.47999613,-70.71127572],
-  [-33.5692408,-70.82567931],
-  [-33.45429649,-70.5736429],
-  [-33.44436716,-70.83097928],
-  [-33.4691352,-70.8013702],
-  [-33.32869427,-70.75122008],
-  [-33.53404902,-70.56804439],
-  [-33.49016246,-70.52567274],
-  [-33.39176969,-70.84707204],
-  [-33.57200683,-70.81760212],
-  [-33.30988861,-70.65913313],
-  [-33.50308593,-70.73191756],
-  [-33.36420838,-70.49699497],
-  [-33.33890139,-70.70611501],
-  [-33.47559267,-70.86422385],
-  [-33.56159469,-70.74725921],
-  [-33.3253314,-70.80412219],
-  [-33.33022176,-70.52552609],
-  [-33.27913752,-70.66870846],
-  [-33.55756035,-70.65541945],
-  [-33.5325112,-70.676788],
-  [-33.46556952,-70.55219588],
-  [-33.48259927,-70.804793],
-  [-33.39986951,-70.8649027],
-  [-33.43521182,-70.79662729],
-  [-33.53220222,-70.53289528],
-  [-33.61178378,-70.69102789],
-  [-33.32847273,-70.56412257],
-  [-33.53914335,-70.76335066],
-  [-33.51628308,-70.59068565],
-  [-33.39642462,-70.64139475],
-  [-33.38526581,-70.68361516],
-  [-33.57976158,-70.68571725],
-  [-33.42497492,-70.6190053],
-  [-33.39438879,-70.65275473],
-  [-33.40934142,-70.65560123],
-  [-33.32028095,-70.64445032],
-  [-33.50300897,-70.59935518],
-  [-33.45233775,-70.57559541],
-  [-33.42708347,-70.53059272],
-  [-33.60032938,-70.76620137],
-  [-33.58648473,-70.67660305],
-  [-33.50911132,-70.60418021],
-  [-33.49140349,-70.7446702],
-  [-33.35641637,-70.59134634],
-  [-33.34972378,-70.52773292],
-  [-33.52996996,-70.8512951],
-  [-33.40479146,-70.61655137],
-  [-33.35369927,-70.51025134],
-  [-33.54991403,-70.60336608],
-  [-33.55765194,-70.57221036],
-  [-33.37761716,-70.78731566],
-  [-33.44801073,-70.71129842],
-  [-33.55464827,-70.59755445],
-  [-33.48004671,-70.77520684],
-  [-33.52894538,-70.81328305],
-  [-33.28567827,-70.59157311],
-  [-33.39867619,-70.83482691],
-  [-33.59600311,-70.58813735],
-  [-33.46768795,-70.63363625],
-  [-33.34672404,-70.7710218],
-  [-33.51583107,-70.53711871],
-  [-33.52486803,-70.83788204],
-  [-33.39077688,-70.67942545],
-  [-33.39422421,-70.74101547],
-  [-33.40254724,-70.80443782],
-  [-33.5461692,-70.76978371],
-  [-33.47182595,-70.85739986],
-  [-33.43198527,-70.71905887],
-  [-33.39979105,-70.54791449],
-  [-33.48804837,-70.85805203],
-  [-33.34130268,-70.67697065],
-  [-33.4305436,-70.51019834],
-  [-33.34486071,-70.63699694],
-  [-33.41929543,-70.87489168],
-  [-33.31858016,-70.65315381],
-  [-33.36677234,-70.49675276],
-  [-33.29380865,-70.61910203],
-  [-33.42663765,-70.61023898],
-  [-33.37516096,-70.73174859],
-  [-33.30644435,-70.68788037],
-  [-33.43767823,-70.52262257],
-  [-33.42171963,-70.7015153],
-  [-33.5886165,-70.62257084],
-  [-33.38589409,-70.6618442],
-  [-33.54394073,-70.53328335],
-  [-33.59067121,-70.55999475],
-  [-33.30165261,-70.79453316],
-  [-33.48053434,-70.52506172],
-  [-33.29617148,-70.6440102],
-  [-33.28005794,-70.61623697],
-  [-33.5786237,-70.78781141],
-  [-33.55774159,-70.56016118],
-  [-33.45893682,-70.75749276],
-  [-33.42267507,-70.79101007],
-  [-33.5401813,-70.50770559],
-  [-33.50879642,-70.67666761],
-  [-33.46915008,-70.56964178],
-  [-33.58819946,-70.71628013],
-  [-33.55005877,-70.62248152],
-  [-33.60738307,-70.632949],
-  [-33.49194792,-70.85707662],
-  [-33.3637739,-70.6493019],
-  [-33.58239786,-70.74811303],
-  [-33.57937725,-70.71753436],
-  [-33.34785731,-70.81039171],
-  [-33.28277752,-70.59263552],
-  [-33.44209457,-70.51689741],
-  [-33.48111315,-70.74521097],
-  [-33.5408464,-70.54709689],
-  [-33.27241007,-70.67096716],
-  [-33.5720334,-70.57905687],
-  [-33.50917921,-70.61816522],
-  [-33.49657948,-70.50599606],
-  [-33.34072035,-70.8109724],
-  [-33.37990022,-70.56387464],
-  [-33.59906219,-70.63982546],
-  [-33.3203442,-70.61236424],
-  [-33.28462081,-70.66350032],
-  [-33.42130556,-70.48467718],
-  [-33.33368091,-70.6463987],
-  [-33.31204356,-70.74347424],
-  [-33.57471611,-70.6883288],
-  [-33.40567186,-70.84079464],
-  [-33.36773558,-70.5751211],
-  [-33.48946297,-70.8291941],
-  [-33.46649241,-70.70749679],
-  [-33.54794434,-70.50489258],
-  [-33.36074472,-70.78609913],
-  [-33.42440094,-70.77964359],
-  [-33.47886436,-70.73660751],
-  [-33.57890006,-70.53571324],
-  [-33.57562953,-70.65568314],
-  [-33.52207519,-70.8657797],
-  [-33.37386697,-70.8201168],
-  [-33.48886029,-70.6600104],
-  [-33.53251592,-70.75291306],
-  [-33.49327802,-70.577775],
-  [-33.59698902,-70.67026663],
-  [-33.30115886,-70.63067821],
-  [-33.37052304,-70.72249439],
-  [-33.37053707,-70.6789754],
-  [-33.40507101,-70.63662116],
-  [-33.4522918,-70.59188976],
-  [-33.43174924,-70.59697339],
-  [-33.53357308,-70.82056309],
-  [-33.34678526,-70.56573366],
-  [-33.38442828,-70.66375865],
-  [-33.3419546,-70.7409062],
-  [-33.57580768,-70.52341363],
-  [-33.40433262,-70.47519324],
-  [-33.42778167,-70.7594341],
-  [-33.37536022,-70.757182],
-  [-33.36081736,-70.67174871],
-  [-33.60945242,-70.63629756],
-  [-33.33993848,-70.52799012],
-  [-33.52833458,-70.58011406],
-  [-33.29518858,-70.74073775],
-  [-33.30425019,-70.59044351],
-  [-33.47001977,-70.46743044],
-  [-33.35066632,-70.50024298],
-  [-33.45321716,-70.47122908],
-  [-33.32550938,-70.64649355],
-  [-33.47880457,-70.61799555],
-  [-33.37366872,-70.67949873],
-  [-33.29248464,-70.63992104],
-  [-33.49822527,-70.52825431],
-  [-33.36136165,-70.69867951],
-  [-33.27985451,-70.6333838],
-  [-33.38626344,-70.53390719],
-  [-33.35985416,-70.85266512],
-  [-33.35312398,-70.74886058],
-  [-33.42821917,-70.84135351],
-  [-33.39525189,-70.82865416],
-  [-33.52168278,-70.67039317],
-  [-33.37797593,-70.76884343],
-  [-33.35177377,-70.76921986],
-  [-33.41020956,-70.64767502],
-  [-33.45702071,-70.68136862],
-  [-33.41412516,-70.71904613],
-  [-33.62365584,-70.64985746],
-  [-33.42726428,-70.7403168],
-  [-33.42558719,-70.79640733],
-  [-33.42799909,-70.72135243],
-  [-33.34094714,-70.66164159],
-  [-33.41920822,-70.8011193],
-  [-33.36274872,-70.53227979],
-  [-33.40036298,-70.49196022],
-  [-33.42254889,-70.71457931],
-  [-33.50008718,-70.74547228],
-  [-33.44243856,-70.87119846],
-  [-33.36688176,-70.70741053],
-  [-33.36458959,-70.84364381],
-  [-33.26774708,-70.67102005],
-  [-33.56604537,-70.75595766],
-  [-33.49439299,-70.6804113],
-  [-33.53111335,-70.79265962],
-  [-33.36333275,-70.84554883],
-  [-33.53321055,-70.79180842],
-  [-33.5290643,-70.75079035],
-  [-33.53419743,-70.85907517],
-  [-33.28588156,-70.7648976],
-  [-33.43741093,-70.57906607],
-  [-33.50639154,-70.49103681],
-  [-33.29041039,-70.71795326],
-  [-33.47788909,-70.5745962],
-  [-33.60809356,-70.6179285],
-  [-33.42600511,-70.66121499],
-  [-33.54008767,-70.67423702],
-  [-33.52452182,-70.72913977],
-  [-33.45376157,-70.47244223],
-  [-33.4440957,-70.47144367],
-  [-33.49408668,-70.85795673],
-  [-33.33181979,-70.73502611],
-  [-33.58634535,-70.54602976],
-  [-33.53582984,-70.71336538],
-  [-33.4540824,-70.68036953],
-  [-33.43157475,-70.47990384],
-  [-33.41067514,-70.73741621],
-  [-33.29753121,-70.74792769],
-  [-33.32788518,-70.5429242],
-  [-33.55349399,-70.56091625],
-  [-33.46149551,-70.86663599],
-  [-33.41495697,-70.59851912],
-  [-33.41002798,-70.63371209],
-  [-33.50299015,-70.59068942],
-  [-33.55755907,-70.83178499],
-  [-33.47791785,-70.6316996],
-  [-33.3197416,-70.52487633],
-  [-33.52306806,-70.49120427],
-  [-33.55932132,-70.79053848],
-  [-33.44636437,-70.79526414],
-  [-33.29951398,-70.77264459],
-  [-33.46035374,-70.72079151],
-  [-33.50322793,-70.83834106],
-  [-33.54113692,-70.77669087],
-  [-33.3651613,-70.57458643],
-  [-33.61260779,-70.66399008],
-  [-33.56748153,-70.58512156],
-  [-33.31954761,-70.67411418],
-  [-33.46315496,-70.72876372],
-  [-33.39151578,-70.70119457],
-  [-33.60578335,-70.67821068],
-  [-33.3513343,-70.55626668],
-  [-33.40318767,-70.64609347],
-  [-33.58433649,-70.69446383],
-  [-33.33987687,-70.70831294],
-  [-33.30555908,-70.71353144],
-  [-33.38618924,-70.524998],
-  [-33.33872241,-70.66308011],
-  [-33.27994026,-70.68550778],
-  [-33.29941326,-70.71133561],
-  [-33.51010916,-70.87118752],
-  [-33.58512599,-70.54737231],
-  [-33.53286659,-70.65487776],
-  [-33.51253881,-70.81108619],
-  [-33.33326137,-70.60108856],
-  [-33.33860041,-70.52904797],
-  [-33.54847421,-70.51620738],
-  [-33.4692096,-70.50485673],
-  [-33.51887602,-70.63386723],
-  [-33.59720943,-70.73865847],
-  [-33.42018977,-70.85113224],
-  [-33.45416411,-70.80804101],
-  [-33.57259754,-70.73403798],
-  [-33.28450506,-70.67055573],
-  [-33.40992788,-70.53725282],
-  [-33.43396604,-70.47452369],
-  [-33.51454672,-70.8350996],
-  [-33.49977504,-70.69736931],
-  [-33.48830705,-70.54654945],
-  [-33.38683592,-70.47891837],
-  [-33.34600866,-70.83506236],
-  [-33.41871952,-70.60621084],
-  [-33.3144592,-70.66870061],
-  [-33.4479361,-70.63814037],
-  [-33.27805251,-70.71849885],
-  [-33.46219818,-70.76520963],
-  [-33.55822247,-70.81918281],
-  [-33.39504275,-70.64270502],
-  [-33.54308979,-70.73954704],
-  [-33.38397109,-70.80029922],
-  [-33.53298663,-70.60837641],
-  [-33.46058413,-70.83868232],
-  [-33.43822871,-70.63165347],
-  [-33.26933322,-70.66065721],
-  [-33.56116479,-70.77068505],
-  [-33.48312744,-70.66160656],
-  [-33.37197754,-70.78824428],
-  [-33.4281244,-70.57735721],
-  [-33.53871517,-70.74742019],
-  [-33.44916443,-70.64569942],
-  [-33.42794815,-70.79710728],
-  [-33.40110398,-70.53727795],
-  [-33.41741271,-70.60196672],
-  [-33.35913008,-70.51759341],
-  [-33.29436961,-70.6123197],
-  [-33.5290997,-70.7500948],
-  [-33.2770535,-70.69684418],
-  [-33.35831208,-70.50348848],
-  [-33.48416168,-70.79425595],
-  [-33.42353909,-70.67310638],
-  [-33.52803748,-70.53445068],
-  [-33.37735018,-70.50173478],
-  [-33.56468047,-70.8119149],
-  [-33.39073138,-70.81986887],
-  [-33.46701964,-70.79539631],
-  [-33.57404418,-70.77910331],
-  [-33.54806139,-70.7876989],
-  [-33.33428014,-70.75068998],
-  [-33.45992205,-70.88308592],
-  [-33.38383077,-70.68391999],
-  [-33.5131592,-70.52108711],
-  [-33.44941623,-70.48149264],
-  [-33.41641286,-70.49824076],
-  [-33.54488362,-70.83878021],
-  [-33.43205453,-70.83902419],
-  [-33.32729417,-70.83206417],
-  [-33.60985438,-70.70148456],
-  [-33.56954021,-70.52989974],
-  [-33.55209255,-70.81514251],
-  [-33.51367487,-70.76862382],
-  [-33.45751172,-70.84240292],
-  [-33.3507737,-70.5755209],
-  [-33.57975239,-70.65547793],
-  [-33.34433053,-70.50110393],
-  [-33.36776105,-70.55734874],
-  [-33.43704533,-70.70477141],
-  [-33.59153057,-70.77314582],
-  [-33.37422313,-70.55273332],
-  [-33.37301465,-70.67010511],
-  [-33.59765121,-70.6056874],
-  [-33.35985951,-70.86058584],
-  [-33.57255296,-70.75045334],
-  [-33.32423303,-70.76723608],
-  [-33.41763394,-70.67663359],
-  [-33.47982386,-70.80369296],
-  [-33.32887438,-70.68142526],
-  [-33.36383584,-70.53757233],
-  [-33.45476121,-70.47421802],
-  [-33.47612669,-70.86834688],
-  [-33.41598774,-70.5375391],
-  [-33.36876383,-70.62436631],
-  [-33.36553569,-70.86131585],
-  [-33.43333055,-70.76045472],
-  [-33.36001055,-70.75156272],
-  [-33.47289132,-70.80887892],
-  [-33.44026984,-70.75462642],
-  [-33.56166909,-70.76733263],
-  [-33.29625817,-70.6971442],
-  [-33.57030977,-70.65465126],
-  [-33.53685707,-70.51856184],
-  [-33.4031491,-70.55570644],
-  [-33.46845595,-70.54140254],
-  [-33.39127378,-70.74949264],
-  [-33.50363041,-70.49575061],
-  [-33.34767589,-70.74926108],
-  [-33.34265849,-70.5770943],
-  [-33.51350795,-70.47588056],
-  [-33.44681803,-70.87314413],
-  [-33.47476402,-70.52760857],
-  [-33.31069412,-70.71966882],
-  [-33.45279092,-70.47597712],
-  [-33.44226756,-70.82506662],
-  [-33.41684748,-70.51867372],
-  [-33.40281751,-70.61523936],
-  [-33.29489018,-70.57073088],
-  [-33.50818446,-70.52578054],
-  [-33.36668193,-70.59244434],
-  [-33.46174808,-70.84405266],
-  [-33.36134918,-70.66572343],
-  [-33.47377583,-70.69779799],
-  [-33.4606082,-70.60113337],
-  [-33.32697857,-70.6580136],
-  [-33.44243468,-70.50644123],
-  [-33.27275692,-70.69706711],
-  [-33.30275123,-70.60554788],
-  [-33.37466541,-70.82290775],
-  [-33.53575407,-70.5353482],
-  [-33.62493772,-70.69785712],
-  [-33.45997085,-70.58781822],
-  [-33.49389228,-70.70564499],
-  [-33.50617229,-70.62551399],
-  [-33.39895172,-70.82312022],
-  [-33.58540404,-70.5494011],
-  [-33.30268176,-70.6824589],
-  [-33.3492643,-70.62824157],
-  [-33.28677772,-70.64678346],
-  [-33.4100278,-70.8033772],
-  [-33.47575454,-70.52027041],
-  [-33.61777982,-70.6076376],
-  [-33.42494818,-70.62658333],
-  [-33.42239486,-70.54608762],
-  [-33.53258615,-70.62136773],
-  [-33.48205831,-70.56720394],
-  [-33.60940653,-70.74308093],
-  [-33.38308949,-70.79329972],
-  [-33.58425913,-70.57697706],
-  [-33.40642413,-70.82363787],
-  [-33.52053533,-70.75780286],
-  [-33.40916206,-70.71335596],
-  [-33.34424772,-70.72869138],
-  [-33.56157748,-70.54458346],
-  [-33.29073031,-70.74091905],
-  [-33.55467659,-70.79859917],
-  [-33.36950156,-70.54672529],
-  [-33.43174138,-70.46501885],
-  [-33.56253046,-70.56113252],
-  [-33.49968639,-70.51937539],
-  [-33.40849999,-70.61872878],
-  [-33.31545566,-70.75819186],
-  [-33.51430107,-70.73118563],
-  [-33.38955153,-70.76115711],
-  [-33.58077264,-70.55185319],
-  [-33.57997319,-70.55692417],
-  [-33.60699145,-70.62013657],
-  [-33.48834097,-70.61640506],
-  [-33.39878259,-70.61562203],
-  [-33.30620053,-70.74184494],
-  [-33.30554175,-70.68918104],
-  [-33.56314992,-70.61086141],
-  [-33.55543372,-70.51536705],
-  [-33.41722141,-70.82363716],
-  [-33.42064345,-70.60660927],
-  [-33.37812135,-70.66840166],
-  [-33.56555831,-70.5846902],
-  [-33.54810369,-70.82479609],
-  [-33.43484135,-70.57893482],
-  [-33.33377289,-70.60340808],
-  [-33.48271535,-70.51800801],
-  [-33.44698705,-70.50657219],
-  [-33.54268471,-70.6692329],
-  [-33.54559883,-70.57761082],
-  [-33.44458217,-70.54136175],
-  [-33.43899787,-70.50160115],
-  [-33.2819865,-70.68885791],
-  [-33.30402366,-70.6029611],
-  [-33.4472879,-70.46735348],
-  [-33.5775059,-70.53324902],
-  [-33.50401676,-70.67252103],
-  [-33.47068066,-70.65864691],
-  [-33.29159391,-70.60017337],
-  [-33.3567858,-70.73397639],
-  [-33.52569562,-70.57954147],
-  [-33.38195999,-70.66778258],
-  [-33.2879534,-70.60283833],
-  [-33.38986246,-70.73533696],
-  [-33.44444463,-70.82516742],
-  [-33.5663101,-70.68150953],
-  [-33.48054049,-70.55766279],
-  [-33.34830276,-70.81208543],
-  [-33.38640108,-70.57077653],
-  [-33.48928758,-70.60967002],
-  [-33.40363375,-70.57780948],
-  [-33.4779976,-70.81465869],
-  [-33.4194963,-70.67073292],
-  [-33.41728099,-70.55556274],
-  [-33.48118618,-70.82469741],
-  [-33.34543856,-70.744956],
-  [-33.55324865,-70.74874075],
-  [-33.52982437,-70.63813345],
-  [-33.5712769,-70.5913577],
-  [-33.31369245,-70.75041951],
-  [-33.36032208,-70.61375954],
-  [-33.35372384,-70.7981513],
-  [-33.33222987,-70.57764236],
-  [-33.48579784,-70.64842443],
-  [-33.43975503,-70.50922611],
-  [-33.57378227,-70.65673803],
-  [-33.44386099,-70.59194061],
-  [-33.44426914,-70.53535322],
-  [-33.4133187,-70.70706621],
-  [-33.54627233,-70.77431806],
-  [-33.46780242,-70.62583455],
-  [-33.37011835,-70.70364663],
-  [-33.33267153,-70.61769711],
-  [-33.4006984,-70.66216286],
-  [-33.46336997,-70.81498976],
-  [-33.34837664,-70.69818034],
-  [-33.43205244,-70.72433229],
-  [-33.53167617,-70.82016924],
-  [-33.40965246,-70.87532701],
-  [-33.29685551,-70.74735058],
-  [-33.42153711,-70.88669829],
-  [-33.4834275,-70.65631313],
-  [-33.46741571,-70.83136301],
-  [-33.33997049,-70.68163498],
-  [-33.42043221,-70.63288734],
-  [-33.37128855,-70.53176109],
-  [-33.42070806,-70.55050318],
-  [-33.27891927,-70.60070414],
-  [-33.53329075,-70.55619939],
-  [-33.54347191,-70.5546521],
-  [-33.48202272,-70.48652236],
-  [-33.37934348,-70.81749503],
-  [-33.50289797,-70.83986748],
-  [-33.44272954,-70.58207968],
-  [-33.57445113,-70.52567788],
-  [-33.49782123,-70.68521252],
-  [-33.49083263,-70.62116436],
-  [-33.59553253,-70.578731],
-  [-33.37623481,-70.80254006],
-  [-33.31306317,-70.68488561],
-  [-33.49596708,-70.62254859],
-  [-33.33371379,-70.68004653],
-  [-33.44728208,-70.84102689],
-  [-33.37916745,-70.80722661],
-  [-33.49679395,-70.77118465],
-  [-33.45715905,-70.73828515],
-  [-33.43054514,-70.55890613],
-  [-33.3338325,-70.68018208],
-  [-33.42804477,-70.70103292],
-  [-33.51619055,-70.72123776],
-  [-33.45883993,-70.83226421],
-  [-33.39032775,-70.66841331],
-  [-33.39738941,-70.50141895],
-  [-33.61553038,-70.74897274],
-  [-33.41175167,-70.77007061],
-  [-33.38605007,-70.82870056],
-  [-33.44630242,-70.77525356],
-  [-33.38247789,-70.84467544],
-  [-33.55504879,-70.68418249],
-  [-33.44353505,-70.87719196],
-  [-33.54874911,-70.71210347],
-  [-33.58788441,-70.61424731],
-  [-33.39129798,-70.68540848],
-  [-33.52851556,-70.70548003],
-  [-33.53726122,-70.54904277],
-  [-33.50328556,-70.63294857],
-  [-33.53741716,-70.79132628],
-  [-33.37114936,-70.49611432],
-  [-33.42707955,-70.80178865],
-  [-33.38818881,-70.6725832],
-  [-33.49435934,-70.63866636],
-  [-33.53348018,-70.85923754],
-  [-33.47018677,-70.71005383],
-  [-33.55449687,-70.65364195],
-  [-33.43379658,-70.52588205],
-  [-33.44920036,-70.85840097],
-  [-33.51534271,-70.62404544],
-  [-33.31161518,-70.69236647],
-  [-33.5412346,-70.75219211],
-  [-33.45331696,-70.57960033],
-  [-33.44015803,-70.68494788],
-  [-33.44979861,-70.76832851],
-  [-33.37976682,-70.75215185],
-  [-33.57971658,-70.64594877],
-  [-33.36608667,-70.52924065],
-  [-33.51630747,-70.77239686],
-  [-33.47424142,-70.77778366],
-  [-33.34593296,-70.63295874],
-  [-33.55333533,-70.65790987],
-  [-33.3035939,-70.55033905],
-  [-33.50767043,-70.68701565],
-  [-33.41591069,-70.56255796],
-  [-33.48820946,-70.62581849],
-  [-33.51527924,-70.7854857],
-  [-33.43063865,-70.56360083],
-  [-33.42497983,-70.6711218],
-  [-33.44644099,-70.80191246],
-  [-33.37115484,-70.82093962],
-  [-33.56627712,-70.5991239],
-  [-33.38028577,-70.76581914],
-  [-33.39402798,-70.66203759],
-  [-33.35725162,-70.76075707],
-  [-33.47958761,-70.78330041],
-  [-33.38832212,-70.83378813],
-  [-33.57557496,-70.73955077],
-  [-33.31352428,-70.78835394],
-  [-33.431538,-70.8159497],
-  [-33.29642143,-70.74063529],
-  [-33.43062522,-70.52271284],
-  [-33.3798817,-70.60881377],
-  [-33.50710576,-70.49267698],
-  [-33.51067508,-70.67342704],
-  [-33.38047079,-70.69656035],
-  [-33.53816731,-70.66497916],
-  [-33.3647641,-70.56161503],
-  [-33.40306257,-70.52945485],
-  [-33.30331022,-70.8002042],
-  [-33.43392372,-70.8297601],
-  [-33.57849081,-70.80534827],
-  [-33.42132079,-70.56386173],
-  [-33.41046127,-70.77336696],
-  [-33.27746184,-70.67456412],
-  [-33.37006849,-70.85644204],
-  [-33.32673701,-70.65048538],
-  [-33.36707138,-70.76030271],
-  [-33.51429472,-70.81326221],
-  [-33.49219341,-70.64253148],
-  [-33.46737584,-70.83451989],
-  [-33.59557151,-70.55540535],
-  [-33.30619127,-70.80609919],
-  [-33.5067533,-70.72389963],
-  [-33.37447731,-70.81866242],
-  [-33.29821396,-70.69156532],
-  [-33.42073282,-70.54262299],
-  [-33.30693986,-70.67994118],
-  [-33.37859621,-70.82850528],
-  [-33.30325732,-70.64198748],
-  [-33.40107905,-70.64382533],
-  [-33.58501306,-70.69737805],
-  [-33.47630138,-70.556478],
-  [-33.36966185,-70.69596045],
-  [-33.56054569,-70.72129796],
-  [-33.37219272,-70.52221495],
-  [-33.58300643,-70.62751366],
-  [-33.40330708,-70.53435203],
-  [-33.49564154,-70.52324408],
-  [-33.49722414,-70.60143041],
-  [-33.29125573,-70.6606691],
-  [-33.37325509,-70.85646369],
-  [-33.46816043,-70.83050107],
-  [-33.48639253,-70.6141564],
-  [-33.44133134,-70.72779557],
-  [-33.53231873,-70.72382034],
-  [-33.48563144,-70.57650021],
-  [-33.41480373,-70.68550299],
-  [-33.36435317,-70.82830976],
-  [-33.31496791,-70.78493856],
-  [-33.43350476,-70.85093161],
-  [-33.5102816,-70.64085984],
-  [-33.58701068,-70.54973065],
-  [-33.46596489,-70.61402026],
-  [-33.4938663,-70.56783679],
-  [-33.53574373,-70.66827378],
-  [-33.51833343,-70.51881081],
-  [-33.38089252,-70.53946441],
-  [-33.34111929,-70.60391943],
-  [-33.34926863,-70.58991972],
-  [-33.56252628,-70.60404683],
-  [-33.41810498,-70.57840389],
-  [-33.55052026,-70.78865421],
-  [-33.34376309,-70.611314],
-  [-33.32254406,-70.54999904],
-  [-33.4792684,-70.86833414],
-  [-33.34172999,-70.7775429],
-  [-33.34382682,-70.74749241],
-  [-33.55029701,-70.58014742],
-  [-33.41782157,-70.88329524],
-  [-33.49147818,-70.66685288],
-  [-33.51210628,-70.85115744],
-  [-33.48780917,-70.86641872],
-  [-33.32065845,-70.55901487],
-  [-33.59889139,-70.62133642],
-  [-33.49922624,-70.70865635],
-  [-33.42849563,-70.69792032],
-  [-33.40277454,-70.59288573],
-  [-33.43087089,-70.64115149],
-  [-33.51104589,-70.5611954],
-  [-33.57246213,-70.64202411],
-  [-33.5137389,-70.7494959],
-  [-33.36830314,-70.72140303],
-  [-33.30210057,-70.58189859],
-  [-33.45675831,-70.68675027],
-  [-33.4017437,-70.67129409],
-  [-33.39723609,-70.8395401],
-  [-33.45825063,-70.71471255],
-  [-33.50947315,-70.83850436],
-  [-33.40349837,-70.81807566],
-  [-33.45822294,-70.58338969],
-  [-33.30981268,-70.59089491],
-  [-33.58327306,-70.65614059],
-  [-33.55461327,-70.79502763],
-  [-33.53229172,-70.60161503],
-  [-33.5370468,-70.81336862],
-  [-33.56506583,-70.83411168],
-  [-33.57106988,-70.8296067],
-  [-33.43530257,-70.6703106],
-  [-33.31094519,-70.70230376],
-  [-33.57540147,-70.58172279],
-  [-33.33258191,-70.65486919],
-  [-33.44116488,-70.62108309],
-  [-33.36758411,-70.71778881],
-  [-33.41837556,-70.56041007],
-  [-33.41247091,-70.73518854],
-  [-33.56226439,-70.83597124],
-  [-33.55137027,-70.78068345],
-  [-33.37149157,-70.8544811],
-  [-33.59748869,-70.58509264],
-  [-33.56597695,-70.58570631],
-  [-33.48668812,-70.49009906],
-  [-33.32225939,-70.7644583],
-  [-33.61736419,-70.63962648],
-  [-33.33654326,-70.56581229],
-  [-33.36715959,-70.70869893],
-  [-33.48173188,-70.53366635],
-  [-33.34140523,-70.7653342],
-  [-33.42522913,-70.83575554],
-  [-33.29352018,-70.68511582],
-  [-33.51978473,-70.6952089],
-  [-33.61485174,-70.64904039],
-  [-33.57048216,-70.69800664],
-  [-33.58722942,-70.70056571],
-  [-33.36050988,-70.54522541],
-  [-33.53140487,-70.69955513],
-  [-33.38149724,-70.86229764],
-  [-33.40438184,-70.77407515],
-  [-33.47191779,-70.46033332],
-  [-33.32954596,-70.51636976],
-  [-33.43776228,-70.49405375],
-  [-33.51609803,-70.5251126],
-  [-33.45677071,-70.86514297],
-  [-33.40467165,-70.69302991],
-  [-33.43902995,-70.54990135],
-  [-33.34328944,-70.77470757],
-  [-33.32042379,-70.62248813],
-  [-33.31650115,-70.66983517],
-  [-33.4811987,-70.75621778],
-  [-33.29848775,-70.68465872],
-  [-33.4122806,-70.52403973],
-  [-33.43275062,-70.49107193],
-  [-33.40587998,-70.72033728],
-  [-33.28797406,-70.69140303],
-  [-33.37157284,-70.62860963],
-  [-33.48540607,-70.77866522],
-  [-33.51156382,-70.66300763],
-  [-33.37525197,-70.78705766],
-  [-33.40314882,-70.50183378],
-  [-33.38257005,-70.76915424],
-  [-33.46679956,-70.84960878],
-  [-33.59766048,-70.68901728],
-  [-33.39903942,-70.69063099],
-  [-33.29750134,-70.61986937],
-  [-33.38033503,-70.71811121],
-  [-33.43724867,-70.52699631],
-  [-33.38516868,-70.49018266],
-  [-33.36593525,-70.59493734],
-  [-33.34758237,-70.78402895],
-  [-33.54656772,-70.58927895],
-  [-33.55665589,-70.54257011],
-  [-33.58096466,-70.55276452],
-  [-33.49465071,-70.71447204],
-  [-33.53829564,-70.6466343],
-  [-33.44665864,-70.79595613],
-  [-33.36722018,-70.52860432],
-  [-33.46048553,-70.64065107],
-  [-33.3782665,-70.60679123],
-  [-33.57194294,-70.75172082],
-  [-33.27475253,-70.7151277],
-  [-33.48227817,-70.4942112],
-  [-33.39933952,-70.85352722],
-  [-33.582255,-70.62841694],
-  [-33.50697391,-70.74839315],
-  [-33.43201061,-70.69141454],
-  [-33.53053115,-70.83376403],
-  [-33.34697688,-70.64086493],
-  [-33.4700938,-70.78912254],
-  [-33.4485541,-70.82055911],
-  [-33.45473387,-70.8264072],
-  [-33.37926517,-70.50646162],
-  [-33.54455516,-70.54825473],
-  [-33.54742647,-70.55410708],
-  [-33.47251499,-70.78402711],
-  [-33.59014116,-70.73388033],
-  [-33.35644114,-70.72797833],
-  [-33.51398988,-70.81392082],
-  [-33.55987073,-70.7787442],
-  [-33.56197283,-70.5591964],
-  [-33.5016212,-70.61266423],
-  [-33.40288887,-70.83955809],
-  [-33.49856423,-70.76764317],
-  [-33.48469156,-70.8311059],
-  [-33.56070627,-70.72869295],
-  [-33.60168875,-70.60018527],
-  [-33.45249153,-70.83239028],
-  [-33.47668941,-70.74828744],
-  [-33.33127151,-70.55504081],
-  [-33.50854477,-70.69988838],
-  [-33.51188922,-70.7790757],
-  [-33.2804784,-70.73831448],
-  [-33.47587289,-70.54348852],
-  [-33.38129175,-70.54993357],
-  [-33.45883471,-70.68598588],
-  [-33.58508968,-70.75610284],
-  [-33.47416174,-70.76954116],
-  [-33.49507379,-70.5948553],
-  [-33.45233259,-70.82998549],
-  [-33.33150354,-70.75323371],
-  [-33.42586342,-70.66688412],
-  [-33.45751391,-70.58962855],
-  [-33.49742117,-70.68040789],
-  [-33.54348538,-70.53778295],
-  [-33.51910989,-70.70263614],
-  [-33.35691954,-70.57017255],
-  [-33.33918792,-70.55473123],
-  [-33.54766701,-70.84738581],
-  [-33.372003,-70.65889707],
-  [-33.33395217,-70.74100543],
-  [-33.44035351,-70.7255933],
-  [-33.33350726,-70.73458433],
-  [-33.4770934,-70.62265926],
-  [-33.37920428,-70.8074662],
-  [-33.55377079,-70.83149715],
-  [-33.5722381,-70.7902171],
-  [-33.38185459,-70.51168822],
-  [-33.44983841,-70.76506841],
-  [-33.28198189,-70.6604886],
-  [-33.46077421,-70.6894029],
-  [-33.45058771,-70.80762815],
-  [-33.43732351,-70.72726285],
-  [-33.45693582,-70.71127614],
-  [-33.42613916,-70.67074622],
-  [-33.52203194,-70.74669068],
-  [-33.33394632,-70.57980621],
-  [-33.48144445,-70.47110704],
-  [-33.4167767,-70.58910687],
-  [-33.49278733,-70.88126823],
-  [-33.38777151,-70.87047341],
-  [-33.52608684,-70.72520858],
-  [-33.3404533,-70.65304263],
-  [-33.35662392,-70.63958446],
-  [-33.55952842,-70.60404636],
-  [-33.31228309,-70.54926597],
-  [-33.61092468,-70.74550267],
-  [-33.34044737,-70.52523019],
-  [-33.53099257,-70.84686933],
-  [-33.38373059,-70.66261357],
-  [-33.40650828,-70.87076099],
-  [-33.49862728,-70.63599793],
-  [-33.3878098,-70.78092887],
-  [-33.40791748,-70.46986641],
-  [-33.36879136,-70.67826289],
-  [-33.51038903,-70.74867933],
-  [-33.30340642,-70.70537742],
-  [-33.58151684,-70.60913593],
-  [-33.35639455,-70.60984406],
-  [-33.53196139,-70.74504607],
-  [-33.429798,-70.56824875],
-  [-33.42905707,-70.50316948],
-  [-33.60686958,-70.71494495],
-  [-33.33303118,-70.69408655],
-  [-33.54286508,-70.63462085],
-  [-33.33611843,-70.76471976],
-  [-33.56302506,-70.6946776],
-  [-33.53206254,-70.51427385],
-  [-33.57483549,-70.66929612],
-  [-33.3393868,-70.72992261],
-  [-33.37054509,-70.60394818],
-  [-33.53099614,-70.68791011],
-  [-33.55770952,-70.7434096],
-  [-33.57101716,-70.72495476],
-  [-33.50180512,-70.74906334],
-  [-33.50259755,-70.5660925],
-  [-33.34415485,-70.78723247],
-  [-33.59520856,-70.59276253],
-  [-33.41295262,-70.60324897],
-  [-33.32832229,-70.66785153],
-  [-33.54047168,-70.69954335],
-  [-33.5081247,-70.8536821],
-  [-33.31829429,-70.56040411],
-  [-33.52767167,-70.73066268],
-  [-33.6032752,-70.62140343],
-  [-33.54010658,-70.5881515],
-  [-33.56460309,-70.58551387],
-  [-33.31652355,-70.68586488],
-  [-33.52699214,-70.55967516],
-  [-33.31932698,-70.55398417],
-  [-33.50280778,-70.52950993],
-  [-33.62046831,-70.63066921],
-  [-33.47155959,-70.71134424],
-  [-33.56578824,-70.57686139],
-  [-33.58660271,-70.6010992],
-  [-33.40920652,-70.55196059],
-  [-33.45510635,-70.65824134],
-  [-33.45753885,-70.69113042],
-  [-33.38855192,-70.50604836],
-  [-33.52072289,-70.58399981],
-  [-33.36233254,-70.56515088],
-  [-33.44118456,-70.55927878],
-  [-33.59295695,-70.78729367],
-  [-33.39339318,-70.73159707],
-  [-33.30410455,-70.70573723],
-  [-33.53851233,-70.54804954],
-  [-33.30627244,-70.72563518],
-  [-33.3489903,-70.62835593],
-  [-33.27616512,-70.6837728],
-  [-33.45242045,-70.69270316],
-  [-33.57567723,-70.56343345],
-  [-33.61779781,-70.70577831],
-  [-33.46492339,-70.75545108],
-  [-33.42972289,-70.83650993],
-  [-33.54742115,-70.65666524],
-  [-33.55835935,-70.8220145],
-  [-33.47369135,-70.84343269],
-  [-33.49870378,-70.68208568],
-  [-33.36825334,-70.6624658],
-  [-33.40391232,-70.59610454],
-  [-33.54397669,-70.74334827],
-  [-33.52322632,-70.75781331],
-  [-33.51557306,-70.75584072],
-  [-33.4999643,-70.62696118],
-  [-33.44018415,-70.48754556],
-  [-33.47671857,-70.57424302],
-  [-33.5759431,-70.54059167],
-  [-33.43229313,-70.66125136],
-  [-33.52954154,-70.59929586],
-  [-33.49207808,-70.75920886],
-  [-33.57880626,-70.63993612],
-  [-33.34306404,-70.72463511],
-  [-33.57825195,-70.67045505],
-  [-33.54163394,-70.82951086],
-  [-33.55908747,-70.81437021],
-  [-33.58276245,-70.56756361],
-  [-33.5577289,-70.74774587],
-  [-33.61206367,-70.71920671],
-  [-33.41292027,-70.58344227],
-  [-33.42392062,-70.73766815],
-  [-33.42297191,-70.72336158],
-  [-33.49094998,-70.78642535],
-  [-33.443118,-70.80681661],
-  [-33.37949056,-70.52413339],
-  [-33.42394941,-70.85551729],
-  [-33.51250405,-70.51155376],
-  [-33.42996228,-70.81539225],
-  [-33.37950523,-70.56534295],
-  [-33.43103503,-70.70997679],
-  [-33.46526495,-70.76702282],
-  [-33.56164159,-70.58500826],
-  [-33.47882077,-70.65074714],
-  [-33.41278684,-70.62462934],
-  [-33.47507588,-70.73830516],
-  [-33.56489126,-70.52590121],
-  [-33.45688546,-70.70677604],
-  [-33.4936597,-70.74471326],
-  [-33.47910614,-70.75556969],
-  [-33.59747905,-70.67906108],
-  [-33.56399823,-70.67377344],
-  [-33.31001162,-70.59921398],
-  [-33.37220547,-70.54358692],
-  [-33.30327816,-70.76898282],
-  [-33.35527038,-70.81873703],
-  [-33.27800934,-70.70817746],
-  [-33.46163275,-70.46196191],
-  [-33.29752327,-70.63636683],
-  [-33.41320227,-70.47329696],
-  [-33.50111277,-70.85017829],
-  [-33.52406441,-70.56203061],
-  [-33.39852254,-70.53787384],
-  [-33.36825105,-70.7926703],
-  [-33.38937644,-70.70646229],
-  [-33.37282186,-70.75330711],
-  [-33.33925293,-70.81749684],
-  [-33.40909296,-70.79782094],
-  [-33.57303592,-70.65518907],
-  [-33.44216095,-70.5260271],
-  [-33.34658741,-70.63093514],
-  [-33.46583975,-70.65018348],
-  [-33.44451063,-70.45822417],
-  [-33.52818528,-70.75932098],
-  [-33.53299661,-70.57227724],
-  [-33.41631365,-70.76918118],
-  [-33.57915021,-70.71865432],
-  [-33.33811211,-70.64150884],
-  [-33.32801869,-70.59610771],
-  [-33.30402249,-70.71986882],
-  [-33.45109081,-70.57041708],
-  [-33.30664141,-70.76963071],
-  [-33.57092835,-70.73014796],
-  [-33.435231,-70.80445276],
-  [-33.31409247,-70.78947662],
-  [-33.37673027,-70.75344134],
-  [-33.51392598,-70.78007818],
-  [-33.41249744,-70.7873358],
-  [-33.3830369,-70.77838206],
-  [-33.55795889,-70.7528993],
-  [-33.37800288,-70.56302982],
-  [-33.32863873,-70.83203359],
-  [-33.41504845,-70.81039265],
-  [-33.28995264,-70.72530697],
-  [-33.42167537,-70.71984128],
-  [-33.31455661,-70.56884715],
-  [-33.5292666,-70.78514993],
-  [-33.34244695,-70.52195317],
-  [-33.37375251,-70.72100365],
-  [-33.33497958,-70.62881008],
-  [-33.41431059,-70.52764186],
-  [-33.43540694,-70.52802254],
-  [-33.40933253,-70.84150956],
-  [-33.4404929,-70.7840206],
-  [-33.33497743,-70.6925001],
-  [-33.30261994,-70.79271841],
-  [-33.57480193,-70.74519003],
-  [-33.50632923,-70.71791207],
-  [-33.38054083,-70.59498401],
-  [-33.42794564,-70.8430077],
-  [-33.41055524,-70.57584877],
-  [-33.48548116,-70.69562033],
-  [-33.50377271,-70.82813931],
-  [-33.42374294,-70.86829751],
-  [-33.61932082,-70.6208424],
-  [-33.43531308,-70.58584756],
-  [-33.40842916,-70.59945383],
-  [-33.53580955,-70.56663326],
-  [-33.43095822,-70.65463067],
-  [-33.57486769,-70.6468425],
-  [-33.49009696,-70.55904733],
-  [-33.37576705,-70.78304859],
-  [-33.37635673,-70.77077874],
-  [-33.55096096,-70.82177382],
-  [-33.43009236,-70.49690676],
-  [-33.54606905,-70.81848811],
-  [-33.50189818,-70.69430342],
-  [-33.46495634,-70.68481388],
-  [-33.58860088,-70.66466061],
-  [-33.59309959,-70.70780553],
-  [-33.51442817,-70.77745589],
-  [-33.40331569,-70.53290618],
-  [-33.42153708,-70.52677901],
-  [-33.31120143,-70.65616159],
-  [-33.45837631,-70.63719473],
-  [-33.42050757,-70.66099836],
-  [-33.55384124,-70.55888915],
-  [-33.56283986,-70.82599377],
-  [-33.52140864,-70.63593803],
-  [-33.50872399,-70.47414043],
-  [-33.47831352,-70.47622481],
-  [-33.42763263,-70.59285163],
-  [-33.39761494,-70.88049278],
-  [-33.58847397,-70.61248707],
-  [-33.59414463,-70.5792053],
-  [-33.39278427,-70.66182308],
-  [-33.4899442,-70.61491057],
-  [-33.52688291,-70.6963729],
-  [-33.49564461,-70.74372431],
-  [-33.35169284,-70.82430236],
-  [-33.28439384,-70.63233653],
-  [-33.33161509,-70.6807338],
-  [-33.53609809,-70.84427048],
-  [-33.35906401,-70.57993399],
-  [-33.48136174,-70.83435016],
-  [-33.38593349,-70.60842885],
-  [-33.47685405,-70.82665414],
-  [-33.40422797,-70.51594765],
-  [-33.52247776,-70.54064739],
-  [-33.54922604,-70.77155251],
-  [-33.44995779,-70.86465405],
-  [-33.42050865,-70.62080759],
-  [-33.46573686,-70.6255228],
-  [-33.40290802,-70.72623977],
-  [-33.48324112,-70.81459057],
-  [-33.57657494,-70.81129953],
-  [-33.34210143,-70.6292626],
-  [-33.56302159,-70.67135877],
-  [-33.44297517,-70.49175255],
-  [-33.56769359,-70.70689411],
-  [-33.54074566,-70.50951643],
-  [-33.48689778,-70.55508993],
-  [-33.35049884,-70.77728534],
-  [-33.32337194,-70.5208788],
-  [-33.55390454,-70.73538284],
-  [-33.56007603,-70.66333409],
-  [-33.36906744,-70.77244443],
-  [-33.39891817,-70.55109094],
-  [-33.33734692,-70.7483199],
-  [-33.49254519,-70.53241034],
-  [-33.48137008,-70.55415765],
-  [-33.43086826,-70.71415702],
-  [-33.29443846,-70.75887873],
-  [-33.37436892,-70.47941039],
-  [-33.56860492,-70.7794499],
-  [-33.50972957,-70.85926408],
-  [-33.41836689,-70.58467526],
-  [-33.43279638,-70.4753833],
-  [-33.28619431,-70.5868533],
-  [-33.3675459,-70.82522773],
-  [-33.33679508,-70.77085378],
-  [-33.40591371,-70.4674172],
-  [-33.42426371,-70.63682462],
-  [-33.47964883,-70.46348208],
-  [-33.54215123,-70.60858236],
-  [-33.30964297,-70.59949589],
-  [-33.50436121,-70.72890672],
-  [-33.31839318,-70.80535233],
-  [-33.41650047,-70.48772963],
-  [-33.53210424,-70.6095749],
-  [-33.59816723,-70.6227273],
-  [-33.43086806,-70.86266693],
-  [-33.37797695,-70.78430133],
-  [-33.42429571,-70.87040935],
-  [-33.48079982,-70.5928029],
-  [-33.46659979,-70.52624694],
-  [-33.61187101,-70.66320691],
-  [-33.6047289,-70.65169338],
-  [-33.3086131,-70.77000424],
-  [-33.35473658,-70.57027742],
-  [-33.38772851,-70.79464889],
-  [-33.4003325,-70.62064696],
-  [-33.5415886,-70.55467166],
-  [-33.40253677,-70.80557057],
-  [-33.29181387,-70.57977137],
-  [-33.44256356,-70.62519747],
-  [-33.46266477,-70.60033165],
-  [-33.3264036,-70.77242885],
-  [-33.45018887,-70.86649518],
-  [-33.59273531,-70.69538672],
-  [-33.58136583,-70.77127389],
-  [-33.42717523,-70.76144765],
-  [-33.56348086,-70.81957536],
-  [-33.31991621,-70.72891991],
-  [-33.41212545,-70.79875554],
-  [-33.42639726,-70.63742611],
-  [-33.60699267,-70.75538421],
-  [-33.43669791,-70.56083739],
-  [-33.32729492,-70.56021787],
-  [-33.61775769,-70.67699205],
-  [-33.324713,-70.7364319],
-  [-33.40638234,-70.51453477],
-  [-33.58181314,-70.6433408],
-  [-33.38206571,-70.80034999],
-  [-33.31211484,-70.60962871],
-  [-33.39514782,-70.66495879],
-  [-33.53300705,-70.62829671],
-  [-33.5162852,-70.80510895],
-  [-33.27749159,-70.6068415],
-  [-33.49210587,-70.57949111],
-  [-33.35805217,-70.79167115],
-  [-33.39000113,-70.79099385],
-  [-33.39894861,-70.85984517],
-  [-33.50024076,-70.87972931],
-  [-33.5481742,-70.50123365],
-  [-33.44645775,-70.84733128],
-  [-33.37509407,-70.48692955],
-  [-33.27076466,-70.63536277],
-  [-33.49510208,-70.48809641],
-  [-33.40402667,-70.76240481],
-  [-33.35617249,-70.56432835],
-  [-33.61784994,-70.72323224],
-  [-33.37247825,-70.54041082],
-  [-33.57597517,-70.70639384],
-  [-33.3506063,-70.544516],
-  [-33.43179827,-70.85423848],
-  [-33.35012578,-70.58208644],
-  [-33.61695384,-70.71401492],
-  [-33.41189115,-70.78261913],
-  [-33.41934509,-70.82454706],
-  [-33.48725104,-70.69736726],
-  [-33.45927923,-70.74258116],
-  [-33.40714205,-70.86770997],
-  [-33.48149266,-70.72398785],
-  [-33.44974547,-70.84193149],
-  [-33.42322102,-70.69018899],
-  [-33.47128211,-70.72637627],
-  [-33.47951803,-70.72662919],
-  [-33.50717652,-70.67837892],
-  [-33.43598081,-70.70161237],
-  [-33.52568417,-70.7273391],
-  [-33.47789716,-70.60182215],
-  [-33.50444965,-70.48862667],
-  [-33.55304947,-70.61469893],
-  [-33.35361689,-70.67181279],
-  [-33.48253447,-70.6970024],
-  [-33.55721495,-70.66383259],
-  [-33.3854724,-70.8535452],
-  [-33.28858392,-70.62591159],
-  [-33.54813028,-70.71345706],
-  [-33.33337145,-70.82028325],
-  [-33.29758969,-70.70107294],
-  [-33.42424255,-70.79173799],
-  [-33.31164337,-70.73757681],
-  [-33.43890596,-70.6198218],
-  [-33.43409694,-70.77979724],
-  [-33.38682781,-70.77044784],
-  [-33.52363467,-70.6958027],
-  [-33.50457862,-70.69021636],
-  [-33.46074256,-70.67530888],
-  [-33.40325115,-70.8250451],
-  [-33.37042641,-70.79208445],
-  [-33.4231536,-70.87455537],
-  [-33.5569502,-70.77939338],
-  [-33.38991925,-70.71414106],
-  [-33.36005975,-70.62613169],
-  [-33.30951483,-70.55923459],
-  [-33.54034846,-70.84068876],
-  [-33.38269404,-70.71499566],
-  [-33.2882246,-70.77148708],
-  [-33.51876707,-70.77483165],
-  [-33.60480835,-70.70477657],
-  [-33.44119077,-70.55681676],
-  [-33.38598977,-70.53115426],
-  [-33.31915558,-70.63227898],
-  [-33.48163759,-70.48018033],
-  [-33.41263012,-70.8702278],
-  [-33.35655513,-70.72707133],
-  [-33.32674745,-70.81933762],
-  [-33.47733371,-70.46781989],
-  [-33.53835347,-70.55079577],
-  [-33.5971626,-70.62256824],
-  [-33.45497381,-70.80709136],
-  [-33.37572252,-70.52987802],
-  [-33.28340805,-70.7430078],
-  [-33.45531024,-70.58203969],
-  [-33.35623494,-70.83100174],
-  [-33.54667645,-70.8317758],
-  [-33.5167477,-70.55679623],
-  [-33.33507261,-70.52418867],
-  [-33.47868365,-70.82975684],
-  [-33.37296589,-70.60881718],
-  [-33.36006308,-70.73307742],
-  [-33.29913465,-70.63211584],
-  [-33.45329078,-70.76665832],
-  [-33.54199243,-70.53937131],
-  [-33.36922182,-70.72125135],
-  [-33.36624096,-70.68692415],
-  [-33.38408368,-70.68480018],
-  [-33.48754672,-70.79885151],
-  [-33.58758696,-70.68309577],
-  [-33.50690191,-70.57522385],
-  [-33.53182579,-70.85208631],
-  [-33.56944136,-70.73708277],
-  [-33.47539983,-70.85288164],
-  [-33.44641136,-70.62146997],
-  [-33.48571669,-70.75845084],
-  [-33.47141773,-70.46535859],
-  [-33.27493595,-70.66905],
-  [-33.45950469,-70.61795084],
-  [-33.41093787,-70.6061575],
-  [-33.37390541,-70.79464466],
-  [-33.34212044,-70.63163633],
-  [-33.42423192,-70.88234547],
-  [-33.4278704,-70.59643061],
-  [-33.58086154,-70.67162668],
-  [-33.42257358,-70.66783176],
-  [-33.32446357,-70.69009365],
-  [-33.39794712,-70.80335201],
-  [-33.27456759,-70.71632854],
-  [-33.44080711,-70.63668088],
-  [-33.2884874,-70.72115492],
-  [-33.37178878,-70.84097301],
-  [-33.32632354,-70.68273656],
-  [-33.41526666,-70.49800265],
-  [-33.34379572,-70.72336247],
-  [-33.34070675,-70.66519691],
-  [-33.37525462,-70.66474097],
-  [-33.60931246,-70.59924545],
-  [-33.42688527,-70.78116245],
-  [-33.53169326,-70.85875706],
-  [-33.408349,-70.57694975],
-  [-33.57292653,-70.57179567],
-  [-33.54914172,-70.67394375],
-  [-33.5607314,-70.54230417],
-  [-33.36347417,-70.79630328],
-  [-33.50227492,-70.72451883],
-  [-33.38772629,-70.61578949],
-  [-33.56552668,-70.59841757],
-  [-33.31360976,-70.78088315],
-  [-33.31712688,-70.65853522],
-  [-33.60391536,-70.5975422],
-  [-33.32645856,-70.65180086],
-  [-33.550654,-70.52701458],
-  [-33.49590318,-70.71578371],
-  [-33.33139579,-70.54957659],
-  [-33.59138276,-70.60746205],
-  [-33.47984301,-70.51524423],
-  [-33.44905185,-70.79009052],
-  [-33.51683975,-70.5808816],
-  [-33.59231687,-70.65991467],
-  [-33.42309057,-70.46188375],
-  [-33.38306405,-70.51674345],
-  [-33.50225381,-70.87613016],
-  [-33.42150446,-70.80292218],
-  [-33.51677571,-70.54147971],
-  [-33.44504756,-70.46763402],
-  [-33.37345943,-70.8400263],
-  [-33.44535683,-70.87145036],
-  [-33.48569762,-70.76403884],
-  [-33.47696994,-70.87654639],
-  [-33.51786019,-70.69539812],
-  [-33.46040331,-70.46308345],
-  [-33.2854533,-70.72234421],
-  [-33.31566472,-70.72027775],
-  [-33.54105295,-70.74086809],
-  [-33.55045739,-70.83443399],
-  [-33.52362127,-70.61770272],
-  [-33.54826395,-70.65407341],
-  [-33.30722839,-70.72299322],
-  [-33.39642479,-70.56921669],
-  [-33.49108825,-70.51807402],
-  [-33.57713927,-70.6801282],
-  [-33.32507079,-70.83110537],
-  [-33.52297213,-70.78653022],
-  [-33.39731862,-70.77008769],
-  [-33.47935986,-70.65622783],
-  [-33.58464122,-70.69419772],
-  [-33.37838488,-70.52047294],
-  [-33.36949027,-70.76494983],
-  [-33.42831702,-70.56882009],
-  [-33.37036944,-70.79573313],
-  [-33.38523331,-70.67018906],
-  [-33.56589609,-70.79790055],
-  [-33.3656348,-70.65519454],
-  [-33.46458055,-70.60519786],
-  [-33.59969994,-70.74873894],
-  [-33.44478545,-70.64695455],
-  [-33.54899697,-70.73697254],
-  [-33.58677938,-70.58338297],
-  [-33.28101397,-70.72001125],
-  [-33.42971139,-70.79538142],
-  [-33.47765792,-70.60308466],
-  [-33.37635864,-70.80564272],
-  [-33.56432375,-70.71095371],
-  [-33.55742748,-70.51524842],
-  [-33.51532534,-70.63937823],
-  [-33.42223859,-70.75645538],
-  [-33.4592298,-70.6708976],
-  [-33.49163344,-70.61067546],
-  [-33.58634718,-70.54808039],
-  [-33.36463307,-70.7985018],
-  [-33.54586071,-70.74906291],
-  [-33.3341792,-70.53375911],
-  [-33.42374104,-70.46841291],
-  [-33.34806969,-70.81225138],
-  [-33.40565311,-70.79224414],
-  [-33.39039921,-70.61561655],
-  [-33.54966437,-70.72903534],
-  [-33.37751424,-70.78678033],
-  [-33.36702062,-70.80126128],
-  [-33.46889979,-70.54068518],
-  [-33.61217558,-70.6372142],
-  [-33.31687175,-70.6129898],
-  [-33.61508154,-70.61567828],
-  [-33.48953152,-70.56260323],
-  [-33.59651306,-70.78402576],
-  [-33.52061172,-70.58936973],
-  [-33.52222164,-70.50837244],
-  [-33.39144586,-70.86236601],
-  [-33.54348608,-70.63843929],
-  [-33.56276055,-70.71794874],
-  [-33.38031255,-70.51094588],
-  [-33.58965718,-70.72726859],
-  [-33.35344819,-70.4940783],
-  [-33.3252993,-70.71915368],
-  [-33.58638662,-70.61477153],
-  [-33.35908762,-70.60218363],
-  [-33.3664019,-70.48719794],
-  [-33.30974726,-70.78796263],
-  [-33.56106833,-70.64931556],
-  [-33.37673876,-70.77152318],
-  [-33.55998509,-70.72729687],
-  [-33.27664688,-70.68700281],
-  [-33.44754882,-70.70869095],
-  [-33.38157694,-70.690243],
-  [-33.46982332,-70.84792601],
-  [-33.47876358,-70.57785679],
-  [-33.62560463,-70.65889739],
-  [-33.50950486,-70.53894314],
-  [-33.37908686,-70.71364357],
-  [-33.42788854,-70.70713183],
-  [-33.50995551,-70.69676029],
-  [-33.56291188,-70.7249902],
-  [-33.40125717,-70.56093963],
-  [-33.51128195,-70.62457788],
-  [-33.44097086,-70.80451113],
-  [-33.44131566,-70.5124473],
-  [-33.52587387,-70.70977946],
-  [-33.3710846,-70.6060548],
-  [-33.42345394,-70.53493839],
-  [-33.37122884,-70.6583376],
-  [-33.31679074,-70.72138788],
-  [-33.6109083,-70.70686237],
-  [-33.35244389,-70.53491617],
-  [-33.52370246,-70.81801399],
-  [-33.5258703,-70.5342639],
-  [-33.49470375,-70.52423078],
-  [-33.37201765,-70.70381173],
-  [-33.54592167,-70.63551199],
-  [-33.37009476,-70.53899435],
-  [-33.37201204,-70.52327344],
-  [-33.32816529,-70.73482961],
-  [-33.40809129,-70.60117386],
-  [-33.39775918,-70.49118657],
-  [-33.5407204,-70.82808996],
-  [-33.43850926,-70.70719265],
-  [-33.43393551,-70.80410327],
-  [-33.30755379,-70.72810245],
-  [-33.39050411,-70.56523088],
-  [-33.49781503,-70.55202719],
-  [-33.42209924,-70.70089351],
-  [-33.44387185,-70.52492556],
-  [-33.35019147,-70.53102557],
-  [-33.44868,-70.7152667],
-  [-33.44659745,-70.56141212],
-  [-33.5095687,-70.70696869],
-  [-33.28418926,-70.68396125],
-  [-33.39779668,-70.59627839],
-  [-33.43704575,-70.75546216],
-  [-33.50070512,-70.65031883],
-  [-33.30906811,-70.64380095],
-  [-33.31047979,-70.65398189],
-  [-33.5327525,-70.8538297],
-  [-33.33647137,-70.82877788],
-  [-33.42306356,-70.77570264],
-  [-33.44886409,-70.79297638],
-  [-33.50685957,-70.4739622],
-  [-33.42172998,-70.87851121],
-  [-33.57087746,-70.69408551],
-  [-33.56951759,-70.73092843],
-  [-33.39574336,-70.51820885],
-  [-33.29279271,-70.72794857],
-  [-33.36879777,-70.57942172],
-  [-33.27993792,-70.73931703],
-  [-33.35307932,-70.77013364],
-  [-33.36724377,-70.60694307],
-  [-33.32587488,-70.79188705],
-  [-33.45353983,-70.88406902],
-  [-33.54678268,-70.6653041],
-  [-33.42128234,-70.57078847],
-  [-33.43279594,-70.846319],
-  [-33.619715,-70.64345783],
-  [-33.53067342,-70.82322476],
-  [-33.530525,-70.57677962],
-  [-33.53383522,-70.80412244],
-  [-33.47117125,-70.79664453],
-  [-33.54097653,-70.5638062],
-  [-33.44741962,-70.46864413],
-  [-33.31992506,-70.78517583],
-  [-33.55997261,-70.64484702],
-  [-33.5443117,-70.77827776],
-  [-33.52056502,-70.66070159],
-  [-33.40766749,-70.87119203],
-  [-33.53206251,-70.80852624],
-  [-33.35913425,-70.49863305],
-  [-33.50238186,-70.71669599],
-  [-33.60616997,-70.6456275],
-  [-33.34067181,-70.51504936],
-  [-33.58173204,-70.62990977],
-  [-33.34464329,-70.51190917],
-  [-33.53856928,-70.77388281],
-  [-33.60057167,-70.71462879],
-  [-33.39042819,-70.72456446],
-  [-33.37676725,-70.48266335],
-  [-33.40880035,-70.69386801],
-  [-33.47439897,-70.74704874],
-  [-33.46581412,-70.54948959],
-  [-33.30517163,-70.69801665],
-  [-33.52332779,-70.80621836],
-  [-33.45321023,-70.73317044],
-  [-33.28374476,-70.60440509],
-  [-33.44034019,-70.47096932],
-  [-33.55644922,-70.52132416],
-  [-33.43447195,-70.78897904],
-  [-33.54764069,-70.67009201],
-  [-33.45033864,-70.50291188],
-  [-33.38843505,-70.76582054],
-  [-33.53424701,-70.84076005],
-  [-33.51621568,-70.74955237],
-  [-33.5123682,-70.81671786],
-  [-33.28832414,-70.66235998],
-  [-33.4153939,-70.88031803],
-  [-33.36155497,-70.74001271],
-  [-33.35368002,-70.70153643],
-  [-33.53983513,-70.6381725],
-  [-33.35430574,-70.79453376],
-  [-33.60109683,-70.73150373],
-  [-33.38057599,-70.60618037],
-  [-33.60603075,-70.72529138],
-  [-33.47012814,-70.51453899],
-  [-33.51866355,-70.6743156],
-  [-33.56978108,-70.60940963],
-  [-33.45681719,-70.50356927],
-  [-33.50169134,-70.84813871],
-  [-33.34854805,-70.62815847],
-  [-33.47361358,-70.85740956],
-  [-33.5622169,-70.54640378],
-  [-33.31942059,-70.72063077],
-  [-33.42740274,-70.73124243],
-  [-33.3493087,-70.66470993],
-  [-33.31210119,-70.58787577],
-  [-33.58888935,-70.54786129],
-  [-33.31133272,-70.80543047],
-  [-33.35793012,-70.67289691],
-  [-33.34798965,-70.69576583],
-  [-33.39883059,-70.6566347],
-  [-33.52615545,-70.61408924],
-  [-33.54448113,-70.67014687],
-  [-33.54665447,-70.77339804],
-  [-33.45617665,-70.52681632],
-  [-33.61021268,-70.64496999],
-  [-33.34730965,-70.64400682],
-  [-33.41617632,-70.88426002],
-  [-33.52717591,-70.81455593],
-  [-33.56803077,-70.71887872],
-  [-33.39871865,-70.7621017],
-  [-33.31314442,-70.63597076],
-  [-33.55154712,-70.56056609],
-  [-33.38821509,-70.86965848],
-  [-33.55111424,-70.84285166],
-  [-33.46555892,-70.64004932],
-  [-33.42087584,-70.62118806],
-  [-33.51830826,-70.60074862],
-  [-33.60119055,-70.5641223],
-  [-33.52061029,-70.65777219],
-  [-33.35461804,-70.8473859],
-  [-33.32519205,-70.77408292],
-  [-33.47595529,-70.80289849],
-  [-33.60650547,-70.73315662],
-  [-33.5265066,-70.78105869],
-  [-33.57492736,-70.66014416],
-  [-33.42496584,-70.68238094],
-  [-33.45045127,-70.68813883],
-  [-33.37469488,-70.59289276],
-  [-33.52788198,-70.58835257],
-  [-33.38739233,-70.55112906],
-  [-33.62575073,-70.65079946],
-  [-33.48481879,-70.88313556],
-  [-33.31827774,-70.61069472],
-  [-33.41851219,-70.55604475],
-  [-33.51092051,-70.73240984],
-  [-33.38989089,-70.61383406],
-  [-33.41702584,-70.7794982],
-  [-33.37291078,-70.68491481],
-  [-33.54142378,-70.80412869],
-  [-33.61891451,-70.69099209],
-  [-33.29324203,-70.63536067],
-  [-33.54491826,-70.71264518],
-  [-33.47660526,-70.67790118],
-  [-33.56898504,-70.64462918],
-  [-33.32601341,-70.78801628],
-  [-33.37062033,-70.56853585],
-  [-33.33553355,-70.64713944],
-  [-33.38937199,-70.58592501],
-  [-33.50758166,-70.85861399],
-  [-33.44327436,-70.59356782],
-  [-33.54428182,-70.85348347],
-  [-33.58999815,-70.58091988],
-  [-33.49303778,-70.7268549],
-  [-33.43440964,-70.83341397],
-  [-33.49502233,-70.77646809],
-  [-33.52783425,-70.53532543],
-  [-33.50850414,-70.49947113],
-  [-33.50168728,-70.51446222],
-  [-33.43707462,-70.6261802],
-  [-33.32227186,-70.65239512],
-  [-33.34304854,-70.82939263],
-  [-33.44979936,-70.69323523],
-  [-33.45784214,-70.71322319],
-  [-33.47630181,-70.79820456],
-  [-33.2714166,-70.71221718],
-  [-33.60561436,-70.67891691],
-  [-33.43348625,-70.87643941],
-  [-33.52358445,-70.60944963],
-  [-33.54232052,-70.72794535],
-  [-33.5210203,-70.62468493],
-  [-33.41349008,-70.85191939],
-  [-33.38085809,-70.50713801],
-  [-33.3514797,-70.58583314],
-  [-33.36569249,-70.85574293],
-  [-33.37203087,-70.59165479],
-  [-33.52947817,-70.59690237],
-  [-33.4201536,-70.83706921],
-  [-33.49239542,-70.64988301],
-  [-33.50823399,-70.64287439],
-  [-33.51734439,-70.72378358],
-  [-33.49830966,-70.8639667],
-  [-33.43046018,-70.46367821],
-  [-33.54640387,-70.66643491],
-  [-33.41024446,-70.80288859],
-  [-33.43799289,-70.58041385],
-  [-33.43982472,-70.84026689],
-  [-33.55295748,-70.5532488],
-  [-33.28135134,-70.59545008],
-  [-33.52467262,-70.55504207],
-  [-33.49091835,-70.70359939],
-  [-33.49581188,-70.62160493],
-  [-33.45929656,-70.53809226],
-  [-33.53325427,-70.66492707],
-  [-33.35174504,-70.58831231],
-  [-33.49481655,-70.66875238],
-  [-33.4006049,-70.71976087],
-  [-33.34148051,-70.76299985],
-  [-33.40833461,-70.73220779],
-  [-33.57968358,-70.60999158],
-  [-33.5362112,-70.67174417],
-  [-33.4813212,-70.66487679],
-  [-33.32487751,-70.80722613],
-  [-33.35305708,-70.82028686],
-  [-33.42676392,-70.86598376],
-  [-33.39423421,-70.51879661],
-  [-33.46144577,-70.54761505],
-  [-33.34086935,-70.68106308],
-  [-33.50755095,-70.53009182],
-  [-33.38276951,-70.72548271],
-  [-33.48682036,-70.77582815],
-  [-33.29665409,-70.57284842],
-  [-33.41754402,-70.55980363],
-  [-33.33861364,-70.73688546],
-  [-33.44952989,-70.72788293],
-  [-33.30263808,-70.76395359],
-  [-33.38691995,-70.66559386],
-  [-33.53556573,-70.73063635],
-  [-33.52103148,-70.69243871],
-  [-33.58425612,-70.5833047],
-  [-33.59004209,-70.57751135],
-  [-33.38930575,-70.78040555],
-  [-33.54442201,-70.7206783],
-  [-33.44961192,-70.54600881],
-  [-33.38413132,-70.62330801],
-  [-33.48812063,-70.74998596],
-  [-33.37363652,-70.8196541],
-  [-33.3774329,-70.52632753],
-  [-33.30184009,-70.73407455],
-  [-33.42547054,-70.5293603],
-  [-33.31170904,-70.80043982],
-  [-33.52475012,-70.70626629],
-  [-33.5951134,-70.75695358],
-  [-33.50652031,-70.72290979],
-  [-33.50533563,-70.64969453],
-  [-33.43044399,-70.8539556],
-  [-33.56013091,-70.71286154],
-  [-33.35899539,-70.59936685],
-  [-33.4533516,-70.88168948],
-  [-33.53760676,-70.82207433],
-  [-33.56936717,-70.77166984],
-  [-33.43718307,-70.62916369],
-  [-33.54161461,-70.76847534],
-  [-33.44353108,-70.48212134],
-  [-33.53464857,-70.58553768],
-  [-33.34730628,-70.83736287],
-  [-33.40418497,-70.52742987],
-  [-33.56070648,-70.57738707],
-  [-33.34538664,-70.63031548],
-  [-33.47749008,-70.63594249],
-  [-33.44710368,-70.7456644],
-  [-33.40604508,-70.65112208],
-  [-33.53276066,-70.84648989],
-  [-33.44784093,-70.72596554],
-  [-33.46423848,-70.71069602],
-  [-33.50117172,-70.66131727],
-  [-33.41462187,-70.83036899],
-  [-33.51834573,-70.84384769],
-  [-33.51264571,-70.74641153],
-  [-33.60089731,-70.75202526],
-  [-33.42398217,-70.80349879],
-  [-33.27908856,-70.72831242],
-  [-33.49075332,-70.7016398],
-  [-33.39068391,-70.65444868],
-  [-33.36077302,-70.73118969],
-  [-33.53220119,-70.76886031],
-  [-33.59357728,-70.73455875],
-  [-33.42935423,-70.65500392],
-  [-33.30531968,-70.77752908],
-  [-33.48408994,-70.59200256],
-  [-33.31019055,-70.79779286],
-  [-33.55222062,-70.77266657],
-  [-33.45539996,-70.78107868],
-  [-33.49161578,-70.84119144],
-  [-33.47499152,-70.84657372],
-  [-33.46257506,-70.76815038],
-  [-33.32599034,-70.52268646],
-  [-33.37149665,-70.50566454],
-  [-33.40018121,-70.81501538],
-  [-33.43766024,-70.57002566],
-  [-33.46003064,-70.80442108],
-  [-33.48923117,-70.48200644],
-  [-33.55206424,-70.7565186],
-  [-33.30412937,-70.63024701],
-  [-33.45760486,-70.48082304],
-  [-33.48802492,-70.65261934],
-  [-33.31998952,-70.57680403],
-  [-33.38775995,-70.52199723],
-  [-33.57048908,-70.64925842],
-  [-33.32881715,-70.512332],
-  [-33.30879738,-70.80298923],
-  [-33.41367684,-70.83745729],
-  [-33.47039613,-70.49217677],
-  [-33.57868457,-70.67427441],
-  [-33.46937401,-70.66493188],
-  [-33.38800492,-70.51930519],
-  [-33.33916811,-70.83113401],
-  [-33.46227412,-70.54266259],
-  [-33.39150066,-70.66462859],
-  [-33.34558336,-70.74985074],
-  [-33.40736428,-70.82614319],
-  [-33.51936877,-70.5085585],
-  [-33.43700155,-70.81076092],
-  [-33.30033657,-70.69163162],
-  [-33.41637426,-70.81729931],
-  [-33.43794852,-70.78460412],
-  [-33.50751032,-70.48508468],
-  [-33.52100832,-70.56204111],
-  [-33.42228326,-70.68688641],
-  [-33.42536658,-70.5123192],
-  [-33.60937192,-70.66964433],
-  [-33.45900884,-70.53100029],
-  [-33.49161504,-70.79626244],
-  [-33.3307047,-70.74973511],
-  [-33.40170234,-70.494742],
-  [-33.53250612,-70.50965256],
-  [-33.38464126,-70.64599764],
-  [-33.39122193,-70.73818558],
-  [-33.45616892,-70.5186208],
-  [-33.51025174,-70.60107794],
-  [-33.52340059,-70.59242419],
-  [-33.44572337,-70.85559391],
-  [-33.34127736,-70.64812414],
-  [-33.53408905,-70.71400822],
-  [-33.47351659,-70.58189921],
-  [-33.36624179,-70.51313714],
-  [-33.349125,-70.62565549],
-  [-33.5975153,-70.6642583],
-  [-33.5551549,-70.5429349],
-  [-33.33504548,-70.66946991],
-  [-33.40498685,-70.64709293],
-  [-33.28453886,-70.71840544],
-  [-33.56870548,-70.54228868],
-  [-33.35436572,-70.74653127],
-  [-33.3906661,-70.53930776],
-  [-33.55772086,-70.58827516],
-  [-33.54083898,-70.60763359],
-  [-33.55431665,-70.63050529],
-  [-33.57874206,-70.77236656],
-  [-33.58006163,-70.59087537],
-  [-33.33067225,-70.64290683],
-  [-33.39574556,-70.6520507],
-  [-33.39941675,-70.85177929],
-  [-33.58528341,-70.53581469],
-  [-33.59846212,-70.69849605],
-  [-33.3978524,-70.67691779],
-  [-33.40132222,-70.80779348],
-  [-33.56412987,-70.6709738],
-  [-33.47080779,-70.76704249],
-  [-33.59251954,-70.70562208],
-  [-33.456409,-70.77789361],
-  [-33.48925209,-70.6605527],
-  [-33.30848028,-70.57388197],
-  [-33.40730999,-70.63012606],
-  [-33.56776543,-70.60146479],
-  [-33.27623058,-70.73027457],
-  [-33.39160804,-70.53644564],
-  [-33.57630159,-70.53191537],
-  [-33.41016946,-70.71603262],
-  [-33.34176342,-70.6067285],
-  [-33.52571021,-70.55081111],
-  [-33.38922175,-70.47307797],
-  [-33.37575661,-70.72785724],
-  [-33.37027834,-70.58528011],
-  [-33.47064458,-70.72563187],
-  [-33.33112442,-70.83616085],
-  [-33.33752417,-70.68326102],
-  [-33.40412859,-70.77534509],
-  [-33.33576045,-70.51110234],
-  [-33.29263394,-70.76771182],
-  [-33.57563427,-70.81499429],
-  [-33.53451656,-70.54526983],
-  [-33.52287825,-70.71463944],
-  [-33.33693152,-70.54059187],
-  [-33.56727354,-70.81596568],
-  [-33.41256028,-70.7247664],
-  [-33.56925869,-70.7541518],
-  [-33.55148602,-70.7299135],
-  [-33.59166247,-70.73124222],
-  [-33.60476322,-70.65217707],
-  [-33.41535921,-70.74316964],
-  [-33.42853838,-70.74251587],
-  [-33.47599102,-70.63159147],
-  [-33.35652256,-70.70449222],
-  [-33.44291351,-70.49249133],
-  [-33.55986929,-70.82916744],
-  [-33.54689617,-70.51500451],
-  [-33.32490572,-70.59684021],
-  [-33.37130444,-70.73669219],
-  [-33.61785472,-70.62336433],
-  [-33.42267142,-70.59168659],
-  [-33.34692876,-70.60192512],
-  [-33.48108078,-70.70245273],
-  [-33.37269549,-70.7347209],
-  [-33.29999577,-70.61233593],
-  [-33.48602635,-70.62631621],
-  [-33.49471376,-70.51271082],
-  [-33.4084509,-70.58934656],
-  [-33.35427177,-70.53311905],
-  [-33.58862915,-70.70730926],
-  [-33.59338648,-70.62043855],
-  [-33.35904215,-70.49362372],
-  [-33.48312388,-70.5889599],
-  [-33.35617643,-70.84886412],
-  [-33.33575608,-70.63580057],
-  [-33.34256551,-70.63130699],
-  [-33.39974667,-70.59199191],
-  [-33.46454735,-70.613746],
-  [-33.40491514,-70.65274886],
-  [-33.3585741,-70.53207508],
-  [-33.48790541,-70.5194557],
-  [-33.50462619,-70.65638081],
-  [-33.57769226,-70.80073323],
-  [-33.34654682,-70.63198348],
-  [-33.41876786,-70.63018727],
-  [-33.34829528,-70.67782778],
-  [-33.27829181,-70.73856687],
-  [-33.54325148,-70.62627071],
-  [-33.53995909,-70.74518491],
-  [-33.34586826,-70.66117506],
-  [-33.52581028,-70.80662826],
-  [-33.43671339,-70.85081976],
-  [-33.43372752,-70.62211346],
-  [-33.57750552,-70.73450316],
-  [-33.51326033,-70.50975898],
-  [-33.44259421,-70.75721804],
-  [-33.38894816,-70.70844705],
-  [-33.4610904,-70.85032162],
-  [-33.61588914,-70.72746258],
-  [-33.52709952,-70.51515143],
-  [-33.52915743,-70.85303688],
-  [-33.47758067,-70.46158073],
-  [-33.30943373,-70.63328766],
-  [-33.43243762,-70.64418906],
-  [-33.37041279,-70.75826094],
-  [-33.42025096,-70.59450113],
-  [-33.50864829,-70.71211028],
-  [-33.40497454,-70.47665275],
-  [-33.57558547,-70.68475644],
-  [-33.47858648,-70.74117638],
-  [-33.35502191,-70.594848],
-  [-33.42403005,-70.88501308],
-  [-33.3929949,-70.81635363],
-  [-33.32145033,-70.60329335],
-  [-33.50944581,-70.7790536],
-  [-33.53769874,-70.79208172],
-  [-33.5304454,-70.70687918],
-  [-33.51562616,-70.71049431],
-  [-33.46655614,-70.62453623],
-  [-33.49728484,-70.68530987],
-  [-33.42443049,-70.7088256],
-  [-33.39096067,-70.59065919],
-  [-33.39809718,-70.66163274],
-  [-33.44238609,-70.61361569],
-  [-33.47441852,-70.84019136],
-  [-33.55514207,-70.63606666],
-  [-33.50764887,-70.87384941],
-  [-33.46488699,-70.77140658],
-  [-33.44692615,-70.74087029],
-  [-33.55185316,-70.658836],
-  [-33.55320057,-70.75178291],
-  [-33.5058981,-70.76386778],
-  [-33.51884585,-70.69275432],
-  [-33.40487737,-70.75440801],
-  [-33.28913148,-70.5928971],
-  [-33.49898734,-70.48169218],
-  [-33.32702215,-70.70483471],
-  [-33.43154162,-70.87486268],
-  [-33.5758146,-70.68583614],
-  [-33.29279012,-70.66719793],
-  [-33.41855799,-70.73104136],
-  [-33.48628965,-70.75625139],
-  [-33.27245796,-70.70418296],
-  [-33.60893482,-70.66634698],
-  [-33.41093716,-70.82652279],
-  [-33.44354773,-70.80292571],
-  [-33.59707016,-70.56001352],
-  [-33.32605167,-70.57883313],
-  [-33.49948412,-70.8395383],
-  [-33.42387345,-70.56918918],
-  [-33.4493478,-70.47279973],
-  [-33.41005869,-70.54368019],
-  [-33.45784674,-70.58720946],
-  [-33.56723858,-70.56680865],
-  [-33.29634771,-70.59590516],
-  [-33.28296539,-70.58729499],
-  [-33.34383851,-70.78209072],
-  [-33.44574708,-70.49969371],
-  [-33.31686433,-70.55318241],
-  [-33.52229338,-70.86539851],
-  [-33.44043476,-70.7487741],
-  [-33.37687825,-70.56481237],
-  [-33.37236696,-70.74849197],
-  [-33.51663373,-70.56767835],
-  [-33.45191849,-70.52985683],
-  [-33.37345554,-70.63020537],
-  [-33.48632308,-70.61607391],
-  [-33.47332679,-70.77447988],
-  [-33.48230868,-70.68806941],
-  [-33.43397852,-70.56108216],
-  [-33.49060404,-70.52165395],
-  [-33.38284736,-70.5742454],
-  [-33.31747556,-70.68883213],
-  [-33.49331427,-70.72641207],
-  [-33.41050224,-70.55346786],
-  [-33.37458183,-70.61496733],
-  [-33.5458066,-70.81957163],
-  [-33.43546886,-70.53512985],
-  [-33.34539841,-70.69022093],
-  [-33.37554125,-70.84198129],
-  [-33.32592686,-70.72379403],
-  [-33.39817446,-70.86888356],
-  [-33.27809787,-70.70304146],
-  [-33.29903561,-70.58741818],
-  [-33.52434829,-70.83096669],
-  [-33.47328488,-70.64044261],
-  [-33.42200452,-70.82168117],
-  [-33.34786795,-70.58373709],
-  [-33.37452879,-70.524515],
-  [-33.42950235,-70.82511853],
-  [-33.53898205,-70.8439915],
-  [-33.56074309,-70.70401035],
-  [-33.54371163,-70.57436102],
-  [-33.44190445,-70.73202132],
-  [-33.4876825,-70.67130792],
-  [-33.36271217,-70.70060022],
-  [-33.4094688,-70.5415215],
-  [-33.492717,-70.52830559],
-  [-33.45061934,-70.58415068],
-  [-33.53154806,-70.66811227],
-  [-33.47857763,-70.63732686],
-  [-33.52223004,-70.52488649],
-  [-33.54114119,-70.50068197],
-  [-33.48158438,-70.7215758],
-  [-33.4005597,-70.62229991],
-  [-33.37930513,-70.49303489],
-  [-33.35144508,-70.75044019],
-  [-33.55089203,-70.70018325],
-  [-33.55998861,-70.62029673],
-  [-33.34399728,-70.78616985],
-  [-33.29920172,-70.78247782],
-  [-33.39155296,-70.73227298],
-  [-33.48601863,-70.63911091],
-  [-33.47265117,-70.78605953],
-  [-33.41750236,-70.62338189],
-  [-33.35513001,-70.78176614],
-  [-33.57263119,-70.6899873],
-  [-33.46389915,-70.60036247],
-  [-33.49485569,-70.81721206],
-  [-33.54252228,-70.83088084],
-  [-33.38821186,-70.49658105],
-  [-33.47183257,-70.78154719],
-  [-33.38534711,-70.75048336],
-  [-33.46992367,-70.85955661],
-  [-33.49056034,-70.56678428],
-  [-33.4445689,-70.63214219],
-  [-33.46709148,-70.86996051],
-  [-33.54020344,-70.67473547],
-  [-33.36159921,-70.62410203],
-  [-33.53837231,-70.6427796],
-  [-33.55820119,-70.59337566],
-  [-33.36798426,-70.7332931],
-  [-33.39847783,-70.66692936],
-  [-33.4841666,-70.88054787],
-  [-33.39849015,-70.52830746],
-  [-33.37904546,-70.85950164],
-  [-33.34544075,-70.69067505],
-  [-33.35875121,-70.6534153],
-  [-33.28841859,-70.76369541],
-  [-33.49467262,-70.55129128],
-  [-33.46559163,-70.49767991],
-  [-33.43775138,-70.50868352],
-  [-33.5116141,-70.70659615],
-  [-33.3119353,-70.69523001],
-  [-33.43053161,-70.58589975],
-  [-33.30420784,-70.78015909],
-  [-33.59949162,-70.58994903],
-  [-33.53274089,-70.7429317],
-  [-33.52798884,-70.80353561],
-  [-33.33023701,-70.81838453],
-  [-33.38090865,-70.79791614],
-  [-33.55889136,-70.5785163],
-  [-33.36356695,-70.80746987],
-  [-33.57543788,-70.60457717],
-  [-33.4402365,-70.63050869],
-  [-33.393045,-70.86752322],
-  [-33.47645274,-70.7874482],
-  [-33.44559321,-70.88768078],
-  [-33.44739147,-70.84874973],
-  [-33.35253109,-70.63641056],
-  [-33.59564731,-70.78814493],
-  [-33.48867918,-70.63176839],
-  [-33.39442834,-70.68796526],
-  [-33.35089137,-70.57562873],
-  [-33.62205423,-70.63050231],
-  [-33.49442169,-70.62143214],
-  [-33.37036888,-70.83742387],
-  [-33.50051068,-70.84673034],
-  [-33.35087721,-70.59506071],
-  [-33.60101138,-70.61556142],
-  [-33.35960576,-70.64350386],
-  [-33.50402081,-70.68513366],
-  [-33.27070643,-70.67481413],
-  [-33.42263335,-70.64254028],
-  [-33.46763449,-70.61399373],
-  [-33.47186404,-70.49934001],
-  [-33.6175666,-70.67651102],
-  [-33.56453809,-70.80525294],
-  [-33.44716167,-70.86011104],
-  [-33.50920254,-70.62543294],
-  [-33.55617997,-70.59364246],
-  [-33.40292083,-70.73324802],
-  [-33.42597152,-70.79090056],
-  [-33.3906595,-70.72830621],
-  [-33.49488689,-70.74990719],
-  [-33.39761793,-70.63252957],
-  [-33.38374553,-70.81081436],
-  [-33.43541131,-70.81696599],
-  [-33.42054782,-70.71199688],
-  [-33.44531299,-70.48301229],
-  [-33.50673705,-70.56769134],
-  [-33.44150767,-70.58679386],
-  [-33.60694162,-70.74233511],
-  [-33.449752,-70.46651652],
-  [-33.34474572,-70.72741195],
-  [-33.5327302,-70.56344169],
-  [-33.35774034,-70.5601262],
-  [-33.47623062,-70.7484578],
-  [-33.47999613,-70.71127572],
-  [-33.5692408,-70.82567931],
-  [-33.45429649,-70.5736429],
-  [-33.44436716,-70.83097928],
-  [-33.4691352,-70.8013702],
-  [-33.32869427,-70.75122008],
-  [-33.53404902,-70.56804439],
-  [-33.49016246,-70.52567274],
-  [-33.39176969,-70.84707204],
-  [-33.57200683,-70.81760212],
-  [-33.30988861,-70.65913313],
-  [-33.50308593,-70.73191756],
-  [-33.36420838,-70.49699497],
-  [-33.33890139,-70.70611501],
-  [-33.47559267,-70.86422385],
-  [-33.56159469,-70.74725921],
-  [-33.3253314,-70.80412219],
-  [-33.33022176,-70.52552609],
-  [-33.27913752,-70.66870846],
-  [-33.55756035,-70.65541945],
-  [-33.5325112,-70.676788],
-  [-33.46556952,-70.55219588],
-  [-33.48259927,-70.804793],
-  [-33.39986951,-70.8649027],
-  [-33.43521182,-70.79662729],
-  [-33.53220222,-70.53289528],
-  [-33.61178378,-70.69102789],
-  [-33.32847273,-70.56412257],
-  [-33.53914335,-70.76335066],
-  [-33.51628308,-70.59068565],
-  [-33.39642462,-70.64139475],
-  [-33.38526581,-70.68361516],
-  [-33.57976158,-70.68571725],
-  [-33.42497492,-70.6190053],
-  [-33.39438879,-70.65275473],
-  [-33.40934142,-70.65560123],
-  [-33.32028095,-70.64445032],
-  [-33.50300897,-70.59935518],
-  [-33.45233775,-70.57559541],
-  [-33.42708347,-70.53059272],
-  [-33.60032938,-70.76620137],
-  [-33.58648473,-70.67660305],
-  [-33.50911132,-70.60418021],
-  [-33.49140349,-70.7446702],
-  [-33.35641637,-70.59134634],
-  [-33.34972378,-70.52773292],
-  [-33.52996996,-70.8512951],
-  [-33.40479146,-70.61655137],
-  [-33.35369927,-70.51025134],
-  [-33.54991403,-70.60336608],
-  [-33.55765194,-70.57221036],
-  [-33.37761716,-70.78731566],
-  [-33.44801073,-70.71129842],
-  [-33.55464827,-70.59755445],
-  [-33.48004671,-70.77520684],
-  [-33.52894538,-70.81328305],
-  [-33.28567827,-70.59157311],
-  [-33.39867619,-70.83482691],
-  [-33.59600311,-70.58813735],
-  [-33.46768795,-70.63363625],
-  [-33.34672404,-70.7710218],
-  [-33.51583107,-70.53711871],
-  [-33.52486803,-70.83788204],
-  [-33.39077688,-70.67942545],
-  [-33.39422421,-70.74101547],
-  [-33.40254724,-70.80443782],
-  [-33.5461692,-70.76978371],
-  [-33.47182595,-70.85739986],
-  [-33.43198527,-70.71905887],
-  [-33.39979105,-70.54791449],
-  [-33.48804837,-70.85805203],
-  [-33.34130268,-70.67697065],
-  [-33.4305436,-70.51019834],
-  [-33.34486071,-70.63699694],
-  [-33.41929543,-70.87489168],
-  [-33.31858016,-70.65315381],
-  [-33.36677234,-70.49675276],
-  [-33.29380865,-70.61910203],
-  [-33.42663765,-70.61023898],
-  [-33.37516096,-70.73174859],
-  [-33.30644435,-70.68788037],
-  [-33.43767823,-70.52262257],
-  [-33.42171963,-70.7015153],
-  [-33.5886165,-70.62257084],
-  [-33.38589409,-70.6618442],
-  [-33.54394073,-70.53328335],
-  [-33.59067121,-70.55999475],
-  [-33.30165261,-70.79453316],
-  [-33.48053434,-70.52506172],
-  [-33.29617148,-70.6440102],
-  [-33.28005794,-70.61623697],
-  [-33.5786237,-70.78781141],
-  [-33.55774159,-70.56016118],
-  [-33.45893682,-70.75749276],
-  [-33.42267507,-70.79101007],
-  [-33.5401813,-70.50770559],
-  [-33.50879642,-70.67666761],
-  [-33.46915008,-70.56964178],
-  [-33.58819946,-70.71628013],
-  [-33.55005877,-70.62248152],
-  [-33.60738307,-70.632949],
-  [-33.49194792,-70.85707662],
-  [-33.3637739,-70.6493019],
-  [-33.58239786,-70.74811303],
-  [-33.57937725,-70.71753436],
-  [-33.34785731,-70.81039171],
-  [-33.28277752,-70.59263552],
-  [-33.44209457,-70.51689741],
-  [-33.48111315,-70.74521097],
-  [-33.5408464,-70.54709689],
-  [-33.27241007,-70.67096716],
-  [-33.5720334,-70.57905687],
-  [-33.50917921,-70.61816522],
-  [-33.49657948,-70.50599606],
-  [-33.34072035,-70.8109724],
-  [-33.37990022,-70.56387464],
-  [-33.59906219,-70.63982546],
-  [-33.3203442,-70.61236424],
-  [-33.28462081,-70.66350032],
-  [-33.42130556,-70.48467718],
-  [-33.33368091,-70.6463987],
-  [-33.31204356,-70.74347424],
-  [-33.57471611,-70.6883288],
-  [-33.40567186,-70.84079464],
-  [-33.36773558,-70.5751211],
-  [-33.48946297,-70.8291941],
-  [-33.46649241,-70.70749679],
-  [-33.54794434,-70.50489258],
-  [-33.36074472,-70.78609913],
-  [-33.42440094,-70.77964359],
-  [-33.47886436,-70.73660751],
-  [-33.57890006,-70.53571324],
-  [-33.57562953,-70.65568314],
-  [-33.52207519,-70.8657797],
-  [-33.37386697,-70.8201168],
-  [-33.48886029,-70.6600104],
-  [-33.53251592,-70.75291306],
-  [-33.49327802,-70.577775],
-  [-33.59698902,-70.67026663],
-  [-33.30115886,-70.63067821],
-  [-33.37052304,-70.72249439],
-  [-33.37053707,-70.6789754],
-  [-33.40507101,-70.63662116],
-  [-33.4522918,-70.59188976],
-  [-33.43174924,-70.59697339],
-  [-33.53357308,-70.82056309],
-  [-33.34678526,-70.56573366],
-  [-33.38442828,-70.66375865],
-  [-33.3419546,-70.7409062],
-  [-33.57580768,-70.52341363],
-  [-33.40433262,-70.47519324],
-  [-33.42778167,-70.7594341],
-  [-33.37536022,-70.757182],
-  [-33.36081736,-70.67174871],
-  [-33.60945242,-70.63629756],
-  [-33.33993848,-70.52799012],
-  [-33.52833458,-70.58011406],
-  [-33.29518858,-70.74073775],
-  [-33.30425019,-70.59044351],
-  [-33.47001977,-70.46743044],
-  [-33.35066632,-70.50024298],
-  [-33.45321716,-70.47122908],
-  [-33.32550938,-70.64649355],
-  [-33.47880457,-70.61799555],
-  [-33.37366872,-70.67949873],
-  [-33.29248464,-70.63992104],
-  [-33.49822527,-70.52825431],
-  [-33.36136165,-70.69867951],
-  [-33.27985451,-70.6333838],
-  [-33.38626344,-70.53390719],
-  [-33.35985416,-70.85266512],
-  [-33.35312398,-70.74886058],
-  [-33.42821917,-70.84135351],
-  [-33.39525189,-70.82865416],
-  [-33.52168278,-70.67039317],
-  [-33.37797593,-70.76884343],
-  [-33.35177377,-70.76921986],
-  [-33.41020956,-70.64767502],
-  [-33.45702071,-70.68136862],
-  [-33.41412516,-70.71904613],
-  [-33.62365584,-70.64985746],
-  [-33.42726428,-70.7403168],
-  [-33.42558719,-70.79640733],
-  [-33.42799909,-70.72135243],
-  [-33.34094714,-70.66164159],
-  [-33.41920822,-70.8011193],
-  [-33.36274872,-70.53227979],
-  [-33.40036298,-70.49196022],
-  [-33.42254889,-70.71457931],
-  [-33.50008718,-70.74547228],
-  [-33.44243856,-70.87119846],
-  [-33.36688176,-70.70741053],
-  [-33.36458959,-70.84364381],
-  [-33.26774708,-70.67102005],
-  [-33.56604537,-70.75595766],
-  [-33.49439299,-70.6804113],
-  [-33.53111335,-70.79265962],
-  [-33.36333275,-70.84554883],
-  [-33.53321055,-70.79180842],
-  [-33.5290643,-70.75079035],
-  [-33.53419743,-70.85907517],
-  [-33.28588156,-70.7648976],
-  [-33.43741093,-70.57906607],
-  [-33.50639154,-70.49103681],
-  [-33.29041039,-70.71795326],
-  [-33.47788909,-70.5745962],
-  [-33.60809356,-70.6179285],
-  [-33.42600511,-70.66121499],
-  [-33.54008767,-70.67423702],
-  [-33.52452182,-70.72913977],
-  [-33.45376157,-70.47244223],
-  [-33.4440957,-70.47144367],
-  [-33.49408668,-70.85795673],
-  [-33.33181979,-70.73502611],
-  [-33.58634535,-70.54602976],
-  [-33.53582984,-70.71336538],
-  [-33.4540824,-70.68036953],
-  [-33.43157475,-70.47990384],
-  [-33.41067514,-70.73741621],
-  [-33.29753121,-70.74792769],
-  [-33.32788518,-70.5429242],
-  [-33.55349399,-70.56091625],
-  [-33.46149551,-70.86663599],
-  [-33.41495697,-70.59851912],
-  [-33.41002798,-70.63371209],
-  [-33.50299015,-70.59068942],
-  [-33.55755907,-70.83178499],
-  [-33.47791785,-70.6316996],
-  [-33.3197416,-70.52487633],
-  [-33.52306806,-70.49120427],
-  [-33.53472517,-70.69530745],
-  [-33.3339739,-70.52362392],
-  [-33.50667793,-70.81604594],
-  [-33.51709643,-70.77697546],
-  [-33.366076,-70.59409512],
-  [-33.35396911,-70.60756222],
-  [-33.32829618,-70.71074169],
-  [-33.60496201,-70.75680133],
-  [-33.52098887,-70.60889629],
-  [-33.45664704,-70.50188569],
-  [-33.27334675,-70.68501382],
-  [-33.40194501,-70.51120457],
-  [-33.5234359,-70.52005318],
-  [-33.49747726,-70.6896816],
-  [-33.39884427,-70.76675164],
-  [-33.56069723,-70.59399258],
-  [-33.55409386,-70.60681498],
-  [-33.31456623,-70.75040388],
-  [-33.53485651,-70.78829309],
-  [-33.48085084,-70.46369627],
-  [-33.59017672,-70.70706603],
-  [-33.35598601,-70.85127394],
-  [-33.31842537,-70.60747617],
-  [-33.53952139,-70.77588483],
-  [-33.39155944,-70.71391605],
-  [-33.50870253,-70.63612847],
-  [-33.44906702,-70.84088286],
-  [-33.54411663,-70.52825606],
-  [-33.40032343,-70.64177699],
-  [-33.57281063,-70.53594601],
-  [-33.51896424,-70.53387999],
-  [-33.58873571,-70.66138024],
-  [-33.41215377,-70.68829983],
-  [-33.37245215,-70.85119451],
-  [-33.39696754,-70.81766866],
-  [-33.4263461,-70.50389071],
-  [-33.43590814,-70.66430567],
-  [-33.28370401,-70.67731411],
-  [-33.33639679,-70.64937495],
-  [-33.29669379,-70.73186547],
-  [-33.40694805,-70.80452434],
-  [-33.58311793,-70.7855288],
-  [-33.56588056,-70.6386039],
-  [-33.39217324,-70.81997801],
-  [-33.50893363,-70.50720975],
-  [-33.60959988,-70.68273339],
-  [-33.32775166,-70.66205575],
-  [-33.41775695,-70.47534395],
-  [-33.50057352,-70.70135949],
-  [-33.40015623,-70.74022839],
-  [-33.49882199,-70.80755916],
-  [-33.47113376,-70.71942618],
-  [-33.35654258,-70.77455162],
-  [-33.39665558,-70.50377916],
-  [-33.47229336,-70.77150267],
-  [-33.57461349,-70.77122574],
-  [-33.39799967,-70.75625545],
-  [-33.36881222,-70.80480272],
-  [-33.51119427,-70.48388872],
-  [-33.4523355,-70.60250937],
-  [-33.42427962,-70.66053361],
-  [-33.30417727,-70.79624649],
-  [-33.58008544,-70.77964659],
-  [-33.3860742,-70.70912605],
-  [-33.44804827,-70.69034947],
-  [-33.29586217,-70.63997774],
-  [-33.47085015,-70.72333616],
-  [-33.34480124,-70.7980399],
-  [-33.34914262,-70.70619092],
-  [-33.59654556,-70.71415447],
-  [-33.37025374,-70.75254884],
-  [-33.51136733,-70.83569877],
-  [-33.56261591,-70.79359115],
-  [-33.5192586,-70.62433866],
-  [-33.54334002,-70.78038261],
-  [-33.59881475,-70.69947662],
-  [-33.34515108,-70.84968013],
-  [-33.60704609,-70.70350056],
-  [-33.44739315,-70.87304796],
-  [-33.30825034,-70.66378658],
-  [-33.44967442,-70.80431107],
-  [-33.53248124,-70.77990509],
-  [-33.41794914,-70.46308249],
-  [-33.43273132,-70.87027027],
-  [-33.46787181,-70.84595501],
-  [-33.61174111,-70.60464158],
-  [-33.49148871,-70.6378942],
-  [-33.41061576,-70.51271356],
-  [-33.31603137,-70.54066008],
-  [-33.43707966,-70.7852657],
-  [-33.41067721,-70.48110475],
-  [-33.58307669,-70.70027136],
-  [-33.33189344,-70.74461366],
-  [-33.53998683,-70.5897397],
-  [-33.55962219,-70.74801874],
-  [-33.28836635,-70.60262318],
-  [-33.39658425,-70.51717377],
-  [-33.46612841,-70.72461891],
-  [-33.58405189,-70.59408716],
-  [-33.57100358,-70.57449566],
-  [-33.37912503,-70.51375531],
-  [-33.53445807,-70.76833035],
-  [-33.41732348,-70.57899197],
-  [-33.40516412,-70.59330793],
-  [-33.41027556,-70.81005076],
-  [-33.42768132,-70.72993428],
-  [-33.37611793,-70.62527134],
-  [-33.40713266,-70.55798325],
-  [-33.38990182,-70.77281125],
-  [-33.32356423,-70.7325427],
-  [-33.43926264,-70.49431779],
-  [-33.41109963,-70.76928495],
-  [-33.57257546,-70.62027114],
-  [-33.47051208,-70.69081156],
-  [-33.40368399,-70.72210872],
-  [-33.41668596,-70.59382557],
-  [-33.46319739,-70.61713847],
-  [-33.32723011,-70.5646974],
-  [-33.44414595,-70.62607382],
-  [-33.28795358,-70.66211597],
-  [-33.45377229,-70.79373778],
-  [-33.59066607,-70.70542291],
-  [-33.37051822,-70.64347764],
-  [-33.52155812,-70.7179906],
-  [-33.36419093,-70.80647982],
-  [-33.40245832,-70.56433532],
-  [-33.4886124,-70.8240751],
-  [-33.52436839,-70.58137568],
-  [-33.5074733,-70.52797317],
-  [-33.50072343,-70.6756768],
-  [-33.49458258,-70.8438846],
-  [-33.46917722,-70.83563836],
-  [-33.49792031,-70.48370709],
-  [-33.27885603,-70.60339562],
-  [-33.53489015,-70.72768937],
-  [-33.34196789,-70.62009192],
-  [-33.47310964,-70.59257772],
-  [-33.31940696,-70.5929117],
-  [-33.36359266,-70.83178173],
-  [-33.57263197,-70.74129811],
-  [-33.49891864,-70.86466142],
-  [-33.40424844,-70.87114779],
-  [-33.54456157,-70.57231354],
-  [-33.49192738,-70.67531169],
-  [-33.50863518,-70.57835927],
-  [-33.40739881,-70.5901145],
-  [-33.53791309,-70.73364357],
-  [-33.4387451,-70.80035464],
-  [-33.55671971,-70.54152097],
-  [-33.36244607,-70.66193504],
-  [-33.42810223,-70.59312734],
-  [-33.60984404,-70.69927521],
-  [-33.2813427,-70.67255934],
-  [-33.58028574,-70.73149196],
-  [-33.33057126,-70.71224283],
-  [-33.47117087,-70.64334815],
-  [-33.41461391,-70.83028268],
-  [-33.32870903,-70.56755168],
-  [-33.3714252,-70.63423055],
-  [-33.53935265,-70.84206463],
-  [-33.50708308,-70.54104823],
-  [-33.42090403,-70.53101958],
-  [-33.46041816,-70.6716515],
-  [-33.5206036,-70.65242488],
-  [-33.376338,-70.76140528],
-  [-33.52423064,-70.55547847],
-  [-33.44944855,-70.87445853],
-  [-33.53523353,-70.65043853],
-  [-33.40456572,-70.86519714],
-  [-33.35851376,-70.49072394],
-  [-33.42969624,-70.73942221],
-  [-33.50250095,-70.47789341],
-  [-33.52609174,-70.52341151],
-  [-33.58636742,-70.62047799],
-  [-33.4493391,-70.59260026],
-  [-33.6098342,-70.74958978],
-  [-33.34630899,-70.58659162],
-  [-33.32829834,-70.59032793],
-  [-33.46440342,-70.86714367],
-  [-33.52929979,-70.52612824],
-  [-33.45885994,-70.88359949],
-  [-33.60787339,-70.63578465],
-  [-33.47003829,-70.78109077],
-  [-33.32993196,-70.61727137],
-  [-33.53100814,-70.62407479],
-  [-33.61384209,-70.69441255],
-  [-33.51554642,-70.75924581],
-  [-33.32340184,-70.81302178],
-  [-33.44666427,-70.52651538],
-  [-33.46253606,-70.59120627],
-  [-33.39617075,-70.8535782],
-  [-33.50275745,-70.86367128],
-  [-33.62143697,-70.68360616],
-  [-33.42345677,-70.64997337],
-  [-33.41830303,-70.82219257],
-  [-33.46771548,-70.87818414],
-  [-33.57438141,-70.7255982],
-  [-33.37016922,-70.75898884],
-  [-33.59593413,-70.77583738],
-  [-33.48708779,-70.56019293],
-  [-33.42328419,-70.87884925],
-  [-33.29821801,-70.69661244],
-  [-33.40735545,-70.50219905],
-  [-33.30111708,-70.63673165],
-  [-33.52536896,-70.81274559],
-  [-33.4334116,-70.56913488],
-  [-33.5109595,-70.70138841],
-  [-33.30328007,-70.67498586],
-  [-33.41783039,-70.71909334],
-  [-33.40383063,-70.83075568],
-  [-33.57530492,-70.67937647],
-  [-33.38900443,-70.67271541],
-  [-33.61680023,-70.61906438],
-  [-33.49557569,-70.65552423],
-  [-33.31871999,-70.76240428],
-  [-33.58080846,-70.75464659],
-  [-33.42398039,-70.52756656],
-  [-33.44078936,-70.52831648],
-  [-33.61618843,-70.67582308],
-  [-33.51924522,-70.48237922],
-  [-33.38608137,-70.58516375],
-  [-33.59695591,-70.58524986],
-  [-33.50456456,-70.54507641],
-  [-33.53994578,-70.72749228],
-  [-33.57148547,-70.60732074],
-  [-33.43931108,-70.69178978],
-  [-33.48390943,-70.79476015],
-  [-33.42724935,-70.7148988],
-  [-33.5239415,-70.81363174],
-  [-33.54577804,-70.71297559],
-  [-33.40925871,-70.67243897],
-  [-33.53684035,-70.53539689],
-  [-33.46504032,-70.59217014],
-  [-33.33253082,-70.6746527],
-  [-33.40633045,-70.82534155],
-  [-33.52157488,-70.60632311],
-  [-33.42414275,-70.48785307],
-  [-33.52542331,-70.49033159],
-  [-33.34873792,-70.76956507],
-  [-33.45578277,-70.84635015],
-  [-33.5288857,-70.82751493],
-  [-33.51834608,-70.59532845],
-  [-33.50939649,-70.69631835],
-  [-33.40493846,-70.61933995],
-  [-33.31470225,-70.61600552],
-  [-33.48677489,-70.57469044],
-  [-33.49681664,-70.67684015],
-  [-33.37607811,-70.5426179],
-  [-33.48379872,-70.50427517],
-  [-33.4655603,-70.51116552],
-  [-33.59889553,-70.65025158],
-  [-33.6195455,-70.70236428],
-  [-33.44819327,-70.76974401],
-  [-33.43671604,-70.82364464],
-  [-33.33448915,-70.67921348],
-  [-33.49066114,-70.60222195],
-  [-33.59809758,-70.72215587],
-  [-33.57635153,-70.73543891],
-  [-33.47632397,-70.65518109],
-  [-33.35362397,-70.72568051],
-  [-33.42626265,-70.7202106],
-  [-33.52190448,-70.77973918],
-  [-33.4070326,-70.6367357],
-  [-33.45262949,-70.62452262],
-  [-33.48065607,-70.69007317],
-  [-33.33548693,-70.57268423],
-  [-33.51221969,-70.49058451],
-  [-33.53587572,-70.77017354],
-  [-33.44902297,-70.82050285],
-  [-33.39113863,-70.76747327],
-  [-33.34587831,-70.68991454],
-  [-33.48343068,-70.49934738],
-  [-33.29198441,-70.70132411],
-  [-33.40028382,-70.51385159],
-  [-33.55992486,-70.56733417],
-  [-33.50136144,-70.73761109],
-  [-33.51166503,-70.51380452],
-  [-33.4890179,-70.74231575],
-  [-33.29072755,-70.72902919],
-  [-33.49505159,-70.84366194],
-  [-33.52689067,-70.57659623],
-  [-33.42398918,-70.76172707],
-  [-33.40403112,-70.8690113],
-  [-33.36755896,-70.6360843],
-  [-33.31149733,-70.81064411],
-  [-33.40814771,-70.58423406],
-  [-33.33321392,-70.53630132],
-  [-33.38966355,-70.56908745],
-  [-33.55212385,-70.66388657],
-  [-33.61128335,-70.74145403],
-  [-33.55317594,-70.50096253],
-  [-33.49558927,-70.87125286],
-  [-33.33494827,-70.58682577],
-  [-33.52808034,-70.81164049],
-  [-33.45699841,-70.5408031],
-  [-33.50952064,-70.52315109],
-  [-33.40914508,-70.53724191],
-  [-33.40058236,-70.70243639],
-  [-33.4135575,-70.50257646],
-  [-33.52218705,-70.66671532],
-  [-33.60640597,-70.67894398],
-  [-33.44075187,-70.70816905],
-  [-33.45475398,-70.7761976],
-  [-33.43945856,-70.86720233],
-  [-33.48252386,-70.63846894],
-  [-33.47658036,-70.60346932],
-  [-33.56331364,-70.82325059],
-  [-33.4308355,-70.55538057],
-  [-33.31588902,-70.77020232],
-  [-33.29143453,-70.62874702],
-  [-33.39582198,-70.65524933],
-  [-33.28449185,-70.72250584],
-  [-33.40955792,-70.74324244],
-  [-33.38463033,-70.64472256],
-  [-33.55043659,-70.5159068],
-  [-33.53037025,-70.50686883],
-  [-33.45369329,-70.852761],
-  [-33.39070255,-70.74760463],
-  [-33.41729163,-70.46855828],
-  [-33.46883616,-70.79396249],
-  [-33.41439855,-70.69333963],
-  [-33.30315879,-70.60162904],
-  [-33.41981601,-70.54857371],
-  [-33.36533087,-70.8589563],
-  [-33.2740948,-70.68401733],
-  [-33.3526583,-70.64038831],
-  [-33.27202385,-70.63115366],
-  [-33.34226832,-70.64660661],
-  [-33.38882747,-70.73561472],
-  [-33.53558793,-70.58074917],
-  [-33.53616711,-70.65508395],
-  [-33.41796089,-70.82367586],
-  [-33.51901555,-70.8129052],
-  [-33.4832256,-70.75855575],
-  [-33.32162896,-70.8253443],
-  [-33.35420158,-70.69076924],
-  [-33.39851928,-70.70860835],
-  [-33.52802197,-70.7065859],
-  [-33.50205487,-70.85254852],
-  [-33.46435638,-70.75809623],
-  [-33.52316364,-70.6081097],
-  [-33.31938484,-70.78847432],
-  [-33.45300541,-70.82602742],
-  [-33.38880335,-70.7276769],
-  [-33.48511774,-70.74236285],
-  [-33.41792015,-70.7203557],
-  [-33.52693673,-70.65441607],
-  [-33.27382221,-70.63632973],
-  [-33.40671998,-70.6870999],
-  [-33.47821265,-70.78929228],
-  [-33.42965307,-70.86575385],
-  [-33.44300222,-70.86444682],
-  [-33.5933521,-70.75043663],
-  [-33.34826967,-70.56314695],
-  [-33.48414476,-70.68040148],
-  [-33.29306943,-70.74219413],
-  [-33.32344402,-70.7176999],
-  [-33.36489657,-70.81285288],
-  [-33.46633206,-70.64112548],
-  [-33.62101063,-70.66423409],
-  [-33.45540512,-70.88812988],
-  [-33.5045039,-70.77348588],
-  [-33.59453833,-70.66422123],
-  [-33.31506178,-70.69821231],
-  [-33.42585538,-70.50719058],
-  [-33.41710207,-70.63038982],
-  [-33.55802132,-70.55765657],
-  [-33.59208948,-70.75915386],
-  [-33.31263431,-70.68862199],
-  [-33.34311846,-70.6604012],
-  [-33.29309023,-70.6898047],
-  [-33.41351991,-70.69685073],
-  [-33.51499111,-70.75264915],
-  [-33.36492339,-70.57233077],
-  [-33.59044269,-70.61508852],
-  [-33.2939028,-70.73891643],
-  [-33.35312787,-70.49833952],
-  [-33.423917,-70.55043983],
-  [-33.27751764,-70.67926814],
-  [-33.49066726,-70.69607579],
-  [-33.5519452,-70.6169376],
-  [-33.5548065,-70.52010501],
-  [-33.45989467,-70.78239727],
-  [-33.61206778,-70.62833636],
-  [-33.44272574,-70.7831249],
-  [-33.55643613,-70.73974497],
-  [-33.33651541,-70.57833429],
-  [-33.48970422,-70.49504239],
-  [-33.44438619,-70.76133328],
-  [-33.39797862,-70.48252758],
-  [-33.54374377,-70.76041368],
-  [-33.31349556,-70.70002565],
-  [-33.37660274,-70.54111933],
-  [-33.35065136,-70.60792829],
-  [-33.43528837,-70.6426689],
-  [-33.45717486,-70.75700054],
-  [-33.43050175,-70.78209395],
-  [-33.56880475,-70.63758376],
-  [-33.50258471,-70.5642479],
-  [-33.48409856,-70.70861057],
-  [-33.49388574,-70.65482883],
-  [-33.29912929,-70.65983635],
-  [-33.55076777,-70.8025516],
-  [-33.42516655,-70.54190434],
-  [-33.34462209,-70.79973339],
-  [-33.51766522,-70.67454329],
-  [-33.51399414,-70.68438785],
-  [-33.47613197,-70.69783434],
-  [-33.3720285,-70.52927464],
-  [-33.44764295,-70.49340049],
-  [-33.36832082,-70.73529028],
-  [-33.41733188,-70.60968769],
-  [-33.36963656,-70.57828222],
-  [-33.5005639,-70.8615818],
-  [-33.38012087,-70.78739296],
-  [-33.52365992,-70.63944222],
-  [-33.35771153,-70.85017897],
-  [-33.48922325,-70.47059786],
-  [-33.44689047,-70.61827701],
-  [-33.37927964,-70.64486934],
-  [-33.56360333,-70.62865714],
-  [-33.60257549,-70.57343059],
-  [-33.33916457,-70.63797258],
-  [-33.47458196,-70.49275111],
-  [-33.29715408,-70.65084463],
-  [-33.40802349,-70.5703804],
-  [-33.53496055,-70.79821399],
-  [-33.4166706,-70.71965012],
-  [-33.3751208,-70.77204164],
-  [-33.37909936,-70.61158851],
-  [-33.27835891,-70.73566231],
-  [-33.41070588,-70.69492268],
-  [-33.32663011,-70.75084281],
-  [-33.56974718,-70.59245442],
-  [-33.36073955,-70.69492141],
-  [-33.48577197,-70.78468704],
-  [-33.36997721,-70.5955955],
-  [-33.62106877,-70.67071357],
-  [-33.57049658,-70.68034691],
-  [-33.32572891,-70.78955408],
-  [-33.50350816,-70.824665],
-  [-33.50862534,-70.67238032],
-  [-33.5271257,-70.57603965],
-  [-33.42283963,-70.82925491],
-  [-33.57672908,-70.63679757],
-  [-33.39568105,-70.79673222],
-  [-33.38029635,-70.66238924],
-  [-33.32768118,-70.70665198],
-  [-33.47118275,-70.78123599],
-  [-33.51577985,-70.67733128],
-  [-33.28685501,-70.75271146],
-  [-33.27471987,-70.62186248],
-  [-33.54017608,-70.5215466],
-  [-33.46042761,-70.86917791],
-  [-33.48098028,-70.56904851],
-  [-33.46577812,-70.81061238],
-  [-33.35940229,-70.80186293],
-  [-33.41182561,-70.57346335],
-  [-33.47032008,-70.46067056],
-  [-33.56068156,-70.59645725],
-  [-33.5590636,-70.59572867],
-  [-33.31407516,-70.61112823],
-  [-33.29807131,-70.62763846],
-  [-33.42967015,-70.56664638],
-  [-33.35770822,-70.5346487],
-  [-33.35584214,-70.5044521],
-  [-33.41989271,-70.50075249],
-  [-33.57011007,-70.68749512],
-  [-33.45946612,-70.55716501],
-  [-33.40976173,-70.49973775],
-  [-33.57713041,-70.81905105],
-  [-33.59453404,-70.67952683],
-  [-33.51759668,-70.62129837],
-  [-33.49817499,-70.78123484],
-  [-33.5414299,-70.4987997],
-  [-33.55477898,-70.58859832],
-  [-33.43629871,-70.79657996],
-  [-33.41433675,-70.860503],
-  [-33.52258904,-70.57278729],
-  [-33.34538077,-70.83926387],
-  [-33.39849343,-70.86572727],
-  [-33.55099454,-70.7152541],
-  [-33.50925817,-70.82979567],
-  [-33.55596575,-70.54014266],
-  [-33.56950978,-70.6440999],
-  [-33.40240826,-70.76792634],
-  [-33.56385407,-70.83028564],
-  [-33.60254457,-70.6654062],
-  [-33.40428477,-70.47823355],
-  [-33.50374111,-70.77266063],
-  [-33.5565983,-70.56494335],
-  [-33.3273074,-70.54909511],
-  [-33.567155,-70.60419635],
-  [-33.50058615,-70.80874295],
-  [-33.47689864,-70.76950495],
-  [-33.41232498,-70.56208859],
-  [-33.29334908,-70.76030169],
-  [-33.48235986,-70.84322502],
-  [-33.50210976,-70.75447112],
-  [-33.45226861,-70.74937354],
-  [-33.29708519,-70.71342859],
-  [-33.31311234,-70.67809606],
-  [-33.44855033,-70.86112002],
-  [-33.47676143,-70.67034939],
-  [-33.36485096,-70.58764931],
-  [-33.285679,-70.58990412],
-  [-33.49855089,-70.75276093],
-  [-33.42324072,-70.74672905],
-  [-33.38748254,-70.66890211],
-  [-33.42694435,-70.51103876],
-  [-33.3579271,-70.83548533],
-  [-33.49052058,-70.72229799],
-  [-33.50345366,-70.68022375],
-  [-33.38412799,-70.51223069],
-  [-33.49265947,-70.521895],
-  [-33.53652766,-70.50619451],
-  [-33.45277482,-70.77467308],
-  [-33.3471638,-70.54081146],
-  [-33.45548865,-70.4733214],
-  [-33.39367783,-70.4736574],
-  [-33.32147491,-70.58743141],
-  [-33.55389042,-70.69709595],
-  [-33.52820984,-70.85009746],
-  [-33.48785473,-70.75489461],
-  [-33.43798665,-70.62274668],
-  [-33.43373042,-70.68312245],
-  [-33.54499241,-70.69111179],
-  [-33.48266888,-70.61109599],
-  [-33.51394245,-70.5414379],
-  [-33.50272636,-70.54972776],
-  [-33.57019147,-70.79810232],
-  [-33.3495935,-70.63410571],
-  [-33.36285703,-70.79855147],
-  [-33.59752865,-70.58264269],
-  [-33.40499666,-70.85394052],
-  [-33.37433319,-70.52253607],
-  [-33.32542667,-70.59533608],
-  [-33.6222336,-70.66580144],
-  [-33.47154171,-70.87308884],
-  [-33.34366099,-70.51125885],
-  [-33.33150462,-70.63675931],
-  [-33.46726537,-70.79776484],
-  [-33.4584094,-70.81949836],
-  [-33.46494195,-70.69084913],
-  [-33.56302029,-70.78909222],
-  [-33.53317136,-70.49160806],
-  [-33.40938857,-70.73728077],
-  [-33.42080706,-70.54132457],
-  [-33.56180228,-70.82847937],
-  [-33.52107241,-70.52885914],
-  [-33.28293656,-70.60014199],
-  [-33.44649397,-70.55433732],
-  [-33.33023721,-70.65812635],
-  [-33.61800869,-70.61351938],
-  [-33.50890898,-70.67892034],
-  [-33.53469281,-70.64164327],
-  [-33.34668092,-70.58229531],
-  [-33.49337232,-70.75074033],
-  [-33.60584671,-70.74596216],
-  [-33.51702426,-70.52746743],
-  [-33.41041354,-70.54893792],
-  [-33.32886068,-70.7991658],
-  [-33.30463286,-70.65317311],
-  [-33.35668102,-70.60477762],
-  [-33.52554732,-70.67065337],
-  [-33.52332875,-70.51716458],
-  [-33.3508713,-70.68599195],
-  [-33.36448477,-70.73534617],
-  [-33.46783663,-70.8716355],
-  [-33.33673565,-70.53541959],
-  [-33.31606942,-70.79166466],
-  [-33.48045448,-70.48312002],
-  [-33.43033083,-70.76157703],
-  [-33.37708339,-70.49096266],
-  [-33.37918768,-70.54779861],
-  [-33.41987452,-70.46991897],
-  [-33.46666325,-70.79282581],
-  [-33.56010088,-70.60812914],
-  [-33.48122575,-70.70860069],
-  [-33.48746682,-70.62918558],
-  [-33.49572229,-70.52910784],
-  [-33.52313292,-70.82832391],
-  [-33.50642856,-70.87721224],
-  [-33.41225978,-70.8827255],
-  [-33.40686463,-70.71919936],
-  [-33.42285013,-70.52045341],
-  [-33.54781855,-70.68511041],
-  [-33.53685151,-70.56365823],
-  [-33.44730935,-70.84566686],
-  [-33.3373036,-70.74946181],
-  [-33.43304551,-70.50365948],
-  [-33.52667237,-70.66180278],
-  [-33.32889632,-70.60098523],
-  [-33.50313989,-70.6409977],
-  [-33.41131604,-70.86372615],
-  [-33.35074127,-70.68845898],
-  [-33.31370253,-70.69095946],
-  [-33.40448532,-70.50811152],
-  [-33.44930107,-70.70253169],
-  [-33.4979396,-70.76398247],
-  [-33.49431757,-70.73192971],
-  [-33.47840351,-70.76293426],
-  [-33.47059124,-70.69014837],
-  [-33.49337152,-70.6045215],
-  [-33.52214491,-70.61137918],
-  [-33.33129795,-70.76017332],
-  [-33.35007865,-70.67916806],
-  [-33.54674602,-70.51146641],
-  [-33.6052053,-70.73315005],
-  [-33.57312457,-70.70782154],
-  [-33.41167163,-70.72340847],
-  [-33.57416613,-70.582617],
-  [-33.35391129,-70.51823815],
-  [-33.43339872,-70.86041693],
-  [-33.48406718,-70.66449396],
-  [-33.27877867,-70.66070487],
-  [-33.40295311,-70.65670887],
-  [-33.39177038,-70.48960133],
-  [-33.39648719,-70.49380213],
-  [-33.49043267,-70.62472146],
-  [-33.35832912,-70.5226978],
-  [-33.49674361,-70.57879668],
-  [-33.48127945,-70.62768638],
-  [-33.33138795,-70.62452609],
-  [-33.38457043,-70.71601812],
-  [-33.35644946,-70.53078964],
-  [-33.38682857,-70.47644311],
-  [-33.48912676,-70.6444673],
-  [-33.33839487,-70.73575351],
-  [-33.46797862,-70.62458088],
-  [-33.52815264,-70.57713345],
-  [-33.32179918,-70.68448446],
-  [-33.46392334,-70.60136422],
-  [-33.2755042,-70.67052133],
-  [-33.41579458,-70.62624125],
-  [-33.6196512,-70.72158444],
-  [-33.53939951,-70.63129363],
-  [-33.38101094,-70.57344133],
-  [-33.57871039,-70.75954351],
-  [-33.28385516,-70.73179486],
-  [-33.41930196,-70.80489603],
-  [-33.59501956,-70.57179537],
-  [-33.40849137,-70.63378163],
-  [-33.62055902,-70.7310508],
-  [-33.36927628,-70.58143128],
-  [-33.48093219,-70.61590526],
-  [-33.38909161,-70.61485043],
-  [-33.55823999,-70.61030738],
-  [-33.33660204,-70.5694755],
-  [-33.36322263,-70.61856182],
-  [-33.55908539,-70.64431471],
-  [-33.62159767,-70.62966737],
-  [-33.50836981,-70.7136346],
-  [-33.38617303,-70.6694099],
-  [-33.54666509,-70.57145334],
-  [-33.40067249,-70.53924885],
-  [-33.58188643,-70.59363025],
-  [-33.435974,-70.66299519],
-  [-33.28159829,-70.6647035],
-  [-33.51158375,-70.61997735],
-  [-33.33442004,-70.77951238],
-  [-33.37246537,-70.58934192],
-  [-33.45051505,-70.56568213],
-  [-33.37808042,-70.76318557],
-  [-33.59981624,-70.58053039],
-  [-33.47897681,-70.60254987],
-  [-33.57770537,-70.79747468],
-  [-33.49138951,-70.60930133],
-  [-33.47824007,-70.66627132],
-  [-33.36968314,-70.81222391],
-  [-33.47522437,-70.4666087],
-  [-33.60882771,-70.67638205],
-  [-33.28864378,-70.71702953],
-  [-33.32126866,-70.54506306],
-  [-33.42864854,-70.58722371],
-  [-33.6080952,-70.59961053],
-  [-33.43452173,-70.47600445],
-  [-33.5105409,-70.63159643],
-  [-33.39317387,-70.76739046],
-  [-33.46556419,-70.5352724],
-  [-33.5776318,-70.78207073],
-  [-33.5708553,-70.80633131],
-  [-33.44502577,-70.83849357],
-  [-33.57171483,-70.6104419],
-  [-33.3289945,-70.53752443],
-  [-33.43320298,-70.50037796],
-  [-33.53843087,-70.58423777],
-  [-33.59000138,-70.63633957],
-  [-33.58195852,-70.60340969],
-  [-33.48442137,-70.66298472],
-  [-33.55032296,-70.61480773],
-  [-33.48531726,-70.64122203],
-  [-33.5388691,-70.81274685],
-  [-33.47637256,-70.6915264],
-  [-33.55045978,-70.59655229],
-  [-33.47879438,-70.63883774],
-  [-33.28011926,-70.70723712],
-  [-33.54178921,-70.58636651],
-  [-33.41428813,-70.55173489],
-  [-33.3821097,-70.76765568],
-  [-33.36230695,-70.72442281],
-  [-33.52085371,-70.65534198],
-  [-33.542026,-70.49672874],
-  [-33.55683367,-70.80473742],
-  [-33.52164433,-70.60439785],
-  [-33.45387254,-70.82059494],
-  [-33.49913413,-70.85419926],
-  [-33.29508342,-70.56007433],
-  [-33.54107262,-70.59056722],
-  [-33.55134966,-70.72832469],
-  [-33.48076647,-70.67317817],
-  [-33.54346936,-70.71946811],
-  [-33.43699211,-70.65005382],
-  [-33.58508799,-70.78337423],
-  [-33.50772801,-70.58051269],
-  [-33.29792085,-70.69968708],
-  [-33.57488145,-70.59862424],
-  [-33.61420723,-70.68595597],
-  [-33.29268924,-70.7076634],
-  [-33.44699392,-70.71545561],
-  [-33.48798779,-70.77818777],
-  [-33.5663412,-70.72779184],
-  [-33.43211888,-70.8737951],
-  [-33.59042193,-70.694301],
-  [-33.43465182,-70.57704692],
-  [-33.58208886,-70.80112875],
-  [-33.44386043,-70.87408582],
-  [-33.51839985,-70.73210191],
-  [-33.40750345,-70.46699596],
-  [-33.39460598,-70.52207744],
-  [-33.45898572,-70.6851033],
-  [-33.37452553,-70.71285976],
-  [-33.56462603,-70.80354806],
-  [-33.52380963,-70.57394804],
-  [-33.37281262,-70.5074967],
-  [-33.60394281,-70.77679702],
-  [-33.59826806,-70.75787306],
-  [-33.34204015,-70.72229683],
-  [-33.33225565,-70.62042076],
-  [-33.48010875,-70.59904464],
-  [-33.40560798,-70.70989266],
-  [-33.51038006,-70.76430723],
-  [-33.34341695,-70.84525913],
-  [-33.3967494,-70.77980936],
-  [-33.53863857,-70.66380953],
-  [-33.26989151,-70.65059455],
-  [-33.44880981,-70.73354504],
-  [-33.41193237,-70.69532601],
-  [-33.30839944,-70.66211917],
-  [-33.29832627,-70.61529601],
-  [-33.49835843,-70.65565421],
-  [-33.43532846,-70.48495533],
-  [-33.36876494,-70.76943945],
-  [-33.50005384,-70.85389528],
-  [-33.53304791,-70.51848156],
-  [-33.48495015,-70.66597081],
-  [-33.49214973,-70.63410645],
-  [-33.48923865,-70.54839463],
-  [-33.37746633,-70.86895274],
-  [-33.57237169,-70.81636781],
-  [-33.55741093,-70.65785329],
-  [-33.62092066,-70.65082919],
-  [-33.34789147,-70.82124924],
-  [-33.42933564,-70.55446381],
-  [-33.34424713,-70.6026137],
-  [-33.48370578,-70.73813938],
-  [-33.48992933,-70.68883315],
-  [-33.59202684,-70.72427607],
-  [-33.31081467,-70.76673648],
-  [-33.43998579,-70.8097987],
-  [-33.49516603,-70.66467493],
-  [-33.51025804,-70.84924892],
-  [-33.55588425,-70.77186217],
-  [-33.45617532,-70.80335255],
-  [-33.37733164,-70.63034679],
-  [-33.36257525,-70.69395616],
-  [-33.45419125,-70.46835878],
-  [-33.40956875,-70.57042181],
-  [-33.46361596,-70.57096438],
-  [-33.5541538,-70.53984839],
-  [-33.32320961,-70.64530262],
-  [-33.36749301,-70.85855114],
-  [-33.5438822,-70.82060405],
-  [-33.4285876,-70.61214066],
-  [-33.42363071,-70.87586246],
-  [-33.37811766,-70.76648154],
-  [-33.56910082,-70.76654651],
-  [-33.52005032,-70.79397412],
-  [-33.53279145,-70.85490224],
-  [-33.32601682,-70.67551543],
-  [-33.41735726,-70.78407406],
-  [-33.45724164,-70.78969778],
-  [-33.30516757,-70.71791585],
-  [-33.59879236,-70.63276949],
-  [-33.51567242,-70.54609704],
-  [-33.3024186,-70.71110695],
-  [-33.43240375,-70.64471973],
-  [-33.45043252,-70.60559396],
-  [-33.32495389,-70.69326451],
-  [-33.40910117,-70.7236108],
-  [-33.27312605,-70.6928006],
-  [-33.45040545,-70.72331738],
-  [-33.46546713,-70.80276248],
-  [-33.48595093,-70.67772092],
-  [-33.52961285,-70.85381794],
-  [-33.27403564,-70.67219659],
-  [-33.55391983,-70.84285139],
-  [-33.56159133,-70.61726685],
-  [-33.35446129,-70.77012197],
-  [-33.40316283,-70.73526022],
-  [-33.31850235,-70.71363772],
-  [-33.34338726,-70.8327493],
-  [-33.39427198,-70.54718536],
-  [-33.47354001,-70.55976489],
-  [-33.5352555,-70.83804789],
-  [-33.5558673,-70.67169073],
-  [-33.35898805,-70.50066889],
-  [-33.39417601,-70.54369207],
-  [-33.50765837,-70.74818006],
-  [-33.30331748,-70.68327831],
-  [-33.32539349,-70.81557807],
-  [-33.43225235,-70.57458791],
-  [-33.43739682,-70.55419841],
-  [-33.58869358,-70.62991047],
-  [-33.30427696,-70.54580181],
-  [-33.39467783,-70.8549272],
-  [-33.34976525,-70.72810138],
-  [-33.54569316,-70.74971798],
-  [-33.58850009,-70.56066667],
-  [-33.54752897,-70.61409142],
-  [-33.37507815,-70.49321695],
-  [-33.60920158,-70.69791037],
-  [-33.62055271,-70.73080439],
-  [-33.46720922,-70.81087138],
-  [-33.50254604,-70.58542133],
-  [-33.35347104,-70.80221758],
-  [-33.37040491,-70.4951628],
-  [-33.45057836,-70.49323946],
-  [-33.35614337,-70.76567982],
-  [-33.6210458,-70.64038576],
-  [-33.40441887,-70.84168781],
-  [-33.34640524,-70.80471349],
-  [-33.42851074,-70.46347708],
-  [-33.4663398,-70.75263483],
-  [-33.31501592,-70.70913965],
-  [-33.447833,-70.74909752],
-  [-33.34348185,-70.6993323],
-  [-33.59940619,-70.71592098],
-  [-33.3945692,-70.69034343],
-  [-33.53708871,-70.63608049],
-  [-33.34072926,-70.67434814],
-  [-33.58202421,-70.5343115],
-  [-33.30315261,-70.70976421],
-  [-33.52944563,-70.70169664],
-  [-33.35972261,-70.71051561],
-  [-33.43001333,-70.69956202],
-  [-33.42575091,-70.69009983],
-  [-33.405145,-70.58365057],
-  [-33.32410202,-70.63907467],
-  [-33.44747005,-70.6538408],
-  [-33.55049266,-70.65720359],
-  [-33.34280426,-70.76324343],
-  [-33.55268642,-70.57833594],
-  [-33.58933969,-70.54295334],
-  [-33.46863932,-70.74466164],
-  [-33.62259379,-70.64999048],
-  [-33.31385601,-70.5989196],
-  [-33.54020116,-70.84442508],
-  [-33.32329853,-70.56995144],
-  [-33.58105937,-70.71238349],
-  [-33.45736143,-70.77921893],
-  [-33.29948914,-70.67311417],
-  [-33.57101527,-70.52109149],
-  [-33.40588334,-70.49875543],
-  [-33.35349364,-70.51526128],
-  [-33.5043246,-70.86098057],
-  [-33.36949502,-70.85197259],
-  [-33.57261938,-70.72118304],
-  [-33.53039086,-70.86363053],
-  [-33.50570514,-70.5931561],
-  [-33.33658022,-70.65535134],
-  [-33.30594596,-70.58703171],
-  [-33.54053765,-70.60666469],
-  [-33.51975509,-70.82963413],
-  [-33.36631516,-70.83487434],
-  [-33.48473581,-70.65818764],
-  [-33.37017878,-70.71681058],
-  [-33.33582581,-70.77042295],
-  [-33.47847931,-70.49260698],
-  [-33.46452488,-70.64180741],
-  [-33.53734994,-70.53859553],
-  [-33.58709536,-70.56704674],
-  [-33.54368411,-70.75008781],
-  [-33.47349884,-70.8121869],
-  [-33.52262161,-70.59207527],
-  [-33.55978599,-70.5666496],
-  [-33.3845797,-70.70407748],
-  [-33.54844558,-70.84688887],
-  [-33.60250728,-70.5855169],
-  [-33.29971123,-70.56708169],
-  [-33.50940148,-70.5213321],
-  [-33.4382591,-70.52140258],
-  [-33.42731686,-70.69031732],
-  [-33.54163211,-70.85055342],
-  [-33.40500336,-70.63356005],
-  [-33.46349646,-70.77003255],
-  [-33.47358484,-70.53386295],
-  [-33.52858919,-70.79880615],
-  [-33.36801292,-70.72924203],
-  [-33.4471338,-70.56666713],
-  [-33.31510699,-70.70801533],
-  [-33.38566119,-70.85938201],
-  [-33.52679733,-70.5610811],
-  [-33.58111262,-70.66058942],
-  [-33.54289824,-70.82817986],
-  [-33.50626558,-70.79574735],
-  [-33.2955011,-70.57119105],
-  [-33.31881273,-70.5543483],
-  [-33.31891513,-70.80599991],
-  [-33.49699913,-70.66251974],
-  [-33.51496895,-70.57197475],
-  [-33.3573726,-70.79859464],
-  [-33.53118813,-70.85850223],
-  [-33.43814154,-70.58593998],
-  [-33.60498674,-70.70543327],
-  [-33.32596611,-70.77538489],
-  [-33.4905668,-70.73324278],
-  [-33.40784268,-70.63900003],
-  [-33.36669699,-70.76475705],
-  [-33.3829325,-70.74188237],
-  [-33.46659295,-70.50590188],
-  [-33.50284894,-70.82313628],
-  [-33.46542768,-70.52221608],
-  [-33.56717349,-70.54743991],
-  [-33.39805612,-70.51865989],
-  [-33.4086549,-70.87720653],
-  [-33.49584547,-70.70054864],
-  [-33.51391805,-70.60177207],
-  [-33.49153159,-70.80354357],
-  [-33.59342157,-70.72580774],
-  [-33.43467832,-70.64118206],
-  [-33.45949361,-70.71727975],
-  [-33.55384467,-70.65063387],
-  [-33.31927633,-70.67201485],
-  [-33.55763346,-70.53448466],
-  [-33.54360894,-70.50119067],
-  [-33.55271023,-70.60014668],
-  [-33.36784627,-70.75955908],
-  [-33.37413155,-70.85876911],
-  [-33.54585882,-70.68619082],
-  [-33.4686001,-70.50293641],
-  [-33.34967528,-70.57404837],
-  [-33.30647112,-70.63663438],
-  [-33.40760209,-70.87103587],
-  [-33.39987212,-70.65776406],
-  [-33.33449969,-70.71226604],
-  [-33.59730575,-70.61330022],
-  [-33.29974587,-70.74979376],
-  [-33.57974425,-70.55468032],
-  [-33.42929899,-70.87052433],
-  [-33.47834798,-70.46558419],
-  [-33.60841118,-70.61671411],
-  [-33.45349056,-70.88072154],
-  [-33.36994843,-70.60922796],
-  [-33.54660551,-70.77645809],
-  [-33.41797945,-70.5515867],
-  [-33.59776821,-70.57532895],
-  [-33.55072448,-70.75495424],
-  [-33.43950645,-70.69088569],
-  [-33.56041273,-70.51512783],
-  [-33.32989187,-70.58994382],
-  [-33.53852566,-70.62088547],
-  [-33.54014428,-70.57842718],
-  [-33.52689636,-70.59520353],
-  [-33.52584637,-70.69555706],
-  [-33.55337779,-70.61104478],
-  [-33.52015836,-70.85745021],
-  [-33.56406718,-70.65743983],
-  [-33.40629676,-70.70366284],
-  [-33.52854111,-70.60922027],
-  [-33.50986588,-70.68093878],
-  [-33.58846399,-70.7622523],
-  [-33.39103563,-70.70052952],
-  [-33.56938336,-70.76520821],
-  [-33.47126427,-70.49552971],
-  [-33.41103919,-70.49933435],
-  [-33.42956121,-70.76930929],
-  [-33.42246626,-70.74310276],
-  [-33.52361238,-70.69686442],
-  [-33.54081251,-70.4987797],
-  [-33.41068108,-70.55430316],
-  [-33.48071784,-70.75616204],
-  [-33.31185887,-70.71382045],
-  [-33.60032217,-70.62375372],
-  [-33.52750257,-70.65852085],
-  [-33.32672121,-70.69221159],
-  [-33.39394794,-70.68303137],
-  [-33.56478601,-70.7478769],
-  [-33.38817624,-70.64574012],
-  [-33.40452713,-70.82647195],
-  [-33.43519607,-70.65154525],
-  [-33.5847285,-70.71061141],
-  [-33.47703188,-70.79258501],
-  [-33.29110175,-70.58907161],
-  [-33.54165205,-70.52239617],
-  [-33.34649825,-70.52303466],
-  [-33.33021003,-70.80608844],
-  [-33.56492921,-70.52189866],
-  [-33.30455682,-70.67178499],
-  [-33.41409498,-70.59041662],
-  [-33.31300643,-70.80328278],
-  [-33.51270293,-70.8444262],
-  [-33.54421937,-70.49882403],
-  [-33.34726648,-70.63234216],
-  [-33.45610381,-70.77004962],
-  [-33.46276182,-70.81315178],
-  [-33.45853839,-70.54030975],
-  [-33.35066675,-70.49482119],
-  [-33.31493441,-70.55434944],
-  [-33.46403623,-70.69056379],
-  [-33.42042206,-70.51993688],
-  [-33.49045512,-70.75012641],
-  [-33.46624929,-70.70519618],
-  [-33.33204874,-70.62287256],
-  [-33.42139517,-70.52618028],
-  [-33.58222459,-70.74941998],
-  [-33.51955801,-70.68785079],
-  [-33.56078281,-70.75077264],
-  [-33.40225025,-70.51920487],
-  [-33.41504962,-70.49534819],
-  [-33.48178347,-70.86547563],
-  [-33.44923071,-70.48996301],
-  [-33.49300229,-70.5705504],
-  [-33.27984554,-70.60776487],
-  [-33.33493734,-70.83370906],
-  [-33.47361721,-70.50501197],
-  [-33.59735518,-70.70738292],
-  [-33.47467554,-70.57856475],
-  [-33.50614521,-70.81235028],
-  [-33.3324252,-70.6281355],
-  [-33.46960182,-70.62639713],
-  [-33.460114,-70.60613022],
-  [-33.32928186,-70.65995405],
-  [-33.29007007,-70.70911268],
-  [-33.37209128,-70.78407424],
-  [-33.53130743,-70.76024063],
-  [-33.46732307,-70.56254241],
-  [-33.45451091,-70.68771748],
-  [-33.35039077,-70.76223286],
-  [-33.57902365,-70.79179611],
-  [-33.47284317,-70.56102131],
-  [-33.2963795,-70.69255135],
-  [-33.42266382,-70.68617259],
-  [-33.52523392,-70.78641827],
-  [-33.35990669,-70.57449817],
-  [-33.37302564,-70.480256],
-  [-33.5018195,-70.8236369],
-  [-33.47956507,-70.81225023],
-  [-33.43333098,-70.62612453],
-  [-33.34776467,-70.69921696],
-  [-33.52956577,-70.62333434],
-  [-33.32580188,-70.60571303],
-  [-33.33365162,-70.5488365],
-  [-33.30485684,-70.55072305],
-  [-33.50915237,-70.73092481],
-  [-33.36829624,-70.58478147],
-  [-33.43993401,-70.55515807],
-  [-33.61788662,-70.63034112],
-  [-33.35192339,-70.50452685],
-  [-33.30744884,-70.62152866],
-  [-33.49448803,-70.65918777],
-  [-33.45745528,-70.47763072],
-  [-33.5059877,-70.67808819],
-  [-33.41176499,-70.56989606],
-  [-33.38065025,-70.50745915],
-  [-33.36461895,-70.61078586],
-  [-33.45185084,-70.77721803],
-  [-33.29465773,-70.64438923],
-  [-33.35508752,-70.73207597],
-  [-33.4373066,-70.81998674],
-  [-33.41948274,-70.81402326],
-  [-33.29713283,-70.58393681],
-  [-33.41003349,-70.64231444],
-  [-33.58926737,-70.56701702],
-  [-33.56726816,-70.62450294],
-  [-33.31896075,-70.75409698],
-  [-33.37307186,-70.56956561],
-  [-33.31959053,-70.59177819],
-  [-33.44201394,-70.75371989],
-  [-33.34702486,-70.5056795],
-  [-33.40375184,-70.56781663],
-  [-33.59860985,-70.57896346],
-  [-33.49709761,-70.84276661],
-  [-33.38958931,-70.64777044],
-  [-33.60881631,-70.63806133],
-  [-33.28499513,-70.75873129],
-  [-33.48107628,-70.48130885],
-  [-33.30821559,-70.80860142],
-  [-33.45677199,-70.56658745],
-  [-33.61536752,-70.62987255],
-  [-33.41143592,-70.62371027],
-  [-33.56963915,-70.5620541],
-  [-33.48412967,-70.54364193],
-  [-33.53860564,-70.74026065],
-  [-33.46547451,-70.87550466],
-  [-33.58627835,-70.58069642],
-  [-33.60123741,-70.74344277],
-  [-33.29097261,-70.57875909],
-  [-33.48284257,-70.81593409],
-  [-33.41092151,-70.79063659],
-  [-33.46533746,-70.65619175],
-  [-33.62495406,-70.6979326],
-  [-33.47970885,-70.69840614],
-  [-33.52051327,-70.78813803],
-  [-33.30025638,-70.64428522],
-  [-33.41118436,-70.73941863],
-  [-33.52425252,-70.50363524],
-  [-33.29160483,-70.59464585],
-  [-33.52499946,-70.64696683],
-  [-33.55197308,-70.62986692],
-  [-33.2794685,-70.65733175],
-  [-33.42730017,-70.62512631],
-  [-33.34454796,-70.66038678],
-  [-33.37938288,-70.4919218],
-  [-33.45945329,-70.49606884],
-  [-33.41930519,-70.64647428],
-  [-33.27335248,-70.70300843],
-  [-33.5472552,-70.65860298],
-  [-33.41398397,-70.78042918],
-  [-33.35808459,-70.78136738],
-  [-33.5262019,-70.83659895],
-  [-33.36977286,-70.5855082],
-  [-33.60170848,-70.66663055],
-  [-33.53434326,-70.64340668],
-  [-33.48202062,-70.71355454],
-  [-33.55231754,-70.61751763],
-  [-33.56518097,-70.77482807],
-  [-33.50525792,-70.85466864],
-  [-33.3938623,-70.65661092],
-  [-33.39647404,-70.58281616],
-  [-33.53299142,-70.67559751],
-  [-33.4244845,-70.57277712],
-  [-33.42678658,-70.82666888],
-  [-33.49302402,-70.55067954],
-  [-33.42825399,-70.79828332],
-  [-33.55698422,-70.64220372],
-  [-33.41014586,-70.71363923],
-  [-33.44108419,-70.4640788],
-  [-33.28980036,-70.710602],
-  [-33.4293834,-70.67841631],
-  [-33.45517577,-70.7521096],
-  [-33.29043751,-70.65983053],
-  [-33.27178415,-70.67107474],
-  [-33.4111388,-70.529677],
-  [-33.59692504,-70.55645884],
-  [-33.34508256,-70.49996899],
-  [-33.49245578,-70.49071068],
-  [-33.30885779,-70.60144213],
-  [-33.40501453,-70.8184981],
-  [-33.39940849,-70.55716702],
-  [-33.33127979,-70.61515627],
-  [-33.47182035,-70.74357237],
-  [-33.39000248,-70.78770968],
-  [-33.52209608,-70.5848262],
-  [-33.4048781,-70.59960162],
-  [-33.41097222,-70.83356658],
-  [-33.44688742,-70.76655828],
-  [-33.38397144,-70.50932902],
-  [-33.29856352,-70.75351909],
-  [-33.38643102,-70.65222867],
-  [-33.38187102,-70.53919647],
-  [-33.42645459,-70.88462633],
-  [-33.49417736,-70.58712833],
-  [-33.27827101,-70.61334859],
-  [-33.2995813,-70.74223737],
-  [-33.42597097,-70.71054075],
-  [-33.32608033,-70.71263058],
-  [-33.35152392,-70.84533816],
-  [-33.39801358,-70.7921603],
-  [-33.38613599,-70.85412306],
-  [-33.4051151,-70.59882633],
-  [-33.49780452,-70.81013011],
-  [-33.40562854,-70.59891451],
-  [-33.31743631,-70.76332368],
-  [-33.54844163,-70.50642366],
-  [-33.58015504,-70.68784477],
-  [-33.3605345,-70.55826624],
-  [-33.50962159,-70.50038721],
-  [-33.38436602,-70.48107871],
-  [-33.26870021,-70.65560923],
-  [-33.45264753,-70.5048973],
-  [-33.38717563,-70.66085586],
-  [-33.49818399,-70.77699289],
-  [-33.31522064,-70.63621239],
-  [-33.49416336,-70.58098743],
-  [-33.56440439,-70.79632395],
-  [-33.59727562,-70.62489575],
-  [-33.38968001,-70.8732114],
-  [-33.50628205,-70.77477742],
-  [-33.46537787,-70.70561332],
-  [-33.58300028,-70.66287166],
-  [-33.38954184,-70.72017312],
-  [-33.34234297,-70.76574349],
-  [-33.48799439,-70.64519086],
-  [-33.49647717,-70.47784893],
-  [-33.37531422,-70.80010377],
-  [-33.45854666,-70.80644516],
-  [-33.44102753,-70.67732978],
-  [-33.60508644,-70.71723695],
-  [-33.60100041,-70.76844158],
-  [-33.43811587,-70.7157655],
-  [-33.43231649,-70.78305237],
-  [-33.28267042,-70.61476738],
-  [-33.29823304,-70.76147145],
-  [-33.41161215,-70.84290278],
-  [-33.449084,-70.62378272],
-  [-33.59332151,-70.6964733],
-  [-33.45700249,-70.57149824],
-  [-33.4771979,-70.75837349],
-  [-33.40409228,-70.69364278],
-  [-33.42652778,-70.61035869],
-  [-33.38369098,-70.52973437],
-  [-33.36390852,-70.77063298],
-  [-33.37491843,-70.79264469],
-  [-33.48129602,-70.75963667],
-  [-33.39269137,-70.8381598],
-  [-33.34219324,-70.57226429],
-  [-33.41395078,-70.48784322],
-  [-33.37412488,-70.86877426],
-  [-33.5050731,-70.64263433],
-  [-33.56981565,-70.78355674],
-  [-33.51938049,-70.64619649],
-  [-33.42129818,-70.62131454],
-  [-33.32018287,-70.67252783],
-  [-33.40935908,-70.70470625],
-  [-33.38668535,-70.62757002],
-  [-33.36997461,-70.63334663],
-  [-33.3504605,-70.57810618],
-  [-33.2984601,-70.67819168],
-  [-33.35470739,-70.70460245],
-  [-33.46934723,-70.48952905],
-  [-33.44321369,-70.76778874],
-  [-33.36154031,-70.58103029],
-  [-33.51735881,-70.5913559],
-  [-33.57734394,-70.82176341],
-  [-33.58757904,-70.68918288],
-  [-33.30194254,-70.6289366],
-  [-33.50724609,-70.57333189],
-  [-33.36374542,-70.67715999],
-  [-33.31179445,-70.61575672],
-  [-33.38011804,-70.71213911],
-  [-33.5757795,-70.60158341],
-  [-33.33502729,-70.53447067],
-  [-33.5005125,-70.78618136],
-  [-33.44954558,-70.84754325],
-  [-33.48049485,-70.88396331],
-  [-33.28451773,-70.72764662],
-  [-33.32729237,-70.77961513],
-  [-33.40497193,-70.82533135],
-  [-33.32363361,-70.53578493],
-  [-33.43874027,-70.85850219],
-  [-33.53362739,-70.62424525],
-  [-33.40748183,-70.79069699],
-  [-33.55157227,-70.62133408],
-  [-33.54445081,-70.52535104],
-  [-33.44349075,-70.88824369],
-  [-33.43892736,-70.87948087],
-  [-33.42893812,-70.62722446],
-  [-33.3372224,-70.66538052],
-  [-33.40681823,-70.74415537],
-  [-33.35042977,-70.6916366],
-  [-33.41432887,-70.61621942],
-  [-33.41236494,-70.61613079],
-  [-33.30681578,-70.69471223],
-  [-33.52326724,-70.7325465],
-  [-33.55089752,-70.66211705],
-  [-33.47745954,-70.72305052],
-  [-33.53870362,-70.59706726],
-  [-33.36577078,-70.63132746],
-  [-33.53002752,-70.6044663],
-  [-33.33216248,-70.59264285],
-  [-33.35225342,-70.78476834],
-  [-33.43145556,-70.47318049],
-  [-33.46436423,-70.47237824],
-  [-33.50968223,-70.83517211],
-  [-33.36681467,-70.79043912],
-  [-33.41017443,-70.60218578],
-  [-33.4370685,-70.71467456],
-  [-33.52555894,-70.5956233],
-  [-33.37744937,-70.48601831],
-  [-33.51472184,-70.81683042],
-  [-33.35776411,-70.5639734],
-  [-33.52420225,-70.78964467],
-  [-33.54295691,-70.56949678],
-  [-33.36160669,-70.74867458],
-  [-33.45153497,-70.84264517],
-  [-33.41604149,-70.80409684],
-  [-33.43054514,-70.6512055],
-  [-33.57291799,-70.72152997],
-  [-33.45463002,-70.54687486],
-  [-33.53424715,-70.49521623],
-  [-33.58842078,-70.63989439],
-  [-33.31766605,-70.80820681],
-  [-33.46448704,-70.86157334],
-  [-33.47306819,-70.5096379],
-  [-33.42844825,-70.53970643],
-  [-33.54714454,-70.77131301],
-  [-33.53536976,-70.70723683],
-  [-33.55038042,-70.71537466],
-  [-33.3488554,-70.79069755],
-  [-33.35245581,-70.51377303],
-  [-33.32939167,-70.82783277],
-  [-33.54350596,-70.49327236],
-  [-33.53830847,-70.54876538],
-  [-33.53798559,-70.69730174],
-  [-33.46891679,-70.65691913],
-  [-33.51215421,-70.52275133],
-  [-33.46561412,-70.70283736],
-  [-33.50477665,-70.77640777],
-  [-33.38667923,-70.62374735],
-  [-33.61708769,-70.65667957],
-  [-33.41747285,-70.5331384],
-  [-33.3437512,-70.65111941],
-  [-33.44000851,-70.87335772],
-  [-33.37975178,-70.6119974],
-  [-33.34230469,-70.56824089],
-  [-33.60905089,-70.74685492],
-  [-33.50264293,-70.72969887],
-  [-33.35303023,-70.72574332],
-  [-33.42583012,-70.51682397],
-  [-33.34328559,-70.71904484],
-  [-33.39319841,-70.57612572],
-  [-33.54428767,-70.83188205],
-  [-33.33182394,-70.60891146],
-  [-33.42393328,-70.57052944],
-  [-33.4562528,-70.83385127],
-  [-33.29729599,-70.67598611],
-  [-33.38618121,-70.50450966],
-  [-33.43678693,-70.56561051],
-  [-33.54990614,-70.59906261],
-  [-33.39773487,-70.83553498],
-  [-33.46599939,-70.7868378],
-  [-33.54270789,-70.85154857],
-  [-33.51704094,-70.64209804],
-  [-33.56827805,-70.72886286],
-  [-33.43454879,-70.60871471],
-  [-33.42430829,-70.53110761],
-  [-33.47076561,-70.53197875],
-  [-33.53521646,-70.69392748],
-  [-33.50709284,-70.781634],
-  [-33.48098113,-70.80966718],
-  [-33.38897805,-70.59337964],
-  [-33.46128949,-70.65697048],
-  [-33.39651911,-70.70589451],
-  [-33.37180618,-70.80795015],
-  [-33.44046529,-70.71159256],
-  [-33.3757768,-70.69242825],
-  [-33.49500854,-70.55092797],
-  [-33.49003062,-70.63604314],
-  [-33.51158807,-70.58830992],
-  [-33.57504939,-70.73117945],
-  [-33.3535651,-70.82205769],
-  [-33.5634526,-70.53605079],
-  [-33.40170376,-70.85016909],
-  [-33.40222992,-70.81615646],
-  [-33.46272526,-70.75596596],
-  [-33.47917158,-70.74643776],
-  [-33.34801078,-70.74209167],
-  [-33.35920685,-70.589009],
-  [-33.51369724,-70.76421793],
-  [-33.52027266,-70.70318932],
-  [-33.54549783,-70.58704138],
-  [-33.53474844,-70.85235272],
-  [-33.37671309,-70.58817427],
-  [-33.30488242,-70.58469154],
-  [-33.54225879,-70.81733749],
-  [-33.35208676,-70.80493123],
-  [-33.34860259,-70.60326137],
-  [-33.52821088,-70.55999634],
-  [-33.51638112,-70.74914572],
-  [-33.41299134,-70.84626328],
-  [-33.33020377,-70.64552124],
-  [-33.44799035,-70.51938593],
-  [-33.31392103,-70.53674061],
-  [-33.38990585,-70.56030484],
-  [-33.50684378,-70.86598963],
-  [-33.41530442,-70.54522756],
-  [-33.49857186,-70.8514775],
-  [-33.58697212,-70.68747869],
-  [-33.52628517,-70.55203727],
-  [-33.51678431,-70.67861875],
-  [-33.53952041,-70.58291431],
-  [-33.31439018,-70.71263493],
-  [-33.45756996,-70.55434472],
-  [-33.48924089,-70.7369384],
-  [-33.53574391,-70.50545119],
-  [-33.49665879,-70.87597005],
-  [-33.36221381,-70.76668632],
-  [-33.57863966,-70.70018956],
-  [-33.57891987,-70.74281741],
-  [-33.41235917,-70.85324414],
-  [-33.48349199,-70.64182646],
-  [-33.60511255,-70.66623981],
-  [-33.62595071,-70.69038349],
-  [-33.55483685,-70.81078365],
-  [-33.47702593,-70.6982291],
-  [-33.3240723,-70.56403179],
-  [-33.5894235,-70.7921863],
-  [-33.35378852,-70.55308762],
-  [-33.48986255,-70.68576457],
-  [-33.49395397,-70.82239047],
-  [-33.28796503,-70.59072791],
-  [-33.44004142,-70.61399283],
-  [-33.51851944,-70.55031477],
-  [-33.53909615,-70.61534734],
-  [-33.50312431,-70.79087853],
-  [-33.48859019,-70.61247649],
-  [-33.48236355,-70.83011717],
-  [-33.5211787,-70.71120499],
-  [-33.53745844,-70.72057144],
-  [-33.37766445,-70.72647939],
-  [-33.45385089,-70.56519836],
-  [-33.47570007,-70.54720416],
-  [-33.33844179,-70.65087619],
-  [-33.50580783,-70.58060212],
-  [-33.27990001,-70.73107353],
-  [-33.37125026,-70.51695745],
-  [-33.59074688,-70.64676786],
-  [-33.6261915,-70.68228529],
-  [-33.34021202,-70.72978292],
-  [-33.4039684,-70.70666835],
-  [-33.44074317,-70.72677089],
-  [-33.42572691,-70.48987434],
-  [-33.50580349,-70.50917838],
-  [-33.56313135,-70.79566312],
-  [-33.31740794,-70.66751894],
-  [-33.41014948,-70.79913956],
-  [-33.41216372,-70.61025569],
-  [-33.46248287,-70.84309954],
-  [-33.42348487,-70.50461357],
-  [-33.35531474,-70.68354477],
-  [-33.35897039,-70.55914268],
-  [-33.40101872,-70.61943226],
-  [-33.53466362,-70.71684342],
-  [-33.48601574,-70.67511195],
-  [-33.49493722,-70.52995484],
-  [-33.3900485,-70.68030688],
-  [-33.37080735,-70.84801699],
-  [-33.37325199,-70.53155465],
-  [-33.50408791,-70.54118785],
-  [-33.30903499,-70.7142759],
-  [-33.5035193,-70.73717995],
-  [-33.39229775,-70.63352792],
-  [-33.57547778,-70.5831269],
-  [-33.40934336,-70.59227617],
-  [-33.38609811,-70.58802611],
-  [-33.41139191,-70.65461762],
-  [-33.46626777,-70.76962993],
-  [-33.44040262,-70.80811298],
-  [-33.48063444,-70.86006862],
-  [-33.3600965,-70.69854625],
-  [-33.61877779,-70.62022513],
-  [-33.4017021,-70.82973714],
-  [-33.35287974,-70.60893934],
-  [-33.37060935,-70.6338244],
-  [-33.51722712,-70.54037192],
-  [-33.53443484,-70.56501027],
-  [-33.28867288,-70.64042636],
-  [-33.3758839,-70.67476614],
-  [-33.54349988,-70.68812879],
-  [-33.50929971,-70.73805912],
-  [-33.53811099,-70.70616336],
-  [-33.50849623,-70.78664262],
-  [-33.55582182,-70.71057694],
-  [-33.53230926,-70.62638587],
-  [-33.43407419,-70.72828231],
-  [-33.40858427,-70.80938802],
-  [-33.58512708,-70.64480642],
-  [-33.50221661,-70.5471287],
-  [-33.45265642,-70.53816462],
-  [-33.57916529,-70.75117977],
-  [-33.32452165,-70.66314178],
-  [-33.40090868,-70.48069409],
-  [-33.43612101,-70.53851414],
-  [-33.41614483,-70.52066971],
-  [-33.52448122,-70.49985486],
-  [-33.40035841,-70.82704548],
-  [-33.36253493,-70.75084809],
-  [-33.61976111,-70.6683232],
-  [-33.60284724,-70.72029165],
-  [-33.54960375,-70.55204562],
-  [-33.47772743,-70.8104965],
-  [-33.47897163,-70.65593764],
-  [-33.53921747,-70.60447815],
-  [-33.54059097,-70.69444346],
-  [-33.40610563,-70.81715911],
-  [-33.61787786,-70.70080614],
-  [-33.29891693,-70.67522182],
-  [-33.58951844,-70.703404],
-  [-33.36123851,-70.5469518],
-  [-33.36967852,-70.60012326],
-  [-33.32224528,-70.68823755],
-  [-33.44017375,-70.51823853],
-  [-33.56146349,-70.56721887],
-  [-33.43377203,-70.87669612],
-  [-33.36990732,-70.55226921],
-  [-33.40578964,-70.8000202],
-  [-33.30691805,-70.80008401],
-  [-33.33667892,-70.72855422],
-  [-33.28707433,-70.67903221],
-  [-33.57377934,-70.65695161],
-  [-33.30099531,-70.69236904],
-  [-33.48949979,-70.82223828],
-  [-33.49899122,-70.48787752],
-  [-33.30806397,-70.68862763],
-  [-33.56335775,-70.62837943],
-  [-33.40952947,-70.52854454],
-  [-33.55106732,-70.54980116],
-  [-33.43925489,-70.59940066],
-  [-33.33327556,-70.51201664],
-  [-33.61783535,-70.6263798],
-  [-33.59112601,-70.78752832],
-  [-33.37852257,-70.61866428],
-  [-33.35344204,-70.74995421],
-  [-33.52834794,-70.80124819],
-  [-33.41625329,-70.60410977],
-  [-33.34317598,-70.52236288],
-  [-33.37776767,-70.72509365],
-  [-33.39226326,-70.47230095],
-  [-33.4085458,-70.69960224],
-  [-33.56441882,-70.76139307],
-  [-33.39287073,-70.5772659],
-  [-33.37679975,-70.74758332],
-  [-33.50362733,-70.77329476],
-  [-33.47318485,-70.85742963],
-  [-33.40956968,-70.54997138],
-  [-33.4592018,-70.80635992],
-  [-33.56163809,-70.8109906],
-  [-33.52946577,-70.71228072],
-  [-33.4016583,-70.6979882],
-  [-33.43699298,-70.54522364],
-  [-33.3807486,-70.71212027],
-  [-33.30303155,-70.75199142],
-  [-33.51369157,-70.76556112],
-  [-33.51375606,-70.49235677],
-  [-33.60715086,-70.65170297],
-  [-33.46921887,-70.55636202],
-  [-33.48756665,-70.54638165],
-  [-33.53823564,-70.85259086],
-  [-33.45677838,-70.82384548],
-  [-33.5552632,-70.75063252],
-  [-33.52348275,-70.78141301],
-  [-33.60348642,-70.74684971],
-  [-33.55309243,-70.52599954],
-  [-33.41168544,-70.74287801],
-  [-33.55928378,-70.81110987],
-  [-33.60331887,-70.73732825],
-  [-33.35033208,-70.67001584],
-  [-33.5711762,-70.59246012],
-  [-33.5039117,-70.65518088],
-  [-33.42024505,-70.81536917],
-  [-33.36834057,-70.51249706],
-  [-33.56545961,-70.68244475],
-  [-33.5087062,-70.77873399],
-  [-33.56933192,-70.55276409],
-  [-33.48627707,-70.52323926],
-  [-33.59989441,-70.5787215],
-  [-33.41855754,-70.56805731],
-  [-33.38622316,-70.54012216],
-  [-33.46257621,-70.86366364],
-  [-33.50101209,-70.48161414],
-  [-33.414435,-70.59690696],
-  [-33.57901588,-70.55997656],
-  [-33.54343567,-70.58944891],
-  [-33.31893398,-70.61015007],
-  [-33.42442234,-70.71663078],
-  [-33.45094337,-70.55301346],
-  [-33.55674594,-70.80983398],
-  [-33.40422076,-70.79525614],
-  [-33.55923052,-70.774595],
-  [-33.51276793,-70.48427786],
-  [-33.48381668,-70.70690556],
-  [-33.57334856,-70.52110702],
-  [-33.39569152,-70.85124489],
-  [-33.45282836,-70.8084761],
-  [-33.38097956,-70.86157203],
-  [-33.46368909,-70.47495316],
-  [-33.45935079,-70.85679195],
-  [-33.55699192,-70.80746876],
-  [-33.33849568,-70.74431488],
-  [-33.52519245,-70.63380674],
-  [-33.2963906,-70.60778166],
-  [-33.51060071,-70.83282938],
-  [-33.51471496,-70.76792116],
-  [-33.48693854,-70.77786497],
-  [-33.45887836,-70.73271121],
-  [-33.55818682,-70.71883402],
-  [-33.48437916,-70.79928921],
-  [-33.39908775,-70.50372509],
-  [-33.55407274,-70.63013808],
-  [-33.45397147,-70.74883603],
-  [-33.5608325,-70.55911881],
-  [-33.32456087,-70.56385156],
-  [-33.53516876,-70.53091583],
-  [-33.53714373,-70.77543171],
-  [-33.40202535,-70.57421784],
-  [-33.59127682,-70.65686138],
-  [-33.52432824,-70.76220679],
-  [-33.41217391,-70.6427437],
-  [-33.42580971,-70.63339232],
-  [-33.52763965,-70.85198335],
-  [-33.39261324,-70.68719257],
-  [-33.32764858,-70.59892385],
-  [-33.55177807,-70.57917942],
-  [-33.42970946,-70.61714126],
-  [-33.34535912,-70.76533495],
-  [-33.45524585,-70.54384043],
-  [-33.42547486,-70.81404013],
-  [-33.32044027,-70.6997203],
-  [-33.36582961,-70.49392299],
-  [-33.5623444,-70.63620209],
-  [-33.3153164,-70.78635626],
-  [-33.46914324,-70.61800194],
-  [-33.30913148,-70.80243147],
-  [-33.305802,-70.5837699],
-  [-33.51588647,-70.5874423],
-  [-33.3740015,-70.81098734],
-  [-33.35551307,-70.79356236],
-  [-33.30083341,-70.61651375],
-  [-33.55532065,-70.58456389],
-  [-33.36213943,-70.56473259],
-  [-33.45515187,-70.67842766],
-  [-33.42017953,-70.82757981],
-  [-33.46995214,-70.74967494],
-  [-33.35843911,-70.53948776],
-  [-33.42094506,-70.80640683],
-  [-33.45071433,-70.83802953],
-  [-33.52718124,-70.54119781],
-  [-33.43894097,-70.72498544],
-  [-33.47523787,-70.51719304],
-  [-33.3488163,-70.60128206],
-  [-33.53121961,-70.80575432],
-  [-33.3321219,-70.54376383],
-  [-33.42317389,-70.56435601],
-  [-33.5065755,-70.81549007],
-  [-33.55381151,-70.50169011],
-  [-33.3890383,-70.86510401],
-  [-33.34547249,-70.60568496],
-  [-33.3823078,-70.72912483],
-  [-33.48124195,-70.84494133],
-  [-33.4839706,-70.53557237],
-  [-33.46702601,-70.59214936],
-  [-33.40646937,-70.78221091],
-  [-33.3086926,-70.58887231],
-  [-33.49521656,-70.85831994],
-  [-33.60397471,-70.59105737],
-  [-33.43846389,-70.68599767],
-  [-33.30760725,-70.57425633],
-  [-33.47248651,-70.68733345],
-  [-33.44675373,-70.50937157],
-  [-33.40947656,-70.84452011],
-  [-33.34411248,-70.69399609],
-  [-33.43389712,-70.75966262],
-  [-33.46881067,-70.81959572],
-  [-33.54853063,-70.73268104],
-  [-33.40043183,-70.69289705],
-  [-33.28330022,-70.75022042],
-  [-33.34071337,-70.65300658],
-  [-33.41255372,-70.50932404],
-  [-33.56016529,-70.64684305],
-  [-33.49884677,-70.73309951],
-  [-33.36375158,-70.55447535],
-  [-33.45807278,-70.84998157],
-  [-33.52326172,-70.57271513],
-  [-33.50196479,-70.74017789],
-  [-33.2904864,-70.68120175],
-  [-33.35984686,-70.72788691],
-  [-33.30276194,-70.72082593],
-  [-33.43165399,-70.78987765],
-  [-33.53244623,-70.58309104],
-  [-33.34807214,-70.68609961],
-  [-33.48900203,-70.70592665],
-  [-33.40787045,-70.66103746],
-  [-33.53305377,-70.66165845],
-  [-33.40511229,-70.70932661],
-  [-33.36664938,-70.49141413],
-  [-33.48740436,-70.63421039],
-  [-33.51702852,-70.82351408],
-  [-33.47099627,-70.64886872],
-  [-33.30556962,-70.76580957],
-  [-33.50232771,-70.5113328],
-  [-33.42234314,-70.56244016],
-  [-33.3317012,-70.81595382],
-  [-33.45309726,-70.54214778],
-  [-33.54624218,-70.65426606],
-  [-33.29330566,-70.77959411],
-  [-33.38072918,-70.53797588],
-  [-33.41066929,-70.7141101],
-  [-33.40729661,-70.63219696],
-  [-33.45614939,-70.68026706],
-  [-33.39304863,-70.85449748],
-  [-33.42078977,-70.48258332],
-  [-33.34369675,-70.65711492],
-  [-33.28596207,-70.6532601],
-  [-33.30110682,-70.64586741],
-  [-33.50689407,-70.78628501],
-  [-33.55596887,-70.73194688],
-  [-33.38725582,-70.63646093],
-  [-33.31545525,-70.79531236],
-  [-33.33595273,-70.75406336],
-  [-33.4251875,-70.61295406],
-  [-33.46168243,-70.70808587],
-  [-33.53096433,-70.51882807],
-  [-33.45970267,-70.46990676],
-  [-33.34685336,-70.8132639],
-  [-33.58049757,-70.55461722],
-  [-33.47241365,-70.54965846],
-  [-33.5811757,-70.75781006],
-  [-33.38694052,-70.87354629],
-  [-33.37533225,-70.60408151],
-  [-33.48839508,-70.79825646],
-  [-33.33171003,-70.56678233],
-  [-33.57572313,-70.69182232],
-  [-33.51959525,-70.72600222],
-  [-33.47380124,-70.53627563],
-  [-33.53280971,-70.66617777],
-  [-33.35986614,-70.52581009],
-  [-33.48148056,-70.67664993],
-  [-33.47261819,-70.8049503],
-  [-33.4212642,-70.64281427],
-  [-33.48512106,-70.54595872],
-  [-33.53242648,-70.67648631],
-  [-33.56782029,-70.81860909],
-  [-33.48242808,-70.8050564],
-  [-33.58611275,-70.59805207],
-  [-33.26895927,-70.67873439],
-  [-33.26836119,-70.66232367],
-  [-33.3070625,-70.72870686],
-  [-33.37106666,-70.58247594],
-  [-33.56164295,-70.70217203],
-  [-33.5856629,-70.65401129],
-  [-33.50518097,-70.8298699],
-  [-33.34972214,-70.68840303],
-  [-33.27582587,-70.61572877],
-  [-33.47495404,-70.80902471],
-  [-33.41674836,-70.57245092],
-  [-33.60406004,-70.72919958],
-  [-33.38838049,-70.55782291],
-  [-33.42383374,-70.5702739],
-  [-33.60268482,-70.5874634],
-  [-33.50439491,-70.58200949],
-  [-33.38280378,-70.57579275],
-  [-33.54295037,-70.50877693],
-  [-33.61944877,-70.67020137],
-  [-33.3014532,-70.74135116],
-  [-33.40887866,-70.60415858],
-  [-33.55490209,-70.75695551],
-  [-33.58000702,-70.79706516],
-  [-33.61477348,-70.68187186],
-  [-33.37399961,-70.82132807],
-  [-33.4579331,-70.49259129],
-  [-33.35230052,-70.71394918],
-  [-33.56819285,-70.65254425],
-  [-33.36438962,-70.85596312],
-  [-33.48728585,-70.62814754],
-  [-33.50568237,-70.80460212],
-  [-33.55912977,-70.69097473],
-  [-33.41054614,-70.63470812],
-  [-33.53798603,-70.72311727],
-  [-33.48202057,-70.80950301],
-  [-33.44492796,-70.7493199],
-  [-33.5170084,-70.50157882],
-  [-33.57708519,-70.73001394],
-  [-33.41264766,-70.54202373],
-  [-33.30175484,-70.70971733],
-  [-33.43281886,-70.71684772],
-  [-33.30571369,-70.80457398],
-  [-33.5249125,-70.55291516],
-  [-33.4006173,-70.63775727],
-  [-33.61525184,-70.74374767],
-  [-33.60890744,-70.59728316],
-  [-33.61200148,-70.60489205],
-  [-33.60973021,-70.7015098],
-  [-33.54999925,-70.59677698],
-  [-33.59305679,-70.74743569],
-  [-33.47332613,-70.80610971],
-  [-33.33889353,-70.83093184],
-  [-33.51407152,-70.85120975],
-  [-33.42135159,-70.65818971],
-  [-33.4652936,-70.63557663],
-  [-33.37129967,-70.71386865],
-  [-33.34390748,-70.50811356],
-  [-33.49213393,-70.57808579],
-  [-33.45107943,-70.70083858],
-  [-33.32901139,-70.7110828],
-  [-33.52742602,-70.8444228],
-  [-33.53505429,-70.62872612],
-  [-33.37643213,-70.50608932],
-  [-33.34003762,-70.77499577],
-  [-33.49169478,-70.78202331],
-  [-33.44275253,-70.74167106],
-  [-33.60107443,-70.61737764],
-  [-33.39661496,-70.80480285],
-  [-33.32361458,-70.77829795],
-  [-33.31324316,-70.76936647],
-  [-33.59998581,-70.69019804],
-  [-33.58530459,-70.74175614],
-  [-33.44673527,-70.71645506],
-  [-33.34932935,-70.62738721],
-  [-33.30719276,-70.77426399],
-  [-33.5087486,-70.63230561],
-  [-33.33534197,-70.55576334],
-  [-33.32937668,-70.73011175],
-  [-33.42643639,-70.74310627],
-  [-33.34798469,-70.6389003],
-  [-33.29268911,-70.75581113],
-  [-33.3904324,-70.67539985],
-  [-33.45672915,-70.81872967],
-  [-33.47700417,-70.72031738],
-  [-33.3049904,-70.65391928],
-  [-33.4243963,-70.61350878],
-  [-33.50715129,-70.74451253],
-  [-33.45575476,-70.79217071],
-  [-33.40083055,-70.79440393],
-  [-33.45719931,-70.495926],
-  [-33.47823594,-70.77086628],
-  [-33.59355267,-70.6143622],
-  [-33.34714269,-70.69994694],
-  [-33.50490711,-70.73448602],
-  [-33.42575962,-70.71375778],
-  [-33.35523183,-70.79728354],
-  [-33.54301304,-70.62282969],
-  [-33.52743637,-70.73702597],
-  [-33.33529937,-70.70690122],
-  [-33.46360486,-70.609074],
-  [-33.36821928,-70.75158438],
-  [-33.59880493,-70.68292874],
-  [-33.43048872,-70.5442262],
-  [-33.31023318,-70.56310509],
-  [-33.59320123,-70.63161784],
-  [-33.61260629,-70.72465986],
-  [-33.33551141,-70.52011207],
-  [-33.43922532,-70.85371962],
-  [-33.47569361,-70.47258712],
-  [-33.43196858,-70.8053531],
-  [-33.44691278,-70.73234885],
-  [-33.47892734,-70.77187648],
-  [-33.54512805,-70.55472483],
-  [-33.33142577,-70.51383449],
-  [-33.42365527,-70.72107091],
-  [-33.37113786,-70.79350506],
-  [-33.36169985,-70.60958387],
-  [-33.32640227,-70.5491775],
-  [-33.31236593,-70.76221894],
-  [-33.46127343,-70.58228281],
-  [-33.45745687,-70.75022705],
-  [-33.38632873,-70.58595564],
-  [-33.42742036,-70.61602412],
-  [-33.47181867,-70.74428939],
-  [-33.45010887,-70.7067614],
-  [-33.52850409,-70.60007269],
-  [-33.40168864,-70.67328886],
-  [-33.43756427,-70.54309859],
-  [-33.52325002,-70.69426894],
-  [-33.27618702,-70.70443192],
-  [-33.48326372,-70.80667599],
-  [-33.40785861,-70.74989588],
-  [-33.55931552,-70.73655583],
-  [-33.57718982,-70.64335658],
-  [-33.61996167,-70.71178812],
-  [-33.45758939,-70.47486659],
-  [-33.55365536,-70.83463298],
-  [-33.5394327,-70.67654088],
-  [-33.30264579,-70.58742168],
-  [-33.3680578,-70.74791371],
-  [-33.3984857,-70.50556818],
-  [-33.38972765,-70.49270465],
-  [-33.4997023,-70.82323554],
-  [-33.61389165,-70.63612893],
-  [-33.44574448,-70.85656386],
-  [-33.57614855,-70.81176475],
-  [-33.34474239,-70.83138291],
-  [-33.33828358,-70.53633131],
-  [-33.55076119,-70.61883366],
-  [-33.43988107,-70.8673128],
-  [-33.48505254,-70.52881467],
-  [-33.33289006,-70.70526257],
-  [-33.59633912,-70.78683512],
-  [-33.52721204,-70.49067238],
-  [-33.41920684,-70.50838882],
-  [-33.33352822,-70.63555494],
-  [-33.51257089,-70.76957369],
-  [-33.39932294,-70.69842928],
-  [-33.38539893,-70.53570426],
-  [-33.39089911,-70.55129542],
-  [-33.39404221,-70.47931735],
-  [-33.29769893,-70.71004569],
-  [-33.31012043,-70.6181188],
-  [-33.59439806,-70.76515052],
-  [-33.29149829,-70.60893293],
-  [-33.60836958,-70.73230068],
-  [-33.43154968,-70.70135355],
-  [-33.49960603,-70.5519888],
-  [-33.53362854,-70.53061299],
-  [-33.43583789,-70.52658012],
-  [-33.55524132,-70.68828569],
-  [-33.52145899,-70.49029166],
-  [-33.35562904,-70.76199555],
-  [-33.39504643,-70.53814017],
-  [-33.60776031,-70.76272208],
-  [-33.52213514,-70.64937386],
-  [-33.42619782,-70.81641228],
-  [-33.33191038,-70.70950323],
-  [-33.52676823,-70.78958573],
-  [-33.51928155,-70.61329565],
-  [-33.45981761,-70.83574589],
-  [-33.3395137,-70.59294542],
-  [-33.57143879,-70.63384022],
-  [-33.4553138,-70.76051602],
-  [-33.57136154,-70.78336593],
-  [-33.49525664,-70.77854921],
-  [-33.53000311,-70.8425479],
-  [-33.42417455,-70.53313051],
-  [-33.5072554,-70.55713128],
-  [-33.42199891,-70.72738584],
-  [-33.35055011,-70.80765515],
-  [-33.40161173,-70.80542141],
-  [-33.44066205,-70.613269],
-  [-33.59753487,-70.63626216],
-  [-33.50693466,-70.52063679],
-  [-33.61550177,-70.63300132],
-  [-33.54765246,-70.81234049],
-  [-33.31521394,-70.61603893],
-  [-33.41314077,-70.48458926],
-  [-33.49160353,-70.67524527],
-  [-33.40589328,-70.8333845],
-  [-33.36355172,-70.76347751],
-  [-33.574167,-70.65200906],
-  [-33.40524785,-70.56317898],
-  [-33.32753994,-70.71096413],
-  [-33.53559516,-70.79871862],
-  [-33.33194801,-70.57936758],
-  [-33.2986357,-70.57654731],
-  [-33.49991778,-70.48060606],
-  [-33.50218124,-70.74545993],
-  [-33.48809011,-70.54494466],
-  [-33.47320386,-70.60533307],
-  [-33.40654075,-70.48861752],
-  [-33.42943582,-70.78710388],
-  [-33.39801651,-70.73197782],
-  [-33.56454175,-70.82842438],
-  [-33.58639926,-70.63404545],
-  [-33.61247928,-70.7465473],
-  [-33.47551024,-70.84600057],
-  [-33.45297159,-70.51940788],
-  [-33.39820267,-70.82612417],
-  [-33.30429949,-70.57898914],
-  [-33.466463,-70.81629992],
-  [-33.54349086,-70.54401115],
-  [-33.40285063,-70.88155973],
-  [-33.5080857,-70.7432288],
-  [-33.35770622,-70.61281625],
-  [-33.53607056,-70.5059906],
-  [-33.44457257,-70.49908837],
-  [-33.27940688,-70.63236833],
-  [-33.49142037,-70.82512605],
-  [-33.30620844,-70.68870216],
-  [-33.45915447,-70.53975013],
-  [-33.44608742,-70.58818267],
-  [-33.42044986,-70.85614306],
-  [-33.41174527,-70.74586639],
-  [-33.57021229,-70.66500288],
-  [-33.46777002,-70.55293474],
-  [-33.4396113,-70.52760426],
-  [-33.61896705,-70.6333375],
-  [-33.43585429,-70.56571736],
-  [-33.49526292,-70.71200082],
-  [-33.57164379,-70.53823157],
-  [-33.49650843,-70.5423756],
-  [-33.57774101,-70.7994843],
-  [-33.35493013,-70.79036336],
-  [-33.52019275,-70.82526245],
-  [-33.44048784,-70.77995526],
-  [-33.32510096,-70.5928782],
-  [-33.53168219,-70.7334891],
-  [-33.34242308,-70.73002832],
-  [-33.40341988,-70.63965218],
-  [-33.59597328,-70.61979532],
-  [-33.32984867,-70.51138885],
-  [-33.27653554,-70.69796783],
-  [-33.43638017,-70.6050461],
-  [-33.41480963,-70.49785247],
-  [-33.50302544,-70.51257499],
-  [-33.34656357,-70.56826065],
-  [-33.55837462,-70.5175854],
-  [-33.56672795,-70.58647159],
-  [-33.31849876,-70.60635834],
-  [-33.3374917,-70.54233465],
-  [-33.53873277,-70.73327326],
-  [-33.45641853,-70.52183705]
-]
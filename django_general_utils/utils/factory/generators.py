@@ -0,0 +1,162 @@
+from itertools import cycle, islice
+
+# Rango por defecto de los RUT generados (el de los fixtures anteriores)
+RUT_MIN = 5_000_000
+RUT_MAX = 25_000_000
+# Contorno aproximado (lat, lon) del Gran Santiago: envolvente convexa de los puntos de los fixtures anteriores
+SANTIAGO_POLYGON = (
+    (-33.6262, -70.6823),
+    (-33.6023, -70.7830),
+    (-33.5675, -70.8332),
+    (-33.5064, -70.8772),
+    (-33.4554, -70.8881),
+    (-33.3976, -70.8805),
+    (-33.3251, -70.8311),
+    (-33.2768, -70.7398),
+    (-33.2708, -70.6354),
+    (-33.2917, -70.5670),
+    (-33.3288, -70.5123),
+    (-33.4022, -70.4661),
+    (-33.4749, -70.4609),
+    (-33.5468, -70.4958),
+    (-33.5777, -70.5254),
+    (-33.6095, -70.5810),
+)
+# Dígito verificador por valor de 11 - (suma % 11): 10 -> K, 11 -> 0
+_CHECK_DIGITS = '?123456789K0'
+
+
+def rut_check_digit(number: int) -> str:
+    """
+    Dígito verificador (módulo 11) del RUT `number`
+    """
+    total = sum(int(_digit) * _weight for _digit, _weight in zip(reversed(str(number)), cycle(range(2, 8))))
+
+    return _CHECK_DIGITS[11 - total % 11]
+
+
+def format_rut(number: int) -> str:
+    """
+    RUT con el formato de `CLRutField().clean()`: `12.611.222-K`
+    """
+    return f'{number:,}'.replace(',', '.') + '-' + rut_check_digit(number)
+
+
+def rut_check_digits(numbers):
+    """
+    Versión vectorizada de `rut_check_digit`
+    @return: ndarray de bytes (`S1`)
+    """
+    import numpy as np
+
+    rest = np.asarray(numbers, dtype=np.int64).copy()
+    total = np.zeros_like(rest)
+
+    for _weight in islice(cycle(range(2, 8)), len(str(int(rest.max(initial=0))))):
+        total += rest % 10 * _weight
+        rest //= 10
+
+    return np.frombuffer(_CHECK_DIGITS.encode(), dtype='S1')[11 - total % 11]
+
+
+def format_ruts(numbers):
+    """
+    Versión vectorizada de `format_rut`: arma los caracteres (UCS-4) en una matriz por cada cantidad de dígitos,
+    sin strings de Python por fila.
+    @return: ndarray de str
+    """
+    import numpy as np
+
+    numbers = np.asarray(numbers, dtype=np.int64)
+    check_digits = rut_check_digits(numbers).view(np.uint8)
+    digit_counts = np.ones(len(numbers), dtype=np.int64)
+    max_digits = len(str(int(numbers.max(initial=0))))
+
+    for _position in range(1, max_digits):
+        digit_counts += numbers >= 10 ** _position
+
+    width = max_digits + (max_digits - 1) // 3 + 2
+    result = np.empty(len(numbers), dtype=f'U{width}')
+
+    for _digits in np.unique(digit_counts).tolist():
+        rows = digit_counts == _digits
+        rest = numbers[rows]
+        chars = np.zeros((len(rest), width), dtype=np.uint32)
+        column = _digits + (_digits - 1) // 3 - 1
+        chars[:, column + 1] = ord('-')
+        chars[:, column + 2] = check_digits[rows]
+
+        for _position in range(_digits):
+            if _position and _position % 3 == 0:
+                chars[:, column] = ord('.')
+                column -= 1
+
+            chars[:, column] = rest % 10 + ord('0')
+            rest //= 10
+            column -= 1
+
+        # Los caracteres nulos al final no forman parte del str
+        result[rows] = chars.view(f'U{width}').ravel()
+
+    return result
+
+
+def random_rut_numbers(rng, n: int, minimum: int = RUT_MIN, maximum: int = RUT_MAX, unique: bool = True):
+    """
+    `n` números de RUT uniformes en [minimum, maximum]; con `unique=True`, sin repetidos
+    @param rng: numpy.random.Generator
+    """
+    size = maximum - minimum + 1
+
+    if not unique:
+        return rng.integers(minimum, maximum + 1, n)
+
+    if n > size:
+        raise ValueError(f'Cannot generate {n} unique RUTs between {minimum} and {maximum}')
+
+    return rng.choice(size, n, replace=False) + minimum
+
+
+def points_in_polygon(points, polygon=SANTIAGO_POLYGON):
+    """
+    Ray casting vectorizado: True para los puntos (lat, lon) dentro de `polygon`
+    @return: ndarray de bool
+    """
+    import numpy as np
+
+    points = np.asarray(points, dtype=np.float64)
+    polygon = np.asarray(polygon, dtype=np.float64)
+    lat, lon = points[:, 0], points[:, 1]
+    inside = np.zeros(len(points), dtype=bool)
+
+    for (_lat1, _lon1), (_lat2, _lon2) in zip(polygon, np.roll(polygon, 1, axis=0)):
+        if _lat1 == _lat2:
+            continue
+
+        crosses = (_lat1 > lat) != (_lat2 > lat)
+        inside ^= crosses & (lon < (_lon2 - _lon1) * (lat - _lat1) / (_lat2 - _lat1) + _lon1)
+
+    return inside
+
+
+def random_points_in_polygon(rng, n: int, polygon=SANTIAGO_POLYGON, decimals: int = 8):
+    """
+    `n` puntos (lat, lon) uniformes dentro de `polygon`, por rechazo sobre su bounding box
+    @param rng: numpy.random.Generator
+    @return: ndarray (n, 2)
+    """
+    import numpy as np
+
+    polygon = np.asarray(polygon, dtype=np.float64)
+    low, high = polygon.min(axis=0), polygon.max(axis=0)
+    lat, lon = polygon[:, 0], polygon[:, 1]
+    # Shoelace: fracción de la bounding box que cubre el polígono
+    area = abs(np.dot(lat, np.roll(lon, 1)) - np.dot(lon, np.roll(lat, 1))) / 2
+    ratio = area / np.prod(high - low)
+    points = np.empty((0, 2))
+
+    while len(points) < n:
+        candidates = rng.uniform(low, high, (int((n - len(points)) / ratio * 1.05) + 16, 2))
+        points = np.concatenate([points, candidates[points_in_polygon(candidates, polygon)]])
+
+    return np.round(points[:n], decimals)
@@ -1,15 +1,63 @@
 from faker.providers import BaseProvider
-from localflavor.cl.forms import CLRutField
 
-from .fixtures import RUTS, SANTIAGO_POINTS
+from .fixtures import LazyFixture, get_ruts, get_santiago_points
+from .generators import (
+    RUT_MAX,
+    RUT_MIN,
+    SANTIAGO_POLYGON,
+    format_rut,
+    format_ruts,
+    random_points_in_polygon,
+    random_rut_numbers,
+)
 
 
 class Provider(BaseProvider):
-    ruts = RUTS
-    santiago_points = SANTIAGO_POINTS
+    rut_min = RUT_MIN
+    rut_max = RUT_MAX
+    santiago_polygon = SANTIAGO_POLYGON
+    # Fixtures fijos (compatibilidad); para lotes nuevos usar `rut_batch(n)` / `santiago_point_batch(n)`
+    ruts = LazyFixture(get_ruts)
+    santiago_points = LazyFixture(get_santiago_points)
 
-    def rut(self):
-        return CLRutField().clean(self.random_element(self.ruts))
+    def _get_rut_range(self, minimum: int = None, maximum: int = None) -> tuple:
+        return (
+            self.rut_min if minimum is None else minimum,
+            self.rut_max if maximum is None else maximum,
+        )
 
-    def santiago_point(self):
-        return self.random_element(self.santiago_points)
+    def numpy_random(self):
+        """
+        numpy.random.Generator con semilla tomada del random de Faker (`seed_instance` hace reproducibles los lotes)
+        """
+        import numpy as np
+
+        return np.random.default_rng(self.generator.random.getrandbits(64))
+
+    def rut(self, minimum: int = None, maximum: int = None) -> str:
+        """
+        RUT válido (dígito verificador módulo 11) con el formato de `CLRutField().clean()`: `12.611.222-K`
+        """
+        return format_rut(self.random_int(*self._get_rut_range(minimum, maximum)))
+
+    def rut_batch(self, n: int, minimum: int = None, maximum: int = None, unique: bool = True):
+        """
+        Lote vectorizado de `rut()`, sin repetidos por defecto
+        @return: ndarray de str
+        """
+        numbers = random_rut_numbers(self.numpy_random(), n, *self._get_rut_range(minimum, maximum), unique=unique)
+
+        return format_ruts(numbers)
+
+    def santiago_point(self) -> list:
+        """
+        [lat, lon] uniforme dentro de `santiago_polygon`
+        """
+        return self.santiago_point_batch(1)[0].tolist()
+
+    def santiago_point_batch(self, n: int):
+        """
+        Lote vectorizado de `santiago_point()`
+        @return: ndarray (n, 2) de [lat, lon]
+        """
+        return random_points_in_polygon(self.numpy_random(), n, self.santiago_polygon)
@@ -1,2 +1,3 @@
-from .format_currency import format_currency
-from .format_decimal import format_decimal
+from .format_currency import format_currency, format_currency_batch
+from .format_decimal import format_decimal, format_decimal_batch
+from .formatter import NumberFormatter, get_number_formatter
@@ -1,4 +1,4 @@
-from babel import numbers
+from .formatter import get_number_formatter
 
 
 def format_currency(
@@ -11,9 +11,18 @@ def format_currency(
     Get format decimal
     @return:
     """
-    return numbers.format_currency(
-        value,
-        currency=currency,
-        locale=locale,
-        **kwargs,
-    )
+    return get_number_formatter(locale, currency, **kwargs)(value)
+
+
+def format_currency_batch(
+        values,
+        currency='CLP',
+        locale: str = 'es_CL',
+        empty: str = '',
+        **kwargs
+) -> list:
+    """
+    `format_currency` para una columna completa (lista, ndarray o `values_list(..., flat=True)`)
+    @return: lista de strings; los None se reemplazan por `empty`
+    """
+    return get_number_formatter(locale, currency, **kwargs).format_many(values, empty=empty)
@@ -1,4 +1,4 @@
-from babel import numbers
+from .formatter import get_number_formatter
 
 
 def format_decimal(
@@ -10,8 +10,17 @@ def format_decimal(
     Get format decimal
     @return:
     """
-    return numbers.format_decimal(
-        value,
-        locale=locale,
-        **kwargs,
-    )
+    return get_number_formatter(locale, **kwargs)(value)
+
+
+def format_decimal_batch(
+        values,
+        locale: str = 'es_CL',
+        empty: str = '',
+        **kwargs
+) -> list:
+    """
+    `format_decimal` para una columna completa (lista, ndarray o `values_list(..., flat=True)`)
+    @return: lista de strings; los None se reemplazan por `empty`
+    """
+    return get_number_formatter(locale, **kwargs).format_many(values, empty=empty)
@@ -0,0 +1,117 @@
+from functools import lru_cache
+
+from babel import numbers
+from babel.core import Locale
+
+
+class NumberFormatter:
+    """
+    Formateador de Babel con el `Locale` y el patrón ya resueltos. `format_decimal`/`format_currency`
+    repiten ese trabajo en cada llamada; aquí solo queda `NumberPattern.apply` por valor.
+    Se obtiene con `get_number_formatter` (cacheado por locale, moneda y opciones).
+    """
+
+    def __init__(
+            self,
+            locale: str = 'es_CL',
+            currency: str = None,
+            format: str = None,
+            format_type: str = 'standard',
+            currency_digits: bool = True,
+            decimal_quantization: bool = True,
+            group_separator: bool = True,
+            numbering_system: str = 'latn',
+    ):
+        self.locale = Locale.parse(locale)
+        self.currency = currency
+        self.format = format
+        self.format_type = format_type
+        self.currency_digits = currency_digits
+        self.decimal_quantization = decimal_quantization
+        self.group_separator = group_separator
+        self.numbering_system = numbering_system
+
+        if format is not None:
+            self.pattern = numbers.parse_pattern(format)
+        elif currency is None:
+            self.pattern = self.locale.decimal_formats[None]
+        elif format_type == 'name':
+            # El patrón depende de la forma plural de cada valor
+            self.pattern = None
+        else:
+            try:
+                self.pattern = self.locale.currency_formats[format_type]
+            except KeyError:
+                raise numbers.UnknownCurrencyFormatError(
+                    f'{format_type!r} is not a known currency format type'
+                ) from None
+
+    def __call__(self, value) -> str:
+        if self.pattern is None:
+            return numbers.format_currency(
+                value,
+                currency=self.currency,
+                format=self.format,
+                locale=self.locale,
+                currency_digits=self.currency_digits,
+                format_type=self.format_type,
+                decimal_quantization=self.decimal_quantization,
+                group_separator=self.group_separator,
+                numbering_system=self.numbering_system,
+            )
+
+        if self.currency is None:
+            return self.pattern.apply(
+                value,
+                self.locale,
+                decimal_quantization=self.decimal_quantization,
+                group_separator=self.group_separator,
+                numbering_system=self.numbering_system,
+            )
+
+        return self.pattern.apply(
+            value,
+            self.locale,
+            currency=self.currency,
+            currency_digits=self.currency_digits,
+            decimal_quantization=self.decimal_quantization,
+            group_separator=self.group_separator,
+            numbering_system=self.numbering_system,
+        )
+
+    def format_many(self, values, empty: str = '') -> list:
+        """
+        Formatea una columna completa: lista, `numpy.ndarray` o `values_list(..., flat=True)`.
+        Los valores repetidos se formatean una sola vez y los None se reemplazan por `empty`.
+        @return: lista de strings en el mismo orden
+        """
+        if hasattr(values, 'tolist'):
+            values = values.tolist()
+
+        formatted = {}
+        result = []
+
+        for _value in values:
+            if _value is None:
+                result.append(empty)
+
+                continue
+
+            # Babel formatea Decimal(str(valor)): mismo str, mismo resultado (0.0 == -0.0 no)
+            key = str(_value)
+
+            if key not in formatted:
+                formatted[key] = self(_value)
+
+            result.append(formatted[key])
+
+        return result
+
+
+@lru_cache(maxsize=256)
+def get_number_formatter(locale: str = 'es_CL', currency: str = None, **kwargs) -> NumberFormatter:
+    """
+    `NumberFormatter` compartido por (locale, moneda, opciones de formato).
+    @param kwargs: format, format_type, currency_digits, decimal_quantization, group_separator, numbering_system
+    """
+    return NumberFormatter(locale, currency, **kwargs)
@@ -1,2 +1,4 @@
 from .blur import DEFAULT_BLUR_CODE
-from .blur_img_to_base64 import blur_img_to_base64
+from .blur_cache import get_blur_code
+from .blur_img_to_base64 import BLUR_CODE_FORMATS, blur_img_to_base64, get_default_blur_code
+from .blurhash import blurhash_encode
@@ -0,0 +1,92 @@
+import hashlib
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files import File as DjangoFile
+
+from .blur_img_to_base64 import blur_img_to_base64, get_default_blur_code
+
+BLUR_CODE_CACHE_PREFIX = 'blur_code'
+
+
+def read_bytes(file: DjangoFile | str) -> bytes:
+    if isinstance(file, str):
+        with open(file, 'rb') as f:
+            return f.read()
+
+    if hasattr(file, 'seek'):
+        file.seek(0)
+
+    content = file.read()
+
+    if hasattr(file, 'seek'):
+        file.seek(0)
+
+    return content
+
+
+def get_blur_cache_key(content: bytes, size_img_blur=(25, 25), format: str = 'BMP') -> str:
+    digest = hashlib.sha256(content).hexdigest()
+
+    return f'{BLUR_CODE_CACHE_PREFIX}:{digest}:{size_img_blur[0]}x{size_img_blur[1]}:{format}'
+
+
+def get_cached_blur_code(content: bytes, size_img_blur=(25, 25), format: str = 'BMP') -> str | None:
+    return cache.get(get_blur_cache_key(content, size_img_blur, format))
+
+
+def set_cached_blur_code(content: bytes, blur_code: str, size_img_blur=(25, 25), format: str = 'BMP') -> None:
+    cache.set(
+        get_blur_cache_key(content, size_img_blur, format),
+        blur_code,
+        getattr(settings, 'BLUR_CODE_CACHE_TIMEOUT', 60 * 60 * 24 * 30)
+    )
+
+    return None
+
+
+def blur_code_from_bytes(content: bytes, size_img_blur=(25, 25), format: str = 'BMP', with_exception=True) -> str:
+    """
+    `blur_img_to_base64` sobre el contenido ya leído. Es una función de módulo (serializable) para
+    poder enviarla a un `ProcessPoolExecutor`.
+    """
+    return blur_img_to_base64(
+        BytesIO(content),
+        size_img_blur=size_img_blur,
+        with_exception=with_exception,
+        format=format,
+    )
+
+
+def get_blur_code(file: DjangoFile | str, size_img_blur=(25, 25), with_exception=True, format: str = 'BMP') -> str:
+    """
+    Igual que `blur_img_to_base64`, pero cacheado por el hash (sha256) del contenido del archivo:
+    la misma imagen se procesa con Pillow una sola vez. El timeout del cache es
+    `BLUR_CODE_CACHE_TIMEOUT` (por defecto 30 días).
+    """
+    default = get_default_blur_code(format, tuple(size_img_blur))
+
+    if not file:
+        return default
+
+    try:
+        content = read_bytes(file)
+    except Exception as e:
+        if with_exception:
+            return default
+
+        raise e
+
+    blur_code = get_cached_blur_code(content, size_img_blur, format)
+
+    if blur_code is not None:
+        return blur_code
+
+    blur_code = blur_code_from_bytes(content, size_img_blur, format=format, with_exception=with_exception)
+
+    # No se cachea el fallback: un error transitorio no debe quedar fijo
+    if blur_code != default:
+        set_cached_blur_code(content, blur_code, size_img_blur, format)
+
+    return blur_code
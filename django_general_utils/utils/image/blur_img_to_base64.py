@@ -1,28 +1,89 @@
 import base64
+from functools import lru_cache
 from io import BytesIO
 
 from PIL import Image, ImageFilter
 from django.core.files import File as DjangoFile
 
 from .blur import DEFAULT_BLUR_CODE
+from .blurhash import blurhash_encode
 
+# Formato -> mime type del data URI (None: no es una imagen, p. ej. BlurHash)
+BLUR_CODE_FORMATS = {
+    'BMP': 'image/bmp',
+    'PNG': 'image/png',
+    'WEBP': 'image/webp',
+    'JPEG': 'image/jpeg',
+    'BLURHASH': None,
+}
+# Color de `DEFAULT_BLUR_CODE`
+DEFAULT_BLUR_COLOR = (195, 195, 195)
 
-def blur_img_to_base64(file: DjangoFile | str, size_img_blur=(25, 25), with_exception=True) -> str:
+
+def _encode(img: Image.Image, format: str, blurhash_components: tuple) -> str:
+    if format == 'BLURHASH':
+        return blurhash_encode(img, *blurhash_components)
+
+    if format in ('BMP', 'JPEG') or img.mode not in ('RGB', 'RGBA'):
+        img = img.convert('RGBA' if format in ('PNG', 'WEBP') and img.has_transparency_data else 'RGB')
+
+    buffered = BytesIO()
+
+    if format == 'PNG':
+        img.save(buffered, format='PNG', optimize=True)
+    elif format in ('WEBP', 'JPEG'):
+        img.save(buffered, format=format, quality=50)
+    else:
+        img.save(buffered, format=format)
+
+    return base64.b64encode(buffered.getvalue()).decode('utf-8')
+
+
+@lru_cache
+def get_default_blur_code(format: str = 'BMP', size_img_blur=(25, 25), blurhash_components=(4, 3)) -> str:
+    """
+    Código de respaldo (gris uniforme) para `format`. En BMP es `DEFAULT_BLUR_CODE`.
+    """
+    assert format in BLUR_CODE_FORMATS, f'format must be one of {", ".join(BLUR_CODE_FORMATS)}'
+
+    if format == 'BMP':
+        return DEFAULT_BLUR_CODE
+
+    return _encode(Image.new('RGB', size_img_blur, DEFAULT_BLUR_COLOR), format, blurhash_components)
+
+
+def blur_img_to_base64(
+        file: DjangoFile | str,
+        size_img_blur=(25, 25),
+        with_exception=True,
+        format: str = 'BMP',
+        radius: float = 5,
+        blurhash_components=(4, 3),
+) -> str:
     """
     blur image and return base64
+
+    En JPEG se decodifica con `draft()` (reducción 1/2, 1/4 o 1/8 en el decoder), así que no se
+    leen todos los píxeles de la imagen original.
+    @param format: 'BMP' | 'PNG' | 'WEBP' | 'JPEG' en base64, o 'BLURHASH' (string BlurHash, sin blur previo)
+    @param with_exception: True retorna el código de respaldo ante un error en vez de lanzarlo
     """
+    assert format in BLUR_CODE_FORMATS, f'format must be one of {", ".join(BLUR_CODE_FORMATS)}'
+
     try:
         img = Image.open(file)
+        img.draft('RGB', size_img_blur)
         img.thumbnail(size_img_blur, Image.LANCZOS)
-        img.filter(ImageFilter.GaussianBlur(radius=5))
 
-        buffered = BytesIO()
+        if format != 'BLURHASH' and radius:
+            if img.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+                img = img.convert('RGBA' if img.has_transparency_data else 'RGB')
 
-        img.save(buffered, format='BMP')
+            img = img.filter(ImageFilter.GaussianBlur(radius=radius))
 
-        return base64.b64encode(buffered.getvalue()).decode('utf-8')
+        return _encode(img, format, blurhash_components)
     except Exception as e:
         if with_exception:
-            return DEFAULT_BLUR_CODE
+            return get_default_blur_code(format, tuple(size_img_blur), tuple(blurhash_components))
 
         raise e
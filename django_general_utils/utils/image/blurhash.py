@@ -0,0 +1,69 @@
+import numpy as np
+from PIL import Image
+
+BASE83_CHARACTERS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~'
+
+
+def base83_encode(value: int, length: int) -> str:
+    return ''.join(
+        BASE83_CHARACTERS[(value // (83 ** (length - _index - 1))) % 83]
+        for _index in range(length)
+    )
+
+
+def _srgb_to_linear(values: np.ndarray) -> np.ndarray:
+    values = values / 255.0
+
+    return np.where(values <= 0.04045, values / 12.92, ((values + 0.055) / 1.055) ** 2.4)
+
+
+def _linear_to_srgb(value: float) -> int:
+    value = min(max(value, 0.0), 1.0)
+
+    if value <= 0.0031308:
+        return int(value * 12.92 * 255 + 0.5)
+
+    return int((1.055 * value ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def blurhash_encode(img: Image.Image, x_components: int = 4, y_components: int = 3) -> str:
+    """
+    Codifica una imagen (ya reducida, p. ej. a 32x32) como BlurHash. Los factores de la DCT se
+    calculan con dos productos matriciales en vez de recorrer los píxeles por componente.
+    """
+    assert 1 <= x_components <= 9 and 1 <= y_components <= 9, 'components must be between 1 and 9'
+
+    pixels = _srgb_to_linear(np.asarray(img.convert('RGB'), dtype=np.float64))
+    height, width = pixels.shape[:2]
+
+    basis_x = np.cos(np.pi * np.outer(np.arange(x_components), np.arange(width)) / width)
+    basis_y = np.cos(np.pi * np.outer(np.arange(y_components), np.arange(height)) / height)
+
+    # factors[j, i, canal] = sum_y sum_x basis_y[j, y] * basis_x[i, x] * pixels[y, x, canal]
+    factors = np.einsum('jy,ix,yxc->jic', basis_y, basis_x, pixels) / (width * height)
+    factors = factors.reshape(-1, 3)
+    # Normalización: 1 para el componente DC, 2 para los AC
+    factors[1:] *= 2
+
+    dc, ac = factors[0], factors[1:]
+    result = base83_encode((x_components - 1) + (y_components - 1) * 9, 1)
+
+    if len(ac):
+        quantised_max = int(max(0, min(82, np.floor(np.abs(ac).max() * 166 - 0.5))))
+        max_value = (quantised_max + 1) / 166
+    else:
+        quantised_max = 0
+        max_value = 1
+
+    result += base83_encode(quantised_max, 1)
+    result += base83_encode(
+        (_linear_to_srgb(dc[0]) << 16) + (_linear_to_srgb(dc[1]) << 8) + _linear_to_srgb(dc[2]),
+        4
+    )
+
+    quantised = np.clip(np.floor(np.sign(ac) * np.sqrt(np.abs(ac / max_value)) * 9 + 9.5), 0, 18).astype(int)
+
+    for _r, _g, _b in quantised:
+        result += base83_encode(_r * 19 * 19 + _g * 19 + _b, 2)
+
+    return result
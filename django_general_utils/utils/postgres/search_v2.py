@@ -1,11 +1,28 @@
 import re
 from typing import Tuple
 
+from django.contrib.postgres.expressions import ArraySubquery
 from django.contrib.postgres.search import (
     TrigramSimilarity, SearchRank, TrigramWordSimilarity, SearchQuery
 )
-from django.db.models import F, CharField, FloatField, QuerySet, Q
-from django.db.models.functions import Cast, Greatest, Coalesce
+from django.db.models import F, CharField, FloatField, Func, IntegerField, QuerySet, Q, Value
+from django.db.models.functions import Cast, Greatest, Coalesce, NullIf
+
+HYBRID_MODES = ('rrf', 'weighted')
+
+
+class ArrayPosition(Func):
+    function = 'array_position'
+    output_field = IntegerField()
+
+
+class ArrayElement(Func):
+    """
+    `(array)[(índice)]`, índice base 1 (como `array_position`); NULL si el índice es NULL.
+    """
+    template = '(%(expressions)s)]'
+    arg_joiner = ')[('
+    arity = 2
 
 
 class PostgresSearchV2:
@@ -20,13 +37,42 @@ class PostgresSearchV2:
             search_vector_field=None,
             search_rank_weights=None,
             order_by='-order_rank',
+            query_embedding=None,
+            embedding_field=None,
+            hybrid_mode='rrf',
+            hybrid_candidates=100,
+            rrf_k=60,
+            lexical_weight=0.5,
+            vector_weight=0.5,
+            vector_metric='cosine',
     ) -> QuerySet:
         """
         Aplica búsqueda Full-Text y de Trigramas de forma optimizada.
         Filtra primero mediante índices GIN y luego calcula el ranking.
+        Con `query_embedding` y `embedding_field` (un `VectorField`) la búsqueda es híbrida
+        (ver `get_hybrid_queryset`).
         """
         search_terms = search_terms.strip()
 
+        if query_embedding is not None and embedding_field:
+            return PostgresSearchV2.get_hybrid_queryset(
+                queryset,
+                search_terms,
+                query_embedding,
+                embedding_field,
+                mode=hybrid_mode,
+                candidates=hybrid_candidates,
+                rrf_k=rrf_k,
+                lexical_weight=lexical_weight,
+                vector_weight=vector_weight,
+                vector_metric=vector_metric,
+                search_fields_filter=search_fields_filter,
+                search_trigram_fields=search_trigram_fields,
+                search_word_trigram_fields=search_word_trigram_fields,
+                search_vector_field=search_vector_field,
+                search_rank_weights=search_rank_weights,
+            )
+
         if not search_terms:
             return queryset
 
@@ -130,6 +176,93 @@ class PostgresSearchV2:
             .order_by(order_by)
         )
 
+    @staticmethod
+    def get_hybrid_queryset(
+            queryset: QuerySet,
+            search_terms: str,
+            query_embedding,
+            embedding_field: str,
+            mode='rrf',
+            candidates=100,
+            rrf_k=60,
+            lexical_weight=0.5,
+            vector_weight=0.5,
+            vector_metric='cosine',
+            **lexical_kwargs,
+    ) -> QuerySet:
+        """
+        Búsqueda híbrida en una sola consulta: toma los `candidates` mejores de la búsqueda léxica
+        (`order_rank`) y los `candidates` más cercanos a `query_embedding` (`ORDER BY distancia
+        LIMIT`, usa el índice HNSW/IVFFlat) y fusiona ambos rankings sobre esa unión acotada.
+
+        - `rrf`: Reciprocal Rank Fusion, `1 / (rrf_k + posición)` sumado en ambas listas.
+        - `weighted`: `lexical_weight * order_rank / máximo order_rank + vector_weight * similitud`
+          (`1 - distancia` en coseno, producto interno en `inner_product`, `1 / (1 + distancia)` en el resto).
+          Fuera de los candidatos léxicos el `order_rank` cuenta como 0.
+
+        Anota `vector_distance` y `hybrid_rank` (las posiciones son `alias`, para no repetir los
+        ARRAY en el SELECT) y ordena por `-hybrid_rank, pk` (estable para paginar). **Postgres-only**.
+        """
+        from ...models.querysets.vector import VECTOR_METRICS
+
+        assert mode in HYBRID_MODES, f'mode must be one of {", ".join(HYBRID_MODES)}'
+        assert vector_metric in VECTOR_METRICS, f'vector_metric must be one of {", ".join(VECTOR_METRICS)}'
+
+        vector_ids = queryset.annotate(
+            vector_distance=VECTOR_METRICS[vector_metric](embedding_field, query_embedding)
+        ).order_by('vector_distance').values('pk')[:candidates]
+        candidates_filter = Q(pk__in=vector_ids)
+        lexical = None
+
+        if search_terms:
+            lexical = PostgresSearchV2.get_queryset(queryset, search_terms, **lexical_kwargs)
+
+            # Sin `order_rank` los candidatos léxicos se toman por pk, para que el corte sea determinista
+            lexical = lexical.order_by(*(('-order_rank', 'pk') if 'order_rank' in lexical.query.annotations else ('pk',)))
+
+            candidates_filter |= Q(pk__in=lexical.values('pk')[:candidates])
+
+        # ARRAY(...) no correlacionado: Postgres lo calcula una vez (InitPlan) para todas las filas
+        queryset = queryset.filter(candidates_filter).annotate(
+            vector_distance=VECTOR_METRICS[vector_metric](embedding_field, query_embedding),
+        ).alias(
+            vector_position=ArrayPosition(ArraySubquery(vector_ids), F('pk')),
+            lexical_position=(
+                ArrayPosition(ArraySubquery(lexical.values('pk')[:candidates]), F('pk'))
+                if lexical is not None else Value(None, output_field=IntegerField())
+            ),
+        )
+
+        if mode == 'rrf':
+            hybrid_rank = sum(
+                Coalesce(Value(1.0) / (Value(float(rrf_k)) + F(_position)), 0.0, output_field=FloatField())
+                for _position in ('lexical_position', 'vector_position')
+            )
+        else:
+            if vector_metric == 'cosine':
+                vector_score = Value(1.0) - F('vector_distance')
+            elif vector_metric == 'inner_product':
+                vector_score = Value(-1.0) * F('vector_distance')
+            else:
+                vector_score = Value(1.0) / (Value(1.0) + F('vector_distance'))
+
+            lexical_score = Value(0.0)
+
+            if lexical is not None and 'order_rank' in lexical.query.annotations:
+                # order_rank de los candidatos léxicos en el mismo orden que `lexical_position` (ARRAY no
+                # correlacionado, se calcula una vez): el de la fila sobre el primero (el máximo)
+                lexical_ranks = ArraySubquery(lexical.values('order_rank')[:candidates])
+                lexical_score = Coalesce(
+                    ArrayElement(lexical_ranks, F('lexical_position'), output_field=FloatField())
+                    / NullIf(ArrayElement(lexical_ranks, Value(1), output_field=FloatField()), 0.0),
+                    0.0,
+                    output_field=FloatField()
+                )
+
+            hybrid_rank = Value(float(lexical_weight)) * lexical_score + Value(float(vector_weight)) * vector_score
+
+        return queryset.annotate(hybrid_rank=hybrid_rank).order_by('-hybrid_rank', 'pk')
+
     @staticmethod
     def get_similarity_annotate(queryset: QuerySet, search_fields: list, search: str) -> Tuple[QuerySet, list[str]]:
         similarities = {}
@@ -0,0 +1,180 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection, models
+from django.utils import timezone
+
+from django_general_utils.management.commands.archive_deleted import Command
+from django_general_utils.models import fields
+from django_general_utils.models.archive import (
+    archive_soft_deleted,
+    create_archive_view,
+    get_archive_model,
+    sort_by_dependencies,
+)
+from django_general_utils.models.base import BaseModel
+
+
+class ArchiveParentModel(BaseModel):
+    name = models.CharField(max_length=64, unique=True)
+    _archive_after = datetime.timedelta(days=30)
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_archive_parent_model'
+
+
+class ArchiveChildModel(BaseModel):
+    name = models.CharField(max_length=64)
+    parent = fields.ForeignKey(ArchiveParentModel, on_delete=models.CASCADE, related_name='children')
+    _archive_after = datetime.timedelta(days=30)
+    _archive_mode = 'purge'
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_archive_child_model'
+
+
+class ArchiveTests(unittest.TestCase):
+    MODELS = (ArchiveParentModel, ArchiveChildModel)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            for _model in cls.MODELS:
+                schema_editor.create_model(_model)
+                schema_editor.create_model(_model.history.model)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.cursor() as cursor:
+            cursor.execute('DROP VIEW IF EXISTS test_archive_parent_model_with_archive')
+
+        with connection.schema_editor() as schema_editor:
+            schema_editor.execute('DROP TABLE IF EXISTS test_archive_parent_model_archive')
+
+            for _model in reversed(cls.MODELS):
+                schema_editor.delete_model(_model.history.model)
+                schema_editor.delete_model(_model)
+
+        super().tearDownClass()
+
+    def setUp(self):
+        for _model in reversed(self.MODELS):
+            _model.objects.all_with_deleted().hard_delete_policy_action()
+            _model.history.model.objects.all().delete()
+
+        with connection.cursor() as cursor:
+            cursor.execute('DROP VIEW IF EXISTS test_archive_parent_model_with_archive')
+            cursor.execute('DROP TABLE IF EXISTS test_archive_parent_model_archive')
+
+    def _deleted_parent(self, name: str, days: int = 60, children: int = 1):
+        parent = ArchiveParentModel.objects.create(name=name)
+
+        for _i in range(children):
+            ArchiveChildModel.objects.create(name=f'{name}-{_i}', parent=parent)
+
+        parent.delete()
+        deleted = timezone.now() - datetime.timedelta(days=days)
+        ArchiveParentModel.objects.all_with_deleted().filter(pk=parent.pk).update(deleted=deleted)
+        ArchiveChildModel.objects.all_with_deleted().filter(parent=parent).update(deleted=deleted)
+
+        return parent
+
+    def test_referenced_rows_are_skipped_until_children_are_gone(self):
+        parent = self._deleted_parent('old')
+
+        self.assertEqual(archive_soft_deleted(ArchiveParentModel), {'archived': 0, 'purged': 0})
+        self.assertEqual(archive_soft_deleted(ArchiveChildModel), {'archived': 0, 'purged': 1})
+        self.assertEqual(archive_soft_deleted(ArchiveParentModel), {'archived': 1, 'purged': 0})
+
+        self.assertFalse(ArchiveParentModel.objects.all_with_deleted().exists())
+        archived = get_archive_model(ArchiveParentModel).objects.get()
+        self.assertEqual((archived.pk, archived.name), (parent.pk, 'old'))
+
+        return None
+
+    def test_recent_and_active_rows_are_kept(self):
+        self._deleted_parent('recent', days=5, children=0)
+        ArchiveParentModel.objects.create(name='active')
+
+        self.assertEqual(archive_soft_deleted(ArchiveParentModel)['archived'], 0)
+        self.assertEqual(ArchiveParentModel.objects.all_with_deleted().count(), 2)
+
+        return None
+
+    def test_batches_and_dry_run(self):
+        for _i in range(5):
+            self._deleted_parent(f'old-{_i}', children=0)
+
+        self.assertEqual(archive_soft_deleted(ArchiveParentModel, dry_run=True)['archived'], 5)
+        self.assertEqual(
+            archive_soft_deleted(ArchiveParentModel, batch_size=2, max_batches=2)['archived'],
+            4
+        )
+        self.assertEqual(ArchiveParentModel.objects.all_with_deleted().count(), 1)
+
+        return None
+
+    def test_view_unions_live_and_archived_rows(self):
+        self._deleted_parent('old', children=0)
+        ArchiveParentModel.objects.create(name='active')
+        archive_soft_deleted(ArchiveParentModel)
+        create_archive_view(ArchiveParentModel)
+
+        self.assertEqual(
+            set(ArchiveParentModel.objects.all_with_archived().values_list('name', flat=True)),
+            {'old', 'active'}
+        )
+
+        return None
+
+    def test_command_processes_children_first(self):
+        self._deleted_parent('old', children=2)
+        out = StringIO()
+
+        call_command(Command(), 'auth.ArchiveParentModel', 'auth.ArchiveChildModel', stdout=out)
+
+        self.assertEqual(sort_by_dependencies([ArchiveParentModel, ArchiveChildModel])[0], ArchiveChildModel)
+        self.assertIn('auth.ArchiveChildModel: 0 registros archivados, 2 registros eliminados', out.getvalue())
+        self.assertIn('auth.ArchiveParentModel: 1 registros archivados', out.getvalue())
+
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,272 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.db import connection, models
+from PIL import Image
+
+from django_general_utils.management.commands.backfill_blur_codes import Command
+from django_general_utils.models.base import BaseModel
+from django_general_utils.utils.executors import InProcessExecutor, set_executor
+from django_general_utils.utils.image import DEFAULT_BLUR_CODE, blur_cache, get_blur_code
+
+MEDIA_ROOT = tempfile.mkdtemp()
+storage = FileSystemStorage(location=MEDIA_ROOT)
+
+
+def tearDownModule():
+    shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+
+def _make_image_bytes(size=(50, 50), color=(255, 0, 0)) -> bytes:
+    buffer = BytesIO()
+    Image.new('RGB', size, color).save(buffer, format='PNG')
+
+    return buffer.getvalue()
+
+
+class BlurCodeModel(BaseModel):
+    name = models.CharField(max_length=64, blank=True)
+    image = models.ImageField(storage=storage, upload_to='blur', blank=True)
+    _images_field_to_blur = ['image']
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_blur_code_model'
+
+
+class DeferredBlurCodeModel(BaseModel):
+    image = models.ImageField(storage=storage, upload_to='blur', blank=True)
+    _images_field_to_blur = ['image']
+    _blur_run_in = 'thread'
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_deferred_blur_code_model'
+
+
+class BackfillBlurCodeModel(BaseModel):
+    image = models.ImageField(storage=storage, upload_to='blur', blank=True)
+    _images_field_to_blur = ['image']
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_backfill_blur_code_model'
+
+
+class GetBlurCodeTests(unittest.TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_same_content_is_processed_once(self):
+        content = _make_image_bytes()
+
+        with mock.patch.object(blur_cache, 'blur_img_to_base64', wraps=blur_cache.blur_img_to_base64) as blur:
+            first = get_blur_code(BytesIO(content))
+            second = get_blur_code(BytesIO(content))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, DEFAULT_BLUR_CODE)
+        self.assertEqual(blur.call_count, 1)
+
+        return None
+
+    def test_fallback_is_not_cached(self):
+        with mock.patch.object(blur_cache, 'blur_img_to_base64', wraps=blur_cache.blur_img_to_base64) as blur:
+            self.assertEqual(get_blur_code(BytesIO(b'not an image')), DEFAULT_BLUR_CODE)
+            self.assertEqual(get_blur_code(BytesIO(b'not an image')), DEFAULT_BLUR_CODE)
+
+        self.assertEqual(blur.call_count, 2)
+
+        return None
+
+
+class BlurOnSaveTests(unittest.TestCase):
+    MODELS = (BlurCodeModel, DeferredBlurCodeModel)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            for _model in cls.MODELS:
+                schema_editor.create_model(_model)
+                schema_editor.create_model(_model.history.model)
+
+    @classmethod
+    def tearDownClass(cls):
+        set_executor('thread', None)
+
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        set_executor('thread', InProcessExecutor())
+
+        for _model in self.MODELS:
+            _model.objects.all_with_deleted().hard_delete_policy_action()
+            _model.history.model.objects.all().delete()
+
+    def test_blur_is_skipped_when_image_is_unchanged(self):
+        instance = BlurCodeModel(image=ContentFile(_make_image_bytes(), name='a.png'))
+        instance.save()
+
+        self.assertNotEqual(instance.image_blur_code, DEFAULT_BLUR_CODE)
+
+        with mock.patch('django_general_utils.models.base.get_blur_code') as get_blur:
+            instance.name = 'other'
+            instance.save()
+
+        get_blur.assert_not_called()
+
+        return None
+
+    def test_blur_is_recalculated_when_image_changes(self):
+        instance = BlurCodeModel.objects.create(image=ContentFile(_make_image_bytes(), name='a.png'))
+        blur_code = instance.image_blur_code
+
+        instance.image = ContentFile(_make_image_bytes(color=(0, 0, 255)), name='a.png')
+        instance.save()
+
+        self.assertNotEqual(instance.image_blur_code, blur_code)
+        self.assertEqual(
+            BlurCodeModel.objects.get(pk=instance.pk).image_blur_code,
+            instance.image_blur_code,
+        )
+
+        return None
+
+    def test_update_fields_includes_blur_code(self):
+        instance = BlurCodeModel.objects.create(name='a')
+
+        instance.image = ContentFile(_make_image_bytes(), name='a.png')
+        instance.save(update_fields=['image'])
+
+        self.assertNotEqual(BlurCodeModel.objects.get(pk=instance.pk).image_blur_code, DEFAULT_BLUR_CODE)
+
+        return None
+
+    def test_deferred_blur_is_written_after_commit(self):
+        instance = DeferredBlurCodeModel(image=ContentFile(_make_image_bytes(), name='a.png'))
+        instance.save()
+
+        # La instancia en memoria no se toca; el executor actualiza la fila
+        self.assertEqual(instance.image_blur_code, DEFAULT_BLUR_CODE)
+        self.assertNotEqual(
+            DeferredBlurCodeModel.objects.get(pk=instance.pk).image_blur_code,
+            DEFAULT_BLUR_CODE,
+        )
+
+        return None
+
+
+class BackfillBlurCodesTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(BackfillBlurCodeModel)
+            schema_editor.create_model(BackfillBlurCodeModel.history.model)
+
+    def setUp(self):
+        cache.clear()
+        BackfillBlurCodeModel.objects.all_with_deleted().hard_delete_policy_action()
+        BackfillBlurCodeModel.history.model.objects.all().delete()
+
+        self.objs = [
+            BackfillBlurCodeModel.objects.create(
+                image=ContentFile(_make_image_bytes(color=(_index * 60, 0, 0)), name=f'{_index}.png')
+            )
+            for _index in range(4)
+        ]
+        BackfillBlurCodeModel.objects.create()
+        # Simula un campo de blur recién agregado: todas las filas con el código por defecto
+        BackfillBlurCodeModel.objects.update(image_blur_code=DEFAULT_BLUR_CODE)
+
+    def call(self, *args) -> str:
+        out = StringIO()
+        call_command(Command(), 'auth.BackfillBlurCodeModel', *args, stdout=out)
+
+        return out.getvalue()
+
+    def get_codes(self) -> dict:
+        return dict(BackfillBlurCodeModel.objects.values_list('pk', 'image_blur_code'))
+
+    def test_backfill_only_touches_blur_columns(self):
+        history = BackfillBlurCodeModel.history.count()
+        output = self.call('--workers', '0', '--chunk-size', '2')
+        codes = self.get_codes()
+
+        for _obj in self.objs:
+            self.assertEqual(codes[_obj.pk], BlurCodeModel.get_blur_code(_obj.image))
+            self.assertNotEqual(codes[_obj.pk], DEFAULT_BLUR_CODE)
+
+        self.assertEqual(BackfillBlurCodeModel.history.count(), history)
+        self.assertIn('2/5', output)
+        self.assertIn('5 registros actualizados', output)
+
+        return None
+
+    def test_start_after_resumes_from_pk(self):
+        self.call('--workers', '0', '--start-after', str(self.objs[1].pk))
+        codes = self.get_codes()
+
+        self.assertEqual(codes[self.objs[0].pk], DEFAULT_BLUR_CODE)
+        self.assertEqual(codes[self.objs[1].pk], DEFAULT_BLUR_CODE)
+        self.assertNotEqual(codes[self.objs[2].pk], DEFAULT_BLUR_CODE)
+
+        return None
+
+    def test_process_pool(self):
+        output = self.call('--workers', '2', '--only-default')
+
+        self.assertIn('5 registros actualizados', output)
+        self.assertNotIn(DEFAULT_BLUR_CODE, [self.get_codes()[_obj.pk] for _obj in self.objs])
+
+        # Ya no quedan filas con imagen y código por defecto
+        self.assertIn('1 registros actualizados', self.call('--workers', '0', '--only-default'))
+
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
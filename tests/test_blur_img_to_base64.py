@@ -1,6 +1,7 @@
 import base64
 import unittest
 from io import BytesIO
+from unittest import mock
 
 import django
 from django.conf import settings
@@ -28,10 +29,15 @@ if not settings.configured:
     )
     django.setup()
 
-from PIL import Image, UnidentifiedImageError
+from PIL import Image, JpegImagePlugin, UnidentifiedImageError
 
 from django_general_utils.utils.image.blur import DEFAULT_BLUR_CODE
-from django_general_utils.utils.image.blur_img_to_base64 import blur_img_to_base64
+from django_general_utils.utils.image.blur_img_to_base64 import (
+    DEFAULT_BLUR_COLOR,
+    blur_img_to_base64,
+    get_default_blur_code,
+)
+from django_general_utils.utils.image.blurhash import BASE83_CHARACTERS
 
 
 def _make_image_bytes(size=(50, 50), color=(255, 0, 0)) -> BytesIO:
@@ -42,6 +48,15 @@ def _make_image_bytes(size=(50, 50), color=(255, 0, 0)) -> BytesIO:
     return buffer
 
 
+def _decode_dc(blurhash: str) -> tuple:
+    value = 0
+
+    for _char in blurhash[2:6]:
+        value = value * 83 + BASE83_CHARACTERS.index(_char)
+
+    return value >> 16, (value >> 8) & 255, value & 255
+
+
 class DefaultBlurCodeTests(unittest.TestCase):
     def test_is_valid_base64_bmp(self):
         decoded = base64.b64decode(DEFAULT_BLUR_CODE)
@@ -66,22 +81,50 @@ class BlurImgToBase64Tests(unittest.TestCase):
         self.assertLessEqual(img.size[0], 20)
         self.assertLessEqual(img.size[1], 20)
 
-    def test_blur_is_not_actually_applied_current_behavior(self):
-        # Known bug: img.filter(ImageFilter.GaussianBlur(...)) return value
-        # is discarded (never reassigned to `img`), so the output is
-        # pixel-identical to a plain thumbnail+BMP-encode with no blur at
-        # all. This test documents that current (buggy) behavior.
-        source = _make_image_bytes(size=(20, 20))
-        result = blur_img_to_base64(source, size_img_blur=(20, 20))
+    def test_blur_is_applied(self):
+        source = BytesIO()
+        img = Image.new('RGB', (20, 20), (255, 255, 255))
+        img.paste((0, 0, 0), (0, 0, 10, 20))
+        img.save(source, format='PNG')
+        source.seek(0)
+
+        result = Image.open(BytesIO(base64.b64decode(blur_img_to_base64(source, size_img_blur=(20, 20)))))
 
+        # Sin blur el borde entre negro y blanco sería abrupto
+        self.assertNotIn(result.getpixel((9, 10)), ((0, 0, 0), (255, 255, 255)))
+
+    def test_jpeg_is_decoded_in_draft_mode(self):
+        source = BytesIO()
+        Image.new('RGB', (800, 800), (255, 0, 0)).save(source, format='JPEG')
         source.seek(0)
-        expected_img = Image.open(source)
-        expected_img.thumbnail((20, 20), Image.LANCZOS)
-        expected_buffer = BytesIO()
-        expected_img.save(expected_buffer, format='BMP')
-        expected = base64.b64encode(expected_buffer.getvalue()).decode('utf-8')
 
-        self.assertEqual(result, expected)
+        jpeg_draft = JpegImagePlugin.JpegImageFile.draft
+
+        with mock.patch.object(JpegImagePlugin.JpegImageFile, 'draft', autospec=True, side_effect=jpeg_draft) as draft:
+            blur_img_to_base64(source)
+
+        self.assertEqual(draft.call_args_list[0].args[1:], ('RGB', (25, 25)))
+
+    def test_image_formats(self):
+        for _format, _magic in (('PNG', b'\x89PNG'), ('WEBP', b'RIFF'), ('JPEG', b'\xff\xd8')):
+            with self.subTest(format=_format):
+                decoded = base64.b64decode(blur_img_to_base64(_make_image_bytes(), format=_format))
+
+                self.assertEqual(decoded[:len(_magic)], _magic)
+                self.assertLess(len(decoded), len(base64.b64decode(DEFAULT_BLUR_CODE)))
+
+    def test_blurhash_format(self):
+        result = blur_img_to_base64(_make_image_bytes(), format='BLURHASH')
+
+        # 1 (tamaño) + 1 (máximo AC) + 4 (DC) + 2 por cada uno de los 11 AC de 4x3
+        self.assertEqual(len(result), 28)
+        self.assertEqual(_decode_dc(result), (255, 0, 0))
+
+    def test_invalid_file_returns_default_code_of_the_format(self):
+        result = blur_img_to_base64(BytesIO(b'not an image'), format='BLURHASH')
+
+        self.assertEqual(result, get_default_blur_code('BLURHASH'))
+        self.assertEqual(_decode_dc(result), DEFAULT_BLUR_COLOR)
 
     def test_invalid_file_returns_default_blur_code_by_default(self):
         # with_exception=True (the default) actually SUPPRESSES exceptions
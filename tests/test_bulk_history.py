@@ -0,0 +1,236 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+from types import SimpleNamespace
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection, models
+from django.utils.connection import ConnectionDoesNotExist
+
+from django_general_utils.models import fields
+from django_general_utils.models.base import BaseModel
+from django_general_utils.models.simple_history import HistoricalRecords, bulk_history_create
+
+
+class BulkHistoryParentModel(BaseModel):
+    name = models.CharField(max_length=64)
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_bulk_history_parent_model'
+
+
+class BulkHistoryChildModel(BaseModel):
+    name = models.CharField(max_length=64)
+    parent = fields.ForeignKey(BulkHistoryParentModel, on_delete=models.CASCADE, related_name='children')
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_bulk_history_child_model'
+
+
+class BulkHistoryTests(unittest.TestCase):
+    MODELS = (BulkHistoryParentModel, BulkHistoryChildModel)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            for _model in cls.MODELS:
+                schema_editor.create_model(_model)
+                schema_editor.create_model(_model.history.model)
+
+        cls.user, _ = User.objects.get_or_create(username='bulk-history-user')
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            for _model in reversed(cls.MODELS):
+                schema_editor.delete_model(_model.history.model)
+                schema_editor.delete_model(_model)
+
+        super().tearDownClass()
+
+    def setUp(self):
+        for _model in reversed(self.MODELS):
+            _model.objects.all_with_deleted().hard_delete_policy_action()
+            _model.history.model.objects.all().delete()
+
+    def _parents(self, count: int = 3) -> list:
+        return BulkHistoryParentModel.objects.bulk_create(
+            [BulkHistoryParentModel(name=f'parent-{_i}') for _i in range(count)],
+            with_history=False,
+        )
+
+    def test_bulk_create_writes_history_in_one_insert(self):
+        HistoricalRecords.context.request = SimpleNamespace(user=self.user)
+
+        try:
+            objs = BulkHistoryParentModel.objects.bulk_create(
+                [BulkHistoryParentModel(name=f'parent-{_i}') for _i in range(3)]
+            )
+        finally:
+            del HistoricalRecords.context.request
+
+        history = BulkHistoryParentModel.history.all()
+
+        self.assertEqual(history.count(), 3)
+        self.assertEqual({_h.history_type for _h in history}, {'+'})
+        self.assertEqual({_h.history_user for _h in history}, {self.user})
+        self.assertEqual({_h.id for _h in history}, {_obj.pk for _obj in objs})
+
+        return None
+
+    def test_bulk_create_without_history(self):
+        self._parents()
+
+        self.assertEqual(BulkHistoryParentModel.history.count(), 0)
+
+        return None
+
+    def test_bulk_update_writes_changed_history_with_explicit_user(self):
+        objs = self._parents()
+
+        for _obj in objs:
+            _obj.name = 'renamed'
+
+        BulkHistoryParentModel.objects.bulk_update(objs, fields=['name'], history_user=self.user)
+
+        history = BulkHistoryParentModel.history.all()
+
+        self.assertEqual({(_h.history_type, _h.name, _h.history_user) for _h in history}, {('~', 'renamed', self.user)})
+        self.assertEqual(set(BulkHistoryParentModel.objects.values_list('updated_by', flat=True)), {self.user.pk})
+
+        return None
+
+    def test_bulk_create_or_update_dict_writes_history(self):
+        self._parents(1)
+
+        BulkHistoryParentModel.objects.bulk_create_or_update_dict(
+            [{'name': 'parent-0'}, {'name': 'parent-new'}],
+            update_fields=['name'],
+            unique_fields=['name'],
+        )
+
+        self.assertEqual(
+            sorted(BulkHistoryParentModel.history.values_list('name', 'history_type')),
+            [('parent-0', '~'), ('parent-new', '+')]
+        )
+
+        return None
+
+    def test_bulk_delete_cascades_and_writes_history(self):
+        parents = self._parents(2)
+        BulkHistoryChildModel.objects.bulk_create(
+            [BulkHistoryChildModel(name=f'child-{_i}', parent=parents[0]) for _i in range(2)],
+            with_history=False,
+        )
+
+        total, counter = BulkHistoryParentModel.objects.filter(pk=parents[0].pk).bulk_delete(user=self.user)
+
+        self.assertEqual(total, 3)
+        self.assertEqual(counter, {'auth.BulkHistoryParentModel': 1, 'auth.BulkHistoryChildModel': 2})
+        self.assertEqual(list(BulkHistoryParentModel.objects.values_list('pk', flat=True)), [parents[1].pk])
+        self.assertEqual(BulkHistoryChildModel.objects.count(), 0)
+        self.assertEqual(
+            set(BulkHistoryChildModel.objects.all_with_deleted().values_list('deleted_by_cascade', 'updated_by')),
+            {(True, self.user.pk)}
+        )
+        self.assertEqual(BulkHistoryParentModel.history.filter(deleted__isnull=False).count(), 1)
+        self.assertEqual(BulkHistoryChildModel.history.filter(deleted__isnull=False).count(), 2)
+
+        return None
+
+    def test_bulk_undelete_restores_cascade(self):
+        parent = self._parents(1)[0]
+        BulkHistoryChildModel.objects.bulk_create(
+            [BulkHistoryChildModel(name='child', parent=parent)],
+            with_history=False,
+        )
+        BulkHistoryParentModel.objects.filter(pk=parent.pk).bulk_delete(with_history=False)
+
+        total, _ = BulkHistoryParentModel.objects.deleted_only().filter(pk=parent.pk).bulk_undelete()
+
+        self.assertEqual(total, 2)
+        self.assertEqual(BulkHistoryParentModel.objects.count(), 1)
+        self.assertEqual(list(BulkHistoryChildModel.objects.values_list('deleted_by_cascade', flat=True)), [False])
+        self.assertEqual(BulkHistoryChildModel.history.filter(deleted__isnull=True).count(), 1)
+
+        return None
+
+    def test_bulk_history_create_ignores_models_without_history(self):
+        self.assertEqual(bulk_history_create(User, [self.user]), [])
+
+        return None
+
+    def test_bulk_history_create_requires_pks(self):
+        with self.assertRaises(ValueError):
+            bulk_history_create(BulkHistoryParentModel, [BulkHistoryParentModel(name='sin pk')])
+
+        return None
+
+    def test_bulk_history_create_uses_database(self):
+        parents = self._parents(2)
+
+        with self.assertRaises(ConnectionDoesNotExist):
+            bulk_history_create(BulkHistoryParentModel, parents, using='missing')
+
+        history = bulk_history_create(BulkHistoryParentModel, parents, using='default')
+
+        self.assertEqual({_h._state.db for _h in history}, {'default'})
+        self.assertEqual(BulkHistoryParentModel.history.count(), 2)
+
+        return None
+
+    def test_bulk_create_ignore_conflicts_skips_history(self):
+        objs = BulkHistoryParentModel.objects.bulk_create([BulkHistoryParentModel(name='a')], ignore_conflicts=True)
+
+        self.assertEqual(len(objs), 1)
+        self.assertEqual(BulkHistoryParentModel.objects.count(), 1)
+        self.assertEqual(BulkHistoryParentModel.history.count(), 0)
+
+        return None
+
+    def test_bulk_create_ignore_conflicts_with_history_raises(self):
+        with self.assertRaises(ValueError):
+            BulkHistoryParentModel.objects.bulk_create(
+                [BulkHistoryParentModel(name='a')], ignore_conflicts=True, with_history=True
+            )
+
+        self.assertEqual(BulkHistoryParentModel.objects.count(), 0)
+
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+from django.core.management import call_command
+from django.db import connection, models
+from django.db.models.deletion import ProtectedError
+from django.test.utils import CaptureQueriesContext
+
+from django_general_utils.models import fields
+from django_general_utils.models.base import BaseModel
+from django_general_utils.models.cascade import collect_soft_delete
+
+
+class CascadeParentModel(BaseModel):
+    name = models.CharField(max_length=64)
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_cascade_parent_model'
+
+
+class CascadeChildModel(BaseModel):
+    name = models.CharField(max_length=64)
+    parent = fields.ForeignKey(CascadeParentModel, on_delete=models.CASCADE, related_name='children')
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_cascade_child_model'
+
+
+class CascadeGrandchildModel(BaseModel):
+    name = models.CharField(max_length=64)
+    child = fields.ForeignKey(CascadeChildModel, on_delete=models.CASCADE, related_name='grandchildren')
+    reviewer = fields.ForeignKey(
+        CascadeParentModel,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='reviewed',
+    )
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_cascade_grandchild_model'
+
+
+class CascadeProtectedModel(BaseModel):
+    parent = fields.ForeignKey(CascadeParentModel, on_delete=models.PROTECT, related_name='protected')
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_cascade_protected_model'
+
+
+class CascadeTests(unittest.TestCase):
+    MODELS = (CascadeParentModel, CascadeChildModel, CascadeGrandchildModel, CascadeProtectedModel)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            for _model in cls.MODELS:
+                schema_editor.create_model(_model)
+                schema_editor.create_model(_model.history.model)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            for _model in reversed(cls.MODELS):
+                schema_editor.delete_model(_model.history.model)
+                schema_editor.delete_model(_model)
+
+        super().tearDownClass()
+
+    def setUp(self):
+        for _model in reversed(self.MODELS):
+            _model.objects.all_with_deleted().hard_delete_policy_action()
+            _model.history.model.objects.all().delete()
+
+    def _tree(self, children: int = 3, grandchildren: int = 2):
+        parent = CascadeParentModel.objects.create(name='parent')
+        objs = CascadeChildModel.objects.bulk_create(
+            [CascadeChildModel(name=f'child-{_i}', parent=parent) for _i in range(children)],
+            with_history=False,
+        )
+        CascadeGrandchildModel.objects.bulk_create(
+            [
+                CascadeGrandchildModel(name=f'grandchild-{_i}', child=_child)
+                for _child in objs
+                for _i in range(grandchildren)
+            ],
+            with_history=False,
+        )
+
+        return parent
+
+    def test_delete_cascades_by_sets(self):
+        parent = self._tree()
+
+        total, counter = parent.delete()
+
+        self.assertEqual(total, 10)
+        self.assertEqual(counter, {
+            'auth.CascadeParentModel': 1,
+            'auth.CascadeChildModel': 3,
+            'auth.CascadeGrandchildModel': 6,
+        })
+        self.assertEqual(CascadeChildModel.objects.count(), 0)
+        self.assertEqual(CascadeGrandchildModel.objects.count(), 0)
+        self.assertEqual(
+            set(CascadeGrandchildModel.objects.deleted_only().values_list('deleted_by_cascade', flat=True)),
+            {True}
+        )
+        self.assertFalse(CascadeParentModel.objects.deleted_only().get().deleted_by_cascade)
+        self.assertEqual(CascadeChildModel.history.filter(deleted__isnull=False).count(), 3)
+        self.assertEqual(CascadeGrandchildModel.history.filter(deleted__isnull=False).count(), 6)
+
+        return None
+
+    def test_query_count_does_not_grow_with_children(self):
+        small, large = self._tree(children=1, grandchildren=1), self._tree(children=5, grandchildren=4)
+
+        with CaptureQueriesContext(connection) as small_context:
+            small.delete()
+
+        with CaptureQueriesContext(connection) as large_context:
+            large.delete()
+
+        self.assertEqual(len(small_context.captured_queries), len(large_context.captured_queries))
+
+        return None
+
+    def test_undelete_restores_cascade(self):
+        parent = self._tree()
+        child = CascadeChildModel.objects.first()
+        child.delete()
+        parent.delete()
+
+        parent = CascadeParentModel.objects.deleted_only().get()
+        total, counter = parent.undelete()
+
+        self.assertEqual(counter['auth.CascadeChildModel'], 2)
+        self.assertEqual(CascadeChildModel.objects.count(), 2)
+        self.assertEqual(CascadeGrandchildModel.objects.count(), 4)
+        self.assertEqual(CascadeChildModel.objects.deleted_only().get().pk, child.pk)
+
+        return None
+
+    def test_set_null_relations_are_updated(self):
+        parent = self._tree(children=1, grandchildren=1)
+        reviewer = CascadeParentModel.objects.create(name='reviewer')
+        CascadeGrandchildModel.objects.update(reviewer=reviewer)
+
+        reviewer.delete()
+
+        self.assertEqual(CascadeGrandchildModel.objects.get().reviewer_id, None)
+        self.assertEqual(CascadeParentModel.objects.get().pk, parent.pk)
+
+        return None
+
+    def test_protected_relation_raises(self):
+        parent = self._tree(children=1, grandchildren=0)
+        CascadeProtectedModel.objects.create(parent=parent)
+
+        with self.assertRaises(ProtectedError):
+            parent.delete()
+
+        self.assertEqual(CascadeChildModel.objects.count(), 1)
+
+        CascadeProtectedModel.objects.get().delete()
+        parent.delete()
+
+        self.assertEqual(CascadeParentModel.objects.count(), 0)
+
+        return None
+
+    def test_collect_soft_delete_returns_pk_sets(self):
+        parent = self._tree(children=2, grandchildren=1)
+
+        affected, _ = collect_soft_delete(CascadeParentModel, [parent.pk])
+
+        self.assertEqual(affected[CascadeChildModel], set(parent.children.values_list('pk', flat=True)))
+        self.assertEqual(len(affected[CascadeGrandchildModel]), 2)
+
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection, models
+from django.db.models import Q
+
+from django_general_utils.models.base_without_safe_delete import BaseWithoutSafeDeleteModel
+from django_general_utils.models.constraints import (
+    CheckFlowStatusConstraint,
+    CheckRowsModelWithoutSafeDeleteConstraint,
+    ConstraintProfiler,
+    add_constraint_hook,
+    prometheus_hook,
+    remove_constraint_hook,
+)
+from django_general_utils.models.constraints.profiler import _measuring
+from django_general_utils.test.constraints import ConstraintAssertionsMixin
+
+
+class ProfilerModel(BaseWithoutSafeDeleteModel):
+    status = models.CharField(max_length=1, default='P', choices=[('P', 'Pendiente'), ('E', 'Enviado')])
+
+    class Meta:
+        app_label = 'tests'
+        db_table = 'test_constraint_profiler_model'
+        constraints = [
+            CheckFlowStatusConstraint(name='profiler_flow', flow={'P': ['E'], 'E': []}),
+            CheckRowsModelWithoutSafeDeleteConstraint(max_rows=2, name='profiler_max_rows', check=Q(status='P')),
+        ]
+
+
+class _Metric:
+    def __init__(self):
+        self.values = []
+
+    def labels(self, **labels):
+        self.current = labels
+
+        return self
+
+    def observe(self, value):
+        self.values.append((self.current['constraint'], value))
+
+    def inc(self, value=1):
+        self.values.append((self.current['constraint'], value))
+
+
+class ConstraintProfilerTests(ConstraintAssertionsMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(ProfilerModel)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(ProfilerModel)
+
+        super().tearDownClass()
+
+    def setUp(self):
+        ProfilerModel.objects.all().delete()
+
+    def test_profiler_records_calls_and_queries_per_constraint(self):
+        with ConstraintProfiler() as profiler:
+            ProfilerModel.objects.create()
+
+        max_rows = profiler.stats[('tests.ProfilerModel', 'profiler_max_rows')]
+        flow = profiler.stats[('tests.ProfilerModel', 'profiler_flow')]
+
+        self.assertEqual((max_rows.calls, max_rows.queries, max_rows.violations), (1, 1, 0))
+        self.assertEqual((flow.calls, flow.queries), (1, 0))
+        self.assertGreaterEqual(max_rows.total_time, 0)
+        self.assertEqual({_row['constraint'] for _row in profiler.report()}, {'profiler_max_rows', 'profiler_flow'})
+
+        return None
+
+    def test_violations_are_recorded(self):
+        ProfilerModel.objects.create()
+        ProfilerModel.objects.create()
+
+        with ConstraintProfiler() as profiler:
+            with self.assertRaises(ValidationError):
+                ProfilerModel.objects.create()
+
+        self.assertEqual(profiler.get('profiler_max_rows').violations, 1)
+
+        return None
+
+    def test_profiler_is_inactive_outside_block(self):
+        with ConstraintProfiler() as profiler:
+            pass
+
+        ProfilerModel.objects.create()
+
+        self.assertEqual(profiler.stats, {})
+        self.assertEqual(_measuring.get(), frozenset())
+
+        return None
+
+    def test_hook_receives_prometheus_style_metrics(self):
+        duration, queries = _Metric(), _Metric()
+        hook = prometheus_hook(duration_metric=duration, queries_metric=queries)
+        add_constraint_hook(hook)
+
+        try:
+            ProfilerModel.objects.create()
+        finally:
+            remove_constraint_hook(hook)
+
+        self.assertEqual({_name for _name, _ in duration.values}, {'profiler_max_rows', 'profiler_flow'})
+        self.assertEqual(queries.values, [('profiler_max_rows', 1)])
+
+        return None
+
+    def test_failing_hook_does_not_break_save(self):
+        def _hook(*args):
+            raise ValueError('boom')
+
+        add_constraint_hook(_hook)
+
+        try:
+            with self.assertLogs('django_general_utils.models.constraints.profiler', level='ERROR'):
+                ProfilerModel.objects.create()
+        finally:
+            remove_constraint_hook(_hook)
+
+        self.assertEqual(ProfilerModel.objects.count(), 1)
+
+        return None
+
+    def test_assertion_helpers(self):
+        with self.assertConstraintQueries(1, 'profiler_max_rows'):
+            ProfilerModel.objects.create()
+
+        with self.assertConstraintValidated('profiler_flow', model=ProfilerModel, calls=1):
+            ProfilerModel.objects.create(status='E')
+
+        with self.assertRaises(AssertionError):
+            with self.assertConstraintNotValidated('profiler_flow'):
+                ProfilerModel.objects.create(status='E')
+
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
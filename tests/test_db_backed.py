@@ -28,8 +28,9 @@ if not settings.configured:
 
 from django.core.exceptions import ValidationError
 from django.core.management import call_command
-from django.db import IntegrityError, connection, models
+from django.db import IntegrityError, connection, models, transaction
 from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
 from rest_framework import serializers
 
 from django_general_utils.models.base_without_safe_delete import BaseWithoutSafeDeleteModel
@@ -41,6 +42,7 @@ from django_general_utils.models.constraints.unique_without_safe_delete_constrai
     UniqueWithoutSafeDeleteConstraint,
 )
 from django_general_utils.utils.drf.fields.nested_primary_key_related_field import PrimaryKeyRelatedField
+from django_general_utils.utils.drf.validation_errors import ListValidationError
 from django_general_utils.utils.drf.validations.unique_together import validate_unique_together
 from django_general_utils.utils.factory.django.django_model_factory import DjangoModelFactory
 
@@ -229,6 +231,52 @@ class CheckRowsModelWithoutSafeDeleteConstraintDbTests(_DbBackedTestCase):
         first.refresh_from_db()
         self.assertEqual(first.name, 'updated')
 
+    def test_count_is_bounded_by_max_rows(self):
+        _MaxRowsModel.objects.bulk_create([_MaxRowsModel(name='a'), _MaxRowsModel(name='b')], full_clean=False)
+        constraint = _MaxRowsModel._meta.constraints[0]
+
+        with CaptureQueriesContext(connection) as context:
+            with self.assertRaises(ValidationError):
+                constraint.validate(model=_MaxRowsModel, instance=_MaxRowsModel(name='c'))
+
+        self.assertIn('LIMIT 2', context.captured_queries[-1]['sql'])
+
+    def test_bulk_create_validates_pending_rows_together(self):
+        _MaxRowsModel.objects.create(name='a')
+
+        with self.assertRaises(ListValidationError) as ctx:
+            _MaxRowsModel.objects.bulk_create([_MaxRowsModel(name='b'), _MaxRowsModel(name='c')])
+
+        self.assertEqual([len(_error.message_dict) > 0 for _error in ctx.exception.args[0]], [False, True])
+        self.assertEqual(_MaxRowsModel.objects.count(), 1)
+
+    def test_bulk_create_up_to_max_rows(self):
+        _MaxRowsModel.objects.bulk_create([_MaxRowsModel(name='a'), _MaxRowsModel(name='b')])
+
+        self.assertEqual(_MaxRowsModel.objects.count(), 2)
+
+    def test_validate_bulk_excludes_updated_rows(self):
+        objs = [_MaxRowsModel.objects.create(name='a'), _MaxRowsModel.objects.create(name='b')]
+        constraint = _MaxRowsModel._meta.constraints[0]
+
+        self.assertEqual(constraint.validate_bulk(_MaxRowsModel, objs), {})
+        self.assertEqual(list(constraint.validate_bulk(_MaxRowsModel, objs + [_MaxRowsModel(name='c')])), [2])
+
+    def test_lock_modes(self):
+        _MaxRowsModel.objects.create(name='a')
+
+        for _lock in ('advisory', 'select_for_update'):
+            constraint = CheckRowsModelWithoutSafeDeleteConstraint(max_rows=1, name='locked', check=Q(), lock=_lock)
+
+            with transaction.atomic():
+                with self.assertRaises(ValidationError):
+                    constraint.validate(model=_MaxRowsModel, instance=_MaxRowsModel(name='b'))
+
+            self.assertEqual(constraint.deconstruct()[2]['lock'], _lock)
+
+        with self.assertRaises(AssertionError):
+            CheckRowsModelWithoutSafeDeleteConstraint(max_rows=1, name='locked', lock='table')
+
 
 class PrimaryKeyRelatedFieldDbTests(_DbBackedTestCase):
     def test_resolves_instance_from_pk(self):
@@ -0,0 +1,137 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+import numpy as np
+from faker import Faker
+from localflavor.cl.forms import CLRutField
+
+from django_general_utils.utils.factory import Provider, fixtures
+from django_general_utils.utils.factory.generators import (
+    SANTIAGO_POLYGON,
+    format_rut,
+    format_ruts,
+    points_in_polygon,
+    random_rut_numbers,
+    rut_check_digit,
+    rut_check_digits,
+)
+
+
+class RutGeneratorTests(unittest.TestCase):
+    def test_check_digit(self):
+        self.assertEqual(rut_check_digit(12611222), 'K')
+        self.assertEqual(rut_check_digit(10314141), '9')
+        self.assertEqual(rut_check_digit(21094385), '4')
+        self.assertEqual(format_rut(12611222), '12.611.222-K')
+
+    def test_vectorized_format_matches_clean(self):
+        field = CLRutField()
+        numbers = [1, 10, 999, 1000, 999999, 1000000, 5855930, 12611222, 99999999]
+        ruts = format_ruts(numbers)
+
+        self.assertEqual(ruts.tolist(), [format_rut(_number) for _number in numbers])
+
+        # localflavor antepone un punto a los RUT de 6 dígitos (`.999.999-K`)
+        for _rut in ruts[5:].tolist():
+            self.assertEqual(field.clean(_rut), _rut)
+
+    def test_unique_numbers(self):
+        rng = np.random.default_rng(1)
+        numbers = random_rut_numbers(rng, 1000, 1_000_000, 1_001_999)
+
+        self.assertEqual(len(set(numbers.tolist())), 1000)
+        self.assertTrue(((numbers >= 1_000_000) & (numbers <= 1_001_999)).all())
+
+        with self.assertRaises(ValueError):
+            random_rut_numbers(rng, 11, 1, 10)
+
+
+class PolygonTests(unittest.TestCase):
+    def test_points_in_polygon(self):
+        square = ((0, 0), (0, 1), (1, 1), (1, 0))
+
+        self.assertEqual(
+            points_in_polygon([[0.5, 0.5], [1.5, 0.5], [0.5, -0.1]], square).tolist(),
+            [True, False, False]
+        )
+
+
+class ProviderTests(unittest.TestCase):
+    def setUp(self):
+        self.faker = Faker()
+        self.faker.add_provider(Provider)
+
+    def test_rut(self):
+        rut = self.faker.rut()
+
+        self.assertEqual(CLRutField().clean(rut), rut)
+        self.assertEqual(self.faker.rut(minimum=1000, maximum=1000), '1.000-6')
+        self.assertEqual(self.faker.rut(minimum=0, maximum=0), '0-0')
+
+    def test_ruts_batch_is_unique(self):
+        ruts = self.faker.rut_batch(50000)
+
+        self.assertEqual(len(set(ruts.tolist())), 50000)
+        self.assertEqual(CLRutField().clean(ruts[0]), ruts[0])
+
+    def test_santiago_points_inside_polygon(self):
+        points = self.faker.santiago_point_batch(5000)
+
+        self.assertEqual(points.shape, (5000, 2))
+        self.assertTrue(points_in_polygon(points, SANTIAGO_POLYGON).all())
+
+        point = self.faker.santiago_point()
+
+        self.assertIsInstance(point, list)
+        self.assertTrue(points_in_polygon([point]).all())
+
+    def test_seed_is_reproducible(self):
+        self.faker.seed_instance(7)
+        values = [self.faker.rut(), self.faker.rut_batch(3).tolist(), self.faker.santiago_point()]
+        self.faker.seed_instance(7)
+
+        self.assertEqual([self.faker.rut(), self.faker.rut_batch(3).tolist(), self.faker.santiago_point()], values)
+
+    def test_fixture_sequences_are_kept(self):
+        provider = Provider(self.faker)
+
+        self.assertEqual(len(provider.ruts), fixtures.FIXTURES_SIZE)
+        self.assertIn(self.faker.random_element(provider.ruts), fixtures.get_ruts())
+        self.assertEqual(provider.santiago_points.shape, (fixtures.FIXTURES_SIZE, 2))
+        self.assertTrue(points_in_polygon(provider.santiago_points).all())
+
+    def test_fixtures_module_constants(self):
+        self.assertEqual(fixtures.RUTS, list(fixtures.get_ruts()))
+        self.assertEqual(CLRutField().clean(fixtures.RUTS[0]), fixtures.RUTS[0])
+        self.assertEqual(len(fixtures.SANTIAGO_POINTS), fixtures.FIXTURES_SIZE)
+        ruts = fixtures.get_rut_array()[:3]
+
+        self.assertEqual(ruts['dv'].tolist(), rut_check_digits(ruts['number']).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,7 +27,27 @@ if not settings.configured:
     )
     django.setup()
 
-from django_general_utils.utils.formats import format_currency, format_decimal
+import numpy as np
+from django.core.management import call_command
+from django.db import connection, models
+
+from django_general_utils.models.base_without_safe_delete import BaseWithoutSafeDeleteModel
+from django_general_utils.utils.formats import (
+    NumberFormatter,
+    format_currency,
+    format_currency_batch,
+    format_decimal,
+    format_decimal_batch,
+    get_number_formatter,
+)
+
+
+class FormatAmountModel(BaseWithoutSafeDeleteModel):
+    amount = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_format_amount_model'
 
 
 class FormatCurrencyTests(unittest.TestCase):
@@ -69,5 +89,66 @@ class FormatDecimalTests(unittest.TestCase):
             format_decimal(10, locale='not-a-real-locale')
 
 
+class NumberFormatterTests(unittest.TestCase):
+    def test_formatter_is_cached_per_options(self):
+        formatter = get_number_formatter('es_CL', 'CLP')
+
+        self.assertIsInstance(formatter, NumberFormatter)
+        self.assertIs(get_number_formatter('es_CL', 'CLP'), formatter)
+        self.assertIsNot(get_number_formatter('es_CL', 'USD'), formatter)
+        self.assertIsNot(get_number_formatter('es_CL', 'CLP', group_separator=False), formatter)
+
+    def test_matches_babel(self):
+        from babel import numbers
+
+        for _kwargs in ({}, {'format_type': 'accounting'}, {'format_type': 'name'}, {'currency_digits': False}):
+            with self.subTest(**_kwargs):
+                self.assertEqual(
+                    format_currency(-1099.985, currency='USD', locale='en_US', **_kwargs),
+                    numbers.format_currency(-1099.985, 'USD', locale='en_US', **_kwargs)
+                )
+
+        self.assertEqual(
+            format_decimal(1234.5678, format='#,##0.0'),
+            numbers.format_decimal(1234.5678, '#,##0.0', 'es_CL')
+        )
+
+    def test_unknown_format_type(self):
+        from babel.numbers import UnknownCurrencyFormatError
+
+        with self.assertRaises(UnknownCurrencyFormatError):
+            format_currency(1000, format_type='other')
+
+
+class FormatBatchTests(unittest.TestCase):
+    def test_list_with_none(self):
+        self.assertEqual(format_currency_batch([1000, None, 1000, 2500.6]), ['$1.000', '', '$1.000', '$2.501'])
+        self.assertEqual(format_decimal_batch([1234.5, None], empty='-'), ['1.234,5', '-'])
+
+    def test_numpy_array(self):
+        self.assertEqual(format_decimal_batch(np.array([1234.5, 10])), ['1.234,5', '10'])
+
+    def test_equal_values_with_different_text(self):
+        self.assertEqual(format_decimal_batch([0.0, -0.0, Decimal('0')], locale='en_US'), ['0', '-0', '0'])
+
+    def test_queryset_column(self):
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(FormatAmountModel)
+
+        try:
+            FormatAmountModel.objects.create(amount=1000)
+            FormatAmountModel.objects.create(amount=None)
+            queryset = FormatAmountModel.objects.order_by('order')
+
+            self.assertEqual(queryset.format_currency('amount'), ['$1.000', ''])
+            self.assertEqual(queryset.format_decimal('amount', locale='en_US'), ['1,000', ''])
+        finally:
+            with connection.schema_editor() as schema_editor:
+                schema_editor.delete_model(FormatAmountModel)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+from django.db import models
+
+from django_general_utils.models.functions import FormattedCurrency, FormattedNumber
+from django_general_utils.models.functions.formatted_number import get_to_char_format
+
+
+class FormattedAmountModel(models.Model):
+    amount = models.DecimalField(max_digits=12, decimal_places=2, null=True)
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_formatted_amount_model'
+
+
+class ToCharFormatTests(unittest.TestCase):
+    def test_grouping(self):
+        self.assertEqual(get_to_char_format(1, (0, 3)), 'FM999,999,999,999,999,990.999')
+        self.assertEqual(get_to_char_format(1, (2, 2), (3, 2)), 'FM9,99,99,99,99,99,99,99,990.00')
+        self.assertEqual(get_to_char_format(1, (0, 0), group_separator=False), 'FM999999999999999990')
+
+
+class FormattedNumberTests(unittest.TestCase):
+    def get_sql(self, expression) -> str:
+        return str(FormattedAmountModel.objects.annotate(formatted=expression).values('formatted').query)
+
+    def test_decimal_es_cl(self):
+        sql = self.get_sql(FormattedNumber('amount'))
+
+        self.assertIn('to_char(', sql)
+        self.assertIn('FM999,999,999,999,999,990.999)', sql)
+        self.assertIn('rtrim(', sql)
+        self.assertIn('translate(', sql)
+        self.assertIn(', ,., .,)', sql)
+        self.assertIn('IS NULL THEN NULL', sql)
+        self.assertIn('< 0 THEN', sql)
+
+    def test_currency_clp(self):
+        sql = self.get_sql(FormattedCurrency('amount'))
+
+        self.assertIn('FM999,999,999,999,999,990)', sql)
+        self.assertNotIn('rtrim(', sql)
+        self.assertIn('COALESCE($-, )', sql)
+        self.assertIn('COALESCE($, )', sql)
+
+    def test_currency_digits_and_code(self):
+        sql = self.get_sql(FormattedCurrency('amount', locale='en_US', currency='USD', format='¤¤ #,##0.00'))
+
+        self.assertIn('990.00)', sql)
+        self.assertIn('USD ', sql)
+        self.assertIn(', ,., ,.)', sql)
+
+    def test_unsupported_patterns(self):
+        with self.assertRaises(ValueError):
+            FormattedCurrency('amount', format_type='name')
+
+        with self.assertRaises(ValueError):
+            FormattedNumber('amount', format='#E0')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+from django.core.management import call_command
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from django_general_utils.models.base import BaseModel
+from django_general_utils.models.simple_history import HistoricalRecords
+
+
+class HistoryNeighborsModel(BaseModel):
+    name = models.CharField(max_length=64)
+    amount = models.IntegerField(default=0)
+    note = models.CharField(max_length=64, null=True, blank=True)
+
+    history = HistoricalRecords(excluded_fields=['note'])
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_history_neighbors_model'
+
+
+class HistoryNeighborsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(HistoryNeighborsModel)
+            schema_editor.create_model(HistoryNeighborsModel.history.model)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(HistoryNeighborsModel.history.model)
+            schema_editor.delete_model(HistoryNeighborsModel)
+
+        super().tearDownClass()
+
+    def setUp(self):
+        self.instance = HistoryNeighborsModel.objects.create(name='a', note='nota')
+        self.instance.name = 'b'
+        self.instance.save()
+        self.instance.amount = 5
+        self.instance.save()
+
+        # Otro objeto: las ventanas son por objeto
+        self.other = HistoryNeighborsModel.objects.create(name='other')
+
+    def tearDown(self):
+        HistoryNeighborsModel.objects.all_with_deleted().hard_delete_policy_action()
+        HistoryNeighborsModel.history.model.objects.all().delete()
+
+    def _timeline(self):
+        return HistoryNeighborsModel.history.filter(id=self.instance.pk).with_neighbors().order_by('history_date')
+
+    def test_timeline_navigation_and_diffs_in_one_query(self):
+        with CaptureQueriesContext(connection) as context:
+            records = list(self._timeline())
+            navigation = [(_record.prev_record, _record.next_record) for _record in records]
+            diffs = [_record.diff_prev() for _record in records]
+
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(navigation[0], (None, records[1]))
+        self.assertEqual(navigation[1], (records[0], records[2]))
+        self.assertEqual(navigation[2], (records[1], None))
+        self.assertIsNone(diffs[0])
+        self.assertEqual(diffs[1].changed_fields, ['name'])
+        self.assertEqual([(_c.old, _c.new) for _c in diffs[1].changes], [('a', 'b')])
+        self.assertEqual(diffs[2].changed_fields, ['amount'])
+        self.assertIs(diffs[2].old_record, records[1])
+
+        return None
+
+    def test_diff_matches_diff_against(self):
+        records = list(self._timeline())
+
+        self.assertEqual(records[2].diff_prev(), records[2].diff_against(records[1]))
+
+        return None
+
+    def test_windows_are_partitioned_by_object(self):
+        record = HistoryNeighborsModel.history.with_neighbors().get(id=self.other.pk)
+
+        self.assertIsNone(record.prev_history_id)
+        self.assertIsNone(record.next_history_id)
+
+        return None
+
+    def test_neighbors_outside_the_filter_are_kept(self):
+        records = list(self._timeline())
+        filtered = list(
+            HistoryNeighborsModel.history.filter(id=self.instance.pk, history_type='~').with_neighbors()
+            .order_by('history_date')
+        )
+
+        self.assertEqual(filtered[0].prev_history_id, records[0].history_id)
+        self.assertEqual(filtered[0].diff_prev().changed_fields, ['name'])
+        self.assertEqual(filtered[0].next_record, filtered[1])
+
+        return None
+
+    def test_filters_after_with_neighbors_do_not_cut_neighbors(self):
+        records = list(self._timeline())
+        record = HistoryNeighborsModel.history.with_neighbors().get(history_id=records[1].history_id)
+
+        self.assertEqual(record.prev_history_id, records[0].history_id)
+        self.assertEqual(record.next_history_id, records[2].history_id)
+        self.assertEqual(record.diff_prev().changed_fields, ['name'])
+
+        return None
+
+    def test_neighbors_are_windows_over_the_full_history(self):
+        queryset = HistoryNeighborsModel.history.filter(id=self.instance.pk, history_type='~').with_neighbors()
+        sql = str(queryset.query)
+
+        self.assertIn('LAG(', sql)
+        self.assertIn('LEAD(', sql)
+        self.assertNotIn('LIMIT 1', sql)
+
+        return None
+
+    def test_exclude_and_neighbor_filters_after_with_neighbors(self):
+        records = list(self._timeline())
+        queryset = HistoryNeighborsModel.history.filter(id=self.instance.pk).with_neighbors()
+
+        self.assertEqual(
+            [_record.prev_history_id for _record in queryset.exclude(history_type='+').order_by('history_date')],
+            [records[0].history_id, records[1].history_id]
+        )
+        self.assertEqual(
+            list(queryset.filter(prev_history_id__isnull=True).values_list('history_id', flat=True)),
+            [records[0].history_id]
+        )
+        self.assertEqual(queryset.filter(prev_history_id__isnull=False).filter(history_type='~').count(), 2)
+
+        return None
+
+    def test_queryset_diffs_skip_first_records(self):
+        deltas = HistoryNeighborsModel.history.filter(id=self.instance.pk).diffs()
+
+        self.assertEqual(len(deltas), 2)
+
+        return None
+
+    def test_navigation_without_annotations_still_works(self):
+        records = list(HistoryNeighborsModel.history.filter(id=self.instance.pk).order_by('history_date'))
+
+        self.assertEqual(records[1].prev_record, records[0])
+        self.assertEqual(records[1].next_record, records[2])
+        self.assertEqual(records[1].diff_prev().changed_fields, ['name'])
+
+        return None
+
+    def test_excluded_fields_are_annotated_for_instance(self):
+        records = list(HistoryNeighborsModel.history.filter(id=self.instance.pk).with_excluded_fields())
+
+        with CaptureQueriesContext(connection) as context:
+            notes = {_record.instance.note for _record in records}
+
+        self.assertEqual(notes, {'nota'})
+        self.assertEqual(len(context.captured_queries), 0)
+
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
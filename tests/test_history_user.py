@@ -0,0 +1,157 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+from types import SimpleNamespace
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection, models, transaction
+from django.test.utils import CaptureQueriesContext
+
+from django_general_utils.models.base import BaseModel
+from django_general_utils.models.simple_history import HistoricalRecords
+
+
+class HistoryUserModel(BaseModel):
+    name = models.CharField(max_length=64, null=True, blank=True)
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_history_user_model'
+
+
+class HistoryUserTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(HistoryUserModel)
+            schema_editor.create_model(HistoryUserModel.history.model)
+
+        cls.user, _ = User.objects.get_or_create(username='history-user')
+        cls.other_user, _ = User.objects.get_or_create(username='history-other-user')
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(HistoryUserModel.history.model)
+            schema_editor.delete_model(HistoryUserModel)
+
+        super().tearDownClass()
+
+    def setUp(self):
+        HistoricalRecords.context.request = SimpleNamespace(user=self.user)
+
+    def tearDown(self):
+        del HistoricalRecords.context.request
+
+    def _updates(self, context):
+        return [
+            _query['sql']
+            for _query in context.captured_queries
+            if _query['sql'].startswith('UPDATE') and HistoryUserModel._meta.db_table in _query['sql']
+        ]
+
+    def test_create_persists_updated_by_without_extra_update(self):
+        with CaptureQueriesContext(connection) as context:
+            instance = HistoryUserModel.objects.create(name='created')
+
+        instance.refresh_from_db()
+
+        self.assertEqual(instance.updated_by, self.user)
+        self.assertEqual(instance.history.first().history_user, self.user)
+        self.assertEqual(self._updates(context), [])
+
+        return None
+
+    def test_update_rides_along_in_the_same_statement(self):
+        instance = HistoryUserModel.objects.create(name='before')
+        HistoricalRecords.context.request = SimpleNamespace(user=self.other_user)
+        instance.name = 'after'
+
+        with CaptureQueriesContext(connection) as context:
+            instance.save()
+
+        instance.refresh_from_db()
+
+        self.assertEqual(instance.updated_by, self.other_user)
+        self.assertEqual(len(self._updates(context)), 1)
+
+        return None
+
+    def test_update_fields_are_corrected_once_per_transaction(self):
+        instances = [HistoryUserModel.objects.create(name=f'row-{_i}') for _i in range(3)]
+        HistoricalRecords.context.request = SimpleNamespace(user=self.other_user)
+
+        with CaptureQueriesContext(connection) as context:
+            with transaction.atomic():
+                for _instance in instances:
+                    _instance.name = 'renamed'
+                    _instance.save(update_fields=['name'])
+
+        updates = self._updates(context)
+        updated_by = HistoryUserModel.objects.filter(pk__in=[_i.pk for _i in instances]).values_list(
+            'updated_by',
+            flat=True
+        )
+
+        self.assertEqual(len(updates), 4)
+        self.assertEqual(set(updated_by), {self.other_user.pk})
+
+        return None
+
+    def test_correction_is_discarded_on_rollback(self):
+        instance = HistoryUserModel.objects.create(name='before')
+        HistoricalRecords.context.request = SimpleNamespace(user=self.other_user)
+
+        try:
+            with transaction.atomic():
+                instance.name = 'rolled-back'
+                instance.save(update_fields=['name'])
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        instance.name = 'after'
+
+        with transaction.atomic():
+            instance.save(update_fields=['name'])
+
+        instance.refresh_from_db()
+
+        self.assertEqual(instance.updated_by, self.other_user)
+
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
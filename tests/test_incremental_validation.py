@@ -0,0 +1,219 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection, models
+from django.db.models import Exists, F, OuterRef, Q
+from django.test.utils import CaptureQueriesContext
+
+from django_general_utils.models.base_without_safe_delete import BaseWithoutSafeDeleteModel
+from django_general_utils.models.constraints import (
+    CheckFlowStatusConstraint,
+    CheckModelRelationConstraint,
+    CheckRowsModelConstraint,
+    UniqueWithoutSafeDeleteConstraint,
+)
+from django_general_utils.models.constraints.base_constraint import get_expression_referenced_fields
+from django_general_utils.models.validation import get_changed_fields, get_referenced_fields
+
+RELATION_CHECK_CALLS = []
+
+
+def _relation_check(instance):
+    RELATION_CHECK_CALLS.append(instance.name)
+
+    return False
+
+
+class IncrementalValidationModel(BaseWithoutSafeDeleteModel):
+    _full_clean_changed_only = True
+
+    code = models.CharField(max_length=20)
+    name = models.CharField(max_length=20, null=True, blank=True)
+    status = models.CharField(max_length=1, default='P', choices=[('P', 'Pendiente'), ('E', 'Enviado')])
+
+    class Meta:
+        app_label = 'tests'
+        db_table = 'test_incremental_validation_model'
+        constraints = [
+            UniqueWithoutSafeDeleteConstraint(prefix='incval', fields=['code']),
+            CheckFlowStatusConstraint(name='incval_flow', flow={'P': ['E'], 'E': []}),
+            CheckModelRelationConstraint(name='incval_relation', fields=['name'], check=_relation_check),
+        ]
+
+
+class IncrementalValidationTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(IncrementalValidationModel)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(IncrementalValidationModel)
+
+        super().tearDownClass()
+
+    def setUp(self):
+        IncrementalValidationModel.objects.all().delete()
+        RELATION_CHECK_CALLS.clear()
+
+    def test_create_runs_full_validation(self):
+        IncrementalValidationModel.objects.create(code='A', name='first')
+
+        self.assertEqual(RELATION_CHECK_CALLS, ['first'])
+
+        return None
+
+    def test_status_flip_skips_unrelated_constraints_and_unique_queries(self):
+        instance = IncrementalValidationModel.objects.create(code='A', name='first')
+        RELATION_CHECK_CALLS.clear()
+
+        instance.status = 'E'
+
+        with CaptureQueriesContext(connection) as context:
+            instance.save()
+
+        self.assertEqual(RELATION_CHECK_CALLS, [])
+        self.assertFalse(any(_query['sql'].startswith('SELECT') for _query in context.captured_queries))
+
+        return None
+
+    def test_changed_field_runs_its_constraints(self):
+        instance = IncrementalValidationModel.objects.create(code='A', name='first')
+        RELATION_CHECK_CALLS.clear()
+
+        instance.name = 'second'
+        instance.save()
+
+        self.assertEqual(RELATION_CHECK_CALLS, ['second'])
+
+        return None
+
+    def test_changed_unique_field_is_still_validated(self):
+        IncrementalValidationModel.objects.create(code='A')
+        instance = IncrementalValidationModel.objects.create(code='B')
+
+        instance.code = 'A'
+
+        with self.assertRaises(ValidationError):
+            instance.save()
+
+        return None
+
+    def test_changed_field_is_cleaned(self):
+        instance = IncrementalValidationModel.objects.create(code='A')
+
+        instance.status = 'X'
+
+        with self.assertRaises(ValidationError) as ctx:
+            instance.save()
+
+        self.assertIn('status', ctx.exception.message_dict)
+
+        return None
+
+    def test_flow_constraint_still_runs_on_status_change(self):
+        instance = IncrementalValidationModel.objects.create(code='A', status='E')
+
+        instance.status = 'P'
+
+        with self.assertRaises(ValidationError):
+            instance.save()
+
+        return None
+
+    def test_full_clean_all_forces_full_validation(self):
+        instance = IncrementalValidationModel.objects.create(code='A', name='first')
+        RELATION_CHECK_CALLS.clear()
+
+        instance.status = 'E'
+        instance.save(full_clean='all')
+
+        self.assertEqual(RELATION_CHECK_CALLS, ['first'])
+
+        return None
+
+    def test_changed_fields_use_field_names_not_attnames(self):
+        user = User.objects.create(username='incremental-validation')
+        instance = IncrementalValidationModel.objects.create(code='A')
+
+        instance.updated_by = user
+
+        self.assertEqual(get_changed_fields(instance), {'updated_by'})
+
+        return None
+
+
+class ReferencedFieldsTests(unittest.TestCase):
+    def test_lookups_and_f_expressions(self):
+        referenced = get_expression_referenced_fields(Q(a=1) | ~Q(b__gt=F('c__name')))
+
+        self.assertEqual(referenced, {'a', 'b', 'c'})
+
+        return None
+
+    def test_subquery_is_unknown(self):
+        subquery = Exists(User.objects.filter(pk=OuterRef('created_by')))
+
+        self.assertIsNone(get_expression_referenced_fields(Q(subquery)))
+
+        return None
+
+    def test_unique_constraint_fields(self):
+        constraint = IncrementalValidationModel._meta.constraints[0]
+
+        self.assertEqual(get_referenced_fields(constraint, IncrementalValidationModel), {'code'})
+
+        return None
+
+    def test_relation_constraint_without_fields_always_runs(self):
+        constraint = CheckModelRelationConstraint(name='c', check=_relation_check)
+
+        self.assertIsNone(get_referenced_fields(constraint, IncrementalValidationModel))
+
+        return None
+
+    def test_max_rows_constraint_depends_on_check_and_soft_delete(self):
+        constraint = CheckRowsModelConstraint(max_rows=1, name='c', check=Q(status='P'))
+
+        self.assertEqual(constraint.get_referenced_fields(IncrementalValidationModel), {'status', 'deleted'})
+
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
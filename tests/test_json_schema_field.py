@@ -0,0 +1,179 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.db import models
+
+from django_general_utils.models.fields import json_schema_field
+from django_general_utils.models.fields.json_schema_field import JSONSchemaField
+from django_general_utils.models.validation import full_clean_batch
+
+SCHEMA_DIR = tempfile.mkdtemp()
+SCHEMA_PATH = os.path.join(SCHEMA_DIR, 'schema.json')
+
+
+def _write_schema(schema: dict, mtime: float = None) -> None:
+    with open(SCHEMA_PATH, 'w') as file:
+        file.write(json.dumps(schema))
+
+    if mtime is not None:
+        os.utime(SCHEMA_PATH, (mtime, mtime))
+
+    return None
+
+
+def tearDownModule():
+    shutil.rmtree(SCHEMA_DIR, ignore_errors=True)
+
+
+class JSONSchemaModel(models.Model):
+    data = JSONSchemaField(schema=SCHEMA_PATH, default=dict, blank=True)
+
+    class Meta:
+        app_label = 'tests'
+
+
+class JSONSchemaFieldTests(unittest.TestCase):
+    SCHEMA = {
+        'type': 'object',
+        'properties': {'name': {'type': 'string'}, 'count': {'type': 'integer'}},
+        'required': ['name'],
+    }
+
+    def setUp(self):
+        json_schema_field._validators.clear()
+        _write_schema(self.SCHEMA, mtime=1_000_000)
+        self.field = JSONSchemaModel._meta.get_field('data')
+
+    def test_invalid_value_raises_validation_error(self):
+        with self.assertRaises(ValidationError) as e:
+            self.field.validate({'name': 1}, None)
+
+        self.assertEqual(e.exception.code, 'invalid')
+
+        return None
+
+    def test_validator_is_compiled_once(self):
+        validator = self.field.get_validator()
+
+        with mock.patch('builtins.open', side_effect=AssertionError('schema reloaded')):
+            for _ in range(3):
+                self.field.validate({'name': 'a'}, None)
+
+        self.assertIs(self.field.get_validator(), validator)
+
+        return None
+
+    def test_schema_is_reloaded_when_mtime_changes_in_debug(self):
+        self.field.validate({'name': 'a'}, None)
+
+        _write_schema({'type': 'object', 'properties': {'name': {'type': 'integer'}}}, mtime=2_000_000)
+
+        with self.settings_debug(True), self.assertRaises(ValidationError):
+            self.field.validate({'name': 'a'}, None)
+
+        return None
+
+    def test_schema_is_not_reloaded_without_debug(self):
+        self.field.validate({'name': 'a'}, None)
+
+        _write_schema({'type': 'object', 'properties': {'name': {'type': 'integer'}}}, mtime=2_000_000)
+
+        with self.settings_debug(False):
+            self.field.validate({'name': 'a'}, None)
+
+        return None
+
+    def test_validates_once_per_save(self):
+        instance = JSONSchemaModel(data={'name': 'a'})
+
+        with mock.patch.object(JSONSchemaField, '_get_schema_error', autospec=True, return_value=None) as get_error:
+            instance.full_clean()
+            self.field.pre_save(instance, True)
+
+        self.assertEqual(get_error.call_count, 1)
+
+        return None
+
+    def test_pre_save_validates_values_changed_after_full_clean(self):
+        instance = JSONSchemaModel(data={'name': 'a'})
+        instance.full_clean()
+        instance.data['name'] = 1
+
+        with self.assertRaises(ValidationError):
+            self.field.pre_save(instance, True)
+
+        return None
+
+    def test_pre_save_detects_changes_equal_in_python(self):
+        instance = JSONSchemaModel(data={'name': 'a', 'count': 1})
+        instance.full_clean()
+        # `1 == True` en Python, pero `true` no es un integer para el schema
+        instance.data['count'] = True
+
+        with self.assertRaises(ValidationError):
+            self.field.pre_save(instance, True)
+
+        return None
+
+    def test_validate_batch(self):
+        instances = [JSONSchemaModel(data=_data) for _data in ({'name': 'a'}, {'count': 1}, {'name': 'b'}, {'name': 2})]
+        errors = self.field.validate_batch(instances)
+
+        self.assertEqual(sorted(errors), [1, 3])
+        self.assertTrue(all(isinstance(_error, ValidationError) for _error in errors.values()))
+
+        return None
+
+    def test_full_clean_batch_validates_schema_once_per_instance(self):
+        instances = [JSONSchemaModel(data={'name': 'a'}), JSONSchemaModel(data={'name': 2})]
+
+        get_schema_error = JSONSchemaField._get_schema_error
+
+        with mock.patch.object(
+                JSONSchemaField, '_get_schema_error', autospec=True, side_effect=get_schema_error
+        ) as get_error:
+            errors = full_clean_batch(instances)
+
+        self.assertEqual(get_error.call_count, 2)
+        self.assertEqual(errors[0].message_dict, {})
+        self.assertEqual(list(errors[1].message_dict), ['data'])
+
+        return None
+
+    def settings_debug(self, value: bool):
+        return mock.patch.object(settings, 'DEBUG', value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+from django.core.management import call_command
+from django.db import connection, models
+from django.db.models import Q
+
+from django_general_utils.checks import check_soft_delete_indexes
+from django_general_utils.models import fields
+from django_general_utils.models.base import BaseModel
+from django_general_utils.models.indexes import is_soft_delete_partial
+
+
+class PartialIndexParentModel(BaseModel):
+    name = models.CharField(max_length=64)
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_partial_index_parent_model'
+
+
+class PartialIndexChildModel(BaseModel):
+    _soft_delete_partial_indexes = True
+
+    name = models.CharField(max_length=64)
+    code = models.CharField(max_length=64)
+    parent = fields.ForeignKey(PartialIndexParentModel, on_delete=models.CASCADE, related_name='children')
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_partial_index_child_model'
+        indexes = [
+            models.Index(fields=['name'], name='partial_child_name_idx'),
+            models.Index(fields=['code'], name='partial_child_code_idx', condition=Q(code__gt='')),
+        ]
+
+
+class PartialIndexWithoutFkIndexModel(BaseModel):
+    _soft_delete_partial_indexes = True
+
+    parent = fields.ForeignKey(PartialIndexParentModel, on_delete=models.CASCADE, db_index=False, related_name='+')
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_partial_index_without_fk_index_model'
+
+
+class PartialIndexTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(PartialIndexParentModel)
+            schema_editor.create_model(PartialIndexChildModel)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(PartialIndexChildModel)
+            schema_editor.delete_model(PartialIndexParentModel)
+
+        super().tearDownClass()
+
+    def test_declared_indexes_become_partial(self):
+        indexes = {_index.name: _index for _index in PartialIndexChildModel._meta.indexes}
+
+        self.assertEqual(indexes['partial_child_name_idx'].condition, Q(deleted__isnull=True))
+        self.assertEqual(indexes['partial_child_code_idx'].condition, Q(code__gt='') & Q(deleted__isnull=True))
+
+        return None
+
+    def test_fk_indexes_are_replaced(self):
+        parent = PartialIndexChildModel._meta.get_field('parent')
+        fk_indexes = [
+            _index
+            for _index in PartialIndexChildModel._meta.indexes
+            if _index.fields == ['parent'] and is_soft_delete_partial(_index)
+        ]
+
+        self.assertFalse(parent.db_index)
+        self.assertEqual(len(fk_indexes), 1)
+        self.assertTrue(fk_indexes[0].name.endswith('_pdx'))
+        self.assertTrue(PartialIndexParentModel._meta.get_field('created_by').db_index)
+
+        return None
+
+    def test_indexes_are_created_with_where_clause(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'test_partial_index_child_model'"
+            )
+            partial = [_sql for _sql, in cursor.fetchall() if _sql and '"deleted" IS NULL' in _sql]
+
+        for _column in ('"name"', '"code"', '"created_by_id"', '"updated_by_id"', '"parent_id"'):
+            self.assertEqual(len([_sql for _sql in partial if f'({_column}' in _sql]), 1, _column)
+
+        return None
+
+    def test_check_lists_fk_columns_without_partial_index(self):
+        messages = {_message.obj: _message for _message in check_soft_delete_indexes()}
+
+        self.assertNotIn(PartialIndexChildModel, messages)
+        # Solo se revisan los modelos que activaron los índices parciales
+        self.assertNotIn(PartialIndexParentModel, messages)
+        self.assertEqual(messages[PartialIndexWithoutFkIndexModel].id, 'django_general_utils.I001')
+        self.assertIn('parent_id', messages[PartialIndexWithoutFkIndexModel].msg)
+        self.assertNotIn('created_by_id', messages[PartialIndexWithoutFkIndexModel].msg)
+
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
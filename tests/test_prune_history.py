@@ -0,0 +1,328 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+import datetime
+import os
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection, connections, models
+from django.db.migrations.state import ProjectState
+from django.utils import timezone
+
+from django_general_utils.management.commands.prune_history import Command
+from django_general_utils.models.base import BaseModel
+from django_general_utils.models.operations import PartitionHistoryTable
+from django_general_utils.models.operations.partition_history import (
+    add_months,
+    create_month_partitions,
+    get_partition_name,
+    get_partitions,
+    parse_partition_month,
+)
+from django_general_utils.models.simple_history import prune_history
+
+
+class PruneHistoryModel(BaseModel):
+    _history_retention = datetime.timedelta(days=30)
+
+    name = models.CharField(max_length=64)
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_prune_history_model'
+
+
+class PruneHistoryTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(PruneHistoryModel)
+            schema_editor.create_model(PruneHistoryModel.history.model)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(PruneHistoryModel.history.model)
+            schema_editor.delete_model(PruneHistoryModel)
+
+        super().tearDownClass()
+
+    def setUp(self):
+        now = timezone.now()
+        self.objs = []
+
+        # 3 registros antiguos y 1 reciente por objeto
+        for _name in ('a', 'b'):
+            obj = PruneHistoryModel.objects.create(name=_name)
+
+            for _i in range(3):
+                obj.name = f'{_name}-{_i}'
+                obj.save()
+
+            self.objs.append(obj)
+
+            for _days, _record in zip((90, 80, 70, 1), obj.history.order_by('history_date')):
+                PruneHistoryModel.history.filter(history_id=_record.history_id).update(
+                    history_date=now - datetime.timedelta(days=_days)
+                )
+
+    def tearDown(self):
+        PruneHistoryModel.objects.all_with_deleted().hard_delete_policy_action()
+        PruneHistoryModel.history.model.objects.all().delete()
+
+    def test_drop_removes_records_older_than_retention(self):
+        result = prune_history(PruneHistoryModel)
+
+        self.assertEqual(result['deleted'], 6)
+        self.assertEqual(PruneHistoryModel.history.count(), 2)
+
+        return None
+
+    def test_compact_keeps_latest_record_before_cutoff(self):
+        result = prune_history(PruneHistoryModel, mode='compact')
+        cutoff = timezone.now() - datetime.timedelta(days=30)
+
+        self.assertEqual(result['deleted'], 4)
+        self.assertEqual(
+            sorted(PruneHistoryModel.history.filter(history_date__lt=cutoff).values_list('name', flat=True)),
+            ['a-1', 'b-1']
+        )
+
+        return None
+
+    def test_batches_are_bounded(self):
+        result = prune_history(PruneHistoryModel, batch_size=2, max_batches=2)
+
+        self.assertEqual(result['deleted'], 4)
+        self.assertEqual(PruneHistoryModel.history.count(), 4)
+
+        return None
+
+    def test_dry_run_does_not_delete(self):
+        result = prune_history(PruneHistoryModel, dry_run=True)
+
+        self.assertEqual(result['deleted'], 6)
+        self.assertEqual(PruneHistoryModel.history.count(), 8)
+
+        return None
+
+    def test_models_without_retention_are_skipped(self):
+        PruneHistoryModel._history_retention = None
+
+        try:
+            self.assertEqual(prune_history(PruneHistoryModel)['deleted'], 0)
+        finally:
+            PruneHistoryModel._history_retention = datetime.timedelta(days=30)
+
+        return None
+
+    def test_command(self):
+        stdout = StringIO()
+
+        call_command(Command(), 'auth.PruneHistoryModel', '--days=75', stdout=stdout)
+
+        self.assertIn('auth.PruneHistoryModel: 0 particiones creadas, 0 particiones eliminadas, 4', stdout.getvalue())
+        self.assertEqual(PruneHistoryModel.history.count(), 4)
+
+        return None
+
+
+class PartitionHistoryOperationTests(unittest.TestCase):
+    def test_month_helpers(self):
+        self.assertEqual(add_months(datetime.date(2024, 11, 15), 3), datetime.date(2025, 2, 1))
+        self.assertEqual(get_partition_name('history', datetime.date(2024, 3, 1)), 'history_p202403')
+        self.assertEqual(parse_partition_month('history', 'history_p202403'), datetime.date(2024, 3, 1))
+        self.assertIsNone(parse_partition_month('history', 'history_default'))
+
+        return None
+
+    def test_deconstruct(self):
+        self.assertEqual(
+            PartitionHistoryTable('HistoricalInvoice', months_ahead=6).deconstruct(),
+            ('PartitionHistoryTable', [], {'model_name': 'HistoricalInvoice', 'months_ahead': 6})
+        )
+
+        return None
+
+    def test_is_noop_outside_postgres(self):
+        operation = PartitionHistoryTable('HistoricalInvoice')
+        state = ProjectState()
+
+        with connection.schema_editor() as schema_editor:
+            operation.database_forwards('auth', schema_editor, state, state)
+            operation.database_backwards('auth', schema_editor, state, state)
+
+        return None
+
+    def get_partitioned_connection(self, partitions: list, default: str | None, default_has_rows: bool):
+        """
+        Conexión postgres simulada que registra las sentencias ejecutadas.
+        """
+        cursor = mock.MagicMock()
+        cursor.fetchall.return_value = [(_name,) for _name in partitions]
+        cursor.fetchone.side_effect = [(default,) if default is not None else None, (default_has_rows,)]
+        mocked = mock.MagicMock(vendor='postgresql', alias='default')
+        mocked.ops.quote_name.side_effect = lambda name: f'"{name}"'
+        mocked.cursor.return_value.__enter__.return_value = cursor
+
+        return mocked, cursor
+
+    def get_statements(self, cursor) -> list:
+        return [' '.join(_call.args[0].split()[:4]) for _call in cursor.execute.call_args_list]
+
+    def test_create_month_partitions_moves_rows_out_of_default(self):
+        mocked, cursor = self.get_partitioned_connection(['history_p202401'], 'history_default', True)
+
+        created = create_month_partitions(
+            mocked,
+            'history',
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 3, 1),
+        )
+
+        self.assertEqual(created, ['history_p202402', 'history_p202403'])
+        self.assertEqual(self.get_statements(cursor)[2:], [
+            'SELECT EXISTS (SELECT 1',
+            'ALTER TABLE "history" DETACH',
+            'CREATE TABLE "history_p202402" PARTITION',
+            'CREATE TABLE "history_p202403" PARTITION',
+            'WITH moved AS (DELETE',
+            'ALTER TABLE "history" ATTACH',
+        ])
+        self.assertEqual(
+            cursor.execute.call_args_list[-2].args[1],
+            ['2024-02-01 00:00:00+00', '2024-04-01 00:00:00+00']
+        )
+
+        return None
+
+    def test_create_month_partitions_keeps_empty_default_attached(self):
+        mocked, cursor = self.get_partitioned_connection([], 'history_default', False)
+
+        create_month_partitions(mocked, 'history', datetime.date(2024, 1, 1), datetime.date(2024, 1, 1))
+
+        self.assertEqual(self.get_statements(cursor)[2:], [
+            'SELECT EXISTS (SELECT 1',
+            'CREATE TABLE "history_p202401" PARTITION',
+        ])
+
+        return None
+
+    def test_create_month_partitions_without_missing_months(self):
+        mocked, cursor = self.get_partitioned_connection(['history_p202401'], None, False)
+
+        self.assertEqual(
+            create_month_partitions(mocked, 'history', datetime.date(2024, 1, 1), datetime.date(2024, 1, 31)),
+            []
+        )
+        self.assertEqual(cursor.execute.call_count, 1)
+
+        return None
+
+
+@unittest.skipUnless(os.environ.get('POSTGRES_TEST_NAME'), 'Requiere POSTGRES_TEST_NAME con una base de prueba')
+class PartitionHistoryPostgresTests(unittest.TestCase):
+    """
+    Ejecuta el SQL de particiones contra un Postgres real (POSTGRES_TEST_NAME, POSTGRES_TEST_USER,
+    POSTGRES_TEST_PASSWORD, POSTGRES_TEST_HOST, POSTGRES_TEST_PORT).
+    """
+    table = 'test_partition_history'
+
+    @classmethod
+    def setUpClass(cls):
+        connections.settings['postgres'] = {
+            **connections.settings['default'],
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ['POSTGRES_TEST_NAME'],
+            'USER': os.environ.get('POSTGRES_TEST_USER', 'postgres'),
+            'PASSWORD': os.environ.get('POSTGRES_TEST_PASSWORD', ''),
+            'HOST': os.environ.get('POSTGRES_TEST_HOST', 'localhost'),
+            'PORT': os.environ.get('POSTGRES_TEST_PORT', '5432'),
+        }
+        cls.connection = connections['postgres']
+
+        return None
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.connection.close()
+        del connections['postgres']
+        del connections.settings['postgres']
+
+        return None
+
+    def setUp(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE TABLE {self.table} (history_id integer, history_date timestamptz) '
+                f'PARTITION BY RANGE (history_date)'
+            )
+            cursor.execute(f'CREATE TABLE {self.table}_default PARTITION OF {self.table} DEFAULT')
+            cursor.execute(
+                f'INSERT INTO {self.table} VALUES (1, %s), (2, %s)',
+                ['2024-02-10 12:00:00+00', '2030-01-01 00:00:00+00']
+            )
+
+        return None
+
+    def tearDown(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE {self.table} CASCADE')
+
+        return None
+
+    def test_rows_in_default_are_moved_to_new_partition(self):
+        created = create_month_partitions(
+            self.connection,
+            self.table,
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 3, 1),
+        )
+
+        self.assertEqual(len(created), 3)
+        self.assertEqual(len(get_partitions(self.connection, self.table)), 3)
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'SELECT history_id FROM {self.table}_p202402')
+            self.assertEqual(cursor.fetchall(), [(1,)])
+            cursor.execute(f'SELECT history_id FROM {self.table}_default')
+            self.assertEqual(cursor.fetchall(), [(2,)])
+            cursor.execute(f'INSERT INTO {self.table} VALUES (3, %s)', ['2031-01-01 00:00:00+00'])
+
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+import datetime
+import decimal
+
+from django.db import connection, models
+from django.db.models import F, Q
+from django.test.utils import CaptureQueriesContext
+
+from django_general_utils.models.constraints import CheckConstraint, CheckErrorConstraint
+from django_general_utils.models.constraints.q_evaluator import Unsupported, check_q, evaluate_q
+
+
+class QEvaluatorModel(models.Model):
+    status = models.CharField(max_length=1, default='P')
+    amount = models.IntegerField(null=True)
+    limit = models.IntegerField(null=True)
+    price = models.DecimalField(max_digits=8, decimal_places=2, null=True)
+    date = models.DateField(null=True)
+    active = models.BooleanField(default=True)
+
+    class Meta:
+        app_label = 'tests'
+        db_table = 'test_q_evaluator_model'
+        constraints = [
+            CheckErrorConstraint(name='q_eval_error', check=Q(status='X') & Q(amount__gt=10)),
+            CheckConstraint(name='q_eval_check', check=Q(amount__isnull=True) | Q(amount__gte=0)),
+        ]
+
+
+CASES = [
+    Q(status='P'),
+    Q(status='E'),
+    ~Q(status='P'),
+    Q(status__in=['P', 'E', None]),
+    Q(amount__gt=5),
+    Q(amount__lte=5),
+    ~Q(amount__gt=5),
+    Q(amount__isnull=True),
+    Q(amount=None),
+    Q(amount__gt=F('limit')),
+    Q(amount='10'),
+    Q(price__gte=decimal.Decimal('10.5')),
+    Q(price__lt=11),
+    Q(date__gte=datetime.date(2024, 1, 1)),
+    Q(active=True),
+    Q(active=False) | Q(amount__gt=5),
+    Q(status='P') & ~Q(amount__lt=0),
+    Q(status='P') | Q(amount__gt=100),
+    Q(status='E') & Q(amount__gt=100),
+]
+
+INSTANCES = [
+    QEvaluatorModel(status='P', amount=10, limit=3, price=decimal.Decimal('10.50'), date=datetime.date(2024, 5, 1)),
+    QEvaluatorModel(status='E', amount=1, limit=3, price=decimal.Decimal('9.99'), date=datetime.date(2023, 1, 1)),
+    QEvaluatorModel(status='P', amount=None, limit=None, price=None, date=None, active=False),
+]
+
+
+class QEvaluatorTests(unittest.TestCase):
+    def _against(self, instance):
+        return instance._get_field_expression_map(meta=QEvaluatorModel._meta)
+
+    def test_matches_database_check(self):
+        for _instance in INSTANCES:
+            against = self._against(_instance)
+
+            for _q in CASES:
+                with self.subTest(q=_q, status=_instance.status, amount=_instance.amount):
+                    self.assertEqual(evaluate_q(_q, against) is not False, _q.check(against))
+
+        return None
+
+    def test_unknown_is_null(self):
+        against = self._against(INSTANCES[2])
+
+        self.assertIsNone(evaluate_q(Q(amount__gt=5), against))
+        self.assertIsNone(evaluate_q(~Q(amount__gt=5), against))
+        self.assertFalse(evaluate_q(Q(amount__gt=5) & Q(status='E'), against))
+        self.assertTrue(evaluate_q(Q(amount__gt=5) | Q(status='P'), against))
+
+        return None
+
+    def test_unsupported_lookups(self):
+        against = self._against(INSTANCES[0])
+
+        unsupported = (
+            Q(status__icontains='p'),
+            Q(status__gt='A'),
+            Q(missing=1),
+            Q(status__in=QEvaluatorModel.objects.values('status')),
+        )
+
+        for _q in unsupported:
+            with self.subTest(q=_q), self.assertRaises(Unsupported):
+                evaluate_q(_q, against)
+
+        return None
+
+    def test_check_q_falls_back_to_database(self):
+        against = self._against(INSTANCES[0])
+
+        with CaptureQueriesContext(connection) as context:
+            self.assertTrue(check_q(Q(status__icontains='p'), against))
+
+        self.assertEqual(len(context.captured_queries), 1)
+
+        return None
+
+    def test_constraints_validate_without_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            for _instance in INSTANCES:
+                _instance.validate_constraints()
+
+        self.assertEqual(context.captured_queries, [])
+
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,245 @@
+import asyncio
+import threading
+import time
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection, models, transaction
+from django.db.models.signals import post_save
+
+from django_general_utils.models.base_without_safe_delete import BaseWithoutSafeDeleteModel
+from django_general_utils.models.signals import SignalRegister
+from django_general_utils.utils.executors import AsyncExecutor, InProcessExecutor, ThreadExecutor
+from django_general_utils.utils.executors.base import BaseExecutor
+
+
+class SignalRegisterModel(BaseWithoutSafeDeleteModel):
+    name = models.CharField(max_length=64, null=True, blank=True)
+
+    class Meta:
+        app_label = 'tests'
+        db_table = 'test_signal_register_model'
+
+
+class SignalRegisterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(SignalRegisterModel)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(SignalRegisterModel)
+
+        super().tearDownClass()
+
+    def setUp(self):
+        self.calls = []
+        self.registers = []
+
+    def tearDown(self):
+        for _register in self.registers:
+            _register.unregister()
+
+    def _register(self, callback, **kwargs):
+        register = SignalRegister(callback, post_save, **kwargs)
+        register.set_model(SignalRegisterModel)
+        register.register()
+        self.registers.append(register)
+
+        return register
+
+    def _callback(self, sender, instance, **kwargs):
+        self.calls.append((instance.name, threading.current_thread().name))
+
+    def test_without_run_in_runs_synchronously(self):
+        self._register(self._callback)
+
+        SignalRegisterModel.objects.create(name='sync')
+
+        self.assertEqual(self.calls, [('sync', threading.current_thread().name)])
+
+        return None
+
+    def test_deferred_callback_waits_for_commit(self):
+        executor = InProcessExecutor()
+        self._register(self._callback, run_in='thread', executor=executor)
+
+        with transaction.atomic():
+            SignalRegisterModel.objects.create(name='deferred')
+
+            self.assertEqual(self.calls, [])
+
+        self.assertEqual([_call[0] for _call in self.calls], ['deferred'])
+        self.assertEqual(executor.metrics.completed, 1)
+
+        return None
+
+    def test_deferred_callback_is_dropped_on_rollback(self):
+        executor = InProcessExecutor()
+        self._register(self._callback, run_in='thread', executor=executor)
+
+        try:
+            with transaction.atomic():
+                SignalRegisterModel.objects.create(name='rolled-back')
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        self.assertEqual(self.calls, [])
+        self.assertEqual(executor.metrics.submitted, 0)
+
+        return None
+
+    def test_callback_errors_are_isolated(self):
+        def _failing(sender, instance, **kwargs):
+            raise ValueError('boom')
+
+        executor = InProcessExecutor()
+        self._register(_failing, run_in='thread', executor=executor)
+
+        with self.assertLogs('django_general_utils.utils.executors.base', level='ERROR'):
+            SignalRegisterModel.objects.create(name='failing')
+
+        self.assertEqual(executor.metrics.failed, 1)
+        self.assertEqual(executor.metrics.in_flight, 0)
+
+        return None
+
+    def test_thread_executor_runs_outside_request_thread(self):
+        executor = ThreadExecutor(max_workers=2)
+        self._register(self._callback, run_in='thread', executor=executor)
+
+        SignalRegisterModel.objects.create(name='threaded')
+
+        self.assertTrue(executor.wait(timeout=5))
+        self.assertEqual(len(self.calls), 1)
+        self.assertNotEqual(self.calls[0][1], threading.current_thread().name)
+        executor.shutdown()
+
+        return None
+
+    def test_async_callback_defaults_to_async_executor(self):
+        async def _async_callback(sender, instance, **kwargs):
+            self.calls.append((instance.name, None))
+
+        executor = AsyncExecutor(max_workers=1)
+        register = self._register(_async_callback, executor=executor)
+
+        SignalRegisterModel.objects.create(name='async')
+
+        self.assertEqual(register.run_in, 'async')
+        self.assertTrue(executor.wait(timeout=5))
+        self.assertEqual(self.calls, [('async', None)])
+        executor.shutdown()
+
+        return None
+
+    def test_async_executor_closes_old_connections_around_sync_callbacks(self):
+        executor = AsyncExecutor(max_workers=1)
+
+        with mock.patch('django_general_utils.utils.executors.async_executor.close_old_connections') as close:
+            executor.submit(self._callback, sender=None, instance=SignalRegisterModel(name='sync'))
+
+            self.assertTrue(executor.wait(timeout=5))
+
+        self.assertEqual(close.call_count, 2)
+        self.assertEqual(self.calls[0][0], 'sync')
+        self.assertNotEqual(self.calls[0][1], threading.current_thread().name)
+        executor.shutdown()
+
+        return None
+
+    def test_async_executor_creates_semaphore_in_loop_thread(self):
+        semaphore = asyncio.Semaphore
+        threads = []
+
+        def _semaphore(*args):
+            threads.append(threading.current_thread().name)
+
+            return semaphore(*args)
+
+        executor = AsyncExecutor(max_workers=1)
+
+        with mock.patch.object(asyncio, 'Semaphore', side_effect=_semaphore):
+            executor.submit(self._callback, sender=None, instance=SignalRegisterModel(name='loop'))
+
+            self.assertTrue(executor.wait(timeout=5))
+
+        self.assertEqual(threads, ['django-general-utils-async'])
+        executor.shutdown()
+
+        return None
+
+    def test_thread_executor_shutdown_drains_pending_work(self):
+        executor = ThreadExecutor(max_workers=1)
+        executor.submit(time.sleep, 0.05)
+
+        with mock.patch.object(BaseExecutor, 'shutdown', autospec=True, side_effect=BaseExecutor.shutdown) as shutdown:
+            executor.shutdown()
+
+        shutdown.assert_called_once_with(executor, wait=True)
+        self.assertEqual(executor.metrics.in_flight, 0)
+        self.assertEqual(executor.metrics.completed, 1)
+
+        return None
+
+    def test_saturated_executor_runs_in_caller_thread(self):
+        release = threading.Event()
+        executor = ThreadExecutor(max_workers=1, max_queue_size=0, queue_timeout=0)
+
+        executor.submit(release.wait, 5)
+        executor.submit(self._callback, sender=None, instance=SignalRegisterModel(name='inline'))
+        release.set()
+
+        self.assertTrue(executor.wait(timeout=5))
+        self.assertEqual(self.calls, [('inline', threading.current_thread().name)])
+        self.assertEqual(executor.metrics.rejected, 1)
+        self.assertEqual(executor.metrics.completed, 2)
+        executor.shutdown()
+
+        return None
+
+    def test_invalid_run_in_raises(self):
+        with self.assertRaises(AssertionError):
+            SignalRegister(self._callback, post_save, run_in='process')
+
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
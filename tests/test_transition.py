@@ -0,0 +1,226 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from django_general_utils.models.base import BaseModel
+from django_general_utils.models.base_without_safe_delete import BaseWithoutSafeDeleteModel
+from django_general_utils.models.constraints import CheckFlowStatusConstraint
+
+STATUS_CHOICES = [('P', 'Pendiente'), ('E', 'Enviado'), ('F', 'Finalizado'), ('C', 'Cancelado')]
+FLOW = {'P': ['E', 'C'], 'E': ['F', 'C'], 'F': [], 'C': []}
+
+
+def _skip_urgent(instance, last_value, current_value):
+    return instance.name == 'urgent'
+
+
+class TransitionModel(BaseModel):
+    name = models.CharField(max_length=64, null=True, blank=True)
+    status = models.CharField(max_length=1, default='P', choices=STATUS_CHOICES)
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_transition_model'
+        constraints = [
+            CheckFlowStatusConstraint(name='transition_flow', flow=FLOW),
+        ]
+
+
+class TransitionWithoutSafeDeleteModel(BaseWithoutSafeDeleteModel):
+    name = models.CharField(max_length=64, null=True, blank=True)
+    status = models.CharField(max_length=1, default='P', choices=STATUS_CHOICES)
+
+    class Meta:
+        app_label = 'tests'
+        db_table = 'test_transition_without_safe_delete_model'
+        constraints = [
+            CheckFlowStatusConstraint(name='transition_ws_flow', flow=FLOW, skip_validate=_skip_urgent),
+        ]
+
+
+class TransitionTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        call_command('migrate', 'contenttypes', verbosity=0)
+        call_command('migrate', 'auth', verbosity=0)
+
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(TransitionModel)
+            schema_editor.create_model(TransitionModel.history.model)
+            schema_editor.create_model(TransitionWithoutSafeDeleteModel)
+
+        cls.user, _ = User.objects.get_or_create(username='transition-user')
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(TransitionWithoutSafeDeleteModel)
+            schema_editor.delete_model(TransitionModel.history.model)
+            schema_editor.delete_model(TransitionModel)
+
+        super().tearDownClass()
+
+    def setUp(self):
+        TransitionModel.objects.all_with_deleted().hard_delete_policy_action()
+        TransitionModel.history.model.objects.all().delete()
+        TransitionWithoutSafeDeleteModel.objects.all().delete()
+
+    def test_valid_transition_updates_in_one_statement(self):
+        TransitionModel.objects.bulk_create([TransitionModel(status='P') for _ in range(5)], with_history=False)
+
+        with CaptureQueriesContext(connection) as context:
+            count, offending = TransitionModel.objects.transition('E', with_history=False)
+
+        updates = [_query for _query in context.captured_queries if _query['sql'].startswith('UPDATE')]
+
+        self.assertEqual((count, offending), (5, {}))
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(set(TransitionModel.objects.values_list('status', flat=True)), {'E'})
+
+        return None
+
+    def test_transition_writes_history_and_updated_by(self):
+        TransitionModel.objects.bulk_create([TransitionModel(status='P') for _ in range(3)], with_history=False)
+
+        TransitionModel.objects.transition('E', user=self.user)
+
+        history = TransitionModel.history.all()
+
+        self.assertEqual(history.count(), 3)
+        self.assertEqual(
+            {(_h.status, _h.history_type, _h.history_user_id) for _h in history},
+            {('E', '~', self.user.pk)}
+        )
+        self.assertEqual(set(TransitionModel.objects.values_list('updated_by', flat=True)), {self.user.pk})
+
+        return None
+
+    def test_offending_pks_are_reported_per_state(self):
+        pending = TransitionModel.objects.create(status='P')
+        finished = TransitionModel.objects.create(status='F')
+        cancelled = TransitionModel.objects.create(status='C')
+
+        with self.assertRaises(ValidationError) as ctx:
+            TransitionModel.objects.transition('E')
+
+        errors = {_error.params['last_value']: _error.params['pks'] for _error in ctx.exception.error_dict['status']}
+
+        self.assertEqual(errors, {'F': [finished.pk], 'C': [cancelled.pk]})
+
+        pending.refresh_from_db()
+        self.assertEqual(pending.status, 'P')
+
+        return None
+
+    def test_without_raise_updates_only_allowed_rows(self):
+        pending = TransitionModel.objects.create(status='P')
+        finished = TransitionModel.objects.create(status='F')
+
+        count, offending = TransitionModel.objects.transition('E', raise_exception=False)
+
+        pending.refresh_from_db()
+        finished.refresh_from_db()
+
+        self.assertEqual((count, offending), (1, {'F': [finished.pk]}))
+        self.assertEqual((pending.status, finished.status), ('E', 'F'))
+
+        return None
+
+    def test_rows_already_in_target_are_not_updated(self):
+        TransitionModel.objects.create(status='E')
+        TransitionModel.objects.create(status='P')
+
+        count, _ = TransitionModel.objects.transition('E')
+
+        self.assertEqual(count, 1)
+
+        return None
+
+    def test_state_changed_after_validation_is_not_moved(self):
+        pending = TransitionModel.objects.create(status='P')
+        changed = TransitionModel.objects.create(status='P')
+        get_transition_offending = TransitionModel.objects.none().get_transition_offending.__func__
+
+        def _change_state(queryset, *args, **kwargs):
+            offending = get_transition_offending(queryset, *args, **kwargs)
+            # Otra transacción lo deja en un estado desde el que no se puede llegar a 'E'
+            TransitionModel.objects.filter(pk=changed.pk).update(status='F')
+
+            return offending
+
+        with mock.patch.object(type(TransitionModel.objects.all()), 'get_transition_offending', _change_state):
+            count, offending = TransitionModel.objects.transition('E', with_history=False)
+
+        self.assertEqual((count, offending), (1, {}))
+        self.assertEqual(TransitionModel.objects.get(pk=pending.pk).status, 'E')
+        self.assertEqual(TransitionModel.objects.get(pk=changed.pk).status, 'F')
+
+        return None
+
+    def test_skip_validate_is_evaluated_for_denied_rows(self):
+        urgent = TransitionWithoutSafeDeleteModel.objects.create(name='urgent', status='F')
+        normal = TransitionWithoutSafeDeleteModel.objects.create(name='normal', status='F')
+
+        count, offending = TransitionWithoutSafeDeleteModel.objects.transition('P', raise_exception=False)
+
+        urgent.refresh_from_db()
+
+        self.assertEqual((count, offending), (1, {'F': [normal.pk]}))
+        self.assertEqual(urgent.status, 'P')
+
+        return None
+
+    def test_missing_constraint_raises(self):
+        with self.assertRaises(ValueError):
+            TransitionModel.objects.transition('E', field='name')
+
+        return None
+
+    def test_compiled_flow_matrix(self):
+        constraint = TransitionModel._meta.constraints[0]
+
+        self.assertTrue(constraint.is_allowed('P', 'E'))
+        self.assertTrue(constraint.is_allowed('F', 'F'))
+        self.assertFalse(constraint.is_allowed('F', 'E'))
+        self.assertEqual(constraint.get_sources('C'), {'P', 'E'})
+        self.assertIs(constraint.get_choices(TransitionModel), constraint.get_choices(TransitionModel))
+
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
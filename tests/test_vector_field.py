@@ -0,0 +1,155 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+import numpy as np
+from django.core.exceptions import ValidationError
+from django.db import models
+from pgvector import Bit, HalfVector, SparseVector, Vector
+
+from django_general_utils.models.fields import VectorField
+from django_general_utils.models.fields.vector_field import binary_quantize, vector_to_numpy
+
+
+class NumpyVectorModel(models.Model):
+    embedding = VectorField(dimensions=3, as_numpy=True)
+    embedding_bit = VectorField(dimensions=3, storage='bit', as_numpy=True, null=True, blank=True)
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_numpy_vector_model'
+
+
+class VectorToNumpyTests(unittest.TestCase):
+    def test_text(self):
+        result = vector_to_numpy('[0.5,1,-2.25]')
+
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_array_equal(result, [0.5, 1, -2.25])
+
+    def test_binary(self):
+        result = vector_to_numpy(Vector([0.5, 1, -2.25]).to_binary())
+
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_array_equal(result, [0.5, 1, -2.25])
+
+    def test_pgvector_vector_and_ndarray(self):
+        np.testing.assert_array_equal(vector_to_numpy(Vector([1, 2])), [1, 2])
+        self.assertEqual(vector_to_numpy(np.array([1, 2], dtype=np.float64)).dtype, np.float32)
+
+    def test_other_storages(self):
+        np.testing.assert_array_equal(vector_to_numpy(HalfVector([0.5, -2]).to_binary(), 'halfvec'), [0.5, -2])
+        np.testing.assert_array_equal(vector_to_numpy('{2:0.5}/3', 'sparsevec'), [0, 0.5, 0])
+        np.testing.assert_array_equal(vector_to_numpy(SparseVector([0, 1.5]).to_binary(), 'sparsevec'), [0, 1.5])
+        np.testing.assert_array_equal(vector_to_numpy('101', 'bit'), [True, False, True])
+        np.testing.assert_array_equal(vector_to_numpy(Bit('011').to_binary(), 'bit'), [False, True, True])
+
+    def test_binary_quantize(self):
+        self.assertEqual(binary_quantize([0.5, -1, 0, 2]), '1001')
+
+
+class VectorFieldTests(unittest.TestCase):
+    def test_lists_by_default(self):
+        field = VectorField(dimensions=3)
+
+        self.assertEqual(field.from_db_value('[0.5,1,-2.25]', None, None), [0.5, 1.0, -2.25])
+        self.assertEqual(field.from_db_value(Vector([0.5, 1]).to_binary(), None, None), [0.5, 1.0])
+        self.assertEqual(field.to_python(np.array([0.5, 1])), [0.5, 1.0])
+        self.assertEqual(field.to_python('[0.5,1]'), [0.5, 1.0])
+        self.assertIsNone(field.from_db_value(None, None, None))
+
+    def test_as_numpy(self):
+        field = VectorField(dimensions=3, as_numpy=True)
+        result = field.from_db_value('[0.5,1,-2.25]', None, None)
+
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.dtype, np.float32)
+        self.assertIsInstance(field.to_python([0.5, 1, 2]), np.ndarray)
+        self.assertEqual(field.get_prep_value(result), '[0.5,1.0,-2.25]')
+
+    def test_deconstruct(self):
+        self.assertNotIn('as_numpy', VectorField(dimensions=3).deconstruct()[3])
+        self.assertNotIn('storage', VectorField(dimensions=3).deconstruct()[3])
+        self.assertTrue(VectorField(dimensions=3, as_numpy=True).deconstruct()[3]['as_numpy'])
+        self.assertEqual(VectorField(dimensions=3, storage='bit').deconstruct()[3]['storage'], 'bit')
+
+    def test_db_type(self):
+        self.assertEqual(VectorField(dimensions=3).db_type(None), 'vector(3)')
+        self.assertEqual(VectorField(dimensions=3, storage='halfvec').db_type(None), 'halfvec(3)')
+        self.assertEqual(VectorField(storage='sparsevec').db_type(None), 'sparsevec')
+
+        with self.assertRaises(AssertionError):
+            VectorField(storage='float8')
+
+    def test_halfvec(self):
+        field = VectorField(dimensions=2, storage='halfvec')
+
+        self.assertEqual(field.get_prep_value(np.array([0.5, -2], dtype=np.float32)), '[0.5,-2.0]')
+        self.assertEqual(field.from_db_value('[0.5,-2]', None, None), [0.5, -2.0])
+        self.assertEqual(field.from_db_value(HalfVector([0.5, -2]), None, None), [0.5, -2.0])
+
+    def test_sparsevec_is_dense_in_python(self):
+        field = VectorField(dimensions=3, storage='sparsevec')
+
+        self.assertEqual(field.get_prep_value([0, 0.5, 0]), '{2:0.5}/3')
+        self.assertEqual(field.get_prep_value({1: 0.5}), '{2:0.5}/3')
+        self.assertEqual(field.from_db_value('{2:0.5}/3', None, None), [0.0, 0.5, 0.0])
+        self.assertEqual(
+            VectorField(dimensions=3, storage='sparsevec', as_numpy=True).to_python('{1:1}/3').dtype,
+            np.float32
+        )
+
+    def test_bit_quantizes_floats(self):
+        field = VectorField(dimensions=4, storage='bit')
+
+        self.assertEqual(field.get_prep_value([0.5, -1, 0, 2]), '1001')
+        self.assertEqual(field.get_prep_value(np.array([True, False, True, True])), '1011')
+        self.assertEqual(field.get_prep_value('0110'), '0110')
+        self.assertEqual(field.from_db_value('1001', None, None), [True, False, False, True])
+        self.assertEqual(VectorField(dimensions=4, storage='bit', as_numpy=True).to_python('1001').dtype, np.bool_)
+
+
+class VectorFieldValidationTests(unittest.TestCase):
+    def test_clean_ndarray(self):
+        result = VectorField(dimensions=3, as_numpy=True).clean([1, 2, 3], None)
+
+        np.testing.assert_array_equal(result, [1, 2, 3])
+
+    def test_full_clean_with_ndarray(self):
+        instance = NumpyVectorModel(
+            embedding=np.array([0.5, 1, -2], dtype=np.float32),
+            embedding_bit=np.array([True, False, True]),
+        )
+        instance.full_clean()
+
+        with self.assertRaises(ValidationError) as context:
+            NumpyVectorModel(embedding=np.array([], dtype=np.float32)).full_clean()
+
+        self.assertEqual(context.exception.error_dict['embedding'][0].code, 'blank')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,346 @@
+import unittest
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import os
+
+    settings.configure(
+        BASE_DIR=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'django_general_utils')),
+        DEBUG=True,
+        SECRET_KEY='test-secret-key',
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+        ),
+        TIME_ZONE='UTC',
+        USE_TZ=True,
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+from unittest import mock
+
+from django.contrib.postgres.search import SearchVectorField
+from django.db import connection, models, transaction
+from django.db.migrations.exceptions import IrreversibleError
+from django.db.migrations.state import ModelState, ProjectState
+from pgvector.django import HnswIndex, IvfflatIndex
+
+from django_general_utils.models.base import BaseModel
+from django_general_utils.models.fields import VectorField
+from django_general_utils.models.operations import ConvertVectorStorage, CopyVectorStorage, CreateVectorIndex
+from django_general_utils.models.operations.vector_storage import get_vector_cast_sql
+from django_general_utils.models.querysets import vector
+from django_general_utils.utils.postgres import PostgresSearchV2
+
+
+class VectorSearchModel(BaseModel):
+    name = models.CharField(max_length=64)
+    embedding = VectorField(dimensions=3)
+    embedding_bit = VectorField(dimensions=3, storage='bit', null=True)
+    search_vector = SearchVectorField(null=True)
+
+    class Meta:
+        app_label = 'auth'
+        db_table = 'test_vector_search_model'
+
+
+class NearestTests(unittest.TestCase):
+    def test_orders_by_distance_with_limit(self):
+        queryset = VectorSearchModel.objects.nearest('embedding', [1, 0, 0], k=5, filters={'name': 'a'})
+        sql = str(queryset.query)
+
+        self.assertIn('<=>', sql)
+        self.assertIn('ASC LIMIT 5', sql)
+        self.assertIn('"deleted" IS NULL', sql)
+        self.assertIn('"name" = a', sql)
+
+    def test_metric_operator(self):
+        for _metric, _operator in (('l2', '<->'), ('inner_product', '<#>'), ('l1', '<+>')):
+            with self.subTest(metric=_metric):
+                queryset = VectorSearchModel.objects.nearest('embedding', [1, 0, 0], metric=_metric)
+
+                self.assertIn(_operator, str(queryset.query))
+
+        with self.assertRaises(AssertionError):
+            VectorSearchModel.objects.nearest('embedding', [1, 0, 0], metric='dot')
+
+    def test_search_parameters_are_kept_in_clones(self):
+        queryset = VectorSearchModel.objects.nearest(
+            'embedding',
+            [1, 0, 0],
+            ef_search=80,
+            probes=10,
+            iterative_scan='strict_order',
+        )
+
+        self.assertEqual(
+            queryset.all().get_db_config(),
+            {'hnsw.ef_search': 80, 'ivfflat.probes': 10, 'hnsw.iterative_scan': 'strict_order'},
+        )
+        self.assertEqual(VectorSearchModel.objects.all().get_db_config(), {})
+
+    def test_set_config_runs_in_the_same_transaction(self):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(VectorSearchModel)
+
+        try:
+            fake_connection = mock.MagicMock(vendor='postgresql')
+            cursor = fake_connection.cursor.return_value.__enter__.return_value
+
+            with mock.patch.object(vector, 'connections', {'default': fake_connection}):
+                list(VectorSearchModel.objects.set_config({'hnsw.ef_search': 100}))
+
+            cursor.execute.assert_called_once_with('SELECT set_config(%s, %s, true)', ['hnsw.ef_search', '100'])
+        finally:
+            with connection.schema_editor() as schema_editor:
+                schema_editor.delete_model(VectorSearchModel)
+
+    def test_set_config_applies_to_every_evaluation_and_is_rolled_back(self):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(VectorSearchModel)
+
+        try:
+            fake_connection = mock.MagicMock(vendor='postgresql')
+            cursor = fake_connection.cursor.return_value.__enter__.return_value
+            queryset = VectorSearchModel.objects.set_config({'hnsw.ef_search': 100})
+            evaluations = {
+                'iterator': lambda: list(queryset.iterator()),
+                'count': queryset.count,
+                'exists': queryset.exists,
+                'aggregate': lambda: queryset.aggregate(total=models.Count('pk')),
+            }
+
+            for _name, _evaluate in evaluations.items():
+                with self.subTest(_name):
+                    cursor.execute.reset_mock()
+
+                    with mock.patch.object(vector, 'connections', {'default': fake_connection}):
+                        with mock.patch.object(vector.transaction, 'set_rollback') as set_rollback:
+                            with transaction.atomic():
+                                _evaluate()
+
+                    cursor.execute.assert_called_once_with(
+                        'SELECT set_config(%s, %s, true)',
+                        ['hnsw.ef_search', '100']
+                    )
+                    set_rollback.assert_called_once_with(True, using='default')
+        finally:
+            with connection.schema_editor() as schema_editor:
+                schema_editor.delete_model(VectorSearchModel)
+
+
+class RescoreTests(unittest.TestCase):
+    def test_quantized_candidates_then_full_precision_order(self):
+        queryset = VectorSearchModel.objects.nearest(
+            'embedding_bit',
+            [0.5, -1, 2],
+            k=5,
+            rescore_field='embedding',
+            ef_search=40,
+        )
+        sql = str(queryset.query)
+
+        self.assertIn('<~> 101', sql)
+        self.assertIn('LIMIT 20', sql)
+        self.assertIn('<=> [0.5,-1.0,2.0]', sql)
+        self.assertIn('ASC LIMIT 5', sql)
+        self.assertEqual(queryset.get_db_config(), {'hnsw.ef_search': 40})
+
+    def test_candidates_and_candidate_metric(self):
+        queryset = VectorSearchModel.objects.nearest(
+            'embedding_bit',
+            [0.5, -1, 2],
+            rescore_field='embedding',
+            rescore_candidates=100,
+            candidate_metric='jaccard',
+            metric='l2',
+        )
+        sql = str(queryset.query)
+
+        self.assertIn('LIMIT 100', sql)
+        self.assertIn('<%>', sql)
+        self.assertIn('<->', sql)
+
+
+class ConvertVectorStorageTests(unittest.TestCase):
+    def get_state(self, storage: str) -> ProjectState:
+        state = ProjectState()
+        state.add_model(ModelState('vector_storage', 'Item', [
+            ('id', models.AutoField(primary_key=True)),
+            ('embedding', VectorField(dimensions=3, storage=storage)),
+        ]))
+
+        return state
+
+    def get_schema_editor(self):
+        schema_editor = mock.MagicMock()
+        schema_editor.connection.vendor = 'postgresql'
+        schema_editor.connection.alias = 'default'
+        schema_editor.quote_name.side_effect = lambda name: f'"{name}"'
+
+        return schema_editor
+
+    def test_cast_sql(self):
+        self.assertEqual(get_vector_cast_sql('"e"', 'vector', 'halfvec(3)'), '"e"::halfvec(3)')
+        self.assertEqual(get_vector_cast_sql('"e"', 'halfvec', 'bit(3)'), 'binary_quantize("e")::bit(3)')
+        self.assertEqual(get_vector_cast_sql('"e"', 'sparsevec', 'bit(3)'), 'binary_quantize("e"::vector)::bit(3)')
+
+        with self.assertRaises(IrreversibleError):
+            get_vector_cast_sql('"e"', 'bit', 'vector(3)')
+
+    def test_alter_column_with_cast(self):
+        operation = ConvertVectorStorage('Item', 'embedding', VectorField(dimensions=3, storage='bit'))
+        schema_editor = self.get_schema_editor()
+        operation.database_forwards('vector_storage', schema_editor, self.get_state('vector'), self.get_state('bit'))
+
+        schema_editor.execute.assert_called_once_with(
+            'ALTER TABLE "vector_storage_item" ALTER COLUMN "embedding" '
+            'TYPE bit(3) USING binary_quantize("embedding")::bit(3)'
+        )
+        self.assertEqual(schema_editor.alter_field.call_args[0][1].storage, 'bit')
+        self.assertEqual(operation.migration_name_fragment, 'convert_item_embedding_bit')
+
+    def test_copy_into_quantized_column(self):
+        state = ProjectState()
+        state.add_model(ModelState('vector_storage', 'Item', [
+            ('id', models.AutoField(primary_key=True)),
+            ('embedding', VectorField(dimensions=3)),
+            ('embedding_bit', VectorField(dimensions=3, storage='bit', null=True)),
+        ]))
+        schema_editor = self.get_schema_editor()
+        CopyVectorStorage('Item', 'embedding', 'embedding_bit').database_forwards(
+            'vector_storage',
+            schema_editor,
+            state,
+            state
+        )
+
+        schema_editor.execute.assert_called_once_with(
+            'UPDATE "vector_storage_item" SET "embedding_bit" = binary_quantize("embedding")::bit(3) '
+            'WHERE "embedding_bit" IS NULL AND "embedding" IS NOT NULL'
+        )
+
+    def test_noop_copy_outside_postgres(self):
+        operation = CopyVectorStorage('Item', 'embedding', 'embedding_bit')
+
+        with connection.schema_editor() as schema_editor:
+            self.assertIsNone(operation.database_forwards('vector_storage', schema_editor, None, self.get_state('bit')))
+
+
+class CreateVectorIndexTests(unittest.TestCase):
+    def test_hnsw_index(self):
+        operation = CreateVectorIndex('VectorSearchModel', 'embedding', m=16, ef_construction=128)
+        index = operation.get_index(VectorSearchModel, connection)
+
+        self.assertIsInstance(index, HnswIndex)
+        self.assertEqual(index.opclasses, ['vector_cosine_ops'])
+        self.assertEqual(index.get_with_params(), ['m = 16', 'ef_construction = 128'])
+        self.assertEqual(index.name, 'test_vector_search_model_embedding_hnsw_cosine')
+
+    def test_ivfflat_index(self):
+        operation = CreateVectorIndex('VectorSearchModel', 'embedding', method='ivfflat', metric='l2', lists=100)
+        index = operation.get_index(VectorSearchModel, connection)
+
+        self.assertIsInstance(index, IvfflatIndex)
+        self.assertEqual(index.opclasses, ['vector_l2_ops'])
+
+        with self.assertRaises(ValueError):
+            CreateVectorIndex('VectorSearchModel', 'embedding', method='ivfflat', metric='l1').get_index(
+                VectorSearchModel,
+                connection
+            )
+
+    def test_deconstruct_omits_defaults(self):
+        name, args, kwargs = CreateVectorIndex('VectorSearchModel', 'embedding', m=16).deconstruct()
+
+        self.assertEqual(name, 'CreateVectorIndex')
+        self.assertEqual(kwargs, {'model_name': 'VectorSearchModel', 'field': 'embedding', 'm': 16})
+
+    def test_noop_outside_postgres(self):
+        operation = CreateVectorIndex('VectorSearchModel', 'embedding')
+
+        with connection.schema_editor() as schema_editor:
+            self.assertIsNone(operation.database_forwards('auth', schema_editor, None, None))
+
+
+class HybridSearchTests(unittest.TestCase):
+    def get_queryset(self, **kwargs):
+        return PostgresSearchV2.get_queryset(
+            VectorSearchModel.objects.all(),
+            'silla',
+            search_vector_field='search_vector',
+            query_embedding=[1, 0, 0],
+            embedding_field='embedding',
+            hybrid_candidates=50,
+            **kwargs
+        )
+
+    def test_rrf_fuses_bounded_candidate_lists(self):
+        queryset = self.get_queryset()
+        sql = str(queryset.query)
+
+        self.assertEqual(sql.count('ARRAY('), 2)
+        self.assertEqual(sql.count('array_position'), 2)
+        self.assertIn('LIMIT 50', sql)
+        self.assertIn('<=>', sql)
+        self.assertIn('plainto_tsquery', sql)
+        self.assertEqual(queryset.query.order_by, ('-hybrid_rank', 'pk'))
+
+    def test_weighted_mode(self):
+        queryset = self.get_queryset(hybrid_mode='weighted', lexical_weight=0.3, vector_weight=0.7)
+        sql = str(queryset.query)
+
+        self.assertIn('NULLIF', sql)
+        self.assertIn('0.7', sql)
+        # Rangos léxicos como ARRAY no correlacionados, no un subquery por fila
+        self.assertEqual(sql.count('ARRAY('), 3)
+        self.assertIn('[(1)]', sql)
+        self.assertNotIn('= ("test_vector_search_model"."id")', sql)
+
+        with self.assertRaises(AssertionError):
+            self.get_queryset(hybrid_mode='other')
+
+    def test_lexical_candidates_without_rank_are_ordered_by_pk(self):
+        queryset = PostgresSearchV2.get_hybrid_queryset(
+            VectorSearchModel.objects.all(),
+            'silla',
+            [1, 0, 0],
+            'embedding',
+            candidates=50,
+        )
+        sql = str(queryset.query)
+
+        self.assertEqual(sql.count('ARRAY('), 2)
+        self.assertIn('WHERE U0."deleted" IS NULL ORDER BY 1 ASC LIMIT 50', sql)
+
+    def test_without_terms_only_vector_ranking(self):
+        queryset = PostgresSearchV2.get_queryset(
+            VectorSearchModel.objects.all(),
+            '',
+            query_embedding=[1, 0, 0],
+            embedding_field='embedding',
+        )
+
+        self.assertEqual(str(queryset.query).count('ARRAY('), 1)
+
+    def test_without_embedding_keeps_lexical_search(self):
+        queryset = PostgresSearchV2.get_queryset(
+            VectorSearchModel.objects.all(),
+            'silla',
+            search_vector_field='search_vector',
+        )
+
+        self.assertNotIn('hybrid_rank', queryset.query.annotations)
+        self.assertIn('order_rank', queryset.query.annotations)
+
+
+if __name__ == '__main__':
+    unittest.main()